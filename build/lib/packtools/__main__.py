@@ -0,0 +1,98 @@
+# coding: utf-8
+"""packtools command line utility.
+
+Usage: ``packtools warm-cache`` (or ``python -m packtools warm-cache``).
+"""
+from __future__ import print_function, unicode_literals
+import argparse
+import logging
+import sys
+
+from packtools import catalogs, utils
+from packtools.pkg_resources_fixer import get_version
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+LOGGER_FMT = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+
+
+EPILOG = """\
+Copyright 2013 SciELO <scielo-dev@googlegroups.com>.
+Licensed under the terms of the BSD license. Please see LICENSE in the source
+code for more information.
+"""
+
+
+def warm_cache(cache_dir=None):
+    """Compiles every schematron schema in ``catalogs.SCH_SCHEMAS`` and
+    stores the validation XSLT at the cache directory.
+
+    Returns the list of schema names that could not be compiled.
+    """
+    failures = []
+    for name, path in sorted(catalogs.SCH_SCHEMAS.items()):
+        LOGGER.info('compiling schematron "%s"', name)
+        try:
+            utils.get_schematron_from_cache(path, cache_dir=cache_dir)
+        except Exception as exc:
+            LOGGER.exception(exc)
+            failures.append(name)
+    return failures
+
+
+def _warm_cache(args):
+    cache_dir = args.cachedir or utils.get_schematron_cache_dir()
+    failures = warm_cache(cache_dir)
+    for name in failures:
+        print('Unable to compile schematron "%s"' % name, file=sys.stderr)
+    print('Compiled schematron schemas are at: "%s"' % cache_dir)
+    return 1 if failures else 0
+
+
+def _main():
+    parser = argparse.ArgumentParser(
+            description='SciELO PS packtools command line utility.',
+            epilog=EPILOG)
+    parser.add_argument('--version', action='version',
+                        version=get_version('packtools'))
+    parser.add_argument('--loglevel', default='')  # disabled by default
+    subparsers = parser.add_subparsers(dest='command')
+
+    warm_cache_parser = subparsers.add_parser(
+            'warm-cache',
+            help='precompiles all the bundled schematron schemas.')
+    warm_cache_parser.add_argument(
+            '--cachedir', default=None,
+            help='directory where the compiled schemas are stored. '
+                 'defaults to the PACKTOOLS_CACHE_DIR environment variable '
+                 'or to the user cache directory.')
+    warm_cache_parser.set_defaults(func=_warm_cache)
+
+    args = parser.parse_args()
+
+    # All log messages will be omited if level > 50
+    logging.basicConfig(level=getattr(logging, args.loglevel.upper(), 999),
+            format=LOGGER_FMT)
+
+    if not args.command:
+        parser.print_help()
+        return 2
+
+    return args.func(args)
+
+
+def main():
+    try:
+        sys.exit(_main())
+    except KeyboardInterrupt:
+        LOGGER.info('terminating the program')
+        sys.exit(1)
+    except Exception as exc:
+        LOGGER.exception(exc)
+        sys.exit('An unexpected error has occurred: %s' % exc)
+
+
+if __name__ == '__main__':
+    main()
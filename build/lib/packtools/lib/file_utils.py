@@ -0,0 +1,521 @@
+import os
+import logging
+import re
+import shutil
+import struct
+import tempfile
+import time
+import zipfile
+import zlib
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from zipfile import ZipFile, ZIP_DEFLATED
+
+
+logger = logging.getLogger(__name__)
+
+
+def is_folder(source):
+    return os.path.isdir(source)
+
+
+def is_zipfile(source):
+    return os.path.isfile(source) and source.endswith(".zip")
+
+
+def xml_files_list(path):
+    """
+    Return the XML files found in `path`
+    """
+    return (f for f in os.listdir(path) if f.endswith(".xml"))
+
+
+def files_list(path):
+    """
+    Return the files in `path`
+    """
+    return os.listdir(path)
+
+
+def read_file(path, encoding="utf-8", mode="r"):
+    with open(path, mode=mode, encoding=encoding) as f:
+        text = f.read()
+    return text
+
+
+def read_from_zipfile(zip_path, filename):
+    with ZipFile(zip_path) as zf:
+        return zf.read(filename)
+
+
+def xml_files_list_from_zipfile(zip_path):
+    with ZipFile(zip_path) as zf:
+        xmls_filenames = [
+            xml_filename
+            for xml_filename in zf.namelist()
+            if os.path.splitext(xml_filename)[-1] == ".xml"
+        ]
+    return xmls_filenames
+
+
+def files_list_from_zipfile(zip_path):
+    """
+    Return the files in `zip_path`
+
+    Example:
+
+    ```
+    [
+        '2318-0889-tinf-33-0421/2318-0889-tinf-33-e200069.pdf',
+        '2318-0889-tinf-33-0421/2318-0889-tinf-33-e200069.xml',
+        '2318-0889-tinf-33-0421/2318-0889-tinf-33-e200071.pdf',
+        '2318-0889-tinf-33-0421/2318-0889-tinf-33-e200071.xml',
+        '2318-0889-tinf-33-0421/2318-0889-tinf-33-e200071-gf01.tif',
+        '2318-0889-tinf-33-0421/2318-0889-tinf-33-e200071-gf02.tif',
+        '2318-0889-tinf-33-0421/2318-0889-tinf-33-e200071-gf03.tif',
+        '2318-0889-tinf-33-0421/2318-0889-tinf-33-e200071-gf04.tif',
+    ]
+    ```
+    """
+    with ZipFile(zip_path) as zf:
+        return zf.namelist()
+
+
+def write_file(path, source, mode="w"):
+    dirname = os.path.dirname(path)
+    if not os.path.isdir(dirname):
+        os.makedirs(dirname)
+    logger.debug("Gravando arquivo: %s", path)
+    if "b" in mode:
+        with open(path, mode) as f:
+            f.write(source)
+        return
+
+    with open(path, mode, encoding="utf-8") as f:
+        f.write(source)
+
+
+def create_zip_file(files, zip_name, zip_folder=None, compression_policy=None, jobs=1):
+    zip_folder = zip_folder or tempfile.mkdtemp()
+
+    zip_path = os.path.join(zip_folder, zip_name)
+    with ZipFile(zip_path, 'w', ZIP_DEFLATED) as myzip:
+        write_zip_members(
+            myzip,
+            [(os.path.basename(f), f) for f in files],
+            compression_policy,
+            jobs,
+        )
+    return zip_path
+
+
+# local file header: signature, versions, flags, compression, time, date,
+# crc, sizes, file name length, extra field length
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_ZIP_LOCAL_HEADER_SIGNATURE = b"PK\003\004"
+_ZIP_ENCRYPTED = 0x1
+_ZIP_DATA_DESCRIPTOR = 0x8
+_ZIP_EXTRA_ZIP64 = 0x0001
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# ZipFile attributes, not part of its API, used to write the compressed data
+# of a member (see _write_compressed_member)
+_ZIPFILE_INTERNALS = (
+    "_lock",
+    "_writing",
+    "_seekable",
+    "_allowZip64",
+    "_writecheck",
+    "_didModify",
+    "start_dir",
+    "filelist",
+    "NameToInfo",
+    "fp",
+)
+
+
+def _can_write_compressed(*zip_files):
+    """
+    Returns whether the ``zipfile`` module in use has the internals which
+    ``copy_zip_member`` and ``write_zip_members`` rely on to write compressed
+    data as it is. Otherwise they read and write the members with the
+    ``ZipFile`` API.
+    """
+    return hasattr(zipfile, "_strip_extra") and all(
+        hasattr(zip_file, name)
+        for zip_file in zip_files
+        for name in _ZIPFILE_INTERNALS
+    )
+
+
+def _new_zip_info(zinfo):
+    """
+    Returns a ``ZipInfo`` with the name, date and attributes of ``zinfo``,
+    for ``ZipFile.writestr``, which changes the ``ZipInfo`` it is given
+    """
+    new_zinfo = zipfile.ZipInfo(zinfo.filename, zinfo.date_time)
+    for attr in (
+        "compress_type",
+        "comment",
+        "create_system",
+        "internal_attr",
+        "external_attr",
+    ):
+        setattr(new_zinfo, attr, getattr(zinfo, attr))
+    return new_zinfo
+
+
+def _copy_zip_info(zinfo):
+    new_zinfo = zipfile.ZipInfo(zinfo.filename, zinfo.date_time)
+    for attr in (
+        "compress_type",
+        "comment",
+        "create_system",
+        "create_version",
+        "extract_version",
+        "internal_attr",
+        "external_attr",
+        "CRC",
+        "compress_size",
+        "file_size",
+    ):
+        setattr(new_zinfo, attr, getattr(zinfo, attr))
+    # the sizes are known, they are written in the local header
+    new_zinfo.flag_bits = zinfo.flag_bits & ~_ZIP_DATA_DESCRIPTOR
+    # ZipFile adds its own zip64 extra field when it is needed
+    new_zinfo.extra = zipfile._strip_extra(zinfo.extra, (_ZIP_EXTRA_ZIP64,))
+    return new_zinfo
+
+
+def copy_zip_member(source_zip, target_zip, name):
+    """
+    Copies the member ``name`` of ``source_zip`` to ``target_zip`` (both
+    instances of ``ZipFile``, ``target_zip`` opened to write or append)
+    without decompressing and compressing it again.
+
+    The compressed data is copied in chunks, so the memory used does not
+    depend on the member size. Encrypted members, which are not supported by
+    ``ZipFile`` writer, are read and written again, as all the members are
+    if the ``zipfile`` internals this copy relies on are not available.
+    """
+    zinfo = source_zip.getinfo(name) if isinstance(name, str) else name
+    if zinfo.flag_bits & _ZIP_ENCRYPTED or not _can_write_compressed(
+        source_zip, target_zip
+    ):
+        target_zip.writestr(_new_zip_info(zinfo), source_zip.read(zinfo))
+        return
+
+    new_zinfo = _copy_zip_info(zinfo)
+    with source_zip._lock, target_zip._lock:
+        source_zip.fp.seek(zinfo.header_offset)
+        header = source_zip.fp.read(_ZIP_LOCAL_HEADER.size)
+        if len(header) != _ZIP_LOCAL_HEADER.size:
+            raise zipfile.BadZipFile("Truncated file header")
+        header = _ZIP_LOCAL_HEADER.unpack(header)
+        if header[0] != _ZIP_LOCAL_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile("Bad magic number for file header")
+        # skip file name and extra field
+        source_zip.fp.seek(header[10] + header[11], os.SEEK_CUR)
+
+        _write_compressed_member(
+            target_zip, new_zinfo, _read_chunks(source_zip.fp, zinfo)
+        )
+
+
+def _read_chunks(fp, zinfo):
+    remaining = zinfo.compress_size
+    while remaining > 0:
+        chunk = fp.read(min(remaining, _COPY_CHUNK_SIZE))
+        if not chunk:
+            raise zipfile.BadZipFile("Truncated member %r" % zinfo.filename)
+        remaining -= len(chunk)
+        yield chunk
+
+
+def _write_compressed_member(target_zip, zinfo, chunks):
+    """
+    Writes the member ``zinfo``, whose compressed data is ``chunks``, in
+    ``target_zip``. ``zinfo`` must have CRC and sizes. The caller must hold
+    ``target_zip._lock``.
+    """
+    if target_zip._writing:
+        raise ValueError(
+            "Can't write to the ZIP file while there is an open writing handle"
+        )
+    zip64 = (
+        zinfo.file_size > zipfile.ZIP64_LIMIT
+        or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    )
+    if zip64 and not target_zip._allowZip64:
+        raise zipfile.LargeZipFile("Filesize would require ZIP64 extensions")
+
+    if target_zip._seekable:
+        target_zip.fp.seek(target_zip.start_dir)
+    zinfo.header_offset = target_zip.fp.tell()
+    target_zip._writecheck(zinfo)
+    target_zip._didModify = True
+    target_zip.fp.write(zinfo.FileHeader(zip64))
+    for chunk in chunks:
+        target_zip.fp.write(chunk)
+    target_zip.start_dir = target_zip.fp.tell()
+    target_zip.filelist.append(zinfo)
+    target_zip.NameToInfo[zinfo.filename] = zinfo
+
+
+class CompressionPolicy:
+    """
+    Chooses the compression of each member of a zip package.
+
+    Members whose extension is in ``stored_extensions`` (images, PDF,
+    audio, video and other already compressed formats) are stored, since
+    deflating them spends CPU and barely reduces their size. The other
+    members (XML, HTML, text, TIFF, ...) are deflated with ``compresslevel``
+    (``None`` is the zlib default).
+
+    >>> policy = CompressionPolicy(compresslevel=6)
+    >>> with ZipFile(zip_path, "w") as zf:
+    ...     policy.writestr(zf, "article.xml", xml_content)
+    ...     policy.write(zf, "/tmp/article.pdf", "article.pdf")
+
+    ``parallel_min_size`` is the size in bytes from which a member is
+    compressed in a thread by ``write_zip_members``.
+    """
+
+    STORED_EXTENSIONS = frozenset(
+        (
+            ".png", ".jpg", ".jpeg", ".gif", ".webp", ".jp2",
+            ".pdf", ".epub", ".docx", ".xlsx", ".pptx", ".odt",
+            ".mp3", ".mp4", ".m4a", ".m4v", ".mov", ".avi", ".webm", ".ogg",
+            ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar",
+        )
+    )
+
+    def __init__(
+        self, compresslevel=None, stored_extensions=None, parallel_min_size=1024 * 1024
+    ):
+        self.compresslevel = compresslevel
+        self.stored_extensions = frozenset(
+            ext.lower()
+            for ext in (
+                self.STORED_EXTENSIONS
+                if stored_extensions is None
+                else stored_extensions
+            )
+        )
+        self.parallel_min_size = parallel_min_size
+
+    def get_compress_type(self, filename):
+        ext = os.path.splitext(filename)[1].lower()
+        if ext in self.stored_extensions:
+            return zipfile.ZIP_STORED
+        return ZIP_DEFLATED
+
+    def writestr(self, zip_file, arcname, data):
+        zip_file.writestr(
+            arcname, data, self.get_compress_type(arcname), self.compresslevel
+        )
+
+    def write(self, zip_file, filename, arcname=None):
+        arcname = arcname or os.path.basename(filename)
+        zip_file.write(
+            filename, arcname, self.get_compress_type(arcname), self.compresslevel
+        )
+
+
+DEFAULT_COMPRESSION_POLICY = CompressionPolicy()
+
+
+def _deflate(content, compresslevel):
+    """
+    Returns the CRC, the size and the deflated chunks of ``content``, a file
+    path or bytes, as ``ZipFile`` would write them.
+    """
+    compressor = zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel,
+        zlib.DEFLATED,
+        -15,
+    )
+    crc = 0
+    size = 0
+    chunks = []
+    if isinstance(content, bytes):
+        content = [content]
+        fp = None
+    else:
+        fp = open(content, "rb")
+        content = iter(lambda: fp.read(_COPY_CHUNK_SIZE), b"")
+    try:
+        for data in content:
+            crc = zlib.crc32(data, crc)
+            size += len(data)
+            chunks.append(compressor.compress(data))
+    finally:
+        if fp is not None:
+            fp.close()
+    chunks.append(compressor.flush())
+    return crc, size, chunks
+
+
+def _get_size(content):
+    if isinstance(content, bytes):
+        return len(content)
+    return os.path.getsize(content)
+
+
+def write_zip_members(zip_file, members, compression_policy=None, jobs=1):
+    """
+    Writes ``members``, pairs of member name and content (file path or
+    bytes), in ``zip_file`` according to ``compression_policy``.
+
+    If ``jobs`` is greater than 1, members to deflate larger than
+    ``compression_policy.parallel_min_size`` are compressed in a pool of
+    ``jobs`` threads (zlib releases the GIL), unless the ``zipfile``
+    internals needed to write them are not available. The package content
+    and the order of the members do not depend on ``jobs``.
+    """
+    policy = compression_policy or DEFAULT_COMPRESSION_POLICY
+    if jobs > 1 and not _can_write_compressed(zip_file):
+        jobs = 1
+
+    def write(arcname, content, deflated):
+        if deflated is None:
+            if isinstance(content, bytes):
+                policy.writestr(zip_file, arcname, content)
+            else:
+                policy.write(zip_file, content, arcname)
+            return
+
+        crc, size, chunks = deflated.result()
+        if isinstance(content, bytes):
+            zinfo = zipfile.ZipInfo(arcname, time.localtime(time.time())[:6])
+            zinfo.external_attr = 0o600 << 16
+        else:
+            zinfo = zipfile.ZipInfo.from_file(content, arcname)
+        zinfo.compress_type = ZIP_DEFLATED
+        zinfo.CRC = crc
+        zinfo.file_size = size
+        zinfo.compress_size = sum(len(chunk) for chunk in chunks)
+        with zip_file._lock:
+            _write_compressed_member(zip_file, zinfo, chunks)
+
+    if jobs <= 1:
+        for arcname, content in members:
+            write(arcname, content, None)
+        return
+
+    # members are written in order, at most 2 * jobs are kept in memory
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for arcname, content in members:
+            deflated = None
+            if (
+                policy.get_compress_type(arcname) == ZIP_DEFLATED
+                and _get_size(content) >= policy.parallel_min_size
+            ):
+                deflated = executor.submit(_deflate, content, policy.compresslevel)
+            pending.append((arcname, content, deflated))
+            if len(pending) > 2 * jobs:
+                write(*pending.popleft())
+        while pending:
+            write(*pending.popleft())
+
+
+def delete_folder(path):
+    try:
+        shutil.rmtree(path)
+    except:
+        pass
+
+
+def create_temp_file(filename, content=None, mode='w'):
+    file_path = tempfile.mkdtemp()
+    file_path = os.path.join(file_path, filename)
+    write_file(file_path, content or '', mode)
+    return file_path
+
+
+def copy_file(source, target):
+    tmpdir = tempfile.mkdtemp()
+    fullpath_target = os.path.join(tmpdir, target)
+
+    logger.info(f'Copying file {source} to {fullpath_target}')
+    return shutil.copyfile(source, fullpath_target)
+
+
+def size(file_path):
+    return os.path.getsize(file_path)
+
+
+def get_prefix_by_xml_filename(xml_filename):
+    """
+    Obtém o prefixo associado a um arquivo xml
+
+    Parameters
+    ----------
+    xml_filename : str
+        Nome de arquivo xml
+
+    Returns
+    -------
+    str
+        Prefixo associado ao arquivo xml
+    """
+    file, ext = os.path.splitext(xml_filename)
+    return file
+
+
+def get_file_role(file_path, prefix, pdf_langs):
+    """
+    Obtém o papel/função de um arquivo (xml, renditions ou assets) no contexto de um documento
+
+    Parameters
+    ----------
+    file_path : str
+        Nome de um arquivo
+    prefix: str
+        Prefixo associado ao arquivo
+    pdf_langs: list
+        Idiomas dos PDFs do documento
+
+    Returns
+    -------
+    str
+        Papel/função de arquivo (xml, rendition ou assets) no contexto de um documento
+    """
+    file, ext = os.path.splitext(file_path)
+
+    if ext == '.xml':
+        return 'xml'
+    elif ext == '.pdf':
+        if file == prefix:
+            return 'renditions'
+
+        for lang in pdf_langs:
+            if file == f'{prefix}-{lang}':
+                return 'renditions'
+    return 'assets'
+
+
+def extract_issn_from_zip_uri(zip_uri):
+    """
+    Extrai código ISSN a partir do endereço de um arquivo zip
+
+    Parameters
+    ----------
+    zip_uri : str
+        Endereço de um arquivo zip
+
+    Returns
+    -------
+    str
+        ISSN
+    """
+    match = re.search(r'.*/ingress/packages/(\d{4}-\d{4})/.*.zip', zip_uri)
+    if match:
+        return match.group(1)
+
+
+def get_filename(file_path):
+    return os.path.basename(file_path)
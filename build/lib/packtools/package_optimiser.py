@@ -0,0 +1,90 @@
+# coding: utf-8
+import os
+import argparse
+import logging
+import sys
+
+import packtools
+from packtools.pkg_resources_fixer import get_version
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def main():
+
+    packtools_version = get_version("packtools")
+
+    parser = argparse.ArgumentParser(description="WEB Images generator CLI utility")
+    parser.add_argument("SPPackage", help="SP Package Zip file path.")
+    parser.add_argument(
+        "New_SPPackage", nargs="?", default='', help="Optimised SP Package Zip file path."
+    )
+    parser.add_argument(
+        '--preservefiles',
+        action='store_true',
+        help='preserve extracted and optimised files in aux directory',
+    )
+    parser.add_argument(
+        '--stopiferror',
+        action='store_true',
+        help='stop execution if an error occurs',
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='number of processes optimising images',
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='reuse the web images and thumbnails produced from the same images '
+             'in previous executions',
+    )
+    parser.add_argument(
+        '--cachedir',
+        default=None,
+        help='directory of the images cache (implies --cache). defaults to the '
+             'PACKTOOLS_CACHE_DIR environment variable or to the user cache directory.',
+    )
+    parser.add_argument(
+        '--cachesize',
+        type=int,
+        default=None,
+        help='maximum size of the images cache in MiB. defaults to 1024',
+    )
+    parser.add_argument("--version", action="version", version=packtools_version)
+    parser.add_argument("--loglevel", default="WARNING")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.loglevel.upper()))
+
+    print("Please wait, this may take a while...", file=sys.stderr)
+
+    if len(args.New_SPPackage) > 0:
+        new_package_file_path = args.New_SPPackage
+    else:
+        new_package_file_path = os.path.splitext(args.SPPackage)[0] + "_optimised.zip"
+
+    image_cache = None
+    if args.cache or args.cachedir:
+        image_cache = packtools.utils.ImageDerivativeCache(
+            args.cachedir, args.cachesize and args.cachesize * 1024 * 1024
+        )
+
+    package = packtools.SPPackage.from_file(
+        args.SPPackage,
+        os.path.splitext(args.SPPackage)[0],
+        stop_if_error=args.stopiferror,
+        image_cache=image_cache,
+    )
+    package.optimise(
+        new_package_file_path=new_package_file_path,
+        preserve_files=args.preservefiles,
+        jobs=args.jobs,
+    )
+
+
+if __name__ == "__main__":
+    main()
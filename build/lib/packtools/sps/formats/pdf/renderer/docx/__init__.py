@@ -0,0 +1,8 @@
+# docx/__init__.py
+
+from . import builder # noqa: F401
+from . import text # noqa: F401
+from . import section # noqa: F401
+from . import style # noqa: F401
+from . import table # noqa: F401
+from . import figure # noqa: F401
@@ -0,0 +1,34 @@
+from lxml import etree as ET
+
+def build_back(nodes):
+    """
+    Constructs an XML 'back' element and populates it with child elements.
+
+    This function takes a list of lists, where each sublist contains XML elements,
+    and appends all these elements as children of a newly created 'back' element.
+
+    Args:
+        nodes (list of list of xml.etree.ElementTree.Element):
+            A list of lists containing 'Element' objects to be added as children of the 'back' element.
+
+    Returns:
+        xml.etree.ElementTree.Element:
+            An XML 'back' element with the provided child elements appended.
+
+    Raises:
+        ValueError: If the input 'nodes' list is empty.
+
+    Example:
+        nodes = [
+            [<Element>, <Element>],
+            [<Element>]
+        ]
+    """
+    if not nodes:
+        raise ValueError("A list of child elements is required.")
+
+    back_elem = ET.Element("back")
+    for element_list in nodes:
+        back_elem.extend(element_list)
+
+    return back_elem
@@ -0,0 +1,171 @@
+import re
+
+import warnings as _warnings
+
+
+class AccessibilityData:
+    def __init__(self, node):
+        self.node = node
+        self.transcript_data = None
+
+    @property
+    def xref_sec_rid(self):
+        try:
+            return self.node.xpath('xref[@ref-type="sec"]')[0].get("rid")
+        except Exception:
+            return None
+
+    def _get_xml_string(self):
+        """Retorna string XML do elemento para mensagens de erro"""
+        try:
+            from lxml import etree
+            xml_str = etree.tostring(self.node, encoding='unicode')
+            # Limita a 200 caracteres para não sobrecarregar logs
+            return xml_str[:200] + "..." if len(xml_str) > 200 else xml_str
+        except Exception:
+            return f"<{self.node.tag}...>"
+
+    @property
+    def alt_text(self):
+        try:
+            node = self.node.find("alt-text")
+            text = node.text
+            content_type = node.get("content-type")
+            if content_type:
+                xml = f'<alt-text content-type="{content_type}">{text}</alt-text>'
+            else:
+                xml = f'<alt-text>{text}</alt-text>'
+            return {
+                "alt_text": text,
+                "alt_text_content_type": content_type,
+                "alt_text_xml": xml
+            }
+        except Exception:
+            return None
+
+    @property
+    def long_desc(self):
+        """Obtém a descrição longa (<long-desc>) do XML, removendo espaços extras."""
+        try:
+            node = self.node.find("long-desc")
+            text = node.text
+            content_type = node.get("content-type")
+            if content_type:
+                xml = f'<long-desc content-type="{content_type}">{text}</long-desc>'
+            else:
+                xml = f'<long-desc>{text}</long-desc>'
+            return {
+                "long_desc": text,
+                "long_desc_content_type": content_type,
+                "long_desc_xml": xml
+            }
+        except Exception:
+            return None
+
+    @property
+    def long_desc_count(self):
+        """Conta quantos elementos <long-desc> existem como filhos diretos."""
+        try:
+            return len(self.node.findall("long-desc"))
+        except (AttributeError, TypeError):
+            return 0
+
+    @property
+    def parent_info(self):
+        """
+        NOVA FUNCIONALIDADE: Extrai informações do elemento pai para validações.
+        Usado para verificar duplicação de conteúdo e identificar figuras decorativas.
+        """
+        parent = self.node.getparent()
+        if parent is not None:
+            label = parent.findtext("./label")
+            caption_title = parent.findtext("./caption/title")
+            return {
+                "parent_tag": parent.tag,
+                "parent_label": label,
+                "parent_caption_title": caption_title,
+            }
+        return {}
+
+    @property
+    def mimetype_info(self):
+        """
+        NOVA FUNCIONALIDADE: Extrai informações de MIME type para elementos <media>.
+        Necessário para validar regra de alt-text apenas em vídeo/áudio.
+        """
+        if self.node.tag in ("media", "inline-media"):
+            return {
+                "mimetype": self.node.get("mimetype"),
+                "mime_subtype": self.node.get("mime-subtype"),
+            }
+        return {}
+
+    @property
+    def data(self):
+        """Retorna um dicionário com todos os dados extraídos do XML."""
+        d = {
+            "tag": self.node.tag,
+            "xref_sec_rid": self.xref_sec_rid,
+            "xml": self._get_xml_string(),  # Para mensagens de erro mais claras
+            "long_desc_count": self.long_desc_count,
+        }
+        d.update(self.long_desc or {})
+        d.update(self.alt_text or {})
+        d.update(self.parent_info)  # NOVO
+        d.update(self.mimetype_info)  # NOVO
+        d.update(self.transcript_data or {})
+        return d
+
+
+class Transcript:
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def transcript_id(self):
+        """Obtém o id do transcript."""
+        return self.node.get("id")
+
+    @property
+    def transcript(self):
+        """Obtém o texto dentro de <sec sec-type='transcript'>, removendo espaços extras."""
+        text = " ".join(self.node.itertext()).strip()
+        return re.sub(r"\s+", " ", text) if text else None
+
+    @property
+    def speaker_data(self):
+        """Obtém os dados de <speaker> e <speech> dentro de transcrição."""
+        speaker_data = []
+        for speech in self.node.xpath(".//speech"):
+            speaker_data.append({
+                "speaker": speech.findtext("speaker"),
+                "speech": " ".join(speech.xpath("p//text()"))
+            })
+        return speaker_data
+
+    @property
+    def data(self):
+        """Retorna um dicionário com todos os dados extraídos do XML."""
+        return {
+            "transcript_id": self.transcript_id,
+            "transcript": self.transcript,
+            "speakers": self.speaker_data,
+            "tag": self.node.tag,
+        }
+
+
+def __getattr__(name):
+    _moved = {
+        "XMLAccessibilityData": "packtools.sps.validation.models.accessibility_data",
+    }
+    if name in _moved:
+        import importlib
+        _warnings.warn(
+            f"{name} has moved to {_moved[name]}. "
+            f"Importing from packtools.sps.models.accessibility_data is deprecated.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        mod = importlib.import_module(_moved[name])
+        return getattr(mod, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,140 @@
+from bisect import bisect_left, bisect_right
+
+from lxml import etree
+
+from packtools.sps.models.article_and_subarticles import Fulltext
+from packtools.sps.utils.xml_utils import get_parents
+
+
+class ArticleIndex:
+    """
+    Index of an article (and its sub-articles) built in a single tree pass
+
+    It is built once per document and shared by models and validators, which
+    would otherwise run the same XPath queries (``.//sub-article``,
+    ``.//xref``, ``.//*[@id]``, ...) against the same tree.
+
+    All the lists keep the document order, so results obtained from the
+    index are in the same order as the XPath ones.
+    """
+
+    def __init__(self, xmltree):
+        if isinstance(xmltree, etree._ElementTree):
+            xmltree = xmltree.getroot()
+        self.xmltree = xmltree
+
+        # all the elements in document order
+        self.elements = []
+        # tag -> positions (in self.elements)
+        self._positions_by_tag = {}
+        # @id -> elements
+        self.elements_by_id = {}
+        # xref/@rid -> xref elements
+        self.xrefs_by_rid = {}
+        # article and sub-articles, document order
+        self.fulltexts = []
+        # (start, end) positions of the elements of each fulltext
+        self._ranges = []
+
+        self._build()
+
+    def _build(self):
+        open_fulltexts = []
+        for event, node in etree.iterwalk(self.xmltree, events=("start", "end")):
+            tag = node.tag
+            if not isinstance(tag, str):
+                # comments and processing instructions
+                continue
+
+            if event == "end":
+                if open_fulltexts and open_fulltexts[-1][0] is node:
+                    _, index, start = open_fulltexts.pop()
+                    self._ranges[index] = (start, len(self.elements))
+                continue
+
+            position = len(self.elements)
+            self.elements.append(node)
+            self._positions_by_tag.setdefault(tag, []).append(position)
+
+            if node is self.xmltree or tag == "sub-article":
+                open_fulltexts.append((node, len(self.fulltexts), position))
+                self.fulltexts.append(Fulltext(node))
+                self._ranges.append(None)
+
+            node_id = node.get("id")
+            if node_id is not None:
+                self.elements_by_id.setdefault(node_id, []).append(node)
+
+            if tag == "xref":
+                self.xrefs_by_rid.setdefault(node.get("rid"), []).append(node)
+
+    @property
+    def fulltexts_by_lang(self):
+        if not hasattr(self, "_fulltexts_by_lang"):
+            self._fulltexts_by_lang = {}
+            for fulltext in self.fulltexts:
+                self._fulltexts_by_lang.setdefault(fulltext.lang, []).append(
+                    fulltext
+                )
+        return self._fulltexts_by_lang
+
+    @property
+    def parents(self):
+        """
+        Same as list(xml_utils.get_parents(xmltree))
+        """
+        if not hasattr(self, "_parents"):
+            self._parents = list(get_parents(self.xmltree))
+        return self._parents
+
+    def get_fulltext(self, node):
+        """
+        Returns the fulltext of node (article or sub-article), or None if
+        node is not one of them
+        """
+        for fulltext in self.fulltexts:
+            if fulltext.node is node:
+                return fulltext
+
+    def sub_articles(self, translation):
+        """
+        Same as xmltree.xpath(".//sub-article[@article-type='translation']")
+        if translation, else
+        xmltree.xpath(".//sub-article[@article-type!='translation']")
+        """
+        items = []
+        for node in self.descendants("sub-article"):
+            article_type = node.get("article-type")
+            if article_type is None:
+                continue
+            if (article_type == "translation") is translation:
+                items.append(node)
+        return items
+
+    def section_descendants(self, tag, fulltext, sections=("front", "body", "back")):
+        """
+        Same as node.xpath(f"./front//{tag} | ./body//{tag} | ./back//{tag}"),
+        where node is fulltext.node
+        """
+        items = []
+        for node in self.descendants(tag, fulltext):
+            child = node.getparent()
+            while child is not None and child.getparent() is not fulltext.node:
+                child = child.getparent()
+            if child is not None and child.tag in sections:
+                items.append(node)
+        return items
+
+    def descendants(self, tag="*", fulltext=None):
+        """
+        Same as node.xpath(f".//{tag}"), where node is xmltree or
+        fulltext.node (fulltext must be one of self.fulltexts)
+        """
+        index = self.fulltexts.index(fulltext) if fulltext else 0
+        start, end = self._ranges[index]
+        if tag == "*":
+            return self.elements[start + 1:end]
+        positions = self._positions_by_tag.get(tag) or []
+        first = bisect_right(positions, start)
+        last = bisect_left(positions, end)
+        return [self.elements[position] for position in positions[first:last]]
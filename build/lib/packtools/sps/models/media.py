@@ -0,0 +1,66 @@
+from packtools.sps.models.label_and_caption import LabelAndCaption
+from packtools.sps.models.visual_resource_base import (
+    VisualResourceBase,
+    XmlVisualResource,
+)
+
+
+class BaseMedia(VisualResourceBase):
+
+    @property
+    def mimetype(self):
+        return self.node.get("mimetype")
+
+    @property
+    def mime_subtype(self):
+        return self.node.get("mime-subtype")
+
+    @property
+    def data(self):
+        base_data = super().data
+
+        media_data = {
+            "mimetype": self.mimetype,
+            "mime_subtype": self.mime_subtype,
+        }
+
+        combined_data = {**base_data, **media_data}
+        return combined_data
+
+
+class Media(BaseMedia, LabelAndCaption):
+    def __init__(self, node):
+        BaseMedia.__init__(self, node)  # Chama o __init__ de BaseMedia
+        LabelAndCaption.__init__(self, node)  # Chama o __init__ de LabelAndCaption
+
+    @property
+    def data(self):
+        # Detalhes sobre a obtenção dos atributos abaixo em: https://github.com/scieloorg/packtools/pull/964
+        base_data = BaseMedia.data.fget(self)
+        label_caption_data = LabelAndCaption.data.fget(self)
+
+        return {**base_data, **label_caption_data}
+
+
+class InlineMedia(BaseMedia):
+    pass
+
+
+import warnings as _warnings
+
+
+def __getattr__(name):
+    _moved = {
+        "XmlMedias": "packtools.sps.validation.models.media",
+    }
+    if name in _moved:
+        import importlib
+        _warnings.warn(
+            f"{name} has moved to {_moved[name]}. "
+            f"Importing from packtools.sps.models.media is deprecated.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        mod = importlib.import_module(_moved[name])
+        return getattr(mod, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,237 @@
+import lxml.etree as ET
+
+from packtools.sps.utils.xml_utils import put_parent_context, node_plain_text, tostring
+
+
+class TableWrap:
+    def __init__(self, element):
+        self.element = element
+
+    def str_main_tag(self):
+        return f'<table-wrap id="{self.table_wrap_id}">'
+
+    def __str__(self):
+        return tostring(self.element, xml_declaration=False)
+
+    def xml(self, pretty_print=True):
+        return tostring(
+            node=self.element,
+            doctype=None,
+            pretty_print=pretty_print,
+            xml_declaration=False,
+        )
+
+    @property
+    def table_wrap_id(self):
+        return self.element.get("id")
+
+    @property
+    def label(self):
+        return self.element.findtext("label")
+
+    @property
+    def caption(self):
+        caption_element = self.element.find("caption")
+        if caption_element is not None:
+            return ET.tostring(
+                caption_element, encoding="unicode", method="text"
+            ).strip()
+        return ""
+
+    @property
+    def caption_has_title(self):
+        """
+        Checks whether <caption> contains a <title> child element.
+
+        A <title/> (empty) is structurally valid per SPS documentation and counts
+        as present. Returns False only when <caption> is absent entirely or when
+        <caption> has no <title> child at all.
+
+        Returns:
+            bool: True if <caption><title> exists (even if empty), False otherwise.
+        """
+        caption_element = self.element.find("caption")
+        if caption_element is not None:
+            return caption_element.find("title") is not None
+        return False
+
+    @property
+    def table_wrap_foot(self):
+        table_wrap_foot_elem = self.element.find(".//table-wrap-foot")
+        if table_wrap_foot_elem is None:
+            return []
+
+        fns = []
+        for fn_elem in table_wrap_foot_elem.findall(".//fn"):
+            fns.append(
+                {
+                    "text": node_plain_text(fn_elem),
+                    "id": fn_elem.get("id"),
+                    "label": fn_elem.findtext(".//label"),
+                }
+            )
+        return fns
+
+    @property
+    def alternative_elements(self):
+        alternative_elements = self.element.find(".//alternatives")
+        if alternative_elements is not None:
+            return [child.tag for child in alternative_elements]
+        return []
+
+    @property
+    def table(self):
+        table = self.element.find(".//table")
+        if table is not None:
+            return tostring(table, xml_declaration=False)
+        return None
+
+    @property
+    def graphic(self):
+        graphic = self.element.find(".//graphic")
+        if graphic is not None:
+            return graphic.get("{http://www.w3.org/1999/xlink}href")
+        return None
+
+    @property
+    def graphic_alt_text(self):
+        """
+        Extracts alt-text from graphic within alternatives.
+
+        Returns:
+            str or None: The text content of <alt-text> if present, None otherwise.
+        """
+        graphic = self.element.find(".//alternatives/graphic")
+        if graphic is not None:
+            alt_text_elem = graphic.find("alt-text")
+            if alt_text_elem is not None:
+                return alt_text_elem.text
+        return None
+
+    @property
+    def graphic_long_desc(self):
+        """
+        Extracts long-desc from graphic within alternatives.
+
+        Returns:
+            str or None: The text content of <long-desc> if present, None otherwise.
+        """
+        graphic = self.element.find(".//alternatives/graphic")
+        if graphic is not None:
+            long_desc_elem = graphic.find("long-desc")
+            if long_desc_elem is not None:
+                return long_desc_elem.text
+        return None
+
+    @property
+    def has_tr_in_table(self):
+        """Check if <table> has direct <tr> children (invalid per NISO JATS)."""
+        table = self.element.find(".//table")
+        if table is not None:
+            return table.find("tr") is not None
+        return False
+
+    @property
+    def has_th_outside_thead(self):
+        """Check if <th> appears outside of <thead>."""
+        table = self.element.find(".//table")
+        if table is not None:
+            all_th = table.findall(".//th")
+            thead_th = table.findall(".//thead//th")
+            return len(all_th) > len(thead_th)
+        return False
+
+    @property
+    def has_td_outside_tbody(self):
+        """Check if <td> appears outside of <tbody>."""
+        table = self.element.find(".//table")
+        if table is not None:
+            all_td = table.findall(".//td")
+            tbody_td = table.findall(".//tbody//td")
+            return len(all_td) > len(tbody_td)
+        return False
+
+    @property
+    def has_tbody(self):
+        """Check if <table> has a <tbody> element."""
+        table = self.element.find(".//table")
+        if table is not None:
+            return table.find(".//tbody") is not None
+        return False
+
+    @property
+    def data(self):
+        return {
+            "alternative_parent": "table-wrap",
+            "table_wrap_id": self.table_wrap_id,
+            "label": self.label,
+            "caption": self.caption,
+            "caption_has_title": self.caption_has_title,
+            "footnotes": self.table_wrap_foot,
+            "alternative_elements": self.alternative_elements,
+            "table": self.table,
+            "graphic": self.graphic,
+            "graphic_alt_text": self.graphic_alt_text,
+            "graphic_long_desc": self.graphic_long_desc,
+            "has_tr_in_table": self.has_tr_in_table,
+            "has_th_outside_thead": self.has_th_outside_thead,
+            "has_td_outside_tbody": self.has_td_outside_tbody,
+            "has_tbody": self.has_tbody,
+        }
+
+
+class TableWrappers:
+    def __init__(self, node, index=None):
+        """
+        Initializes the TableWrappers class with an XML node.
+
+        Parameters:
+        node : lxml.etree._Element
+            The XML node (element) that contains one or more <table-wrap> elements.
+            This can be the root of an `xml_tree` or a node representing a `sub-article`.
+        index : ArticleIndex, optional
+            Index of the document of node, used instead of XPath queries
+        """
+        self.node = node
+        self.index = index
+        self.parent = self.node.tag
+        self.parent_id = self.node.get("id")
+        self.lang = self.node.get("{http://www.w3.org/XML/1998/namespace}lang")
+        self.article_type = self.node.get("article-type")
+
+    def _nodes(self):
+        fulltext = self.index and self.index.get_fulltext(self.node)
+        if self.parent == "article":
+            if fulltext is not None:
+                return self.index.section_descendants("table-wrap", fulltext)
+            return self.node.xpath("./front//table-wrap | ./body//table-wrap | ./back//table-wrap")
+        if fulltext is not None:
+            return self.index.descendants("table-wrap", fulltext)
+        return self.node.xpath(".//table-wrap")
+
+    def table_wrappers(self):
+        for table in self._nodes():
+            data = TableWrap(table).data
+            yield put_parent_context(
+                data, self.lang, self.article_type, self.parent, self.parent_id
+            )
+
+
+import warnings as _warnings
+
+
+def __getattr__(name):
+    _moved = {
+        "ArticleTableWrappers": "packtools.sps.validation.models.tablewrap",
+    }
+    if name in _moved:
+        import importlib
+        _warnings.warn(
+            f"{name} has moved to {_moved[name]}. "
+            f"Importing from packtools.sps.models.tablewrap is deprecated.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        mod = importlib.import_module(_moved[name])
+        return getattr(mod, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
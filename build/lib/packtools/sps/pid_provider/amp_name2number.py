@@ -0,0 +1,440 @@
+AMP_NAME_TO_NUMBER_ENTITIES = {
+    "&amp;rquo;": "'",
+    "&amp;lquo;": "'",
+    "&amp;Agrave;": "&#192;",
+    "&amp;Aacute;": "&#193;",
+    "&amp;Acirc;": "&#194;",
+    "&amp;Atilde;": "&#195;",
+    "&amp;Auml;": "&#196;",
+    "&amp;Aring;": "&#197;",
+    "&amp;AElig;": "&#198;",
+    "&amp;Ccedil;": "&#199;",
+    "&amp;Egrave;": "&#200;",
+    "&amp;Eacute;": "&#201;",
+    "&amp;Ecirc;": "&#202;",
+    "&amp;Euml;": "&#203;",
+    "&amp;Igrave;": "&#204;",
+    "&amp;Iacute;": "&#205;",
+    "&amp;Icirc;": "&#206;",
+    "&amp;Iuml;": "&#207;",
+    "&amp;ETH;": "&#208;",
+    "&amp;Ntilde;": "&#209;",
+    "&amp;Ograve;": "&#210;",
+    "&amp;Oacute;": "&#211;",
+    "&amp;Ocirc;": "&#212;",
+    "&amp;Otilde;": "&#213;",
+    "&amp;Ouml;": "&#214;",
+    "&amp;Oslash;": "&#216;",
+    "&amp;Ugrave;": "&#217;",
+    "&amp;Uacute;": "&#218;",
+    "&amp;Ucirc;": "&#219;",
+    "&amp;Uuml;": "&#220;",
+    "&amp;Yacute;": "&#221;",
+    "&amp;THORN;": "&#222;",
+    "&amp;szlig;": "&#223;",
+    "&amp;agrave;": "&#224;",
+    "&amp;aacute;": "&#225;",
+    "&amp;acirc;": "&#226;",
+    "&amp;atilde;": "&#227;",
+    "&amp;auml;": "&#228;",
+    "&amp;aring;": "&#229;",
+    "&amp;aelig;": "&#230;",
+    "&amp;ccedil;": "&#231;",
+    "&amp;egrave;": "&#232;",
+    "&amp;eacute;": "&#233;",
+    "&amp;ecirc;": "&#234;",
+    "&amp;euml;": "&#235;",
+    "&amp;igrave;": "&#236;",
+    "&amp;iacute;": "&#237;",
+    "&amp;icirc;": "&#238;",
+    "&amp;iuml;": "&#239;",
+    "&amp;eth;": "&#240;",
+    "&amp;ntilde;": "&#241;",
+    "&amp;ograve;": "&#242;",
+    "&amp;oacute;": "&#243;",
+    "&amp;ocirc;": "&#244;",
+    "&amp;otilde;": "&#245;",
+    "&amp;ouml;": "&#246;",
+    "&amp;oslash;": "&#248;",
+    "&amp;ugrave;": "&#249;",
+    "&amp;uacute;": "&#250;",
+    "&amp;ucirc;": "&#251;",
+    "&amp;uuml;": "&#252;",
+    "&amp;yacute;": "&#253;",
+    "&amp;thorn;": "&#254;",
+    "&amp;yuml;": "&#255;",
+    "&amp;rsquo;": "&#x2019;",
+    "&amp;nbsp;": "&#160;",
+    "&amp;iexcl;": "&#161;",
+    "&amp;cent;": "&#162;",
+    "&amp;pound;": "&#163;",
+    "&amp;curren;": "&#164;",
+    "&amp;yen;": "&#165;",
+    "&amp;brvbar;": "&#166;",
+    "&amp;sect;": "&#167;",
+    "&amp;uml;": "&#168;",
+    "&amp;copy;": "&#169;",
+    "&amp;ordf;": "&#170;",
+    "&amp;laquo;": "&#171;",
+    "&amp;not;": "&#172;",
+    "&amp;shy;": "&#173;",
+    "&amp;reg;": "&#174;",
+    "&amp;macr;": "&#175;",
+    "&amp;deg;": "&#176;",
+    "&amp;plusmn;": "&#177;",
+    "&amp;sup2;": "&#178;",
+    "&amp;sup3;": "&#179;",
+    "&amp;acute;": "&#180;",
+    "&amp;micro;": "&#181;",
+    "&amp;para;": "&#182;",
+    "&amp;middot;": "&#183;",
+    "&amp;cedil;": "&#184;",
+    "&amp;sup1;": "&#185;",
+    "&amp;ordm;": "&#186;",
+    "&amp;raquo;": "&#187;",
+    "&amp;frac14;": "&#188;",
+    "&amp;frac12;": "&#189;",
+    "&amp;frac34;": "&#190;",
+    "&amp;iquest;": "&#191;",
+    "&amp;quest;": "&#191;",
+    "&amp;lowbar;": "&#x005F;",
+    "&amp;times;": "&#215;",
+    "&amp;divide;": "&#247;",
+    "&amp;fnof;": "&#402;",
+    "&amp;Alpha;": "&#913;",
+    "&amp;Beta;": "&#914;",
+    "&amp;Gamma;": "&#915;",
+    "&amp;Delta;": "&#916;",
+    "&amp;Epsilon;": "&#917;",
+    "&amp;Zeta;": "&#918;",
+    "&amp;Eta;": "&#919;",
+    "&amp;Theta;": "&#920;",
+    "&amp;Iota;": "&#921;",
+    "&amp;Kappa;": "&#922;",
+    "&amp;Lambda;": "&#923;",
+    "&amp;Mu;": "&#924;",
+    "&amp;Nu;": "&#925;",
+    "&amp;Xi;": "&#926;",
+    "&amp;Omicron;": "&#927;",
+    "&amp;Pi;": "&#928;",
+    "&amp;Rho;": "&#929;",
+    "&amp;Sigma;": "&#931;",
+    "&amp;Tau;": "&#932;",
+    "&amp;Upsilon;": "&#933;",
+    "&amp;Phi;": "&#934;",
+    "&amp;Chi;": "&#935;",
+    "&amp;Psi;": "&#936;",
+    "&amp;Omega;": "&#937;",
+    "&amp;alpha;": "&#945;",
+    "&amp;beta;": "&#946;",
+    "&amp;gamma;": "&#947;",
+    "&amp;delta;": "&#948;",
+    "&amp;epsilon;": "&#949;",
+    "&amp;zeta;": "&#950;",
+    "&amp;eta;": "&#951;",
+    "&amp;theta;": "&#952;",
+    "&amp;iota;": "&#953;",
+    "&amp;kappa;": "&#954;",
+    "&amp;lambda;": "&#955;",
+    "&amp;mu;": "&#956;",
+    "&amp;nu;": "&#957;",
+    "&amp;xi;": "&#958;",
+    "&amp;omicron;": "&#959;",
+    "&amp;pi;": "&#960;",
+    "&amp;rho;": "&#961;",
+    "&amp;sigmaf;": "&#962;",
+    "&amp;sigma;": "&#963;",
+    "&amp;tau;": "&#964;",
+    "&amp;upsilon;": "&#965;",
+    "&amp;phi;": "&#966;",
+    "&amp;chi;": "&#967;",
+    "&amp;psi;": "&#968;",
+    "&amp;omega;": "&#969;",
+    "&amp;thetasym;": "&#977;",
+    "&amp;upsih;": "&#978;",
+    "&amp;piv;": "&#982;",
+    "&amp;bull;": "&#8226;",
+    "&amp;hellip;": "&#8230;",
+    "&amp;prime;": "&#8242;",
+    "&amp;Prime;": "&#8243;",
+    "&amp;oline;": "&#8254;",
+    "&amp;frasl;": "&#8260;",
+    "&amp;weierp;": "&#8472;",
+    "&amp;image;": "&#8465;",
+    "&amp;real;": "&#8476;",
+    "&amp;trade;": "&#8482;",
+    "&amp;alefsym;": "&#8501;",
+    "&amp;larr;": "&#8592;",
+    "&amp;uarr;": "&#8593;",
+    "&amp;rarr;": "&#8594;",
+    "&amp;darr;": "&#8595;",
+    "&amp;harr;": "&#8596;",
+    "&amp;crarr;": "&#8629;",
+    "&amp;lArr;": "&#8656;",
+    "&amp;uArr;": "&#8657;",
+    "&amp;rArr;": "&#8658;",
+    "&amp;dArr;": "&#8659;",
+    "&amp;hArr;": "&#8660;",
+    "&amp;forall;": "&#8704;",
+    "&amp;part;": "&#8706;",
+    "&amp;exist;": "&#8707;",
+    "&amp;empty;": "&#8709;",
+    "&amp;nabla;": "&#8711;",
+    "&amp;isin;": "&#8712;",
+    "&amp;notin;": "&#8713;",
+    "&amp;ni;": "&#8715;",
+    "&amp;prod;": "&#8719;",
+    "&amp;sum;": "&#8721;",
+    "&amp;minus;": "&#8722;",
+    "&amp;lowast;": "&#8727;",
+    "&amp;radic;": "&#8730;",
+    "&amp;prop;": "&#8733;",
+    "&amp;infin;": "&#8734;",
+    "&amp;ang;": "&#8736;",
+    "&amp;and;": "&#8869;",
+    "&amp;or;": "&#8870;",
+    "&amp;cap;": "&#8745;",
+    "&amp;cup;": "&#8746;",
+    "&amp;int;": "&#8747;",
+    "&amp;there4;": "&#8756;",
+    "&amp;sim;": "&#8764;",
+    "&amp;cong;": "&#8773;",
+    "&amp;asymp;": "&#8776;",
+    "&amp;ne;": "&#8800;",
+    "&amp;equiv;": "&#8801;",
+    "&amp;le;": "&#8804;",
+    "&amp;ge;": "&#8805;",
+    "&amp;sub;": "&#8834;",
+    "&amp;sup;": "&#8835;",
+    "&amp;nsub;": "&#8836;",
+    "&amp;sube;": "&#8838;",
+    "&amp;supe;": "&#8839;",
+    "&amp;oplus;": "&#8853;",
+    "&amp;otimes;": "&#8855;",
+    "&amp;perp;": "&#8869;",
+    "&amp;sdot;": "&#8901;",
+    "&amp;lceil;": "&#8968;",
+    "&amp;rceil;": "&#8969;",
+    "&amp;lfloor;": "&#8970;",
+    "&amp;rfloor;": "&#8971;",
+    "&amp;lang;": "&#9001;",
+    "&amp;rang;": "&#9002;",
+    "&amp;loz;": "&#9674;",
+    "&amp;spades;": "&#9824;",
+    "&amp;clubs;": "&#9827;",
+    "&amp;hearts;": "&#9829;",
+    "&amp;diams;": "&#9830;",
+    "&amp;quot;": "&#34;",
+    "&amp;OElig;": "&#338;",
+    "&amp;oelig;": "&#339;",
+    "&amp;Scaron;": "&#352;",
+    "&amp;scaron;": "&#353;",
+    "&amp;Yuml;": "&#376;",
+    "&amp;circ;": "&#710;",
+    "&amp;tilde;": "&#732;",
+    "&amp;ensp;": "&#8194;",
+    "&amp;emsp;": "&#8195;",
+    "&amp;thinsp;": "&#8201;",
+    "&amp;zwnj;": "&#8204;",
+    "&amp;zwj;": "&#8205;",
+    "&amp;lrm;": "&#8206;",
+    "&amp;rlm;": "&#8207;",
+    "&amp;ndash;": "&#8211;",
+    "&amp;mdash;": "&#8212;",
+    "&amp;lsquo;": "&#8216;",
+    "&amp;rsquo;": "&#8217;",
+    "&amp;sbquo;": "&#8218;",
+    "&amp;ldquo;": "&#8220;",
+    "&amp;rdquo;": "&#8221;",
+    "&amp;bdquo;": "&#8222;",
+    "&amp;dagger;": "&#8224;",
+    "&amp;Dagger;": "&#8225;",
+    "&amp;permil;": "&#8240;",
+    "&amp;lsaquo;": "&#8249;",
+    "&amp;rsaquo;": "&#8250;",
+    "&amp;hairsp;": "&#8202;",
+    "&amp;plus;": "&#43;",
+    "&amp;Eur;": "&#128;",
+    "&amp;low;": "&#130;",
+    "&amp;small;": "&#131;",
+    "&amp;per;": "&#137;",
+    "&amp;capital;": "&#138;",
+    "&amp;left;": "&#139;",
+    "&amp;right;": "&#155;",
+    "&amp;Amacr;": "&#256;",
+    "&amp;amacr;": "&#257;",
+    "&amp;Acaron;": "&#258;",
+    "&amp;acaron;": "&#259;",
+    "&amp;Acedil;": "&#260;",
+    "&amp;acedil;": "&#261;",
+    "&amp;Cacute;": "&#262;",
+    "&amp;cacute;": "&#263;",
+    "&amp;Ccaron;": "&#268;",
+    "&amp;ccaron;": "&#269;",
+    "&amp;Dcaron;": "&#270;",
+    "&amp;Dstrok;": "&#272;",
+    "&amp;dstrok;": "&#273;",
+    "&amp;Emacr;": "&#274;",
+    "&amp;emacr;": "&#276;",
+    "&amp;Edot;": "&#278;",
+    "&amp;edot;": "&#279;",
+    "&amp;Ecedil;": "&#280;",
+    "&amp;ecedil;": "&#281;",
+    "&amp;Ecaron;": "&#282;",
+    "&amp;ecaron;": "&#283;",
+    "&amp;Gcaron;": "&#286;",
+    "&amp;gcaron;": "&#287;",
+    "&amp;Gcedil;": "&#290;",
+    "&amp;gapos;": "&#292;",
+    "&amp;Imacr;": "&#298;",
+    "&amp;imacr;": "&#299;",
+    "&amp;Icedil;": "&#304;",
+    "&amp;Kcedil;": "&#310;",
+    "&amp;kcedil;": "&#311;",
+    "&amp;Lacute;": "&#313;",
+    "&amp;lacute;": "&#314;",
+    "&amp;Lcedil;": "&#315;",
+    "&amp;lcedil;": "&#316;",
+    "&amp;Lstrok;": "&#321;",
+    "&amp;lstrok;": "&#322;",
+    "&amp;Nacute;": "&#323;",
+    "&amp;nacute;": "&#324;",
+    "&amp;Ncedil;": "&#325;",
+    "&amp;ncedil;": "&#326;",
+    "&amp;Ncaron;": "&#327;",
+    "&amp;ncaron;": "&#328;",
+    "&amp;Omacr;": "&#332;",
+    "&amp;omacr;": "&#333;",
+    "&amp;Odblac;": "&#336;",
+    "&amp;odblac;": "&#337;",
+    "&amp;Rcedil;": "&#342;",
+    "&amp;rcedil;": "&#343;",
+    "&amp;Rcaron;": "&#344;",
+    "&amp;rcaron;": "&#345;",
+    "&amp;Sacute;": "&#346;",
+    "&amp;sacute;": "&#347;",
+    "&amp;Scedil;": "&#350;",
+    "&amp;scedil;": "&#351;",
+    "&amp;Tcedil;": "&#354;",
+    "&amp;tcedil;": "&#355;",
+    "&amp;Tcaron;": "&#356;",
+    "&amp;tcaron;": "&#357;",
+    "&amp;Umacr;": "&#362;",
+    "&amp;umacr;": "&#363;",
+    "&amp;Uring;": "&#366;",
+    "&amp;uring;": "&#367;",
+    "&amp;Udblac;": "&#368;",
+    "&amp;udblac;": "&#369;",
+    "&amp;Ucedil;": "&#370;",
+    "&amp;ucedil;": "&#371;",
+    "&amp;Zacute;": "&#377;",
+    "&amp;zacute;": "&#378;",
+    "&amp;Zdot;": "&#379;",
+    "&amp;zdot;": "&#380;",
+    "&amp;Zcaron;": "&#381;",
+    "&amp;zcaron;": "&#382;",
+    "&amp;percnt;": "&#37;",
+    "&amp;emsp14;": "&#x2005;",
+    "&amp;lsqb;": "&#91;",
+    "&amp;rsqb;": "&#93;",
+    "&amp;ast;": "&#42;",
+    "&amp;Agr;": "&#x0391;",
+    "&amp;agr;": "&#x03b1;",
+    "&amp;Bgr;": "&#x0392;",
+    "&amp;bgr;": "&#x03b2;",
+    "&amp;Dgr;": "&#x0394;",
+    "&amp;dgr;": "&#x03b4;",
+    "&amp;EEgr;": "&#x0397;",
+    "&amp;eegr;": "&#x03b7;",
+    "&amp;Egr;": "&#x0395;",
+    "&amp;egr;": "&#x03b5;",
+    "&amp;Ggr;": "&#x0393;",
+    "&amp;ggr;": "&#x03b3;",
+    "&amp;Igr;": "&#x0399;",
+    "&amp;igr;": "&#x03b9;",
+    "&amp;Kgr;": "&#x039a;",
+    "&amp;kgr;": "&#x3ba;",
+    "&amp;KHgr;": "&#x03a7;",
+    "&amp;khgr;": "&#x03c7;",
+    "&amp;Lgr;": "&#x039b;",
+    "&amp;lgr;": "&#x03bb;",
+    "&amp;Mgr;": "&#x039c;",
+    "&amp;mgr;": "&#x03bc;",
+    "&amp;Ngr;": "&#x039d;",
+    "&amp;ngr;": "&#x03bd;",
+    "&amp;Ogr;": "&#x039f;",
+    "&amp;ogr;": "&#x03bf;",
+    "&amp;OHgr;": "&#x03a9;",
+    "&amp;ohgr;": "&#x03c9;",
+    "&amp;Pgr;": "&#x03a0;",
+    "&amp;pgr;": "&#x03c0;",
+    "&amp;PHgr;": "&#x03a6;",
+    "&amp;phgr;": "&#x03c6;",
+    "&amp;PSgr;": "&#x03a8;",
+    "&amp;psgr;": "&#x03c8;",
+    "&amp;Rgr;": "&#x03a1;",
+    "&amp;rgr;": "&#x03c1;",
+    "&amp;Sgr;": "&#x03a3;",
+    "&amp;sgr;": "&#x03c3;",
+    "&amp;Tgr;": "&#x03a4;",
+    "&amp;tgr;": "&#x03c4;",
+    "&amp;THgr;": "&#x0398;",
+    "&amp;thgr;": "&#x03b8;",
+    "&amp;Ugr;": "&#x03a5;",
+    "&amp;ugr;": "&#x03c5;",
+    "&amp;Xgr;": "&#x039e;",
+    "&amp;xgr;": "&#x03be;",
+    "&amp;Zgr;": "&#x0396;",
+    "&amp;zgr;": "&#x03b6;",
+    "&amp;abreve;": "&#259;",
+    "&amp;female;": "&#9792;",
+    "&amp;male;": "&#9794;",
+    "&amp;sol;": "&#47;",
+    "&amp;lpar;": "&#40;",
+    "&amp;rpar;": "&#41;",
+    "&amp;euro;": "&#8364;",
+}
+
+
+def fix_pos_loading(xml):
+    """Formata a saída convertendo entidades para números."""
+    if "&" not in xml:
+        return xml
+
+    entities = set(find_entities_to_fix(xml))
+    if not entities:
+        return xml
+
+    for ent in entities:
+        xml = xml.replace(ent, AMP_NAME_TO_NUMBER_ENTITIES.get(ent) or ent)
+    return xml
+
+
+def find_entities_to_fix(bkp):
+    """Descobre entidades que precisam ser corrigidas na saída."""
+    bkp = bkp.replace("&amp;", "<ISOLAENTIDADEXML>&")
+    bkp = bkp.replace(";", ";<ISOLAENTIDADEXML>")
+
+    for item in bkp.split("<ISOLAENTIDADEXML>"):
+        if not item.strip():
+            continue
+        if " " in item:
+            continue
+        if item[0] == "&" and item[-1] == ";":
+            yield item.replace("&", "&amp;")
+
+
+# Exemplo de uso:
+if __name__ == "__main__":
+    # Testando algumas conversões
+    test_entities = ["&Aacute;", "&ccedil;", "&euro;", "&nbsp;"]
+
+    print("Exemplos de conversão:")
+    print("-" * 40)
+    for entity in test_entities:
+        if entity in NAME_TO_NUMBER_ENTITIES:
+            print(f"{entity:15} -> {NAME_TO_NUMBER_ENTITIES[entity]}")
+        else:
+            print(f"{entity:15} -> Não encontrado")
+
+    print(f"\nTotal de entidades no dicionário: {len(NAME_TO_NUMBER_ENTITIES)}")
@@ -0,0 +1,499 @@
+import functools
+import re
+from html.entities import html5
+
+NAME_TO_NUMBER_ENTITIES = {
+    "&rquo;": "'",
+    "&lquo;": "'",
+    "&Agrave;": "&#192;",
+    "&Aacute;": "&#193;",
+    "&Acirc;": "&#194;",
+    "&Atilde;": "&#195;",
+    "&Auml;": "&#196;",
+    "&Aring;": "&#197;",
+    "&AElig;": "&#198;",
+    "&Ccedil;": "&#199;",
+    "&Egrave;": "&#200;",
+    "&Eacute;": "&#201;",
+    "&Ecirc;": "&#202;",
+    "&Euml;": "&#203;",
+    "&Igrave;": "&#204;",
+    "&Iacute;": "&#205;",
+    "&Icirc;": "&#206;",
+    "&Iuml;": "&#207;",
+    "&ETH;": "&#208;",
+    "&Ntilde;": "&#209;",
+    "&Ograve;": "&#210;",
+    "&Oacute;": "&#211;",
+    "&Ocirc;": "&#212;",
+    "&Otilde;": "&#213;",
+    "&Ouml;": "&#214;",
+    "&Oslash;": "&#216;",
+    "&Ugrave;": "&#217;",
+    "&Uacute;": "&#218;",
+    "&Ucirc;": "&#219;",
+    "&Uuml;": "&#220;",
+    "&Yacute;": "&#221;",
+    "&THORN;": "&#222;",
+    "&szlig;": "&#223;",
+    "&agrave;": "&#224;",
+    "&aacute;": "&#225;",
+    "&acirc;": "&#226;",
+    "&atilde;": "&#227;",
+    "&auml;": "&#228;",
+    "&aring;": "&#229;",
+    "&aelig;": "&#230;",
+    "&ccedil;": "&#231;",
+    "&egrave;": "&#232;",
+    "&eacute;": "&#233;",
+    "&ecirc;": "&#234;",
+    "&euml;": "&#235;",
+    "&igrave;": "&#236;",
+    "&iacute;": "&#237;",
+    "&icirc;": "&#238;",
+    "&iuml;": "&#239;",
+    "&eth;": "&#240;",
+    "&ntilde;": "&#241;",
+    "&ograve;": "&#242;",
+    "&oacute;": "&#243;",
+    "&ocirc;": "&#244;",
+    "&otilde;": "&#245;",
+    "&ouml;": "&#246;",
+    "&oslash;": "&#248;",
+    "&ugrave;": "&#249;",
+    "&uacute;": "&#250;",
+    "&ucirc;": "&#251;",
+    "&uuml;": "&#252;",
+    "&yacute;": "&#253;",
+    "&thorn;": "&#254;",
+    "&yuml;": "&#255;",
+    "&rsquo;": "&#x2019;",
+    "&nbsp;": "&#160;",
+    "&iexcl;": "&#161;",
+    "&cent;": "&#162;",
+    "&pound;": "&#163;",
+    "&curren;": "&#164;",
+    "&yen;": "&#165;",
+    "&brvbar;": "&#166;",
+    "&sect;": "&#167;",
+    "&uml;": "&#168;",
+    "&copy;": "&#169;",
+    "&ordf;": "&#170;",
+    "&laquo;": "&#171;",
+    "&not;": "&#172;",
+    "&shy;": "&#173;",
+    "&reg;": "&#174;",
+    "&macr;": "&#175;",
+    "&deg;": "&#176;",
+    "&plusmn;": "&#177;",
+    "&sup2;": "&#178;",
+    "&sup3;": "&#179;",
+    "&acute;": "&#180;",
+    "&micro;": "&#181;",
+    "&para;": "&#182;",
+    "&middot;": "&#183;",
+    "&cedil;": "&#184;",
+    "&sup1;": "&#185;",
+    "&ordm;": "&#186;",
+    "&raquo;": "&#187;",
+    "&frac14;": "&#188;",
+    "&frac12;": "&#189;",
+    "&frac34;": "&#190;",
+    "&iquest;": "&#191;",
+    "&quest;": "&#191;",
+    "&lowbar;": "&#x005F;",
+    "&times;": "&#215;",
+    "&divide;": "&#247;",
+    "&fnof;": "&#402;",
+    "&Alpha;": "&#913;",
+    "&Beta;": "&#914;",
+    "&Gamma;": "&#915;",
+    "&Delta;": "&#916;",
+    "&Epsilon;": "&#917;",
+    "&Zeta;": "&#918;",
+    "&Eta;": "&#919;",
+    "&Theta;": "&#920;",
+    "&Iota;": "&#921;",
+    "&Kappa;": "&#922;",
+    "&Lambda;": "&#923;",
+    "&Mu;": "&#924;",
+    "&Nu;": "&#925;",
+    "&Xi;": "&#926;",
+    "&Omicron;": "&#927;",
+    "&Pi;": "&#928;",
+    "&Rho;": "&#929;",
+    "&Sigma;": "&#931;",
+    "&Tau;": "&#932;",
+    "&Upsilon;": "&#933;",
+    "&Phi;": "&#934;",
+    "&Chi;": "&#935;",
+    "&Psi;": "&#936;",
+    "&Omega;": "&#937;",
+    "&alpha;": "&#945;",
+    "&beta;": "&#946;",
+    "&gamma;": "&#947;",
+    "&delta;": "&#948;",
+    "&epsilon;": "&#949;",
+    "&zeta;": "&#950;",
+    "&eta;": "&#951;",
+    "&theta;": "&#952;",
+    "&iota;": "&#953;",
+    "&kappa;": "&#954;",
+    "&lambda;": "&#955;",
+    "&mu;": "&#956;",
+    "&nu;": "&#957;",
+    "&xi;": "&#958;",
+    "&omicron;": "&#959;",
+    "&pi;": "&#960;",
+    "&rho;": "&#961;",
+    "&sigmaf;": "&#962;",
+    "&sigma;": "&#963;",
+    "&tau;": "&#964;",
+    "&upsilon;": "&#965;",
+    "&phi;": "&#966;",
+    "&chi;": "&#967;",
+    "&psi;": "&#968;",
+    "&omega;": "&#969;",
+    "&thetasym;": "&#977;",
+    "&upsih;": "&#978;",
+    "&piv;": "&#982;",
+    "&bull;": "&#8226;",
+    "&hellip;": "&#8230;",
+    "&prime;": "&#8242;",
+    "&Prime;": "&#8243;",
+    "&oline;": "&#8254;",
+    "&frasl;": "&#8260;",
+    "&weierp;": "&#8472;",
+    "&image;": "&#8465;",
+    "&real;": "&#8476;",
+    "&trade;": "&#8482;",
+    "&alefsym;": "&#8501;",
+    "&larr;": "&#8592;",
+    "&uarr;": "&#8593;",
+    "&rarr;": "&#8594;",
+    "&darr;": "&#8595;",
+    "&harr;": "&#8596;",
+    "&crarr;": "&#8629;",
+    "&lArr;": "&#8656;",
+    "&uArr;": "&#8657;",
+    "&rArr;": "&#8658;",
+    "&dArr;": "&#8659;",
+    "&hArr;": "&#8660;",
+    "&forall;": "&#8704;",
+    "&part;": "&#8706;",
+    "&exist;": "&#8707;",
+    "&empty;": "&#8709;",
+    "&nabla;": "&#8711;",
+    "&isin;": "&#8712;",
+    "&notin;": "&#8713;",
+    "&ni;": "&#8715;",
+    "&prod;": "&#8719;",
+    "&sum;": "&#8721;",
+    "&minus;": "&#8722;",
+    "&lowast;": "&#8727;",
+    "&radic;": "&#8730;",
+    "&prop;": "&#8733;",
+    "&infin;": "&#8734;",
+    "&ang;": "&#8736;",
+    "&and;": "&#8869;",
+    "&or;": "&#8870;",
+    "&cap;": "&#8745;",
+    "&cup;": "&#8746;",
+    "&int;": "&#8747;",
+    "&there4;": "&#8756;",
+    "&sim;": "&#8764;",
+    "&cong;": "&#8773;",
+    "&asymp;": "&#8776;",
+    "&ne;": "&#8800;",
+    "&equiv;": "&#8801;",
+    "&le;": "&#8804;",
+    "&ge;": "&#8805;",
+    "&sub;": "&#8834;",
+    "&sup;": "&#8835;",
+    "&nsub;": "&#8836;",
+    "&sube;": "&#8838;",
+    "&supe;": "&#8839;",
+    "&oplus;": "&#8853;",
+    "&otimes;": "&#8855;",
+    "&perp;": "&#8869;",
+    "&sdot;": "&#8901;",
+    "&lceil;": "&#8968;",
+    "&rceil;": "&#8969;",
+    "&lfloor;": "&#8970;",
+    "&rfloor;": "&#8971;",
+    "&lang;": "&#9001;",
+    "&rang;": "&#9002;",
+    "&loz;": "&#9674;",
+    "&spades;": "&#9824;",
+    "&clubs;": "&#9827;",
+    "&hearts;": "&#9829;",
+    "&diams;": "&#9830;",
+    "&quot;": "&#34;",
+    "&OElig;": "&#338;",
+    "&oelig;": "&#339;",
+    "&Scaron;": "&#352;",
+    "&scaron;": "&#353;",
+    "&Yuml;": "&#376;",
+    "&circ;": "&#710;",
+    "&tilde;": "&#732;",
+    "&ensp;": "&#8194;",
+    "&emsp;": "&#8195;",
+    "&thinsp;": "&#8201;",
+    "&zwnj;": "&#8204;",
+    "&zwj;": "&#8205;",
+    "&lrm;": "&#8206;",
+    "&rlm;": "&#8207;",
+    "&ndash;": "&#8211;",
+    "&mdash;": "&#8212;",
+    "&lsquo;": "&#8216;",
+    "&rsquo;": "&#8217;",
+    "&sbquo;": "&#8218;",
+    "&ldquo;": "&#8220;",
+    "&rdquo;": "&#8221;",
+    "&bdquo;": "&#8222;",
+    "&dagger;": "&#8224;",
+    "&Dagger;": "&#8225;",
+    "&permil;": "&#8240;",
+    "&lsaquo;": "&#8249;",
+    "&rsaquo;": "&#8250;",
+    "&hairsp;": "&#8202;",
+    "&plus;": "&#43;",
+    "&Eur;": "&#128;",
+    "&low;": "&#130;",
+    "&small;": "&#131;",
+    "&per;": "&#137;",
+    "&capital;": "&#138;",
+    "&left;": "&#139;",
+    "&right;": "&#155;",
+    "&Amacr;": "&#256;",
+    "&amacr;": "&#257;",
+    "&Acaron;": "&#258;",
+    "&acaron;": "&#259;",
+    "&Acedil;": "&#260;",
+    "&acedil;": "&#261;",
+    "&Cacute;": "&#262;",
+    "&cacute;": "&#263;",
+    "&Ccaron;": "&#268;",
+    "&ccaron;": "&#269;",
+    "&Dcaron;": "&#270;",
+    "&Dstrok;": "&#272;",
+    "&dstrok;": "&#273;",
+    "&Emacr;": "&#274;",
+    "&emacr;": "&#276;",
+    "&Edot;": "&#278;",
+    "&edot;": "&#279;",
+    "&Ecedil;": "&#280;",
+    "&ecedil;": "&#281;",
+    "&Ecaron;": "&#282;",
+    "&ecaron;": "&#283;",
+    "&Gcaron;": "&#286;",
+    "&gcaron;": "&#287;",
+    "&Gcedil;": "&#290;",
+    "&gapos;": "&#292;",
+    "&Imacr;": "&#298;",
+    "&imacr;": "&#299;",
+    "&Icedil;": "&#304;",
+    "&Kcedil;": "&#310;",
+    "&kcedil;": "&#311;",
+    "&Lacute;": "&#313;",
+    "&lacute;": "&#314;",
+    "&Lcedil;": "&#315;",
+    "&lcedil;": "&#316;",
+    "&Lstrok;": "&#321;",
+    "&lstrok;": "&#322;",
+    "&Nacute;": "&#323;",
+    "&nacute;": "&#324;",
+    "&Ncedil;": "&#325;",
+    "&ncedil;": "&#326;",
+    "&Ncaron;": "&#327;",
+    "&ncaron;": "&#328;",
+    "&Omacr;": "&#332;",
+    "&omacr;": "&#333;",
+    "&Odblac;": "&#336;",
+    "&odblac;": "&#337;",
+    "&Rcedil;": "&#342;",
+    "&rcedil;": "&#343;",
+    "&Rcaron;": "&#344;",
+    "&rcaron;": "&#345;",
+    "&Sacute;": "&#346;",
+    "&sacute;": "&#347;",
+    "&Scedil;": "&#350;",
+    "&scedil;": "&#351;",
+    "&Tcedil;": "&#354;",
+    "&tcedil;": "&#355;",
+    "&Tcaron;": "&#356;",
+    "&tcaron;": "&#357;",
+    "&Umacr;": "&#362;",
+    "&umacr;": "&#363;",
+    "&Uring;": "&#366;",
+    "&uring;": "&#367;",
+    "&Udblac;": "&#368;",
+    "&udblac;": "&#369;",
+    "&Ucedil;": "&#370;",
+    "&ucedil;": "&#371;",
+    "&Zacute;": "&#377;",
+    "&zacute;": "&#378;",
+    "&Zdot;": "&#379;",
+    "&zdot;": "&#380;",
+    "&Zcaron;": "&#381;",
+    "&zcaron;": "&#382;",
+    "&percnt;": "&#37;",
+    "&emsp14;": "&#x2005;",
+    "&lsqb;": "&#91;",
+    "&rsqb;": "&#93;",
+    "&ast;": "&#42;",
+    "&Agr;": "&#x0391;",
+    "&agr;": "&#x03b1;",
+    "&Bgr;": "&#x0392;",
+    "&bgr;": "&#x03b2;",
+    "&Dgr;": "&#x0394;",
+    "&dgr;": "&#x03b4;",
+    "&EEgr;": "&#x0397;",
+    "&eegr;": "&#x03b7;",
+    "&Egr;": "&#x0395;",
+    "&egr;": "&#x03b5;",
+    "&Ggr;": "&#x0393;",
+    "&ggr;": "&#x03b3;",
+    "&Igr;": "&#x0399;",
+    "&igr;": "&#x03b9;",
+    "&Kgr;": "&#x039a;",
+    "&kgr;": "&#x3ba;",
+    "&KHgr;": "&#x03a7;",
+    "&khgr;": "&#x03c7;",
+    "&Lgr;": "&#x039b;",
+    "&lgr;": "&#x03bb;",
+    "&Mgr;": "&#x039c;",
+    "&mgr;": "&#x03bc;",
+    "&Ngr;": "&#x039d;",
+    "&ngr;": "&#x03bd;",
+    "&Ogr;": "&#x039f;",
+    "&ogr;": "&#x03bf;",
+    "&OHgr;": "&#x03a9;",
+    "&ohgr;": "&#x03c9;",
+    "&Pgr;": "&#x03a0;",
+    "&pgr;": "&#x03c0;",
+    "&PHgr;": "&#x03a6;",
+    "&phgr;": "&#x03c6;",
+    "&PSgr;": "&#x03a8;",
+    "&psgr;": "&#x03c8;",
+    "&Rgr;": "&#x03a1;",
+    "&rgr;": "&#x03c1;",
+    "&Sgr;": "&#x03a3;",
+    "&sgr;": "&#x03c3;",
+    "&Tgr;": "&#x03a4;",
+    "&tgr;": "&#x03c4;",
+    "&THgr;": "&#x0398;",
+    "&thgr;": "&#x03b8;",
+    "&Ugr;": "&#x03a5;",
+    "&ugr;": "&#x03c5;",
+    "&Xgr;": "&#x039e;",
+    "&xgr;": "&#x03be;",
+    "&Zgr;": "&#x0396;",
+    "&zgr;": "&#x03b6;",
+    "&abreve;": "&#259;",
+    "&female;": "&#9792;",
+    "&male;": "&#9794;",
+    "&sol;": "&#47;",
+    "&lpar;": "&#40;",
+    "&rpar;": "&#41;",
+    "&euro;": "&#8364;",
+}
+
+
+# entidades predefinidas do XML, que são mantidas
+XML_ENTITIES = ("amp", "lt", "gt", "quot", "apos")
+
+# "&nome;", "&#123;", "&#x7B;" ou "&" que não inicia uma referência
+ENTITY_REFERENCE = re.compile(r"&(?:(?P<name>\w+);|(?P<number>#(?:\d+|[xX][0-9a-fA-F]+);))?")
+
+# seções CDATA e comentários, cujo conteúdo não é interpretado pelo parser
+UNPARSED_SECTION = re.compile(r"<!(?:\[CDATA\[.*?\]\]>|--.*?-->)", re.DOTALL)
+
+
+@functools.lru_cache(maxsize=None)
+def get_entities_table():
+    """
+    Retorna o nome das entidades e seus valores como referências numéricas.
+
+    Reúne as entidades do HTML5 e as de ``NAME_TO_NUMBER_ENTITIES``, que
+    prevalecem; as entidades predefinidas do XML são mantidas.
+    """
+    table = {}
+    for name, chars in html5.items():
+        if name.endswith(";"):
+            table[name[:-1]] = "".join(f"&#{ord(char)};" for char in chars)
+    for entity, value in NAME_TO_NUMBER_ENTITIES.items():
+        table[entity[1:-1]] = value
+    for name in XML_ENTITIES:
+        table[name] = f"&{name};"
+    return table
+
+
+def _fix_entity_reference(match):
+    name = match.group("name")
+    if name is None:
+        if match.group("number"):
+            return match.group()
+        return "&amp;"
+    return get_entities_table().get(name) or f"&amp;{name};"
+
+
+def _split_unparsed_sections(xml):
+    """
+    Retorna os trechos de xml, alternando texto e seções CDATA ou comentários,
+    estes nas posições ímpares.
+    """
+    if "<!" not in xml:
+        return [xml]
+    parts = []
+    start = 0
+    for match in UNPARSED_SECTION.finditer(xml):
+        parts.append(xml[start:match.start()])
+        parts.append(match.group())
+        start = match.end()
+    parts.append(xml[start:])
+    return parts
+
+
+def fix_pre_loading(xml):
+    """
+    Corrige entidades problemáticas no XML de entrada, percorrendo-o uma vez.
+
+    - entidades HTML (``&eacute;``) são convertidas em referências numéricas;
+    - as entidades predefinidas do XML e as referências numéricas são mantidas;
+    - entidades desconhecidas e ``&`` isolado têm o ``&`` escapado
+      (``&amp;desconhecida;``);
+    - o conteúdo de seções CDATA e de comentários não é alterado.
+    """
+    if "&" not in xml:
+        return xml
+    parts = _split_unparsed_sections(xml)
+    parts[::2] = [
+        ENTITY_REFERENCE.sub(_fix_entity_reference, text) for text in parts[::2]
+    ]
+    return "".join(parts)
+
+
+def find_entities_to_fix(xml):
+    """Identifica entidades que precisam ser corrigidas na entrada."""
+    for text in _split_unparsed_sections(xml)[::2]:
+        for match in ENTITY_REFERENCE.finditer(text):
+            name = match.group("name")
+            if name and name not in XML_ENTITIES:
+                yield match.group()
+
+
+# Exemplo de uso:
+if __name__ == "__main__":
+    # Testando algumas conversões
+    test_entities = ["&Aacute;", "&ccedil;", "&euro;", "&nbsp;"]
+
+    print("Exemplos de conversão:")
+    print("-" * 40)
+    for entity in test_entities:
+        if entity in NAME_TO_NUMBER_ENTITIES:
+            print(f"{entity:15} -> {NAME_TO_NUMBER_ENTITIES[entity]}")
+        else:
+            print(f"{entity:15} -> Não encontrado")
+
+    print(f"\nTotal de entidades no dicionário: {len(NAME_TO_NUMBER_ENTITIES)}")
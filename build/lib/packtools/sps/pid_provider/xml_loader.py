@@ -0,0 +1,537 @@
+import html
+import logging
+from lxml import etree
+from packtools.sps.pid_provider.amp_name2number import fix_pos_loading
+from packtools.sps.pid_provider.name2number import fix_pre_loading
+
+
+def load_xml(xml):
+    """
+    Carrega e processa XML, corrigindo entidades na entrada (ver
+    ``name2number.fix_pre_loading``).
+
+    Análise:
+    - sucesso
+    - Exemplo de saída:
+      <article>
+    <body>
+        <title>Exemplo com Entidades</title>
+        <content>’í
+            <paragraph>“Quotes” e 'apostrophes'</paragraph>
+            <special>— travessão   espaço ©2024</special>
+            <price>€100 ou £80</price>
+            <math>½ × 2 = 1</math>
+            <nested>
+                <item id="1">Primeiro 'item'</item>
+                <item id="2">Segundo — item</item>
+            </nested>
+            <p>mdash : —</p>
+            <p>180 : ´</p>
+            <p>rquo : '<break/>191 : ¿ | ’</p>
+            <p>187 : »</p>
+        </content>
+    </body>
+    </article>
+    """
+    return etree.tostring(
+        etree.fromstring(fix_pre_loading(xml)), method="xml", encoding="utf-8"
+    ).decode("utf-8")
+
+
+def fix_entities(xml):
+    """
+    Corrige entidades usando parser HTML e formatação de saída.
+
+    Análise:
+    - Usa html_parser_ent2char internamente
+    - Aplica format_output para corrigir entidades finais
+
+    PERDE BODY
+    """
+    return fix_pos_loading(html_parser_ent2char(xml))
+
+
+def xml_parser_ent2char(xml):
+    """
+    Usa parser XML do lxml com modo recover para processar entidades.
+
+    Análise:
+    - PERDE OS CARACTERES
+    - Remove completamente as entidades não reconhecidas
+    - Exemplo de saída:
+      <article>
+      <body>
+      <title>Exemplo com Entidades</title>
+      <content>
+          <paragraph>Quotes e apostrophes</paragraph>
+          <special> travessão  espaço 2024</special>
+          <price>100 ou 80</price>
+          <math>  2 = 1</math>
+          <nested>
+              <item id="1">Primeiro item</item>
+              <item id="2">Segundo  item</item>
+          </nested>
+          <p>mdash : </p>
+          <p>180 : ´</p>
+          <p>rquo : <break/>191 : ¿ | '</p>
+          <p>187 : »</p>
+      </content>
+      </body>
+      </article>
+
+    Problema: Entidades como &rsquo;, &ldquo;, &mdash; são completamente removidas
+    ao invés de convertidas para seus caracteres correspondentes.
+    """
+    try:
+        parser = etree.XMLParser(recover=True, encoding="utf-8")
+        root = etree.fromstring(xml, parser)
+        return etree.tostring(root, method="xml", encoding="utf-8").decode("utf-8")
+    except Exception as e:
+        logging.info("opção 1")
+        logging.exception(e)
+
+
+def html_unescape_ent2char(xml):
+    """
+    Usa html.unescape para converter entidades HTML.
+
+    Análise:
+    - NÃO CONSEGUE LER O XML
+    - Falha com erro: Entity 'lquo' not defined
+    - Exemplo de erro:
+      ERROR:root:Entity 'lquo' not defined, line 5, column 38
+      lxml.etree.XMLSyntaxError: Entity 'lquo' not defined
+
+    Problema: html.unescape converte as entidades, mas o XML resultante
+    não é válido porque algumas entidades HTML não são reconhecidas
+    pelo parser XML padrão.
+    """
+    try:
+        xml = html.unescape(xml)
+        root = etree.fromstring(xml)
+        return etree.tostring(root, method="xml", encoding="utf-8").decode("utf-8")
+    except Exception as e:
+        logging.info("opção 2")
+        logging.exception(e)
+
+
+def html_parser_ent2char(xml):
+    """
+    Usa parser HTML do lxml para processar entidades.
+
+    Análise:
+    - PERDE O ARTICLE/BODY, MAS PERDE O ; APÓS LQUO E RQUO
+    - Converte a maioria das entidades corretamente
+    - Exemplo de saída:
+      <article>
+      <title>Exemplo com Entidades</title>
+      <content>'í
+          <paragraph>"Quotes" e &amp;lquo;apostrophes&amp;rquo;</paragraph>
+          <special>— travessão   espaço ©2024</special>
+          <price>€100 ou £80</price>
+          <math>½ × 2 = 1</math>
+          <nested>
+              <item id="1">Primeiro &amp;rquo;item&amp;lquo;</item>
+              <item id="2">Segundo — item</item>
+          </nested>
+          <p>mdash : —</p>
+          <p>180 : ´</p>
+          <p>rquo : &amp;rquo;<break/>191 : ¿ | '</p>
+          <p>187 : »</p>
+      </content>
+      </article>
+
+    Problemas:
+    1. Parser HTML adiciona estrutura <html><body> que precisa ser removida
+    2. Entidades &lquo; e &rquo; perdem o ponto-e-vírgula final
+    3. Estrutura original pode ser alterada (perde elementos externos)
+    """
+    try:
+        parser = etree.HTMLParser()
+        root = etree.fromstring(xml, parser)
+        return etree.tostring(
+            root.find(".").find("body").find("*"), method="xml", encoding="utf-8"
+        ).decode("utf-8")
+    except Exception as e:
+        logging.info("opção 3")
+        logging.exception(e)
+
+
+def bs_ent2char_(xml):
+    """
+    Testa diferentes parsers do BeautifulSoup.
+
+    Análises por parser:
+
+    1. "xml" (Alias para lxml-xml):
+       - PERDE OS CARACTERES
+       - Similar ao xml_parser_ent2char
+
+    2. "lxml" (Parser HTML com lxml):
+       - PERDE O ARTICLE/BODY se usado direto
+       - MANTÉM O ARTICLE/BODY via bs_ent2char
+       - PERDE O ; APÓS LQUO E RQUO
+       - Exemplo: &amp;lquoapostrophes&amp;rquo (sem ;)
+
+    3. "html.parser" (Built-in do Python):
+       - MANTÉM O ARTICLE/BODY
+       - PERDE O ; APÓS LQUO E RQUO
+       - Similar ao lxml mas mantém estrutura melhor
+
+    4. "html5lib" (Parser HTML5):
+       - ADICIONA <html><head></head><body>
+       - Mantém entidades problemáticas como &amp;lquo; e &amp;rquo;
+       - Mais compatível mas adiciona estrutura HTML5
+    """
+    from bs4 import BeautifulSoup
+
+    parsers = [
+        ("xml", "Alias para lxml-xml"),
+        ("lxml", "Parser HTML com lxml, rápido"),
+        ("html.parser", "Parser HTML built-in do Python"),
+        ("html5lib", "Parser HTML5 mais compatível"),  # Precisa instalar
+    ]
+    for parser, description in parsers:
+        print(f"\n---\n{parser}")
+        soup_xml = BeautifulSoup(xml, parser)
+        yield str(soup_xml)
+
+
+def bs_ent2char(xml):
+    """
+    Usa BeautifulSoup com parser lxml para converter entidades.
+
+    Análise:
+    - MANTÉM O ARTICLE/BODY, MAS PERDE O ; APÓS LQUO E RQUO
+    - Converte a maioria das entidades HTML corretamente
+    - Exemplo de saída:
+      <article>
+      <body>
+      <title>Exemplo com Entidades</title>
+      <content>'í
+          <paragraph>"Quotes" e &amp;lquoapostrophes&amp;rquo</paragraph>
+          <special>— travessão   espaço ©2024</special>
+          <price>€100 ou £80</price>
+          <math>½ × 2 = 1</math>
+          <nested>
+          <item id="1">Primeiro &amp;rquoitem&amp;lquo</item>
+          <item id="2">Segundo — item</item>
+          </nested>
+          <p>mdash : —</p>
+          <p>180 : ´</p>
+          <p>rquo : &amp;rquo<break></break>191 : ¿ | '</p>
+          <p>187 : »</p>
+      </content>
+      </body>
+      </article>
+
+    Vantagens:
+    - Mantém estrutura XML original
+    - Converte maioria das entidades HTML para caracteres Unicode
+
+    Problemas:
+    - Entidades &lquo; e &rquo; não são reconhecidas e perdem o ;
+    - Tag <break/> é convertida para <break></break>
+    """
+    from bs4 import BeautifulSoup
+
+    soup_xml = BeautifulSoup(xml, "lxml")
+    return str(soup_xml)
+
+
+def main():
+    """
+    Função principal para testar diferentes métodos de conversão de entidades.
+
+    XML de entrada contém várias entidades HTML problemáticas:
+    - &rsquo; &ldquo; &rdquo; &lquo; &rquo; (quotes)
+    - &mdash; (travessão)
+    - &nbsp; (espaço não quebrável)
+    - &copy; &euro; &pound; (símbolos)
+    - &frac12; &times; (matemáticos)
+    - &#180; &#191; &#187; &#x02019; (numéricos)
+
+    Resumo dos resultados:
+    - xml_parser_ent2char: Remove entidades não reconhecidas
+    - html_unescape_ent2char: Falha ao processar XML
+    - html_parser_ent2char: Melhor conversão mas altera estrutura
+    - bs_ent2char: Bom compromisso mas tem problemas com &lquo;/&rquo;
+    - fix_entities: Usa html_parser_ent2char + format_output
+    - load_xml: Usa fix_input mas perde caracteres
+    """
+    xml = """<article>
+    <body>
+        <title>Exemplo com Entidades</title>
+        <content>&rsquo;&iacute;
+            <paragraph>&ldquo;Quotes&rdquo; e &lquo;apostrophes&rquo;</paragraph>
+            <special>&mdash; travessão &nbsp; espaço &copy;2024</special>
+            <price>&euro;100 ou &pound;80</price>
+            <math>&frac12; &times; 2 = 1</math>
+            <nested>
+                <item id="1">Primeiro &rquo;item&lquo;</item>
+                <item id="2">Segundo &mdash; item</item>
+            </nested>
+            <p>mdash : &mdash;</p>
+            <p>180 : &#180;</p>
+            <p>rquo : &rquo;<break/>191 : &#191; | &#x02019;</p>
+            <p>187 : &#187;</p>
+        </content>
+    </body>
+    </article>"""
+
+    print("\n---\nEntrada")
+    print(xml)
+
+    print("\n---\nxml_parser_ent2char")
+    print(xml_parser_ent2char(xml))
+
+    print("\n---\nhtml_unescape_ent2char")
+    print(html_unescape_ent2char(xml))
+
+    print("\n---\nhtml_parser_ent2char")
+    print(html_parser_ent2char(xml))
+
+    print("\n---\nbs_ent2char")
+    print(bs_ent2char(xml))
+
+    for item in bs_ent2char_(xml):
+        print("")
+        print(item)
+
+    print("\n---\nfix_entities")
+    print(fix_entities(xml))
+
+    print("\n---\nload_xml")
+    print(load_xml(xml))
+
+
+if __name__ == "__main__":
+    main()
+
+"""
+---
+Entrada
+<article>
+        <body>
+        <title>Exemplo com Entidades</title>
+        <content>&rsquo;&iacute;
+            <paragraph>&ldquo;Quotes&rdquo; e &lquo;apostrophes&rquo;</paragraph>
+            <special>&mdash; travessão &nbsp; espaço &copy;2024</special>
+            <price>&euro;100 ou &pound;80</price>
+            <math>&frac12; &times; 2 = 1</math>
+            <nested>
+                <item id="1">Primeiro &rquo;item&lquo;</item>
+                <item id="2">Segundo &mdash; item</item>
+            </nested>
+            <p>mdash : &mdash;</p>
+            <p>180 : &#180;</p>
+            <p>rquo : &rquo;<break/>191 : &#191; | &#x02019;</p>
+            <p>187 : &#187;</p>
+        </content>
+        </body>
+    </article>
+
+---
+"""
+# PERDE OS CARACTERES
+"""
+xml_parser_ent2char
+<article>
+        <body>
+        <title>Exemplo com Entidades</title>
+        <content>
+            <paragraph>Quotes e apostrophes</paragraph>
+            <special> travessão  espaço 2024</special>
+            <price>100 ou 80</price>
+            <math>  2 = 1</math>
+            <nested>
+                <item id="1">Primeiro item</item>
+                <item id="2">Segundo  item</item>
+            </nested>
+            <p>mdash : </p>
+            <p>180 : ´</p>
+            <p>rquo : <break/>191 : ¿ | ’</p>
+            <p>187 : »</p>
+        </content>
+        </body>
+    </article>
+
+---
+"""
+# NAO CONSEGUE LER O XML
+"""
+html_unescape_ent2char
+ERROR:root:Entity 'lquo' not defined, line 5, column 38 (<string>, line 5)
+Traceback (most recent call last):
+  File "/Users/roberta.takenaka/github.com/scieloorg/packtools/packtools/packtools/sps/pid_provider/ent2char.py", line 51, in html_unescape_ent2char
+    root = etree.fromstring(xml)
+  File "src/lxml/etree.pyx", line 3257, in lxml.etree.fromstring
+  File "src/lxml/parser.pxi", line 1916, in lxml.etree._parseMemoryDocument
+  File "src/lxml/parser.pxi", line 1796, in lxml.etree._parseDoc
+  File "src/lxml/parser.pxi", line 1085, in lxml.etree._BaseParser._parseUnicodeDoc
+  File "src/lxml/parser.pxi", line 618, in lxml.etree._ParserContext._handleParseResultDoc
+  File "src/lxml/parser.pxi", line 728, in lxml.etree._handleParseResult
+  File "src/lxml/parser.pxi", line 657, in lxml.etree._raiseParseError
+  File "<string>", line 5
+lxml.etree.XMLSyntaxError: Entity 'lquo' not defined, line 5, column 38
+None
+
+---
+"""
+# PERDE O ARTICLE/BODY, MAS PERDE O ; APÓS LQUO E RQUO
+"""
+html_parser_ent2char
+<article>
+
+        <title>Exemplo com Entidades</title>
+        <content>’í
+            <paragraph>“Quotes” e &amp;lquo;apostrophes&amp;rquo;</paragraph>
+            <special>— travessão   espaço ©2024</special>
+            <price>€100 ou £80</price>
+            <math>½ × 2 = 1</math>
+            <nested>
+                <item id="1">Primeiro &amp;rquo;item&amp;lquo;</item>
+                <item id="2">Segundo — item</item>
+            </nested>
+            <p>mdash : —</p>
+            <p>180 : ´</p>
+            <p>rquo : &amp;rquo;<break/>191 : ¿ | ’</p>
+            <p>187 : »</p>
+        </content>
+
+    </article>
+
+---
+"""
+# MANTÉM O ARTICLE/BODY, MAS PERDE O ; APÓS LQUO E RQUO
+"""
+bs_ent2char LXML
+<article>
+<body>
+<title>Exemplo com Entidades</title>
+<content>’í
+            <paragraph>“Quotes” e &amp;lquoapostrophes&amp;rquo</paragraph>
+<special>— travessão   espaço ©2024</special>
+<price>€100 ou £80</price>
+<math>½ × 2 = 1</math>
+<nested>
+<item id="1">Primeiro &amp;rquoitem&amp;lquo</item>
+<item id="2">Segundo — item</item>
+</nested>
+<p>mdash : —</p>
+<p>180 : ´</p>
+<p>rquo : &amp;rquo<break></break>191 : ¿ | ’</p>
+<p>187 : »</p>
+</content>
+</body>
+</article>
+
+---
+"""
+
+# PERDE OS CARACTERES
+"""
+xml
+
+<?xml version="1.0" encoding="utf-8"?>
+<article>
+<body>
+<title>Exemplo com Entidades</title>
+<content>
+<paragraph>Quotes e apostrophes</paragraph>
+<special> travessão  espaço 2024</special>
+<price>100 ou 80</price>
+<math>  2 = 1</math>
+<nested>
+<item id="1">Primeiro item</item>
+<item id="2">Segundo  item</item>
+</nested>
+<p>mdash : </p>
+<p>180 : ´</p>
+<p>rquo : <break/>191 : ¿ | ’</p>
+<p>187 : »</p>
+</content>
+</body>
+</article>
+
+---
+"""
+
+# PERDE O ARTICLE/BODY
+"""
+lxml
+
+<html><body><article>
+<title>Exemplo com Entidades</title>
+<content>’í
+            <paragraph>“Quotes” e &amp;lquo;apostrophes&amp;rquo;</paragraph>
+<special>— travessão   espaço ©2024</special>
+<price>€100 ou £80</price>
+<math>½ × 2 = 1</math>
+<nested>
+<item id="1">Primeiro &amp;rquo;item&amp;lquo;</item>
+<item id="2">Segundo — item</item>
+</nested>
+<p>mdash : —</p>
+<p>180 : ´</p>
+<p>rquo : &amp;rquo;<break></break>191 : ¿ | ’</p>
+<p>187 : »</p>
+</content>
+</article></body></html>
+
+---
+"""
+
+# MANTÉM O ARTICLE/BODY, MAS PERDE O ; APÓS LQUO E RQUO
+"""
+html.parser
+
+<article>
+<body>
+<title>Exemplo com Entidades</title>
+<content>’í
+            <paragraph>“Quotes” e &amp;lquoapostrophes&amp;rquo</paragraph>
+<special>— travessão   espaço ©2024</special>
+<price>€100 ou £80</price>
+<math>½ × 2 = 1</math>
+<nested>
+<item id="1">Primeiro &amp;rquoitem&amp;lquo</item>
+<item id="2">Segundo — item</item>
+</nested>
+<p>mdash : —</p>
+<p>180 : ´</p>
+<p>rquo : &amp;rquo<break></break>191 : ¿ | ’</p>
+<p>187 : »</p>
+</content>
+</body>
+</article>
+
+---
+"""
+
+# SOME O ARTICLE/BODY
+"""
+html5lib
+
+<html><head></head><body><article>
+
+        <title>Exemplo com Entidades</title>
+        <content>’í
+            <paragraph>“Quotes” e &amp;lquo;apostrophes&amp;rquo;</paragraph>
+            <special>— travessão   espaço ©2024</special>
+            <price>€100 ou £80</price>
+            <math>½ × 2 = 1</math>
+            <nested>
+                <item id="1">Primeiro &amp;rquo;item&amp;lquo;</item>
+                <item id="2">Segundo — item</item>
+            </nested>
+            <p>mdash : —</p>
+            <p>180 : ´</p>
+            <p>rquo : &amp;rquo;<break>191 : ¿ | ’</break></p>
+            <p>187 : »</p>
+        </content>
+
+    </article></body></html>
+
+
+"""
@@ -0,0 +1,733 @@
+import logging
+import re
+
+from contextvars import ContextVar
+from copy import deepcopy
+from lxml import etree
+from packtools.sps import exceptions
+from packtools.lib import file_utils
+from packtools.utils import parse_bytes
+
+logger = logging.getLogger(__name__)
+
+_text_memo = ContextVar("packtools_sps_xml_utils_text_memo", default=None)
+
+
+def remove_namespaces(xml_string):
+    namespaces_to_remove = [
+        'xmlns:xlink="http://www.w3.org/1999/xlink"',
+        'xmlns:mml="http://www.w3.org/1998/Math/MathML"',
+    ]
+    for ns in namespaces_to_remove:
+        xml_string = xml_string.replace(ns, "")
+    return xml_string
+
+
+def get_nodes_with_lang(xmltree, lang_xpath, node_xpath=None):
+    _items = []
+    for node in xmltree.xpath(lang_xpath):
+        _item = {"id": node.get("id")}
+        if node_xpath:
+            _item["node"] = node.find(node_xpath)
+        else:
+            _item["node"] = node
+        _item["lang"] = node.get("{http://www.w3.org/XML/1998/namespace}lang")
+        _item["id"] = node.get("id")
+        _items.append(_item)
+    return _items
+
+
+def process_xref(node, footnote_markers=None):
+    if footnote_markers is None:
+        footnote_markers = ["*"]
+    node = deepcopy(node)
+
+    for xref in node.findall(".//xref"):
+        if xref.tail:
+            _next = xref.getnext()
+            if _next is None or _next.tag != "xref":
+                e = etree.Element("EMPTYTAGTOKEEPXREFTAIL")
+                xref.addnext(e)
+
+    for xref in node.findall(".//xref"):
+        ref_type = xref.get("ref-type")
+        texts = xref.xpath(".//text()")
+        text = ''.join(texts).strip()
+        parent = xref.getparent()
+
+        is_fn_ref = ref_type == "fn"
+        is_punctuation = text in footnote_markers if text else False
+        is_numeric = text.isdigit() if text else False
+        has_parent = parent is not None
+
+        if text and has_parent and (is_fn_ref or is_punctuation or is_numeric):
+            parent.remove(xref)
+        else:
+            etree.strip_tags(xref, "xref")
+
+    etree.strip_tags(node, "EMPTYTAGTOKEEPXREFTAIL")
+
+    return node
+
+
+def _is_xref_to_remove(xref, footnote_markers):
+    # mesmo critério de process_xref
+    text = "".join(xref.itertext()).strip()
+    return bool(text) and (
+        xref.get("ref-type") == "fn"
+        or text in footnote_markers
+        or text.isdigit()
+    )
+
+
+def _iter_xref_processed_children(node, footnote_markers, in_xref):
+    """
+    Retorna os filhos de node, sem copiá-lo, como se process_xref tivesse
+    sido aplicado: para cada filho, gera (filho, tail) ou, se o filho é um
+    xref a remover, (None, tail), sendo o tail descartado quando o próximo
+    irmão também é xref.
+    """
+    for child in node:
+        if child.tag == "xref" and not in_xref:
+            if _is_xref_to_remove(child, footnote_markers):
+                _next = child.getnext()
+                if _next is None or _next.tag != "xref":
+                    yield None, child.tail
+                continue
+        yield child, child.tail
+
+
+def _iter_plain_text(node, footnote_markers, in_xref=False):
+    if node.text:
+        yield node.text
+    for child, tail in _iter_xref_processed_children(node, footnote_markers, in_xref):
+        if child is not None and isinstance(child.tag, str):
+            yield from _iter_plain_text(
+                child, footnote_markers, in_xref or child.tag == "xref"
+            )
+        if tail:
+            yield tail
+
+
+def _get_memoized(key, function, *args):
+    # memorização ativada por set_text_memo
+    memo = _text_memo.get()
+    if memo is None:
+        return function(*args)
+    try:
+        return memo[key]
+    except KeyError:
+        value = memo[key] = function(*args)
+        return value
+
+
+def set_text_memo(enabled=True):
+    """
+    Ativa, no contexto atual, a memorização, por elemento, dos textos obtidos
+    por node_plain_text, remove_subtags e process_subtags
+
+    Os textos memorizados não são atualizados se a árvore for modificada,
+    portanto, ativar somente enquanto o documento é apenas consultado, por
+    exemplo, durante a validação.
+    """
+    _text_memo.set({} if enabled else None)
+
+
+def _node_plain_text(node):
+    return " ".join("".join(_iter_plain_text(node, ("*",))).split())
+
+
+def node_plain_text(node):
+    """
+    Função que retorna texto de nó, sem subtags e com espaços padronizados.
+
+    Para elementos <xref>, verifica o valor de @ref-type:
+    - Se @ref-type é 'fn' e o conteúdo não é alfanumérico, remove o elemento.
+    - Caso contrário, remove apenas a tag <xref> mantendo o conteúdo interno.
+
+    Ajusta o comportamento de preservação do texto em caso de `tail`.
+    """
+    if node is None:
+        return ""
+    return _get_memoized(("node_plain_text", node), _node_plain_text, node)
+
+
+def node_text_without_fn_xref(node):
+    """
+    Retorna text com subtags, exceto `xref`
+    """
+    if node is None:
+        return
+
+    node = process_xref(node)
+
+    return node_text(node)
+
+
+def formatted_text(title_node):
+    # FIXME substituir `formatted_text` por `node_text_without_xref`
+    # por ser mais explícito
+    return node_text_without_fn_xref(title_node)
+
+
+def fix_xml(xml_str):
+    return fix_namespace_prefix_w(xml_str)
+
+
+def fix_namespace_prefix_w(content):
+    """
+    Convert os textos cujo padrão é `w:st="` em `w-st="`
+    """
+    pattern = r"\bw:[a-z]{1,}=\""
+    found_items = re.findall(pattern, content)
+    logger.debug("Found %i namespace prefix w", len(found_items))
+    for item in set(found_items):
+        new_namespace = item.replace(":", "-")
+        logger.debug("%s -> %s" % (item, new_namespace))
+        content = content.replace(item, new_namespace)
+    return content
+
+
+def _get_xml_content(xml):
+    if isinstance(xml, str):
+        try:
+            content = file_utils.read_file(xml)
+        except (FileNotFoundError, OSError):
+            content = xml
+        content = fix_xml(content)
+        return content.encode("utf-8")
+    return xml
+
+
+def get_xml_tree(content):
+    try:
+        content = _get_xml_content(content)
+        xml_tree = parse_bytes(content, remove_blank_text=True)
+    except etree.XMLSyntaxError as exc:
+        raise exceptions.SPSLoadToXMLError(str(exc)) from None
+    else:
+        return xml_tree
+
+
+def tostring(node, doctype=None, pretty_print=False, xml_declaration=True):
+    return etree.tostring(
+        node,
+        doctype=doctype,
+        xml_declaration=xml_declaration,
+        method="xml",
+        encoding="utf-8",
+        pretty_print=pretty_print,
+    ).decode("utf-8")
+
+
+def remove_comments(node):
+    comments = node.xpath('//comment()')
+    for comment in comments:
+        parent = comment.getparent()
+        if parent is not None:
+            parent.remove(comment)
+
+
+def node_text(node):
+    """
+    Retorna todos os node.text, incluindo a subtags
+    Para <title>Text <bold>text</bold> Text</title>, retorna
+    Text <bold>text</bold> Text
+    """
+    remove_comments(node)
+    items = [node.text or ""]
+    for child in node.getchildren():
+        items.append(etree.tostring(child, encoding="utf-8").decode("utf-8"))
+    return "".join(items)
+
+
+def get_node_without_subtag(node, remove_extra_spaces=False):
+    """
+    Função que retorna nó sem subtags.
+    """
+    if node is None:
+        return
+    if remove_extra_spaces:
+        return " ".join(
+            [text.strip() for text in node.xpath(".//text()") if text.strip()]
+        )
+    return "".join(node.xpath(".//text()"))
+
+
+def get_year_month_day(node):
+    """
+    Retorna os valores respectivos dos elementos "year", "month", "day".
+
+    Parameters
+    ----------
+    node : lxml.etree.Element
+        Elemento do tipo _date_, que tem os elementos "year", "month", "day".
+
+    Returns
+    -------
+    tuple of strings
+        ("YYYY", "MM", "DD")
+    None se node is None
+
+    """
+    if node is not None:
+        return tuple(
+            [(node.findtext(item) or "").zfill(2) for item in ["year", "month", "day"]]
+        )
+
+
+def create_alternatives(node, assets_data):
+    """
+    ```xml
+    <alternatives>
+        <graphic
+            xlink:href="https://minio.scielo.br/documentstore/1678-2674/
+            rQRTPbt6jkrncZTsPdCyXsn/
+            6d6b2cfaa2dc5bd1fb84644218506cbfbc4dfb1e.tif"/>
+        <graphic
+            xlink:href="https://minio.scielo.br/documentstore/1678-2674/
+            rQRTPbt6jkrncZTsPdCyXsn/
+            b810735a45beb5f829d4eb07e4cf68842f57313f.png"
+            specific-use="scielo-web"/>
+        <graphic
+            xlink:href="https://minio.scielo.br/documentstore/1678-2674/
+            rQRTPbt6jkrncZTsPdCyXsn/
+            e9d0cd6430c85a125e7490629ce43f227d00ef5e.jpg"
+            specific-use="scielo-web"
+            content-type="scielo-267x140"/>
+    </alternatives>
+    ```
+    """
+    if node is None or not assets_data:
+        return
+    parent = node.getparent()
+    if parent is None:
+        return
+    if len(assets_data) == 1:
+        for extension, uri in assets_data.items():
+            node.set("{http://www.w3.org/1999/xlink}href", uri)
+            if extension in [".tif", ".tiff"]:
+                pass
+            elif extension in [".png"]:
+                node.set("specific-use", "scielo-web")
+            else:
+                node.set("specific-use", "scielo-web")
+                node.set("content-type", "scielo-267x140")
+    else:
+        alternative_node = etree.Element("alternatives")
+        for extension, uri in assets_data.items():
+            _node = etree.Element("graphic")
+            _node.set("{http://www.w3.org/1999/xlink}href", uri)
+            alternative_node.append(_node)
+            if extension in [".tif", ".tiff"]:
+                pass
+            elif extension in [".png"]:
+                _node.set("specific-use", "scielo-web")
+            else:
+                _node.set("specific-use", "scielo-web")
+                _node.set("content-type", "scielo-267x140")
+        parent.replace(node, alternative_node)
+
+
+def parse_value(value):
+    value = value.lower()
+    if value.isdigit():
+        return value.zfill(2)
+    if "spe" in value:
+        return "spe"
+    if "sup" in value:
+        return "s"
+    return value
+
+
+def parse_issue(issue):
+    issue = " ".join([item for item in issue.split()])
+    parts = issue.split()
+    parts = [parse_value(item) for item in parts]
+    s = "-".join(parts)
+    s = s.replace("spe-", "spe")
+    s = s.replace("s-", "s")
+    if s.endswith("s"):
+        s += "0"
+    return s
+
+
+def is_valid_value_for_pid_v2(value):
+    if len(value or "") != 23:
+        raise ValueError
+    return True
+
+
+VALIDATE_FUNCTIONS = dict((("scielo_pid_v2", is_valid_value_for_pid_v2),))
+
+
+def is_allowed_to_update(xml_sps, attr_name, attr_new_value):
+    """
+    Se há uma função de validação associada com o atributo,
+    verificar se é permitido atualizar o atributo, dados seus valores
+    atual e/ou novo
+    """
+    validate_function = VALIDATE_FUNCTIONS.get(attr_name)
+    if validate_function is None:
+        # não há nenhuma validação, então é permitido fazer a atualização
+        return True
+
+    curr_value = getattr(xml_sps, attr_name)
+
+    if attr_new_value == curr_value:
+        # desnecessario atualizar
+        return False
+
+    try:
+        # valida o valor atual do atributo
+        validate_function(curr_value)
+
+    except (ValueError, exceptions.InvalidValueForOrderError):
+        # o valor atual do atributo é inválido,
+        # então continuar para verificar o valor "novo"
+        pass
+
+    else:
+        # o valor atual do atributo é válido,
+        # então não permitir atualização
+        raise exceptions.NotAllowedtoChangeAttributeValueError(
+            "Not allowed to update %s (%s) with %s, "
+            "because current is valid" % (attr_name, curr_value, attr_new_value)
+        )
+
+    try:
+        # valida o valor novo para o atributo
+        validate_function(attr_new_value)
+
+    except (ValueError, exceptions.InvalidValueForOrderError):
+        # o valor novo é inválido, então não permitir atualização
+        raise exceptions.InvalidAttributeValueError(
+            "Not allowed to update %s (%s) with %s, "
+            "because new value is invalid" % (attr_name, curr_value, attr_new_value)
+        )
+
+    else:
+        # o valor novo é válido, então não permitir atualização
+        return True
+
+
+def match_pubdate(node, pubdate_xpaths):
+    """
+    Retorna o primeiro match da lista de pubdate_xpaths
+    """
+    for xpath in pubdate_xpaths:
+        pubdate = node.find(xpath)
+        if pubdate is not None:
+            return pubdate
+
+
+def _generate_tag_list(tags_to_keep, tags_to_convert_to_html):
+    return list(tags_to_keep or []) + list(
+        tags_to_convert_to_html and tags_to_convert_to_html.keys() or []
+    )
+
+
+class _NormalizedText:
+    """
+    Acumula textos com os espaços padronizados, como
+    ``" ".join(text.split())``, sem reprocessar os textos já padronizados.
+    """
+
+    def __init__(self):
+        self.items = []
+        self.space = False
+
+    def add(self, text):
+        if not text:
+            return
+        words = text.split()
+        if not words:
+            self.space = True
+            return
+        if text[0].isspace():
+            self.space = True
+        self.add_normalized(" ".join(words))
+        self.space = text[-1].isspace()
+
+    def add_normalized(self, text):
+        if not text:
+            return
+        if self.space and self.items:
+            self.items.append(" ")
+        self.items.append(text)
+        self.space = False
+
+    @property
+    def value(self):
+        return "".join(self.items)
+
+
+def _tostring_without_tail(node, footnote_markers, in_xref, is_root):
+    if in_xref:
+        # xref dentro de xref: somente a tag é removida
+        node = deepcopy(node)
+        etree.strip_tags(node, "xref")
+    else:
+        processed = process_xref(node, footnote_markers)
+        if not is_root and len(processed.xpath(".//xref")) != len(
+            node.xpath(".//xref")
+        ):
+            # declara somente os namespaces usados após a remoção
+            etree.cleanup_namespaces(processed)
+        node = processed
+    node.tail = None
+    return tostring(node, xml_declaration=False)
+
+
+def _add_subtags_content(text, node, params, in_xref):
+    text.add(node.text)
+    for child, tail in _iter_xref_processed_children(
+        node, params["footnote_markers"], in_xref
+    ):
+        if child is not None and isinstance(child.tag, str):
+            if in_xref and child.tag == "xref":
+                # xref dentro de xref: somente a tag é removida
+                _add_subtags_content(text, child, params, in_xref)
+            else:
+                text.add_normalized(
+                    _remove_subtags(child, params, in_xref or child.tag == "xref")
+                )
+        text.add(tail)
+
+
+def _remove_subtags(node, params, in_xref=False, is_root=False):
+    tag = node.tag
+
+    # verifica se é o caso de manutenção da tag e seu conteúdo
+    if tag in params["tags_to_keep_with_content"]:
+        content = _tostring_without_tail(
+            node, params["footnote_markers"], in_xref, is_root
+        )
+        return content if is_root else " ".join(content.split())
+
+    # verifica se é o caso de remoção do conteúdo da tag
+    if tag in params["tags_to_remove_with_content"]:
+        return ""
+
+    text = _NormalizedText()
+    _add_subtags_content(text, node, params, in_xref)
+    text = text.value
+
+    if tag in params["all_tags_to_keep"]:
+        if attribs := " ".join(
+            f'{key}="{value}"' for key, value in node.attrib.items()
+        ):
+            if not is_root:
+                attribs = " ".join(attribs.split())
+            return f"<{tag} {attribs}>{text}</{tag}>"
+        return f"<{tag}>{text}</{tag}>"
+    return text
+
+
+def _get_subtags_params(
+    tags_to_keep,
+    tags_to_keep_with_content,
+    tags_to_remove_with_content,
+    tags_to_convert_to_html,
+    footnote_markers,
+):
+    return {
+        "all_tags_to_keep": frozenset(
+            _generate_tag_list(tags_to_keep, tags_to_convert_to_html)
+        ),
+        "tags_to_keep_with_content": frozenset(tags_to_keep_with_content or []),
+        "tags_to_remove_with_content": frozenset(tags_to_remove_with_content or []),
+        "footnote_markers": tuple(
+            ["*"] if footnote_markers is None else footnote_markers
+        ),
+    }
+
+
+def _get_subtags_key(function_name, node, *args):
+    # argumentos em forma imutável, para compor a chave da memorização
+    return (function_name, node) + tuple(
+        tuple(sorted(arg.items())) if isinstance(arg, dict)
+        else tuple(arg) if isinstance(arg, (list, tuple, set, frozenset))
+        else arg
+        for arg in args
+    )
+
+
+def remove_subtags(
+        node,
+        tags_to_keep=None,
+        tags_to_keep_with_content=None,
+        tags_to_remove_with_content=None,
+        tags_to_convert_to_html=None,
+        footnote_markers=None,
+    ):
+    """
+    Remove as subtags de node que não estiverem especificadas em allowed_tags.
+
+    Exemplo:
+        Entrada: <bold><italic>São</italic> Paulo</bold> <i>Paulo</i>, ['italic']
+        Saída: <italic>São</italic> Paulo Paulo
+
+    Outros exemplos nos testes.
+
+    Percorre node uma única vez, sem copiá-lo; somente as tags mantidas com
+    conteúdo são copiadas, para serem serializadas.
+    """
+    params = _get_subtags_params(
+        tags_to_keep,
+        tags_to_keep_with_content,
+        tags_to_remove_with_content,
+        tags_to_convert_to_html,
+        footnote_markers,
+    )
+    return _get_memoized(
+        _get_subtags_key(
+            "remove_subtags",
+            node,
+            tags_to_keep,
+            tags_to_keep_with_content,
+            tags_to_remove_with_content,
+            tags_to_convert_to_html,
+            footnote_markers,
+        ),
+        _remove_subtags,
+        node,
+        params,
+        False,
+        True,
+    )
+
+
+def process_subtags(
+        node,
+        tags_to_keep=None,
+        tags_to_keep_with_content=None,
+        tags_to_remove_with_content=None,
+        tags_to_convert_to_html=None,
+        footnote_markers=None
+    ):
+
+    if node is None:
+        return
+
+    return _get_memoized(
+        _get_subtags_key(
+            "process_subtags",
+            node,
+            tags_to_keep,
+            tags_to_keep_with_content,
+            tags_to_remove_with_content,
+            tags_to_convert_to_html,
+            footnote_markers,
+        ),
+        _process_subtags,
+        node,
+        tags_to_keep,
+        tags_to_keep_with_content,
+        tags_to_remove_with_content,
+        tags_to_convert_to_html,
+        footnote_markers,
+    )
+
+
+def _process_subtags(
+        node,
+        tags_to_keep,
+        tags_to_keep_with_content,
+        tags_to_remove_with_content,
+        tags_to_convert_to_html,
+        footnote_markers,
+    ):
+    if footnote_markers is None:
+        footnote_markers = ["*"]
+
+    std_to_keep = ["sup", "sub"]
+    std_to_keep_with_content = [
+        "mml:math",
+        "{http://www.w3.org/1998/Math/MathML}math",
+        "math",
+    ]
+    std_to_convert = {"italic": "i"}
+
+    # garante que as tags em std_to_keep serão mantidas
+    if tags_to_keep is None:
+        tags_to_keep = std_to_keep
+    else:
+        tags_to_keep = list(set(tags_to_keep + std_to_keep))
+
+    # garante que as tags em std_to_keep_with_content serão mantidas
+    if tags_to_keep_with_content is None:
+        tags_to_keep_with_content = std_to_keep_with_content
+    else:
+        tags_to_keep_with_content = list(
+            set(tags_to_keep_with_content + std_to_keep_with_content)
+        )
+
+    # verifica se é o caso de manutenção da tag e seu conteúdo
+    tag = node.tag
+    if tag in tags_to_keep_with_content:
+        node = deepcopy(node)
+        node.tail = None
+        return tostring(node)
+
+    # garante que as tags em std_to_convert serão convertidas em html
+    std_to_convert.update(tags_to_convert_to_html or {})
+
+    params = _get_subtags_params(
+        tags_to_keep,
+        tags_to_keep_with_content,
+        tags_to_remove_with_content,
+        std_to_convert,
+        footnote_markers,
+    )
+    text = _remove_subtags(node, params, is_root=True)
+
+    for xml_tag, html_tag in std_to_convert.items():
+        text = text.replace(f"<{xml_tag} ", f"<{html_tag} ")
+        text = text.replace(f"<{xml_tag}>", f"<{html_tag}>")
+        text = text.replace(f"</{xml_tag}>", f"</{html_tag}>")
+
+    return text
+
+
+def get_parent_context(xmltree):
+    main = xmltree.xpath(".")[0]
+    main_lang = main.get("{http://www.w3.org/XML/1998/namespace}lang")
+    main_article_type = main.get("article-type")
+    for node in xmltree.xpath("./front | ./body | ./back | ./sub-article"):
+        parent = "sub-article" if node.tag == "sub-article" else "article"
+        parent_id = node.get("id")
+        lang = node.get("{http://www.w3.org/XML/1998/namespace}lang") or main_lang
+        article_type = node.get("article-type") or main_article_type
+        yield node, lang, article_type, parent, parent_id
+
+
+def put_parent_context(data, lang, article_type, parent, parent_id):
+    data.update(
+        {
+            "parent": parent,
+            "parent_id": parent_id,
+            "parent_lang": lang,
+            "parent_article_type": article_type,
+        }
+    )
+    return data
+
+
+def get_parent_data(node):
+    return {
+        "parent": node.tag,
+        "parent_id": node.get("id"),
+        "parent_lang": node.get("{http://www.w3.org/XML/1998/namespace}lang"),
+        "parent_article_type": node.get("article-type"),
+        "xpath": "sub-article" if node.tag == "sub-article" else "front | body | back"
+    }
+
+
+def get_parents(xmltree):
+    main = xmltree.xpath(".")[0]
+    yield get_parent_data(main)
+    for node in xmltree.xpath("./sub-article"):
+        yield get_parent_data(node)
+        for sub_node in node.xpath("./sub-article"):
+            yield get_parent_data(sub_node)
@@ -0,0 +1,92 @@
+"""
+Code lists used by the validations (ISO 3166 country codes, ISO 639 language
+codes, CRediT taxonomy, special characters of award ids), converted to
+``frozenset`` / ``dict`` lookups.
+
+The lists come from the rules (``country_codes_list``,
+``language_codes_list``, ``credit_taxonomy_terms_and_urls``, ...). The
+lookups are built once per ``RuleSet`` (``get_code_set``,
+``get_credit_taxonomy``, ``get_special_chars_award_id``) and given to the
+validators, so they check a value in O(1) and format the list only when the
+value is invalid.
+
+>>> "BR" in get_code_set(ruleset, "country_codes_list")
+True
+"""
+from collections import namedtuple
+from types import MappingProxyType
+
+from packtools.sps.validation.xml_validator_rules import RuleSet
+
+
+CreditTaxonomy = namedtuple("CreditTaxonomy", "by_uri by_term terms")
+
+
+def code_set(codes):
+    """
+    Returns ``codes`` as a ``frozenset``; sets are returned as they are
+    """
+    if isinstance(codes, (set, frozenset)):
+        return codes
+    return frozenset(codes or ())
+
+
+def credit_taxonomy(terms_and_urls):
+    """
+    Returns the CRediT taxonomy indexed by URI (``by_uri``), by upper case
+    term (``by_term``) and the terms in their original order (``terms``)
+
+    ``terms_and_urls`` is a list of ``{"term": ..., "uri": ...}``, as
+    ``credit_taxonomy_terms_and_urls`` of ``article_contribs_rules``.
+    """
+    by_uri = {}
+    by_term = {}
+    terms = []
+    for item in terms_and_urls or ():
+        term, uri = item["term"], item["uri"]
+        terms.append(term)
+        by_uri[uri] = term
+        by_term[term.upper()] = uri
+    return CreditTaxonomy(
+        MappingProxyType(by_uri), MappingProxyType(by_term), tuple(terms)
+    )
+
+
+def _contribs_credit_taxonomy(article_contribs_rules):
+    return credit_taxonomy(article_contribs_rules["credit_taxonomy_terms_and_urls"])
+
+
+def _funding_special_chars_award_id(funding_data_rules):
+    return code_set(funding_data_rules["special_chars_award_id"])
+
+
+def _get_lookup(rules, name, build):
+    if isinstance(rules, RuleSet):
+        return rules.get_lookup(name, build)
+    return build(rules[name])
+
+
+def get_code_set(rules, name):
+    """
+    Returns the code list ``rules[name]`` as a ``frozenset``, built once per
+    ``RuleSet``
+    """
+    return _get_lookup(rules, name, code_set)
+
+
+def get_credit_taxonomy(rules):
+    """
+    Returns the CRediT taxonomy of ``article_contribs_rules``, built once per
+    ``RuleSet``
+    """
+    return _get_lookup(rules, "article_contribs_rules", _contribs_credit_taxonomy)
+
+
+def get_special_chars_award_id(rules):
+    """
+    Returns ``special_chars_award_id`` of ``funding_data_rules`` as a
+    ``frozenset``, built once per ``RuleSet``
+    """
+    return _get_lookup(
+        rules, "funding_data_rules", _funding_special_chars_award_id
+    )
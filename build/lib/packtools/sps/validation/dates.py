@@ -0,0 +1,689 @@
+from datetime import date, datetime
+
+from packtools.sps.models.dates import FulltextDates
+from packtools.sps.validation.utils import build_response, get_future_date
+from packtools.sps import i18n
+
+
+def is_subsequence_in_order(subsequence, main_sequence):
+    """
+    Checks if the elements of 'subsequence' appear in the same main_sequence within 'main_sequence'.
+
+    This function creates an iterator from 'main_sequence' and checks if each item in 'subsequence'
+    appears sequentially within this iterator.
+
+    Params:
+    -------
+    subsequence : list
+        A list of elements whose main_sequence needs to be checked.
+    main_sequence : list
+        A list in which the main_sequence of elements from 'subsequence' will be checked.
+
+    Returns:
+    --------
+    bool
+        True if 'subsequence' is a subsequence of 'main_sequence' maintaining the main_sequence of elements, False otherwise.
+
+    Description automatically generated by ChatGPT.
+    """
+
+    # Creates an iterator from the 'main_sequence' list.
+    iterator_main_sequence = iter(main_sequence)
+
+    # Checks if each item in 'subsequence' appears in 'iterator_main_sequence' maintaining the main_sequence.
+    return all(item in iterator_main_sequence for item in subsequence)
+
+
+class DateValidation:
+    def __init__(self, date_data, params):
+        self.date_data = date_data
+        self.date_type = self.date_data["type"]
+        self.tag = "pub-date" if self.date_type in ("pub", "collection") else "date"
+
+        # Initialize default params and update with provided params
+        self.params = self._get_default_params()
+        self.params.update(params or {})
+        self.params["limit_date"] = self.params["limit_date"] or get_future_date(datetime.now().isoformat()[:10], 60)
+
+    def _get_default_params(self):
+        """Return default parameters for date validation."""
+        return {
+            # Error levels for format validation
+            "day_format_error_level": "CRITICAL",
+            "month_format_error_level": "CRITICAL",
+            "year_format_error_level": "CRITICAL",
+            "year_value_error_level": "CRITICAL",
+            "value_error_level": "CRITICAL",
+            "format_error_level": "CRITICAL",
+            "limit_error_level": "CRITICAL",
+            # Event ordering configuration
+            "pre_pub_ordered_events": ["preprint", "received", "rev-request", "rev-recd", "revised", "accepted"],
+            "pos_pub_ordered_events": ["pub", "resubmitted", "corrected", "retracted"],
+            # Parent reference for validation responses
+            "parent": None,
+            # Date limits
+            "limit_date": get_future_date(datetime.now().isoformat()[:10], 60),
+            "pub_date": None,
+        }
+
+    def _validate_format(self, label, number):
+        valid = len(self.date_data.get(label) or "") == number
+        return build_response(
+            title=f"{label} format",
+            parent=self.params["parent"],
+            item=self.params["parent"].get("parent"),
+            sub_item=self.date_type,
+            validation_type="format",
+            is_valid=valid,
+            expected=f"{number}-digits {label}",
+            obtained=self.date_data.get(label),
+            advice=f'Complete <{self.tag} date-type="{self.date_type}"><{label}> with {number}-digits',
+            advice_text=i18n._('Complete <{tag} date-type="{date_type}"><{label}> with {number}-digits'),
+            advice_params={
+                "tag": self.tag,
+                "date_type": self.date_type,
+                "label": label,
+                "number": number,
+            },
+            data=self.date_data,
+            error_level=self.params[f"{label}_format_error_level"],
+        )
+
+    def validate_day_format(self):
+        yield self._validate_format("day", 2)
+
+    def validate_month_format(self):
+        yield self._validate_format("month", 2)
+
+    def validate_year_format(self):
+        yield self._validate_format("year", 4)
+
+    def validate_year_value(self):
+        limit_year = datetime.now().year + 1
+        year = self.date_data.get("year") or 0
+        is_valid = 0 < int(year) <= limit_year
+
+        advice = f'Complete <{self.tag} date-type="{self.date_type}"><year> with an year previous or equal to {limit_year}'
+        yield build_response(
+            title="year value",
+            parent=self.params["parent"],
+            item=self.params["parent"].get("parent"),
+            sub_item=self.date_type,
+            validation_type="value",
+            is_valid=is_valid,
+            expected="max one year in the future",
+            obtained=year,
+            advice=advice,
+            advice_text=i18n._('Complete <{tag} date-type="{date_type}"><year> with an year previous or equal to {limit_year}'),
+            advice_params={
+                "tag": self.tag,
+                "date_type": self.date_type,
+                "limit_year": limit_year,
+            },
+            data=self.date_data,
+            error_level=self.params["year_value_error_level"],
+        )
+
+    def validate_date(self):
+        try:
+            _date = date(
+                int(self.date_data.get("year")),
+                int(self.date_data.get("month") or 1),
+                int(self.date_data.get("day") or 1),
+            )
+            if self.date_data.get("year"):
+                yield from self.validate_year_format()
+                yield from self.validate_year_value()
+            if self.date_data.get("month"):
+                yield from self.validate_month_format()
+            if self.date_data.get("day"):
+                yield from self.validate_day_format()
+
+        except (ValueError, TypeError) as e:
+            parts = self.date_data.get("parts")
+            yield build_response(
+                title="valid date",
+                parent=self.params["parent"],
+                item=self.params["parent"].get("parent"),
+                sub_item=self.date_type,
+                validation_type="value",
+                is_valid=False,
+                expected="valid date",
+                obtained=self.date_data,
+                advice=f'<date date-type="{self.date_type}"> ({parts}) is invalid: {e}',
+                advice_text=i18n._('<date date-type="{date_type}"> ({parts}) is invalid: {error}'),
+                advice_params={
+                    "date_type": self.date_type,
+                    "parts": parts,
+                    "error": e,
+                },
+                data=self.date_data,
+                error_level=self.params["value_error_level"],
+            )
+
+    def validate_complete_date(self):
+        formatted_date = self.date_data["display"]
+        parts = self.date_data.get("parts")
+        date_type = self.date_type
+
+        if self.date_data["is_complete"]:
+            limit_date = self.params["limit_date"]
+            pub_date = self.params.get("pub_date")
+
+            max_date_label = "limit date"
+            if pub_date:                
+                if date_type in self.params["pre_pub_ordered_events"]:
+                    max_date_label = "publication date"
+
+            if max_date_label == "limit date":
+                max_date = limit_date
+            else:
+                max_date = pub_date
+
+            valid = formatted_date < max_date
+            advice = f'<date date-type="{date_type}"> ({formatted_date}) must be previous to {max_date_label} ({max_date})'
+            yield build_response(
+                title="valid date",
+                parent=self.params["parent"],
+                item=self.params["parent"].get("parent"),
+                sub_item=self.date_type,
+                validation_type="value",
+                is_valid=valid,
+                expected="valid date",
+                obtained=formatted_date,
+                advice=advice,
+                advice_text=i18n._('<date date-type="{date_type}"> ({formatted_date}) must be previous to {max_date_label} ({max_date})'),
+                advice_params={
+                    "date_type": date_type,
+                    "formatted_date": formatted_date,
+                    "max_date_label": max_date_label,
+                    "max_date": max_date,
+                },
+                data=self.date_data,
+                error_level=self.params["limit_error_level"],
+            )
+        else:
+            advice = f'<date date-type="{date_type}"> ({parts}) must be a date with year, month (2-digits) and day (2-digits)'
+            yield build_response(
+                title=f"{date_type} date",
+                parent=self.params.get("parent"),
+                item="date",
+                sub_item=date_type,
+                validation_type="format",
+                is_valid=False,
+                expected="a date with year, month (2-digits) and day (2-digits)",
+                obtained=self.date_data,
+                advice=advice,
+                advice_text=i18n._('<date date-type="{date_type}"> ({parts}) must be a date with year, month (2-digits) and day (2-digits)'),
+                advice_params={
+                    "date_type": date_type,
+                    "parts": parts,
+                },
+                data=self.date_data,
+                error_level=self.params["format_error_level"],
+            )
+
+
+class FulltextDatesValidation:
+    def __init__(self, node, params=None):
+        """Initialize a FulltextDatesValidation instance.
+
+        Args:
+            node: FulltextDates instance to validate
+            params: Optional dictionary of validation parameters
+        """
+        self.fulltext = FulltextDates(node)
+
+        # FIX: usar history_dates_list (cached_property que retorna lista) em vez de
+        # list(history_dates), que esgota o generator armazenado em @cached_property.
+        # Esgotar o generator via list() faz com que history_dates_dict, ordered_events e
+        # date_types_ordered_by_date recebam o generator já vazio, resultando em [] para
+        # todos os acessos subsequentes, mesmo quando o artigo possui datas de histórico.
+        self.history_dates = self.fulltext.history_dates_list
+
+        # Initialize default params and update with provided params
+        self.params = self._get_default_params()
+        self.params.update(params or {})
+
+        self._add_required_events()
+
+        self.date_types_ordered_by_date = self.fulltext.date_types_ordered_by_date
+        self.expected_date_type_list = (
+            self.params["pre_pub_ordered_events"]
+            + self.params["pos_pub_ordered_events"]
+        )
+        self.required_date_types = self.params["required_events"]
+        self.params["pub_date"] = (
+            self.fulltext.article_date and self.fulltext.article_date["display"]
+        )
+
+    def _get_default_params(self):
+        """Return default parameters for fulltext dates validation.
+
+        Returns:
+            dict: Dictionary containing all default parameter values
+        """
+        return {
+            # Error levels
+            "day_format_error_level": "CRITICAL",
+            "month_format_error_level": "CRITICAL",
+            "year_format_error_level": "CRITICAL",
+            "format_error_level": "CRITICAL",
+            "value_error_level": "CRITICAL",
+            "limit_error_level": "CRITICAL",
+            "unexpected_events_error_level": "CRITICAL",
+            "missing_events_error_level": "CRITICAL",
+            "history_order_error_level": "CRITICAL",
+            # pub-date specific error levels
+            "pub_date_presence_error_level": "CRITICAL",
+            "collection_date_presence_error_level": "CRITICAL",
+            "publication_format_error_level": "CRITICAL",
+            "pub_date_required_elements_error_level": "CRITICAL",
+            "collection_date_year_error_level": "CRITICAL",
+            "collection_date_day_error_level": "ERROR",
+            "pub_date_uniqueness_error_level": "ERROR",
+            "day_value_error_level": "ERROR",
+            "month_value_error_level": "ERROR",
+            # Event lists — alinhados com article_dates_rules.json
+            "required_events": ["received", "accepted"],
+            "pre_pub_ordered_events": [
+                "preprint", "received", "rev-request", "rev-recd", "revised", "accepted"
+            ],
+            "pos_pub_ordered_events": [
+                "pub", "resubmitted", "corrected", "retracted"
+            ],
+            # Required events mappings
+            "required_history_events_for_article_type": {},
+            "required_history_events_for_related_article_type": {},
+            # Parent reference
+            "parent": None,
+            # Date limits - will be set after initialization
+            "limit_date": datetime.now().isoformat()[:10],
+            "pub_date": None,
+        }
+
+    def _add_required_events(self):
+        events = []
+        key = self.fulltext.attribs_parent_prefixed["original_article_type"]
+        if event := self.params["required_history_events_for_article_type"].get(key):
+            events.append(event)
+
+        for item in self.fulltext.related_articles:
+            key = item["related-article-type"]
+            if event := self.params[
+                "required_history_events_for_related_article_type"
+            ].get(key):
+                events.append(event)
+
+        self.params["required_events"] = [
+            *(self.params.get("required_events") or []),
+            *events,
+        ]
+
+    def validate(self):
+        """Perform all date validations.
+
+        Yields:
+            Generator of validation results for all date checks
+        """
+        yield from self.validate_pub_date_pub_presence()
+        yield from self.validate_pub_date_collection_presence()
+        yield from self.validate_publication_format()
+        yield from self.validate_pub_date_uniqueness()
+        yield from self.validate_pub_date_pub_required_elements()
+        yield from self.validate_pub_date_collection_required_year()
+        yield from self.validate_pub_date_collection_no_day()
+        yield from self.validate_day_month_values()
+        yield from self.validate_article_date()
+        yield from self.validate_collection_date()
+        yield from self.validate_history_dates()
+        yield from self.validate_history_order()
+        yield from self.validate_history_events()
+        yield from self.validate_translations()
+        yield from self.validate_not_translations()
+
+    def validate_translations(self):
+        for item in self.fulltext.translations:
+            validator = FulltextDatesValidation(item.node, self.params)
+            yield from validator.validate()
+
+    def validate_not_translations(self):
+        for item in self.fulltext.not_translations:
+            validator = FulltextDatesValidation(item.node, self.params)
+            yield from validator.validate()
+
+    def validate_pub_date_pub_presence(self):
+        """Rule 1: Validate that pub-date with date-type='pub' exists.
+        Only applies to main article (not sub-articles).
+        """
+        if self.fulltext.tag != "article":
+            return
+        is_valid = self.fulltext.epub_date is not None
+        yield build_response(
+            title="pub-date pub presence",
+            parent=self.params["parent"],
+            item="pub-date",
+            sub_item="pub",
+            validation_type="exist",
+            is_valid=is_valid,
+            expected='<pub-date date-type="pub">',
+            obtained='<pub-date date-type="pub">' if is_valid else None,
+            advice='Add <pub-date publication-format="electronic" date-type="pub"> with <day>, <month> and <year>',
+            advice_text=i18n._('Add <pub-date publication-format="electronic" date-type="pub"> with <day>, <month> and <year>'),
+            advice_params={},
+            data=None,
+            error_level=self.params["pub_date_presence_error_level"],
+        )
+
+    def validate_pub_date_collection_presence(self):
+        """Rule 2: Validate that pub-date with date-type='collection' exists.
+        Only applies to main article (not sub-articles).
+        """
+        if self.fulltext.tag != "article":
+            return
+        is_valid = self.fulltext.collection_date is not None
+        yield build_response(
+            title="pub-date collection presence",
+            parent=self.params["parent"],
+            item="pub-date",
+            sub_item="collection",
+            validation_type="exist",
+            is_valid=is_valid,
+            expected='<pub-date date-type="collection">',
+            obtained='<pub-date date-type="collection">' if is_valid else None,
+            advice='Add <pub-date publication-format="electronic" date-type="collection"> with <year>',
+            advice_text=i18n._('Add <pub-date publication-format="electronic" date-type="collection"> with <year>'),
+            advice_params={},
+            data=None,
+            error_level=self.params["collection_date_presence_error_level"],
+        )
+
+    def validate_publication_format(self):
+        """Rule 3: Validate that all pub-date elements have publication-format='electronic'."""
+        for date_obj in self.fulltext.all_pub_date_nodes:
+            pub_format = date_obj.publication_format
+            is_valid = pub_format == "electronic"
+            yield build_response(
+                title="pub-date publication-format",
+                parent=self.params["parent"],
+                item="pub-date",
+                sub_item=date_obj.type,
+                validation_type="value",
+                is_valid=is_valid,
+                expected="electronic",
+                obtained=pub_format,
+                advice=f'Set @publication-format="electronic" in <pub-date date-type="{date_obj.type}">',
+                advice_text=i18n._('Set @publication-format="electronic" in <pub-date date-type="{date_type}">'),
+                advice_params={"date_type": date_obj.type},
+                data=date_obj.data,
+                error_level=self.params["publication_format_error_level"],
+            )
+
+    def validate_pub_date_pub_required_elements(self):
+        """Rule 4: Validate that pub date has day, month, and year."""
+        article_date = self.fulltext.article_date
+        if not article_date:
+            return
+        for element in ("day", "month", "year"):
+            is_valid = bool(article_date.get(element))
+            yield build_response(
+                title=f"pub-date pub {element}",
+                parent=self.params["parent"],
+                item="pub-date",
+                sub_item="pub",
+                validation_type="exist",
+                is_valid=is_valid,
+                expected=f"<{element}> in pub-date[@date-type='pub']",
+                obtained=article_date.get(element),
+                advice=f'Add <{element}> to <pub-date date-type="pub">',
+                advice_text=i18n._('Add <{element}> to <pub-date date-type="pub">'),
+                advice_params={"element": element},
+                data=article_date,
+                error_level=self.params["pub_date_required_elements_error_level"],
+            )
+
+    def validate_pub_date_collection_required_year(self):
+        """Rule 5: Validate that collection date has year."""
+        collection_date = self.fulltext.collection_date
+        if not collection_date:
+            return
+        is_valid = bool(collection_date.get("year"))
+        yield build_response(
+            title="pub-date collection year",
+            parent=self.params["parent"],
+            item="pub-date",
+            sub_item="collection",
+            validation_type="exist",
+            is_valid=is_valid,
+            expected="<year> in pub-date[@date-type='collection']",
+            obtained=collection_date.get("year"),
+            advice='Add <year> to <pub-date date-type="collection">',
+            advice_text=i18n._('Add <year> to <pub-date date-type="collection">'),
+            advice_params={},
+            data=collection_date,
+            error_level=self.params["collection_date_year_error_level"],
+        )
+
+    def validate_pub_date_collection_no_day(self):
+        """Rule 6: Validate that collection date does NOT have day."""
+        collection_date = self.fulltext.collection_date
+        if not collection_date:
+            return
+        has_day = bool(collection_date.get("day"))
+        is_valid = not has_day
+        yield build_response(
+            title="pub-date collection day",
+            parent=self.params["parent"],
+            item="pub-date",
+            sub_item="collection",
+            validation_type="value",
+            is_valid=is_valid,
+            expected="no <day> in pub-date[@date-type='collection']",
+            obtained=f"<day>{collection_date.get('day')}</day>" if has_day else None,
+            advice='Remove <day> from <pub-date date-type="collection">',
+            advice_text=i18n._('Remove <day> from <pub-date date-type="collection">'),
+            advice_params={},
+            data=collection_date,
+            error_level=self.params["collection_date_day_error_level"],
+        )
+
+    def validate_pub_date_uniqueness(self):
+        """Rule 7: Validate exactly one pub-date per date-type."""
+        nodes_by_type = self.fulltext.pub_date_nodes_by_type
+        for date_type in ("pub", "collection"):
+            count = len(nodes_by_type.get(date_type, []))
+            is_valid = count <= 1
+            yield build_response(
+                title=f"pub-date {date_type} uniqueness",
+                parent=self.params["parent"],
+                item="pub-date",
+                sub_item=date_type,
+                validation_type="value",
+                is_valid=is_valid,
+                expected=f"at most 1 pub-date[@date-type='{date_type}']",
+                obtained=f"{count} pub-date[@date-type='{date_type}']",
+                advice=f'Ensure there is at most one <pub-date date-type="{date_type}">',
+                advice_text=i18n._('Ensure there is at most one <pub-date date-type="{date_type}">'),
+                advice_params={"date_type": date_type},
+                data=None,
+                error_level=self.params["pub_date_uniqueness_error_level"],
+            )
+
+    def validate_day_month_values(self):
+        """Rule 8: Validate day (00-31) and month (00-12) numeric ranges."""
+        for date_data in self.fulltext.pub_dates:
+            date_type = date_data.get("type")
+            day = date_data.get("day")
+            month = date_data.get("month")
+            if day:
+                try:
+                    day_int = int(day)
+                    is_valid = 0 <= day_int <= 31
+                except (ValueError, TypeError):
+                    is_valid = False
+                yield build_response(
+                    title="pub-date day value",
+                    parent=self.params["parent"],
+                    item="pub-date",
+                    sub_item=date_type,
+                    validation_type="value",
+                    is_valid=is_valid,
+                    expected="a value between 00 and 31",
+                    obtained=day,
+                    advice=f'Fix <day> value in <pub-date date-type="{date_type}">. Must be between 00 and 31',
+                    advice_text=i18n._('Fix <day> value in <pub-date date-type="{date_type}">. Must be between 00 and 31'),
+                    advice_params={"date_type": date_type},
+                    data=date_data,
+                    error_level=self.params["day_value_error_level"],
+                )
+            if month:
+                try:
+                    month_int = int(month)
+                    is_valid = 0 <= month_int <= 12
+                except (ValueError, TypeError):
+                    is_valid = False
+                yield build_response(
+                    title="pub-date month value",
+                    parent=self.params["parent"],
+                    item="pub-date",
+                    sub_item=date_type,
+                    validation_type="value",
+                    is_valid=is_valid,
+                    expected="a value between 00 and 12",
+                    obtained=month,
+                    advice=f'Fix <month> value in <pub-date date-type="{date_type}">. Must be between 00 and 12',
+                    advice_text=i18n._('Fix <month> value in <pub-date date-type="{date_type}">. Must be between 00 and 12'),
+                    advice_params={"date_type": date_type},
+                    data=date_data,
+                    error_level=self.params["month_value_error_level"],
+                )
+
+    def validate_article_date(self):
+        """Validate the main article date."""
+        if article_date := self.fulltext.article_date:
+            validator = DateValidation(article_date, self.params)
+            yield from validator.validate_date()
+            yield from validator.validate_complete_date()
+
+    def validate_collection_date(self):
+        """Validate the collection date (only basic validation, not completeness)."""
+        if collection_date := self.fulltext.collection_date:
+            validator = DateValidation(collection_date, self.params)
+            yield from validator.validate_date()
+            # Note: We don't validate completeness for collection dates
+
+    def validate_history_dates(self):
+        """Validate each history date."""
+        for history_date in self.fulltext.history_dates_list:
+            validator = DateValidation(history_date, self.params)
+            yield from validator.validate_date()
+            yield from validator.validate_complete_date()
+
+    def get_events_ordered_by_date(self, unordered_events):
+        try:
+            return sorted(
+                unordered_events,
+                key=lambda x: (
+                    self.expected_date_type_list.index(x)
+                    if x in self.expected_date_type_list
+                    else float("inf")
+                ),
+            )
+        except ValueError:
+            # In case an event in unordered_events is not in self.expected_date_type_list, it's placed at the end of the sorted list
+            return unordered_events
+
+    @property
+    def missing_events(self):
+        return self.get_events_ordered_by_date(
+            set(self.params["required_events"]) - set(self.date_types_ordered_by_date),
+        )
+
+    @property
+    def unexpected_events(self):
+        # obtem uma lista em ordem alfabética dos eventos identificados que não são reconhecidos
+        return sorted(
+            set(self.date_types_ordered_by_date) - set(self.expected_date_type_list)
+        )
+
+    @property
+    def expected_events(self):
+        s = set(self.date_types_ordered_by_date) - set(self.unexpected_events)
+        # FIX: set.union() retorna um novo set e não modifica s in-place.
+        # A linha anterior era s.union(self.required_date_types), cujo retorno era ignorado.
+        s |= set(self.required_date_types)
+        return self.get_events_ordered_by_date(s)
+
+    @property
+    def is_ordered_history(self):
+        # o histórico é válido se os eventos estão ordenados pelo padrão e não há eventos faltantes nem desconhecidos
+        return is_subsequence_in_order(
+            self.date_types_ordered_by_date, self.expected_date_type_list
+        )
+
+    def validate_history_events(self):
+        history_dates = self.history_dates
+
+        yield build_response(
+            title="unexpected events",
+            parent=self.params["parent"],
+            item="history",
+            sub_item=None,
+            validation_type="value",
+            is_valid=not self.unexpected_events,
+            expected=self.expected_events,
+            obtained=self.date_types_ordered_by_date,
+            advice=f"History dates found: {self.date_types_ordered_by_date}. Exclude unexpected dates: {self.unexpected_events}",
+            advice_text=i18n._("History dates found: {date_types}. Exclude unexpected dates: {unexpected_events}"),
+            advice_params={
+                "date_types": self.date_types_ordered_by_date,
+                "unexpected_events": self.unexpected_events,
+            },
+            data=history_dates,
+            error_level=self.params["unexpected_events_error_level"],
+        )
+
+        yield build_response(
+            title="missing events",
+            parent=self.params["parent"],
+            item="history",
+            sub_item=None,
+            validation_type="value",
+            is_valid=not self.missing_events,
+            expected=self.expected_events,
+            obtained=self.date_types_ordered_by_date,
+            advice=f"History dates found: {self.date_types_ordered_by_date}. Add missing dates: {self.missing_events}",
+            advice_text=i18n._("History dates found: {date_types}. Add missing dates: {missing_events}"),
+            advice_params={
+                "date_types": self.date_types_ordered_by_date,
+                "missing_events": self.missing_events,
+            },
+            data=history_dates,
+            error_level=self.params["missing_events_error_level"],
+        )
+
+    def validate_history_order(self):
+        """Validate the chronological order of history events."""
+        is_valid = self.is_ordered_history
+        expected = self.get_events_ordered_by_date(
+            set(self.date_types_ordered_by_date + self.expected_date_type_list)
+            - set(self.unexpected_events),
+        )
+        yield build_response(
+            title="ordered events",
+            parent=self.params["parent"],
+            item="history",
+            sub_item=None,
+            validation_type="match",
+            is_valid=is_valid,
+            expected=expected,
+            obtained=self.date_types_ordered_by_date,
+            advice=f"History dates ({self.date_types_ordered_by_date}) must be in chronological order: {expected}",
+            advice_text=i18n._("History dates ({date_types}) must be in chronological order: {expected}"),
+            advice_params={
+                "date_types": self.date_types_ordered_by_date,
+                "expected": expected,
+            },
+            data=self.history_dates,
+            error_level=self.params["history_order_error_level"],
+        )
@@ -0,0 +1,35 @@
+from packtools.sps.models.fig import Figs
+
+
+class ArticleFigs:
+    def __init__(self, xml_tree, index=None):
+        self.xml_tree = xml_tree
+        # ArticleIndex shared by the validators of the document
+        self.index = index
+
+    def _sub_articles(self, translation):
+        if self.index is not None:
+            return self.index.sub_articles(translation)
+        if translation:
+            return self.xml_tree.xpath(".//sub-article[@article-type='translation']")
+        return self.xml_tree.xpath(".//sub-article[@article-type!='translation']")
+
+    @property
+    def get_all_figs(self):
+        yield from self.get_article_figs
+        yield from self.get_sub_article_translation_figs
+        yield from self.get_sub_article_non_translation_figs
+
+    @property
+    def get_article_figs(self):
+        yield from Figs(self.xml_tree.find("."), self.index).figs()
+
+    @property
+    def get_sub_article_translation_figs(self):
+        for node in self._sub_articles(translation=True):
+            yield from Figs(node, self.index).figs()
+
+    @property
+    def get_sub_article_non_translation_figs(self):
+        for node in self._sub_articles(translation=False):
+            yield from Figs(node, self.index).figs()
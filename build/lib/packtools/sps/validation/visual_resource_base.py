@@ -0,0 +1,77 @@
+import os
+
+from packtools.sps.validation.utils import build_response
+from packtools.sps import i18n
+
+
+class VisualResourceBaseValidation:
+    def __init__(self, data, params):
+        self.data = data
+        self.params = params
+
+    def validate(self):
+        yield self.validate_id()
+        yield self.validate_xlink_href()
+        # Accessibility validations are intentionally NOT yielded here.
+        # They are executed separately by ``XMLAccessibilityDataValidation``
+        # via ``validate_accessibility_data`` in the orchestrator
+        # (``xml_validations.py``), which iterates over <graphic>,
+        # <inline-graphic>, <media> and <inline-media>. Calling them here as
+        # well would produce duplicated entries in the validation report.
+
+    def validate_id(self):
+        xml = self.data.get("xml")
+        tag = self.data.get("tag")
+        if tag and tag.startswith("inline-"):
+            valid = True
+            expected = None
+        else:
+            valid = bool(self.data.get("id"))
+            elem = xml[:xml.find(">")+1] if xml else None
+            expected = f"id for {elem}"
+        return build_response(
+            title="@id",
+            parent=self.data,
+            item=tag,
+            sub_item=None,
+            is_valid=valid,
+            validation_type="exist",
+            expected=expected,
+            obtained=self.data.get("id"),
+            advice=f'Add id="" to {xml}',
+            advice_text=i18n._('Add id="" to {element}'),
+            advice_params={"element": xml},
+            error_level=self.params["media_attributes_error_level"],
+            data=self.data,
+        )
+
+    def validate_xlink_href(self):
+        xlink_href = self.data.get("xlink_href")
+        if not xlink_href:
+            valid = False
+            obtained = xlink_href
+        else:
+            name, ext = os.path.splitext(xlink_href)
+            valid = ext[1:] in self.params["valid_extension"]
+            obtained = xlink_href
+
+        return build_response(
+            title="@xlink:href validation",
+            parent=self.data,
+            item="xlink_href",
+            sub_item=None,
+            is_valid=valid,
+            validation_type="format",
+            expected="File name with extension",
+            obtained=obtained,
+            advice=f'In @xlink:href, provide a valid file name with its extension in {self.params["valid_extension"]}.',
+            advice_text=(
+                i18n._("In @xlink:href, provide a valid file name with its extension "
+                "in {valid_extensions}.")
+            ),
+            advice_params={
+                "valid_extensions": self.params["valid_extension"],
+            },
+            error_level=self.params["xlink_href_error_level"],
+            data=self.data,
+        )
@@ -0,0 +1,198 @@
+# coding=utf-8
+from io import BytesIO
+
+from packtools import XMLValidator
+from packtools.domain import SchematronValidator, PyValidator
+from packtools.sps import i18n
+
+
+# the DTDs bundled with packtools are resolved by the parser
+# (see ``packtools.utils.XMLCatalogResolver``), without the need of the
+# ``XML_CATALOG_FILES`` environment variable
+IS_PACKTOOLS_INSTALLED = False
+try:
+    from packtools.catalogs import XML_CATALOG
+    IS_PACKTOOLS_INSTALLED = bool(XML_CATALOG)
+except Exception as e:
+    pass
+
+
+DEFAULT_VERSIONS = {
+    '-//NLM//DTD Journal Publishing DTD v3.0 20080202//EN': {
+        "sps_versions": [
+            None,
+            'sps-1.0',
+            'sps-1.1',
+        ],
+        "url": "https://dtd.nlm.nih.gov/publishing/3.0/journalpublishing3.dtd",
+    },
+    '-//NLM//DTD JATS (Z39.96) Journal Publishing DTD v1.0 20120330//EN': {
+        "sps_versions": [
+            'sps-1.2',
+            'sps-1.3',
+            'sps-1.4',
+            'sps-1.5',
+            'sps-1.6',
+            'sps-1.7',
+            'sps-1.8',
+        ],
+        "url": "https://jats.nlm.nih.gov/publishing/1.0/JATS-journalpublishing1.dtd",
+    },
+    '-//NLM//DTD JATS (Z39.96) Journal Publishing DTD v1.1 20151215//EN': {
+        "sps_versions": [
+            'sps-1.7',
+            'sps-1.8',
+            'sps-1.9',
+        ],
+        "url": "https://jats.nlm.nih.gov/publishing/1.1/JATS-journalpublishing1.dtd",
+    },
+    "-//NLM//DTD JATS (Z39.96) Journal Publishing DTD v1.3 20210610//EN": {
+        "sps_versions": [
+            'sps-1.10',
+        ],
+        "url": "https://jats.nlm.nih.gov/publishing/1.3/JATS-journalpublishing1-3.dtd",
+    },
+}
+
+
+class StructureValidator:
+
+    def __init__(self, xml_with_pre, VERSIONS=None):
+        self.xml_with_pre = xml_with_pre
+        self.VERSIONS = VERSIONS
+        sps_version = self.xml_with_pre.sps_version
+        auto_loaded_sch_label = u'@' + sps_version
+        self.style_validators = [
+            SchematronValidator.from_catalog(
+                sps_version,
+                label=auto_loaded_sch_label),
+            PyValidator(label=auto_loaded_sch_label),
+            # the python based validation pipeline
+        ]
+
+        # the DTD bundled with packtools is parsed once per PUBLIC ID and
+        # shared by all the XMLValidator instances. It is also loaded while
+        # parsing, since the XML is serialized by annotate_errors
+        self.xml_validator = XMLValidator.parse(
+            BytesIO(self.xml_with_pre.tostring().encode("utf-8")),
+        )
+
+    def validate_doctype(self, VERSIONS=None):
+        VERSIONS = VERSIONS or self.VERSIONS or DEFAULT_VERSIONS
+        try:
+            dtd_version = VERSIONS[self.xml_with_pre.public_id]
+        except KeyError:
+            yield {
+                "result": "error",
+                "message": 'Unknown {}: {}'.format(
+                    'PUBLIC ID',
+                    self.xml_with_pre.public_id,
+                ),
+                "msg_text": i18n._("Unknown {identifier}: {value}"),
+                "msg_params": {
+                    "identifier": "PUBLIC ID",
+                    "value": self.xml_with_pre.public_id,
+                },
+                "adv_text": None,
+                "adv_params": None,
+            }
+            return
+
+        if self.xml_with_pre.sps_version not in dtd_version["sps_versions"]:
+            yield {
+                "result": "error",
+                "message": 'Unmatched {}: {}. Expected one of {}'.format(
+                    'sps version',
+                    self.xml_with_pre.sps_version,
+                    dtd_version["sps_versions"],
+                ),
+                "msg_text": i18n._(
+                    "Unmatched {identifier}: {value}. "
+                    "Expected one of {expected}"
+                ),
+                "msg_params": {
+                    "identifier": "sps version",
+                    "value": self.xml_with_pre.sps_version,
+                    "expected": dtd_version["sps_versions"],
+                },
+                "adv_text": None,
+                "adv_params": None,
+            }
+
+        try:
+            system_id = self.xml_with_pre.system_id.split("://")[1]
+            if system_id not in dtd_version['url']:
+                yield {
+                    "result": "error",
+                    "message": 'Unmatched {}: {}. Expected {}'.format(
+                        'SYSTEM ID',
+                        self.xml_with_pre.system_id,
+                        dtd_version['url'],
+                    ),
+                    "msg_text": i18n._(
+                        "Unmatched {identifier}: {value}. "
+                        "Expected {expected}"
+                    ),
+                    "msg_params": {
+                        "identifier": "SYSTEM ID",
+                        "value": self.xml_with_pre.system_id,
+                        "expected": dtd_version["url"],
+                    },
+                    "adv_text": None,
+                    "adv_params": None,
+                }
+        except (AttributeError, ValueError, TypeError, IndexError):
+            yield {
+                "result": "error",
+                "message": 'Unmatched {}: {}. Expected {}'.format(
+                    'SYSTEM ID',
+                    self.xml_with_pre.system_id,
+                    dtd_version['url'],
+                ),
+                "msg_text": i18n._(
+                    "Unmatched {identifier}: {value}. Expected {expected}"
+                ),
+                "msg_params": {
+                    "identifier": "SYSTEM ID",
+                    "value": self.xml_with_pre.system_id,
+                    "expected": dtd_version["url"],
+                },
+                "adv_text": None,
+                "adv_params": None,
+            }
+
+    def annotate_errors(self):
+        annotated = BytesIO()
+        self.xml_validator.write_annotated_errors(annotated)
+        return annotated.getvalue().decode("utf-8")
+
+    def validate_dtd(self):
+        try:
+            dtd_is_valid, dtd_errors = self.xml_validator.validate()
+        except Exception as e:
+            dtd_is_valid, dtd_errors = False, [str(e)]
+        return {"dtd_is_valid": dtd_is_valid, "dtd_errors": dtd_errors}
+
+    def validate_style(self):
+        try:
+            style_is_valid, style_errors = self.xml_validator.validate_style()
+        except Exception as e:
+            style_is_valid, style_errors = False, [str(e)]
+        return {"style_is_valid": style_is_valid, "style_errors": style_errors}
+
+    def validate(self):
+        dtd_validation_result = self.validate_dtd()
+        style_validation_result = self.validate_style()
+        d = {
+            "is_valid": bool(
+                dtd_validation_result["dtd_is_valid"] and
+                style_validation_result["style_is_valid"]),
+            "errors_number": (
+                len(dtd_validation_result["dtd_errors"]) +
+                len(style_validation_result["style_errors"])
+            ),
+            "doctype_validation_result": list(self.validate_doctype()),
+        }
+        d.update(dtd_validation_result)
+        d.update(style_validation_result)
+        return d
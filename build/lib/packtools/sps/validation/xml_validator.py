@@ -0,0 +1,226 @@
+from contextvars import copy_context
+
+from packtools.sps.models.article_index import ArticleIndex
+from packtools.sps.utils import xml_utils
+from packtools.sps.validation import xml_validations
+from packtools.sps.validation.profiling import SETUP_GROUP, set_profile
+from packtools.sps.validation.utils import REPORT_ALL, REPORT_FAILURES, set_report
+from packtools.sps.validation.xml_validator_rules import get_ruleset
+
+
+def get_validation_results(xmltree, params, report=REPORT_ALL, profile=None):
+    """
+    Validates xmltree and yields one flat result per validation item
+
+    params may be a ``RuleSet`` (see ``xml_validator_rules.get_ruleset``),
+    which is used as is and can be shared across documents, or a dict of
+    rules which overrides the default rules.
+
+    report="failures" yields only the results which are not OK (and the
+    exceptions); the OK results are built as compact records, without
+    formatting nor localizing their messages, and then discarded.
+
+    profile may be a ``profiling.DocumentProfile``, which records the time
+    spent by each group of the validation and by each validator method
+    (check) of the groups.
+    """
+    # the report mode only applies to the validators run by this generator
+    context = copy_context()
+    context.run(set_report, report)
+    # os validadores extraem, repetidamente, textos dos mesmos elementos
+    context.run(xml_utils.set_text_memo)
+    context.run(set_profile, profile)
+    results = _get_validation_results(xmltree, params, profile)
+    while True:
+        try:
+            data = context.run(next, results)
+        except StopIteration:
+            return
+        if report == REPORT_FAILURES and data.get("response") == "OK":
+            continue
+        yield data
+
+
+def _get_validation_results(xmltree, params, profile=None):
+    groups = validate_xml_content(xmltree, params)
+    if profile is not None:
+        groups = profile.measure(SETUP_GROUP, groups)
+    for result in groups:
+        try:
+            group = None
+            group = result["group"]
+            items = result["items"]
+            if profile is not None:
+                items = profile.measure(group, items)
+            for index, item in enumerate(items):
+                if not item:
+                    continue
+                try:
+                    data = {}
+                    data.update(item)
+                    data["group"] = group
+                    yield data
+                except Exception as e:
+                    data = {
+                        "response": "exception",
+                        "group": group,
+                        "error": str(e),
+                        "type": str(type(e)),
+                    }
+                    data.update(item)
+                    yield data
+        except Exception as e:
+            yield {
+                "response": "exception",
+                "group": group,
+                "error": str(e),
+                "type": str(type(e)),
+            }
+
+
+def validate_xml_content(xmltree, rules):
+    params = get_ruleset(rules)
+    if not params.get("article_index"):
+        # built in one tree pass and shared by the validators
+        params = params.override({"article_index": ArticleIndex(xmltree)})
+    yield {
+        "group": "journal-meta",
+        "items": xml_validations.validate_journal_meta(xmltree, params),
+    }
+    yield {
+        "group": "bibliographic strip",
+        "items": xml_validations.validate_bibliographic_strip(xmltree, params),
+    }
+    yield {
+        "group": "article attributes",
+        "items": xml_validations.validate_article(xmltree, params),
+    }
+    yield {
+        "group": "article-id",
+        "items": xml_validations.validate_article_ids(xmltree, params),
+    }
+    yield {
+        "group": "article dates",
+        "items": xml_validations.validate_article_dates(xmltree, params),
+    }
+    yield {
+        "group": "history",
+        "items": xml_validations.validate_history(xmltree, params),
+    }
+    yield {
+        "group": "article languages",
+        "items": xml_validations.validate_article_languages(xmltree, params),
+    }
+    yield {
+        "group": "article languages",
+        "items": xml_validations.validate_metadata_languages(xmltree, params),
+    }
+    yield {
+        "group": "subject",
+        "items": xml_validations.validate_article_toc_sections(xmltree, params),
+    }
+    yield {
+        "group": "article-type",
+        "items": xml_validations.validate_article_type(xmltree, params),
+    }
+    yield {
+        "group": "contrib",
+        "items": xml_validations.validate_article_contribs(xmltree, params),
+    }
+    yield {
+        "group": "aff",
+        "items": xml_validations.validate_affiliations(xmltree, params),
+    }
+    yield {
+        "group": "author-notes",
+        "items": xml_validations.validate_author_notes(xmltree, params),
+    }
+    yield {
+        "group": "abstract",
+        "items": xml_validations.validate_abstracts(xmltree, params),
+    }
+    yield {
+        "group": "open science",
+        "items": xml_validations.validate_open_science_actions(xmltree, params),
+    }
+    yield {
+        "group": "funding data",
+        "items": xml_validations.validate_funding_data(xmltree, params),
+    }
+    yield {
+        "group": "id and rid",
+        "items": xml_validations.validate_id_and_rid_match(xmltree, params),
+    }
+    yield {"group": "fig", "items": xml_validations.validate_figs(xmltree, params)}
+    yield {
+        "group": "table-wrap",
+        "items": xml_validations.validate_tablewraps(xmltree, params),
+    }
+    yield {
+        "group": "disp-formula",
+        "items": xml_validations.validate_equations(xmltree, params),
+    }
+    yield {
+        "group": "inline-formula",
+        "items": xml_validations.validate_inline_equations(xmltree, params),
+    }
+    yield {
+        "group": "reference",
+        "items": xml_validations.validate_references(xmltree, params),
+    }
+    yield {
+        "group": "related-article",
+        "items": xml_validations.validate_related_articles(xmltree, params),
+    }
+    yield {
+        "group": "fn",
+        "items": xml_validations.validate_fns(xmltree, params),
+    }
+    yield {
+        "group": "reviewer-report",
+        "items": xml_validations.validate_peer_reviews(xmltree, params),
+    }
+    yield {
+        "group": "accessibility",
+        "items": xml_validations.validate_accessibility_data(xmltree, params),
+    }
+    yield {
+        "group": "media",
+        "items": xml_validations.validate_media(xmltree, params),
+    }
+    yield {
+        "group": "app",
+        "items": xml_validations.validate_app_group(xmltree, params),
+    }
+    yield {
+        "group": "supplementary-material",
+        "items": xml_validations.validate_supplementary_materials(xmltree, params),
+    }
+    yield {
+        "group": "ext-link",
+        "items": xml_validations.validate_ext_links(xmltree, params),
+    }
+    yield {
+        "group": "list",
+        "items": xml_validations.validate_lists(xmltree, params),
+    }
+    yield {
+        "group": "graphic",
+        "items": xml_validations.validate_graphics(xmltree, params),
+    }
+    yield {
+        "group": "response",
+        "items": xml_validations.validate_response(xmltree, params),
+    }
+    yield {
+        "group": "sec",
+        "items": xml_validations.validate_secs(xmltree, params),
+    }
+    yield {
+        "group": "product",
+        "items": xml_validations.validate_products(xmltree, params),
+    }
+    yield {
+        "group": "permissions",
+        "items": xml_validations.validate_permissions(xmltree, params),
+    }
@@ -0,0 +1,443 @@
+# coding: utf-8
+from __future__ import print_function, unicode_literals
+import os
+import argparse
+import sys
+import json
+import logging
+import posixpath
+import io
+import functools
+import collections
+import multiprocessing
+
+from lxml import etree
+
+import packtools
+from packtools import exceptions
+from packtools import catalogs
+from packtools.pkg_resources_fixer import get_version
+
+
+__all__ = ['summarize', 'annotate', 'validate_file']
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+LOGGER_FMT = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+
+
+EPILOG = """\
+Copyright 2013 SciELO <scielo-dev@googlegroups.com>.
+Licensed under the terms of the BSD license. Please see LICENSE in the source
+code for more information.
+"""
+
+
+ERR_MESSAGE = "Something went wrong while working on {filename}: {details}."
+
+
+AVAILABLE_SCHEMAS = ', '.join(sorted(['@'+key 
+    for key in catalogs.SCH_SCHEMAS.keys()]))
+
+
+def get_xmlvalidator(xmlpath, no_network, extra_sch, load_dtd=True):
+    """ Get an instance of ``packtools.XMLValidator``.
+
+    :param xmlpath: filesystem or URL to an XML file.
+    :param no_network: if the parser might retrieve the DTD from the internet.
+    :param extra_sch: list of paths to schematron schemas.
+    :param load_dtd: (optional) load the DTD while parsing the XML. It is
+                     needed to serialize the XML as it was loaded (e.g. the
+                     attributes defaulted by the DTD and the ignorable
+                     whitespace), but not to validate it, since the bundled
+                     DTDs are parsed once and shared (see
+                     ``packtools.domain.StdDTD``).
+    """ 
+    try:
+        parsed_xml = packtools.XML(xmlpath, no_network=no_network,
+                                   load_dtd=load_dtd)
+    except etree.XMLSyntaxError:
+        if load_dtd:
+            raise
+        # the XML may use entities declared in the DTD
+        parsed_xml = packtools.XML(xmlpath, no_network=no_network)
+    _extra_sch = list(extra_sch)
+    if _extra_sch:
+        schemas = [_get_extra_schematron(path_or_ref)
+                   for path_or_ref in _extra_sch]
+        labeled_schemas = zip(schemas, _extra_sch)
+    else:
+        labeled_schemas = None
+
+    return packtools.XMLValidator.parse(parsed_xml, 
+            extra_sch_schemas=labeled_schemas)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_extra_schematron(path_or_ref):
+    path = packtools.utils.resolve_schematron_filepath(path_or_ref)
+    return packtools.utils.get_schematron_from_filepath(path)
+
+
+def annotate(validator, buff, encoding=None):
+    _encoding = encoding or validator.encoding
+    validator.write_annotated_errors(buff, encoding=_encoding)
+
+
+def summarize(validator, assets_basedir=None):
+    """Produce a summarized result of the validation.
+    """
+    def _make_err_message(err):
+        """ An error message is comprised of the message itself and the
+        element sourceline.
+        """
+        err_msg = {'message': err.message}
+
+        try:
+            err_element = err.get_apparent_element(validator.lxml)
+        except ValueError:
+            LOGGER.info('could not find the element name in message')
+            err_element = None
+
+        if err_element is not None:
+            err_msg['apparent_line'] = err_element.sourceline
+        else:
+            err_msg['apparent_line'] = None
+
+        return err_msg
+
+    dtd_is_valid, dtd_errors = validator.validate()
+    sps_is_valid, sps_errors = validator.validate_style()
+
+    summary = {
+        'dtd_errors': [_make_err_message(err) for err in dtd_errors],
+        'style_errors': {},
+        'is_valid': bool(dtd_is_valid and sps_is_valid),
+    }
+
+    for sps_error in sps_errors:
+        err_group = summary['style_errors'].setdefault(sps_error.label, [])
+        err_group.append(_make_err_message(sps_error))
+
+    if assets_basedir:
+        LOGGER.info('starting to look for assets')
+        summary['assets'] = validator.lookup_assets(assets_basedir)
+        LOGGER.info('total assets referenced: %s', len(summary['assets']))
+
+    return summary
+
+
+class _RelativeMembers(object):
+    """Membership tests, for paths relative to ``base``, against the set of
+    package members.
+    """
+    def __init__(self, members, base):
+        self.members = members
+        self.base = base
+
+    def __contains__(self, path):
+        return posixpath.join(self.base, path) in self.members
+
+
+def _validate_package_member(member, content, members):
+    try:
+        validator = packtools.XMLValidator.parse(io.BytesIO(content))
+
+    except exceptions.PacktoolsError as exc:
+        exc_type = type(exc).__name__
+        exc_value = str(exc)
+        summary = None
+
+    else:
+        exc_type = None
+        exc_value = None
+
+        # useful for looking-up files relative to the xml file
+        paths = _RelativeMembers(members, posixpath.dirname(member))
+        summary = summarize(validator, paths)
+
+    return (member, summary, exc_type, exc_value)
+
+
+_package_members = None
+
+
+def _init_package_worker(members):
+    global _package_members
+    _package_members = members
+    _warm_up()
+
+
+def _validate_package_member_in_worker(args):
+    member, content = args
+    return _validate_package_member(member, content, _package_members)
+
+
+def validate_zip_package(filepath, jobs=1):
+    """Validates all documents in a zip package.
+
+    Returns a generator object that produces validation reports for each
+    XML document. Validation reports are represented as 4-tuples in the form:
+    (<filename>, <summary>, <exc_type>, <exc_value>)
+
+    The package members are indexed once, so the assets referenced by each
+    XML are looked up in constant time, and the XMLs are read as bytes
+    without extracting the package.
+
+    :param filepath: filesystem path to the zip file.
+    :param jobs: (optional) number of processes validating the XMLs in
+                 parallel. The reports keep the order of the members.
+    """
+    with packtools.utils.Xray.fromfile(filepath) as xpack:
+        members = xpack.members_index()
+        xmls = xpack.show_sorted_members().get('xml', [])
+
+        def _read_xmls():
+            for xml in xmls:
+                with xpack.get_file(xml) as file:
+                    yield xml, file.read()
+
+        if jobs > 1:
+            _warm_up()
+            pool = multiprocessing.Pool(
+                    jobs, initializer=_init_package_worker,
+                    initargs=(members, ))
+            try:
+                for report in _imap_bounded(
+                        pool, _validate_package_member_in_worker,
+                        _read_xmls(), 2 * jobs):
+                    yield report
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            for xml, content in _read_xmls():
+                yield _validate_package_member(xml, content, members)
+
+
+def _warm_up(extra_sch=()):
+    """Loads the schemas that are shared by all the validations, so that
+    they are not loaded while validating the first files.
+    """
+    for sps_version in catalogs.CURRENTLY_SUPPORTED_VERSIONS:
+        try:
+            packtools.domain.StdSchematron(sps_version)
+        except ValueError as exc:
+            LOGGER.info('cannot load schematron for "%s": %s', sps_version, exc)
+
+    public_ids = (set(catalogs.ALLOWED_PUBLIC_IDS) |
+                  set(catalogs.ALLOWED_PUBLIC_IDS_LEGACY))
+    for public_id in public_ids:
+        try:
+            packtools.domain.DTDValidator.from_catalog(public_id)
+        except ValueError as exc:
+            LOGGER.info('cannot load DTD for "%s": %s', public_id, exc)
+
+    for path_or_ref in extra_sch:
+        _get_extra_schematron(path_or_ref)
+
+
+def _init_worker(extra_sch):
+    _warm_up(extra_sch)
+
+
+def _imap_bounded(pool, func, iterable, max_pending):
+    """Like ``pool.imap(func, iterable)`` but consumes ``iterable`` as the
+    results are produced, keeping at most ``max_pending`` tasks in the pool.
+
+    ``Pool.imap`` consumes the whole iterable upfront, which is not desired
+    when the paths come from stdin.
+    """
+    pending = collections.deque()
+    for item in iterable:
+        pending.append(pool.apply_async(func, (item, )))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+
+    while pending:
+        yield pending.popleft().get()
+
+
+def validate_file(xml, nonetwork=False, extrasch=(), annotated=False,
+                  assetsdir=None):
+    """Validates the XML at ``xml``, the filesystem path or URL.
+
+    Returns a dict with the keys: ``xml``, ``is_valid``, ``summary`` (``None``
+    if ``annotated`` is set), ``annotated`` (path of the annotated XML file,
+    if ``annotated`` is set) and ``error`` (the message if ``xml`` could not
+    be validated).
+    """
+    result = {'xml': xml, 'is_valid': None, 'summary': None,
+              'annotated': None, 'error': None}
+
+    LOGGER.info('starting validation of "%s"', xml)
+
+    try:
+        # the annotated XML is serialized, so the DTD is loaded
+        validator = get_xmlvalidator(xml, nonetwork, extrasch,
+                                     load_dtd=annotated)
+
+    except (etree.XMLSyntaxError, exceptions.XMLDoctypeError,
+            exceptions.XMLSPSVersionError) as exc:
+        LOGGER.exception(exc)
+        result['error'] = ERR_MESSAGE.format(filename=xml, details=exc)
+        return result
+
+    if annotated:
+
+        fname, fext = xml.rsplit('.', 1)
+        out_fname = '.'.join([fname, 'annotated', fext])
+
+        with open(out_fname, 'wb') as fp:
+            annotate(validator, fp)
+
+        result['is_valid'], _ = validator.validate_all()
+        result['annotated'] = out_fname
+
+    else:
+        # remote XML will not lookup for assets
+        if xml.startswith(('http:', 'https:')):
+            LOGGER.info('disabling assets lookup since "%s" is a '
+                        'remote file', xml)
+            assetsdir = ''
+            assetsdir_files = []
+        else:
+            assetsdir = assetsdir or os.path.dirname(xml)
+            assetsdir_files = os.listdir(assetsdir)  # list of files in dir
+
+        try:
+            summary = summarize(validator, assets_basedir=assetsdir_files)
+        except TypeError as exc:
+            LOGGER.exception(exc)
+            LOGGER.info(
+                    'error validating "%s". Skipping. '
+                    'run with option `--loglevel INFO` for more info',
+                    xml)
+            return result
+
+        summary['_xml'] = xml
+        result['summary'] = summary
+        result['is_valid'] = summary['is_valid']
+
+    LOGGER.info('finished validating "%s"', xml)
+    return result
+
+
+def _main():
+    exit_status = 0
+
+    packtools_version = get_version('packtools')
+
+    parser = argparse.ArgumentParser(
+            description='SciELO PS stylechecker command line utility.',
+            epilog=EPILOG)
+
+    mutex_group = parser.add_mutually_exclusive_group()
+    mutex_group.add_argument('--annotated', action='store_true',
+                             help='reproduces the XML with notes at elements that have errors')
+    mutex_group.add_argument('--raw', action='store_true',
+                             help='each result is encoded as json, without any formatting, and written to stdout in a single line.')
+    mutex_group.add_argument('--jsonl', action='store_true',
+                             help='each result, including the files that could not be validated, is encoded as json and written to stdout in a single line as soon as it is ready. by default, the results are kept in memory and written together once all the files are validated.')
+
+    parser.add_argument('--nonetwork', action='store_true',
+                        help='prevents the retrieval of the DTD through the network')
+    parser.add_argument('--assetsdir', default=None,
+                        help='lookup, at the given directory, for each asset referenced by the XML. current working directory will be used by default.')
+    parser.add_argument('--version', action='version', version=packtools_version)
+    parser.add_argument('--loglevel', default='')  # disabled by default
+    parser.add_argument('--nocolors', action='store_false',
+                        help='prevents the output from being colorized by ANSI escape sequences')
+    parser.add_argument('--extrasch', action='append', default=[],
+                        help='runs an extra validation using an external schematron schema. built-in schemas are available through the prefix `@`: %s.' % AVAILABLE_SCHEMAS)
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='number of processes validating the files in parallel. the results keep the input order.')
+    parser.add_argument('--sysinfo', action='store_true',
+                        help='show program\'s installation info and exit.')
+    parser.add_argument('file', nargs='*',
+                        help='filesystem path or URL to the XML')
+    args = parser.parse_args()
+
+    # All log messages will be omited if level > 50
+    logging.basicConfig(level=getattr(logging, args.loglevel.upper(), 999),
+            format=LOGGER_FMT)
+
+    if args.sysinfo:
+        print(packtools.utils.prettify(packtools.get_debug_info(), colorize=args.nocolors))
+        sys.exit(0)
+
+    print('Please wait, this may take a while...', file=sys.stderr)
+
+    input_args = args.file or sys.stdin
+    summary_list = []
+
+    LOGGER.info('running with catalog: %s', catalogs.NAME)
+
+    _validate_file = functools.partial(validate_file,
+            nonetwork=args.nonetwork, extrasch=tuple(args.extrasch),
+            annotated=args.annotated, assetsdir=args.assetsdir)
+    xmls = packtools.utils.flatten(input_args)
+
+    if args.jobs > 1:
+        # the workers inherit the schemas loaded by the main process
+        _warm_up(args.extrasch)
+        pool = multiprocessing.Pool(args.jobs, initializer=_init_worker,
+                                    initargs=(tuple(args.extrasch), ))
+        results = _imap_bounded(pool, _validate_file, xmls, 2 * args.jobs)
+    else:
+        pool = None
+        results = (_validate_file(xml) for xml in xmls)
+
+    try:
+        for result in results:
+            if result['error']:
+                print(result['error'], file=sys.stderr)
+                exit_status = 1
+                if args.jsonl:
+                    print(json.dumps(
+                        {'_xml': result['xml'], 'error': result['error']},
+                        sort_keys=True), flush=True)
+                continue
+
+            if result['annotated']:
+                print('Annotated XML file: "%s"' % result['annotated'])
+
+            elif result['summary']:
+                if args.raw:
+                    print(json.dumps(result['summary'], sort_keys=True))
+                elif args.jsonl:
+                    print(json.dumps(result['summary'], sort_keys=True),
+                          flush=True)
+                else:
+                    summary_list.append(result['summary'])
+
+            # set the exit status to 1 if the xml is not valid
+            if result['is_valid'] is False:
+                exit_status = 1
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    if summary_list:
+        print(packtools.utils.prettify(summary_list, colorize=args.nocolors))
+
+    return exit_status
+
+
+def main():
+    try:
+        sys.exit(_main())
+    except KeyboardInterrupt:
+        LOGGER.info('terminating the program')
+        sys.exit(1)
+    except Exception as exc:
+        LOGGER.exception(exc)
+        sys.exit('An unexpected error has occurred: %s' % exc)
+
+
+if __name__ == '__main__':
+    main()
+
@@ -0,0 +1,5 @@
+def get_text(texto):
+    return texto
+
+
+_ = get_text
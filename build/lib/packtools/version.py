@@ -0,0 +1,4 @@
+"""Single source to the version across setup.py and the whole project.
+"""
+from __future__ import unicode_literals
+__version__ = '4.16.10'
@@ -0,0 +1 @@
+(function(c){var b=function(d,e){this.options=e;this.$elementFilestyle=[];this.$element=c(d)};b.prototype={clear:function(){this.$element.val("");this.$elementFilestyle.find(":text").val("")},destroy:function(){this.$element.removeAttr("style").removeData("filestyle").val("");this.$elementFilestyle.remove()},disabled:function(d){if(d===true){this.$element.attr("disabled","true");this.$elementFilestyle.find("label").attr("disabled","true")}else{if(d===false){this.$element.removeAttr("disabled");this.$elementFilestyle.find("label").removeAttr("disabled")}else{return this.options.disabled}}},icon:function(d){if(d===true){if(!this.options.icon){this.options.icon=true;this.$elementFilestyle.find("label").prepend(this.htmlIcon())}}else{if(d===false){if(this.options.icon){this.options.icon=false;this.$elementFilestyle.find("i").remove()}}else{return this.options.icon}}},input:function(d){if(d===true){if(!this.options.input){this.options.input=true;this.$elementFilestyle.prepend(this.htmlInput());var e="",g=[];if(this.$element[0].files===undefined){g[0]={name:this.$element[0].value}}else{g=this.$element[0].files}for(var f=0;f<g.length;f++){e+=g[f].name.split("\\").pop()+", "}if(e!==""){this.$elementFilestyle.find(":text").val(e.replace(/\, $/g,""))}}}else{if(d===false){if(this.options.input){this.options.input=false;this.$elementFilestyle.find(":text").remove()}}else{return this.options.input}}},buttonText:function(d){if(d!==undefined){this.options.buttonText=d;this.$elementFilestyle.find("label span").html(this.options.buttonText)}else{return this.options.buttonText}},classButton:function(d){if(d!==undefined){this.options.classButton=d;this.$elementFilestyle.find("label").attr({"class":this.options.classButton});if(this.options.classButton.search(/btn-inverse|btn-primary|btn-danger|btn-warning|btn-success/i)!==-1){this.$elementFilestyle.find("label i").addClass("icon-white")}else{this.$elementFilestyle.find("label i").removeClass("icon-white")}}else{return this.options.classButton}},classIcon:function(d){if(d!==undefined){this.options.classIcon=d;if(this.options.classButton.search(/btn-inverse|btn-primary|btn-danger|btn-warning|btn-success/i)!==-1){this.$elementFilestyle.find("label").find("i").attr({"class":"icon-white "+this.options.classIcon})}else{this.$elementFilestyle.find("label").find("i").attr({"class":this.options.classIcon})}}else{return this.options.classIcon}},classInput:function(d){if(d!==undefined){this.options.classInput=d;this.$elementFilestyle.find(":text").addClass(this.options.classInput)}else{return this.options.classInput}},htmlIcon:function(){if(this.options.icon){var d="";if(this.options.classButton.search(/btn-inverse|btn-primary|btn-danger|btn-warning|btn-success/i)!==-1){d=" icon-white "}return'<i class="'+d+this.options.classIcon+'"></i> '}else{return""}},htmlInput:function(){if(this.options.input){return'<input type="text" class="'+this.options.classInput+'" disabled> '}else{return""}},constructor:function(){var j=this,h="",i=this.$element.attr("id"),d=[];if(i===""||!i){i="filestyle-"+c(".bootstrap-filestyle").length;this.$element.attr({id:i})}var f=(this.options.classInputContainerClass!="")?'<div class="'+this.options.classInputContainerClass+'">':"";var m=(f!="")?"</div>":"";var l=(this.options.classButtonContainerClass!="")?'<div class="'+this.options.classButtonContainerClass+'">':"";var k=(l!="")?"</div>":"";if(this.options.buttonBefore){h=l+'<label for="'+i+'" class="'+this.options.classButton+'" '+(this.options.disabled?'disabled="true"':"")+">"+this.htmlIcon()+"<span>"+this.options.buttonText+"</span></label>"+k+f+this.htmlInput()+m}else{h=f+this.htmlInput()+m+l+'<label for="'+i+'" class="'+this.options.classButton+'" '+(this.options.disabled?'disabled="true"':"")+">"+this.htmlIcon()+"<span>"+this.options.buttonText+"</span></label>"+k}this.$elementFilestyle=c('<div class="'+this.options.containerClass+' bootstrap-filestyle">'+h+"</div>");var g=this.$elementFilestyle.find("label");var e=g.parent();e.attr("tabindex","0").keypress(function(n){if(n.keyCode===13||n.charCode===32){g.click()}});this.$element.css({position:"absolute",clip:"rect(0,0,0,0)"}).attr("tabindex","-1").after(this.$elementFilestyle);if(this.options.disabled){this.$element.attr("disabled","true")}this.$element.change(function(){var n="";if(this.files===undefined){d[0]={name:this.value}}else{d=this.files}for(var o=0;o<d.length;o++){n+=d[o].name.split("\\").pop()+", "}if(n!==""){j.$elementFilestyle.find(":text").val(n.replace(/\, $/g,""))}else{j.$elementFilestyle.find(":text").val("")}if(j.options.input==false){if(j.$elementFilestyle.find(".quant-files-filestyle").length==0){j.$elementFilestyle.find("label").append(' <span class="quant-files-filestyle badge badge-important">'+d.length+"</span>")}else{if(d.length==0){j.$elementFilestyle.find(".quant-files-filestyle").remove()}else{j.$elementFilestyle.find(".quant-files-filestyle").html(d.length)}}}else{j.$elementFilestyle.find(".quant-files-filestyle").remove()}});if(window.navigator.userAgent.search(/firefox/i)>-1){this.$elementFilestyle.find("label").click(function(){j.$element.click();return false})}}};var a=c.fn.filestyle;c.fn.filestyle=function(e,d){var f="",g=this.each(function(){if(c(this).attr("type")==="file"){var j=c(this),h=j.data("filestyle"),i=c.extend({},c.fn.filestyle.defaults,e,typeof e==="object"&&e);if(!h){j.data("filestyle",(h=new b(this,i)));h.constructor()}if(typeof e==="string"){f=h[e](d)}}});if(typeof f!==undefined){return f}else{return g}};c.fn.filestyle.defaults={buttonText:"Choose file",input:true,icon:true,buttonBefore:false,disabled:false,containerClass:"form-group",classButtonContainerClass:"",classButton:"btn btn-default",classInputContainerClass:"",classInput:"form-control",classIcon:"icon-folder-open"};c.fn.filestyle.noConflict=function(){c.fn.filestyle=a;return this};c(function(){c(".filestyle").each(function(){var e=c(this),d={buttonText:e.attr("data-buttonText"),input:e.attr("data-input")==="false"?false:true,icon:e.attr("data-icon")==="false"?false:true,classButton:e.attr("data-classButton"),classInput:e.attr("data-classInput"),classIcon:e.attr("data-classIcon"),disabled:e.attr("data-disabled")==="true"?true:false};e.filestyle(d)})})})(window.jQuery);
\ No newline at end of file
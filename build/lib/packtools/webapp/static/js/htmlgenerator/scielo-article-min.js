@@ -0,0 +1,6 @@
+if(function(t,e){"object"==typeof module&&"object"==typeof module.exports?module.exports=t.document?e(t,!0):function(t){if(!t.document)throw new Error("jQuery requires a window with a document");return e(t)}:e(t)}("undefined"!=typeof window?window:this,function(f,t){var d=[],u=d.slice,m=d.concat,a=d.push,o=d.indexOf,n={},e=n.toString,g=n.hasOwnProperty,i="".trim,y={},r="1.11.0",_=function(t,e){return new _.fn.init(t,e)},s=/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,l=/^-ms-/,c=/-([\da-z])/gi,h=function(t,e){return e.toUpperCase()};function p(t){var e=t.length,n=_.type(t);return"function"!==n&&!_.isWindow(t)&&(!(1!==t.nodeType||!e)||("array"===n||0===e||"number"==typeof e&&0<e&&e-1 in t))}_.fn=_.prototype={jquery:r,constructor:_,selector:"",length:0,toArray:function(){return u.call(this)},get:function(t){return null!=t?t<0?this[t+this.length]:this[t]:u.call(this)},pushStack:function(t){var e=_.merge(this.constructor(),t);return e.prevObject=this,e.context=this.context,e},each:function(t,e){return _.each(this,t,e)},map:function(n){return this.pushStack(_.map(this,function(t,e){return n.call(t,e,t)}))},slice:function(){return this.pushStack(u.apply(this,arguments))},first:function(){return this.eq(0)},last:function(){return this.eq(-1)},eq:function(t){var e=this.length,n=+t+(t<0?e:0);return this.pushStack(0<=n&&n<e?[this[n]]:[])},end:function(){return this.prevObject||this.constructor(null)},push:a,sort:d.sort,splice:d.splice},_.extend=_.fn.extend=function(){var t,e,n,i,o,r,s=arguments[0]||{},a=1,l=arguments.length,c=!1;for("boolean"==typeof s&&(c=s,s=arguments[a]||{},a++),"object"==typeof s||_.isFunction(s)||(s={}),a===l&&(s=this,a--);a<l;a++)if(null!=(o=arguments[a]))for(i in o)t=s[i],s!==(n=o[i])&&(c&&n&&(_.isPlainObject(n)||(e=_.isArray(n)))?(r=e?(e=!1,t&&_.isArray(t)?t:[]):t&&_.isPlainObject(t)?t:{},s[i]=_.extend(c,r,n)):void 0!==n&&(s[i]=n));return s},_.extend({expando:"jQuery"+(r+Math.random()).replace(/\D/g,""),isReady:!0,error:function(t){throw new Error(t)},noop:function(){},isFunction:function(t){return"function"===_.type(t)},isArray:Array.isArray||function(t){return"array"===_.type(t)},isWindow:function(t){return null!=t&&t==t.window},isNumeric:function(t){return 0<=t-parseFloat(t)},isEmptyObject:function(t){var e;for(e in t)return!1;return!0},isPlainObject:function(t){var e;if(!t||"object"!==_.type(t)||t.nodeType||_.isWindow(t))return!1;try{if(t.constructor&&!g.call(t,"constructor")&&!g.call(t.constructor.prototype,"isPrototypeOf"))return!1}catch(t){return!1}if(y.ownLast)for(e in t)return g.call(t,e);for(e in t);return void 0===e||g.call(t,e)},type:function(t){return null==t?t+"":"object"==typeof t||"function"==typeof t?n[e.call(t)]||"object":typeof t},globalEval:function(t){t&&_.trim(t)&&(f.execScript||function(t){f.eval.call(f,t)})(t)},camelCase:function(t){return t.replace(l,"ms-").replace(c,h)},nodeName:function(t,e){return t.nodeName&&t.nodeName.toLowerCase()===e.toLowerCase()},each:function(t,e,n){var i=0,o=t.length,r=p(t);if(n){if(r)for(;i<o&&!1!==e.apply(t[i],n);i++);else for(i in t)if(!1===e.apply(t[i],n))break}else if(r)for(;i<o&&!1!==e.call(t[i],i,t[i]);i++);else for(i in t)if(!1===e.call(t[i],i,t[i]))break;return t},trim:i&&!i.call("\ufeffÂ ")?function(t){return null==t?"":i.call(t)}:function(t){return null==t?"":(t+"").replace(s,"")},makeArray:function(t,e){var n=e||[];return null!=t&&(p(Object(t))?_.merge(n,"string"==typeof t?[t]:t):a.call(n,t)),n},inArray:function(t,e,n){var i;if(e){if(o)return o.call(e,t,n);for(i=e.length,n=n?n<0?Math.max(0,i+n):n:0;n<i;n++)if(n in e&&e[n]===t)return n}return-1},merge:function(t,e){for(var n=+e.length,i=0,o=t.length;i<n;)t[o++]=e[i++];if(n!=n)for(;void 0!==e[i];)t[o++]=e[i++];return t.length=o,t},grep:function(t,e,n){for(var i=[],o=0,r=t.length,s=!n;o<r;o++)!e(t[o],o)!==s&&i.push(t[o]);return i},map:function(t,e,n){var i,o=0,r=t.length,s=[];if(p(t))for(;o<r;o++)null!=(i=e(t[o],o,n))&&s.push(i);else for(o in t)null!=(i=e(t[o],o,n))&&s.push(i);return m.apply([],s)},guid:1,proxy:function(t,e){var n,i,o;return"string"==typeof e&&(o=t[e],e=t,t=o),_.isFunction(t)?(n=u.call(arguments,2),(i=function(){return t.apply(e||this,n.concat(u.call(arguments)))}).guid=t.guid=t.guid||_.guid++,i):void 0},now:function(){return+new Date},support:y}),_.each("Boolean Number String Function Array Date RegExp Object Error".split(" "),function(t,e){n["[object "+e+"]"]=e.toLowerCase()});var v=function(n){var t,f,w,r,i,m,x,c,u,g,k,o,y,v,s,a,b,_="sizzle"+-new Date,C=n.document,T=0,d=0,l=nt(),h=nt(),p=nt(),S=function(t,e){return t===e&&(u=!0),0},D="undefined",E={}.hasOwnProperty,e=[],$=e.pop,L=e.push,M=e.push,O=e.slice,A=e.indexOf||function(t){for(var e=0,n=this.length;e<n;e++)if(this[e]===t)return e;return-1},j="checked|selected|async|autofocus|autoplay|controls|defer|disabled|hidden|ismap|loop|multiple|open|readonly|required|scoped",F="[\\x20\\t\\r\\n\\f]",N="(?:\\\\.|[\\w-]|[^\\x00-\\xa0])+",P=N.replace("w","w#"),I="\\["+F+"*("+N+")"+F+"*(?:([*^$|!~]?=)"+F+"*(?:(['\"])((?:\\\\.|[^\\\\])*?)\\3|("+P+")|)|)"+F+"*\\]",H=":("+N+")(?:\\(((['\"])((?:\\\\.|[^\\\\])*?)\\3|((?:\\\\.|[^\\\\()[\\]]|"+I.replace(3,8)+")*)|.*)\\)|)",Y=new RegExp("^"+F+"+|((?:^|[^\\\\])(?:\\\\.)*)"+F+"+$","g"),q=new RegExp("^"+F+"*,"+F+"*"),R=new RegExp("^"+F+"*([>+~]|"+F+")"+F+"*"),W=new RegExp("="+F+"*([^\\]'\"]*?)"+F+"*\\]","g"),B=new RegExp(H),G=new RegExp("^"+P+"$"),U={ID:new RegExp("^#("+N+")"),CLASS:new RegExp("^\\.("+N+")"),TAG:new RegExp("^("+N.replace("w","w*")+")"),ATTR:new RegExp("^"+I),PSEUDO:new RegExp("^"+H),CHILD:new RegExp("^:(only|first|last|nth|nth-last)-(child|of-type)(?:\\("+F+"*(even|odd|(([+-]|)(\\d*)n|)"+F+"*(?:([+-]|)"+F+"*(\\d+)|))"+F+"*\\)|)","i"),bool:new RegExp("^(?:"+j+")$","i"),needsContext:new RegExp("^"+F+"*[>+~]|:(even|odd|eq|gt|lt|nth|first|last)(?:\\("+F+"*((?:-\\d)?\\d*)"+F+"*\\)|)(?=[^-]|$)","i")},z=/^(?:input|select|textarea|button)$/i,V=/^h\d$/i,Z=/^[^{]+\{\s*\[native \w/,X=/^(?:#([\w-]+)|(\w+)|\.([\w-]+))$/,Q=/[+~]/,J=/'|\\/g,K=new RegExp("\\\\([\\da-f]{1,6}"+F+"?|("+F+")|.)","ig"),tt=function(t,e,n){var i="0x"+e-65536;return i!=i||n?e:i<0?String.fromCharCode(i+65536):String.fromCharCode(i>>10|55296,1023&i|56320)};try{M.apply(e=O.call(C.childNodes),C.childNodes),e[C.childNodes.length].nodeType}catch(t){M={apply:e.length?function(t,e){L.apply(t,O.call(e))}:function(t,e){for(var n=t.length,i=0;t[n++]=e[i++];);t.length=n-1}}}function et(t,e,n,i){var o,r,s,a,l,c,u,d,h,p;if((e?e.ownerDocument||e:C)!==k&&g(e),n=n||[],!t||"string"!=typeof t)return n;if(1!==(a=(e=e||k).nodeType)&&9!==a)return[];if(y&&!i){if(o=X.exec(t))if(s=o[1]){if(9===a){if(!(r=e.getElementById(s))||!r.parentNode)return n;if(r.id===s)return n.push(r),n}else if(e.ownerDocument&&(r=e.ownerDocument.getElementById(s))&&b(e,r)&&r.id===s)return n.push(r),n}else{if(o[2])return M.apply(n,e.getElementsByTagName(t)),n;if((s=o[3])&&f.getElementsByClassName&&e.getElementsByClassName)return M.apply(n,e.getElementsByClassName(s)),n}if(f.qsa&&(!v||!v.test(t))){if(d=u=_,h=e,p=9===a&&t,1===a&&"object"!==e.nodeName.toLowerCase()){for(c=ht(t),(u=e.getAttribute("id"))?d=u.replace(J,"\\$&"):e.setAttribute("id",d),d="[id='"+d+"'] ",l=c.length;l--;)c[l]=d+pt(c[l]);h=Q.test(t)&&ut(e.parentNode)||e,p=c.join(",")}if(p)try{return M.apply(n,h.querySelectorAll(p)),n}catch(t){}finally{u||e.removeAttribute("id")}}}return function(t,e,n,i){var o,r,s,a,l,c=ht(t);if(!i&&1===c.length){if(2<(r=c[0]=c[0].slice(0)).length&&"ID"===(s=r[0]).type&&f.getById&&9===e.nodeType&&y&&w.relative[r[1].type]){if(!(e=(w.find.ID(s.matches[0].replace(K,tt),e)||[])[0]))return n;t=t.slice(r.shift().value.length)}for(o=U.needsContext.test(t)?0:r.length;o--&&(s=r[o],!w.relative[a=s.type]);)if((l=w.find[a])&&(i=l(s.matches[0].replace(K,tt),Q.test(r[0].type)&&ut(e.parentNode)||e))){if(r.splice(o,1),!(t=i.length&&pt(r)))return M.apply(n,i),n;break}}return m(t,c)(i,e,!y,n,Q.test(t)&&ut(e.parentNode)||e),n}(t.replace(Y,"$1"),e,n,i)}function nt(){var i=[];return function t(e,n){return i.push(e+" ")>w.cacheLength&&delete t[i.shift()],t[e+" "]=n}}function it(t){return t[_]=!0,t}function ot(t){var e=k.createElement("div");try{return!!t(e)}catch(t){return!1}finally{e.parentNode&&e.parentNode.removeChild(e),e=null}}function rt(t,e){for(var n=t.split("|"),i=t.length;i--;)w.attrHandle[n[i]]=e}function st(t,e){var n=e&&t,i=n&&1===t.nodeType&&1===e.nodeType&&(~e.sourceIndex||1<<31)-(~t.sourceIndex||1<<31);if(i)return i;if(n)for(;n=n.nextSibling;)if(n===e)return-1;return t?1:-1}function at(e){return function(t){return"input"===t.nodeName.toLowerCase()&&t.type===e}}function lt(n){return function(t){var e=t.nodeName.toLowerCase();return("input"===e||"button"===e)&&t.type===n}}function ct(s){return it(function(r){return r=+r,it(function(t,e){for(var n,i=s([],t.length,r),o=i.length;o--;)t[n=i[o]]&&(t[n]=!(e[n]=t[n]))})})}function ut(t){return t&&typeof t.getElementsByTagName!==D&&t}for(t in f=et.support={},i=et.isXML=function(t){var e=t&&(t.ownerDocument||t).documentElement;return!!e&&"HTML"!==e.nodeName},g=et.setDocument=function(t){var e,l=t?t.ownerDocument||t:C,n=l.defaultView;return l!==k&&9===l.nodeType&&l.documentElement?(o=(k=l).documentElement,y=!i(l),n&&n!==n.top&&(n.addEventListener?n.addEventListener("unload",function(){g()},!1):n.attachEvent&&n.attachEvent("onunload",function(){g()})),f.attributes=ot(function(t){return t.className="i",!t.getAttribute("className")}),f.getElementsByTagName=ot(function(t){return t.appendChild(l.createComment("")),!t.getElementsByTagName("*").length}),f.getElementsByClassName=Z.test(l.getElementsByClassName)&&ot(function(t){return t.innerHTML="<div class='a'></div><div class='a i'></div>",t.firstChild.className="i",2===t.getElementsByClassName("i").length}),f.getById=ot(function(t){return o.appendChild(t).id=_,!l.getElementsByName||!l.getElementsByName(_).length}),f.getById?(w.find.ID=function(t,e){if(typeof e.getElementById!==D&&y){var n=e.getElementById(t);return n&&n.parentNode?[n]:[]}},w.filter.ID=function(t){var e=t.replace(K,tt);return function(t){return t.getAttribute("id")===e}}):(delete w.find.ID,w.filter.ID=function(t){var n=t.replace(K,tt);return function(t){var e=typeof t.getAttributeNode!==D&&t.getAttributeNode("id");return e&&e.value===n}}),w.find.TAG=f.getElementsByTagName?function(t,e){return typeof e.getElementsByTagName!==D?e.getElementsByTagName(t):void 0}:function(t,e){var n,i=[],o=0,r=e.getElementsByTagName(t);if("*"!==t)return r;for(;n=r[o++];)1===n.nodeType&&i.push(n);return i},w.find.CLASS=f.getElementsByClassName&&function(t,e){return typeof e.getElementsByClassName!==D&&y?e.getElementsByClassName(t):void 0},s=[],v=[],(f.qsa=Z.test(l.querySelectorAll))&&(ot(function(t){t.innerHTML="<select t=''><option selected=''></option></select>",t.querySelectorAll("[t^='']").length&&v.push("[*^$]="+F+"*(?:''|\"\")"),t.querySelectorAll("[selected]").length||v.push("\\["+F+"*(?:value|"+j+")"),t.querySelectorAll(":checked").length||v.push(":checked")}),ot(function(t){var e=l.createElement("input");e.setAttribute("type","hidden"),t.appendChild(e).setAttribute("name","D"),t.querySelectorAll("[name=d]").length&&v.push("name"+F+"*[*^$|!~]?="),t.querySelectorAll(":enabled").length||v.push(":enabled",":disabled"),t.querySelectorAll("*,:x"),v.push(",.*:")})),(f.matchesSelector=Z.test(a=o.webkitMatchesSelector||o.mozMatchesSelector||o.oMatchesSelector||o.msMatchesSelector))&&ot(function(t){f.disconnectedMatch=a.call(t,"div"),a.call(t,"[s!='']:x"),s.push("!=",H)}),v=v.length&&new RegExp(v.join("|")),s=s.length&&new RegExp(s.join("|")),e=Z.test(o.compareDocumentPosition),b=e||Z.test(o.contains)?function(t,e){var n=9===t.nodeType?t.documentElement:t,i=e&&e.parentNode;return t===i||!(!i||1!==i.nodeType||!(n.contains?n.contains(i):t.compareDocumentPosition&&16&t.compareDocumentPosition(i)))}:function(t,e){if(e)for(;e=e.parentNode;)if(e===t)return!0;return!1},S=e?function(t,e){if(t===e)return u=!0,0;var n=!t.compareDocumentPosition-!e.compareDocumentPosition;return n||(1&(n=(t.ownerDocument||t)===(e.ownerDocument||e)?t.compareDocumentPosition(e):1)||!f.sortDetached&&e.compareDocumentPosition(t)===n?t===l||t.ownerDocument===C&&b(C,t)?-1:e===l||e.ownerDocument===C&&b(C,e)?1:c?A.call(c,t)-A.call(c,e):0:4&n?-1:1)}:function(t,e){if(t===e)return u=!0,0;var n,i=0,o=t.parentNode,r=e.parentNode,s=[t],a=[e];if(!o||!r)return t===l?-1:e===l?1:o?-1:r?1:c?A.call(c,t)-A.call(c,e):0;if(o===r)return st(t,e);for(n=t;n=n.parentNode;)s.unshift(n);for(n=e;n=n.parentNode;)a.unshift(n);for(;s[i]===a[i];)i++;return i?st(s[i],a[i]):s[i]===C?-1:a[i]===C?1:0},l):k},et.matches=function(t,e){return et(t,null,null,e)},et.matchesSelector=function(t,e){if((t.ownerDocument||t)!==k&&g(t),e=e.replace(W,"='$1']"),!(!f.matchesSelector||!y||s&&s.test(e)||v&&v.test(e)))try{var n=a.call(t,e);if(n||f.disconnectedMatch||t.document&&11!==t.document.nodeType)return n}catch(t){}return 0<et(e,k,null,[t]).length},et.contains=function(t,e){return(t.ownerDocument||t)!==k&&g(t),b(t,e)},et.attr=function(t,e){(t.ownerDocument||t)!==k&&g(t);var n=w.attrHandle[e.toLowerCase()],i=n&&E.call(w.attrHandle,e.toLowerCase())?n(t,e,!y):void 0;return void 0!==i?i:f.attributes||!y?t.getAttribute(e):(i=t.getAttributeNode(e))&&i.specified?i.value:null},et.error=function(t){throw new Error("Syntax error, unrecognized expression: "+t)},et.uniqueSort=function(t){var e,n=[],i=0,o=0;if(u=!f.detectDuplicates,c=!f.sortStable&&t.slice(0),t.sort(S),u){for(;e=t[o++];)e===t[o]&&(i=n.push(o));for(;i--;)t.splice(n[i],1)}return c=null,t},r=et.getText=function(t){var e,n="",i=0,o=t.nodeType;if(o){if(1===o||9===o||11===o){if("string"==typeof t.textContent)return t.textContent;for(t=t.firstChild;t;t=t.nextSibling)n+=r(t)}else if(3===o||4===o)return t.nodeValue}else for(;e=t[i++];)n+=r(e);return n},(w=et.selectors={cacheLength:50,createPseudo:it,match:U,attrHandle:{},find:{},relative:{">":{dir:"parentNode",first:!0}," ":{dir:"parentNode"},"+":{dir:"previousSibling",first:!0},"~":{dir:"previousSibling"}},preFilter:{ATTR:function(t){return t[1]=t[1].replace(K,tt),t[3]=(t[4]||t[5]||"").replace(K,tt),"~="===t[2]&&(t[3]=" "+t[3]+" "),t.slice(0,4)},CHILD:function(t){return t[1]=t[1].toLowerCase(),"nth"===t[1].slice(0,3)?(t[3]||et.error(t[0]),t[4]=+(t[4]?t[5]+(t[6]||1):2*("even"===t[3]||"odd"===t[3])),t[5]=+(t[7]+t[8]||"odd"===t[3])):t[3]&&et.error(t[0]),t},PSEUDO:function(t){var e,n=!t[5]&&t[2];return U.CHILD.test(t[0])?null:(t[3]&&void 0!==t[4]?t[2]=t[4]:n&&B.test(n)&&(e=ht(n,!0))&&(e=n.indexOf(")",n.length-e)-n.length)&&(t[0]=t[0].slice(0,e),t[2]=n.slice(0,e)),t.slice(0,3))}},filter:{TAG:function(t){var e=t.replace(K,tt).toLowerCase();return"*"===t?function(){return!0}:function(t){return t.nodeName&&t.nodeName.toLowerCase()===e}},CLASS:function(t){var e=l[t+" "];return e||(e=new RegExp("(^|"+F+")"+t+"("+F+"|$)"))&&l(t,function(t){return e.test("string"==typeof t.className&&t.className||typeof t.getAttribute!==D&&t.getAttribute("class")||"")})},ATTR:function(n,i,o){return function(t){var e=et.attr(t,n);return null==e?"!="===i:!i||(e+="","="===i?e===o:"!="===i?e!==o:"^="===i?o&&0===e.indexOf(o):"*="===i?o&&-1<e.indexOf(o):"$="===i?o&&e.slice(-o.length)===o:"~="===i?-1<(" "+e+" ").indexOf(o):"|="===i&&(e===o||e.slice(0,o.length+1)===o+"-"))}},CHILD:function(p,t,e,f,m){var g="nth"!==p.slice(0,3),y="last"!==p.slice(-4),v="of-type"===t;return 1===f&&0===m?function(t){return!!t.parentNode}:function(t,e,n){var i,o,r,s,a,l,c=g!==y?"nextSibling":"previousSibling",u=t.parentNode,d=v&&t.nodeName.toLowerCase(),h=!n&&!v;if(u){if(g){for(;c;){for(r=t;r=r[c];)if(v?r.nodeName.toLowerCase()===d:1===r.nodeType)return!1;l=c="only"===p&&!l&&"nextSibling"}return!0}if(l=[y?u.firstChild:u.lastChild],y&&h){for(a=(i=(o=u[_]||(u[_]={}))[p]||[])[0]===T&&i[1],s=i[0]===T&&i[2],r=a&&u.childNodes[a];r=++a&&r&&r[c]||(s=a=0)||l.pop();)if(1===r.nodeType&&++s&&r===t){o[p]=[T,a,s];break}}else if(h&&(i=(t[_]||(t[_]={}))[p])&&i[0]===T)s=i[1];else for(;(r=++a&&r&&r[c]||(s=a=0)||l.pop())&&((v?r.nodeName.toLowerCase()!==d:1!==r.nodeType)||!++s||(h&&((r[_]||(r[_]={}))[p]=[T,s]),r!==t)););return(s-=m)===f||s%f==0&&0<=s/f}}},PSEUDO:function(t,r){var e,s=w.pseudos[t]||w.setFilters[t.toLowerCase()]||et.error("unsupported pseudo: "+t);return s[_]?s(r):1<s.length?(e=[t,t,"",r],w.setFilters.hasOwnProperty(t.toLowerCase())?it(function(t,e){for(var n,i=s(t,r),o=i.length;o--;)t[n=A.call(t,i[o])]=!(e[n]=i[o])}):function(t){return s(t,0,e)}):s}},pseudos:{not:it(function(t){var i=[],o=[],a=m(t.replace(Y,"$1"));return a[_]?it(function(t,e,n,i){for(var o,r=a(t,null,i,[]),s=t.length;s--;)(o=r[s])&&(t[s]=!(e[s]=o))}):function(t,e,n){return i[0]=t,a(i,null,n,o),!o.pop()}}),has:it(function(e){return function(t){return 0<et(e,t).length}}),contains:it(function(e){return function(t){return-1<(t.textContent||t.innerText||r(t)).indexOf(e)}}),lang:it(function(n){return G.test(n||"")||et.error("unsupported lang: "+n),n=n.replace(K,tt).toLowerCase(),function(t){var e;do{if(e=y?t.lang:t.getAttribute("xml:lang")||t.getAttribute("lang"))return(e=e.toLowerCase())===n||0===e.indexOf(n+"-")}while((t=t.parentNode)&&1===t.nodeType);return!1}}),target:function(t){var e=n.location&&n.location.hash;return e&&e.slice(1)===t.id},root:function(t){return t===o},focus:function(t){return t===k.activeElement&&(!k.hasFocus||k.hasFocus())&&!!(t.type||t.href||~t.tabIndex)},enabled:function(t){return!1===t.disabled},disabled:function(t){return!0===t.disabled},checked:function(t){var e=t.nodeName.toLowerCase();return"input"===e&&!!t.checked||"option"===e&&!!t.selected},selected:function(t){return t.parentNode&&t.parentNode.selectedIndex,!0===t.selected},empty:function(t){for(t=t.firstChild;t;t=t.nextSibling)if(t.nodeType<6)return!1;return!0},parent:function(t){return!w.pseudos.empty(t)},header:function(t){return V.test(t.nodeName)},input:function(t){return z.test(t.nodeName)},button:function(t){var e=t.nodeName.toLowerCase();return"input"===e&&"button"===t.type||"button"===e},text:function(t){var e;return"input"===t.nodeName.toLowerCase()&&"text"===t.type&&(null==(e=t.getAttribute("type"))||"text"===e.toLowerCase())},first:ct(function(){return[0]}),last:ct(function(t,e){return[e-1]}),eq:ct(function(t,e,n){return[n<0?n+e:n]}),even:ct(function(t,e){for(var n=0;n<e;n+=2)t.push(n);return t}),odd:ct(function(t,e){for(var n=1;n<e;n+=2)t.push(n);return t}),lt:ct(function(t,e,n){for(var i=n<0?n+e:n;0<=--i;)t.push(i);return t}),gt:ct(function(t,e,n){for(var i=n<0?n+e:n;++i<e;)t.push(i);return t})}}).pseudos.nth=w.pseudos.eq,{radio:!0,checkbox:!0,file:!0,password:!0,image:!0})w.pseudos[t]=at(t);for(t in{submit:!0,reset:!0})w.pseudos[t]=lt(t);function dt(){}function ht(t,e){var n,i,o,r,s,a,l,c=h[t+" "];if(c)return e?0:c.slice(0);for(s=t,a=[],l=w.preFilter;s;){for(r in(!n||(i=q.exec(s)))&&(i&&(s=s.slice(i[0].length)||s),a.push(o=[])),n=!1,(i=R.exec(s))&&(n=i.shift(),o.push({value:n,type:i[0].replace(Y," ")}),s=s.slice(n.length)),w.filter)!(i=U[r].exec(s))||l[r]&&!(i=l[r](i))||(n=i.shift(),o.push({value:n,type:r,matches:i}),s=s.slice(n.length));if(!n)break}return e?s.length:s?et.error(t):h(t,a).slice(0)}function pt(t){for(var e=0,n=t.length,i="";e<n;e++)i+=t[e].value;return i}function ft(s,t,e){var a=t.dir,l=e&&"parentNode"===a,c=d++;return t.first?function(t,e,n){for(;t=t[a];)if(1===t.nodeType||l)return s(t,e,n)}:function(t,e,n){var i,o,r=[T,c];if(n){for(;t=t[a];)if((1===t.nodeType||l)&&s(t,e,n))return!0}else for(;t=t[a];)if(1===t.nodeType||l){if((i=(o=t[_]||(t[_]={}))[a])&&i[0]===T&&i[1]===c)return r[2]=i[2];if((o[a]=r)[2]=s(t,e,n))return!0}}}function mt(o){return 1<o.length?function(t,e,n){for(var i=o.length;i--;)if(!o[i](t,e,n))return!1;return!0}:o[0]}function gt(t,e,n,i,o){for(var r,s=[],a=0,l=t.length,c=null!=e;a<l;a++)(r=t[a])&&(!n||n(r,i,o))&&(s.push(r),c&&e.push(a));return s}function yt(p,f,m,g,y,t){return g&&!g[_]&&(g=yt(g)),y&&!y[_]&&(y=yt(y,t)),it(function(t,e,n,i){var o,r,s,a=[],l=[],c=e.length,u=t||function(t,e,n){for(var i=0,o=e.length;i<o;i++)et(t,e[i],n);return n}(f||"*",n.nodeType?[n]:n,[]),d=!p||!t&&f?u:gt(u,a,p,n,i),h=m?y||(t?p:c||g)?[]:e:d;if(m&&m(d,h,n,i),g)for(o=gt(h,l),g(o,[],n,i),r=o.length;r--;)(s=o[r])&&(h[l[r]]=!(d[l[r]]=s));if(t){if(y||p){if(y){for(o=[],r=h.length;r--;)(s=h[r])&&o.push(d[r]=s);y(null,h=[],o,i)}for(r=h.length;r--;)(s=h[r])&&-1<(o=y?A.call(t,s):a[r])&&(t[o]=!(e[o]=s))}}else h=gt(h===e?h.splice(c,h.length):h),y?y(null,e,h,i):M.apply(e,h)})}function vt(t){for(var i,e,n,o=t.length,r=w.relative[t[0].type],s=r||w.relative[" "],a=r?1:0,l=ft(function(t){return t===i},s,!0),c=ft(function(t){return-1<A.call(i,t)},s,!0),u=[function(t,e,n){return!r&&(n||e!==x)||((i=e).nodeType?l(t,e,n):c(t,e,n))}];a<o;a++)if(e=w.relative[t[a].type])u=[ft(mt(u),e)];else{if((e=w.filter[t[a].type].apply(null,t[a].matches))[_]){for(n=++a;n<o&&!w.relative[t[n].type];n++);return yt(1<a&&mt(u),1<a&&pt(t.slice(0,a-1).concat({value:" "===t[a-2].type?"*":""})).replace(Y,"$1"),e,a<n&&vt(t.slice(a,n)),n<o&&vt(t=t.slice(n)),n<o&&pt(t))}u.push(e)}return mt(u)}return dt.prototype=w.filters=w.pseudos,w.setFilters=new dt,m=et.compile=function(t,e){var n,g,y,v,b,i,o=[],r=[],s=p[t+" "];if(!s){for(e||(e=ht(t)),n=e.length;n--;)(s=vt(e[n]))[_]?o.push(s):r.push(s);s=p(t,(g=r,v=0<(y=o).length,b=0<g.length,i=function(t,e,n,i,o){var r,s,a,l=0,c="0",u=t&&[],d=[],h=x,p=t||b&&w.find.TAG("*",o),f=T+=null==h?1:Math.random()||.1,m=p.length;for(o&&(x=e!==k&&e);c!==m&&null!=(r=p[c]);c++){if(b&&r){for(s=0;a=g[s++];)if(a(r,e,n)){i.push(r);break}o&&(T=f)}v&&((r=!a&&r)&&l--,t&&u.push(r))}if(l+=c,v&&c!==l){for(s=0;a=y[s++];)a(u,d,e,n);if(t){if(0<l)for(;c--;)u[c]||d[c]||(d[c]=$.call(i));d=gt(d)}M.apply(i,d),o&&!t&&0<d.length&&1<l+y.length&&et.uniqueSort(i)}return o&&(T=f,x=h),u},v?it(i):i))}return s},f.sortStable=_.split("").sort(S).join("")===_,f.detectDuplicates=!!u,g(),f.sortDetached=ot(function(t){return 1&t.compareDocumentPosition(k.createElement("div"))}),ot(function(t){return t.innerHTML="<a href='#'></a>","#"===t.firstChild.getAttribute("href")})||rt("type|href|height|width",function(t,e,n){return n?void 0:t.getAttribute(e,"type"===e.toLowerCase()?1:2)}),f.attributes&&ot(function(t){return t.innerHTML="<input/>",t.firstChild.setAttribute("value",""),""===t.firstChild.getAttribute("value")})||rt("value",function(t,e,n){return n||"input"!==t.nodeName.toLowerCase()?void 0:t.defaultValue}),ot(function(t){return null==t.getAttribute("disabled")})||rt(j,function(t,e,n){var i;return n?void 0:!0===t[e]?e.toLowerCase():(i=t.getAttributeNode(e))&&i.specified?i.value:null}),et}(f);_.find=v,_.expr=v.selectors,_.expr[":"]=_.expr.pseudos,_.unique=v.uniqueSort,_.text=v.getText,_.isXMLDoc=v.isXML,_.contains=v.contains;var b=_.expr.match.needsContext,w=/^<(\w+)\s*\/?>(?:<\/\1>|)$/,x=/^.[^:#\[\.,]*$/;function k(t,n,i){if(_.isFunction(n))return _.grep(t,function(t,e){return!!n.call(t,e,t)!==i});if(n.nodeType)return _.grep(t,function(t){return t===n!==i});if("string"==typeof n){if(x.test(n))return _.filter(n,t,i);n=_.filter(n,t)}return _.grep(t,function(t){return 0<=_.inArray(t,n)!==i})}_.filter=function(t,e,n){var i=e[0];return n&&(t=":not("+t+")"),1===e.length&&1===i.nodeType?_.find.matchesSelector(i,t)?[i]:[]:_.find.matches(t,_.grep(e,function(t){return 1===t.nodeType}))},_.fn.extend({find:function(t){var e,n=[],i=this,o=i.length;if("string"!=typeof t)return this.pushStack(_(t).filter(function(){for(e=0;e<o;e++)if(_.contains(i[e],this))return!0}));for(e=0;e<o;e++)_.find(t,i[e],n);return(n=this.pushStack(1<o?_.unique(n):n)).selector=this.selector?this.selector+" "+t:t,n},filter:function(t){return this.pushStack(k(this,t||[],!1))},not:function(t){return this.pushStack(k(this,t||[],!0))},is:function(t){return!!k(this,"string"==typeof t&&b.test(t)?_(t):t||[],!1).length}});var C,T=f.document,S=/^(?:\s*(<[\w\W]+>)[^>]*|#([\w-]*))$/;(_.fn.init=function(t,e){var n,i;if(!t)return this;if("string"!=typeof t)return t.nodeType?(this.context=this[0]=t,this.length=1,this):_.isFunction(t)?void 0!==C.ready?C.ready(t):t(_):(void 0!==t.selector&&(this.selector=t.selector,this.context=t.context),_.makeArray(t,this));if(!(n="<"===t.charAt(0)&&">"===t.charAt(t.length-1)&&3<=t.length?[null,t,null]:S.exec(t))||!n[1]&&e)return!e||e.jquery?(e||C).find(t):this.constructor(e).find(t);if(n[1]){if(e=e instanceof _?e[0]:e,_.merge(this,_.parseHTML(n[1],e&&e.nodeType?e.ownerDocument||e:T,!0)),w.test(n[1])&&_.isPlainObject(e))for(n in e)_.isFunction(this[n])?this[n](e[n]):this.attr(n,e[n]);return this}if((i=T.getElementById(n[2]))&&i.parentNode){if(i.id!==n[2])return C.find(t);this.length=1,this[0]=i}return this.context=T,this.selector=t,this}).prototype=_.fn,C=_(T);var D=/^(?:parents|prev(?:Until|All))/,E={children:!0,contents:!0,next:!0,prev:!0};function $(t,e){for(;(t=t[e])&&1!==t.nodeType;);return t}_.extend({dir:function(t,e,n){for(var i=[],o=t[e];o&&9!==o.nodeType&&(void 0===n||1!==o.nodeType||!_(o).is(n));)1===o.nodeType&&i.push(o),o=o[e];return i},sibling:function(t,e){for(var n=[];t;t=t.nextSibling)1===t.nodeType&&t!==e&&n.push(t);return n}}),_.fn.extend({has:function(t){var e,n=_(t,this),i=n.length;return this.filter(function(){for(e=0;e<i;e++)if(_.contains(this,n[e]))return!0})},closest:function(t,e){for(var n,i=0,o=this.length,r=[],s=b.test(t)||"string"!=typeof t?_(t,e||this.context):0;i<o;i++)for(n=this[i];n&&n!==e;n=n.parentNode)if(n.nodeType<11&&(s?-1<s.index(n):1===n.nodeType&&_.find.matchesSelector(n,t))){r.push(n);break}return this.pushStack(1<r.length?_.unique(r):r)},index:function(t){return t?"string"==typeof t?_.inArray(this[0],_(t)):_.inArray(t.jquery?t[0]:t,this):this[0]&&this[0].parentNode?this.first().prevAll().length:-1},add:function(t,e){return this.pushStack(_.unique(_.merge(this.get(),_(t,e))))},addBack:function(t){return this.add(null==t?this.prevObject:this.prevObject.filter(t))}}),_.each({parent:function(t){var e=t.parentNode;return e&&11!==e.nodeType?e:null},parents:function(t){return _.dir(t,"parentNode")},parentsUntil:function(t,e,n){return _.dir(t,"parentNode",n)},next:function(t){return $(t,"nextSibling")},prev:function(t){return $(t,"previousSibling")},nextAll:function(t){return _.dir(t,"nextSibling")},prevAll:function(t){return _.dir(t,"previousSibling")},nextUntil:function(t,e,n){return _.dir(t,"nextSibling",n)},prevUntil:function(t,e,n){return _.dir(t,"previousSibling",n)},siblings:function(t){return _.sibling((t.parentNode||{}).firstChild,t)},children:function(t){return _.sibling(t.firstChild)},contents:function(t){return _.nodeName(t,"iframe")?t.contentDocument||t.contentWindow.document:_.merge([],t.childNodes)}},function(i,o){_.fn[i]=function(t,e){var n=_.map(this,o,t);return"Until"!==i.slice(-5)&&(e=t),e&&"string"==typeof e&&(n=_.filter(e,n)),1<this.length&&(E[i]||(n=_.unique(n)),D.test(i)&&(n=n.reverse())),this.pushStack(n)}});var L,M=/\S+/g,O={};function A(){T.addEventListener?(T.removeEventListener("DOMContentLoaded",j,!1),f.removeEventListener("load",j,!1)):(T.detachEvent("onreadystatechange",j),f.detachEvent("onload",j))}function j(){(T.addEventListener||"load"===event.type||"complete"===T.readyState)&&(A(),_.ready())}_.Callbacks=function(o){var t,n;o="string"==typeof o?O[o]||(n=O[t=o]={},_.each(t.match(M)||[],function(t,e){n[e]=!0}),n):_.extend({},o);var i,e,r,s,a,l,c=[],u=!o.once&&[],d=function(t){for(e=o.memory&&t,r=!0,a=l||0,l=0,s=c.length,i=!0;c&&a<s;a++)if(!1===c[a].apply(t[0],t[1])&&o.stopOnFalse){e=!1;break}i=!1,c&&(u?u.length&&d(u.shift()):e?c=[]:h.disable())},h={add:function(){if(c){var t=c.length;!function i(t){_.each(t,function(t,e){var n=_.type(e);"function"===n?o.unique&&h.has(e)||c.push(e):e&&e.length&&"string"!==n&&i(e)})}(arguments),i?s=c.length:e&&(l=t,d(e))}return this},remove:function(){return c&&_.each(arguments,function(t,e){for(var n;-1<(n=_.inArray(e,c,n));)c.splice(n,1),i&&(n<=s&&s--,n<=a&&a--)}),this},has:function(t){return t?-1<_.inArray(t,c):!(!c||!c.length)},empty:function(){return c=[],s=0,this},disable:function(){return c=u=e=void 0,this},disabled:function(){return!c},lock:function(){return u=void 0,e||h.disable(),this},locked:function(){return!u},fireWith:function(t,e){return!c||r&&!u||(e=[t,(e=e||[]).slice?e.slice():e],i?u.push(e):d(e)),this},fire:function(){return h.fireWith(this,arguments),this},fired:function(){return!!r}};return h},_.extend({Deferred:function(t){var r=[["resolve","done",_.Callbacks("once memory"),"resolved"],["reject","fail",_.Callbacks("once memory"),"rejected"],["notify","progress",_.Callbacks("memory")]],o="pending",s={state:function(){return o},always:function(){return a.done(arguments).fail(arguments),this},then:function(){var o=arguments;return _.Deferred(function(i){_.each(r,function(t,e){var n=_.isFunction(o[t])&&o[t];a[e[1]](function(){var t=n&&n.apply(this,arguments);t&&_.isFunction(t.promise)?t.promise().done(i.resolve).fail(i.reject).progress(i.notify):i[e[0]+"With"](this===s?i.promise():this,n?[t]:arguments)})}),o=null}).promise()},promise:function(t){return null!=t?_.extend(t,s):s}},a={};return s.pipe=s.then,_.each(r,function(t,e){var n=e[2],i=e[3];s[e[1]]=n.add,i&&n.add(function(){o=i},r[1^t][2].disable,r[2][2].lock),a[e[0]]=function(){return a[e[0]+"With"](this===a?s:this,arguments),this},a[e[0]+"With"]=n.fireWith}),s.promise(a),t&&t.call(a,a),a},when:function(t){var o,e,n,i=0,r=u.call(arguments),s=r.length,a=1!==s||t&&_.isFunction(t.promise)?s:0,l=1===a?t:_.Deferred(),c=function(e,n,i){return function(t){n[e]=this,i[e]=1<arguments.length?u.call(arguments):t,i===o?l.notifyWith(n,i):--a||l.resolveWith(n,i)}};if(1<s)for(o=new Array(s),e=new Array(s),n=new Array(s);i<s;i++)r[i]&&_.isFunction(r[i].promise)?r[i].promise().done(c(i,n,r)).fail(l.reject).progress(c(i,e,o)):--a;return a||l.resolveWith(n,r),l.promise()}}),_.fn.ready=function(t){return _.ready.promise().done(t),this},_.extend({isReady:!1,readyWait:1,holdReady:function(t){t?_.readyWait++:_.ready(!0)},ready:function(t){if(!0===t?!--_.readyWait:!_.isReady){if(!T.body)return setTimeout(_.ready);(_.isReady=!0)!==t&&0<--_.readyWait||(L.resolveWith(T,[_]),_.fn.trigger&&_(T).trigger("ready").off("ready"))}}}),_.ready.promise=function(t){if(!L)if(L=_.Deferred(),"complete"===T.readyState)setTimeout(_.ready);else if(T.addEventListener)T.addEventListener("DOMContentLoaded",j,!1),f.addEventListener("load",j,!1);else{T.attachEvent("onreadystatechange",j),f.attachEvent("onload",j);var n=!1;try{n=null==f.frameElement&&T.documentElement}catch(t){}n&&n.doScroll&&function e(){if(!_.isReady){try{n.doScroll("left")}catch(t){return setTimeout(e,50)}A(),_.ready()}}()}return L.promise(t)};var F,N="undefined";for(F in _(y))break;y.ownLast="0"!==F,y.inlineBlockNeedsLayout=!1,_(function(){var t,e,n=T.getElementsByTagName("body")[0];n&&((t=T.createElement("div")).style.cssText="border:0;width:0;height:0;position:absolute;top:0;left:-9999px;margin-top:1px",e=T.createElement("div"),n.appendChild(t).appendChild(e),typeof e.style.zoom!==N&&(e.style.cssText="border:0;margin:0;width:1px;padding:1px;display:inline;zoom:1",(y.inlineBlockNeedsLayout=3===e.offsetWidth)&&(n.style.zoom=1)),n.removeChild(t),t=e=null)}),function(){var t=T.createElement("div");if(null==y.deleteExpando){y.deleteExpando=!0;try{delete t.test}catch(t){y.deleteExpando=!1}}t=null}(),_.acceptData=function(t){var e=_.noData[(t.nodeName+" ").toLowerCase()],n=+t.nodeType||1;return(1===n||9===n)&&(!e||!0!==e&&t.getAttribute("classid")===e)};var P=/^(?:\{[\w\W]*\}|\[[\w\W]*\])$/,I=/([A-Z])/g;function H(t,e,n){if(void 0===n&&1===t.nodeType){var i="data-"+e.replace(I,"-$1").toLowerCase();if("string"==typeof(n=t.getAttribute(i))){try{n="true"===n||"false"!==n&&("null"===n?null:+n+""===n?+n:P.test(n)?_.parseJSON(n):n)}catch(t){}_.data(t,e,n)}else n=void 0}return n}function Y(t){var e;for(e in t)if(("data"!==e||!_.isEmptyObject(t[e]))&&"toJSON"!==e)return!1;return!0}function q(t,e,n,i){if(_.acceptData(t)){var o,r,s=_.expando,a=t.nodeType,l=a?_.cache:t,c=a?t[s]:t[s]&&s;if(c&&l[c]&&(i||l[c].data)||void 0!==n||"string"!=typeof e)return c||(c=a?t[s]=d.pop()||_.guid++:s),l[c]||(l[c]=a?{}:{toJSON:_.noop}),("object"==typeof e||"function"==typeof e)&&(i?l[c]=_.extend(l[c],e):l[c].data=_.extend(l[c].data,e)),r=l[c],i||(r.data||(r.data={}),r=r.data),void 0!==n&&(r[_.camelCase(e)]=n),"string"==typeof e?null==(o=r[e])&&(o=r[_.camelCase(e)]):o=r,o}}function R(t,e,n){if(_.acceptData(t)){var i,o,r=t.nodeType,s=r?_.cache:t,a=r?t[_.expando]:_.expando;if(s[a]){if(e&&(i=n?s[a]:s[a].data)){o=(e=_.isArray(e)?e.concat(_.map(e,_.camelCase)):e in i?[e]:(e=_.camelCase(e))in i?[e]:e.split(" ")).length;for(;o--;)delete i[e[o]];if(n?!Y(i):!_.isEmptyObject(i))return}(n||(delete s[a].data,Y(s[a])))&&(r?_.cleanData([t],!0):y.deleteExpando||s!=s.window?delete s[a]:s[a]=null)}}}_.extend({cache:{},noData:{"applet ":!0,"embed ":!0,"object ":"clsid:D27CDB6E-AE6D-11cf-96B8-444553540000"},hasData:function(t){return!!(t=t.nodeType?_.cache[t[_.expando]]:t[_.expando])&&!Y(t)},data:function(t,e,n){return q(t,e,n)},removeData:function(t,e){return R(t,e)},_data:function(t,e,n){return q(t,e,n,!0)},_removeData:function(t,e){return R(t,e,!0)}}),_.fn.extend({data:function(t,e){var n,i,o,r=this[0],s=r&&r.attributes;if(void 0!==t)return"object"==typeof t?this.each(function(){_.data(this,t)}):1<arguments.length?this.each(function(){_.data(this,t,e)}):r?H(r,t,_.data(r,t)):void 0;if(this.length&&(o=_.data(r),1===r.nodeType&&!_._data(r,"parsedAttrs"))){for(n=s.length;n--;)0===(i=s[n].name).indexOf("data-")&&H(r,i=_.camelCase(i.slice(5)),o[i]);_._data(r,"parsedAttrs",!0)}return o},removeData:function(t){return this.each(function(){_.removeData(this,t)})}}),_.extend({queue:function(t,e,n){var i;return t?(e=(e||"fx")+"queue",i=_._data(t,e),n&&(!i||_.isArray(n)?i=_._data(t,e,_.makeArray(n)):i.push(n)),i||[]):void 0},dequeue:function(t,e){e=e||"fx";var n=_.queue(t,e),i=n.length,o=n.shift(),r=_._queueHooks(t,e);"inprogress"===o&&(o=n.shift(),i--),o&&("fx"===e&&n.unshift("inprogress"),delete r.stop,o.call(t,function(){_.dequeue(t,e)},r)),!i&&r&&r.empty.fire()},_queueHooks:function(t,e){var n=e+"queueHooks";return _._data(t,n)||_._data(t,n,{empty:_.Callbacks("once memory").add(function(){_._removeData(t,e+"queue"),_._removeData(t,n)})})}}),_.fn.extend({queue:function(e,n){var t=2;return"string"!=typeof e&&(n=e,e="fx",t--),arguments.length<t?_.queue(this[0],e):void 0===n?this:this.each(function(){var t=_.queue(this,e,n);_._queueHooks(this,e),"fx"===e&&"inprogress"!==t[0]&&_.dequeue(this,e)})},dequeue:function(t){return this.each(function(){_.dequeue(this,t)})},clearQueue:function(t){return this.queue(t||"fx",[])},promise:function(t,e){var n,i=1,o=_.Deferred(),r=this,s=this.length,a=function(){--i||o.resolveWith(r,[r])};for("string"!=typeof t&&(e=t,t=void 0),t=t||"fx";s--;)(n=_._data(r[s],t+"queueHooks"))&&n.empty&&(i++,n.empty.add(a));return a(),o.promise(e)}});var W=/[+-]?(?:\d*\.|)\d+(?:[eE][+-]?\d+|)/.source,B=["Top","Right","Bottom","Left"],G=function(t,e){return t=e||t,"none"===_.css(t,"display")||!_.contains(t.ownerDocument,t)},U=_.access=function(t,e,n,i,o,r,s){var a=0,l=t.length,c=null==n;if("object"===_.type(n))for(a in o=!0,n)_.access(t,e,a,n[a],!0,r,s);else if(void 0!==i&&(o=!0,_.isFunction(i)||(s=!0),c&&(e=s?(e.call(t,i),null):(c=e,function(t,e,n){return c.call(_(t),n)})),e))for(;a<l;a++)e(t[a],n,s?i:i.call(t[a],a,e(t[a],n)));return o?t:c?e.call(t):l?e(t[0],n):r},z=/^(?:checkbox|radio)$/i;!function(){var t=T.createDocumentFragment(),e=T.createElement("div"),n=T.createElement("input");if(e.setAttribute("className","t"),e.innerHTML="  <link/><table></table><a href='/a'>a</a>",y.leadingWhitespace=3===e.firstChild.nodeType,y.tbody=!e.getElementsByTagName("tbody").length,y.htmlSerialize=!!e.getElementsByTagName("link").length,y.html5Clone="<:nav></:nav>"!==T.createElement("nav").cloneNode(!0).outerHTML,n.type="checkbox",n.checked=!0,t.appendChild(n),y.appendChecked=n.checked,e.innerHTML="<textarea>x</textarea>",y.noCloneChecked=!!e.cloneNode(!0).lastChild.defaultValue,t.appendChild(e),e.innerHTML="<input type='radio' checked='checked' name='t'/>",y.checkClone=e.cloneNode(!0).cloneNode(!0).lastChild.checked,y.noCloneEvent=!0,e.attachEvent&&(e.attachEvent("onclick",function(){y.noCloneEvent=!1}),e.cloneNode(!0).click()),null==y.deleteExpando){y.deleteExpando=!0;try{delete e.test}catch(t){y.deleteExpando=!1}}t=e=n=null}(),function(){var t,e,n=T.createElement("div");for(t in{submit:!0,change:!0,focusin:!0})e="on"+t,(y[t+"Bubbles"]=e in f)||(n.setAttribute(e,"t"),y[t+"Bubbles"]=!1===n.attributes[e].expando);n=null}();var V=/^(?:input|select|textarea)$/i,Z=/^key/,X=/^(?:mouse|contextmenu)|click/,Q=/^(?:focusinfocus|focusoutblur)$/,J=/^([^.]*)(?:\.(.+)|)$/;function K(){return!0}function tt(){return!1}function et(){try{return T.activeElement}catch(t){}}function nt(t){var e=it.split("|"),n=t.createDocumentFragment();if(n.createElement)for(;e.length;)n.createElement(e.pop());return n}_.event={global:{},add:function(t,e,n,i,o){var r,s,a,l,c,u,d,h,p,f,m,g=_._data(t);if(g){for(n.handler&&(n=(l=n).handler,o=l.selector),n.guid||(n.guid=_.guid++),(s=g.events)||(s=g.events={}),(u=g.handle)||((u=g.handle=function(t){return typeof _===N||t&&_.event.triggered===t.type?void 0:_.event.dispatch.apply(u.elem,arguments)}).elem=t),a=(e=(e||"").match(M)||[""]).length;a--;)p=m=(r=J.exec(e[a])||[])[1],f=(r[2]||"").split(".").sort(),p&&(c=_.event.special[p]||{},p=(o?c.delegateType:c.bindType)||p,c=_.event.special[p]||{},d=_.extend({type:p,origType:m,data:i,handler:n,guid:n.guid,selector:o,needsContext:o&&_.expr.match.needsContext.test(o),namespace:f.join(".")},l),(h=s[p])||((h=s[p]=[]).delegateCount=0,c.setup&&!1!==c.setup.call(t,i,f,u)||(t.addEventListener?t.addEventListener(p,u,!1):t.attachEvent&&t.attachEvent("on"+p,u))),c.add&&(c.add.call(t,d),d.handler.guid||(d.handler.guid=n.guid)),o?h.splice(h.delegateCount++,0,d):h.push(d),_.event.global[p]=!0);t=null}},remove:function(t,e,n,i,o){var r,s,a,l,c,u,d,h,p,f,m,g=_.hasData(t)&&_._data(t);if(g&&(u=g.events)){for(c=(e=(e||"").match(M)||[""]).length;c--;)if(p=m=(a=J.exec(e[c])||[])[1],f=(a[2]||"").split(".").sort(),p){for(d=_.event.special[p]||{},h=u[p=(i?d.delegateType:d.bindType)||p]||[],a=a[2]&&new RegExp("(^|\\.)"+f.join("\\.(?:.*\\.|)")+"(\\.|$)"),l=r=h.length;r--;)s=h[r],!o&&m!==s.origType||n&&n.guid!==s.guid||a&&!a.test(s.namespace)||i&&i!==s.selector&&("**"!==i||!s.selector)||(h.splice(r,1),s.selector&&h.delegateCount--,d.remove&&d.remove.call(t,s));l&&!h.length&&(d.teardown&&!1!==d.teardown.call(t,f,g.handle)||_.removeEvent(t,p,g.handle),delete u[p])}else for(p in u)_.event.remove(t,p+e[c],n,i,!0);_.isEmptyObject(u)&&(delete g.handle,_._removeData(t,"events"))}},trigger:function(t,e,n,i){var o,r,s,a,l,c,u,d=[n||T],h=g.call(t,"type")?t.type:t,p=g.call(t,"namespace")?t.namespace.split("."):[];if(s=c=n=n||T,3!==n.nodeType&&8!==n.nodeType&&!Q.test(h+_.event.triggered)&&(0<=h.indexOf(".")&&(h=(p=h.split(".")).shift(),p.sort()),r=h.indexOf(":")<0&&"on"+h,(t=t[_.expando]?t:new _.Event(h,"object"==typeof t&&t)).isTrigger=i?2:3,t.namespace=p.join("."),t.namespace_re=t.namespace?new RegExp("(^|\\.)"+p.join("\\.(?:.*\\.|)")+"(\\.|$)"):null,t.result=void 0,t.target||(t.target=n),e=null==e?[t]:_.makeArray(e,[t]),l=_.event.special[h]||{},i||!l.trigger||!1!==l.trigger.apply(n,e))){if(!i&&!l.noBubble&&!_.isWindow(n)){for(a=l.delegateType||h,Q.test(a+h)||(s=s.parentNode);s;s=s.parentNode)d.push(s),c=s;c===(n.ownerDocument||T)&&d.push(c.defaultView||c.parentWindow||f)}for(u=0;(s=d[u++])&&!t.isPropagationStopped();)t.type=1<u?a:l.bindType||h,(o=(_._data(s,"events")||{})[t.type]&&_._data(s,"handle"))&&o.apply(s,e),(o=r&&s[r])&&o.apply&&_.acceptData(s)&&(t.result=o.apply(s,e),!1===t.result&&t.preventDefault());if(t.type=h,!i&&!t.isDefaultPrevented()&&(!l._default||!1===l._default.apply(d.pop(),e))&&_.acceptData(n)&&r&&n[h]&&!_.isWindow(n)){(c=n[r])&&(n[r]=null),_.event.triggered=h;try{n[h]()}catch(t){}_.event.triggered=void 0,c&&(n[r]=c)}return t.result}},dispatch:function(t){t=_.event.fix(t);var e,n,i,o,r,s=[],a=u.call(arguments),l=(_._data(this,"events")||{})[t.type]||[],c=_.event.special[t.type]||{};if((a[0]=t).delegateTarget=this,!c.preDispatch||!1!==c.preDispatch.call(this,t)){for(s=_.event.handlers.call(this,t,l),e=0;(o=s[e++])&&!t.isPropagationStopped();)for(t.currentTarget=o.elem,r=0;(i=o.handlers[r++])&&!t.isImmediatePropagationStopped();)(!t.namespace_re||t.namespace_re.test(i.namespace))&&(t.handleObj=i,t.data=i.data,void 0!==(n=((_.event.special[i.origType]||{}).handle||i.handler).apply(o.elem,a))&&!1===(t.result=n)&&(t.preventDefault(),t.stopPropagation()));return c.postDispatch&&c.postDispatch.call(this,t),t.result}},handlers:function(t,e){var n,i,o,r,s=[],a=e.delegateCount,l=t.target;if(a&&l.nodeType&&(!t.button||"click"!==t.type))for(;l!=this;l=l.parentNode||this)if(1===l.nodeType&&(!0!==l.disabled||"click"!==t.type)){for(o=[],r=0;r<a;r++)void 0===o[n=(i=e[r]).selector+" "]&&(o[n]=i.needsContext?0<=_(n,this).index(l):_.find(n,this,null,[l]).length),o[n]&&o.push(i);o.length&&s.push({elem:l,handlers:o})}return a<e.length&&s.push({elem:this,handlers:e.slice(a)}),s},fix:function(t){if(t[_.expando])return t;var e,n,i,o=t.type,r=t,s=this.fixHooks[o];for(s||(this.fixHooks[o]=s=X.test(o)?this.mouseHooks:Z.test(o)?this.keyHooks:{}),i=s.props?this.props.concat(s.props):this.props,t=new _.Event(r),e=i.length;e--;)t[n=i[e]]=r[n];return t.target||(t.target=r.srcElement||T),3===t.target.nodeType&&(t.target=t.target.parentNode),t.metaKey=!!t.metaKey,s.filter?s.filter(t,r):t},props:"altKey bubbles cancelable ctrlKey currentTarget eventPhase metaKey relatedTarget shiftKey target timeStamp view which".split(" "),fixHooks:{},keyHooks:{props:"char charCode key keyCode".split(" "),filter:function(t,e){return null==t.which&&(t.which=null!=e.charCode?e.charCode:e.keyCode),t}},mouseHooks:{props:"button buttons clientX clientY fromElement offsetX offsetY pageX pageY screenX screenY toElement".split(" "),filter:function(t,e){var n,i,o,r=e.button,s=e.fromElement;return null==t.pageX&&null!=e.clientX&&(o=(i=t.target.ownerDocument||T).documentElement,n=i.body,t.pageX=e.clientX+(o&&o.scrollLeft||n&&n.scrollLeft||0)-(o&&o.clientLeft||n&&n.clientLeft||0),t.pageY=e.clientY+(o&&o.scrollTop||n&&n.scrollTop||0)-(o&&o.clientTop||n&&n.clientTop||0)),!t.relatedTarget&&s&&(t.relatedTarget=s===t.target?e.toElement:s),t.which||void 0===r||(t.which=1&r?1:2&r?3:4&r?2:0),t}},special:{load:{noBubble:!0},focus:{trigger:function(){if(this!==et()&&this.focus)try{return this.focus(),!1}catch(t){}},delegateType:"focusin"},blur:{trigger:function(){return this===et()&&this.blur?(this.blur(),!1):void 0},delegateType:"focusout"},click:{trigger:function(){return _.nodeName(this,"input")&&"checkbox"===this.type&&this.click?(this.click(),!1):void 0},_default:function(t){return _.nodeName(t.target,"a")}},beforeunload:{postDispatch:function(t){void 0!==t.result&&(t.originalEvent.returnValue=t.result)}}},simulate:function(t,e,n,i){var o=_.extend(new _.Event,n,{type:t,isSimulated:!0,originalEvent:{}});i?_.event.trigger(o,null,e):_.event.dispatch.call(e,o),o.isDefaultPrevented()&&n.preventDefault()}},_.removeEvent=T.removeEventListener?function(t,e,n){t.removeEventListener&&t.removeEventListener(e,n,!1)}:function(t,e,n){var i="on"+e;t.detachEvent&&(typeof t[i]===N&&(t[i]=null),t.detachEvent(i,n))},_.Event=function(t,e){return this instanceof _.Event?(t&&t.type?(this.originalEvent=t,this.type=t.type,this.isDefaultPrevented=t.defaultPrevented||void 0===t.defaultPrevented&&(!1===t.returnValue||t.getPreventDefault&&t.getPreventDefault())?K:tt):this.type=t,e&&_.extend(this,e),this.timeStamp=t&&t.timeStamp||_.now(),void(this[_.expando]=!0)):new _.Event(t,e)},_.Event.prototype={isDefaultPrevented:tt,isPropagationStopped:tt,isImmediatePropagationStopped:tt,preventDefault:function(){var t=this.originalEvent;this.isDefaultPrevented=K,t&&(t.preventDefault?t.preventDefault():t.returnValue=!1)},stopPropagation:function(){var t=this.originalEvent;this.isPropagationStopped=K,t&&(t.stopPropagation&&t.stopPropagation(),t.cancelBubble=!0)},stopImmediatePropagation:function(){this.isImmediatePropagationStopped=K,this.stopPropagation()}},_.each({mouseenter:"mouseover",mouseleave:"mouseout"},function(t,o){_.event.special[t]={delegateType:o,bindType:o,handle:function(t){var e,n=t.relatedTarget,i=t.handleObj;return(!n||n!==this&&!_.contains(this,n))&&(t.type=i.origType,e=i.handler.apply(this,arguments),t.type=o),e}}}),y.submitBubbles||(_.event.special.submit={setup:function(){return!_.nodeName(this,"form")&&void _.event.add(this,"click._submit keypress._submit",function(t){var e=t.target,n=_.nodeName(e,"input")||_.nodeName(e,"button")?e.form:void 0;n&&!_._data(n,"submitBubbles")&&(_.event.add(n,"submit._submit",function(t){t._submit_bubble=!0}),_._data(n,"submitBubbles",!0))})},postDispatch:function(t){t._submit_bubble&&(delete t._submit_bubble,this.parentNode&&!t.isTrigger&&_.event.simulate("submit",this.parentNode,t,!0))},teardown:function(){return!_.nodeName(this,"form")&&void _.event.remove(this,"._submit")}}),y.changeBubbles||(_.event.special.change={setup:function(){return V.test(this.nodeName)?(("checkbox"===this.type||"radio"===this.type)&&(_.event.add(this,"propertychange._change",function(t){"checked"===t.originalEvent.propertyName&&(this._just_changed=!0)}),_.event.add(this,"click._change",function(t){this._just_changed&&!t.isTrigger&&(this._just_changed=!1),_.event.simulate("change",this,t,!0)})),!1):void _.event.add(this,"beforeactivate._change",function(t){var e=t.target;V.test(e.nodeName)&&!_._data(e,"changeBubbles")&&(_.event.add(e,"change._change",function(t){!this.parentNode||t.isSimulated||t.isTrigger||_.event.simulate("change",this.parentNode,t,!0)}),_._data(e,"changeBubbles",!0))})},handle:function(t){var e=t.target;return this!==e||t.isSimulated||t.isTrigger||"radio"!==e.type&&"checkbox"!==e.type?t.handleObj.handler.apply(this,arguments):void 0},teardown:function(){return _.event.remove(this,"._change"),!V.test(this.nodeName)}}),y.focusinBubbles||_.each({focus:"focusin",blur:"focusout"},function(n,i){var o=function(t){_.event.simulate(i,t.target,_.event.fix(t),!0)};_.event.special[i]={setup:function(){var t=this.ownerDocument||this,e=_._data(t,i);e||t.addEventListener(n,o,!0),_._data(t,i,(e||0)+1)},teardown:function(){var t=this.ownerDocument||this,e=_._data(t,i)-1;e?_._data(t,i,e):(t.removeEventListener(n,o,!0),_._removeData(t,i))}}}),_.fn.extend({on:function(t,e,n,i,o){var r,s;if("object"==typeof t){for(r in"string"!=typeof e&&(n=n||e,e=void 0),t)this.on(r,e,n,t[r],o);return this}if(null==n&&null==i?(i=e,n=e=void 0):null==i&&("string"==typeof e?(i=n,n=void 0):(i=n,n=e,e=void 0)),!1===i)i=tt;else if(!i)return this;return 1===o&&(s=i,(i=function(t){return _().off(t),s.apply(this,arguments)}).guid=s.guid||(s.guid=_.guid++)),this.each(function(){_.event.add(this,t,i,n,e)})},one:function(t,e,n,i){return this.on(t,e,n,i,1)},off:function(t,e,n){var i,o;if(t&&t.preventDefault&&t.handleObj)return i=t.handleObj,_(t.delegateTarget).off(i.namespace?i.origType+"."+i.namespace:i.origType,i.selector,i.handler),this;if("object"!=typeof t)return(!1===e||"function"==typeof e)&&(n=e,e=void 0),!1===n&&(n=tt),this.each(function(){_.event.remove(this,t,n,e)});for(o in t)this.off(o,e,t[o]);return this},trigger:function(t,e){return this.each(function(){_.event.trigger(t,e,this)})},triggerHandler:function(t,e){var n=this[0];return n?_.event.trigger(t,e,n,!0):void 0}});var it="abbr|article|aside|audio|bdi|canvas|data|datalist|details|figcaption|figure|footer|header|hgroup|mark|meter|nav|output|progress|section|summary|time|video",ot=/ jQuery\d+="(?:null|\d+)"/g,rt=new RegExp("<(?:"+it+")[\\s/>]","i"),st=/^\s+/,at=/<(?!area|br|col|embed|hr|img|input|link|meta|param)(([\w:]+)[^>]*)\/>/gi,lt=/<([\w:]+)/,ct=/<tbody/i,ut=/<|&#?\w+;/,dt=/<(?:script|style|link)/i,ht=/checked\s*(?:[^=]|=\s*.checked.)/i,pt=/^$|\/(?:java|ecma)script/i,ft=/^true\/(.*)/,mt=/^\s*<!(?:\[CDATA\[|--)|(?:\]\]|--)>\s*$/g,gt={option:[1,"<select multiple='multiple'>","</select>"],legend:[1,"<fieldset>","</fieldset>"],area:[1,"<map>","</map>"],param:[1,"<object>","</object>"],thead:[1,"<table>","</table>"],tr:[2,"<table><tbody>","</tbody></table>"],col:[2,"<table><tbody></tbody><colgroup>","</colgroup></table>"],td:[3,"<table><tbody><tr>","</tr></tbody></table>"],_default:y.htmlSerialize?[0,"",""]:[1,"X<div>","</div>"]},yt=nt(T).appendChild(T.createElement("div"));function vt(t,e){var n,i,o=0,r=typeof t.getElementsByTagName!==N?t.getElementsByTagName(e||"*"):typeof t.querySelectorAll!==N?t.querySelectorAll(e||"*"):void 0;if(!r)for(r=[],n=t.childNodes||t;null!=(i=n[o]);o++)!e||_.nodeName(i,e)?r.push(i):_.merge(r,vt(i,e));return void 0===e||e&&_.nodeName(t,e)?_.merge([t],r):r}function bt(t){z.test(t.type)&&(t.defaultChecked=t.checked)}function wt(t,e){return _.nodeName(t,"table")&&_.nodeName(11!==e.nodeType?e:e.firstChild,"tr")?t.getElementsByTagName("tbody")[0]||t.appendChild(t.ownerDocument.createElement("tbody")):t}function xt(t){return t.type=(null!==_.find.attr(t,"type"))+"/"+t.type,t}function kt(t){var e=ft.exec(t.type);return e?t.type=e[1]:t.removeAttribute("type"),t}function _t(t,e){for(var n,i=0;null!=(n=t[i]);i++)_._data(n,"globalEval",!e||_._data(e[i],"globalEval"))}function Ct(t,e){if(1===e.nodeType&&_.hasData(t)){var n,i,o,r=_._data(t),s=_._data(e,r),a=r.events;if(a)for(n in delete s.handle,s.events={},a)for(i=0,o=a[n].length;i<o;i++)_.event.add(e,n,a[n][i]);s.data&&(s.data=_.extend({},s.data))}}function Tt(t,e){var n,i,o;if(1===e.nodeType){if(n=e.nodeName.toLowerCase(),!y.noCloneEvent&&e[_.expando]){for(i in(o=_._data(e)).events)_.removeEvent(e,i,o.handle);e.removeAttribute(_.expando)}"script"===n&&e.text!==t.text?(xt(e).text=t.text,kt(e)):"object"===n?(e.parentNode&&(e.outerHTML=t.outerHTML),y.html5Clone&&t.innerHTML&&!_.trim(e.innerHTML)&&(e.innerHTML=t.innerHTML)):"input"===n&&z.test(t.type)?(e.defaultChecked=e.checked=t.checked,e.value!==t.value&&(e.value=t.value)):"option"===n?e.defaultSelected=e.selected=t.defaultSelected:("input"===n||"textarea"===n)&&(e.defaultValue=t.defaultValue)}}gt.optgroup=gt.option,gt.tbody=gt.tfoot=gt.colgroup=gt.caption=gt.thead,gt.th=gt.td,_.extend({clone:function(t,e,n){var i,o,r,s,a,l=_.contains(t.ownerDocument,t);if(y.html5Clone||_.isXMLDoc(t)||!rt.test("<"+t.nodeName+">")?r=t.cloneNode(!0):(yt.innerHTML=t.outerHTML,yt.removeChild(r=yt.firstChild)),!(y.noCloneEvent&&y.noCloneChecked||1!==t.nodeType&&11!==t.nodeType||_.isXMLDoc(t)))for(i=vt(r),a=vt(t),s=0;null!=(o=a[s]);++s)i[s]&&Tt(o,i[s]);if(e)if(n)for(a=a||vt(t),i=i||vt(r),s=0;null!=(o=a[s]);s++)Ct(o,i[s]);else Ct(t,r);return 0<(i=vt(r,"script")).length&&_t(i,!l&&vt(t,"script")),i=a=o=null,r},buildFragment:function(t,e,n,i){for(var o,r,s,a,l,c,u,d=t.length,h=nt(e),p=[],f=0;f<d;f++)if((r=t[f])||0===r)if("object"===_.type(r))_.merge(p,r.nodeType?[r]:r);else if(ut.test(r)){for(a=a||h.appendChild(e.createElement("div")),l=(lt.exec(r)||["",""])[1].toLowerCase(),u=gt[l]||gt._default,a.innerHTML=u[1]+r.replace(at,"<$1></$2>")+u[2],o=u[0];o--;)a=a.lastChild;if(!y.leadingWhitespace&&st.test(r)&&p.push(e.createTextNode(st.exec(r)[0])),!y.tbody)for(o=(r="table"!==l||ct.test(r)?"<table>"!==u[1]||ct.test(r)?0:a:a.firstChild)&&r.childNodes.length;o--;)_.nodeName(c=r.childNodes[o],"tbody")&&!c.childNodes.length&&r.removeChild(c);for(_.merge(p,a.childNodes),a.textContent="";a.firstChild;)a.removeChild(a.firstChild);a=h.lastChild}else p.push(e.createTextNode(r));for(a&&h.removeChild(a),y.appendChecked||_.grep(vt(p,"input"),bt),f=0;r=p[f++];)if((!i||-1===_.inArray(r,i))&&(s=_.contains(r.ownerDocument,r),a=vt(h.appendChild(r),"script"),s&&_t(a),n))for(o=0;r=a[o++];)pt.test(r.type||"")&&n.push(r);return a=null,h},cleanData:function(t,e){for(var n,i,o,r,s=0,a=_.expando,l=_.cache,c=y.deleteExpando,u=_.event.special;null!=(n=t[s]);s++)if((e||_.acceptData(n))&&(r=(o=n[a])&&l[o])){if(r.events)for(i in r.events)u[i]?_.event.remove(n,i):_.removeEvent(n,i,r.handle);l[o]&&(delete l[o],c?delete n[a]:typeof n.removeAttribute!==N?n.removeAttribute(a):n[a]=null,d.push(o))}}}),_.fn.extend({text:function(t){return U(this,function(t){return void 0===t?_.text(this):this.empty().append((this[0]&&this[0].ownerDocument||T).createTextNode(t))},null,t,arguments.length)},append:function(){return this.domManip(arguments,function(t){1!==this.nodeType&&11!==this.nodeType&&9!==this.nodeType||wt(this,t).appendChild(t)})},prepend:function(){return this.domManip(arguments,function(t){if(1===this.nodeType||11===this.nodeType||9===this.nodeType){var e=wt(this,t);e.insertBefore(t,e.firstChild)}})},before:function(){return this.domManip(arguments,function(t){this.parentNode&&this.parentNode.insertBefore(t,this)})},after:function(){return this.domManip(arguments,function(t){this.parentNode&&this.parentNode.insertBefore(t,this.nextSibling)})},remove:function(t,e){for(var n,i=t?_.filter(t,this):this,o=0;null!=(n=i[o]);o++)e||1!==n.nodeType||_.cleanData(vt(n)),n.parentNode&&(e&&_.contains(n.ownerDocument,n)&&_t(vt(n,"script")),n.parentNode.removeChild(n));return this},empty:function(){for(var t,e=0;null!=(t=this[e]);e++){for(1===t.nodeType&&_.cleanData(vt(t,!1));t.firstChild;)t.removeChild(t.firstChild);t.options&&_.nodeName(t,"select")&&(t.options.length=0)}return this},clone:function(t,e){return t=null!=t&&t,e=null==e?t:e,this.map(function(){return _.clone(this,t,e)})},html:function(t){return U(this,function(t){var e=this[0]||{},n=0,i=this.length;if(void 0===t)return 1===e.nodeType?e.innerHTML.replace(ot,""):void 0;if(!("string"!=typeof t||dt.test(t)||!y.htmlSerialize&&rt.test(t)||!y.leadingWhitespace&&st.test(t)||gt[(lt.exec(t)||["",""])[1].toLowerCase()])){t=t.replace(at,"<$1></$2>");try{for(;n<i;n++)1===(e=this[n]||{}).nodeType&&(_.cleanData(vt(e,!1)),e.innerHTML=t);e=0}catch(t){}}e&&this.empty().append(t)},null,t,arguments.length)},replaceWith:function(){var e=arguments[0];return this.domManip(arguments,function(t){e=this.parentNode,_.cleanData(vt(this)),e&&e.replaceChild(t,this)}),e&&(e.length||e.nodeType)?this:this.remove()},detach:function(t){return this.remove(t,!0)},domManip:function(n,i){n=m.apply([],n);var t,e,o,r,s,a,l=0,c=this.length,u=this,d=c-1,h=n[0],p=_.isFunction(h);if(p||1<c&&"string"==typeof h&&!y.checkClone&&ht.test(h))return this.each(function(t){var e=u.eq(t);p&&(n[0]=h.call(this,t,e.html())),e.domManip(n,i)});if(c&&(t=(a=_.buildFragment(n,this[0].ownerDocument,!1,this)).firstChild,1===a.childNodes.length&&(a=t),t)){for(o=(r=_.map(vt(a,"script"),xt)).length;l<c;l++)e=a,l!==d&&(e=_.clone(e,!0,!0),o&&_.merge(r,vt(e,"script"))),i.call(this[l],e,l);if(o)for(s=r[r.length-1].ownerDocument,_.map(r,kt),l=0;l<o;l++)e=r[l],pt.test(e.type||"")&&!_._data(e,"globalEval")&&_.contains(s,e)&&(e.src?_._evalUrl&&_._evalUrl(e.src):_.globalEval((e.text||e.textContent||e.innerHTML||"").replace(mt,"")));a=t=null}return this}}),_.each({appendTo:"append",prependTo:"prepend",insertBefore:"before",insertAfter:"after",replaceAll:"replaceWith"},function(t,s){_.fn[t]=function(t){for(var e,n=0,i=[],o=_(t),r=o.length-1;n<=r;n++)e=n===r?this:this.clone(!0),_(o[n])[s](e),a.apply(i,e.get());return this.pushStack(i)}});var St,Dt,Et,$t,Lt={};function Mt(t,e){var n=_(e.createElement(t)).appendTo(e.body),i=f.getDefaultComputedStyle?f.getDefaultComputedStyle(n[0]).display:_.css(n[0],"display");return n.detach(),i}function Ot(t){var e=T,n=Lt[t];return n||("none"!==(n=Mt(t,e))&&n||((e=((St=(St||_("<iframe frameborder='0' width='0' height='0'/>")).appendTo(e.documentElement))[0].contentWindow||St[0].contentDocument).document).write(),e.close(),n=Mt(t,e),St.detach()),Lt[t]=n),n}($t=T.createElement("div")).innerHTML="  <link/><table></table><a href='/a'>a</a><input type='checkbox'/>",(Dt=$t.getElementsByTagName("a")[0]).style.cssText="float:left;opacity:.5",y.opacity=/^0.5/.test(Dt.style.opacity),y.cssFloat=!!Dt.style.cssFloat,$t.style.backgroundClip="content-box",$t.cloneNode(!0).style.backgroundClip="",y.clearCloneStyle="content-box"===$t.style.backgroundClip,Dt=$t=null,y.shrinkWrapBlocks=function(){var t,e,n;if(null==Et){if(!(t=T.getElementsByTagName("body")[0]))return;e=T.createElement("div"),n=T.createElement("div"),t.appendChild(e).appendChild(n),Et=!1,typeof n.style.zoom!==N&&(n.style.cssText="-webkit-box-sizing:content-box;-moz-box-sizing:content-box;box-sizing:content-box;display:block;padding:0;margin:0;border:0;width:1px;padding:1px;zoom:1",n.innerHTML="<div></div>",n.firstChild.style.width="5px",Et=3!==n.offsetWidth),t.removeChild(e),t=e=n=null}return Et};var At,jt,Ft=/^margin/,Nt=new RegExp("^("+W+")(?!px)[a-z%]+$","i"),Pt=/^(top|right|bottom|left)$/;function It(e,n){return{get:function(){var t=e();if(null!=t)return t?void delete this.get:(this.get=n).apply(this,arguments)}}}f.getComputedStyle?(At=function(t){return t.ownerDocument.defaultView.getComputedStyle(t,null)},jt=function(t,e,n){var i,o,r,s,a=t.style;return s=(n=n||At(t))?n.getPropertyValue(e)||n[e]:void 0,n&&(""!==s||_.contains(t.ownerDocument,t)||(s=_.style(t,e)),Nt.test(s)&&Ft.test(e)&&(i=a.width,o=a.minWidth,r=a.maxWidth,a.minWidth=a.maxWidth=a.width=s,s=n.width,a.width=i,a.minWidth=o,a.maxWidth=r)),void 0===s?s:s+""}):T.documentElement.currentStyle&&(At=function(t){return t.currentStyle},jt=function(t,e,n){var i,o,r,s,a=t.style;return null==(s=(n=n||At(t))?n[e]:void 0)&&a&&a[e]&&(s=a[e]),Nt.test(s)&&!Pt.test(e)&&(i=a.left,(r=(o=t.runtimeStyle)&&o.left)&&(o.left=t.currentStyle.left),a.left="fontSize"===e?"1em":s,s=a.pixelLeft+"px",a.left=i,r&&(o.left=r)),void 0===s?s:s+""||"auto"}),function(){var t,r,i,o,s,a,e=T.createElement("div"),l="border:0;width:0;height:0;position:absolute;top:0;left:-9999px";function n(){var t,e,n=T.getElementsByTagName("body")[0];n&&(t=T.createElement("div"),e=T.createElement("div"),t.style.cssText=l,n.appendChild(t).appendChild(e),e.style.cssText="-webkit-box-sizing:border-box;-moz-box-sizing:border-box;box-sizing:border-box;position:absolute;display:block;padding:1px;border:1px;width:4px;margin-top:1%;top:1%",_.swap(n,null!=n.style.zoom?{zoom:1}:{},function(){i=4===e.offsetWidth}),a=!(s=!(o=!0)),f.getComputedStyle&&(s="1%"!==(f.getComputedStyle(e,null)||{}).top,o="4px"===(f.getComputedStyle(e,null)||{width:"4px"}).width),n.removeChild(t),e=n=null)}e.innerHTML="  <link/><table></table><a href='/a'>a</a><input type='checkbox'/>",(t=e.getElementsByTagName("a")[0]).style.cssText="float:left;opacity:.5",y.opacity=/^0.5/.test(t.style.opacity),y.cssFloat=!!t.style.cssFloat,e.style.backgroundClip="content-box",e.cloneNode(!0).style.backgroundClip="",y.clearCloneStyle="content-box"===e.style.backgroundClip,t=e=null,_.extend(y,{reliableHiddenOffsets:function(){if(null!=r)return r;var t,e,n,i=T.createElement("div"),o=T.getElementsByTagName("body")[0];return o?(i.setAttribute("className","t"),i.innerHTML="  <link/><table></table><a href='/a'>a</a><input type='checkbox'/>",(t=T.createElement("div")).style.cssText=l,o.appendChild(t).appendChild(i),i.innerHTML="<table><tr><td></td><td>t</td></tr></table>",(e=i.getElementsByTagName("td"))[0].style.cssText="padding:0;margin:0;border:0;display:none",n=0===e[0].offsetHeight,e[0].style.display="",e[1].style.display="none",r=n&&0===e[0].offsetHeight,o.removeChild(t),i=o=null,r):void 0},boxSizing:function(){return null==i&&n(),i},boxSizingReliable:function(){return null==o&&n(),o},pixelPosition:function(){return null==s&&n(),s},reliableMarginRight:function(){var t,e,n,i;if(null==a&&f.getComputedStyle){if(!(t=T.getElementsByTagName("body")[0]))return;e=T.createElement("div"),n=T.createElement("div"),e.style.cssText=l,t.appendChild(e).appendChild(n),(i=n.appendChild(T.createElement("div"))).style.cssText=n.style.cssText="-webkit-box-sizing:content-box;-moz-box-sizing:content-box;box-sizing:content-box;display:block;padding:0;margin:0;border:0",i.style.marginRight=i.style.width="0",n.style.width="1px",a=!parseFloat((f.getComputedStyle(i,null)||{}).marginRight),t.removeChild(e)}return a}})}(),_.swap=function(t,e,n,i){var o,r,s={};for(r in e)s[r]=t.style[r],t.style[r]=e[r];for(r in o=n.apply(t,i||[]),e)t.style[r]=s[r];return o};var Ht=/alpha\([^)]*\)/i,Yt=/opacity\s*=\s*([^)]*)/,qt=/^(none|table(?!-c[ea]).+)/,Rt=new RegExp("^("+W+")(.*)$","i"),Wt=new RegExp("^([+-])=("+W+")","i"),Bt={position:"absolute",visibility:"hidden",display:"block"},Gt={letterSpacing:0,fontWeight:400},Ut=["Webkit","O","Moz","ms"];function zt(t,e){if(e in t)return e;for(var n=e.charAt(0).toUpperCase()+e.slice(1),i=e,o=Ut.length;o--;)if((e=Ut[o]+n)in t)return e;return i}function Vt(t,e){for(var n,i,o,r=[],s=0,a=t.length;s<a;s++)(i=t[s]).style&&(r[s]=_._data(i,"olddisplay"),n=i.style.display,e?(r[s]||"none"!==n||(i.style.display=""),""===i.style.display&&G(i)&&(r[s]=_._data(i,"olddisplay",Ot(i.nodeName)))):r[s]||(o=G(i),(n&&"none"!==n||!o)&&_._data(i,"olddisplay",o?n:_.css(i,"display"))));for(s=0;s<a;s++)(i=t[s]).style&&(e&&"none"!==i.style.display&&""!==i.style.display||(i.style.display=e?r[s]||"":"none"));return t}function Zt(t,e,n){var i=Rt.exec(e);return i?Math.max(0,i[1]-(n||0))+(i[2]||"px"):e}function Xt(t,e,n,i,o){for(var r=n===(i?"border":"content")?4:"width"===e?1:0,s=0;r<4;r+=2)"margin"===n&&(s+=_.css(t,n+B[r],!0,o)),i?("content"===n&&(s-=_.css(t,"padding"+B[r],!0,o)),"margin"!==n&&(s-=_.css(t,"border"+B[r]+"Width",!0,o))):(s+=_.css(t,"padding"+B[r],!0,o),"padding"!==n&&(s+=_.css(t,"border"+B[r]+"Width",!0,o)));return s}function Qt(t,e,n){var i=!0,o="width"===e?t.offsetWidth:t.offsetHeight,r=At(t),s=y.boxSizing()&&"border-box"===_.css(t,"boxSizing",!1,r);if(o<=0||null==o){if(((o=jt(t,e,r))<0||null==o)&&(o=t.style[e]),Nt.test(o))return o;i=s&&(y.boxSizingReliable()||o===t.style[e]),o=parseFloat(o)||0}return o+Xt(t,e,n||(s?"border":"content"),i,r)+"px"}function Jt(t,e,n,i,o){return new Jt.prototype.init(t,e,n,i,o)}_.extend({cssHooks:{opacity:{get:function(t,e){if(e){var n=jt(t,"opacity");return""===n?"1":n}}}},cssNumber:{columnCount:!0,fillOpacity:!0,fontWeight:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,widows:!0,zIndex:!0,zoom:!0},cssProps:{float:y.cssFloat?"cssFloat":"styleFloat"},style:function(t,e,n,i){if(t&&3!==t.nodeType&&8!==t.nodeType&&t.style){var o,r,s,a=_.camelCase(e),l=t.style;if(e=_.cssProps[a]||(_.cssProps[a]=zt(l,a)),s=_.cssHooks[e]||_.cssHooks[a],void 0===n)return s&&"get"in s&&void 0!==(o=s.get(t,!1,i))?o:l[e];if("string"===(r=typeof n)&&(o=Wt.exec(n))&&(n=(o[1]+1)*o[2]+parseFloat(_.css(t,e)),r="number"),null!=n&&n==n&&("number"!==r||_.cssNumber[a]||(n+="px"),y.clearCloneStyle||""!==n||0!==e.indexOf("background")||(l[e]="inherit"),!(s&&"set"in s&&void 0===(n=s.set(t,n,i)))))try{l[e]="",l[e]=n}catch(t){}}},css:function(t,e,n,i){var o,r,s,a=_.camelCase(e);return e=_.cssProps[a]||(_.cssProps[a]=zt(t.style,a)),(s=_.cssHooks[e]||_.cssHooks[a])&&"get"in s&&(r=s.get(t,!0,n)),void 0===r&&(r=jt(t,e,i)),"normal"===r&&e in Gt&&(r=Gt[e]),""===n||n?(o=parseFloat(r),!0===n||_.isNumeric(o)?o||0:r):r}}),_.each(["height","width"],function(t,o){_.cssHooks[o]={get:function(t,e,n){return e?0===t.offsetWidth&&qt.test(_.css(t,"display"))?_.swap(t,Bt,function(){return Qt(t,o,n)}):Qt(t,o,n):void 0},set:function(t,e,n){var i=n&&At(t);return Zt(0,e,n?Xt(t,o,n,y.boxSizing()&&"border-box"===_.css(t,"boxSizing",!1,i),i):0)}}}),y.opacity||(_.cssHooks.opacity={get:function(t,e){return Yt.test((e&&t.currentStyle?t.currentStyle.filter:t.style.filter)||"")?.01*parseFloat(RegExp.$1)+"":e?"1":""},set:function(t,e){var n=t.style,i=t.currentStyle,o=_.isNumeric(e)?"alpha(opacity="+100*e+")":"",r=i&&i.filter||n.filter||"";((n.zoom=1)<=e||""===e)&&""===_.trim(r.replace(Ht,""))&&n.removeAttribute&&(n.removeAttribute("filter"),""===e||i&&!i.filter)||(n.filter=Ht.test(r)?r.replace(Ht,o):r+" "+o)}}),_.cssHooks.marginRight=It(y.reliableMarginRight,function(t,e){return e?_.swap(t,{display:"inline-block"},jt,[t,"marginRight"]):void 0}),_.each({margin:"",padding:"",border:"Width"},function(o,r){_.cssHooks[o+r]={expand:function(t){for(var e=0,n={},i="string"==typeof t?t.split(" "):[t];e<4;e++)n[o+B[e]+r]=i[e]||i[e-2]||i[0];return n}},Ft.test(o)||(_.cssHooks[o+r].set=Zt)}),_.fn.extend({css:function(t,e){return U(this,function(t,e,n){var i,o,r={},s=0;if(_.isArray(e)){for(i=At(t),o=e.length;s<o;s++)r[e[s]]=_.css(t,e[s],!1,i);return r}return void 0!==n?_.style(t,e,n):_.css(t,e)},t,e,1<arguments.length)},show:function(){return Vt(this,!0)},hide:function(){return Vt(this)},toggle:function(t){return"boolean"==typeof t?t?this.show():this.hide():this.each(function(){G(this)?_(this).show():_(this).hide()})}}),((_.Tween=Jt).prototype={constructor:Jt,init:function(t,e,n,i,o,r){this.elem=t,this.prop=n,this.easing=o||"swing",this.options=e,this.start=this.now=this.cur(),this.end=i,this.unit=r||(_.cssNumber[n]?"":"px")},cur:function(){var t=Jt.propHooks[this.prop];return t&&t.get?t.get(this):Jt.propHooks._default.get(this)},run:function(t){var e,n=Jt.propHooks[this.prop];return this.pos=e=this.options.duration?_.easing[this.easing](t,this.options.duration*t,0,1,this.options.duration):t,this.now=(this.end-this.start)*e+this.start,this.options.step&&this.options.step.call(this.elem,this.now,this),n&&n.set?n.set(this):Jt.propHooks._default.set(this),this}}).init.prototype=Jt.prototype,(Jt.propHooks={_default:{get:function(t){var e;return null==t.elem[t.prop]||t.elem.style&&null!=t.elem.style[t.prop]?(e=_.css(t.elem,t.prop,""))&&"auto"!==e?e:0:t.elem[t.prop]},set:function(t){_.fx.step[t.prop]?_.fx.step[t.prop](t):t.elem.style&&(null!=t.elem.style[_.cssProps[t.prop]]||_.cssHooks[t.prop])?_.style(t.elem,t.prop,t.now+t.unit):t.elem[t.prop]=t.now}}}).scrollTop=Jt.propHooks.scrollLeft={set:function(t){t.elem.nodeType&&t.elem.parentNode&&(t.elem[t.prop]=t.now)}},_.easing={linear:function(t){return t},swing:function(t){return.5-Math.cos(t*Math.PI)/2}},_.fx=Jt.prototype.init,_.fx.step={};var Kt,te,ee,ne,ie,oe,re,se=/^(?:toggle|show|hide)$/,ae=new RegExp("^(?:([+-])=|)("+W+")([a-z%]*)$","i"),le=/queueHooks$/,ce=[function(e,t,n){var i,o,r,s,a,l,c,u,d=this,h={},p=e.style,f=e.nodeType&&G(e),m=_._data(e,"fxshow");for(i in n.queue||(null==(a=_._queueHooks(e,"fx")).unqueued&&(a.unqueued=0,l=a.empty.fire,a.empty.fire=function(){a.unqueued||l()}),a.unqueued++,d.always(function(){d.always(function(){a.unqueued--,_.queue(e,"fx").length||a.empty.fire()})})),1===e.nodeType&&("height"in t||"width"in t)&&(n.overflow=[p.overflow,p.overflowX,p.overflowY],c=_.css(e,"display"),u=Ot(e.nodeName),"none"===c&&(c=u),"inline"===c&&"none"===_.css(e,"float")&&(y.inlineBlockNeedsLayout&&"inline"!==u?p.zoom=1:p.display="inline-block")),n.overflow&&(p.overflow="hidden",y.shrinkWrapBlocks()||d.always(function(){p.overflow=n.overflow[0],p.overflowX=n.overflow[1],p.overflowY=n.overflow[2]})),t)if(o=t[i],se.exec(o)){if(delete t[i],r=r||"toggle"===o,o===(f?"hide":"show")){if("show"!==o||!m||void 0===m[i])continue;f=!0}h[i]=m&&m[i]||_.style(e,i)}if(!_.isEmptyObject(h))for(i in m?"hidden"in m&&(f=m.hidden):m=_._data(e,"fxshow",{}),r&&(m.hidden=!f),f?_(e).show():d.done(function(){_(e).hide()}),d.done(function(){var t;for(t in _._removeData(e,"fxshow"),h)_.style(e,t,h[t])}),h)s=pe(f?m[i]:0,i,d),i in m||(m[i]=s.start,f&&(s.end=s.start,s.start="width"===i||"height"===i?1:0))}],ue={"*":[function(t,e){var n=this.createTween(t,e),i=n.cur(),o=ae.exec(e),r=o&&o[3]||(_.cssNumber[t]?"":"px"),s=(_.cssNumber[t]||"px"!==r&&+i)&&ae.exec(_.css(n.elem,t)),a=1,l=20;if(s&&s[3]!==r)for(r=r||s[3],o=o||[],s=+i||1;s/=a=a||".5",_.style(n.elem,t,s+r),a!==(a=n.cur()/i)&&1!==a&&--l;);return o&&(s=n.start=+s||+i||0,n.unit=r,n.end=o[1]?s+(o[1]+1)*o[2]:+o[2]),n}]};function de(){return setTimeout(function(){Kt=void 0}),Kt=_.now()}function he(t,e){var n,i={height:t},o=0;for(e=e?1:0;o<4;o+=2-e)i["margin"+(n=B[o])]=i["padding"+n]=t;return e&&(i.opacity=i.width=t),i}function pe(t,e,n){for(var i,o=(ue[e]||[]).concat(ue["*"]),r=0,s=o.length;r<s;r++)if(i=o[r].call(n,e,t))return i}function fe(r,t,e){var n,s,i=0,o=ce.length,a=_.Deferred().always(function(){delete l.elem}),l=function(){if(s)return!1;for(var t=Kt||de(),e=Math.max(0,c.startTime+c.duration-t),n=1-(e/c.duration||0),i=0,o=c.tweens.length;i<o;i++)c.tweens[i].run(n);return a.notifyWith(r,[c,n,e]),n<1&&o?e:(a.resolveWith(r,[c]),!1)},c=a.promise({elem:r,props:_.extend({},t),opts:_.extend(!0,{specialEasing:{}},e),originalProperties:t,originalOptions:e,startTime:Kt||de(),duration:e.duration,tweens:[],createTween:function(t,e){var n=_.Tween(r,c.opts,t,e,c.opts.specialEasing[t]||c.opts.easing);return c.tweens.push(n),n},stop:function(t){var e=0,n=t?c.tweens.length:0;if(s)return this;for(s=!0;e<n;e++)c.tweens[e].run(1);return t?a.resolveWith(r,[c,t]):a.rejectWith(r,[c,t]),this}}),u=c.props;for(function(t,e){var n,i,o,r,s;for(n in t)if(o=e[i=_.camelCase(n)],r=t[n],_.isArray(r)&&(o=r[1],r=t[n]=r[0]),n!==i&&(t[i]=r,delete t[n]),(s=_.cssHooks[i])&&"expand"in s)for(n in r=s.expand(r),delete t[i],r)n in t||(t[n]=r[n],e[n]=o);else e[i]=o}(u,c.opts.specialEasing);i<o;i++)if(n=ce[i].call(c,r,u,c.opts))return n;return _.map(u,pe,c),_.isFunction(c.opts.start)&&c.opts.start.call(r,c),_.fx.timer(_.extend(l,{elem:r,anim:c,queue:c.opts.queue})),c.progress(c.opts.progress).done(c.opts.done,c.opts.complete).fail(c.opts.fail).always(c.opts.always)}_.Animation=_.extend(fe,{tweener:function(t,e){for(var n,i=0,o=(t=_.isFunction(t)?(e=t,["*"]):t.split(" ")).length;i<o;i++)n=t[i],ue[n]=ue[n]||[],ue[n].unshift(e)},prefilter:function(t,e){e?ce.unshift(t):ce.push(t)}}),_.speed=function(t,e,n){var i=t&&"object"==typeof t?_.extend({},t):{complete:n||!n&&e||_.isFunction(t)&&t,duration:t,easing:n&&e||e&&!_.isFunction(e)&&e};return i.duration=_.fx.off?0:"number"==typeof i.duration?i.duration:i.duration in _.fx.speeds?_.fx.speeds[i.duration]:_.fx.speeds._default,(null==i.queue||!0===i.queue)&&(i.queue="fx"),i.old=i.complete,i.complete=function(){_.isFunction(i.old)&&i.old.call(this),i.queue&&_.dequeue(this,i.queue)},i},_.fn.extend({fadeTo:function(t,e,n,i){return this.filter(G).css("opacity",0).show().end().animate({opacity:e},t,n,i)},animate:function(e,t,n,i){var o=_.isEmptyObject(e),r=_.speed(t,n,i),s=function(){var t=fe(this,_.extend({},e),r);(o||_._data(this,"finish"))&&t.stop(!0)};return s.finish=s,o||!1===r.queue?this.each(s):this.queue(r.queue,s)},stop:function(o,t,r){var s=function(t){var e=t.stop;delete t.stop,e(r)};return"string"!=typeof o&&(r=t,t=o,o=void 0),t&&!1!==o&&this.queue(o||"fx",[]),this.each(function(){var t=!0,e=null!=o&&o+"queueHooks",n=_.timers,i=_._data(this);if(e)i[e]&&i[e].stop&&s(i[e]);else for(e in i)i[e]&&i[e].stop&&le.test(e)&&s(i[e]);for(e=n.length;e--;)n[e].elem!==this||null!=o&&n[e].queue!==o||(n[e].anim.stop(r),t=!1,n.splice(e,1));(t||!r)&&_.dequeue(this,o)})},finish:function(s){return!1!==s&&(s=s||"fx"),this.each(function(){var t,e=_._data(this),n=e[s+"queue"],i=e[s+"queueHooks"],o=_.timers,r=n?n.length:0;for(e.finish=!0,_.queue(this,s,[]),i&&i.stop&&i.stop.call(this,!0),t=o.length;t--;)o[t].elem===this&&o[t].queue===s&&(o[t].anim.stop(!0),o.splice(t,1));for(t=0;t<r;t++)n[t]&&n[t].finish&&n[t].finish.call(this);delete e.finish})}}),_.each(["toggle","show","hide"],function(t,i){var o=_.fn[i];_.fn[i]=function(t,e,n){return null==t||"boolean"==typeof t?o.apply(this,arguments):this.animate(he(i,!0),t,e,n)}}),_.each({slideDown:he("show"),slideUp:he("hide"),slideToggle:he("toggle"),fadeIn:{opacity:"show"},fadeOut:{opacity:"hide"},fadeToggle:{opacity:"toggle"}},function(t,i){_.fn[t]=function(t,e,n){return this.animate(i,t,e,n)}}),_.timers=[],_.fx.tick=function(){var t,e=_.timers,n=0;for(Kt=_.now();n<e.length;n++)(t=e[n])()||e[n]!==t||e.splice(n--,1);e.length||_.fx.stop(),Kt=void 0},_.fx.timer=function(t){_.timers.push(t),t()?_.fx.start():_.timers.pop()},_.fx.interval=13,_.fx.start=function(){te||(te=setInterval(_.fx.tick,_.fx.interval))},_.fx.stop=function(){clearInterval(te),te=null},_.fx.speeds={slow:600,fast:200,_default:400},_.fn.delay=function(i,t){return i=_.fx&&_.fx.speeds[i]||i,t=t||"fx",this.queue(t,function(t,e){var n=setTimeout(t,i);e.stop=function(){clearTimeout(n)}})},(re=T.createElement("div")).setAttribute("className","t"),re.innerHTML="  <link/><table></table><a href='/a'>a</a><input type='checkbox'/>",ee=re.getElementsByTagName("a")[0],oe=(ie=T.createElement("select")).appendChild(T.createElement("option")),ne=re.getElementsByTagName("input")[0],ee.style.cssText="top:1px",y.getSetAttribute="t"!==re.className,y.style=/top/.test(ee.getAttribute("style")),y.hrefNormalized="/a"===ee.getAttribute("href"),y.checkOn=!!ne.value,y.optSelected=oe.selected,y.enctype=!!T.createElement("form").enctype,ie.disabled=!0,y.optDisabled=!oe.disabled,(ne=T.createElement("input")).setAttribute("value",""),y.input=""===ne.getAttribute("value"),ne.value="t",ne.setAttribute("type","radio"),y.radioValue="t"===ne.value,ee=ne=ie=oe=re=null;var me=/\r/g;_.fn.extend({val:function(n){var i,t,o,e=this[0];return arguments.length?(o=_.isFunction(n),this.each(function(t){var e;1===this.nodeType&&(null==(e=o?n.call(this,t,_(this).val()):n)?e="":"number"==typeof e?e+="":_.isArray(e)&&(e=_.map(e,function(t){return null==t?"":t+""})),(i=_.valHooks[this.type]||_.valHooks[this.nodeName.toLowerCase()])&&"set"in i&&void 0!==i.set(this,e,"value")||(this.value=e))})):e?(i=_.valHooks[e.type]||_.valHooks[e.nodeName.toLowerCase()])&&"get"in i&&void 0!==(t=i.get(e,"value"))?t:"string"==typeof(t=e.value)?t.replace(me,""):null==t?"":t:void 0}}),_.extend({valHooks:{option:{get:function(t){var e=_.find.attr(t,"value");return null!=e?e:_.text(t)}},select:{get:function(t){for(var e,n,i=t.options,o=t.selectedIndex,r="select-one"===t.type||o<0,s=r?null:[],a=r?o+1:i.length,l=o<0?a:r?o:0;l<a;l++)if(!(!(n=i[l]).selected&&l!==o||(y.optDisabled?n.disabled:null!==n.getAttribute("disabled"))||n.parentNode.disabled&&_.nodeName(n.parentNode,"optgroup"))){if(e=_(n).val(),r)return e;s.push(e)}return s},set:function(t,e){for(var n,i,o=t.options,r=_.makeArray(e),s=o.length;s--;)if(i=o[s],0<=_.inArray(_.valHooks.option.get(i),r))try{i.selected=n=!0}catch(t){i.scrollHeight}else i.selected=!1;return n||(t.selectedIndex=-1),o}}}}),_.each(["radio","checkbox"],function(){_.valHooks[this]={set:function(t,e){return _.isArray(e)?t.checked=0<=_.inArray(_(t).val(),e):void 0}},y.checkOn||(_.valHooks[this].get=function(t){return null===t.getAttribute("value")?"on":t.value})});var ge,ye,ve=_.expr.attrHandle,be=/^(?:checked|selected)$/i,we=y.getSetAttribute,xe=y.input;_.fn.extend({attr:function(t,e){return U(this,_.attr,t,e,1<arguments.length)},removeAttr:function(t){return this.each(function(){_.removeAttr(this,t)})}}),_.extend({attr:function(t,e,n){var i,o,r=t.nodeType;if(t&&3!==r&&8!==r&&2!==r)return typeof t.getAttribute===N?_.prop(t,e,n):(1===r&&_.isXMLDoc(t)||(e=e.toLowerCase(),i=_.attrHooks[e]||(_.expr.match.bool.test(e)?ye:ge)),void 0===n?i&&"get"in i&&null!==(o=i.get(t,e))?o:null==(o=_.find.attr(t,e))?void 0:o:null!==n?i&&"set"in i&&void 0!==(o=i.set(t,n,e))?o:(t.setAttribute(e,n+""),n):void _.removeAttr(t,e))},removeAttr:function(t,e){var n,i,o=0,r=e&&e.match(M);if(r&&1===t.nodeType)for(;n=r[o++];)i=_.propFix[n]||n,_.expr.match.bool.test(n)?xe&&we||!be.test(n)?t[i]=!1:t[_.camelCase("default-"+n)]=t[i]=!1:_.attr(t,n,""),t.removeAttribute(we?n:i)},attrHooks:{type:{set:function(t,e){if(!y.radioValue&&"radio"===e&&_.nodeName(t,"input")){var n=t.value;return t.setAttribute("type",e),n&&(t.value=n),e}}}}}),ye={set:function(t,e,n){return!1===e?_.removeAttr(t,n):xe&&we||!be.test(n)?t.setAttribute(!we&&_.propFix[n]||n,n):t[_.camelCase("default-"+n)]=t[n]=!0,n}},_.each(_.expr.match.bool.source.match(/\w+/g),function(t,e){var r=ve[e]||_.find.attr;ve[e]=xe&&we||!be.test(e)?function(t,e,n){var i,o;return n||(o=ve[e],ve[e]=i,i=null!=r(t,e,n)?e.toLowerCase():null,ve[e]=o),i}:function(t,e,n){return n?void 0:t[_.camelCase("default-"+e)]?e.toLowerCase():null}}),xe&&we||(_.attrHooks.value={set:function(t,e,n){return _.nodeName(t,"input")?void(t.defaultValue=e):ge&&ge.set(t,e,n)}}),we||(ge={set:function(t,e,n){var i=t.getAttributeNode(n);return i||t.setAttributeNode(i=t.ownerDocument.createAttribute(n)),i.value=e+="","value"===n||e===t.getAttribute(n)?e:void 0}},ve.id=ve.name=ve.coords=function(t,e,n){var i;return n?void 0:(i=t.getAttributeNode(e))&&""!==i.value?i.value:null},_.valHooks.button={get:function(t,e){var n=t.getAttributeNode(e);return n&&n.specified?n.value:void 0},set:ge.set},_.attrHooks.contenteditable={set:function(t,e,n){ge.set(t,""!==e&&e,n)}},_.each(["width","height"],function(t,n){_.attrHooks[n]={set:function(t,e){return""===e?(t.setAttribute(n,"auto"),e):void 0}}})),y.style||(_.attrHooks.style={get:function(t){return t.style.cssText||void 0},set:function(t,e){return t.style.cssText=e+""}});var ke=/^(?:input|select|textarea|button|object)$/i,_e=/^(?:a|area)$/i;_.fn.extend({prop:function(t,e){return U(this,_.prop,t,e,1<arguments.length)},removeProp:function(t){return t=_.propFix[t]||t,this.each(function(){try{this[t]=void 0,delete this[t]}catch(t){}})}}),_.extend({propFix:{for:"htmlFor",class:"className"},prop:function(t,e,n){var i,o,r=t.nodeType;if(t&&3!==r&&8!==r&&2!==r)return(1!==r||!_.isXMLDoc(t))&&(e=_.propFix[e]||e,o=_.propHooks[e]),void 0!==n?o&&"set"in o&&void 0!==(i=o.set(t,n,e))?i:t[e]=n:o&&"get"in o&&null!==(i=o.get(t,e))?i:t[e]},propHooks:{tabIndex:{get:function(t){var e=_.find.attr(t,"tabindex");return e?parseInt(e,10):ke.test(t.nodeName)||_e.test(t.nodeName)&&t.href?0:-1}}}}),y.hrefNormalized||_.each(["href","src"],function(t,e){_.propHooks[e]={get:function(t){return t.getAttribute(e,4)}}}),y.optSelected||(_.propHooks.selected={get:function(t){var e=t.parentNode;return e&&(e.selectedIndex,e.parentNode&&e.parentNode.selectedIndex),null}}),_.each(["tabIndex","readOnly","maxLength","cellSpacing","cellPadding","rowSpan","colSpan","useMap","frameBorder","contentEditable"],function(){_.propFix[this.toLowerCase()]=this}),y.enctype||(_.propFix.enctype="encoding");var Ce=/[\t\r\n\f]/g;_.fn.extend({addClass:function(e){var t,n,i,o,r,s,a=0,l=this.length,c="string"==typeof e&&e;if(_.isFunction(e))return this.each(function(t){_(this).addClass(e.call(this,t,this.className))});if(c)for(t=(e||"").match(M)||[];a<l;a++)if(i=1===(n=this[a]).nodeType&&(n.className?(" "+n.className+" ").replace(Ce," "):" ")){for(r=0;o=t[r++];)i.indexOf(" "+o+" ")<0&&(i+=o+" ");s=_.trim(i),n.className!==s&&(n.className=s)}return this},removeClass:function(e){var t,n,i,o,r,s,a=0,l=this.length,c=0===arguments.length||"string"==typeof e&&e;if(_.isFunction(e))return this.each(function(t){_(this).removeClass(e.call(this,t,this.className))});if(c)for(t=(e||"").match(M)||[];a<l;a++)if(i=1===(n=this[a]).nodeType&&(n.className?(" "+n.className+" ").replace(Ce," "):"")){for(r=0;o=t[r++];)for(;0<=i.indexOf(" "+o+" ");)i=i.replace(" "+o+" "," ");s=e?_.trim(i):"",n.className!==s&&(n.className=s)}return this},toggleClass:function(o,e){var r=typeof o;return"boolean"==typeof e&&"string"===r?e?this.addClass(o):this.removeClass(o):this.each(_.isFunction(o)?function(t){_(this).toggleClass(o.call(this,t,this.className,e),e)}:function(){if("string"===r)for(var t,e=0,n=_(this),i=o.match(M)||[];t=i[e++];)n.hasClass(t)?n.removeClass(t):n.addClass(t);else(r===N||"boolean"===r)&&(this.className&&_._data(this,"__className__",this.className),this.className=this.className||!1===o?"":_._data(this,"__className__")||"")})},hasClass:function(t){for(var e=" "+t+" ",n=0,i=this.length;n<i;n++)if(1===this[n].nodeType&&0<=(" "+this[n].className+" ").replace(Ce," ").indexOf(e))return!0;return!1}}),_.each("blur focus focusin focusout load resize scroll unload click dblclick mousedown mouseup mousemove mouseover mouseout mouseenter mouseleave change select submit keydown keypress keyup error contextmenu".split(" "),function(t,n){_.fn[n]=function(t,e){return 0<arguments.length?this.on(n,null,t,e):this.trigger(n)}}),_.fn.extend({hover:function(t,e){return this.mouseenter(t).mouseleave(e||t)},bind:function(t,e,n){return this.on(t,null,e,n)},unbind:function(t,e){return this.off(t,null,e)},delegate:function(t,e,n,i){return this.on(e,t,n,i)},undelegate:function(t,e,n){return 1===arguments.length?this.off(t,"**"):this.off(e,t||"**",n)}});var Te=_.now(),Se=/\?/,De=/(,)|(\[|{)|(}|])|"(?:[^"\\\r\n]|\\["\\\/bfnrt]|\\u[\da-fA-F]{4})*"\s*:?|true|false|null|-?(?!0\d)\d+(?:\.\d+|)(?:[eE][+-]?\d+|)/g;_.parseJSON=function(t){if(f.JSON&&f.JSON.parse)return f.JSON.parse(t+"");var o,r=null,e=_.trim(t+"");return e&&!_.trim(e.replace(De,function(t,e,n,i){return o&&e&&(r=0),0===r?t:(o=n||e,r+=!i-!n,"")}))?Function("return "+e)():_.error("Invalid JSON: "+t)},_.parseXML=function(t){var e;if(!t||"string"!=typeof t)return null;try{f.DOMParser?e=(new DOMParser).parseFromString(t,"text/xml"):((e=new ActiveXObject("Microsoft.XMLDOM")).async="false",e.loadXML(t))}catch(t){e=void 0}return e&&e.documentElement&&!e.getElementsByTagName("parsererror").length||_.error("Invalid XML: "+t),e};var Ee,$e,Le=/#.*$/,Me=/([?&])_=[^&]*/,Oe=/^(.*?):[ \t]*([^\r\n]*)\r?$/gm,Ae=/^(?:GET|HEAD)$/,je=/^\/\//,Fe=/^([\w.+-]+:)(?:\/\/(?:[^\/?#]*@|)([^\/?#:]*)(?::(\d+)|)|)/,Ne={},Pe={},Ie="*/".concat("*");try{$e=location.href}catch(t){($e=T.createElement("a")).href="",$e=$e.href}function He(r){return function(t,e){"string"!=typeof t&&(e=t,t="*");var n,i=0,o=t.toLowerCase().match(M)||[];if(_.isFunction(e))for(;n=o[i++];)"+"===n.charAt(0)?(n=n.slice(1)||"*",(r[n]=r[n]||[]).unshift(e)):(r[n]=r[n]||[]).push(e)}}function Ye(e,o,r,s){var a={},l=e===Pe;function c(t){var i;return a[t]=!0,_.each(e[t]||[],function(t,e){var n=e(o,r,s);return"string"!=typeof n||l||a[n]?l?!(i=n):void 0:(o.dataTypes.unshift(n),c(n),!1)}),i}return c(o.dataTypes[0])||!a["*"]&&c("*")}function qe(t,e){var n,i,o=_.ajaxSettings.flatOptions||{};for(i in e)void 0!==e[i]&&((o[i]?t:n||(n={}))[i]=e[i]);return n&&_.extend(!0,t,n),t}Ee=Fe.exec($e.toLowerCase())||[],_.extend({active:0,lastModified:{},etag:{},ajaxSettings:{url:$e,type:"GET",isLocal:/^(?:about|app|app-storage|.+-extension|file|res|widget):$/.test(Ee[1]),global:!0,processData:!0,async:!0,contentType:"application/x-www-form-urlencoded; charset=UTF-8",accepts:{"*":Ie,text:"text/plain",html:"text/html",xml:"application/xml, text/xml",json:"application/json, text/javascript"},contents:{xml:/xml/,html:/html/,json:/json/},responseFields:{xml:"responseXML",text:"responseText",json:"responseJSON"},converters:{"* text":String,"text html":!0,"text json":_.parseJSON,"text xml":_.parseXML},flatOptions:{url:!0,context:!0}},ajaxSetup:function(t,e){return e?qe(qe(t,_.ajaxSettings),e):qe(_.ajaxSettings,t)},ajaxPrefilter:He(Ne),ajaxTransport:He(Pe),ajax:function(t,e){"object"==typeof t&&(e=t,t=void 0),e=e||{};var n,i,u,d,h,p,f,o,m=_.ajaxSetup({},e),g=m.context||m,y=m.context&&(g.nodeType||g.jquery)?_(g):_.event,v=_.Deferred(),b=_.Callbacks("once memory"),w=m.statusCode||{},r={},s={},x=0,a="canceled",k={readyState:0,getResponseHeader:function(t){var e;if(2===x){if(!o)for(o={};e=Oe.exec(d);)o[e[1].toLowerCase()]=e[2];e=o[t.toLowerCase()]}return null==e?null:e},getAllResponseHeaders:function(){return 2===x?d:null},setRequestHeader:function(t,e){var n=t.toLowerCase();return x||(t=s[n]=s[n]||t,r[t]=e),this},overrideMimeType:function(t){return x||(m.mimeType=t),this},statusCode:function(t){var e;if(t)if(x<2)for(e in t)w[e]=[w[e],t[e]];else k.always(t[k.status]);return this},abort:function(t){var e=t||a;return f&&f.abort(e),l(0,e),this}};if(v.promise(k).complete=b.add,k.success=k.done,k.error=k.fail,m.url=((t||m.url||$e)+"").replace(Le,"").replace(je,Ee[1]+"//"),m.type=e.method||e.type||m.method||m.type,m.dataTypes=_.trim(m.dataType||"*").toLowerCase().match(M)||[""],null==m.crossDomain&&(n=Fe.exec(m.url.toLowerCase()),m.crossDomain=!(!n||n[1]===Ee[1]&&n[2]===Ee[2]&&(n[3]||("http:"===n[1]?"80":"443"))===(Ee[3]||("http:"===Ee[1]?"80":"443")))),m.data&&m.processData&&"string"!=typeof m.data&&(m.data=_.param(m.data,m.traditional)),Ye(Ne,m,e,k),2===x)return k;for(i in(p=m.global)&&0==_.active++&&_.event.trigger("ajaxStart"),m.type=m.type.toUpperCase(),m.hasContent=!Ae.test(m.type),u=m.url,m.hasContent||(m.data&&(u=m.url+=(Se.test(u)?"&":"?")+m.data,delete m.data),!1===m.cache&&(m.url=Me.test(u)?u.replace(Me,"$1_="+Te++):u+(Se.test(u)?"&":"?")+"_="+Te++)),m.ifModified&&(_.lastModified[u]&&k.setRequestHeader("If-Modified-Since",_.lastModified[u]),_.etag[u]&&k.setRequestHeader("If-None-Match",_.etag[u])),(m.data&&m.hasContent&&!1!==m.contentType||e.contentType)&&k.setRequestHeader("Content-Type",m.contentType),k.setRequestHeader("Accept",m.dataTypes[0]&&m.accepts[m.dataTypes[0]]?m.accepts[m.dataTypes[0]]+("*"!==m.dataTypes[0]?", "+Ie+"; q=0.01":""):m.accepts["*"]),m.headers)k.setRequestHeader(i,m.headers[i]);if(m.beforeSend&&(!1===m.beforeSend.call(g,k,m)||2===x))return k.abort();for(i in a="abort",{success:1,error:1,complete:1})k[i](m[i]);if(f=Ye(Pe,m,e,k)){k.readyState=1,p&&y.trigger("ajaxSend",[k,m]),m.async&&0<m.timeout&&(h=setTimeout(function(){k.abort("timeout")},m.timeout));try{x=1,f.send(r,l)}catch(t){if(!(x<2))throw t;l(-1,t)}}else l(-1,"No Transport");function l(t,e,n,i){var o,r,s,a,l,c=e;2!==x&&(x=2,h&&clearTimeout(h),f=void 0,d=i||"",k.readyState=0<t?4:0,o=200<=t&&t<300||304===t,n&&(a=function(t,e,n){for(var i,o,r,s,a=t.contents,l=t.dataTypes;"*"===l[0];)l.shift(),void 0===o&&(o=t.mimeType||e.getResponseHeader("Content-Type"));if(o)for(s in a)if(a[s]&&a[s].test(o)){l.unshift(s);break}if(l[0]in n)r=l[0];else{for(s in n){if(!l[0]||t.converters[s+" "+l[0]]){r=s;break}i||(i=s)}r=r||i}return r?(r!==l[0]&&l.unshift(r),n[r]):void 0}(m,k,n)),a=function(t,e,n,i){var o,r,s,a,l,c={},u=t.dataTypes.slice();if(u[1])for(s in t.converters)c[s.toLowerCase()]=t.converters[s];for(r=u.shift();r;)if(t.responseFields[r]&&(n[t.responseFields[r]]=e),!l&&i&&t.dataFilter&&(e=t.dataFilter(e,t.dataType)),l=r,r=u.shift())if("*"===r)r=l;else if("*"!==l&&l!==r){if(!(s=c[l+" "+r]||c["* "+r]))for(o in c)if((a=o.split(" "))[1]===r&&(s=c[l+" "+a[0]]||c["* "+a[0]])){!0===s?s=c[o]:!0!==c[o]&&(r=a[0],u.unshift(a[1]));break}if(!0!==s)if(s&&t.throws)e=s(e);else try{e=s(e)}catch(t){return{state:"parsererror",error:s?t:"No conversion from "+l+" to "+r}}}return{state:"success",data:e}}(m,a,k,o),o?(m.ifModified&&((l=k.getResponseHeader("Last-Modified"))&&(_.lastModified[u]=l),(l=k.getResponseHeader("etag"))&&(_.etag[u]=l)),204===t||"HEAD"===m.type?c="nocontent":304===t?c="notmodified":(c=a.state,r=a.data,o=!(s=a.error))):(s=c,(t||!c)&&(c="error",t<0&&(t=0))),k.status=t,k.statusText=(e||c)+"",o?v.resolveWith(g,[r,c,k]):v.rejectWith(g,[k,c,s]),k.statusCode(w),w=void 0,p&&y.trigger(o?"ajaxSuccess":"ajaxError",[k,m,o?r:s]),b.fireWith(g,[k,c]),p&&(y.trigger("ajaxComplete",[k,m]),--_.active||_.event.trigger("ajaxStop")))}return k},getJSON:function(t,e,n){return _.get(t,e,n,"json")},getScript:function(t,e){return _.get(t,void 0,e,"script")}}),_.each(["get","post"],function(t,o){_[o]=function(t,e,n,i){return _.isFunction(e)&&(i=i||n,n=e,e=void 0),_.ajax({url:t,type:o,dataType:i,data:e,success:n})}}),_.each(["ajaxStart","ajaxStop","ajaxComplete","ajaxError","ajaxSuccess","ajaxSend"],function(t,e){_.fn[e]=function(t){return this.on(e,t)}}),_._evalUrl=function(t){return _.ajax({url:t,type:"GET",dataType:"script",async:!1,global:!1,throws:!0})},_.fn.extend({wrapAll:function(e){if(_.isFunction(e))return this.each(function(t){_(this).wrapAll(e.call(this,t))});if(this[0]){var t=_(e,this[0].ownerDocument).eq(0).clone(!0);this[0].parentNode&&t.insertBefore(this[0]),t.map(function(){for(var t=this;t.firstChild&&1===t.firstChild.nodeType;)t=t.firstChild;return t}).append(this)}return this},wrapInner:function(n){return this.each(_.isFunction(n)?function(t){_(this).wrapInner(n.call(this,t))}:function(){var t=_(this),e=t.contents();e.length?e.wrapAll(n):t.append(n)})},wrap:function(e){var n=_.isFunction(e);return this.each(function(t){_(this).wrapAll(n?e.call(this,t):e)})},unwrap:function(){return this.parent().each(function(){_.nodeName(this,"body")||_(this).replaceWith(this.childNodes)}).end()}}),_.expr.filters.hidden=function(t){return t.offsetWidth<=0&&t.offsetHeight<=0||!y.reliableHiddenOffsets()&&"none"===(t.style&&t.style.display||_.css(t,"display"))},_.expr.filters.visible=function(t){return!_.expr.filters.hidden(t)};var Re=/%20/g,We=/\[\]$/,Be=/\r?\n/g,Ge=/^(?:submit|button|image|reset|file)$/i,Ue=/^(?:input|select|textarea|keygen)/i;function ze(n,t,i,o){var e;if(_.isArray(t))_.each(t,function(t,e){i||We.test(n)?o(n,e):ze(n+"["+("object"==typeof e?t:"")+"]",e,i,o)});else if(i||"object"!==_.type(t))o(n,t);else for(e in t)ze(n+"["+e+"]",t[e],i,o)}_.param=function(t,e){var n,i=[],o=function(t,e){e=_.isFunction(e)?e():null==e?"":e,i[i.length]=encodeURIComponent(t)+"="+encodeURIComponent(e)};if(void 0===e&&(e=_.ajaxSettings&&_.ajaxSettings.traditional),_.isArray(t)||t.jquery&&!_.isPlainObject(t))_.each(t,function(){o(this.name,this.value)});else for(n in t)ze(n,t[n],e,o);return i.join("&").replace(Re,"+")},_.fn.extend({serialize:function(){return _.param(this.serializeArray())},serializeArray:function(){return this.map(function(){var t=_.prop(this,"elements");return t?_.makeArray(t):this}).filter(function(){var t=this.type;return this.name&&!_(this).is(":disabled")&&Ue.test(this.nodeName)&&!Ge.test(t)&&(this.checked||!z.test(t))}).map(function(t,e){var n=_(this).val();return null==n?null:_.isArray(n)?_.map(n,function(t){return{name:e.name,value:t.replace(Be,"\r\n")}}):{name:e.name,value:n.replace(Be,"\r\n")}}).get()}}),_.ajaxSettings.xhr=void 0!==f.ActiveXObject?function(){return!this.isLocal&&/^(get|post|head|put|delete|options)$/i.test(this.type)&&Qe()||function(){try{return new f.ActiveXObject("Microsoft.XMLHTTP")}catch(t){}}()}:Qe;var Ve=0,Ze={},Xe=_.ajaxSettings.xhr();function Qe(){try{return new f.XMLHttpRequest}catch(t){}}f.ActiveXObject&&_(f).on("unload",function(){for(var t in Ze)Ze[t](void 0,!0)}),y.cors=!!Xe&&"withCredentials"in Xe,(Xe=y.ajax=!!Xe)&&_.ajaxTransport(function(l){var c;if(!l.crossDomain||y.cors)return{send:function(t,r){var e,s=l.xhr(),a=++Ve;if(s.open(l.type,l.url,l.async,l.username,l.password),l.xhrFields)for(e in l.xhrFields)s[e]=l.xhrFields[e];for(e in l.mimeType&&s.overrideMimeType&&s.overrideMimeType(l.mimeType),l.crossDomain||t["X-Requested-With"]||(t["X-Requested-With"]="XMLHttpRequest"),t)void 0!==t[e]&&s.setRequestHeader(e,t[e]+"");s.send(l.hasContent&&l.data||null),c=function(t,e){var n,i,o;if(c&&(e||4===s.readyState))if(delete Ze[a],c=void 0,s.onreadystatechange=_.noop,e)4!==s.readyState&&s.abort();else{o={},n=s.status,"string"==typeof s.responseText&&(o.text=s.responseText);try{i=s.statusText}catch(t){i=""}n||!l.isLocal||l.crossDomain?1223===n&&(n=204):n=o.text?200:404}o&&r(n,i,o,s.getAllResponseHeaders())},l.async?4===s.readyState?setTimeout(c):s.onreadystatechange=Ze[a]=c:c()},abort:function(){c&&c(void 0,!0)}}}),_.ajaxSetup({accepts:{script:"text/javascript, application/javascript, application/ecmascript, application/x-ecmascript"},contents:{script:/(?:java|ecma)script/},converters:{"text script":function(t){return _.globalEval(t),t}}}),_.ajaxPrefilter("script",function(t){void 0===t.cache&&(t.cache=!1),t.crossDomain&&(t.type="GET",t.global=!1)}),_.ajaxTransport("script",function(e){if(e.crossDomain){var i,o=T.head||_("head")[0]||T.documentElement;return{send:function(t,n){(i=T.createElement("script")).async=!0,e.scriptCharset&&(i.charset=e.scriptCharset),i.src=e.url,i.onload=i.onreadystatechange=function(t,e){(e||!i.readyState||/loaded|complete/.test(i.readyState))&&(i.onload=i.onreadystatechange=null,i.parentNode&&i.parentNode.removeChild(i),i=null,e||n(200,"success"))},o.insertBefore(i,o.firstChild)},abort:function(){i&&i.onload(void 0,!0)}}}});var Je=[],Ke=/(=)\?(?=&|$)|\?\?/;_.ajaxSetup({jsonp:"callback",jsonpCallback:function(){var t=Je.pop()||_.expando+"_"+Te++;return this[t]=!0,t}}),_.ajaxPrefilter("json jsonp",function(t,e,n){var i,o,r,s=!1!==t.jsonp&&(Ke.test(t.url)?"url":"string"==typeof t.data&&!(t.contentType||"").indexOf("application/x-www-form-urlencoded")&&Ke.test(t.data)&&"data");return s||"jsonp"===t.dataTypes[0]?(i=t.jsonpCallback=_.isFunction(t.jsonpCallback)?t.jsonpCallback():t.jsonpCallback,s?t[s]=t[s].replace(Ke,"$1"+i):!1!==t.jsonp&&(t.url+=(Se.test(t.url)?"&":"?")+t.jsonp+"="+i),t.converters["script json"]=function(){return r||_.error(i+" was not called"),r[0]},t.dataTypes[0]="json",o=f[i],f[i]=function(){r=arguments},n.always(function(){f[i]=o,t[i]&&(t.jsonpCallback=e.jsonpCallback,Je.push(i)),r&&_.isFunction(o)&&o(r[0]),r=o=void 0}),"script"):void 0}),_.parseHTML=function(t,e,n){if(!t||"string"!=typeof t)return null;"boolean"==typeof e&&(n=e,e=!1),e=e||T;var i=w.exec(t),o=!n&&[];return i?[e.createElement(i[1])]:(i=_.buildFragment([t],e,o),o&&o.length&&_(o).remove(),_.merge([],i.childNodes))};var tn=_.fn.load;_.fn.load=function(t,e,n){if("string"!=typeof t&&tn)return tn.apply(this,arguments);var i,o,r,s=this,a=t.indexOf(" ");return 0<=a&&(i=t.slice(a,t.length),t=t.slice(0,a)),_.isFunction(e)?(n=e,e=void 0):e&&"object"==typeof e&&(r="POST"),0<s.length&&_.ajax({url:t,type:r,dataType:"html",data:e}).done(function(t){o=arguments,s.html(i?_("<div>").append(_.parseHTML(t)).find(i):t)}).complete(n&&function(t,e){s.each(n,o||[t.responseText,e,t])}),this},_.expr.filters.animated=function(e){return _.grep(_.timers,function(t){return e===t.elem}).length};var en=f.document.documentElement;function nn(t){return _.isWindow(t)?t:9===t.nodeType&&(t.defaultView||t.parentWindow)}_.offset={setOffset:function(t,e,n){var i,o,r,s,a,l,c=_.css(t,"position"),u=_(t),d={};"static"===c&&(t.style.position="relative"),a=u.offset(),r=_.css(t,"top"),l=_.css(t,"left"),o=("absolute"===c||"fixed"===c)&&-1<_.inArray("auto",[r,l])?(s=(i=u.position()).top,i.left):(s=parseFloat(r)||0,parseFloat(l)||0),_.isFunction(e)&&(e=e.call(t,n,a)),null!=e.top&&(d.top=e.top-a.top+s),null!=e.left&&(d.left=e.left-a.left+o),"using"in e?e.using.call(t,d):u.css(d)}},_.fn.extend({offset:function(e){if(arguments.length)return void 0===e?this:this.each(function(t){_.offset.setOffset(this,e,t)});var t,n,i={top:0,left:0},o=this[0],r=o&&o.ownerDocument;return r?(t=r.documentElement,_.contains(t,o)?(typeof o.getBoundingClientRect!==N&&(i=o.getBoundingClientRect()),n=nn(r),{top:i.top+(n.pageYOffset||t.scrollTop)-(t.clientTop||0),left:i.left+(n.pageXOffset||t.scrollLeft)-(t.clientLeft||0)}):i):void 0},position:function(){if(this[0]){var t,e,n={top:0,left:0},i=this[0];return"fixed"===_.css(i,"position")?e=i.getBoundingClientRect():(t=this.offsetParent(),e=this.offset(),_.nodeName(t[0],"html")||(n=t.offset()),n.top+=_.css(t[0],"borderTopWidth",!0),n.left+=_.css(t[0],"borderLeftWidth",!0)),{top:e.top-n.top-_.css(i,"marginTop",!0),left:e.left-n.left-_.css(i,"marginLeft",!0)}}},offsetParent:function(){return this.map(function(){for(var t=this.offsetParent||en;t&&!_.nodeName(t,"html")&&"static"===_.css(t,"position");)t=t.offsetParent;return t||en})}}),_.each({scrollLeft:"pageXOffset",scrollTop:"pageYOffset"},function(e,o){var r=/Y/.test(o);_.fn[e]=function(t){return U(this,function(t,e,n){var i=nn(t);return void 0===n?i?o in i?i[o]:i.document.documentElement[e]:t[e]:void(i?i.scrollTo(r?_(i).scrollLeft():n,r?n:_(i).scrollTop()):t[e]=n)},e,t,arguments.length,null)}}),_.each(["top","left"],function(t,n){_.cssHooks[n]=It(y.pixelPosition,function(t,e){return e?(e=jt(t,n),Nt.test(e)?_(t).position()[n]+"px":e):void 0})}),_.each({Height:"height",Width:"width"},function(r,s){_.each({padding:"inner"+r,content:s,"":"outer"+r},function(i,t){_.fn[t]=function(t,e){var n=arguments.length&&(i||"boolean"!=typeof t),o=i||(!0===t||!0===e?"margin":"border");return U(this,function(t,e,n){var i;return _.isWindow(t)?t.document.documentElement["client"+r]:9===t.nodeType?(i=t.documentElement,Math.max(t.body["scroll"+r],i["scroll"+r],t.body["offset"+r],i["offset"+r],i["client"+r])):void 0===n?_.css(t,e,o):_.style(t,e,n,o)},s,n?t:void 0,n,null)}})}),_.fn.size=function(){return this.length},_.fn.andSelf=_.fn.addBack,"function"==typeof define&&define.amd&&define("jquery",[],function(){return _});var on=f.jQuery,rn=f.$;return _.noConflict=function(t){return f.$===_&&(f.$=rn),t&&f.jQuery===_&&(f.jQuery=on),_},typeof t===N&&(f.jQuery=f.$=_),_}),"undefined"==typeof jQuery)throw new Error("Bootstrap's JavaScript requires jQuery");!function(i){i.fn.emulateTransitionEnd=function(t){var e=!1,n=this;i(this).one(i.support.transition.end,function(){e=!0});return setTimeout(function(){e||i(n).trigger(i.support.transition.end)},t),this},i(function(){i.support.transition=function(){var t=document.createElement("bootstrap"),e={WebkitTransition:"webkitTransitionEnd",MozTransition:"transitionend",OTransition:"oTransitionEnd otransitionend",transition:"transitionend"};for(var n in e)if(void 0!==t.style[n])return{end:e[n]};return!1}()})}(jQuery),function(r){var e='[data-dismiss="alert"]',i=function(t){r(t).on("click",e,this.close)};i.prototype.close=function(t){var e=r(this),n=e.attr("data-target");n||(n=(n=e.attr("href"))&&n.replace(/.*(?=#[^\s]*$)/,""));var i=r(n);function o(){i.trigger("closed.bs.alert").remove()}t&&t.preventDefault(),i.length||(i=e.hasClass("alert")?e:e.parent()),i.trigger(t=r.Event("close.bs.alert")),t.isDefaultPrevented()||(i.removeClass("in"),r.support.transition&&i.hasClass("fade")?i.one(r.support.transition.end,o).emulateTransitionEnd(150):o())};var t=r.fn.alert;r.fn.alert=function(n){return this.each(function(){var t=r(this),e=t.data("bs.alert");e||t.data("bs.alert",e=new i(this)),"string"==typeof n&&e[n].call(t)})},r.fn.alert.Constructor=i,r.fn.alert.noConflict=function(){return r.fn.alert=t,this},r(document).on("click.bs.alert.data-api",e,i.prototype.close)}(jQuery),function(r){var o=function(t,e){this.$element=r(t),this.options=r.extend({},o.DEFAULTS,e),this.isLoading=!1};o.DEFAULTS={loadingText:"loading..."},o.prototype.setState=function(t){var e="disabled",n=this.$element,i=n.is("input")?"val":"html",o=n.data();t+="Text",o.resetText||n.data("resetText",n[i]()),n[i](o[t]||this.options[t]),setTimeout(r.proxy(function(){"loadingText"==t?(this.isLoading=!0,n.addClass(e).attr(e,e)):this.isLoading&&(this.isLoading=!1,n.removeClass(e).removeAttr(e))},this),0)},o.prototype.toggle=function(){var t=!0,e=this.$element.closest('[data-toggle="buttons"]');if(e.length){var n=this.$element.find("input");"radio"==n.prop("type")&&(n.prop("checked")&&this.$element.hasClass("active")?t=!1:e.find(".active").removeClass("active")),t&&n.prop("checked",!this.$element.hasClass("active")).trigger("change")}t&&this.$element.toggleClass("active")};var t=r.fn.button;r.fn.button=function(i){return this.each(function(){var t=r(this),e=t.data("bs.button"),n="object"==typeof i&&i;e||t.data("bs.button",e=new o(this,n)),"toggle"==i?e.toggle():i&&e.setState(i)})},r.fn.button.Constructor=o,r.fn.button.noConflict=function(){return r.fn.button=t,this},r(document).on("click.bs.button.data-api","[data-toggle^=button]",function(t){var e=r(t.target);e.hasClass("btn")||(e=e.closest(".btn")),e.button("toggle"),t.preventDefault()})}(jQuery),function(c){var r=function(t,e){this.$element=c(t),this.$indicators=this.$element.find(".carousel-indicators"),this.options=e,this.paused=this.sliding=this.interval=this.$active=this.$items=null,"hover"==this.options.pause&&this.$element.on("mouseenter",c.proxy(this.pause,this)).on("mouseleave",c.proxy(this.cycle,this))};r.DEFAULTS={interval:5e3,pause:"hover",wrap:!0},r.prototype.cycle=function(t){return t||(this.paused=!1),this.interval&&clearInterval(this.interval),this.options.interval&&!this.paused&&(this.interval=setInterval(c.proxy(this.next,this),this.options.interval)),this},r.prototype.getActiveIndex=function(){return this.$active=this.$element.find(".item.active"),this.$items=this.$active.parent().children(),this.$items.index(this.$active)},r.prototype.to=function(t){var e=this,n=this.getActiveIndex();if(!(t>this.$items.length-1||t<0))return this.sliding?this.$element.one("slid.bs.carousel",function(){e.to(t)}):n==t?this.pause().cycle():this.slide(n<t?"next":"prev",c(this.$items[t]))},r.prototype.pause=function(t){return t||(this.paused=!0),this.$element.find(".next, .prev").length&&c.support.transition&&(this.$element.trigger(c.support.transition.end),this.cycle(!0)),this.interval=clearInterval(this.interval),this},r.prototype.next=function(){if(!this.sliding)return this.slide("next")},r.prototype.prev=function(){if(!this.sliding)return this.slide("prev")},r.prototype.slide=function(t,e){var n=this.$element.find(".item.active"),i=e||n[t](),o=this.interval,r="next"==t?"left":"right",s="next"==t?"first":"last",a=this;if(!i.length){if(!this.options.wrap)return;i=this.$element.find(".item")[s]()}if(i.hasClass("active"))return this.sliding=!1;var l=c.Event("slide.bs.carousel",{relatedTarget:i[0],direction:r});return this.$element.trigger(l),l.isDefaultPrevented()?void 0:(this.sliding=!0,o&&this.pause(),this.$indicators.length&&(this.$indicators.find(".active").removeClass("active"),this.$element.one("slid.bs.carousel",function(){var t=c(a.$indicators.children()[a.getActiveIndex()]);t&&t.addClass("active")})),c.support.transition&&this.$element.hasClass("slide")?(i.addClass(t),i[0].offsetWidth,n.addClass(r),i.addClass(r),n.one(c.support.transition.end,function(){i.removeClass([t,r].join(" ")).addClass("active"),n.removeClass(["active",r].join(" ")),a.sliding=!1,setTimeout(function(){a.$element.trigger("slid.bs.carousel")},0)}).emulateTransitionEnd(1e3*n.css("transition-duration").slice(0,-1))):(n.removeClass("active"),i.addClass("active"),this.sliding=!1,this.$element.trigger("slid.bs.carousel")),o&&this.cycle(),this)};var t=c.fn.carousel;c.fn.carousel=function(o){return this.each(function(){var t=c(this),e=t.data("bs.carousel"),n=c.extend({},r.DEFAULTS,t.data(),"object"==typeof o&&o),i="string"==typeof o?o:n.slide;e||t.data("bs.carousel",e=new r(this,n)),"number"==typeof o?e.to(o):i?e[i]():n.interval&&e.pause().cycle()})},c.fn.carousel.Constructor=r,c.fn.carousel.noConflict=function(){return c.fn.carousel=t,this},c(document).on("click.bs.carousel.data-api","[data-slide], [data-slide-to]",function(t){var e,n=c(this),i=c(n.attr("data-target")||(e=n.attr("href"))&&e.replace(/.*(?=#[^\s]+$)/,"")),o=c.extend({},i.data(),n.data()),r=n.attr("data-slide-to");r&&(o.interval=!1),i.carousel(o),(r=n.attr("data-slide-to"))&&i.data("bs.carousel").to(r),t.preventDefault()}),c(window).on("load",function(){c('[data-ride="carousel"]').each(function(){var t=c(this);t.carousel(t.data())})})}(jQuery),function(c){var o=function(t,e){this.$element=c(t),this.options=c.extend({},o.DEFAULTS,e),this.transitioning=null,this.options.parent&&(this.$parent=c(this.options.parent)),this.options.toggle&&this.toggle()};o.DEFAULTS={toggle:!0},o.prototype.dimension=function(){return this.$element.hasClass("width")?"width":"height"},o.prototype.show=function(){if(!this.transitioning&&!this.$element.hasClass("in")){var t=c.Event("show.bs.collapse");if(this.$element.trigger(t),!t.isDefaultPrevented()){var e=this.$parent&&this.$parent.find("> .panel > .in");if(e&&e.length){var n=e.data("bs.collapse");if(n&&n.transitioning)return;e.collapse("hide"),n||e.data("bs.collapse",null)}var i=this.dimension();this.$element.removeClass("collapse").addClass("collapsing")[i](0),this.transitioning=1;var o=function(){this.$element.removeClass("collapsing").addClass("collapse in")[i]("auto"),this.transitioning=0,this.$element.trigger("shown.bs.collapse")};if(!c.support.transition)return o.call(this);var r=c.camelCase(["scroll",i].join("-"));this.$element.one(c.support.transition.end,c.proxy(o,this)).emulateTransitionEnd(350)[i](this.$element[0][r])}}},o.prototype.hide=function(){if(!this.transitioning&&this.$element.hasClass("in")){var t=c.Event("hide.bs.collapse");if(this.$element.trigger(t),!t.isDefaultPrevented()){var e=this.dimension();this.$element[e](this.$element[e]())[0].offsetHeight,this.$element.addClass("collapsing").removeClass("collapse").removeClass("in"),this.transitioning=1;var n=function(){this.transitioning=0,this.$element.trigger("hidden.bs.collapse").removeClass("collapsing").addClass("collapse")};if(!c.support.transition)return n.call(this);this.$element[e](0).one(c.support.transition.end,c.proxy(n,this)).emulateTransitionEnd(350)}}},o.prototype.toggle=function(){this[this.$element.hasClass("in")?"hide":"show"]()};var t=c.fn.collapse;c.fn.collapse=function(i){return this.each(function(){var t=c(this),e=t.data("bs.collapse"),n=c.extend({},o.DEFAULTS,t.data(),"object"==typeof i&&i);!e&&n.toggle&&"show"==i&&(i=!i),e||t.data("bs.collapse",e=new o(this,n)),"string"==typeof i&&e[i]()})},c.fn.collapse.Constructor=o,c.fn.collapse.noConflict=function(){return c.fn.collapse=t,this},c(document).on("click.bs.collapse.data-api","[data-toggle=collapse]",function(t){var e,n=c(this),i=n.attr("data-target")||t.preventDefault()||(e=n.attr("href"))&&e.replace(/.*(?=#[^\s]+$)/,""),o=c(i),r=o.data("bs.collapse"),s=r?"toggle":n.data(),a=n.attr("data-parent"),l=a&&c(a);r&&r.transitioning||(l&&l.find('[data-toggle=collapse][data-parent="'+a+'"]').not(n).addClass("collapsed"),n[o.hasClass("in")?"addClass":"removeClass"]("collapsed")),o.collapse(s)})}(jQuery),function(a){var l="[data-toggle=dropdown]",i=function(t){a(t).on("click.bs.dropdown",this.toggle)};function r(n){a(".dropdown-backdrop").remove(),a(l).each(function(){var t=c(a(this)),e={relatedTarget:this};t.hasClass("open")&&(t.trigger(n=a.Event("hide.bs.dropdown",e)),n.isDefaultPrevented()||t.removeClass("open").trigger("hidden.bs.dropdown",e))})}function c(t){var e=t.attr("data-target");e||(e=(e=t.attr("href"))&&/#[A-Za-z]/.test(e)&&e.replace(/.*(?=#[^\s]*$)/,""));var n=e&&a(e);return n&&n.length?n:t.parent()}i.prototype.toggle=function(t){var e=a(this);if(!e.is(".disabled, :disabled")){var n=c(e),i=n.hasClass("open");if(r(),!i){"ontouchstart"in document.documentElement&&!n.closest(".navbar-nav").length&&a('<div class="dropdown-backdrop"/>').insertAfter(a(this)).on("click",r);var o={relatedTarget:this};if(n.trigger(t=a.Event("show.bs.dropdown",o)),t.isDefaultPrevented())return;n.toggleClass("open").trigger("shown.bs.dropdown",o),e.focus()}return!1}},i.prototype.keydown=function(t){if(/(38|40|27)/.test(t.keyCode)){var e=a(this);if(t.preventDefault(),t.stopPropagation(),!e.is(".disabled, :disabled")){var n=c(e),i=n.hasClass("open");if(!i||i&&27==t.keyCode)return 27==t.which&&n.find(l).focus(),e.click();var o=" li:not(.divider):visible a",r=n.find("[role=menu]"+o+", [role=listbox]"+o);if(r.length){var s=r.index(r.filter(":focus"));38==t.keyCode&&0<s&&s--,40==t.keyCode&&s<r.length-1&&s++,~s||(s=0),r.eq(s).focus()}}}};var t=a.fn.dropdown;a.fn.dropdown=function(n){return this.each(function(){var t=a(this),e=t.data("bs.dropdown");e||t.data("bs.dropdown",e=new i(this)),"string"==typeof n&&e[n].call(t)})},a.fn.dropdown.Constructor=i,a.fn.dropdown.noConflict=function(){return a.fn.dropdown=t,this},a(document).on("click.bs.dropdown.data-api",r).on("click.bs.dropdown.data-api",".dropdown form",function(t){t.stopPropagation()}).on("click.bs.dropdown.data-api",l,i.prototype.toggle).on("keydown.bs.dropdown.data-api",l+", [role=menu], [role=listbox]",i.prototype.keydown)}(jQuery),function(r){var s=function(t,e){this.options=e,this.$element=r(t),this.$backdrop=this.isShown=null,this.options.remote&&this.$element.find(".modal-content").load(this.options.remote,r.proxy(function(){this.$element.trigger("loaded.bs.modal")},this))};s.DEFAULTS={backdrop:!0,keyboard:!0,show:!0},s.prototype.toggle=function(t){return this[this.isShown?"hide":"show"](t)},s.prototype.show=function(n){var i=this,t=r.Event("show.bs.modal",{relatedTarget:n});this.$element.trigger(t),this.isShown||t.isDefaultPrevented()||(this.isShown=!0,this.escape(),this.$element.on("click.dismiss.bs.modal",'[data-dismiss="modal"]',r.proxy(this.hide,this)),this.backdrop(function(){var t=r.support.transition&&i.$element.hasClass("fade");i.$element.parent().length||i.$element.appendTo(document.body),i.$element.show().scrollTop(0),t&&i.$element[0].offsetWidth,i.$element.addClass("in").attr("aria-hidden",!1),i.enforceFocus();var e=r.Event("shown.bs.modal",{relatedTarget:n});t?i.$element.find(".modal-dialog").one(r.support.transition.end,function(){i.$element.focus().trigger(e)}).emulateTransitionEnd(300):i.$element.focus().trigger(e)}))},s.prototype.hide=function(t){t&&t.preventDefault(),t=r.Event("hide.bs.modal"),this.$element.trigger(t),this.isShown&&!t.isDefaultPrevented()&&(this.isShown=!1,this.escape(),r(document).off("focusin.bs.modal"),this.$element.removeClass("in").attr("aria-hidden",!0).off("click.dismiss.bs.modal"),r.support.transition&&this.$element.hasClass("fade")?this.$element.one(r.support.transition.end,r.proxy(this.hideModal,this)).emulateTransitionEnd(300):this.hideModal())},s.prototype.enforceFocus=function(){r(document).off("focusin.bs.modal").on("focusin.bs.modal",r.proxy(function(t){this.$element[0]===t.target||this.$element.has(t.target).length||this.$element.focus()},this))},s.prototype.escape=function(){this.isShown&&this.options.keyboard?this.$element.on("keyup.dismiss.bs.modal",r.proxy(function(t){27==t.which&&this.hide()},this)):this.isShown||this.$element.off("keyup.dismiss.bs.modal")},s.prototype.hideModal=function(){var t=this;this.$element.hide(),this.backdrop(function(){t.removeBackdrop(),t.$element.trigger("hidden.bs.modal")})},s.prototype.removeBackdrop=function(){this.$backdrop&&this.$backdrop.remove(),this.$backdrop=null},s.prototype.backdrop=function(t){var e=this.$element.hasClass("fade")?"fade":"";if(this.isShown&&this.options.backdrop){var n=r.support.transition&&e;if(this.$backdrop=r('<div class="modal-backdrop '+e+'" />').appendTo(document.body),this.$element.on("click.dismiss.bs.modal",r.proxy(function(t){t.target===t.currentTarget&&("static"==this.options.backdrop?this.$element[0].focus.call(this.$element[0]):this.hide.call(this))},this)),n&&this.$backdrop[0].offsetWidth,this.$backdrop.addClass("in"),!t)return;n?this.$backdrop.one(r.support.transition.end,t).emulateTransitionEnd(150):t()}else!this.isShown&&this.$backdrop?(this.$backdrop.removeClass("in"),r.support.transition&&this.$element.hasClass("fade")?this.$backdrop.one(r.support.transition.end,t).emulateTransitionEnd(150):t()):t&&t()};var t=r.fn.modal;r.fn.modal=function(i,o){return this.each(function(){var t=r(this),e=t.data("bs.modal"),n=r.extend({},s.DEFAULTS,t.data(),"object"==typeof i&&i);e||t.data("bs.modal",e=new s(this,n)),"string"==typeof i?e[i](o):n.show&&e.show(o)})},r.fn.modal.Constructor=s,r.fn.modal.noConflict=function(){return r.fn.modal=t,this},r(document).on("click.bs.modal.data-api",'[data-toggle="modal"]',function(t){var e=r(this),n=e.attr("href"),i=r(e.attr("data-target")||n&&n.replace(/.*(?=#[^\s]+$)/,"")),o=i.data("bs.modal")?"toggle":r.extend({remote:!/#/.test(n)&&n},i.data(),e.data());e.is("a")&&t.preventDefault(),i.modal(o,this).one("hide",function(){e.is(":visible")&&e.focus()})}),r(document).on("show.bs.modal",".modal",function(){r(document.body).addClass("modal-open")}).on("hidden.bs.modal",".modal",function(){r(document.body).removeClass("modal-open")})}(jQuery),function(y){var o=function(t,e){this.type=this.options=this.enabled=this.timeout=this.hoverState=this.$element=null,this.init("tooltip",t,e)};o.DEFAULTS={animation:!0,placement:"top",selector:!1,template:'<div class="tooltip"><div class="tooltip-arrow"></div><div class="tooltip-inner"></div></div>',trigger:"hover focus",title:"",delay:0,html:!1,container:!1},o.prototype.init=function(t,e,n){this.enabled=!0,this.type=t,this.$element=y(e),this.options=this.getOptions(n);for(var i=this.options.trigger.split(" "),o=i.length;o--;){var r=i[o];if("click"==r)this.$element.on("click."+this.type,this.options.selector,y.proxy(this.toggle,this));else if("manual"!=r){var s="hover"==r?"mouseenter":"focusin",a="hover"==r?"mouseleave":"focusout";this.$element.on(s+"."+this.type,this.options.selector,y.proxy(this.enter,this)),this.$element.on(a+"."+this.type,this.options.selector,y.proxy(this.leave,this))}}this.options.selector?this._options=y.extend({},this.options,{trigger:"manual",selector:""}):this.fixTitle()},o.prototype.getDefaults=function(){return o.DEFAULTS},o.prototype.getOptions=function(t){return(t=y.extend({},this.getDefaults(),this.$element.data(),t)).delay&&"number"==typeof t.delay&&(t.delay={show:t.delay,hide:t.delay}),t},o.prototype.getDelegateOptions=function(){var n={},i=this.getDefaults();return this._options&&y.each(this._options,function(t,e){i[t]!=e&&(n[t]=e)}),n},o.prototype.enter=function(t){var e=t instanceof this.constructor?t:y(t.currentTarget)[this.type](this.getDelegateOptions()).data("bs."+this.type);if(clearTimeout(e.timeout),e.hoverState="in",!e.options.delay||!e.options.delay.show)return e.show();e.timeout=setTimeout(function(){"in"==e.hoverState&&e.show()},e.options.delay.show)},o.prototype.leave=function(t){var e=t instanceof this.constructor?t:y(t.currentTarget)[this.type](this.getDelegateOptions()).data("bs."+this.type);if(clearTimeout(e.timeout),e.hoverState="out",!e.options.delay||!e.options.delay.hide)return e.hide();e.timeout=setTimeout(function(){"out"==e.hoverState&&e.hide()},e.options.delay.hide)},o.prototype.show=function(){var t=y.Event("show.bs."+this.type);if(this.hasContent()&&this.enabled){if(this.$element.trigger(t),t.isDefaultPrevented())return;var e=this,n=this.tip();this.setContent(),this.options.animation&&n.addClass("fade");var i="function"==typeof this.options.placement?this.options.placement.call(this,n[0],this.$element[0]):this.options.placement,o=/\s?auto?\s?/i,r=o.test(i);r&&(i=i.replace(o,"")||"top"),n.detach().css({top:0,left:0,display:"block"}).addClass(i),this.options.container?n.appendTo(this.options.container):n.insertAfter(this.$element);var s=this.getPosition(),a=n[0].offsetWidth,l=n[0].offsetHeight;if(r){var c=this.$element.parent(),u=i,d=document.documentElement.scrollTop||document.body.scrollTop,h="body"==this.options.container?window.innerWidth:c.outerWidth(),p="body"==this.options.container?window.innerHeight:c.outerHeight(),f="body"==this.options.container?0:c.offset().left;i="bottom"==i&&s.top+s.height+l-d>p?"top":"top"==i&&s.top-d-l<0?"bottom":"right"==i&&s.right+a>h?"left":"left"==i&&s.left-a<f?"right":i,n.removeClass(u).addClass(i)}var m=this.getCalculatedOffset(i,s,a,l);this.applyPlacement(m,i),this.hoverState=null;var g=function(){e.$element.trigger("shown.bs."+e.type)};y.support.transition&&this.$tip.hasClass("fade")?n.one(y.support.transition.end,g).emulateTransitionEnd(150):g()}},o.prototype.applyPlacement=function(t,e){var n,i=this.tip(),o=i[0].offsetWidth,r=i[0].offsetHeight,s=parseInt(i.css("margin-top"),10),a=parseInt(i.css("margin-left"),10);isNaN(s)&&(s=0),isNaN(a)&&(a=0),t.top=t.top+s,t.left=t.left+a,y.offset.setOffset(i[0],y.extend({using:function(t){i.css({top:Math.round(t.top),left:Math.round(t.left)})}},t),0),i.addClass("in");var l=i[0].offsetWidth,c=i[0].offsetHeight;if("top"==e&&c!=r&&(n=!0,t.top=t.top+r-c),/bottom|top/.test(e)){var u=0;t.left<0&&(u=-2*t.left,t.left=0,i.offset(t),l=i[0].offsetWidth,c=i[0].offsetHeight),this.replaceArrow(u-o+l,l,"left")}else this.replaceArrow(c-r,c,"top");n&&i.offset(t)},o.prototype.replaceArrow=function(t,e,n){this.arrow().css(n,t?50*(1-t/e)+"%":"")},o.prototype.setContent=function(){var t=this.tip(),e=this.getTitle();t.find(".tooltip-inner")[this.options.html?"html":"text"](e),t.removeClass("fade in top bottom left right")},o.prototype.hide=function(){var t=this,e=this.tip(),n=y.Event("hide.bs."+this.type);function i(){"in"!=t.hoverState&&e.detach(),t.$element.trigger("hidden.bs."+t.type)}if(this.$element.trigger(n),!n.isDefaultPrevented())return e.removeClass("in"),y.support.transition&&this.$tip.hasClass("fade")?e.one(y.support.transition.end,i).emulateTransitionEnd(150):i(),this.hoverState=null,this},o.prototype.fixTitle=function(){var t=this.$element;(t.attr("title")||"string"!=typeof t.attr("data-original-title"))&&t.attr("data-original-title",t.attr("title")||"").attr("title","")},o.prototype.hasContent=function(){return this.getTitle()},o.prototype.getPosition=function(){var t=this.$element[0];return y.extend({},"function"==typeof t.getBoundingClientRect?t.getBoundingClientRect():{width:t.offsetWidth,height:t.offsetHeight},this.$element.offset())},o.prototype.getCalculatedOffset=function(t,e,n,i){return"bottom"==t?{top:e.top+e.height,left:e.left+e.width/2-n/2}:"top"==t?{top:e.top-i,left:e.left+e.width/2-n/2}:"left"==t?{top:e.top+e.height/2-i/2,left:e.left-n}:{top:e.top+e.height/2-i/2,left:e.left+e.width}},o.prototype.getTitle=function(){var t=this.$element,e=this.options;return t.attr("data-original-title")||("function"==typeof e.title?e.title.call(t[0]):e.title)},o.prototype.tip=function(){return this.$tip=this.$tip||y(this.options.template)},o.prototype.arrow=function(){return this.$arrow=this.$arrow||this.tip().find(".tooltip-arrow")},o.prototype.validate=function(){this.$element[0].parentNode||(this.hide(),this.$element=null,this.options=null)},o.prototype.enable=function(){this.enabled=!0},o.prototype.disable=function(){this.enabled=!1},o.prototype.toggleEnabled=function(){this.enabled=!this.enabled},o.prototype.toggle=function(t){var e=t?y(t.currentTarget)[this.type](this.getDelegateOptions()).data("bs."+this.type):this;e.tip().hasClass("in")?e.leave(e):e.enter(e)},o.prototype.destroy=function(){clearTimeout(this.timeout),this.hide().$element.off("."+this.type).removeData("bs."+this.type)};var t=y.fn.tooltip;y.fn.tooltip=function(i){return this.each(function(){var t=y(this),e=t.data("bs.tooltip"),n="object"==typeof i&&i;(e||"destroy"!=i)&&(e||t.data("bs.tooltip",e=new o(this,n)),"string"==typeof i&&e[i]())})},y.fn.tooltip.Constructor=o,y.fn.tooltip.noConflict=function(){return y.fn.tooltip=t,this}}(jQuery),function(o){var r=function(t,e){this.init("popover",t,e)};if(!o.fn.tooltip)throw new Error("Popover requires tooltip.js");r.DEFAULTS=o.extend({},o.fn.tooltip.Constructor.DEFAULTS,{placement:"right",trigger:"click",content:"",template:'<div class="popover"><div class="arrow"></div><h3 class="popover-title"></h3><div class="popover-content"></div></div>'}),((r.prototype=o.extend({},o.fn.tooltip.Constructor.prototype)).constructor=r).prototype.getDefaults=function(){return r.DEFAULTS},r.prototype.setContent=function(){var t=this.tip(),e=this.getTitle(),n=this.getContent();t.find(".popover-title")[this.options.html?"html":"text"](e),t.find(".popover-content")[this.options.html?"string"==typeof n?"html":"append":"text"](n),t.removeClass("fade top bottom left right in"),t.find(".popover-title").html()||t.find(".popover-title").hide()},r.prototype.hasContent=function(){return this.getTitle()||this.getContent()},r.prototype.getContent=function(){var t=this.$element,e=this.options;return t.attr("data-content")||("function"==typeof e.content?e.content.call(t[0]):e.content)},r.prototype.arrow=function(){return this.$arrow=this.$arrow||this.tip().find(".arrow")},r.prototype.tip=function(){return this.$tip||(this.$tip=o(this.options.template)),this.$tip};var t=o.fn.popover;o.fn.popover=function(i){return this.each(function(){var t=o(this),e=t.data("bs.popover"),n="object"==typeof i&&i;(e||"destroy"!=i)&&(e||t.data("bs.popover",e=new r(this,n)),"string"==typeof i&&e[i]())})},o.fn.popover.Constructor=r,o.fn.popover.noConflict=function(){return o.fn.popover=t,this}}(jQuery),function(r){function o(t,e){var n,i=r.proxy(this.process,this);this.$element=r(t).is("body")?r(window):r(t),this.$body=r("body"),this.$scrollElement=this.$element.on("scroll.bs.scroll-spy.data-api",i),this.options=r.extend({},o.DEFAULTS,e),this.selector=(this.options.target||(n=r(t).attr("href"))&&n.replace(/.*(?=#[^\s]+$)/,"")||"")+" .nav li > a",this.offsets=r([]),this.targets=r([]),this.activeTarget=null,this.refresh(),this.process()}o.DEFAULTS={offset:10},o.prototype.refresh=function(){var i=this.$element[0]==window?"offset":"position";this.offsets=r([]),this.targets=r([]);var o=this;this.$body.find(this.selector).map(function(){var t=r(this),e=t.data("target")||t.attr("href"),n=/^#./.test(e)&&r(e);return n&&n.length&&n.is(":visible")&&[[n[i]().top+(!r.isWindow(o.$scrollElement.get(0))&&o.$scrollElement.scrollTop()),e]]||null}).sort(function(t,e){return t[0]-e[0]}).each(function(){o.offsets.push(this[0]),o.targets.push(this[1])})},o.prototype.process=function(){var t,e=this.$scrollElement.scrollTop()+this.options.offset,n=(this.$scrollElement[0].scrollHeight||this.$body[0].scrollHeight)-this.$scrollElement.height(),i=this.offsets,o=this.targets,r=this.activeTarget;if(n<=e)return r!=(t=o.last()[0])&&this.activate(t);if(r&&e<=i[0])return r!=(t=o[0])&&this.activate(t);for(t=i.length;t--;)r!=o[t]&&e>=i[t]&&(!i[t+1]||e<=i[t+1])&&this.activate(o[t])},o.prototype.activate=function(t){this.activeTarget=t,r(this.selector).parentsUntil(this.options.target,".active").removeClass("active");var e=this.selector+'[data-target="'+t+'"],'+this.selector+'[href="'+t+'"]',n=r(e).parents("li").addClass("active");n.parent(".dropdown-menu").length&&(n=n.closest("li.dropdown").addClass("active")),n.trigger("activate.bs.scrollspy")};var t=r.fn.scrollspy;r.fn.scrollspy=function(i){return this.each(function(){var t=r(this),e=t.data("bs.scrollspy"),n="object"==typeof i&&i;e||t.data("bs.scrollspy",e=new o(this,n)),"string"==typeof i&&e[i]()})},r.fn.scrollspy.Constructor=o,r.fn.scrollspy.noConflict=function(){return r.fn.scrollspy=t,this},r(window).on("load",function(){r('[data-spy="scroll"]').each(function(){var t=r(this);t.scrollspy(t.data())})})}(jQuery),function(s){var i=function(t){this.element=s(t)};i.prototype.show=function(){var t=this.element,e=t.closest("ul:not(.dropdown-menu)"),n=t.data("target");if(n||(n=(n=t.attr("href"))&&n.replace(/.*(?=#[^\s]*$)/,"")),!t.parent("li").hasClass("active")){var i=e.find(".active:last a")[0],o=s.Event("show.bs.tab",{relatedTarget:i});if(t.trigger(o),!o.isDefaultPrevented()){var r=s(n);this.activate(t.parent("li"),e),this.activate(r,r.parent(),function(){t.trigger({type:"shown.bs.tab",relatedTarget:i})})}}},i.prototype.activate=function(t,e,n){var i=e.find("> .active"),o=n&&s.support.transition&&i.hasClass("fade");function r(){i.removeClass("active").find("> .dropdown-menu > .active").removeClass("active"),t.addClass("active"),o?(t[0].offsetWidth,t.addClass("in")):t.removeClass("fade"),t.parent(".dropdown-menu")&&t.closest("li.dropdown").addClass("active"),n&&n()}o?i.one(s.support.transition.end,r).emulateTransitionEnd(150):r(),i.removeClass("in")};var t=s.fn.tab;s.fn.tab=function(n){return this.each(function(){var t=s(this),e=t.data("bs.tab");e||t.data("bs.tab",e=new i(this)),"string"==typeof n&&e[n]()})},s.fn.tab.Constructor=i,s.fn.tab.noConflict=function(){return s.fn.tab=t,this},s(document).on("click.bs.tab.data-api",'[data-toggle="tab"], [data-toggle="pill"]',function(t){t.preventDefault(),s(this).tab("show")})}(jQuery),function(c){var u=function(t,e){this.options=c.extend({},u.DEFAULTS,e),this.$window=c(window).on("scroll.bs.affix.data-api",c.proxy(this.checkPosition,this)).on("click.bs.affix.data-api",c.proxy(this.checkPositionWithEventLoop,this)),this.$element=c(t),this.affixed=this.unpin=this.pinnedOffset=null,this.checkPosition()};u.RESET="affix affix-top affix-bottom",u.DEFAULTS={offset:0},u.prototype.getPinnedOffset=function(){if(this.pinnedOffset)return this.pinnedOffset;this.$element.removeClass(u.RESET).addClass("affix");var t=this.$window.scrollTop(),e=this.$element.offset();return this.pinnedOffset=e.top-t},u.prototype.checkPositionWithEventLoop=function(){setTimeout(c.proxy(this.checkPosition,this),1)},u.prototype.checkPosition=function(){if(this.$element.is(":visible")){var t=c(document).height(),e=this.$window.scrollTop(),n=this.$element.offset(),i=this.options.offset,o=i.top,r=i.bottom;"top"==this.affixed&&(n.top+=e),"object"!=typeof i&&(r=o=i),"function"==typeof o&&(o=i.top(this.$element)),"function"==typeof r&&(r=i.bottom(this.$element));var s=!(null!=this.unpin&&e+this.unpin<=n.top)&&(null!=r&&n.top+this.$element.height()>=t-r?"bottom":null!=o&&e<=o&&"top");if(this.affixed!==s){this.unpin&&this.$element.css("top","");var a="affix"+(s?"-"+s:""),l=c.Event(a+".bs.affix");this.$element.trigger(l),l.isDefaultPrevented()||(this.affixed=s,this.unpin="bottom"==s?this.getPinnedOffset():null,this.$element.removeClass(u.RESET).addClass(a).trigger(c.Event(a.replace("affix","affixed"))),"bottom"==s&&this.$element.offset({top:t-r-this.$element.height()}))}}};var t=c.fn.affix;c.fn.affix=function(i){return this.each(function(){var t=c(this),e=t.data("bs.affix"),n="object"==typeof i&&i;e||t.data("bs.affix",e=new u(this,n)),"string"==typeof i&&e[i]()})},c.fn.affix.Constructor=u,c.fn.affix.noConflict=function(){return c.fn.affix=t,this},c(window).on("load",function(){c('[data-spy="affix"]').each(function(){var t=c(this),e=t.data();e.offset=e.offset||{},e.offsetBottom&&(e.offset.bottom=e.offsetBottom),e.offsetTop&&(e.offset.top=e.offsetTop),t.affix(e)})})}(jQuery),function(t){"function"==typeof define&&define.amd?define(["jquery"],t):t(jQuery)}(function(h){var n,a="ui-effects-",i=h;h.effects={effect:{}},function(u,d){function h(t,e,n){var i=g[e.type]||{};return null==t?n||!e.def?null:e.def:(t=i.floor?~~t:parseFloat(t),isNaN(t)?e.def:i.mod?(t+i.mod)%i.mod:t<0?0:t>i.max?i.max:t)}function a(s){var a=f(),l=a._rgba=[];return s=s.toLowerCase(),y(t,function(t,e){var n,i=e.re.exec(s),o=i&&e.parse(i),r=e.space||"rgba";return o?(n=a[r](o),a[m[r].cache]=n[m[r].cache],l=a._rgba=n._rgba,!1):d}),l.length?("0,0,0,0"===l.join()&&u.extend(l,c.transparent),a):c[s]}function l(t,e,n){return 6*(n=(n+1)%1)<1?t+6*(e-t)*n:2*n<1?e:3*n<2?t+6*(e-t)*(2/3-n):t}var c,p=/^([\-+])=\s*(\d+\.?\d*)/,t=[{re:/rgba?\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*(?:,\s*(\d?(?:\.\d+)?)\s*)?\)/,parse:function(t){return[t[1],t[2],t[3],t[4]]}},{re:/rgba?\(\s*(\d+(?:\.\d+)?)\%\s*,\s*(\d+(?:\.\d+)?)\%\s*,\s*(\d+(?:\.\d+)?)\%\s*(?:,\s*(\d?(?:\.\d+)?)\s*)?\)/,parse:function(t){return[2.55*t[1],2.55*t[2],2.55*t[3],t[4]]}},{re:/#([a-f0-9]{2})([a-f0-9]{2})([a-f0-9]{2})/,parse:function(t){return[parseInt(t[1],16),parseInt(t[2],16),parseInt(t[3],16)]}},{re:/#([a-f0-9])([a-f0-9])([a-f0-9])/,parse:function(t){return[parseInt(t[1]+t[1],16),parseInt(t[2]+t[2],16),parseInt(t[3]+t[3],16)]}},{re:/hsla?\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\%\s*,\s*(\d+(?:\.\d+)?)\%\s*(?:,\s*(\d?(?:\.\d+)?)\s*)?\)/,space:"hsla",parse:function(t){return[t[1],t[2]/100,t[3]/100,t[4]]}}],f=u.Color=function(t,e,n,i){return new u.Color.fn.parse(t,e,n,i)},m={rgba:{props:{red:{idx:0,type:"byte"},green:{idx:1,type:"byte"},blue:{idx:2,type:"byte"}}},hsla:{props:{hue:{idx:0,type:"degrees"},saturation:{idx:1,type:"percent"},lightness:{idx:2,type:"percent"}}}},g={byte:{floor:!0,max:255},percent:{max:1},degrees:{mod:360,floor:!0}},s=f.support={},e=u("<p>")[0],y=u.each;e.style.cssText="background-color:rgba(1,1,1,.5)",s.rgba=-1<e.style.backgroundColor.indexOf("rgba"),y(m,function(t,e){e.cache="_"+t,e.props.alpha={idx:3,type:"percent",def:1}}),f.fn=u.extend(f.prototype,{parse:function(o,t,e,n){if(o===d)return this._rgba=[null,null,null,null],this;(o.jquery||o.nodeType)&&(o=u(o).css(t),t=d);var r=this,i=u.type(o),s=this._rgba=[];return t!==d&&(o=[o,t,e,n],i="array"),"string"===i?this.parse(a(o)||c._default):"array"===i?(y(m.rgba.props,function(t,e){s[e.idx]=h(o[e.idx],e)}),this):"object"===i?(y(m,o instanceof f?function(t,e){o[e.cache]&&(r[e.cache]=o[e.cache].slice())}:function(t,n){var i=n.cache;y(n.props,function(t,e){if(!r[i]&&n.to){if("alpha"===t||null==o[t])return;r[i]=n.to(r._rgba)}r[i][e.idx]=h(o[t],e,!0)}),r[i]&&u.inArray(null,r[i].slice(0,3))<0&&(r[i][3]=1,n.from&&(r._rgba=n.from(r[i])))}),this):d},is:function(t){var o=f(t),r=!0,s=this;return y(m,function(t,e){var n,i=o[e.cache];return i&&(n=s[e.cache]||e.to&&e.to(s._rgba)||[],y(e.props,function(t,e){return null!=i[e.idx]?r=i[e.idx]===n[e.idx]:d})),r}),r},_space:function(){var n=[],i=this;return y(m,function(t,e){i[e.cache]&&n.push(t)}),n.pop()},transition:function(t,s){var a=f(t),e=a._space(),n=m[e],i=0===this.alpha()?f("transparent"):this,l=i[n.cache]||n.to(i._rgba),c=l.slice();return a=a[n.cache],y(n.props,function(t,e){var n=e.idx,i=l[n],o=a[n],r=g[e.type]||{};null!==o&&(c[n]=null===i?o:(r.mod&&(o-i>r.mod/2?i+=r.mod:i-o>r.mod/2&&(i-=r.mod)),h((o-i)*s+i,e)))}),this[e](c)},blend:function(t){if(1===this._rgba[3])return this;var e=this._rgba.slice(),n=e.pop(),i=f(t)._rgba;return f(u.map(e,function(t,e){return(1-n)*i[e]+n*t}))},toRgbaString:function(){var t="rgba(",e=u.map(this._rgba,function(t,e){return null==t?2<e?1:0:t});return 1===e[3]&&(e.pop(),t="rgb("),t+e.join()+")"},toHslaString:function(){var t="hsla(",e=u.map(this.hsla(),function(t,e){return null==t&&(t=2<e?1:0),e&&e<3&&(t=Math.round(100*t)+"%"),t});return 1===e[3]&&(e.pop(),t="hsl("),t+e.join()+")"},toHexString:function(t){var e=this._rgba.slice(),n=e.pop();return t&&e.push(~~(255*n)),"#"+u.map(e,function(t){return 1===(t=(t||0).toString(16)).length?"0"+t:t}).join("")},toString:function(){return 0===this._rgba[3]?"transparent":this.toRgbaString()}}),f.fn.parse.prototype=f.fn,m.hsla.to=function(t){if(null==t[0]||null==t[1]||null==t[2])return[null,null,null,t[3]];var e,n,i=t[0]/255,o=t[1]/255,r=t[2]/255,s=t[3],a=Math.max(i,o,r),l=Math.min(i,o,r),c=a-l,u=a+l,d=.5*u;return e=l===a?0:i===a?60*(o-r)/c+360:o===a?60*(r-i)/c+120:60*(i-o)/c+240,n=0===c?0:d<=.5?c/u:c/(2-u),[Math.round(e)%360,n,d,null==s?1:s]},m.hsla.from=function(t){if(null==t[0]||null==t[1]||null==t[2])return[null,null,null,t[3]];var e=t[0]/360,n=t[1],i=t[2],o=t[3],r=i<=.5?i*(1+n):i+n-i*n,s=2*i-r;return[Math.round(255*l(s,r,e+1/3)),Math.round(255*l(s,r,e)),Math.round(255*l(s,r,e-1/3)),o]},y(m,function(l,t){var n=t.props,s=t.cache,a=t.to,c=t.from;f.fn[l]=function(t){if(a&&!this[s]&&(this[s]=a(this._rgba)),t===d)return this[s].slice();var e,i=u.type(t),o="array"===i||"object"===i?t:arguments,r=this[s].slice();return y(n,function(t,e){var n=o["object"===i?t:e.idx];null==n&&(n=r[e.idx]),r[e.idx]=h(n,e)}),c?((e=f(c(r)))[s]=r,e):f(r)},y(n,function(s,a){f.fn[s]||(f.fn[s]=function(t){var e,n=u.type(t),i="alpha"===s?this._hsla?"hsla":"rgba":l,o=this[i](),r=o[a.idx];return"undefined"===n?r:("function"===n&&(t=t.call(this,r),n=u.type(t)),null==t&&a.empty?this:("string"===n&&((e=p.exec(t))&&(t=r+parseFloat(e[2])*("+"===e[1]?1:-1))),o[a.idx]=t,this[i](o)))})})}),f.hook=function(t){var e=t.split(" ");y(e,function(t,r){u.cssHooks[r]={set:function(t,e){var n,i,o="";if("transparent"!==e&&("string"!==u.type(e)||(n=a(e)))){if(e=f(n||e),!s.rgba&&1!==e._rgba[3]){for(i="backgroundColor"===r?t.parentNode:t;(""===o||"transparent"===o)&&i&&i.style;)try{o=u.css(i,"backgroundColor"),i=i.parentNode}catch(t){}e=e.blend(o&&"transparent"!==o?o:"_default")}e=e.toRgbaString()}try{t.style[r]=e}catch(t){}}},u.fx.step[r]=function(t){t.colorInit||(t.start=f(t.elem,r),t.end=f(t.end),t.colorInit=!0),u.cssHooks[r].set(t.elem,t.start.transition(t.end,t.pos))}})},f.hook("backgroundColor borderBottomColor borderLeftColor borderRightColor borderTopColor color columnRuleColor outlineColor textDecorationColor textEmphasisColor"),u.cssHooks.borderColor={expand:function(n){var i={};return y(["Top","Right","Bottom","Left"],function(t,e){i["border"+e+"Color"]=n}),i}},c=u.Color.names={aqua:"#00ffff",black:"#000000",blue:"#0000ff",fuchsia:"#ff00ff",gray:"#808080",green:"#008000",lime:"#00ff00",maroon:"#800000",navy:"#000080",olive:"#808000",purple:"#800080",red:"#ff0000",silver:"#c0c0c0",teal:"#008080",white:"#ffffff",yellow:"#ffff00",transparent:[null,null,null,0],_default:"#ffffff"}}(i),function(){function s(t){var e,n,i=t.ownerDocument.defaultView?t.ownerDocument.defaultView.getComputedStyle(t,null):t.currentStyle,o={};if(i&&i.length&&i[0]&&i[i[0]])for(n=i.length;n--;)"string"==typeof i[e=i[n]]&&(o[h.camelCase(e)]=i[e]);else for(e in i)"string"==typeof i[e]&&(o[e]=i[e]);return o}var r,o,a,l=["add","remove","toggle"],c={border:1,borderBottom:1,borderColor:1,borderLeft:1,borderRight:1,borderTop:1,borderWidth:1,margin:1,padding:1};h.each(["borderLeftStyle","borderRightStyle","borderBottomStyle","borderTopStyle"],function(t,e){h.fx.step[e]=function(t){("none"!==t.end&&!t.setAttr||1===t.pos&&!t.setAttr)&&(i.style(t.elem,e,t.end),t.setAttr=!0)}}),h.fn.addBack||(h.fn.addBack=function(t){return this.add(null==t?this.prevObject:this.prevObject.filter(t))}),h.effects.animateClass=function(o,t,e,n){var r=h.speed(t,e,n);return this.queue(function(){var t,n=h(this),e=n.attr("class")||"",i=r.children?n.find("*").addBack():n;i=i.map(function(){return{el:h(this),start:s(this)}}),(t=function(){h.each(l,function(t,e){o[e]&&n[e+"Class"](o[e])})})(),i=i.map(function(){return this.end=s(this.el[0]),this.diff=function(t,e){var n,i,o={};for(n in e)i=e[n],t[n]!==i&&(c[n]||(h.fx.step[n]||!isNaN(parseFloat(i)))&&(o[n]=i));return o}(this.start,this.end),this}),n.attr("class",e),i=i.map(function(){var t=this,e=h.Deferred(),n=h.extend({},r,{queue:!1,complete:function(){e.resolve(t)}});return this.el.animate(this.diff,n),e.promise()}),h.when.apply(h,i.get()).done(function(){t(),h.each(arguments,function(){var e=this.el;h.each(this.diff,function(t){e.css(t,"")})}),r.complete.call(n[0])})})},h.fn.extend({addClass:(a=h.fn.addClass,function(t,e,n,i){return e?h.effects.animateClass.call(this,{add:t},e,n,i):a.apply(this,arguments)}),removeClass:(o=h.fn.removeClass,function(t,e,n,i){return 1<arguments.length?h.effects.animateClass.call(this,{remove:t},e,n,i):o.apply(this,arguments)}),toggleClass:(r=h.fn.toggleClass,function(t,e,n,i,o){return"boolean"==typeof e||void 0===e?n?h.effects.animateClass.call(this,e?{add:t}:{remove:t},n,i,o):r.apply(this,arguments):h.effects.animateClass.call(this,{toggle:t},e,n,i)}),switchClass:function(t,e,n,i,o){return h.effects.animateClass.call(this,{add:e,remove:t},n,i,o)}})}(),function(){function i(t,e,n,i){return h.isPlainObject(t)&&(t=(e=t).effect),t={effect:t},null==e&&(e={}),h.isFunction(e)&&(i=e,n=null,e={}),("number"==typeof e||h.fx.speeds[e])&&(i=n,n=e,e={}),h.isFunction(n)&&(i=n,n=null),e&&h.extend(t,e),n=n||e.duration,t.duration=h.fx.off?0:"number"==typeof n?n:n in h.fx.speeds?h.fx.speeds[n]:h.fx.speeds._default,t.complete=i||e.complete,t}function n(t){return!(t&&"number"!=typeof t&&!h.fx.speeds[t])||("string"==typeof t&&!h.effects.effect[t]||(!!h.isFunction(t)||"object"==typeof t&&!t.effect))}var o,r,s;h.extend(h.effects,{version:"1.11.1",save:function(t,e){for(var n=0;e.length>n;n++)null!==e[n]&&t.data(a+e[n],t[0].style[e[n]])},restore:function(t,e){var n,i;for(i=0;e.length>i;i++)null!==e[i]&&(void 0===(n=t.data(a+e[i]))&&(n=""),t.css(e[i],n))},setMode:function(t,e){return"toggle"===e&&(e=t.is(":hidden")?"show":"hide"),e},getBaseline:function(t,e){var n,i;switch(t[0]){case"top":n=0;break;case"middle":n=.5;break;case"bottom":n=1;break;default:n=t[0]/e.height}switch(t[1]){case"left":i=0;break;case"center":i=.5;break;case"right":i=1;break;default:i=t[1]/e.width}return{x:i,y:n}},createWrapper:function(n){if(n.parent().is(".ui-effects-wrapper"))return n.parent();var i={width:n.outerWidth(!0),height:n.outerHeight(!0),float:n.css("float")},t=h("<div></div>").addClass("ui-effects-wrapper").css({fontSize:"100%",background:"transparent",border:"none",margin:0,padding:0}),e={width:n.width(),height:n.height()},o=document.activeElement;try{o.id}catch(t){o=document.body}return n.wrap(t),(n[0]===o||h.contains(n[0],o))&&h(o).focus(),t=n.parent(),"static"===n.css("position")?(t.css({position:"relative"}),n.css({position:"relative"})):(h.extend(i,{position:n.css("position"),zIndex:n.css("z-index")}),h.each(["top","left","bottom","right"],function(t,e){i[e]=n.css(e),isNaN(parseInt(i[e],10))&&(i[e]="auto")}),n.css({position:"relative",top:0,left:0,right:"auto",bottom:"auto"})),n.css(e),t.css(i).show()},removeWrapper:function(t){var e=document.activeElement;return t.parent().is(".ui-effects-wrapper")&&(t.parent().replaceWith(t),(t[0]===e||h.contains(t[0],e))&&h(e).focus()),t},setTransition:function(i,t,o,r){return r=r||{},h.each(t,function(t,e){var n=i.cssUnit(e);0<n[0]&&(r[e]=n[0]*o+n[1])}),r}}),h.fn.extend({effect:function(){function t(t){function e(){h.isFunction(i)&&i.call(n[0]),h.isFunction(t)&&t()}var n=h(this),i=r.complete,o=r.mode;(n.is(":hidden")?"hide"===o:"show"===o)?(n[o](),e()):s.call(n[0],r,e)}var r=i.apply(this,arguments),e=r.mode,n=r.queue,s=h.effects.effect[r.effect];return h.fx.off||!s?e?this[e](r.duration,r.complete):this.each(function(){r.complete&&r.complete.call(this)}):!1===n?this.each(t):this.queue(n||"fx",t)},show:(s=h.fn.show,function(t){if(n(t))return s.apply(this,arguments);var e=i.apply(this,arguments);return e.mode="show",this.effect.call(this,e)}),hide:(r=h.fn.hide,function(t){if(n(t))return r.apply(this,arguments);var e=i.apply(this,arguments);return e.mode="hide",this.effect.call(this,e)}),toggle:(o=h.fn.toggle,function(t){if(n(t)||"boolean"==typeof t)return o.apply(this,arguments);var e=i.apply(this,arguments);return e.mode="toggle",this.effect.call(this,e)}),cssUnit:function(t){var n=this.css(t),i=[];return h.each(["em","px","%","pt"],function(t,e){0<n.indexOf(e)&&(i=[parseFloat(n),e])}),i}})}(),n={},h.each(["Quad","Cubic","Quart","Quint","Expo"],function(e,t){n[t]=function(t){return Math.pow(t,e+2)}}),h.extend(n,{Sine:function(t){return 1-Math.cos(t*Math.PI/2)},Circ:function(t){return 1-Math.sqrt(1-t*t)},Elastic:function(t){return 0===t||1===t?t:-Math.pow(2,8*(t-1))*Math.sin((80*(t-1)-7.5)*Math.PI/15)},Back:function(t){return t*t*(3*t-2)},Bounce:function(t){for(var e,n=4;((e=Math.pow(2,--n))-1)/11>t;);return 1/Math.pow(4,3-n)-7.5625*Math.pow((3*e-2)/22-t,2)}}),h.each(n,function(t,e){h.easing["easeIn"+t]=e,h.easing["easeOut"+t]=function(t){return 1-e(1-t)},h.easing["easeInOut"+t]=function(t){return t<.5?e(2*t)/2:1-e(-2*t+2)/2}}),h.effects,h.effects.effect.transfer=function(t,e){var n=h(this),i=h(t.to),o="fixed"===i.css("position"),r=h("body"),s=o?r.scrollTop():0,a=o?r.scrollLeft():0,l=i.offset(),c={top:l.top-s,left:l.left-a,height:i.innerHeight(),width:i.innerWidth()},u=n.offset(),d=h("<div class='ui-effects-transfer'></div>").appendTo(document.body).addClass(t.className).css({top:u.top-s,left:u.left-a,height:n.innerHeight(),width:n.innerWidth(),position:o?"fixed":"absolute"}).animate(c,t.duration,t.easing,function(){d.remove(),e()})}}),function(e){var t;"function"==typeof define&&define.amd?define("jquery-typeahead",["jquery"],function(t){return e(t)}):"object"==typeof module&&module.exports?module.exports=(void 0===t&&(t="undefined"!=typeof window?require("jquery"):require("jquery")(void 0)),e(t)):e(jQuery)}(function(M){"use strict";var n,i={input:null,minLength:2,maxLength:(window.Typeahead={version:"2.10.6"},!1),maxItem:8,dynamic:!1,delay:300,order:null,offset:!1,hint:!1,accent:!1,highlight:!0,multiselect:null,group:!1,groupOrder:null,maxItemPerGroup:null,dropdownFilter:!1,dynamicFilter:null,backdrop:!1,backdropOnFocus:!1,cache:!1,ttl:36e5,compression:!1,searchOnFocus:!1,blurOnTab:!0,resultContainer:null,generateOnLoad:null,mustSelectItem:!1,href:null,display:["display"],template:null,templateValue:null,groupTemplate:null,correlativeTemplate:!1,emptyTemplate:!1,cancelButton:!0,loadingAnimation:!0,filter:!0,matcher:null,source:null,callback:{onInit:null,onReady:null,onShowLayout:null,onHideLayout:null,onSearch:null,onResult:null,onLayoutBuiltBefore:null,onLayoutBuiltAfter:null,onNavigateBefore:null,onNavigateAfter:null,onEnter:null,onLeave:null,onClickBefore:null,onClickAfter:null,onDropdownFilter:null,onSendRequest:null,onReceiveRequest:null,onPopulateSource:null,onCacheSave:null,onSubmit:null,onCancel:null},selector:{container:"typeahead__container",result:"typeahead__result",list:"typeahead__list",group:"typeahead__group",item:"typeahead__item",empty:"typeahead__empty",display:"typeahead__display",query:"typeahead__query",filter:"typeahead__filter",filterButton:"typeahead__filter-button",dropdown:"typeahead__dropdown",dropdownItem:"typeahead__dropdown-item",labelContainer:"typeahead__label-container",label:"typeahead__label",button:"typeahead__button",backdrop:"typeahead__backdrop",hint:"typeahead__hint",cancelButton:"typeahead__cancel-button"},debug:!1},o={from:"Ã£Ã Ã¡Ã¤Ã¢áº½Ã¨Ã©Ã«ÃªÃ¬Ã­Ã¯Ã®ÃµÃ²Ã³Ã¶Ã´Ã¹ÃºÃ¼Ã»Ã±Ã§",to:"aaaaaeeeeeiiiiooooouuuunc"},r=~window.navigator.appVersion.indexOf("MSIE 9."),s=~window.navigator.appVersion.indexOf("MSIE 10"),a=!!~window.navigator.userAgent.indexOf("Trident")&&~window.navigator.userAgent.indexOf("rv:11"),l=function(t,e){this.rawQuery=t.val()||"",this.query=t.val()||"",this.selector=t[0].selector,this.deferred=null,this.tmpSource={},this.source={},this.dynamicGroups=[],this.hasDynamicGroups=!1,this.generatedGroupCount=0,this.groupBy="group",this.groups=[],this.searchGroups=[],this.generateGroups=[],this.requestGroups=[],this.result=[],this.tmpResult={},this.groupTemplate="",this.resultHtml=null,this.resultCount=0,this.resultCountPerGroup={},this.options=e,this.node=t,this.namespace="."+this.helper.slugify.call(this,this.selector)+".typeahead",this.isContentEditable=void 0!==this.node.attr("contenteditable")&&"false"!==this.node.attr("contenteditable"),this.container=null,this.resultContainer=null,this.item=null,this.items=null,this.comparedItems=null,this.xhr={},this.hintIndex=null,this.filters={dropdown:{},dynamic:{}},this.dropdownFilter={static:[],dynamic:[]},this.dropdownFilterAll=null,this.isDropdownEvent=!1,this.requests={},this.backdrop={},this.hint={},this.label={},this.hasDragged=!1,this.focusOnly=!1,this.displayEmptyTemplate,this.__construct()};l.prototype={_validateCacheMethod:function(t){var e;if(!0===t)t="localStorage";else if("string"==typeof t&&!~["localStorage","sessionStorage"].indexOf(t))return!1;e=void 0!==window[t];try{window[t].setItem("typeahead","typeahead"),window[t].removeItem("typeahead")}catch(t){e=!1}return e&&t||!1},extendOptions:function(){if(this.options.cache=this._validateCacheMethod(this.options.cache),this.options.compression&&("object"==typeof LZString&&this.options.cache||(this.options.compression=!1)),this.options.maxLength&&!isNaN(this.options.maxLength)||(this.options.maxLength=1/0),void 0!==this.options.maxItem&&~[0,!1].indexOf(this.options.maxItem)&&(this.options.maxItem=1/0),this.options.maxItemPerGroup&&!/^\d+$/.test(this.options.maxItemPerGroup)&&(this.options.maxItemPerGroup=null),this.options.display&&!Array.isArray(this.options.display)&&(this.options.display=[this.options.display]),this.options.multiselect&&(this.items=[],this.comparedItems=[],"string"==typeof this.options.multiselect.matchOn&&(this.options.multiselect.matchOn=[this.options.multiselect.matchOn])),this.options.group&&(Array.isArray(this.options.group)||("string"==typeof this.options.group?this.options.group={key:this.options.group}:"boolean"==typeof this.options.group&&(this.options.group={key:"group"}),this.options.group.key=this.options.group.key||"group")),this.options.highlight&&!~["any",!0].indexOf(this.options.highlight)&&(this.options.highlight=!1),this.options.dropdownFilter&&this.options.dropdownFilter instanceof Object){Array.isArray(this.options.dropdownFilter)||(this.options.dropdownFilter=[this.options.dropdownFilter]);for(var t=0,e=this.options.dropdownFilter.length;t<e;++t)this.dropdownFilter[this.options.dropdownFilter[t].value?"static":"dynamic"].push(this.options.dropdownFilter[t])}this.options.dynamicFilter&&!Array.isArray(this.options.dynamicFilter)&&(this.options.dynamicFilter=[this.options.dynamicFilter]),this.options.accent&&("object"==typeof this.options.accent?this.options.accent.from&&this.options.accent.to&&(this.options.accent.from.length,this.options.accent.to.length):this.options.accent=o),this.options.groupTemplate&&(this.groupTemplate=this.options.groupTemplate),this.options.resultContainer&&("string"==typeof this.options.resultContainer&&(this.options.resultContainer=M(this.options.resultContainer)),this.options.resultContainer instanceof M&&this.options.resultContainer[0]&&(this.resultContainer=this.options.resultContainer)),this.options.group&&this.options.group.key&&(this.groupBy=this.options.group.key),this.options.callback&&this.options.callback.onClick&&(this.options.callback.onClickBefore=this.options.callback.onClick,delete this.options.callback.onClick),this.options.callback&&this.options.callback.onNavigate&&(this.options.callback.onNavigateBefore=this.options.callback.onNavigate,delete this.options.callback.onNavigate),this.options=M.extend(!0,{},i,this.options)},unifySourceFormat:function(){var t,e,n;for(t in this.dynamicGroups=[],Array.isArray(this.options.source)&&(this.options.source={group:{data:this.options.source}}),"string"==typeof this.options.source&&(this.options.source={group:{ajax:{url:this.options.source}}}),this.options.source.ajax&&(this.options.source={group:{ajax:this.options.source.ajax}}),(this.options.source.url||this.options.source.data)&&(this.options.source={group:this.options.source}),this.options.source)if(this.options.source.hasOwnProperty(t)){if("string"==typeof(e=this.options.source[t])&&(e={ajax:{url:e}}),n=e.url||e.ajax,Array.isArray(n)?(e.ajax="string"==typeof n[0]?{url:n[0]}:n[0],e.ajax.path=e.ajax.path||n[1]||null):"object"==typeof e.url?e.ajax=e.url:"string"==typeof e.url&&(e.ajax={url:e.url}),delete e.url,!e.data&&!e.ajax)return!1;e.display&&!Array.isArray(e.display)&&(e.display=[e.display]),e.minLength="number"==typeof e.minLength?e.minLength:this.options.minLength,e.maxLength="number"==typeof e.maxLength?e.maxLength:this.options.maxLength,e.dynamic="boolean"==typeof e.dynamic||this.options.dynamic,e.minLength>e.maxLength&&(e.minLength=e.maxLength),this.options.source[t]=e,this.options.source[t].dynamic&&this.dynamicGroups.push(t),e.cache=void 0!==e.cache?this._validateCacheMethod(e.cache):this.options.cache,e.compression&&("object"==typeof LZString&&e.cache||(e.compression=!1))}return this.hasDynamicGroups=this.options.dynamic||!!this.dynamicGroups.length,!0},init:function(){this.helper.executeCallback.call(this,this.options.callback.onInit,[this.node]),this.container=this.node.closest("."+this.options.selector.container)},delegateEvents:function(){var n=this,t=["focus"+this.namespace,"input"+this.namespace,"propertychange"+this.namespace,"keydown"+this.namespace,"keyup"+this.namespace,"search"+this.namespace,"generate"+this.namespace];M("html").on("touchmove",function(){n.hasDragged=!0}).on("touchstart",function(){n.hasDragged=!1}),this.node.closest("form").on("submit",function(t){if(!n.options.mustSelectItem||!n.helper.isEmpty(n.item))return n.options.backdropOnFocus||n.hideLayout(),n.options.callback.onSubmit?n.helper.executeCallback.call(n,n.options.callback.onSubmit,[n.node,this,n.item||n.items,t]):void 0;t.preventDefault()}).on("reset",function(){setTimeout(function(){n.node.trigger("input"+n.namespace),n.hideLayout()})});var i=!1;if(this.node.attr("placeholder")&&(s||a)){var e=!0;this.node.on("focusin focusout",function(){e=!(this.value||!this.placeholder)}),this.node.on("input",function(t){e&&(t.stopImmediatePropagation(),e=!1)})}this.node.off(this.namespace).on(t.join(" "),function(t,e){switch(t.type){case"generate":n.generateSource(Object.keys(n.options.source));break;case"focus":if(n.focusOnly){n.focusOnly=!1;break}n.options.backdropOnFocus&&(n.buildBackdropLayout(),n.showLayout()),n.options.searchOnFocus&&!n.item&&(n.deferred=M.Deferred(),n.assignQuery(),n.generateSource());break;case"keydown":8===t.keyCode&&n.options.multiselect&&n.options.multiselect.cancelOnBackspace&&""===n.query&&n.items.length?n.cancelMultiselectItem(n.items.length-1,null,t):t.keyCode&&~[9,13,27,38,39,40].indexOf(t.keyCode)&&(i=!0,n.navigate(t));break;case"keyup":r&&n.node[0].value.replace(/^\s+/,"").toString().length<n.query.length&&n.node.trigger("input"+n.namespace);break;case"propertychange":if(i){i=!1;break}case"input":n.deferred=M.Deferred(),n.assignQuery(),""===n.rawQuery&&""===n.query&&(t.originalEvent=e||{},n.helper.executeCallback.call(n,n.options.callback.onCancel,[n.node,n.item,t]),n.item=null),n.options.cancelButton&&n.toggleCancelButtonVisibility(),n.options.hint&&n.hint.container&&""!==n.hint.container.val()&&0!==n.hint.container.val().indexOf(n.rawQuery)&&(n.hint.container.val(""),n.isContentEditable&&n.hint.container.text("")),n.hasDynamicGroups?n.helper.typeWatch(function(){n.generateSource()},n.options.delay):n.generateSource();break;case"search":n.searchResult(),n.buildLayout(),n.result.length||n.searchGroups.length&&n.displayEmptyTemplate?n.showLayout():n.hideLayout(),n.deferred&&n.deferred.resolve()}return n.deferred&&n.deferred.promise()}),this.options.generateOnLoad&&this.node.trigger("generate"+this.namespace)},assignQuery:function(){this.isContentEditable?this.rawQuery=this.node.text():this.rawQuery=this.node.val().toString(),this.rawQuery=this.rawQuery.replace(/^\s+/,""),this.rawQuery!==this.query&&(this.query=this.rawQuery)},filterGenerateSource:function(){if(this.searchGroups=[],this.generateGroups=[],!this.focusOnly||this.options.multiselect)for(var t in this.options.source)if(this.options.source.hasOwnProperty(t)&&this.query.length>=this.options.source[t].minLength&&this.query.length<=this.options.source[t].maxLength){if(this.filters.dropdown&&"group"===this.filters.dropdown.key&&this.filters.dropdown.value!==t)continue;if(this.searchGroups.push(t),!this.options.source[t].dynamic&&this.source[t])continue;this.generateGroups.push(t)}},generateSource:function(t){if(this.filterGenerateSource(),Array.isArray(t)&&t.length)this.generateGroups=t;else if(!this.generateGroups.length)return void this.node.trigger("search"+this.namespace);if(this.requestGroups=[],this.generatedGroupCount=0,this.options.loadingAnimation&&this.container.addClass("loading"),!this.helper.isEmpty(this.xhr)){for(var e in this.xhr)this.xhr.hasOwnProperty(e)&&this.xhr[e].abort();this.xhr={}}for(var n,i,o,r,s,a,l,c=this,u=(e=0,this.generateGroups.length);e<u;++e){if(n=this.generateGroups[e],r=(o=this.options.source[n]).cache,s=o.compression,r&&(a=window[r].getItem("TYPEAHEAD_"+this.selector+":"+n))){s&&(a=LZString.decompressFromUTF16(a)),l=!1;try{(a=JSON.parse(a+"")).data&&a.ttl>(new Date).getTime()?(this.populateSource(a.data,n),l=!0):window[r].removeItem("TYPEAHEAD_"+this.selector+":"+n)}catch(t){}if(l)continue}!o.data||o.ajax?o.ajax&&(this.requests[n]||(this.requests[n]=this.generateRequestObject(n)),this.requestGroups.push(n)):"function"==typeof o.data?(i=o.data.call(this),Array.isArray(i)?c.populateSource(i,n):"function"==typeof i.promise&&function(e){M.when(i).then(function(t){t&&Array.isArray(t)&&c.populateSource(t,e)})}(n)):this.populateSource(M.extend(!0,[],o.data),n)}return this.requestGroups.length&&this.handleRequests(),!!this.generateGroups.length},generateRequestObject:function(i){var o=this,r=this.options.source[i],t={request:{url:r.ajax.url||null,dataType:"json",beforeSend:function(t,e){o.xhr[i]=t;var n=o.requests[i].callback.beforeSend||r.ajax.beforeSend;"function"==typeof n&&n.apply(null,arguments)}},callback:{beforeSend:null,done:null,fail:null,then:null,always:null},extra:{path:r.ajax.path||null,group:i},validForGroup:[i]};if("function"!=typeof r.ajax&&(r.ajax instanceof Object&&(t=this.extendXhrObject(t,r.ajax)),1<Object.keys(this.options.source).length))for(var e in this.requests)this.requests.hasOwnProperty(e)&&(this.requests[e].isDuplicated||t.request.url&&t.request.url===this.requests[e].request.url&&(this.requests[e].validForGroup.push(i),t.isDuplicated=!0,delete t.validForGroup));return t},extendXhrObject:function(t,e){return"object"==typeof e.callback&&(t.callback=e.callback,delete e.callback),"function"==typeof e.beforeSend&&(t.callback.beforeSend=e.beforeSend,delete e.beforeSend),t.request=M.extend(!0,t.request,e),"jsonp"!==t.request.dataType.toLowerCase()||t.request.jsonpCallback||(t.request.jsonpCallback="callback_"+t.extra.group),t},handleRequests:function(){var t,c=this,u=this.requestGroups.length;if(!1!==this.helper.executeCallback.call(this,this.options.callback.onSendRequest,[this.node,this.query]))for(var e=0,n=this.requestGroups.length;e<n;++e)t=this.requestGroups[e],this.requests[t].isDuplicated||function(t,s){if("function"==typeof c.options.source[t].ajax){var e=c.options.source[t].ajax.call(c,c.query);if("object"!=typeof(s=c.extendXhrObject(c.generateRequestObject(t),"object"==typeof e?e:{})).request||!s.request.url)return c.populateSource([],t);c.requests[t]=s}var a,n=!1,l={};if(~s.request.url.indexOf("{{query}}")&&(n||(s=M.extend(!0,{},s),n=!0),s.request.url=s.request.url.replace("{{query}}",encodeURIComponent(c.query))),s.request.data)for(var i in s.request.data)if(s.request.data.hasOwnProperty(i)&&~String(s.request.data[i]).indexOf("{{query}}")){n||(s=M.extend(!0,{},s),n=!0),s.request.data[i]=s.request.data[i].replace("{{query}}",c.query);break}M.ajax(s.request).done(function(t,e,n){for(var i,o=0,r=s.validForGroup.length;o<r;o++)i=s.validForGroup[o],"function"==typeof(a=c.requests[i]).callback.done&&(l[i]=a.callback.done.call(c,t,e,n))}).fail(function(t,e,n){for(var i=0,o=s.validForGroup.length;i<o;i++)(a=c.requests[s.validForGroup[i]]).callback.fail instanceof Function&&a.callback.fail.call(c,t,e,n)}).always(function(t,e,n){for(var i,o=0,r=s.validForGroup.length;o<r;o++){if(i=s.validForGroup[o],(a=c.requests[i]).callback.always instanceof Function&&a.callback.always.call(c,t,e,n),"abort"===e)return;c.populateSource(null!==t&&"function"==typeof t.promise&&[]||l[i]||t,a.extra.group,a.extra.path||a.request.path),0==(u-=1)&&c.helper.executeCallback.call(c,c.options.callback.onReceiveRequest,[c.node,c.query])}}).then(function(t,e){for(var n=0,i=s.validForGroup.length;n<i;n++)(a=c.requests[s.validForGroup[n]]).callback.then instanceof Function&&a.callback.then.call(c,t,e)})}(t,this.requests[t])},populateSource:function(n,t,e){var i=this,o=this.options.source[t],r=o.ajax&&o.data;e&&"string"==typeof e&&(n=this.helper.namespace.call(this,e,n)),Array.isArray(n)||(n=[]),r&&("function"==typeof r&&(r=r()),Array.isArray(r)&&(n=n.concat(r)));for(var s,a=o.display?"compiled"===o.display[0]?o.display[1]:o.display[0]:"compiled"===this.options.display[0]?this.options.display[1]:this.options.display[0],l=0,c=n.length;l<c;l++)null!==n[l]&&"boolean"!=typeof n[l]&&("string"==typeof n[l]&&((s={})[a]=n[l],n[l]=s),n[l].group=t);if(!this.hasDynamicGroups&&this.dropdownFilter.dynamic.length){var u,d,h={};for(l=0,c=n.length;l<c;l++)for(var p=0,f=this.dropdownFilter.dynamic.length;p<f;p++)u=this.dropdownFilter.dynamic[p].key,(d=n[l][u])&&(this.dropdownFilter.dynamic[p].value||(this.dropdownFilter.dynamic[p].value=[]),h[u]||(h[u]=[]),~h[u].indexOf(d.toLowerCase())||(h[u].push(d.toLowerCase()),this.dropdownFilter.dynamic[p].value.push(d)))}if(this.options.correlativeTemplate){var m=o.template||this.options.template,g="";if("function"==typeof m&&(m=m.call(this,"",{})),m){if(Array.isArray(this.options.correlativeTemplate))for(l=0,c=this.options.correlativeTemplate.length;l<c;l++)g+="{{"+this.options.correlativeTemplate[l]+"}} ";else g=m.replace(/<.+?>/g," ").replace(/\s{2,}/," ").trim();for(l=0,c=n.length;l<c;l++)n[l].compiled=M("<textarea />").html(g.replace(/\{\{([\w\-\.]+)(?:\|(\w+))?}}/g,function(t,e){return i.helper.namespace.call(i,e,n[l],"get","")}).trim()).text();o.display?~o.display.indexOf("compiled")||o.display.unshift("compiled"):~this.options.display.indexOf("compiled")||this.options.display.unshift("compiled")}}this.options.callback.onPopulateSource&&(n=this.helper.executeCallback.call(this,this.options.callback.onPopulateSource,[this.node,n,t,e])),this.tmpSource[t]=Array.isArray(n)&&n||[];var y=this.options.source[t].cache,v=this.options.source[t].compression,b=this.options.source[t].ttl||this.options.ttl;if(y&&!window[y].getItem("TYPEAHEAD_"+this.selector+":"+t)){this.options.callback.onCacheSave&&(n=this.helper.executeCallback.call(this,this.options.callback.onCacheSave,[this.node,n,t,e]));var w=JSON.stringify({data:n,ttl:(new Date).getTime()+b});v&&(w=LZString.compressToUTF16(w)),window[y].setItem("TYPEAHEAD_"+this.selector+":"+t,w)}this.incrementGeneratedGroup()},incrementGeneratedGroup:function(){if(this.generatedGroupCount++,this.generatedGroupCount===this.generateGroups.length){this.xhr={};for(var t=0,e=this.generateGroups.length;t<e;t++)this.source[this.generateGroups[t]]=this.tmpSource[this.generateGroups[t]];this.hasDynamicGroups||this.buildDropdownItemLayout("dynamic"),this.options.loadingAnimation&&this.container.removeClass("loading"),this.node.trigger("search"+this.namespace)}},navigate:function(t){if(this.helper.executeCallback.call(this,this.options.callback.onNavigateBefore,[this.node,this.query,t]),27===t.keyCode)return t.preventDefault(),void(this.query.length?(this.resetInput(),this.node.trigger("input"+this.namespace,[t])):(this.node.blur(),this.hideLayout()));if(this.result.length){var e,n=this.resultContainer.find("."+this.options.selector.item).not("[disabled]"),i=n.filter(".active"),o=i[0]?n.index(i):null,r=i[0]?i.attr("data-index"):null,s=null;if(this.clearActiveItem(),this.helper.executeCallback.call(this,this.options.callback.onLeave,[this.node,null!==o&&n.eq(o)||void 0,null!==r&&this.result[r]||void 0,t]),13===t.keyCode)return t.preventDefault(),void(0<i.length?"javascript:;"===i.find("a:first")[0].href?i.find("a:first").trigger("click",t):i.find("a:first")[0].click():this.node.closest("form").trigger("submit"));if(39!==t.keyCode){9===t.keyCode?this.options.blurOnTab?this.hideLayout():0<i.length?o+1<n.length?(t.preventDefault(),s=o+1,this.addActiveItem(n.eq(s))):this.hideLayout():n.length?(t.preventDefault(),s=0,this.addActiveItem(n.first())):this.hideLayout():38===t.keyCode?(t.preventDefault(),0<i.length?0<=o-1&&(s=o-1,this.addActiveItem(n.eq(s))):n.length&&(s=n.length-1,this.addActiveItem(n.last()))):40===t.keyCode&&(t.preventDefault(),0<i.length?o+1<n.length&&(s=o+1,this.addActiveItem(n.eq(s))):n.length&&(s=0,this.addActiveItem(n.first()))),e=null!==s?n.eq(s).attr("data-index"):null,this.helper.executeCallback.call(this,this.options.callback.onEnter,[this.node,null!==s&&n.eq(s)||void 0,null!==e&&this.result[e]||void 0,t]),t.preventInputChange&&~[38,40].indexOf(t.keyCode)&&this.buildHintLayout(null!==e&&e<this.result.length?[this.result[e]]:null),this.options.hint&&this.hint.container&&this.hint.container.css("color",t.preventInputChange?this.hint.css.color:null===e&&this.hint.css.color||this.hint.container.css("background-color")||"fff");var a=null===e||t.preventInputChange?this.rawQuery:this.getTemplateValue.call(this,this.result[e]);this.node.val(a),this.isContentEditable&&this.node.text(a),this.helper.executeCallback.call(this,this.options.callback.onNavigateAfter,[this.node,n,null!==s&&n.eq(s).find("a:first")||void 0,null!==e&&this.result[e]||void 0,this.query,t])}else null!==o?n.eq(o).find("a:first")[0].click():this.options.hint&&""!==this.hint.container.val()&&this.helper.getCaret(this.node[0])>=this.query.length&&n.filter('[data-index="'+this.hintIndex+'"]').find("a:first")[0].click()}},getTemplateValue:function(n){if(n){var t=n.group&&this.options.source[n.group].templateValue||this.options.templateValue;if("function"==typeof t&&(t=t.call(this)),!t)return this.helper.namespace.call(this,n.matchedKey,n).toString();var i=this;return t.replace(/\{\{([\w\-.]+)}}/gi,function(t,e){return i.helper.namespace.call(i,e,n,"get","")})}},clearActiveItem:function(){this.resultContainer.find("."+this.options.selector.item).removeClass("active")},addActiveItem:function(t){t.addClass("active")},searchResult:function(){this.resetLayout(),!1!==this.helper.executeCallback.call(this,this.options.callback.onSearch,[this.node,this.query])&&(!this.searchGroups.length||this.options.multiselect&&this.options.multiselect.limit&&this.items.length>=this.options.multiselect.limit||this.searchResultData(),this.helper.executeCallback.call(this,this.options.callback.onResult,[this.node,this.query,this.result,this.resultCount,this.resultCountPerGroup]),this.isDropdownEvent&&(this.helper.executeCallback.call(this,this.options.callback.onDropdownFilter,[this.node,this.query,this.filters.dropdown,this.result]),this.isDropdownEvent=!1))},searchResultData:function(){var t,e,n,i,o,r,s,a,l,c,u,d=this.groupBy,h=null,p=this.query.toLowerCase(),f=this.options.maxItem,m=this.options.maxItemPerGroup,g=this.filters.dynamic&&!this.helper.isEmpty(this.filters.dynamic),y="function"==typeof this.options.matcher&&this.options.matcher;this.options.accent&&(p=this.helper.removeAccent.call(this,p));for(var v=0,b=this.searchGroups.length;v<b;++v)if(E=this.searchGroups[v],!this.filters.dropdown||"group"!==this.filters.dropdown.key||this.filters.dropdown.value===E){o=void 0!==this.options.source[E].filter?this.options.source[E].filter:this.options.filter,s="function"==typeof this.options.source[E].matcher&&this.options.source[E].matcher||y;for(var w=0,x=this.source[E].length;w<x&&(!(this.resultItemCount>=f)||this.options.callback.onResult);w++)if((!g||this.dynamicFilter.validate.apply(this,[this.source[E][w]]))&&null!==(t=this.source[E][w])&&"boolean"!=typeof t&&(!this.options.multiselect||this.isMultiselectUniqueData(t))&&(!this.filters.dropdown||(t[this.filters.dropdown.key]||"").toLowerCase()===(this.filters.dropdown.value||"").toLowerCase())){if((h="group"===d?E:t[d]?t[d]:t.group)&&!this.tmpResult[h]&&(this.tmpResult[h]=[],this.resultCountPerGroup[h]=0),m&&"group"===d&&this.tmpResult[h].length>=m&&!this.options.callback.onResult)break;for(var k=0,_=(D=this.options.source[E].display||this.options.display).length;k<_;++k){if(!1!==o){if(void 0===(i=/\./.test(D[k])?this.helper.namespace.call(this,D[k],t):t[D[k]])||""===i)continue;i=this.helper.cleanStringFromScript(i)}if("function"==typeof o){if(void 0===(r=o.call(this,t,i)))break;if(!r)continue;"object"==typeof r&&(t=r)}if(~[void 0,!0].indexOf(o)){if(null===i)continue;if(n=(n=i).toString().toLowerCase(),this.options.accent&&(n=this.helper.removeAccent.call(this,n)),e=n.indexOf(p),this.options.correlativeTemplate&&"compiled"===D[k]&&e<0&&/\s/.test(p)){l=!0,u=n;for(var C=0,T=(c=p.split(" ")).length;C<T;C++)if(""!==c[C]){if(!~u.indexOf(c[C])){l=!1;break}u=u.replace(c[C],"")}}if(e<0&&!l)continue;if(this.options.offset&&0!==e)continue;if(s){if(void 0===(a=s.call(this,t,i)))break;if(!a)continue;"object"==typeof a&&(t=a)}}if(this.resultCount++,this.resultCountPerGroup[h]++,this.resultItemCount<f){if(m&&this.tmpResult[h].length>=m)break;this.tmpResult[h].push(M.extend(!0,{matchedKey:D[k]},t)),this.resultItemCount++}break}if(!this.options.callback.onResult){if(this.resultItemCount>=f)break;if(m&&this.tmpResult[h].length>=m&&"group"===d)break}}}if(this.options.order){var S,D=[];for(var E in this.tmpResult)if(this.tmpResult.hasOwnProperty(E)){for(v=0,b=this.tmpResult[E].length;v<b;v++)S=this.options.source[this.tmpResult[E][v].group].display||this.options.display,~D.indexOf(S[0])||D.push(S[0]);this.tmpResult[E].sort(this.helper.sort(D,"asc"===this.options.order,function(t){return t.toString().toUpperCase()}))}}var $,L=[];for(v=0,b=($="function"==typeof this.options.groupOrder?this.options.groupOrder.apply(this,[this.node,this.query,this.tmpResult,this.resultCount,this.resultCountPerGroup]):Array.isArray(this.options.groupOrder)?this.options.groupOrder:"string"==typeof this.options.groupOrder&&~["asc","desc"].indexOf(this.options.groupOrder)?Object.keys(this.tmpResult).sort(this.helper.sort([],"asc"===this.options.groupOrder,function(t){return t.toString().toUpperCase()})):Object.keys(this.tmpResult)).length;v<b;v++)L=L.concat(this.tmpResult[$[v]]||[]);this.groups=JSON.parse(JSON.stringify($)),this.result=L},buildLayout:function(){this.buildHtmlLayout(),this.buildBackdropLayout(),this.buildHintLayout(),this.options.callback.onLayoutBuiltBefore&&(this.tmpResultHtml=this.helper.executeCallback.call(this,this.options.callback.onLayoutBuiltBefore,[this.node,this.query,this.result,this.resultHtml])),this.tmpResultHtml instanceof M?this.resultContainer.html(this.tmpResultHtml):this.resultHtml instanceof M&&this.resultContainer.html(this.resultHtml),this.options.callback.onLayoutBuiltAfter&&this.helper.executeCallback.call(this,this.options.callback.onLayoutBuiltAfter,[this.node,this.query,this.result])},buildHtmlLayout:function(){if(!1!==this.options.resultContainer){var c;if(this.resultContainer||(this.resultContainer=M("<div/>",{class:this.options.selector.result}),this.container.append(this.resultContainer)),!this.result.length)if(this.options.multiselect&&this.options.multiselect.limit&&this.items.length>=this.options.multiselect.limit)c=this.options.multiselect.limitTemplate?"function"==typeof this.options.multiselect.limitTemplate?this.options.multiselect.limitTemplate.call(this,this.query):this.options.multiselect.limitTemplate.replace(/\{\{query}}/gi,M("<div>").text(this.helper.cleanStringFromScript(this.query)).html()):"Can't select more than "+this.items.length+" items.";else{if(!this.options.emptyTemplate||""===this.query)return;c="function"==typeof this.options.emptyTemplate?this.options.emptyTemplate.call(this,this.query):this.options.emptyTemplate.replace(/\{\{query}}/gi,M("<div>").text(this.helper.cleanStringFromScript(this.query)).html())}this.displayEmptyTemplate=!!c;var o=this.query.toLowerCase();this.options.accent&&(o=this.helper.removeAccent.call(this,o));var u=this,t=this.groupTemplate||"<ul></ul>",d=!1;this.groupTemplate?t=M(t.replace(/<([^>]+)>\{\{(.+?)}}<\/[^>]+>/g,function(t,e,n,i,o){var r="",s="group"===n?u.groups:[n];if(!u.result.length)return!0===d?"":(d=!0,"<"+e+' class="'+u.options.selector.empty+'">'+c+"</"+e+">");for(var a=0,l=s.length;a<l;++a)r+="<"+e+' data-group-template="'+s[a]+'"><ul></ul></'+e+">";return r})):(t=M(t),this.result.length||t.append(c instanceof M?c:'<li class="'+u.options.selector.empty+'">'+c+"</li>")),t.addClass(this.options.selector.list+(this.helper.isEmpty(this.result)?" empty":""));for(var e,n,r,i,s,a,l,h,p,f,m,g,y,v=this.groupTemplate&&this.result.length&&u.groups||[],b=0,w=this.result.length;b<w;++b)e=(r=this.result[b]).group,i=!this.options.multiselect&&this.options.source[r.group].href||this.options.href,h=[],p=this.options.source[r.group].display||this.options.display,this.options.group&&(e=r[this.options.group.key],this.options.group.template&&("function"==typeof this.options.group.template?n=this.options.group.template.call(this,r):"string"==typeof this.options.group.template&&(n=this.options.group.template.replace(/\{\{([\w\-\.]+)}}/gi,function(t,e){return u.helper.namespace.call(u,e,r,"get","")}))),t.find('[data-search-group="'+e+'"]')[0]||(this.groupTemplate?t.find('[data-group-template="'+e+'"] ul'):t).append(M("<li/>",{class:u.options.selector.group,html:M("<a/>",{href:"javascript:;",html:n||e,tabindex:-1}),"data-search-group":e}))),this.groupTemplate&&v.length&&~(m=v.indexOf(e||r.group))&&v.splice(m,1),s=M("<li/>",{class:u.options.selector.item+" "+u.options.selector.group+"-"+this.helper.slugify.call(this,e),disabled:!!r.disabled,"data-group":e,"data-index":b,html:M("<a/>",{href:i&&!r.disabled?(g=i,y=r,y.href=u.generateHref.call(u,g,y)):"javascript:;",html:function(){if(a=r.group&&u.options.source[r.group].template||u.options.template)"function"==typeof a&&(a=a.call(u,u.query,r)),l=a.replace(/\{\{([^\|}]+)(?:\|([^}]+))*}}/gi,function(t,e,n){var i=u.helper.cleanStringFromScript(String(u.helper.namespace.call(u,e,r,"get","")));return~(n=n&&n.split("|")||[]).indexOf("slugify")&&(i=u.helper.slugify.call(u,i)),~n.indexOf("raw")||!0===u.options.highlight&&o&&~p.indexOf(e)&&(i=u.helper.highlight.call(u,i,o.split(" "),u.options.accent)),i});else{for(var t=0,e=p.length;t<e;t++)void 0!==(f=/\./.test(p[t])?u.helper.namespace.call(u,p[t],r,"get",""):r[p[t]])&&""!==f&&h.push(f);l='<span class="'+u.options.selector.display+'">'+u.helper.cleanStringFromScript(String(h.join(" ")))+"</span>"}(!0===u.options.highlight&&o&&!a||"any"===u.options.highlight)&&(l=u.helper.highlight.call(u,l,o.split(" "),u.options.accent)),M(this).append(l)}})}),function(t,n,e){e.on("click",function(t,e){n.disabled?t.preventDefault():(e&&"object"==typeof e&&(t.originalEvent=e),u.options.mustSelectItem&&u.helper.isEmpty(n)?t.preventDefault():(u.options.multiselect||(u.item=n),!1!==u.helper.executeCallback.call(u,u.options.callback.onClickBefore,[u.node,M(this),n,t])&&(t.originalEvent&&t.originalEvent.defaultPrevented||t.isDefaultPrevented()||(u.options.multiselect?(u.query=u.rawQuery="",u.addMultiselectItemLayout(n)):(u.focusOnly=!0,u.query=u.rawQuery=u.getTemplateValue.call(u,n),u.isContentEditable&&(u.node.text(u.query),u.helper.setCaretAtEnd(u.node[0]))),u.hideLayout(),u.node.val(u.query).focus(),u.options.cancelButton&&u.toggleCancelButtonVisibility(),u.helper.executeCallback.call(u,u.options.callback.onClickAfter,[u.node,M(this),n,t])))))}),e.on("mouseenter",function(t){n.disabled||(u.clearActiveItem(),u.addActiveItem(M(this))),u.helper.executeCallback.call(u,u.options.callback.onEnter,[u.node,M(this),n,t])}),e.on("mouseleave",function(t){n.disabled||u.clearActiveItem(),u.helper.executeCallback.call(u,u.options.callback.onLeave,[u.node,M(this),n,t])})}(0,r,s),(this.groupTemplate?t.find('[data-group-template="'+e+'"] ul'):t).append(s);if(this.result.length&&v.length)for(b=0,w=v.length;b<w;++b)t.find('[data-group-template="'+v[b]+'"]').remove();this.resultHtml=t}},generateHref:function(t,o){var r=this;return"string"==typeof t?t=t.replace(/\{\{([^\|}]+)(?:\|([^}]+))*}}/gi,function(t,e,n){var i=r.helper.namespace.call(r,e,o,"get","");return~(n=n&&n.split("|")||[]).indexOf("slugify")&&(i=r.helper.slugify.call(r,i)),i}):"function"==typeof t&&(t=t.call(this,o)),t},getMultiselectComparedData:function(t){var e="";if(Array.isArray(this.options.multiselect.matchOn))for(var n=0,i=this.options.multiselect.matchOn.length;n<i;++n)e+=void 0!==t[this.options.multiselect.matchOn[n]]?t[this.options.multiselect.matchOn[n]]:"";else{var o=JSON.parse(JSON.stringify(t)),r=["group","matchedKey","compiled","href"];for(n=0,i=r.length;n<i;++n)delete o[r[n]];e=JSON.stringify(o)}return e},buildBackdropLayout:function(){this.options.backdrop&&(this.backdrop.container||(this.backdrop.css=M.extend({opacity:.6,filter:"alpha(opacity=60)",position:"fixed",top:0,right:0,bottom:0,left:0,"z-index":1040,"background-color":"#000"},this.options.backdrop),this.backdrop.container=M("<div/>",{class:this.options.selector.backdrop,css:this.backdrop.css}).insertAfter(this.container)),this.container.addClass("backdrop").css({"z-index":this.backdrop.css["z-index"]+1,position:"relative"}))},buildHintLayout:function(t){if(this.options.hint)if(this.node[0].scrollWidth>Math.ceil(this.node.innerWidth()))this.hint.container&&this.hint.container.val("");else{var e=this,n="",i=(t=t||this.result,this.query.toLowerCase());if(this.options.accent&&(i=this.helper.removeAccent.call(this,i)),this.hintIndex=null,this.searchGroups.length){if(this.hint.container||(this.hint.css=M.extend({"border-color":"transparent",position:"absolute",top:0,display:"inline","z-index":-1,float:"none",color:"silver","box-shadow":"none",cursor:"default","-webkit-user-select":"none","-moz-user-select":"none","-ms-user-select":"none","user-select":"none"},this.options.hint),this.hint.container=M("<"+this.node[0].nodeName+"/>",{type:this.node.attr("type"),class:this.node.attr("class"),readonly:!0,unselectable:"on","aria-hidden":"true",tabindex:-1,click:function(){e.node.focus()}}).addClass(this.options.selector.hint).css(this.hint.css).insertAfter(this.node),this.node.parent().css({position:"relative"})),this.hint.container.css("color",this.hint.css.color),i)for(var o,r,s,a=0,l=t.length;a<l;a++)if(!t[a].disabled){r=t[a].group;for(var c=0,u=(o=this.options.source[r].display||this.options.display).length;c<u;c++)if(s=String(t[a][o[c]]).toLowerCase(),this.options.accent&&(s=this.helper.removeAccent.call(this,s)),0===s.indexOf(i)){n=String(t[a][o[c]]),this.hintIndex=a;break}if(null!==this.hintIndex)break}var d=0<n.length&&this.rawQuery+n.substring(this.query.length)||"";this.hint.container.val(d),this.isContentEditable&&this.hint.container.text(d)}}},buildDropdownLayout:function(){if(this.options.dropdownFilter){var n=this;M("<span/>",{class:this.options.selector.filter,html:function(){M(this).append(M("<button/>",{type:"button",class:n.options.selector.filterButton,style:"display: none;",click:function(){n.container.toggleClass("filter");var e=n.namespace+"-dropdown-filter";M("html").off(e),n.container.hasClass("filter")&&M("html").on("click"+e+" touchend"+e,function(t){M(t.target).closest("."+n.options.selector.filter)[0]&&M(t.target).closest(n.container)[0]||n.hasDragged||(n.container.removeClass("filter"),M("html").off(e))})}})),M(this).append(M("<ul/>",{class:n.options.selector.dropdown}))}}).insertAfter(n.container.find("."+n.options.selector.query))}},buildDropdownItemLayout:function(t){if(this.options.dropdownFilter){var e,n,o=this,r="string"==typeof this.options.dropdownFilter&&this.options.dropdownFilter||"All",s=this.container.find("."+this.options.selector.dropdown);"static"!==t||!0!==this.options.dropdownFilter&&"string"!=typeof this.options.dropdownFilter||this.dropdownFilter.static.push({key:"group",template:"{{group}}",all:r,value:Object.keys(this.options.source)});for(var i=0,a=this.dropdownFilter[t].length;i<a;i++){n=this.dropdownFilter[t][i],Array.isArray(n.value)||(n.value=[n.value]),n.all&&(this.dropdownFilterAll=n.all);for(var l=0,c=n.value.length;l<=c;l++)l===c&&i!==a-1||l===c&&i===a-1&&"static"===t&&this.dropdownFilter.dynamic.length||(e=this.dropdownFilterAll||r,n.value[l]?e=n.template?n.template.replace(new RegExp("{{"+n.key+"}}","gi"),n.value[l]):n.value[l]:this.container.find("."+o.options.selector.filterButton).html(e),function(e,n,i){s.append(M("<li/>",{class:o.options.selector.dropdownItem+" "+o.helper.slugify.call(o,n.key+"-"+(n.value[e]||r)),html:M("<a/>",{href:"javascript:;",html:i,click:function(t){t.preventDefault(),u.call(o,{key:n.key,value:n.value[e]||"*",template:i})}})}))}(l,n,e))}this.dropdownFilter[t].length&&this.container.find("."+o.options.selector.filterButton).removeAttr("style")}function u(t){"*"===t.value?delete this.filters.dropdown:this.filters.dropdown=t,this.container.removeClass("filter").find("."+this.options.selector.filterButton).html(t.template),this.isDropdownEvent=!0,this.node.trigger("input"+this.namespace),this.options.multiselect&&this.adjustInputSize(),this.node.focus()}},dynamicFilter:{isEnabled:!1,init:function(){this.options.dynamicFilter&&(this.dynamicFilter.bind.call(this),this.dynamicFilter.isEnabled=!0)},validate:function(t){var e,n,i=null,o=null;for(var r in this.filters.dynamic)if(this.filters.dynamic.hasOwnProperty(r)&&(n=~r.indexOf(".")?this.helper.namespace.call(this,r,t,"get"):t[r],"|"!==this.filters.dynamic[r].modifier||i||(i=n==this.filters.dynamic[r].value||!1),"&"===this.filters.dynamic[r].modifier)){if(n!=this.filters.dynamic[r].value){o=!1;break}o=!0}return e=i,null!==o&&!0===(e=o)&&null!==i&&(e=i),!!e},set:function(t,e){var n=t.match(/^([|&])?(.+)/);e?this.filters.dynamic[n[2]]={modifier:n[1]||"|",value:e}:delete this.filters.dynamic[n[2]],this.dynamicFilter.isEnabled&&this.generateSource()},bind:function(){for(var t,e=this,n=0,i=this.options.dynamicFilter.length;n<i;n++)"string"==typeof(t=this.options.dynamicFilter[n]).selector&&(t.selector=M(t.selector)),t.selector instanceof M&&t.selector[0]&&t.key&&function(t){t.selector.off(e.namespace).on("change"+e.namespace,function(){e.dynamicFilter.set.apply(e,[t.key,e.dynamicFilter.getValue(this)])}).trigger("change"+e.namespace)}(t)},getValue:function(t){var e;return"SELECT"===t.tagName?e=t.value:"INPUT"===t.tagName&&("checkbox"===t.type?e=t.checked&&t.getAttribute("value")||t.checked||null:"radio"===t.type&&t.checked&&(e=t.value)),e}},buildMultiselectLayout:function(){if(this.options.multiselect){var t,e=this;this.label.container=M("<span/>",{class:this.options.selector.labelContainer,"data-padding-left":parseFloat(this.node.css("padding-left"))||0,"data-padding-right":parseFloat(this.node.css("padding-right"))||0,"data-padding-top":parseFloat(this.node.css("padding-top"))||0,click:function(t){M(t.target).hasClass(e.options.selector.labelContainer)&&e.node.focus()}}),this.node.closest("."+this.options.selector.query).prepend(this.label.container),this.options.multiselect.data&&(Array.isArray(this.options.multiselect.data)?this.populateMultiselectData(this.options.multiselect.data):"function"==typeof this.options.multiselect.data&&(t=this.options.multiselect.data.call(this),Array.isArray(t)?this.populateMultiselectData(t):"function"==typeof t.promise&&M.when(t).then(function(t){t&&Array.isArray(t)&&e.populateMultiselectData(t)})))}},isMultiselectUniqueData:function(t){for(var e=!0,n=0,i=this.comparedItems.length;n<i;++n)if(this.comparedItems[n]===this.getMultiselectComparedData(t)){e=!1;break}return e},populateMultiselectData:function(t){for(var e=0,n=t.length;e<n;++e)this.addMultiselectItemLayout(t[e]);this.node.trigger("search"+this.namespace,{origin:"populateMultiselectData"})},addMultiselectItemLayout:function(t){if(this.isMultiselectUniqueData(t)){this.items.push(t),this.comparedItems.push(this.getMultiselectComparedData(t));var e,n=this.getTemplateValue(t),i=this,o=this.options.multiselect.href?"a":"span",r=M("<span/>",{class:this.options.selector.label,html:M("<"+o+"/>",{text:n,click:function(t){var e=M(this).closest("."+i.options.selector.label),n=i.label.container.find("."+i.options.selector.label).index(e);i.options.multiselect.callback&&i.helper.executeCallback.call(i,i.options.multiselect.callback.onClick,[i.node,i.items[n],t])},href:this.options.multiselect.href?(e=i.items[i.items.length-1],i.generateHref.call(i,i.options.multiselect.href,e)):null})});return r.append(M("<span/>",{class:this.options.selector.cancelButton,html:"Ã—",click:function(t){var e=M(this).closest("."+i.options.selector.label),n=i.label.container.find("."+i.options.selector.label).index(e);i.cancelMultiselectItem(n,e,t)}})),this.label.container.append(r),this.adjustInputSize(),!0}},cancelMultiselectItem:function(t,e,n){var i=this.items[t];(e=e||this.label.container.find("."+this.options.selector.label).eq(t)).remove(),this.items.splice(t,1),this.comparedItems.splice(t,1),this.options.multiselect.callback&&this.helper.executeCallback.call(this,this.options.multiselect.callback.onCancel,[this.node,i,n]),this.adjustInputSize(),this.focusOnly=!0,this.node.focus().trigger("input"+this.namespace,{origin:"cancelMultiselectItem"})},adjustInputSize:function(){var n=this.node[0].getBoundingClientRect().width-(parseFloat(this.label.container.data("padding-right"))||0)-(parseFloat(this.label.container.css("padding-left"))||0),i=0,o=0,r=0,s=!1,a=0;this.label.container.find("."+this.options.selector.label).filter(function(t,e){0===t&&(a=M(e)[0].getBoundingClientRect().height+parseFloat(M(e).css("margin-bottom")||0)),i=M(e)[0].getBoundingClientRect().width+parseFloat(M(e).css("margin-right")||0),.7*n<r+i&&!s&&(o++,s=!0),r+i<n?r+=i:(s=!1,r=i)});var t=parseFloat(this.label.container.data("padding-left")||0)+(s?0:r),e=o*a+parseFloat(this.label.container.data("padding-top")||0);this.container.find("."+this.options.selector.query).find("input, textarea, [contenteditable], .typeahead__hint").css({paddingLeft:t,paddingTop:e})},showLayout:function(){!this.container.hasClass("result")&&(this.result.length||this.displayEmptyTemplate||this.options.backdropOnFocus)&&(function(){var e=this;M("html").off("keydown"+this.namespace).on("keydown"+this.namespace,function(t){t.keyCode&&9===t.keyCode&&setTimeout(function(){M(":focus").closest(e.container).find(e.node)[0]||e.hideLayout()},0)}),M("html").off("click"+this.namespace+" touchend"+this.namespace).on("click"+this.namespace+" touchend"+this.namespace,function(t){M(t.target).closest(e.container)[0]||M(t.target).closest("."+e.options.selector.item)[0]||t.target.className===e.options.selector.cancelButton||e.hasDragged||e.hideLayout()})}.call(this),this.container.addClass([this.result.length||this.searchGroups.length&&this.displayEmptyTemplate?"result ":"",this.options.hint&&this.searchGroups.length?"hint":"",this.options.backdrop||this.options.backdropOnFocus?"backdrop":""].join(" ")),this.helper.executeCallback.call(this,this.options.callback.onShowLayout,[this.node,this.query]))},hideLayout:function(){(this.container.hasClass("result")||this.container.hasClass("backdrop"))&&(this.container.removeClass("result hint filter"+(this.options.backdropOnFocus&&M(this.node).is(":focus")?"":" backdrop")),this.options.backdropOnFocus&&this.container.hasClass("backdrop")||(M("html").off(this.namespace),this.helper.executeCallback.call(this,this.options.callback.onHideLayout,[this.node,this.query])))},resetLayout:function(){this.result=[],this.tmpResult={},this.groups=[],this.resultCount=0,this.resultCountPerGroup={},this.resultItemCount=0,this.resultHtml=null,this.options.hint&&this.hint.container&&(this.hint.container.val(""),this.isContentEditable&&this.hint.container.text(""))},resetInput:function(){this.node.val(""),this.isContentEditable&&this.node.text(""),this.query="",this.rawQuery=""},buildCancelButtonLayout:function(){if(this.options.cancelButton){var e=this;M("<span/>",{class:this.options.selector.cancelButton,html:"Ã—",mousedown:function(t){t.stopImmediatePropagation(),t.preventDefault(),e.resetInput(),e.node.trigger("input"+e.namespace,[t])}}).insertBefore(this.node)}},toggleCancelButtonVisibility:function(){this.container.toggleClass("cancel",!!this.query.length)},__construct:function(){this.extendOptions(),this.unifySourceFormat()&&(this.dynamicFilter.init.apply(this),this.init(),this.buildDropdownLayout(),this.buildDropdownItemLayout("static"),this.buildMultiselectLayout(),this.delegateEvents(),this.buildCancelButtonLayout(),this.helper.executeCallback.call(this,this.options.callback.onReady,[this.node]))},helper:{isEmpty:function(t){for(var e in t)if(t.hasOwnProperty(e))return!1;return!0},removeAccent:function(t){if("string"==typeof t){var e=o;return"object"==typeof this.options.accent&&(e=this.options.accent),t.toLowerCase().replace(new RegExp("["+e.from+"]","g"),function(t){return e.to[e.from.indexOf(t)]})}},slugify:function(t){return""!==(t=String(t))&&(t=(t=this.helper.removeAccent.call(this,t)).replace(/[^-a-z0-9]+/g,"-").replace(/-+/g,"-").replace(/^-|-$/g,"")),t},sort:function(i,n,o){var r=function(t){for(var e=0,n=i.length;e<n;e++)if(void 0!==t[i[e]])return o(t[i[e]]);return t};return n=[-1,1][+!!n],function(t,e){return t=r(t),e=r(e),n*((e<t)-(t<e))}},replaceAt:function(t,e,n,i){return t.substring(0,e)+i+t.substring(e+n)},highlight:function(t,e,n){t=String(t);var i=n&&this.helper.removeAccent.call(this,t)||t,o=[];Array.isArray(e)||(e=[e]),e.sort(function(t,e){return e.length-t.length});for(var r=e.length-1;0<=r;r--)""!==e[r].trim()?e[r]=e[r].replace(/[-[\]{}()*+?.,\\^$|#\s]/g,"\\$&"):e.splice(r,1);for(i.replace(new RegExp("(?:"+e.join("|")+")(?!([^<]+)?>)","gi"),function(t,e,n){o.push({offset:n,length:t.length})}),r=o.length-1;0<=r;r--)t=this.helper.replaceAt(t,o[r].offset,o[r].length,"<strong>"+t.substr(o[r].offset,o[r].length)+"</strong>");return t},getCaret:function(t){var e=0;if(t.selectionStart)return t.selectionStart;if(document.selection){var n=document.selection.createRange();if(null===n)return e;var i=t.createTextRange(),o=i.duplicate();i.moveToBookmark(n.getBookmark()),o.setEndPoint("EndToStart",i),e=o.text.length}else if(window.getSelection){var r=window.getSelection();if(r.rangeCount){var s=r.getRangeAt(0);s.commonAncestorContainer.parentNode==t&&(e=s.endOffset)}}return e},setCaretAtEnd:function(t){if(void 0!==window.getSelection&&void 0!==document.createRange){var e=document.createRange();e.selectNodeContents(t),e.collapse(!1);var n=window.getSelection();n.removeAllRanges(),n.addRange(e)}else if(void 0!==document.body.createTextRange){var i=document.body.createTextRange();i.moveToElementText(t),i.collapse(!1),i.select()}},cleanStringFromScript:function(t){return"string"==typeof t&&t.replace(/<\/?(?:script|iframe)\b[^>]*>/gm,"")||t},executeCallback:function(t,e){if(t){var n;if("function"==typeof t)n=t;else if(("string"==typeof t||Array.isArray(t))&&("string"==typeof t&&(t=[t,[]]),"function"!=typeof(n=this.helper.namespace.call(this,t[0],window))))return;return n.apply(this,(t[1]||[]).concat(e||[]))}},namespace:function(t,e,n,i){if("string"!=typeof t||""===t)return!1;var o=void 0!==i?i:void 0;if(!~t.indexOf("."))return e[t]||o;for(var r=t.split("."),s=e||window,a=(n=n||"get",""),l=0,c=r.length;l<c;l++){if(void 0===s[a=r[l]]){if(~["get","delete"].indexOf(n))return void 0!==i?i:void 0;s[a]={}}if(~["set","create","delete"].indexOf(n)&&l===c-1){if("set"!==n&&"create"!==n)return delete s[a],!0;s[a]=o}s=s[a]}return s},typeWatch:(n=0,function(t,e){clearTimeout(n),n=setTimeout(t,e)})}},M.fn.typeahead=M.typeahead=function(t){return e.typeahead(this,t)};var e={typeahead:function(t,e){if(e&&e.source&&"object"==typeof e.source){if("function"==typeof t){if(!e.input)return;t=M(e.input)}if(void 0===t[0].value&&(t[0].value=t.text()),t.length){if(1===t.length)return t[0].selector=t.selector||e.input||t[0].nodeName.toLowerCase(),window.Typeahead[t[0].selector]=new l(t,e);for(var n,i={},o=0,r=t.length;o<r;++o)void 0!==i[n=t[o].nodeName.toLowerCase()]&&(n+=o),t[o].selector=n,window.Typeahead[n]=i[n]=new l(t.eq(o),e);return i}}}};return window.console=window.console||{log:function(){}},Array.isArray||(Array.isArray=function(t){return"[object Array]"===Object.prototype.toString.call(t)}),"trim"in String.prototype||(String.prototype.trim=function(){return this.replace(/^\s+/,"").replace(/\s+$/,"")}),"indexOf"in Array.prototype||(Array.prototype.indexOf=function(t,e){void 0===e&&(e=0),e<0&&(e+=this.length),e<0&&(e=0);for(var n=this.length;e<n;e++)if(e in this&&this[e]===t)return e;return-1}),Object.keys||(Object.keys=function(t){var e,n=[];for(e in t)Object.prototype.hasOwnProperty.call(t,e)&&n.push(e);return n}),l}),function(s,y){var u,d,h,v=s,b=v.document,c=v.navigator,o=v.setTimeout,t=v.clearTimeout,p=v.setInterval,e=v.clearInterval,l=v.getComputedStyle,a=v.encodeURIComponent,f=v.ActiveXObject,r=v.Error,n=v.Number.parseInt||v.parseInt,m=v.Number.parseFloat||v.parseFloat,i=v.Number.isNaN||v.isNaN,g=v.Date.now,w=v.Object.keys,x=v.Object.prototype.hasOwnProperty,k=v.Array.prototype.slice,_=function(){var t=function(t){return t};if("function"==typeof v.wrap&&"function"==typeof v.unwrap)try{var e=b.createElement("div"),n=v.unwrap(e);1===e.nodeType&&n&&1===n.nodeType&&(t=v.unwrap)}catch(t){}return t}(),C=function(t){return k.call(t,0)},T=function(){var t,e,n,i,o,r=C(arguments),s=r[0]||{};for(t=1,e=r.length;t<e;t++)if(null!=(n=r[t]))for(i in n)x.call(n,i)&&(s[i],s!==(o=n[i])&&o!==y&&(s[i]=o));return s},S=function(t){var e,n,i,o;if("object"!=typeof t||null==t||"number"==typeof t.nodeType)e=t;else if("number"==typeof t.length)for(e=[],n=0,i=t.length;n<i;n++)x.call(t,n)&&(e[n]=S(t[n]));else for(o in e={},t)x.call(t,o)&&(e[o]=S(t[o]));return e},D=function(t,e){if(t&&1===t.nodeType&&t.ownerDocument&&e&&(1===e.nodeType&&e.ownerDocument&&e.ownerDocument===t.ownerDocument||9===e.nodeType&&!e.ownerDocument&&e===t.ownerDocument))do{if(t===e)return!0;t=t.parentNode}while(t);return!1},E=function(t){var e;return"string"==typeof t&&t&&(e=t.split("#")[0].split("?")[0],e=t.slice(0,t.lastIndexOf("/")+1)),e},$=function(){var t,e,n;if(b.currentScript&&(t=b.currentScript.src))return t;if(1===(e=b.getElementsByTagName("script")).length)return e[0].src||y;if("readyState"in(e[0]||document.createElement("script")))for(n=e.length;n--;)if("interactive"===e[n].readyState&&(t=e[n].src))return t;return"loading"===b.readyState&&(t=e[e.length-1].src)?t:(t=function(){var t,e,n,i,o;try{throw new r}catch(t){e=t}return e&&(t=e.sourceURL||e.fileName||("string"==typeof(n=e.stack)&&n&&((o=n.match(/^(?:|[^:@]*@|.+\)@(?=http[s]?|file)|.+?\s+(?: at |@)(?:[^:\(]+ )*[\(]?)((?:http[s]?|file):\/\/[\/]?.+?\/[^:\)]*?)(?::\d+)(?::\d+)?/))&&o[1]?i=o[1]:(o=n.match(/\)@((?:http[s]?|file):\/\/[\/]?.+?\/[^:\)]*?)(?::\d+)(?::\d+)?/))&&o[1]&&(i=o[1])),i)),t}())?t:y},L=null==v.opener&&(!!v.top&&v!=v.top||!!v.parent&&v!=v.parent),M="html"===b.documentElement.nodeName,O={bridge:null,version:"0.0.0",pluginType:"unknown",sandboxed:null,disabled:null,outdated:null,insecure:null,unavailable:null,degraded:null,deactivated:null,overdue:null,ready:null},A={},j={},F=null,N=0,P=0,I={ready:"Flash communication is established",error:{"flash-sandboxed":"Attempting to run Flash in a sandboxed iframe, which is impossible","flash-disabled":"Flash is disabled or not installed. May also be attempting to run Flash in a sandboxed iframe, which is impossible.","flash-outdated":"Flash is too outdated to support ZeroClipboard","flash-insecure":"Flash will be unable to communicate due to a protocol mismatch between your `swfPath` configuration and the page","flash-unavailable":"Flash is unable to communicate bidirectionally with JavaScript","flash-degraded":"Flash is unable to preserve data fidelity when communicating with JavaScript","flash-deactivated":"Flash is too outdated for your browser and/or is configured as click-to-activate.\nThis may also mean that the ZeroClipboard SWF object could not be loaded, so please check your `swfPath` configuration and/or network connectivity.\nMay also be attempting to run Flash in a sandboxed iframe, which is impossible.","flash-overdue":"Flash communication was established but NOT within the acceptable time limit","version-mismatch":"ZeroClipboard JS version number does not match ZeroClipboard SWF version number","clipboard-error":"At least one error was thrown while ZeroClipboard was attempting to inject your data into the clipboard","config-mismatch":"ZeroClipboard configuration does not match Flash's reality","swf-not-found":"The ZeroClipboard SWF object could not be loaded, so please check your `swfPath` configuration and/or network connectivity","browser-unsupported":"The browser does not support the required HTML DOM and JavaScript features"}},H=["flash-unavailable","flash-degraded","flash-overdue","version-mismatch","config-mismatch","clipboard-error"],Y=["flash-sandboxed","flash-disabled","flash-outdated","flash-insecure","flash-unavailable","flash-degraded","flash-deactivated","flash-overdue"],q=new RegExp("^flash-("+Y.map(function(t){return t.replace(/^flash-/,"")}).join("|")+")$"),R=new RegExp("^flash-("+Y.filter(function(t){return"flash-disabled"!==t}).map(function(t){return t.replace(/^flash-/,"")}).join("|")+")$"),W={swfPath:(E($())||function(){var t,e,n,i=b.getElementsByTagName("script");for(t=i.length;t--;){if(!(n=i[t].src)){e=null;break}if(n=E(n),null==e)e=n;else if(e!==n){e=null;break}}return e||y}()||"")+"ZeroClipboard.swf",trustedDomains:v.location.host?[v.location.host]:[],cacheBust:!0,forceEnhancedClipboard:!1,flashLoadTimeout:3e4,autoActivate:!0,bubbleEvents:!0,fixLineEndings:!0,containerId:"global-zeroclipboard-html-bridge",containerClass:"global-zeroclipboard-container",swfObjectId:"global-zeroclipboard-flash-bridge",hoverClass:!1,activeClass:!1,forceHandCursor:!1,title:null,zIndex:999999999},B=function(){return!!(b.addEventListener&&v.Object.keys&&v.Array.prototype.map)},G=function(){var t=W.swfPath||"",e=t.slice(0,2),n=t.slice(0,t.indexOf("://")+1);return"\\\\"===e?"file:":"//"===e||""===n?v.location.protocol:n},U=function(t){void 0===t?(!function(t){if(t)for(var e in t)x.call(t,e)&&delete t[e]}(j),F=null):"string"==typeof t&&x.call(j,t)&&delete j[t]},z=function(t){return"string"==typeof t&&t&&/^[A-Za-z][A-Za-z0-9_:\-\.]*$/.test(t)},V=function(t){var e;if("string"==typeof t&&t?(e=t,t={}):"object"==typeof t&&t&&"string"==typeof t.type&&t.type&&(e=t.type),e){e=e.toLowerCase(),!t.target&&(/^(copy|aftercopy|_click)$/.test(e)||"error"===e&&"clipboard-error"===t.name)&&(t.target=h),T(t,{type:e,target:t.target||d||null,relatedTarget:t.relatedTarget||null,currentTarget:O&&O.bridge||null,timeStamp:t.timeStamp||g()||null});var n=I[t.type];return"error"===t.type&&t.name&&n&&(n=n[t.name]),n&&(t.message=n),"ready"===t.type&&T(t,{target:null,version:O.version}),"error"===t.type&&(q.test(t.name)&&T(t,{target:null,minimumVersion:"11.0.0"}),R.test(t.name)&&T(t,{version:O.version}),"flash-insecure"===t.name&&T(t,{pageProtocol:v.location.protocol,swfProtocol:G()})),"copy"===t.type&&(t.clipboardData={setData:Tt.setData,clearData:Tt.clearData}),"aftercopy"===t.type&&(t=at(t,F)),t.target&&!t.relatedTarget&&(t.relatedTarget=Z(t.target)),X(t)}},Z=function(t){var e=t&&t.getAttribute&&t.getAttribute("data-clipboard-target");return e?b.getElementById(e):null},X=function(t){if(t&&/^_(?:click|mouse(?:over|out|down|up|move))$/.test(t.type)){var e=t.target,n="_mouseover"===t.type&&t.relatedTarget?t.relatedTarget:y,i="_mouseout"===t.type&&t.relatedTarget?t.relatedTarget:y,o=gt(e),r=v.screenLeft||v.screenX||0,s=v.screenTop||v.screenY||0,a=b.body.scrollLeft+b.documentElement.scrollLeft,l=b.body.scrollTop+b.documentElement.scrollTop,c=o.left+("number"==typeof t._stageX?t._stageX:0),u=o.top+("number"==typeof t._stageY?t._stageY:0),d=c-a,h=u-l,p=r+d,f=s+h,m="number"==typeof t.movementX?t.movementX:0,g="number"==typeof t.movementY?t.movementY:0;delete t._stageX,delete t._stageY,T(t,{srcElement:e,fromElement:n,toElement:i,screenX:p,screenY:f,pageX:c,pageY:u,clientX:d,clientY:h,x:d,y:h,movementX:m,movementY:g,offsetX:0,offsetY:0,layerX:0,layerY:0})}return t},Q=function(t){var e=t&&"string"==typeof t.type&&t.type||"";return!/^(?:(?:before)?copy|destroy)$/.test(e)},J=function(t,e,n,i){i?o(function(){t.apply(e,n)},0):t.apply(e,n)},K=function(t){if("object"==typeof t&&t&&t.type){var e=Q(t),n=A["*"]||[],i=A[t.type]||[],o=n.concat(i);if(o&&o.length){var r,s,a,l,c;for(r=0,s=o.length;r<s;r++)l=this,"string"==typeof(a=o[r])&&"function"==typeof v[a]&&(a=v[a]),"object"==typeof a&&a&&"function"==typeof a.handleEvent&&(a=(l=a).handleEvent),"function"==typeof a&&(c=T({},t),J(a,l,[c],e))}return this}},tt=function(t){var e,n,i=t.target||d||null,o="swf"===t._source;switch(delete t._source,t.type){case"error":var r="flash-sandboxed"===t.name||(e=t,n=null,(!1===L||e&&"error"===e.type&&e.name&&-1!==H.indexOf(e.name))&&(n=!1),n);"boolean"==typeof r&&(O.sandboxed=r),"browser-unsupported"===t.name?T(O,{disabled:!1,outdated:!1,unavailable:!1,degraded:!1,deactivated:!1,overdue:!1,ready:!1}):-1!==Y.indexOf(t.name)?T(O,{disabled:"flash-disabled"===t.name,outdated:"flash-outdated"===t.name,insecure:"flash-insecure"===t.name,unavailable:"flash-unavailable"===t.name,degraded:"flash-degraded"===t.name,deactivated:"flash-deactivated"===t.name,overdue:"flash-overdue"===t.name,ready:!1}):"version-mismatch"===t.name&&(u=t.swfVersion,T(O,{disabled:!1,outdated:!1,insecure:!1,unavailable:!1,degraded:!1,deactivated:!1,overdue:!1,ready:!1})),vt();break;case"ready":u=t.swfVersion;var s=!0===O.deactivated;T(O,{sandboxed:!1,disabled:!1,outdated:!1,insecure:!1,unavailable:!1,degraded:!1,deactivated:!1,overdue:s,ready:!s}),vt();break;case"beforecopy":h=i;break;case"copy":var a,l,c=t.relatedTarget;!j["text/html"]&&!j["text/plain"]&&c&&(l=c.value||c.outerHTML||c.innerHTML)&&(a=c.value||c.textContent||c.innerText)?(t.clipboardData.clearData(),t.clipboardData.setData("text/plain",a),l!==a&&t.clipboardData.setData("text/html",l)):!j["text/plain"]&&t.target&&(a=t.target.getAttribute("data-clipboard-text"))&&(t.clipboardData.clearData(),t.clipboardData.setData("text/plain",a));break;case"aftercopy":et(t),Tt.clearData(),i&&i!==ht()&&i.focus&&i.focus();break;case"_mouseover":Tt.focus(i),!0===W.bubbleEvents&&o&&(i&&i!==t.relatedTarget&&!D(t.relatedTarget,i)&&nt(T({},t,{type:"mouseenter",bubbles:!1,cancelable:!1})),nt(T({},t,{type:"mouseover"})));break;case"_mouseout":Tt.blur(),!0===W.bubbleEvents&&o&&(i&&i!==t.relatedTarget&&!D(t.relatedTarget,i)&&nt(T({},t,{type:"mouseleave",bubbles:!1,cancelable:!1})),nt(T({},t,{type:"mouseout"})));break;case"_mousedown":pt(i,W.activeClass),!0===W.bubbleEvents&&o&&nt(T({},t,{type:t.type.slice(1)}));break;case"_mouseup":ft(i,W.activeClass),!0===W.bubbleEvents&&o&&nt(T({},t,{type:t.type.slice(1)}));break;case"_click":!(h=null)===W.bubbleEvents&&o&&nt(T({},t,{type:t.type.slice(1)}));break;case"_mousemove":!0===W.bubbleEvents&&o&&nt(T({},t,{type:t.type.slice(1)}))}if(/^_(?:click|mouse(?:over|out|down|up|move))$/.test(t.type))return!0},et=function(t){if(t.errors&&0<t.errors.length){var e=S(t);T(e,{type:"error",name:"clipboard-error"}),delete e.success,o(function(){Tt.emit(e)},0)}},nt=function(t){if(t&&"string"==typeof t.type&&t){var e,n=t.target||null,i=n&&n.ownerDocument||b,o={view:i.defaultView||v,canBubble:!0,cancelable:!0,detail:"click"===t.type?1:0,button:"number"==typeof t.which?t.which-1:"number"==typeof t.button?t.button:i.createEvent?0:1},r=T(o,t);n&&i.createEvent&&n.dispatchEvent&&(r=[r.type,r.canBubble,r.cancelable,r.view,r.detail,r.screenX,r.screenY,r.clientX,r.clientY,r.ctrlKey,r.altKey,r.shiftKey,r.metaKey,r.button,r.relatedTarget],(e=i.createEvent("MouseEvents")).initMouseEvent&&(e.initMouseEvent.apply(e,r),e._source="js",n.dispatchEvent(e)))}},it=function(t){for(var e=t&&t.parentNode;e&&"OBJECT"===e.nodeName&&e.parentNode;)e=e.parentNode;return e||null},ot=function(){var t,e,n,i=O.bridge,o=it(i);if(!i){var r=dt(v.location.host,W),s="never"===r?"none":"all",a=ct(T({jsVersion:Tt.version},W)),l=W.swfPath+lt(W.swfPath,W);M&&(l="string"==typeof(n=l)&&n?n.replace(/["&'<>]/g,function(t){switch(t){case'"':return"&quot;";case"&":return"&amp;";case"'":return"&apos;";case"<":return"&lt;";case">":return"&gt;";default:return t}}):n),(e=b.createElement("div")).id=W.containerId,e.className=W.containerClass,e.style.position="absolute",e.style.left="0px",e.style.top="-9999px",e.style.width="1px",e.style.height="1px",e.style.zIndex=""+xt(W.zIndex),o=e;var c=b.createElement("div");o.appendChild(c),b.body.appendChild(o);var u=b.createElement("div"),d="activex"===O.pluginType;u.innerHTML='<object id="'+W.swfObjectId+'" name="'+W.swfObjectId+'" width="100%" height="100%" '+(d?'classid="clsid:d27cdb6e-ae6d-11cf-96b8-444553540000"':'type="application/x-shockwave-flash" data="'+l+'"')+">"+(d?'<param name="movie" value="'+l+'"/>':"")+'<param name="allowScriptAccess" value="'+r+'"/><param name="allowNetworking" value="'+s+'"/><param name="menu" value="false"/><param name="wmode" value="transparent"/><param name="flashvars" value="'+a+'"/><div id="'+W.swfObjectId+'_fallbackContent">&nbsp;</div></object>',i=u.firstChild,u=null,_(i).ZeroClipboard=Tt,o.replaceChild(i,c),function(){var t=W.flashLoadTimeout;if("number"==typeof t&&0<=t){var e=Math.min(1e3,t/10),n=W.swfObjectId+"_fallbackContent";P=p(function(){var t=b.getElementById(n);yt(t)&&(vt(),O.deactivated=null,Tt.emit({type:"error",name:"swf-not-found"}))},e)}}()}return i||((i=b[W.swfObjectId])&&(t=i.length)&&(i=i[t-1]),!i&&o&&(i=o.firstChild)),O.bridge=i||null,i},rt=function(){var n=O.bridge;if(n){var i=it(n);i&&("activex"===O.pluginType&&"readyState"in n?(n.style.display="none",function t(){if(4===n.readyState){for(var e in n)"function"==typeof n[e]&&(n[e]=null);n.parentNode&&n.parentNode.removeChild(n),i.parentNode&&i.parentNode.removeChild(i)}else o(t,10)}()):(n.parentNode&&n.parentNode.removeChild(n),i.parentNode&&i.parentNode.removeChild(i))),vt(),O.ready=null,O.bridge=null,O.deactivated=null,O.insecure=null,u=y}},st=function(t){var e={},n={};if("object"==typeof t&&t){for(var i in t)if(i&&x.call(t,i)&&"string"==typeof t[i]&&t[i])switch(i.toLowerCase()){case"text/plain":case"text":case"air:text":case"flash:text":e.text=t[i],n.text=i;break;case"text/html":case"html":case"air:html":case"flash:html":e.html=t[i],n.html=i;break;case"application/rtf":case"text/rtf":case"rtf":case"richtext":case"air:rtf":case"flash:rtf":e.rtf=t[i],n.rtf=i}return{data:e,formatMap:n}}},at=function(t,e){if("object"!=typeof t||!t||"object"!=typeof e||!e)return t;var n={};for(var i in t)if(x.call(t,i))if("errors"===i){n[i]=t[i]?t[i].slice():[];for(var o=0,r=n[i].length;o<r;o++)n[i][o].format=e[n[i][o].format]}else if("success"!==i&&"data"!==i)n[i]=t[i];else{n[i]={};var s=t[i];for(var a in s)a&&x.call(s,a)&&x.call(e,a)&&(n[i][e[a]]=s[a])}return n},lt=function(t,e){return null==e||e&&!0===e.cacheBust?(-1===t.indexOf("?")?"?":"&")+"noCache="+g():""},ct=function(t){var e,n,i,o,r="",s=[];if(t.trustedDomains&&("string"==typeof t.trustedDomains?o=[t.trustedDomains]:"object"==typeof t.trustedDomains&&"length"in t.trustedDomains&&(o=t.trustedDomains)),o&&o.length)for(e=0,n=o.length;e<n;e++)if(x.call(o,e)&&o[e]&&"string"==typeof o[e]){if(!(i=ut(o[e])))continue;if("*"===i){s.length=0,s.push(i);break}s.push.apply(s,[i,"//"+i,v.location.protocol+"//"+i])}return s.length&&(r+="trustedOrigins="+a(s.join(","))),!0===t.forceEnhancedClipboard&&(r+=(r?"&":"")+"forceEnhancedClipboard=true"),"string"==typeof t.swfObjectId&&t.swfObjectId&&(r+=(r?"&":"")+"swfObjectId="+a(t.swfObjectId)),"string"==typeof t.jsVersion&&t.jsVersion&&(r+=(r?"&":"")+"jsVersion="+a(t.jsVersion)),r},ut=function(t){if(null==t||""===t)return null;if(""===(t=t.replace(/^\s+|\s+$/g,"")))return null;var e=t.indexOf("//"),n=(t=-1===e?t:t.slice(e+2)).indexOf("/");return(t=-1===n?t:-1===e||0===n?null:t.slice(0,n))&&".swf"===t.slice(-4).toLowerCase()?null:t||null},dt=function(t,e){var n=ut(e.swfPath);null===n&&(n=t);var i=function(t){var e,n,i,o=[];if("string"==typeof t&&(t=[t]),"object"!=typeof t||!t||"number"!=typeof t.length)return o;for(e=0,n=t.length;e<n;e++)if(x.call(t,e)&&(i=ut(t[e]))){if("*"===i){o.length=0,o.push("*");break}-1===o.indexOf(i)&&o.push(i)}return o}(e.trustedDomains),o=i.length;if(0<o){if(1===o&&"*"===i[0])return"always";if(-1!==i.indexOf(t))return 1===o&&t===n?"sameDomain":"always"}return"never"},ht=function(){try{return b.activeElement}catch(t){return null}},pt=function(t,e){var n,i,o,r=[];if("string"==typeof e&&e&&(r=e.split(/\s+/)),t&&1===t.nodeType&&0<r.length){for(o=(" "+(t.className||"")+" ").replace(/[\t\r\n\f]/g," "),n=0,i=r.length;n<i;n++)-1===o.indexOf(" "+r[n]+" ")&&(o+=r[n]+" ");(o=o.replace(/^\s+|\s+$/g,""))!==t.className&&(t.className=o)}return t},ft=function(t,e){var n,i,o,r=[];if("string"==typeof e&&e&&(r=e.split(/\s+/)),t&&1===t.nodeType&&0<r.length&&t.className){for(o=(" "+t.className+" ").replace(/[\t\r\n\f]/g," "),n=0,i=r.length;n<i;n++)o=o.replace(" "+r[n]+" "," ");(o=o.replace(/^\s+|\s+$/g,""))!==t.className&&(t.className=o)}return t},mt=function(t,e){var n=l(t,null).getPropertyValue(e);return"cursor"!==e||n&&"auto"!==n||"A"!==t.nodeName?n:"pointer"},gt=function(t){var e={left:0,top:0,width:0,height:0};if(t.getBoundingClientRect){var n=t.getBoundingClientRect(),i=v.pageXOffset,o=v.pageYOffset,r=b.documentElement.clientLeft||0,s=b.documentElement.clientTop||0,a=0,l=0;if("relative"===mt(b.body,"position")){var c=b.body.getBoundingClientRect(),u=b.documentElement.getBoundingClientRect();a=c.left-u.left||0,l=c.top-u.top||0}e.left=n.left+i-r-a,e.top=n.top+o-s-l,e.width="width"in n?n.width:n.right-n.left,e.height="height"in n?n.height:n.bottom-n.top}return e},yt=function(t){if(!t)return!1;var e=l(t,null);if(!e)return!1;var n=0<m(e.height),i=0<m(e.width),o=0<=m(e.top),r=0<=m(e.left),s=n&&i&&o&&r,a=s?null:gt(t);return"none"!==e.display&&"collapse"!==e.visibility&&(s||!!a&&(n||0<a.height)&&(i||0<a.width)&&(o||0<=a.top)&&(r||0<=a.left))},vt=function(){t(N),N=0,e(P),P=0},bt=function(){var t;if(d&&(t=it(O.bridge))){var e=gt(d);T(t.style,{width:e.width+"px",height:e.height+"px",top:e.top+"px",left:e.left+"px",zIndex:""+xt(W.zIndex)})}},wt=function(t){!0===O.ready&&(O.bridge&&"function"==typeof O.bridge.setHandCursor?O.bridge.setHandCursor(t):O.ready=!1)},xt=function(t){return/^(?:auto|inherit)$/.test(t)?t:("number"!=typeof t||i(t)?"string"==typeof t&&(e=xt(n(t,10))):e=t,"number"==typeof e?e:"auto");var e},kt=function(t){var e,n=/(\r\n|\r|\n)/g;return"string"==typeof t&&!0===W.fixLineEndings&&(e=/win(dows|[\s]?(nt|me|ce|xp|vista|[\d]+))/i,c&&(e.test(c.appVersion||"")||e.test(c.platform||"")||-1!==(c.userAgent||"").indexOf("Windows"))?/((^|[^\r])\n|\r([^\n]|$))/.test(t)&&(t=t.replace(n,"\r\n")):/\r/.test(t)&&(t=t.replace(n,"\n"))),t},_t=function(t){var e,n,i,o=O.sandboxed,r=null;if(t=!0===t,!1===L)r=!1;else{try{n=s.frameElement||null}catch(t){i={name:t.name,message:t.message}}if(n&&1===n.nodeType&&"IFRAME"===n.nodeName)try{r=n.hasAttribute("sandbox")}catch(t){r=null}else{try{e=document.domain||null}catch(t){e=null}(null===e||i&&"SecurityError"===i.name&&/(^|[\s\(\[@])sandbox(es|ed|ing|[\s\.,!\)\]@]|$)/.test(i.message.toLowerCase()))&&(r=!0)}}return o===(O.sandboxed=r)||t||Ct(f),r},Ct=function(e){var n,t,i=!1,o=!1,r=!1,s="";function a(t){var e=t.match(/[\d]+/g);return e.length=3,e.join(".")}function l(t){var e;t&&(i=!0,t.version&&(s=a(t.version)),!s&&t.description&&(s=a(t.description)),t.filename&&(e=t.filename,r=!!e&&(e=e.toLowerCase())&&(/^(pepflashplayer\.dll|libpepflashplayer\.so|pepperflashplayer\.plugin)$/.test(e)||"chrome.plugin"===e.slice(-13))))}if(c.plugins&&c.plugins.length)l(c.plugins["Shockwave Flash"]),c.plugins["Shockwave Flash 2.0"]&&(i=!0,s="2.0.0.11");else if(c.mimeTypes&&c.mimeTypes.length)l((t=c.mimeTypes["application/x-shockwave-flash"])&&t.enabledPlugin);else if(void 0!==e){o=!0;try{n=new e("ShockwaveFlash.ShockwaveFlash.7"),i=!0,s=a(n.GetVariable("$version"))}catch(t){try{n=new e("ShockwaveFlash.ShockwaveFlash.6"),i=!0,s="6.0.21"}catch(t){try{n=new e("ShockwaveFlash.ShockwaveFlash"),i=!0,s=a(n.GetVariable("$version"))}catch(t){o=!1}}}}O.disabled=!0!==i,O.outdated=s&&m(s)<m("11.0.0"),O.version=s||"0.0.0",O.pluginType=r?"pepper":o?"activex":i?"netscape":"unknown"};Ct(f),_t(!0);var Tt=function(){if(!(this instanceof Tt))return new Tt;"function"==typeof Tt._createClient&&Tt._createClient.apply(this,C(arguments))};Tt.version="2.4.0-beta.1",Tt.config=function(){return function(e){return"object"!=typeof e||!e||"length"in e||w(e).forEach(function(t){if(/^(?:forceHandCursor|title|zIndex|bubbleEvents|fixLineEndings)$/.test(t))W[t]=e[t];else if(null==O.bridge)if("containerId"===t||"swfObjectId"===t){if(!z(e[t]))throw new Error("The specified `"+t+"` value is not valid as an HTML4 Element ID");W[t]=e[t]}else W[t]=e[t]}),"string"==typeof e&&e?x.call(W,e)?W[e]:void 0:S(W)}.apply(this,C(arguments))},Tt.state=function(){return function(){return _t(),{browser:T(function(t,e){for(var n={},i=0,o=e.length;i<o;i++)e[i]in t&&(n[e[i]]=t[e[i]]);return n}(c,["userAgent","platform","appName","appVersion"]),{isSupported:B()}),flash:function(t,e){var n={};for(var i in t)-1===e.indexOf(i)&&(n[i]=t[i]);return n}(O,["bridge"]),zeroclipboard:{version:Tt.version,config:Tt.config()}}}.apply(this,C(arguments))},Tt.isFlashUnusable=function(){return function(){return!!(O.sandboxed||O.disabled||O.outdated||O.unavailable||O.degraded||O.deactivated)}.apply(this,C(arguments))},Tt.on=function(){return function(n,t){var e,i,o,r={};if("string"==typeof n&&n?o=n.toLowerCase().split(/\s+/):"object"!=typeof n||!n||"length"in n||void 0!==t||w(n).forEach(function(t){var e=n[t];"function"==typeof e&&Tt.on(t,e)}),o&&o.length&&t){for(e=0,i=o.length;e<i;e++)r[n=o[e].replace(/^on/,"")]=!0,A[n]||(A[n]=[]),A[n].push(t);if(r.ready&&O.ready&&Tt.emit({type:"ready"}),r.error){for(B()||Tt.emit({type:"error",name:"browser-unsupported"}),e=0,i=Y.length;e<i;e++)if(!0===O[Y[e].replace(/^flash-/,"")]){Tt.emit({type:"error",name:Y[e]});break}u!==y&&Tt.version!==u&&Tt.emit({type:"error",name:"version-mismatch",jsVersion:Tt.version,swfVersion:u})}}return Tt}.apply(this,C(arguments))},Tt.off=function(){return function(n,t){var e,i,o,r,s;if(0===arguments.length?r=w(A):"string"==typeof n&&n?r=n.toLowerCase().split(/\s+/):"object"!=typeof n||!n||"length"in n||void 0!==t||w(n).forEach(function(t){var e=n[t];"function"==typeof e&&Tt.off(t,e)}),r&&r.length)for(e=0,i=r.length;e<i;e++)if(n=r[e].replace(/^on/,""),(s=A[n])&&s.length)if(t)for(o=s.indexOf(t);-1!==o;)s.splice(o,1),o=s.indexOf(t,o);else s.length=0;return Tt}.apply(this,C(arguments))},Tt.handlers=function(){return function(t){return"string"==typeof t&&t?S(A[t])||null:S(A)}.apply(this,C(arguments))},Tt.emit=function(){return function(t){var e,n,i;if((t=V(t))&&!tt(t))return"ready"===t.type&&!0===O.overdue?Tt.emit({type:"error",name:"flash-overdue"}):(e=T({},t),K.call(this,e),"copy"===t.type&&(n=(i=st(j)).data,F=i.formatMap),n)}.apply(this,C(arguments))},Tt.create=function(){return function(){var t,e,n=O.sandboxed;if(!B())return O.ready=!1,void Tt.emit({type:"error",name:"browser-unsupported"});_t(),"boolean"!=typeof O.ready&&(O.ready=!1),O.sandboxed!==n&&!0===O.sandboxed?(O.ready=!1,Tt.emit({type:"error",name:"flash-sandboxed"})):Tt.isFlashUnusable()||null!==O.bridge||((e=G())&&e!==v.location.protocol?Tt.emit({type:"error",name:"flash-insecure"}):("number"==typeof(t=W.flashLoadTimeout)&&0<=t&&(N=o(function(){"boolean"!=typeof O.deactivated&&(O.deactivated=!0),!0===O.deactivated&&Tt.emit({type:"error",name:"flash-deactivated"})},t)),O.overdue=!1,ot()))}.apply(this,C(arguments))},Tt.destroy=function(){return function(){Tt.clearData(),Tt.blur(),Tt.emit("destroy"),rt(),Tt.off()}.apply(this,C(arguments))},Tt.setData=function(){return function(t,e){var n;if("object"==typeof t&&t&&void 0===e)n=t,Tt.clearData();else{if("string"!=typeof t||!t)return;(n={})[t]=e}for(var i in n)"string"==typeof i&&i&&x.call(n,i)&&"string"==typeof n[i]&&n[i]&&(j[i]=kt(n[i]))}.apply(this,C(arguments))},Tt.clearData=function(){return U.apply(this,C(arguments))},Tt.getData=function(){return function(t){return void 0===t?S(j):"string"==typeof t&&x.call(j,t)?j[t]:void 0}.apply(this,C(arguments))},Tt.focus=Tt.activate=function(){return function(t){if(t&&1===t.nodeType){d&&(ft(d,W.activeClass),d!==t&&ft(d,W.hoverClass)),pt(d=t,W.hoverClass);var e=t.getAttribute("title")||W.title;if("string"==typeof e&&e){var n=it(O.bridge);n&&n.setAttribute("title",e)}var i=!0===W.forceHandCursor||"pointer"===mt(t,"cursor");wt(i),bt()}}.apply(this,C(arguments))},Tt.blur=Tt.deactivate=function(){return function(){var t=it(O.bridge);t&&(t.removeAttribute("title"),t.style.left="0px",t.style.top="-9999px",t.style.width="1px",t.style.height="1px"),d&&(ft(d,W.hoverClass),ft(d,W.activeClass),d=null)}.apply(this,C(arguments))},Tt.activeElement=function(){return function(){return d||null}.apply(this,C(arguments))};var St=0,Dt={},Et=0,$t={},Lt={};T(W,{autoActivate:!0});var Mt=function(t){if(!t||!t.type)return!1;if(t.client&&t.client!==this)return!1;var e=Dt[this.id],n=e&&e.elements,i=!!n&&0<n.length,o=!t.target||i&&-1!==n.indexOf(t.target),r=t.relatedTarget&&i&&-1!==n.indexOf(t.relatedTarget),s=t.client&&t.client===this;return!(!e||!(o||r||s))},Ot=function(t){var e=Dt[this.id];if("object"==typeof t&&t&&t.type&&e){var n=Q(t),i=e&&e.handlers["*"]||[],o=e&&e.handlers[t.type]||[],r=i.concat(o);if(r&&r.length){var s,a,l,c,u;for(s=0,a=r.length;s<a;s++)c=this,"string"==typeof(l=r[s])&&"function"==typeof v[l]&&(l=v[l]),"object"==typeof l&&l&&"function"==typeof l.handleEvent&&(l=(c=l).handleEvent),"function"==typeof l&&(u=T({},t),J(l,c,[u],n))}}},At=function(t){return"string"==typeof t&&(t=[]),"number"!=typeof t.length?[t]:t},jt=function(e){if(e&&1===e.nodeType){var n=function(t){(t||(t=v.event))&&("js"!==t._source&&(t.stopImmediatePropagation(),t.preventDefault()),delete t._source)},t=function(t){(t||(t=v.event))&&(n(t),Tt.focus(e))};e.addEventListener("mouseover",t,!1),e.addEventListener("mouseout",n,!1),e.addEventListener("mouseenter",n,!1),e.addEventListener("mouseleave",n,!1),e.addEventListener("mousemove",n,!1),Lt[e.zcClippingId]={mouseover:t,mouseout:n,mouseenter:n,mouseleave:n,mousemove:n}}},Ft=function(t){if(t&&1===t.nodeType){var e=Lt[t.zcClippingId];if("object"==typeof e&&e){for(var n,i,o=["move","leave","enter","out","over"],r=0,s=o.length;r<s;r++)"function"==typeof(i=e[n="mouse"+o[r]])&&t.removeEventListener(n,i,!1);delete Lt[t.zcClippingId]}}};Tt._createClient=function(){(function(t){var e,n=this;n.id=""+St++,e={instance:n,elements:[],handlers:{},coreWildcardHandler:function(t){return n.emit(t)}},Dt[n.id]=e,t&&n.clip(t),Tt.on("*",e.coreWildcardHandler),Tt.on("destroy",function(){n.destroy()}),Tt.create()}).apply(this,C(arguments))},Tt.prototype.on=function(){return function(n,t){var e,i,o,r={},s=this,a=Dt[s.id],l=a&&a.handlers;if(!a)throw new Error("Attempted to add new listener(s) to a destroyed ZeroClipboard client instance");if("string"==typeof n&&n?o=n.toLowerCase().split(/\s+/):"object"!=typeof n||!n||"length"in n||void 0!==t||w(n).forEach(function(t){var e=n[t];"function"==typeof e&&s.on(t,e)}),o&&o.length&&t){for(e=0,i=o.length;e<i;e++)r[n=o[e].replace(/^on/,"")]=!0,l[n]||(l[n]=[]),l[n].push(t);if(r.ready&&O.ready&&this.emit({type:"ready",client:this}),r.error){for(e=0,i=Y.length;e<i;e++)if(O[Y[e].replace(/^flash-/,"")]){this.emit({type:"error",name:Y[e],client:this});break}u!==y&&Tt.version!==u&&this.emit({type:"error",name:"version-mismatch",jsVersion:Tt.version,swfVersion:u})}}return s}.apply(this,C(arguments))},Tt.prototype.off=function(){return function(n,t){var e,i,o,r,s,a=this,l=Dt[a.id],c=l&&l.handlers;if(!c)return a;if(0===arguments.length?r=w(c):"string"==typeof n&&n?r=n.split(/\s+/):"object"!=typeof n||!n||"length"in n||void 0!==t||w(n).forEach(function(t){var e=n[t];"function"==typeof e&&a.off(t,e)}),r&&r.length)for(e=0,i=r.length;e<i;e++)if((s=c[n=r[e].toLowerCase().replace(/^on/,"")])&&s.length)if(t)for(o=s.indexOf(t);-1!==o;)s.splice(o,1),o=s.indexOf(t,o);else s.length=0;return a}.apply(this,C(arguments))},Tt.prototype.handlers=function(){return function(t){var e=null,n=Dt[this.id]&&Dt[this.id].handlers;return n&&(e="string"==typeof t&&t?n[t]?n[t].slice(0):[]:S(n)),e}.apply(this,C(arguments))},Tt.prototype.emit=function(){return function(t){var e;return Mt.call(this,t)&&("object"==typeof t&&t&&"string"==typeof t.type&&t.type&&(t=T({},t)),e=T({},V(t),{client:this}),Ot.call(this,e)),this}.apply(this,C(arguments))},Tt.prototype.clip=function(){return function(t){if(!Dt[this.id])throw new Error("Attempted to clip element(s) to a destroyed ZeroClipboard client instance");t=At(t);for(var e=0;e<t.length;e++)if(x.call(t,e)&&t[e]&&1===t[e].nodeType){t[e].zcClippingId?-1===$t[t[e].zcClippingId].indexOf(this.id)&&$t[t[e].zcClippingId].push(this.id):(t[e].zcClippingId="zcClippingId_"+Et++,$t[t[e].zcClippingId]=[this.id],!0===W.autoActivate&&jt(t[e]));var n=Dt[this.id]&&Dt[this.id].elements;-1===n.indexOf(t[e])&&n.push(t[e])}return this}.apply(this,C(arguments))},Tt.prototype.unclip=function(){return function(t){var e=Dt[this.id];if(!e)return this;for(var n,i=e.elements,o=(t=void 0===t?i.slice(0):At(t)).length;o--;)if(x.call(t,o)&&t[o]&&1===t[o].nodeType){for(n=0;-1!==(n=i.indexOf(t[o],n));)i.splice(n,1);var r=$t[t[o].zcClippingId];if(r){for(n=0;-1!==(n=r.indexOf(this.id,n));)r.splice(n,1);0===r.length&&(!0===W.autoActivate&&Ft(t[o]),delete t[o].zcClippingId)}}return this}.apply(this,C(arguments))},Tt.prototype.elements=function(){return function(){var t=Dt[this.id];return t&&t.elements?t.elements.slice(0):[]}.apply(this,C(arguments))},Tt.prototype.destroy=function(){return function(){var t=Dt[this.id];t&&(this.unclip(),this.off(),Tt.off("*",t.coreWildcardHandler),delete Dt[this.id])}.apply(this,C(arguments))},Tt.prototype.setText=function(t){if(!Dt[this.id])throw new Error("Attempted to set pending clipboard data from a destroyed ZeroClipboard client instance");return Tt.setData("text/plain",t),this},Tt.prototype.setHtml=function(t){if(!Dt[this.id])throw new Error("Attempted to set pending clipboard data from a destroyed ZeroClipboard client instance");return Tt.setData("text/html",t),this},Tt.prototype.setRichText=function(t){if(!Dt[this.id])throw new Error("Attempted to set pending clipboard data from a destroyed ZeroClipboard client instance");return Tt.setData("application/rtf",t),this},Tt.prototype.setData=function(){if(!Dt[this.id])throw new Error("Attempted to set pending clipboard data from a destroyed ZeroClipboard client instance");return Tt.setData.apply(this,C(arguments)),this},Tt.prototype.clearData=function(){if(!Dt[this.id])throw new Error("Attempted to clear pending clipboard data from a destroyed ZeroClipboard client instance");return Tt.clearData.apply(this,C(arguments)),this},Tt.prototype.getData=function(){if(!Dt[this.id])throw new Error("Attempted to get pending clipboard data from a destroyed ZeroClipboard client instance");return Tt.getData.apply(this,C(arguments))},"function"==typeof define&&define.amd?define(function(){return Tt}):"object"==typeof module&&module&&"object"==typeof module.exports&&module.exports?module.exports=Tt:s.ZeroClipboard=Tt}(function(){return this||window}()),function(t){if("object"==typeof exports&&"undefined"!=typeof module)module.exports=t();else if("function"==typeof define&&define.amd)define([],t);else{("undefined"!=typeof window?window:"undefined"!=typeof global?global:"undefined"!=typeof self?self:this).Clipboard=t()}}(function(){return function r(s,a,l){function c(n,t){if(!a[n]){if(!s[n]){var e="function"==typeof require&&require;if(!t&&e)return e(n,!0);if(u)return u(n,!0);var i=new Error("Cannot find module '"+n+"'");throw i.code="MODULE_NOT_FOUND",i}var o=a[n]={exports:{}};s[n][0].call(o.exports,function(t){var e=s[n][1][t];return c(e||t)},o,o.exports,r,s,a,l)}return a[n].exports}for(var u="function"==typeof require&&require,t=0;t<l.length;t++)c(l[t]);return c}({1:[function(t,e,n){if("undefined"!=typeof Element&&!Element.prototype.matches){var i=Element.prototype;i.matches=i.matchesSelector||i.mozMatchesSelector||i.msMatchesSelector||i.oMatchesSelector||i.webkitMatchesSelector}e.exports=function(t,e){for(;t&&9!==t.nodeType;){if(t.matches(e))return t;t=t.parentNode}}},{}],2:[function(t,e,n){var s=t("./closest");e.exports=function(t,e,n,i,o){var r=function(e,n,t,i){return function(t){t.delegateTarget=s(t.target,n),t.delegateTarget&&i.call(e,t)}}.apply(this,arguments);return t.addEventListener(n,r,o),{destroy:function(){t.removeEventListener(n,r,o)}}}},{"./closest":1}],3:[function(t,e,n){n.node=function(t){return void 0!==t&&t instanceof HTMLElement&&1===t.nodeType},n.nodeList=function(t){var e=Object.prototype.toString.call(t);return void 0!==t&&("[object NodeList]"===e||"[object HTMLCollection]"===e)&&"length"in t&&(0===t.length||n.node(t[0]))},n.string=function(t){return"string"==typeof t||t instanceof String},n.fn=function(t){return"[object Function]"===Object.prototype.toString.call(t)}},{}],4:[function(t,e,n){var h=t("./is"),p=t("delegate");e.exports=function(t,e,n){if(!t&&!e&&!n)throw new Error("Missing required arguments");if(!h.string(e))throw new TypeError("Second argument must be a String");if(!h.fn(n))throw new TypeError("Third argument must be a Function");if(h.node(t))return u=e,d=n,(c=t).addEventListener(u,d),{destroy:function(){c.removeEventListener(u,d)}};if(h.nodeList(t))return s=t,a=e,l=n,Array.prototype.forEach.call(s,function(t){t.addEventListener(a,l)}),{destroy:function(){Array.prototype.forEach.call(s,function(t){t.removeEventListener(a,l)})}};if(h.string(t))return i=t,o=e,r=n,p(document.body,i,o,r);throw new TypeError("First argument must be a String, HTMLElement, HTMLCollection, or NodeList");var i,o,r,s,a,l,c,u,d}},{"./is":3,delegate:2}],5:[function(t,e,n){e.exports=function(t){var e;if("SELECT"===t.nodeName)t.focus(),e=t.value;else if("INPUT"===t.nodeName||"TEXTAREA"===t.nodeName){var n=t.hasAttribute("readonly");n||t.setAttribute("readonly",""),t.select(),t.setSelectionRange(0,t.value.length),n||t.removeAttribute("readonly"),e=t.value}else{t.hasAttribute("contenteditable")&&t.focus();var i=window.getSelection(),o=document.createRange();o.selectNodeContents(t),i.removeAllRanges(),i.addRange(o),e=i.toString()}return e}},{}],6:[function(t,e,n){function i(){}i.prototype={on:function(t,e,n){var i=this.e||(this.e={});return(i[t]||(i[t]=[])).push({fn:e,ctx:n}),this},once:function(t,e,n){var i=this;function o(){i.off(t,o),e.apply(n,arguments)}return o._=e,this.on(t,o,n)},emit:function(t){for(var e=[].slice.call(arguments,1),n=((this.e||(this.e={}))[t]||[]).slice(),i=0,o=n.length;i<o;i++)n[i].fn.apply(n[i].ctx,e);return this},off:function(t,e){var n=this.e||(this.e={}),i=n[t],o=[];if(i&&e)for(var r=0,s=i.length;r<s;r++)i[r].fn!==e&&i[r].fn._!==e&&o.push(i[r]);return o.length?n[t]=o:delete n[t],this}},e.exports=i},{}],7:[function(i,o,r){!function(t,e){if(void 0!==r)e(o,i("select"));else{var n={exports:{}};e(n,t.select),t.clipboardAction=n.exports}}(this,function(t,e){var n,i=(n=e)&&n.__esModule?n:{default:n};var o="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t};var r=function(){function i(t,e){for(var n=0;n<e.length;n++){var i=e[n];i.enumerable=i.enumerable||!1,i.configurable=!0,"value"in i&&(i.writable=!0),Object.defineProperty(t,i.key,i)}}return function(t,e,n){return e&&i(t.prototype,e),n&&i(t,n),t}}(),s=function(){function e(t){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),this.resolveOptions(t),this.initSelection()}return r(e,[{key:"resolveOptions",value:function(){var t=0<arguments.length&&void 0!==arguments[0]?arguments[0]:{};this.action=t.action,this.emitter=t.emitter,this.target=t.target,this.text=t.text,this.trigger=t.trigger,this.selectedText=""}},{key:"initSelection",value:function(){this.text?this.selectFake():this.target&&this.selectTarget()}},{key:"selectFake",value:function(){var t=this,e="rtl"==document.documentElement.getAttribute("dir");this.removeFake(),this.fakeHandlerCallback=function(){return t.removeFake()},this.fakeHandler=document.body.addEventListener("click",this.fakeHandlerCallback)||!0,this.fakeElem=document.createElement("textarea"),this.fakeElem.style.fontSize="12pt",this.fakeElem.style.border="0",this.fakeElem.style.padding="0",this.fakeElem.style.margin="0",this.fakeElem.style.position="absolute",this.fakeElem.style[e?"right":"left"]="-9999px";var n=window.pageYOffset||document.documentElement.scrollTop;this.fakeElem.style.top=n+"px",this.fakeElem.setAttribute("readonly",""),this.fakeElem.value=this.text,document.body.appendChild(this.fakeElem),this.selectedText=(0,i.default)(this.fakeElem),this.copyText()}},{key:"removeFake",value:function(){this.fakeHandler&&(document.body.removeEventListener("click",this.fakeHandlerCallback),this.fakeHandler=null,this.fakeHandlerCallback=null),this.fakeElem&&(document.body.removeChild(this.fakeElem),this.fakeElem=null)}},{key:"selectTarget",value:function(){this.selectedText=(0,i.default)(this.target),this.copyText()}},{key:"copyText",value:function(){var e=void 0;try{e=document.execCommand(this.action)}catch(t){e=!1}this.handleResult(e)}},{key:"handleResult",value:function(t){this.emitter.emit(t?"success":"error",{action:this.action,text:this.selectedText,trigger:this.trigger,clearSelection:this.clearSelection.bind(this)})}},{key:"clearSelection",value:function(){this.target&&this.target.blur(),window.getSelection().removeAllRanges()}},{key:"destroy",value:function(){this.removeFake()}},{key:"action",set:function(){var t=0<arguments.length&&void 0!==arguments[0]?arguments[0]:"copy";if(this._action=t,"copy"!==this._action&&"cut"!==this._action)throw new Error('Invalid "action" value, use either "copy" or "cut"')},get:function(){return this._action}},{key:"target",set:function(t){if(void 0!==t){if(!t||"object"!==(void 0===t?"undefined":o(t))||1!==t.nodeType)throw new Error('Invalid "target" value, use a valid Element');if("copy"===this.action&&t.hasAttribute("disabled"))throw new Error('Invalid "target" attribute. Please use "readonly" instead of "disabled" attribute');if("cut"===this.action&&(t.hasAttribute("readonly")||t.hasAttribute("disabled")))throw new Error('Invalid "target" attribute. You can\'t cut text from elements with "readonly" or "disabled" attributes');this._target=t}},get:function(){return this._target}}]),e}();t.exports=s})},{select:5}],8:[function(i,o,r){!function(t,e){if(void 0!==r)e(o,i("./clipboard-action"),i("tiny-emitter"),i("good-listener"));else{var n={exports:{}};e(n,t.clipboardAction,t.tinyEmitter,t.goodListener),t.clipboard=n.exports}}(this,function(t,e,n,i){var o=a(e),r=a(n),s=a(i);function a(t){return t&&t.__esModule?t:{default:t}}var l=function(){function i(t,e){for(var n=0;n<e.length;n++){var i=e[n];i.enumerable=i.enumerable||!1,i.configurable=!0,"value"in i&&(i.writable=!0),Object.defineProperty(t,i.key,i)}}return function(t,e,n){return e&&i(t.prototype,e),n&&i(t,n),t}}();var c=function(t){function i(t,e){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,i);var n=function(t,e){if(!t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!e||"object"!=typeof e&&"function"!=typeof e?t:e}(this,(i.__proto__||Object.getPrototypeOf(i)).call(this));return n.resolveOptions(e),n.listenClick(t),n}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function, not "+typeof e);t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),e&&(Object.setPrototypeOf?Object.setPrototypeOf(t,e):t.__proto__=e)}(i,r.default),l(i,[{key:"resolveOptions",value:function(){var t=0<arguments.length&&void 0!==arguments[0]?arguments[0]:{};this.action="function"==typeof t.action?t.action:this.defaultAction,this.target="function"==typeof t.target?t.target:this.defaultTarget,this.text="function"==typeof t.text?t.text:this.defaultText}},{key:"listenClick",value:function(t){var e=this;this.listener=(0,s.default)(t,"click",function(t){return e.onClick(t)})}},{key:"onClick",value:function(t){var e=t.delegateTarget||t.currentTarget;this.clipboardAction&&(this.clipboardAction=null),this.clipboardAction=new o.default({action:this.action(e),target:this.target(e),text:this.text(e),trigger:e,emitter:this})}},{key:"defaultAction",value:function(t){return u("action",t)}},{key:"defaultTarget",value:function(t){var e=u("target",t);if(e)return document.querySelector(e)}},{key:"defaultText",value:function(t){return u("text",t)}},{key:"destroy",value:function(){this.listener.destroy(),this.clipboardAction&&(this.clipboardAction.destroy(),this.clipboardAction=null)}}],[{key:"isSupported",value:function(){var t=0<arguments.length&&void 0!==arguments[0]?arguments[0]:["copy","cut"],e="string"==typeof t?[t]:t,n=!!document.queryCommandSupported;return e.forEach(function(t){n=n&&!!document.queryCommandSupported(t)}),n}}]),i}();function u(t,e){var n="data-clipboard-"+t;if(e.hasAttribute(n))return e.getAttribute(n)}t.exports=c})},{"./clipboard-action":7,"good-listener":4,"tiny-emitter":6}]},{},[8])(8)});var isOldIE=$("html").is(".lt-ie9"),Portal={MenuOpened:!1,MobileVerifier:{IsMobile:!1,IsTablet:!1,IsDesktop:!1,DetectMobile:function(t){var e={detectMobileBrowsers:{fullPattern:/(android|bb\d+|meego).+mobile|avantgo|bada\/|blackberry|blazer|compal|elaine|fennec|hiptop|iemobile|ip(hone|od)|iris|kindle|lge |maemo|midp|mmp|mobile.+firefox|netfront|opera m(ob|in)i|palm( os)?|phone|p(ixi|re)\/|plucker|pocket|psp|series(4|6)0|symbian|treo|up\.(browser|link)|vodafone|wap|windows ce|xda|xiino/i,shortPattern:/1207|6310|6590|3gso|4thp|50[1-6]i|770s|802s|a wa|abac|ac(er|oo|s\-)|ai(ko|rn)|al(av|ca|co)|amoi|an(ex|ny|yw)|aptu|ar(ch|go)|as(te|us)|attw|au(di|\-m|r |s )|avan|be(ck|ll|nq)|bi(lb|rd)|bl(ac|az)|br(e|v)w|bumb|bw\-(n|u)|c55\/|capi|ccwa|cdm\-|cell|chtm|cldc|cmd\-|co(mp|nd)|craw|da(it|ll|ng)|dbte|dc\-s|devi|dica|dmob|do(c|p)o|ds(12|\-d)|el(49|ai)|em(l2|ul)|er(ic|k0)|esl8|ez([4-7]0|os|wa|ze)|fetc|fly(\-|_)|g1 u|g560|gene|gf\-5|g\-mo|go(\.w|od)|gr(ad|un)|haie|hcit|hd\-(m|p|t)|hei\-|hi(pt|ta)|hp( i|ip)|hs\-c|ht(c(\-| |_|a|g|p|s|t)|tp)|hu(aw|tc)|i\-(20|go|ma)|i230|iac( |\-|\/)|ibro|idea|ig01|ikom|im1k|inno|ipaq|iris|ja(t|v)a|jbro|jemu|jigs|kddi|keji|kgt( |\/)|klon|kpt |kwc\-|kyo(c|k)|le(no|xi)|lg( g|\/(k|l|u)|50|54|\-[a-w])|libw|lynx|m1\-w|m3ga|m50\/|ma(te|ui|xo)|mc(01|21|ca)|m\-cr|me(rc|ri)|mi(o8|oa|ts)|mmef|mo(01|02|bi|de|do|t(\-| |o|v)|zz)|mt(50|p1|v )|mwbp|mywa|n10[0-2]|n20[2-3]|n30(0|2)|n50(0|2|5)|n7(0(0|1)|10)|ne((c|m)\-|on|tf|wf|wg|wt)|nok(6|i)|nzph|o2im|op(ti|wv)|oran|owg1|p800|pan(a|d|t)|pdxg|pg(13|\-([1-8]|c))|phil|pire|pl(ay|uc)|pn\-2|po(ck|rt|se)|prox|psio|pt\-g|qa\-a|qc(07|12|21|32|60|\-[2-7]|i\-)|qtek|r380|r600|raks|rim9|ro(ve|zo)|s55\/|sa(ge|ma|mm|ms|ny|va)|sc(01|h\-|oo|p\-)|sdk\/|se(c(\-|0|1)|47|mc|nd|ri)|sgh\-|shar|sie(\-|m)|sk\-0|sl(45|id)|sm(al|ar|b3|it|t5)|so(ft|ny)|sp(01|h\-|v\-|v )|sy(01|mb)|t2(18|50)|t6(00|10|18)|ta(gt|lk)|tcl\-|tdg\-|tel(i|m)|tim\-|t\-mo|to(pl|sh)|ts(70|m\-|m3|m5)|tx\-9|up(\.b|g1|si)|utst|v400|v750|veri|vi(rg|te)|vk(40|5[0-3]|\-v)|vm40|voda|vulc|vx(52|53|60|61|70|80|81|83|85|98)|w3c(\-| )|webc|whit|wi(g |nc|nw)|wmlb|wonu|x700|yas\-|your|zeto|zte\-/i}};return e.detectMobileBrowsers.fullPattern.test(t)||e.detectMobileBrowsers.shortPattern.test(t.substr(0,4))},DetectTablet:function(t){var e={detectMobileBrowsers:{tabletPattern:/android|ipad|playbook|silk/i}};return e.detectMobileBrowsers.tabletPattern.test(t)},Detect:function(){Portal.MobileVerifier.DetectMobile(navigator.userAgent)&&(Portal.MobileVerifier.IsMobile=!0),Portal.MobileVerifier.DetectTablet(navigator.userAgent)&&(Portal.MobileVerifier.IsTablet=!0),990<$(window).innerWidth()&&(Portal.MobileVerifier.IsDesktop=!0)}},Init:function(){Portal.MobileVerifier.Detect(),!Portal.MobileVerifier.IsDesktop||Portal.MobileVerifier.IsMobile||Portal.MobileVerifier.IsTablet||$(".showTooltip").each(function(){var t=$(this).data(),e=void 0!==t.container?t.container:"body",n=void 0!==t.placement?t.placement:"top";$(this).tooltip({container:e,placement:n})}),$(".mainNav .menu").on("click",function(t){t.preventDefault();var e=$(this),n=e.data("rel");(n=$(n,".mainNav")).is(":visible")?(e.removeClass("opened"),n.slideUp("fast",function(){Portal.MenuOpened=!1})):(e.addClass("opened"),n.slideDown("fast",function(){Portal.MenuOpened=!0}))}),$(".shareFacebook,.shareTwitter,.shareDelicious,.shareGooglePlus,.shareLinkedIn,.shareReddit,.shareStambleUpon,.shareCiteULike,.shareMendeley").on("click",function(t){t.preventDefault();var e=escape(this.href),n="https://www.facebook.com/sharer/sharer.php?u=",i="https://twitter.com/intent/tweet?text=",o="https://delicious.com/save?url=",r="https://plus.google.com/share?url=",s="http://www.linkedin.com/shareArticle?mini=true&url=",a="http://www.reddit.com/submit?url=",l="http://www.stumbleupon.com/submit?url=",c="http://www.citeulike.org/posturl?url=",u="http://www.mendeley.com/import/?url=",d="";$(this).is(".shareFacebook")?d=n+e:$(this).is(".shareTwitter")?d=i+e:$(this).is(".shareDelicious")?d=o+e:$(this).is(".shareGooglePlus")?d=r+e:$(this).is(".shareLinkedIn")?d=s+e:$(this).is(".shareReddit")?d=a+e:$(this).is(".shareStambleUpon")?d=l+e:$(this).is(".shareCiteULike")?d=c+e:$(this).is(".shareMendeley")&&(d=u+e),window.open(d,"share")}),$(".slider").each(Portal.Slider),$(".share_modal_id").on("click",function(t){t.preventDefault();var e=$(location).attr("href");$.get("/form_mail/",{url:e},function(t){$("#share_modal_id").html(t),$("#share_modal_id").modal("show")})}),$(".contact_modal_id").on("click",function(t){t.preventDefault();$(location).attr("href");$.get($(this).data("url"),function(t){$("#contact_modal_id").html(t),$("#contact_modal_id").modal("show")})}),$(".floatingBtnError").on("click",function(t){t.preventDefault();var e=$(location).attr("href");$.get("/error_mail/",{url:e},function(t){$("#error_modal_id").html(t),$("#error_modal_id").modal("show")})}),$("#share_modal_id").on("hidden.bs.modal",function(){$(this).empty()}),$("#error_modal_id").on("hidden.bs.modal",function(){$(this).empty()}),$(".alternativeHeader").each(function(){var t=$(".mainMenu nav ul").html();$(this).find("nav ul").html(t)});var e=$("header").outerHeight();($(window).on("scroll",function(){var t=0<window.scrollY?window.scrollY:0<window.pageYOffset?window.pageYOffset:document.documentElement.scrollTop;e<t?$(".alternativeHeader").stop(!0,!1).animate({top:"0"},200,function(){$("#mainMenu").is(":visible")&&$(".menu:eq(0)").trigger("click")}):$(".alternativeHeader").stop(!0,!1).animate({top:"-65px"},200,function(){$(this).find(".mainMenu").is(":visible")&&$(this).find(".menu").trigger("click")})}).on("keydown",function(t){27==t.keyCode&&$("a.menu").is(".opened")&&$("a.menu").trigger("click")}),$("body").on("click",function(t){var e=t.target;if(!$(e).is(".menu")&&1==Portal.MenuOpened){$("a.menu").removeClass("opened"),$(".mainMenu").slideUp("fast",function(){Portal.MenuOpened=!1})}}),$(".expandCollapseContent").on("click",function(t){t.preventDefault();var e=$("#issueIndex"),n=$("#issueData"),i=this;e.css("float","right"),n.is(":visible")?n.fadeOut("fast",function(){e.animate({width:"100%"},300),$(i).find(".glyphBtn").removeClass("opened").addClass("closed")}):e.animate({width:"75%"},300,function(){n.fadeIn("fast"),$(i).find(".glyphBtn").removeClass("closed").addClass("opened")}),$(i).tooltip("hide")}),$(".collapse-title").on("click",function(){var t=$(this),e=$(".collapse-content");e.is(":visible")?(e.slideUp("fast"),t.addClass("closed")):(e.slideDown("fast"),t.removeClass("closed"))}),$(".goto").on("click",function(t){t.preventDefault();var e=$(this).attr("href");e=e.replace("#","");var n=$("a[name="+e+"]").offset();$("html,body").animate({scrollTop:n.top-60},500)}),$(".trigger").on("click",function(t){t.preventDefault();var e=$(this).data("rel");$(e).click()}),$("input[name='link-share']").focus(function(){$(this).select(),window.clipboardData&&clipboardData.setData&&clipboardData.setData("text",$(this).text())}).mouseup(function(t){t.preventDefault()}),$(".levelMenu .dropdown-container").on("mouseenter mouseleave",function(t){var e=$(this).find(".dropdown-menu"),n=$(this).find(".dropdown-toggle");"mouseenter"==t.type?(e.show(),n.addClass("hover")):(e.hide(),n.removeClass("hover"))}),$(".nav-tabs a").click(function(t){t.preventDefault(),$(this).tab("show")}),$(".translateAction").on("click",function(t){t.preventDefault(),$("#translateArticleModal").modal("show")}),"undefined"!=typeof Clipboard)&&new Clipboard(".copyLink").on("success",function(t){var e=$(t.trigger);e.addClass("copyFeedback"),setTimeout(function(){e.removeClass("copyFeedback")},2e3)}).on("error",function(t){});for(var t="",n="",i=$(".results .item"),o=0;o<i.length;o++){n='<br class="visible-xs visible-sm"/><span class="socialLinks articleShareLink">\t\t\t\t\t<a href="" class="articleAction sendViaMail" data-toggle="tooltip" data-placement="top" title="Enviar link por e-mail">Enviar por e-mail</a>\t\t\t\t\t<a target="_blank" href="https://www.facebook.com/sharer/sharer.php?u='+(t=$(i[o]).parent()[0].children[o].children[1].children[0].children[0].href)+'" class="articleAction shareFacebook" data-toggle="tooltip" data-placement="top" title="Compartilhar no Facebook">Facebook</a>\t\t\t\t\t<a target="_blank" href="https://twitter.com/intent/tweet?text='+t+'" class="articleAction shareTwitter" data-toggle="tooltip" data-placement="top" title="Compartilhar no Twitter">Twitter</a>\t\t\t\t\t<a target="_blank" href="https://delicious.com/save?url='+t+'" class="articleAction shareDelicious" data-toggle="tooltip" data-placement="top" title="Compartilhar no Delicious">Delicious</a>\t\t\t\t\t<a href="" class="showTooltip dropdown-toggle" data-toggle="dropdown" data-placement="top" data-placement="top" title="Compartilhar em outras redes"><span class="glyphBtn otherNetworks"></span></a>\t\t\t\t\t<ul class="dropdown-menu articleShare">\t\t\t\t\t\t<li class="dropdown-header">Outras redes sociais</li>\t\t\t\t\t\t<li><a target="_blank" href="https://plus.google.com/share?url='+t+'" class="shareGooglePlus"><span class="glyphBtn googlePlus"></span> Google+</a></li>\t\t\t\t\t\t<li><a target="_blank" href="https://www.linkedin.com/shareArticle?mini=true&url='+t+'" class="shareLinkedIn"><span class="glyphBtn linkedIn"></span> LinkedIn</a></li>\t\t\t\t\t\t<li><a target="_blank" href="https://www.reddit.com/login?dest='+t+'" class="shareReddit"><span class="glyphBtn reddit"></span> Reddit</a></li>\t\t\t\t\t\t<li><a target="_blank" href="http://www.stumbleupon.com/submit?url='+t+'" class="shareStambleUpon"><span class="glyphBtn stambleUpon"></span> StambleUpon</a></li>\t\t\t\t\t\t<li><a target="_blank" href="http://www.citeulike.org/posturl?url='+t+'" class="shareCiteULike"><span class="glyphBtn citeULike"></span> CiteULike</a></li>\t\t\t\t\t\t<li><a target="_blank" href="https://www.mendeley.com/import/?url='+t+'" class="shareMendeley"><span class="glyphBtn mendeley"></span> Mendeley</a></li>\t\t\t\t\t</ul>\t\t\t\t</span>',$(".results .item:nth-child("+(o+1)+") div .line.articleResult").append(n)}$("#contactModal").on("show.bs.modal",function(t){var e=$(t.relatedTarget).data("modal-title");$(this).find(".modal-title").text(e)}),$("#tst").length&&$("#tst").typeahead({order:"asc",minLength:3,dynamic:!0,delay:500,emptyTemplate:'Nenhum periÃ³dico encontrado para o termo: "{{query}}"',source:{journals:{display:"title",href:"{{link}}",ajax:function(t){return{type:"GET",url:"/journals/search/alpha/ajax/",contentType:"application/json",data:{query:"{{query}}",page:"1",query_filter:"current"},callback:{done:function(t){for(var e=[],n=0,i=t.journals.length;n<i;n++)e.push({title:t.journals[n].title,link:t.journals[n].links.detail});return e}}}}}}})},Slider:function(){var t=$(this).attr("id"),e=$("#"+t),n=$(".slide-item",e),i=$(".slide-wrapper",e),o=$(".slide-back",e),r=$(".slide-next",e),s=$(".slide-container",e).outerWidth();warray=[],harray=[],n.each(function(){harray.push($(this).outerHeight()),warray.push($(this).outerWidth())}),itemProps={w:Math.max.apply(null,warray),h:Math.max.apply(null,harray)},wrapperWidth=n.length*itemProps.w+100,i.width(wrapperWidth),$(".slide-container",e).height(itemProps.h),o.css("top",itemProps.h/2+"px"),r.css("top",itemProps.h/2+"px"),o.hide(),i.width()<=e.width()?r.hide():r.show(),o.off().on("click",function(t){t.preventDefault();"auto"==i.css("left")||parseInt(i.css("left"));i.stop(!1,!0).animate({left:"+="+itemProps.w},100,function(){0==("auto"==i.css("left")?0:parseInt(i.css("left")))&&o.hide()}),r.show()}),r.off().on("click",function(t){t.preventDefault();"auto"==i.css("left")||parseInt(i.css("left"));i.stop(!1,!0).animate({left:"-="+itemProps.w},100,function(){("auto"==i.css("left")?0:parseInt(i.css("left")))<=-(wrapperWidth-s)&&r.hide()}),o.show()})}},SearchForm={SearchHistory:"",Init:function(){var p=".searchForm";$("input.trigger").off("click").on("click",function(){var cmd=$(this).data("rel");eval(cmd)}),$(p).on("submit",function(t){t.preventDefault();for(var e=$("*[name='q[]']",p),n=$("select[name='bool[]']",p),i=$("select[name='index[]']",p),o="",r=0,s=e.length;r<s;r++){if("iptQuery"==$(e[r]).attr("id"))var a=$(e[r]).text();else a=$(e[r]).val();if(""!=a){var l=$("option:selected",i[r]).val();if(1<=r)o+=" "+$("option:selected",n[r-1]).val()+" ";o+=""!=l?"("+l+":("+a+"))":2==s?a:"("+a+")"}}var c=$("input[name='collection']:checked",p).val();void 0!==c&&""!=c&&0==$("input[name='filter[in][]']").length&&(initial_filter_in=$("<input>").attr({type:"hidden",name:"filter[in][]",value:c}).appendTo("#searchForm"));var u=$("input[name='publicationYear']:checked",p).val();if("1"==u)""!=(d=$("select[name='y1Start'] option:selected",p).val())&&(o+=" AND publication_year:["+d+" TO *]");else if("2"==u){var d=$("select[name='y2Start'] option:selected",p).val(),h=$("select[name='y2End'] option:selected",p).val();""!=d&&""!=h&&(o+=" AND publication_year:["+d+" TO "+h+"]")}""==(o=o.replace(/^AND|AND$|^OR|OR$/g,""))&&(o="*"),o=$.trim(o);document.searchForm.action;var f=document.searchForm;return $("input[name='q']").val(o),f.submit(),!0}),$("textarea.form-control",p).on("keyup",SearchForm.TextareaAutoHeight).trigger("keyup").on("keypress",function(t){var e=$(this);""!=this.value?e.next().fadeIn("fast"):e.next().fadeOut("fast"),13!=t.which||t.shiftKey||$(p).submit()}),$("a.clearIptText",p).on("click",SearchForm.ClearPrevInput),$(".newSearchField",p).on("click",function(t){t.preventDefault(),SearchForm.InsertNewFieldRow(this,"#searchRow-matriz .searchRow",".searchForm .searchRow-container")}),$(".articleAction, .searchHistoryItem, .colActions .searchHistoryIcon",p).tooltip()},InsertSearchHistoryItem:function(t){var e=$(t).data("item"),n=$(t).parent().parent().find(".colSearch").text(),i=$("#iptQuery"),o='&#160;<div class="searchHistoryItem" contenteditable="false"  data-toggle="tooltip" data-placement="top" title="'+n+'">#'+e+"</div> AND&#160;";i.append(o).focus(),i.find(".searchHistoryItem").tooltip(),$(t).effect("transfer",{to:i.find(".searchHistoryItem:last-child")},1e3),SearchForm.PlaceCaretToEnd(document.getElementById("iptQuery"))},InsertNewFieldRow:function(t,e,n){t=$(t),e=$(e).clone(),n=$(n);var i=t.data("count");e.attr("id","searchRow-"+i),e.find(".eraseSearchField").data("rel",i),e.find(".eraseSearchField").on("click",function(t){t.preventDefault(),SearchForm.EraseFieldRow(this)}),""!=SearchForm.SearchHistory&&e.find("input[name='q[]']").on("focus",function(){SearchForm.SearchHistoryFocusIn(this)}).on("blur",function(){SearchForm.SearchHistoryFocusOut(this)}),e.appendTo(n).slideDown("fast"),e.find("textarea.form-control:visible").on("keyup",SearchForm.TextareaAutoHeight).trigger("keyup"),e.find("a.clearIptText").on("click",SearchForm.ClearPrevInput),e.find(".showTooltip").tooltip({container:"body"}),i=parseInt(i),i++,t.data("count",i)},TextareaAutoHeight:function(){$(this).css("height","auto"),$(this).height(this.scrollHeight),""!=this.value?$(this).next("a").fadeIn("fast"):$(this).next("a").fadeOut("fast")},ClearPrevInput:function(){$(this).prev("input,textarea").val("").trigger("keyup")},EraseFieldRow:function(t){var e=(t=$(t)).data("rel");$("#searchRow-"+e).slideUp("fast",function(){$(this).remove()})},CountCheckedResults:function(t,e){t=$(t);var n=parseInt(t.data("preselected"))+parseInt($(e+":checked").length);t.text(n),0<n?t.addClass("highlighted"):t.removeClass("highlighted")},PlaceCaretToEnd:function(t){if(t.focus(),void 0!==window.getSelection&&void 0!==document.createRange){var e=document.createRange();e.selectNodeContents(t),e.collapse(!1);var n=window.getSelection();n.removeAllRanges(),n.addRange(e)}else if(void 0!==document.body.createTextRange){var i=document.body.createTextRange();i.moveToElementText(t),i.collapse(!1),i.select()}},SubmitForm:function(t){var e=$(".searchForm").attr("action");$(".searchForm").attr("action",e+"?filter="+t).submit()}},Collection={Init:function(){$(".collectionListStart").each(function(){var i=$(this),t=i.data("method"),o=i.data("perpage"),r=i.data("labels"),e=$(".collectionSearch",i),s=$(".collectionListLoading",i),n=!1,a="";if(window.timer,void 0!==i.data("action")){if(r=r.split(";"),e.val(""),$(".collectionCurrentPage",i).val("1"),"alphabetic"==t)a="method=alphabetic&rp="+o,n=!0;else if("theme"==t)a="method=theme";else if("publisher"==t)a="method=publisher";else if("collection"==t)a="method=collection";Collection.JournalListFinder(a,s,i,r,!0,n)}e.on("keyup change",function(){var e=$(this),n="method="+t+"&rp="+o;clearTimeout(window.timer),window.timer=setTimeout(function(){var t=e.val();n+="&query="+t,$(".collectionCurrentPage",i).val("1"),Collection.JournalListFinder(n,s,i,r,!0,!0),!1},300)})})},JournalListFinder:function(param,loading,container,labels,empty,scroll,callback,htmlFill){var currentPage=$(".collectionCurrentPage",container),totalPages=$(".collectionTotalPages",container),totalInfo=$(".collectionListTotalInfo",container),action=$(container).data("action");void 0!==htmlFill&&(loading=htmlFill.next(".collectionListLoading")),void 0===empty&&(empty=!1),param+="&page="+currentPage.val(),$.ajax({url:action,type:"POST",data:param,dataType:"json",beforeSend:function(){loading.show()}}).done(function(data){if(loading.hide(),void 0!==data.journalList){-1==param.indexOf("&theme=")&&-1==param.indexOf("&publisher=")&&(totalInfo.html(labels[11].replace("{total}",data.total)),totalPages.val(data.totalPages));var ctt=Collection.JournalListFill(data,labels);void 0!==htmlFill?(empty&&$(htmlFill).find("tbody").empty(),$(htmlFill).find("tbody").append(ctt).find(".showTooltip").tooltip({container:"body"})):(empty&&$(container).find("tbody").empty(),$(container).find("tbody").append(ctt).find(".showTooltip").tooltip({container:"body"})),scroll&&Collection.ScrollEvents(container,loading,labels)}if(void 0!==data.themeList){totalInfo.html(labels[11].replace("{total}",data.total).replace("{totalTheme}",data.totalThemes));var ctt=Collection.ThemeListFill(data,labels,container.attr("id"));void 0!==htmlFill?(empty&&$(htmlFill).find("tbody").empty(),$(htmlFill).find("tbody").append(ctt).find(".showTooltip").tooltip({container:"body"})):(empty&&$(container).find("tbody").empty(),$(container).find("tbody").append(ctt).find(".showTooltip").tooltip({container:"body"})),Collection.CollapseEvents(container,labels)}if(void 0!==data.publisherList){totalInfo.html(labels[11].replace("{total}",data.total).replace("{totalPublisher}",data.totalPublisher));var ctt=Collection.PublisherListFill(data,labels,container.attr("id"));void 0!==htmlFill?(empty&&$(htmlFill).find("tbody").empty(),$(htmlFill).find("tbody").append(ctt).find(".showTooltip").tooltip({container:"body"})):(empty&&$(container).find("tbody").empty(),$(container).find("tbody").append(ctt).find(".showTooltip").tooltip({container:"body"})),Collection.CollapseEvents(container,labels)}if(void 0!==data.collectionList){totalInfo.html(labels[11].replace("{total}",data.total).replace("{totalCollection}",data.totalCollection));var ctt=Collection.CollectionListFill(data,labels,container.attr("id"));void 0!==htmlFill?(empty&&$(htmlFill).find("tbody").empty(),$(htmlFill).find("tbody").append(ctt).find(".showTooltip").tooltip({container:"body"})):(empty&&$(container).find("tbody").empty(),$(container).find("tbody").append(ctt).find(".showTooltip").tooltip({container:"body"}))}void 0!==callback&&eval(callback)}).error(function(t){loading.hide()})},JournalListFill:function(t,e){for(var n="",i=0,o=t.journalList.length;i<o;i++){var r=t.journalList[i];r.Last=r.Last.split(";"),r.Publisher=r.Publisher.split(";"),n+='\t\t\t\t\t\t<tr>\t\t\t\t\t\t\t<td class="actions">\t\t\t\t\t\t\t\t<a href="'+r.Links[0]+'" class="showTooltip" title="'+e[5]+'"><span class="glyphBtn home"></span></a> \t\t\t\t\t\t\t\t<a href="'+r.Links[1]+'" class="showTooltip" title="'+e[6]+'"><span class="glyphBtn submission"></span></a> \t\t\t\t\t\t\t\t<a href="'+r.Links[2]+'" class="showTooltip" title="'+e[7]+'"><span class="glyphBtn authorInstructions"></span></a> \t\t\t\t\t\t\t\t<a href="'+r.Links[5]+'" class="showTooltip" title="'+e[12]+'"><span class="glyphBtn editorial"></span></a> \t\t\t\t\t\t\t\t<a href="'+r.Links[3]+'" class="showTooltip" title="'+e[8]+'"><span class="glyphBtn about"></span></a> \t\t\t\t\t\t\t\t<a href="'+r.Links[4]+'" class="showTooltip" title="'+e[9]+'"><span class="glyphBtn contact"></span></a> \t\t\t\t\t\t\t</td>\t\t\t\t\t\t\t<td>\t\t\t\t\t\t\t\t<a href="'+r.Links[0]+'" class="collectionLink '+(0==r.Active?"disabled":"")+'">\t\t\t\t\t\t\t\t\t<strong class="journalTitle">'+r.Journal+'</strong>,\t\t\t\t\t\t\t\t\t<strong class="journalIssues">'+r.Issues+" "+e[0]+"</strong>,\t\t\t\t\t\t\t\t\t"+e[1]+"\t\t\t\t\t\t\t\t\t"+(""!=r.Last[0]?'<span class="journalLastVolume"><em>'+e[2]+"</em> "+r.Last[0]+"</span>":"")+"\t\t\t\t\t\t\t\t\t"+(""!=r.Last[1]?'<span class="journalLastNumber"><em>'+e[3]+"</em> "+r.Last[1]+"</span>":"")+"\t\t\t\t\t\t\t\t\t"+(""!=r.Last[2]?'<span class="journalLastSuppl"><em>'+e[4]+"</em> "+r.Last[2]+"</span>":"")+"\t\t\t\t\t\t\t\t\t- \t\t\t\t\t\t\t\t\t"+(""!=r.Last[3]?'<span class="journalLastPubDate">'+r.Last[3]+"</span>":"")+" \t\t\t\t\t\t\t\t\t"+(0==r.Active?e[10]:"")+" \t\t\t\t\t\t\t\t</a>\t\t\t\t\t\t\t</td>",r.Collection&&(n+=' \t\t\t\t\t\t\t\t<td>\t\t\t\t\t\t\t\t\t<span class="glyphFlags '+r.Collection+'"></span> '+Collection.PortalCollectionNameFill(r.Collection)+"\t\t\t\t\t\t\t\t</td>"),n+="\t\t\t\t\t\t</tr>"}return n},PortalCollectionNameFill:function(t){var e="";if(window.collections)for(var n=0,i=window.collections.length;n<i;n++)window.collections[n].id==t&&(e=window.collections[n].name);return e},ThemeListFill:function(t,e,n){for(var i='\t<tr>\t\t\t\t\t\t\t<td class="collapseContainer">',o=0,r=t.themeList.length;o<r;o++){i+='\t\t<div class="themeItem">\t\t\t\t\t\t\t\t\t<a href="javascript:;" id="'+n+"-collapseTitle-"+o+'" \t\t\t\t\t\t\t\t\tclass="collapseTitleBlock '+(void 0===t.themeList[o].journalList?"closed":"")+'" data-id="'+t.themeList[o].id+'">\t\t\t\t\t\t\t\t\t\t<strong>'+t.themeList[o].Area+"</strong>\t\t\t\t\t\t\t\t\t\t("+t.themeList[o].Total+')\t\t\t\t\t\t\t\t\t</a> \t\t\t\t\t\t\t\t\t<div class="collapseContent" id="'+n+"-collapseContent-"+o+'" '+(void 0===t.themeList[o].journalList?'style="display: none;"':"")+">";for(var s=0,a=t.themeList[o].SubAreas.length;s<a;s++)i+='\t\t\t<a href="javascript:;" id="'+n+"-collapseTitle-"+o+"-sub-"+s+'" \t\t\t\t\t\t\t\t\t\t\tclass="collapseTitle '+(void 0===t.themeList[o].SubAreas[s].journalList?"closed":"")+'" data-id="'+t.themeList[o].SubAreas[s].id+'">\t\t\t\t\t\t\t\t\t\t\t<strong>'+t.themeList[o].SubAreas[s].Area+"</strong>\t\t\t\t\t\t\t\t\t\t\t\t("+t.themeList[o].SubAreas[s].Total+')\t\t\t\t\t\t\t\t\t\t</a>\t\t\t\t\t\t\t\t\t\t<div class="collapseContent" id="'+n+"-collapseContent-"+o+"-sub-"+s+'" '+(void 0===t.themeList[o].SubAreas[s].journalList?'style="display: none;"':"")+'>\t\t\t\t\t\t\t\t\t\t\t<table> \t\t\t\t\t\t\t\t\t\t\t\t<thead> \t\t\t\t\t\t\t\t\t\t\t\t\t<tr> \t\t\t\t\t\t\t\t\t\t\t\t\t\t<th class="actions"></th> \t\t\t\t\t\t\t\t\t\t\t\t\t\t<th>'+e[12]+"</th> \t\t\t\t\t\t\t\t\t\t\t\t\t\t"+(t.collection?"<th class='flags'>"+e[14]+"</th>":"")+" \t\t\t\t\t\t\t\t\t\t\t\t\t</tr> \t\t\t\t\t\t\t\t\t\t\t\t</thead> \t\t\t\t\t\t\t\t\t\t\t\t<tbody>",void 0!==t.themeList[o].SubAreas[s].journalList&&(i+=Collection.JournalListFill(t.themeList[o].SubAreas[s],e)),i+='\t\t\t\t\t\t</tbody>\t\t\t\t\t\t\t\t\t\t\t</table> \t\t\t\t\t\t\t\t\t\t</div> \t\t\t\t\t\t\t\t\t\t<div class="collapseContent collectionListLoading" style="display: none;"></div>\t\t\t\t\t\t\t\t\t\t';i+="\t\t\t</div>"}return i+="\t\t</td>\t\t\t\t\t\t</tr>"},PublisherListFill:function(t,e,n){for(var i='\t<tr>\t\t\t\t\t\t\t<td class="collapseContainer">',o=0,r=t.publisherList.length;o<r;o++)i+='\t\t<div class="themeItem">\t\t\t\t\t\t\t\t\t<a href="javascript:;" id="'+n+"-collapseTitle-"+o+'" class="collapseTitle '+(void 0===t.publisherList[o].journalList?"closed":"")+'"><strong>'+t.publisherList[o].Publisher+"</strong> ("+t.publisherList[o].Total+')</a> \t\t\t\t\t\t\t\t\t<div class="collapseContent" id="'+n+"-collapseContent-"+o+'" '+(void 0===t.publisherList[o].journalList?'style="display: none;"':"")+'> \t\t\t\t\t\t\t\t\t\t<table> \t\t\t\t\t\t\t\t\t\t\t<thead> \t\t\t\t\t\t\t\t\t\t\t\t<tr> \t\t\t\t\t\t\t\t\t\t\t\t\t<th class="actions"></th> \t\t\t\t\t\t\t\t\t\t\t\t\t<th>'+e[12]+"</th> \t\t\t\t\t\t\t\t\t\t\t\t\t"+(t.collection?"<th class='flags'>"+e[14]+"</th>":"")+" \t\t\t\t\t\t\t\t\t\t\t\t</tr> \t\t\t\t\t\t\t\t\t\t\t</thead> \t\t\t\t\t\t\t\t\t\t\t<tbody>",void 0!==t.publisherList[o].journalList&&(i+=Collection.JournalListFill(t.publisherList[o],e)),i+='\t\t\t\t\t</tbody> \t\t\t\t\t\t\t\t\t\t</table> \t\t\t\t\t\t\t\t\t</div> \t\t\t\t\t\t\t\t\t<div class="collapseContent collectionListLoading" style="display: none;"></div>\t\t\t\t\t\t\t\t</div>';return i+="\t\t</td>\t\t\t\t\t\t</tr>"},CollectionListFill:function(t,e,n){for(var i='\t<tr>\t\t\t\t\t\t\t<td class="collapseContainer">',o=0,r=t.collectionList.length;o<r;o++)i+='\t\t<div class="themeItem collectionBold">\t\t\t\t\t\t\t\t<a href="'+t.collectionList[o].link+'" class="collapseTitle closed" target="_blank"><span class="glyphFlags '+t.collectionList[o].id+'"></span> <strong>'+t.collectionList[o].name+"</strong> ("+t.collectionList[o].Total+")</a> \t\t\t\t\t\t\t</div>";return i+="\t\t</td>\t\t\t\t\t\t</tr>"},ScrollEvents:function(e,n,i){var o=$(".collectionCurrentPage",e),r=$(".collectionTotalPages",e),t=$(".collectionSearch",e),s=$(e).data("perpage"),a=($(e).data("method"),"method=alphabetic&rp="+s+(""!=t.val()?"&query="+t.val():""));$(window).off("scroll").on("scroll",function(){if(o.val()<r.val()){if($("footer").hide(),$(window).scrollTop()+$(window).height()==$(document).height()){var t=parseInt(o.val());t++,o.val(t),a+="&page="+t,Collection.JournalListFinder(a,n,e,i,!1,!1)}}else $("footer").show()})},CollapseEvents:function(r,s){var a=$(r).data("method"),t=$(".collectionSearch",r),l="method=alphabetic"+(""!=t.val()?"&query="+t.val():"");$(".collapseTitle,.collapseTitleBlock",r).on("click",function(){var t=$(this),e=t.parent().find(".collectionListLoading"),n=t.next(".collapseContent"),i=n.find("table tbody tr").length;if(n.is(":visible"))n.slideUp("fast"),$(this).addClass("closed");else if(t.is(".collapseTitleBlock"))n.slideDown("fast"),e.hide(),$(this).removeClass("closed");else if(0==i){var o=void 0!==t.data("id")?t.data("id"):$("strong",this).text();l+="&"+a+"="+o,Collection.JournalListFinder(l,e,r,s,!0,!1,"Collection.CollapseOpen('#"+n.attr("id")+"','#"+t.attr("id")+"')",n)}else n.slideDown("fast"),e.hide(),$(this).removeClass("closed")})},CollapseOpen:function(t,e){$(t).slideDown("fast"),$(e).removeClass("closed")}};Journal={Init:function(){$("#sortBy").change(function(){$("#sortBy option:selected").each(function(){Journal.publicationSort($(this).val())})}),$(".scroll").on("click",function(t){var e=$(this).attr("href").split("#")[1];if(0<$("a[name="+e+"]").length){var n=$("a[name="+e+"]").offset();$("html,body").animate({scrollTop:n.top+1},500)}})},Bindings:function(t){void 0===t&&(t=".journal")},publicationSort:function(t){for(var e=$(".issueIndent>ul.articles"),n=e.length,i=0;i<=n;i++){var o=e[i],r=$(o).children();"YEAR_DESC"===t?$(r).sort(function(t,e){var n=parseInt($(t).data("date"));return parseInt($(e).data("date"))<n?1:-1}).each(function(){$(o).append(this)}):$(r).sort(function(t,e){return parseInt($(t).data("date"))<parseInt($(e).data("date"))?1:-1}).each(function(){$(o).append(this)})}},publicatorName:function(){var t=$(".namePlublisher").text();56<=t.length&&($(".namePlublisher").attr("data-toggle","tooltip"),$(".namePlublisher").attr("title",t))}};var Validator={MultipleEmails:function(t,e){e=e||";";for(var n=/^(([^<>()[\]\\.,;:\s@\"]+(\.[^<>()[\]\\.,;:\s@\"]+)*)|(\".+\"))@((\[[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\])|(([a-zA-Z\-0-9]+\.)+[a-zA-Z]{2,}))$/,i=!0,o=t.split(e),r=0;r<o.length;r++)o[r]=o[r].trim(),""!=o[r]&&0!=n.test(o[r])||(i=!1);return i}},Cookie={Get:function(t,e){return void 0===e?e="":e+="/",t=e+t,0<document.cookie.length&&(c_start=document.cookie.indexOf(t+"="),-1!=c_start)?(c_start=c_start+t.length+1,c_end=document.cookie.indexOf(";",c_start),-1==c_end&&(c_end=document.cookie.length),unescape(document.cookie.substring(c_start,c_end))):""},Set:function(t,e,n,i){var o;if(void 0!==n){var r=new Date;r.setTime(r.getTime()+24*n*60*60*1e3),o="; expires="+r.toGMTString()}else o="";void 0===i?i="":i+="/",""!=Cookie.Get(t)&&(document.cookie=i+t+"="+e+"expires=Thu, 01 Jan 1970 00:00:01 GMT; path=/"),document.cookie=i+t+"="+e+o+"; path=/"}};$(function(){if(Portal.Init(),$(".searchForm").length&&SearchForm.Init(),$("body.journal").length&&Journal.Init(),$("body.collection, body.portal").length&&Collection.Init(),$("body.portal.home").length&&$(".portal .twitter").twittie({dateFormat:"%b. %d, %Y",template:'<span>{{date}}</span><div class="info">{{tweet}}</div><div class="tShare"><a href="https://twitter.com/intent/tweet?in_reply_to={{twitterId}}" target="_blank" class="showTooltip" data-placement="top" title="" data-original-title="Compartilhar no Twitter"><span class="glyphBtn tShare"></span></a><a href="https://twitter.com/intent/retweet?tweet_id={{twitterId}}" target="_blank" class="showTooltip" data-placement="top" title="" data-original-title="Atualizar"><span class="glyphBtn tReload"></span></a><a href="https://twitter.com/intent/favorite?tweet_id={{twitterId}}"  target="_blank" class="showTooltip" data-placement="top" title="" data-original-title="Adicionar as favoritos no Twitter"><span class="glyphBtn tFavorite"></span></a></div>',count:3,loadingText:"Carregando...",dateFormat:"%d de %B"}),$(".portal .collectionList").length)var t=window.location.hash;$('.portal .collection .nav-tabs a[href="'+t+'"]').tab("show"),$(".namePlublisher").length&&Journal.publicatorName()}),$(function(){$(".dropdown-toggle").dropdown(),$('[data-toggle="tooltip"], .dropdown-tooltip').tooltip(),$(".image").on("error",function(){this.src="/static/img/fallback_image.png"}),collapseAbstract=$(".collapseAbstract,.collapseAbstractBlock"),collapseAbstract.on("click",function(t){t.preventDefault();$(this);id="#"+$(this).attr("data-id"),content=$(id),content.is(":visible")?(content.slideUp("show"),$(this).addClass("collapseAbstractBlock"),$(this).removeClass("collapseAbstract")):(content.slideDown("show"),$(this).removeClass("collapseAbstractBlock"),$(this).addClass("collapseAbstract"))}),$(".modal").on("hidden.bs.modal",function(t){$(this).find("input[type=text], textarea, select").val("").end().find("input[type=checkbox], input[type=radio]").prop("checked","").end()})}),function(t,e){"object"==typeof exports&&"undefined"!=typeof module?module.exports=e():"function"==typeof define&&define.amd?define(e):t.moment=e()}(this,function(){"use strict";var t;function h(){return t.apply(null,arguments)}function a(t){return t instanceof Array||"[object Array]"===Object.prototype.toString.call(t)}function l(t){return null!=t&&"[object Object]"===Object.prototype.toString.call(t)}function c(t){return void 0===t}function u(t){return"number"==typeof t||"[object Number]"===Object.prototype.toString.call(t)}function d(t){return t instanceof Date||"[object Date]"===Object.prototype.toString.call(t)}function p(t,e){var n,i=[];for(n=0;n<t.length;++n)i.push(e(t[n],n));return i}function f(t,e){return Object.prototype.hasOwnProperty.call(t,e)}function m(t,e){for(var n in e)f(e,n)&&(t[n]=e[n]);return f(e,"toString")&&(t.toString=e.toString),f(e,"valueOf")&&(t.valueOf=e.valueOf),t}function g(t,e,n,i){return Ce(t,e,n,i,!0).utc()}function y(t){return null==t._pf&&(t._pf={empty:!1,unusedTokens:[],unusedInput:[],overflow:-2,charsLeftOver:0,nullInput:!1,invalidMonth:null,invalidFormat:!1,userInvalidated:!1,iso:!1,parsedDateParts:[],meridiem:null,rfc2822:!1,weekdayMismatch:!1}),t._pf}var o=Array.prototype.some?Array.prototype.some:function(t){for(var e=Object(this),n=e.length>>>0,i=0;i<n;i++)if(i in e&&t.call(this,e[i],i,e))return!0;return!1};function v(t){if(null==t._isValid){var e=y(t),n=o.call(e.parsedDateParts,function(t){return null!=t}),i=!isNaN(t._d.getTime())&&e.overflow<0&&!e.empty&&!e.invalidMonth&&!e.invalidWeekday&&!e.nullInput&&!e.invalidFormat&&!e.userInvalidated&&(!e.meridiem||e.meridiem&&n);if(t._strict&&(i=i&&0===e.charsLeftOver&&0===e.unusedTokens.length&&void 0===e.bigHour),null!=Object.isFrozen&&Object.isFrozen(t))return i;t._isValid=i}return t._isValid}function b(t){var e=g(NaN);return null!=t?m(y(e),t):y(e).userInvalidated=!0,e}var r=h.momentProperties=[];function w(t,e){var n,i,o;if(c(e._isAMomentObject)||(t._isAMomentObject=e._isAMomentObject),c(e._i)||(t._i=e._i),c(e._f)||(t._f=e._f),c(e._l)||(t._l=e._l),c(e._strict)||(t._strict=e._strict),c(e._tzm)||(t._tzm=e._tzm),c(e._isUTC)||(t._isUTC=e._isUTC),c(e._offset)||(t._offset=e._offset),c(e._pf)||(t._pf=y(e)),c(e._locale)||(t._locale=e._locale),0<r.length)for(n=0;n<r.length;n++)c(o=e[i=r[n]])||(t[i]=o);return t}var e=!1;function x(t){w(this,t),this._d=new Date(null!=t._d?t._d.getTime():NaN),this.isValid()||(this._d=new Date(NaN)),!1===e&&(e=!0,h.updateOffset(this),e=!1)}function k(t){return t instanceof x||null!=t&&null!=t._isAMomentObject}function _(t){return t<0?Math.ceil(t)||0:Math.floor(t)}function C(t){var e=+t,n=0;return 0!==e&&isFinite(e)&&(n=_(e)),n}function s(t,e,n){var i,o=Math.min(t.length,e.length),r=Math.abs(t.length-e.length),s=0;for(i=0;i<o;i++)(n&&t[i]!==e[i]||!n&&C(t[i])!==C(e[i]))&&s++;return s+r}function T(t){!1===h.suppressDeprecationWarnings&&"undefined"!=typeof console&&console.warn}function n(o,r){var s=!0;return m(function(){if(null!=h.deprecationHandler&&h.deprecationHandler(null,o),s){for(var t,e=[],n=0;n<arguments.length;n++){if(t="","object"==typeof arguments[n]){for(var i in t+="\n["+n+"] ",arguments[0])t+=i+": "+arguments[0][i]+", ";t=t.slice(0,-2)}else t=arguments[n];e.push(t)}T((Array.prototype.slice.call(e).join(""),(new Error).stack)),s=!1}return r.apply(this,arguments)},r)}var i={};function S(t,e){null!=h.deprecationHandler&&h.deprecationHandler(t,e),i[t]||(T(),i[t]=!0)}function D(t){return t instanceof Function||"[object Function]"===Object.prototype.toString.call(t)}function E(t,e){var n,i=m({},t);for(n in e)f(e,n)&&(l(t[n])&&l(e[n])?(i[n]={},m(i[n],t[n]),m(i[n],e[n])):null!=e[n]?i[n]=e[n]:delete i[n]);for(n in t)f(t,n)&&!f(e,n)&&l(t[n])&&(i[n]=m({},i[n]));return i}function $(t){null!=t&&this.set(t)}h.suppressDeprecationWarnings=!1,h.deprecationHandler=null;var L=Object.keys?Object.keys:function(t){var e,n=[];for(e in t)f(t,e)&&n.push(e);return n};var M={};function O(t,e){var n=t.toLowerCase();M[n]=M[n+"s"]=M[e]=t}function A(t){return"string"==typeof t?M[t]||M[t.toLowerCase()]:void 0}function j(t){var e,n,i={};for(n in t)f(t,n)&&(e=A(n))&&(i[e]=t[n]);return i}var F={};function N(t,e){F[t]=e}function P(e,n){return function(t){return null!=t?(H(this,e,t),h.updateOffset(this,n),this):I(this,e)}}function I(t,e){return t.isValid()?t._d["get"+(t._isUTC?"UTC":"")+e]():NaN}function H(t,e,n){t.isValid()&&t._d["set"+(t._isUTC?"UTC":"")+e](n)}function Y(t,e,n){var i=""+Math.abs(t),o=e-i.length;return(0<=t?n?"+":"":"-")+Math.pow(10,Math.max(0,o)).toString().substr(1)+i}var q=/(\[[^\[]*\])|(\\)?([Hh]mm(ss)?|Mo|MM?M?M?|Do|DDDo|DD?D?D?|ddd?d?|do?|w[o|w]?|W[o|W]?|Qo?|YYYYYY|YYYYY|YYYY|YY|gg(ggg?)?|GG(GGG?)?|e|E|a|A|hh?|HH?|kk?|mm?|ss?|S{1,9}|x|X|zz?|ZZ?|.)/g,R=/(\[[^\[]*\])|(\\)?(LTS|LT|LL?L?L?|l{1,4})/g,W={},B={};function G(t,e,n,i){var o=i;"string"==typeof i&&(o=function(){return this[i]()}),t&&(B[t]=o),e&&(B[e[0]]=function(){return Y(o.apply(this,arguments),e[1],e[2])}),n&&(B[n]=function(){return this.localeData().ordinal(o.apply(this,arguments),t)})}function U(t,e){return t.isValid()?(e=z(e,t.localeData()),W[e]=W[e]||function(i){var t,o,e,r=i.match(q);for(t=0,o=r.length;t<o;t++)B[r[t]]?r[t]=B[r[t]]:r[t]=(e=r[t]).match(/\[[\s\S]/)?e.replace(/^\[|\]$/g,""):e.replace(/\\/g,"");return function(t){var e,n="";for(e=0;e<o;e++)n+=D(r[e])?r[e].call(t,i):r[e];return n}}(e),W[e](t)):t.localeData().invalidDate()}function z(t,e){var n=5;function i(t){return e.longDateFormat(t)||t}for(R.lastIndex=0;0<=n&&R.test(t);)t=t.replace(R,i),R.lastIndex=0,n-=1;return t}var V=/\d/,Z=/\d\d/,X=/\d{3}/,Q=/\d{4}/,J=/[+-]?\d{6}/,K=/\d\d?/,tt=/\d\d\d\d?/,et=/\d\d\d\d\d\d?/,nt=/\d{1,3}/,it=/\d{1,4}/,ot=/[+-]?\d{1,6}/,rt=/\d+/,st=/[+-]?\d+/,at=/Z|[+-]\d\d:?\d\d/gi,lt=/Z|[+-]\d\d(?::?\d\d)?/gi,ct=/[0-9]*['a-z\u00A0-\u05FF\u0700-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF]+|[\u0600-\u06FF\/]+(\s*?[\u0600-\u06FF]+){1,2}/i,ut={};function dt(t,n,i){ut[t]=D(n)?n:function(t,e){return t&&i?i:n}}function ht(t,e){return f(ut,t)?ut[t](e._strict,e._locale):new RegExp(pt(t.replace("\\","").replace(/\\(\[)|\\(\])|\[([^\]\[]*)\]|\\(.)/g,function(t,e,n,i,o){return e||n||i||o})))}function pt(t){return t.replace(/[-\/\\^$*+?.()|[\]{}]/g,"\\$&")}var ft={};function mt(t,n){var e,i=n;for("string"==typeof t&&(t=[t]),u(n)&&(i=function(t,e){e[n]=C(t)}),e=0;e<t.length;e++)ft[t[e]]=i}function gt(t,o){mt(t,function(t,e,n,i){n._w=n._w||{},o(t,n._w,n,i)})}var yt=0,vt=1,bt=2,wt=3,xt=4,kt=5,_t=6,Ct=7,Tt=8,St=Array.prototype.indexOf?Array.prototype.indexOf:function(t){var e;for(e=0;e<this.length;++e)if(this[e]===t)return e;return-1};function Dt(t,e){return new Date(Date.UTC(t,e+1,0)).getUTCDate()}G("M",["MM",2],"Mo",function(){return this.month()+1}),G("MMM",0,0,function(t){return this.localeData().monthsShort(this,t)}),G("MMMM",0,0,function(t){return this.localeData().months(this,t)}),O("month","M"),N("month",8),dt("M",K),dt("MM",K,Z),dt("MMM",function(t,e){return e.monthsShortRegex(t)}),dt("MMMM",function(t,e){return e.monthsRegex(t)}),mt(["M","MM"],function(t,e){e[vt]=C(t)-1}),mt(["MMM","MMMM"],function(t,e,n,i){var o=n._locale.monthsParse(t,i,n._strict);null!=o?e[vt]=o:y(n).invalidMonth=t});var Et=/D[oD]?(\[[^\[\]]*\]|\s)+MMMM?/,$t="January_February_March_April_May_June_July_August_September_October_November_December".split("_");var Lt="Jan_Feb_Mar_Apr_May_Jun_Jul_Aug_Sep_Oct_Nov_Dec".split("_");function Mt(t,e){var n;if(!t.isValid())return t;if("string"==typeof e)if(/^\d+$/.test(e))e=C(e);else if(!u(e=t.localeData().monthsParse(e)))return t;return n=Math.min(t.date(),Dt(t.year(),e)),t._d["set"+(t._isUTC?"UTC":"")+"Month"](e,n),t}function Ot(t){return null!=t?(Mt(this,t),h.updateOffset(this,!0),this):I(this,"Month")}var At=ct;var jt=ct;function Ft(){function t(t,e){return e.length-t.length}var e,n,i=[],o=[],r=[];for(e=0;e<12;e++)n=g([2e3,e]),i.push(this.monthsShort(n,"")),o.push(this.months(n,"")),r.push(this.months(n,"")),r.push(this.monthsShort(n,""));for(i.sort(t),o.sort(t),r.sort(t),e=0;e<12;e++)i[e]=pt(i[e]),o[e]=pt(o[e]);for(e=0;e<24;e++)r[e]=pt(r[e]);this._monthsRegex=new RegExp("^("+r.join("|")+")","i"),this._monthsShortRegex=this._monthsRegex,this._monthsStrictRegex=new RegExp("^("+o.join("|")+")","i"),this._monthsShortStrictRegex=new RegExp("^("+i.join("|")+")","i")}function Nt(t){return Pt(t)?366:365}function Pt(t){return t%4==0&&t%100!=0||t%400==0}G("Y",0,0,function(){var t=this.year();return t<=9999?""+t:"+"+t}),G(0,["YY",2],0,function(){return this.year()%100}),G(0,["YYYY",4],0,"year"),G(0,["YYYYY",5],0,"year"),G(0,["YYYYYY",6,!0],0,"year"),O("year","y"),N("year",1),dt("Y",st),dt("YY",K,Z),dt("YYYY",it,Q),dt("YYYYY",ot,J),dt("YYYYYY",ot,J),mt(["YYYYY","YYYYYY"],yt),mt("YYYY",function(t,e){e[yt]=2===t.length?h.parseTwoDigitYear(t):C(t)}),mt("YY",function(t,e){e[yt]=h.parseTwoDigitYear(t)}),mt("Y",function(t,e){e[yt]=parseInt(t,10)}),h.parseTwoDigitYear=function(t){return C(t)+(68<C(t)?1900:2e3)};var It=P("FullYear",!0);function Ht(t){var e=new Date(Date.UTC.apply(null,arguments));return t<100&&0<=t&&isFinite(e.getUTCFullYear())&&e.setUTCFullYear(t),e}function Yt(t,e,n){var i=7+e-n;return-((7+Ht(t,0,i).getUTCDay()-e)%7)+i-1}function qt(t,e,n,i,o){var r,s,a=1+7*(e-1)+(7+n-i)%7+Yt(t,i,o);return s=a<=0?Nt(r=t-1)+a:a>Nt(t)?(r=t+1,a-Nt(t)):(r=t,a),{year:r,dayOfYear:s}}function Rt(t,e,n){var i,o,r=Yt(t.year(),e,n),s=Math.floor((t.dayOfYear()-r-1)/7)+1;return s<1?i=s+Wt(o=t.year()-1,e,n):s>Wt(t.year(),e,n)?(i=s-Wt(t.year(),e,n),o=t.year()+1):(o=t.year(),i=s),{week:i,year:o}}function Wt(t,e,n){var i=Yt(t,e,n),o=Yt(t+1,e,n);return(Nt(t)-i+o)/7}G("w",["ww",2],"wo","week"),G("W",["WW",2],"Wo","isoWeek"),O("week","w"),O("isoWeek","W"),N("week",5),N("isoWeek",5),dt("w",K),dt("ww",K,Z),dt("W",K),dt("WW",K,Z),gt(["w","ww","W","WW"],function(t,e,n,i){e[i.substr(0,1)]=C(t)});G("d",0,"do","day"),G("dd",0,0,function(t){return this.localeData().weekdaysMin(this,t)}),G("ddd",0,0,function(t){return this.localeData().weekdaysShort(this,t)}),G("dddd",0,0,function(t){return this.localeData().weekdays(this,t)}),G("e",0,0,"weekday"),G("E",0,0,"isoWeekday"),O("day","d"),O("weekday","e"),O("isoWeekday","E"),N("day",11),N("weekday",11),N("isoWeekday",11),dt("d",K),dt("e",K),dt("E",K),dt("dd",function(t,e){return e.weekdaysMinRegex(t)}),dt("ddd",function(t,e){return e.weekdaysShortRegex(t)}),dt("dddd",function(t,e){return e.weekdaysRegex(t)}),gt(["dd","ddd","dddd"],function(t,e,n,i){var o=n._locale.weekdaysParse(t,i,n._strict);null!=o?e.d=o:y(n).invalidWeekday=t}),gt(["d","e","E"],function(t,e,n,i){e[i]=C(t)});var Bt="Sunday_Monday_Tuesday_Wednesday_Thursday_Friday_Saturday".split("_");var Gt="Sun_Mon_Tue_Wed_Thu_Fri_Sat".split("_");var Ut="Su_Mo_Tu_We_Th_Fr_Sa".split("_");var zt=ct;var Vt=ct;var Zt=ct;function Xt(){function t(t,e){return e.length-t.length}var e,n,i,o,r,s=[],a=[],l=[],c=[];for(e=0;e<7;e++)n=g([2e3,1]).day(e),i=this.weekdaysMin(n,""),o=this.weekdaysShort(n,""),r=this.weekdays(n,""),s.push(i),a.push(o),l.push(r),c.push(i),c.push(o),c.push(r);for(s.sort(t),a.sort(t),l.sort(t),c.sort(t),e=0;e<7;e++)a[e]=pt(a[e]),l[e]=pt(l[e]),c[e]=pt(c[e]);this._weekdaysRegex=new RegExp("^("+c.join("|")+")","i"),this._weekdaysShortRegex=this._weekdaysRegex,this._weekdaysMinRegex=this._weekdaysRegex,this._weekdaysStrictRegex=new RegExp("^("+l.join("|")+")","i"),this._weekdaysShortStrictRegex=new RegExp("^("+a.join("|")+")","i"),this._weekdaysMinStrictRegex=new RegExp("^("+s.join("|")+")","i")}function Qt(){return this.hours()%12||12}function Jt(t,e){G(t,0,0,function(){return this.localeData().meridiem(this.hours(),this.minutes(),e)})}function Kt(t,e){return e._meridiemParse}G("H",["HH",2],0,"hour"),G("h",["hh",2],0,Qt),G("k",["kk",2],0,function(){return this.hours()||24}),G("hmm",0,0,function(){return""+Qt.apply(this)+Y(this.minutes(),2)}),G("hmmss",0,0,function(){return""+Qt.apply(this)+Y(this.minutes(),2)+Y(this.seconds(),2)}),G("Hmm",0,0,function(){return""+this.hours()+Y(this.minutes(),2)}),G("Hmmss",0,0,function(){return""+this.hours()+Y(this.minutes(),2)+Y(this.seconds(),2)}),Jt("a",!0),Jt("A",!1),O("hour","h"),N("hour",13),dt("a",Kt),dt("A",Kt),dt("H",K),dt("h",K),dt("k",K),dt("HH",K,Z),dt("hh",K,Z),dt("kk",K,Z),dt("hmm",tt),dt("hmmss",et),dt("Hmm",tt),dt("Hmmss",et),mt(["H","HH"],wt),mt(["k","kk"],function(t,e,n){var i=C(t);e[wt]=24===i?0:i}),mt(["a","A"],function(t,e,n){n._isPm=n._locale.isPM(t),n._meridiem=t}),mt(["h","hh"],function(t,e,n){e[wt]=C(t),y(n).bigHour=!0}),mt("hmm",function(t,e,n){var i=t.length-2;e[wt]=C(t.substr(0,i)),e[xt]=C(t.substr(i)),y(n).bigHour=!0}),mt("hmmss",function(t,e,n){var i=t.length-4,o=t.length-2;e[wt]=C(t.substr(0,i)),e[xt]=C(t.substr(i,2)),e[kt]=C(t.substr(o)),y(n).bigHour=!0}),mt("Hmm",function(t,e,n){var i=t.length-2;e[wt]=C(t.substr(0,i)),e[xt]=C(t.substr(i))}),mt("Hmmss",function(t,e,n){var i=t.length-4,o=t.length-2;e[wt]=C(t.substr(0,i)),e[xt]=C(t.substr(i,2)),e[kt]=C(t.substr(o))});var te,ee=P("Hours",!0),ne={calendar:{sameDay:"[Today at] LT",nextDay:"[Tomorrow at] LT",nextWeek:"dddd [at] LT",lastDay:"[Yesterday at] LT",lastWeek:"[Last] dddd [at] LT",sameElse:"L"},longDateFormat:{LTS:"h:mm:ss A",LT:"h:mm A",L:"MM/DD/YYYY",LL:"MMMM D, YYYY",LLL:"MMMM D, YYYY h:mm A",LLLL:"dddd, MMMM D, YYYY h:mm A"},invalidDate:"Invalid date",ordinal:"%d",dayOfMonthOrdinalParse:/\d{1,2}/,relativeTime:{future:"in %s",past:"%s ago",s:"a few seconds",ss:"%d seconds",m:"a minute",mm:"%d minutes",h:"an hour",hh:"%d hours",d:"a day",dd:"%d days",M:"a month",MM:"%d months",y:"a year",yy:"%d years"},months:$t,monthsShort:Lt,week:{dow:0,doy:6},weekdays:Bt,weekdaysMin:Ut,weekdaysShort:Gt,meridiemParse:/[ap]\.?m?\.?/i},ie={},oe={};function re(t){return t?t.toLowerCase().replace("_","-"):t}function se(t){var e=null;if(!ie[t]&&"undefined"!=typeof module&&module&&module.exports)try{e=te._abbr,require("./locale/"+t),ae(e)}catch(t){}return ie[t]}function ae(t,e){var n;return t&&(n=c(e)?ce(t):le(t,e))&&(te=n),te._abbr}function le(t,e){if(null===e)return delete ie[t],null;var n=ne;if(e.abbr=t,null!=ie[t])S("defineLocaleOverride","use moment.updateLocale(localeName, config) to change an existing locale. moment.defineLocale(localeName, config) should only be used for creating a new locale See http://momentjs.com/guides/#/warnings/define-locale/ for more info."),n=ie[t]._config;else if(null!=e.parentLocale){if(null==ie[e.parentLocale])return oe[e.parentLocale]||(oe[e.parentLocale]=[]),oe[e.parentLocale].push({name:t,config:e}),null;n=ie[e.parentLocale]._config}return ie[t]=new $(E(n,e)),oe[t]&&oe[t].forEach(function(t){le(t.name,t.config)}),ae(t),ie[t]}function ce(t){var e;if(t&&t._locale&&t._locale._abbr&&(t=t._locale._abbr),!t)return te;if(!a(t)){if(e=se(t))return e;t=[t]}return function(t){for(var e,n,i,o,r=0;r<t.length;){for(e=(o=re(t[r]).split("-")).length,n=(n=re(t[r+1]))?n.split("-"):null;0<e;){if(i=se(o.slice(0,e).join("-")))return i;if(n&&n.length>=e&&s(o,n,!0)>=e-1)break;e--}r++}return null}(t)}function ue(t){var e,n=t._a;return n&&-2===y(t).overflow&&(e=n[vt]<0||11<n[vt]?vt:n[bt]<1||n[bt]>Dt(n[yt],n[vt])?bt:n[wt]<0||24<n[wt]||24===n[wt]&&(0!==n[xt]||0!==n[kt]||0!==n[_t])?wt:n[xt]<0||59<n[xt]?xt:n[kt]<0||59<n[kt]?kt:n[_t]<0||999<n[_t]?_t:-1,y(t)._overflowDayOfYear&&(e<yt||bt<e)&&(e=bt),y(t)._overflowWeeks&&-1===e&&(e=Ct),y(t)._overflowWeekday&&-1===e&&(e=Tt),y(t).overflow=e),t}var de=/^\s*((?:[+-]\d{6}|\d{4})-(?:\d\d-\d\d|W\d\d-\d|W\d\d|\d\d\d|\d\d))(?:(T| )(\d\d(?::\d\d(?::\d\d(?:[.,]\d+)?)?)?)([\+\-]\d\d(?::?\d\d)?|\s*Z)?)?$/,he=/^\s*((?:[+-]\d{6}|\d{4})(?:\d\d\d\d|W\d\d\d|W\d\d|\d\d\d|\d\d))(?:(T| )(\d\d(?:\d\d(?:\d\d(?:[.,]\d+)?)?)?)([\+\-]\d\d(?::?\d\d)?|\s*Z)?)?$/,pe=/Z|[+-]\d\d(?::?\d\d)?/,fe=[["YYYYYY-MM-DD",/[+-]\d{6}-\d\d-\d\d/],["YYYY-MM-DD",/\d{4}-\d\d-\d\d/],["GGGG-[W]WW-E",/\d{4}-W\d\d-\d/],["GGGG-[W]WW",/\d{4}-W\d\d/,!1],["YYYY-DDD",/\d{4}-\d{3}/],["YYYY-MM",/\d{4}-\d\d/,!1],["YYYYYYMMDD",/[+-]\d{10}/],["YYYYMMDD",/\d{8}/],["GGGG[W]WWE",/\d{4}W\d{3}/],["GGGG[W]WW",/\d{4}W\d{2}/,!1],["YYYYDDD",/\d{7}/]],me=[["HH:mm:ss.SSSS",/\d\d:\d\d:\d\d\.\d+/],["HH:mm:ss,SSSS",/\d\d:\d\d:\d\d,\d+/],["HH:mm:ss",/\d\d:\d\d:\d\d/],["HH:mm",/\d\d:\d\d/],["HHmmss.SSSS",/\d\d\d\d\d\d\.\d+/],["HHmmss,SSSS",/\d\d\d\d\d\d,\d+/],["HHmmss",/\d\d\d\d\d\d/],["HHmm",/\d\d\d\d/],["HH",/\d\d/]],ge=/^\/?Date\((\-?\d+)/i;function ye(t){var e,n,i,o,r,s,a=t._i,l=de.exec(a)||he.exec(a);if(l){for(y(t).iso=!0,e=0,n=fe.length;e<n;e++)if(fe[e][1].exec(l[1])){o=fe[e][0],i=!1!==fe[e][2];break}if(null==o)return void(t._isValid=!1);if(l[3]){for(e=0,n=me.length;e<n;e++)if(me[e][1].exec(l[3])){r=(l[2]||" ")+me[e][0];break}if(null==r)return void(t._isValid=!1)}if(!i&&null!=r)return void(t._isValid=!1);if(l[4]){if(!pe.exec(l[4]))return void(t._isValid=!1);s="Z"}t._f=o+(r||"")+(s||""),ke(t)}else t._isValid=!1}var ve=/^((?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),?\s)?(\d?\d\s(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s(?:\d\d)?\d\d\s)(\d\d:\d\d)(\:\d\d)?(\s(?:UT|GMT|[ECMP][SD]T|[A-IK-Za-ik-z]|[+-]\d{4}))$/;function be(t){var e,n,i,o,r,s,a,l={" GMT":" +0000"," EDT":" -0400"," EST":" -0500"," CDT":" -0500"," CST":" -0600"," MDT":" -0600"," MST":" -0700"," PDT":" -0700"," PST":" -0800"};if(e=t._i.replace(/\([^\)]*\)|[\n\t]/g," ").replace(/(\s\s+)/g," ").replace(/^\s|\s$/g,""),n=ve.exec(e)){if(i=n[1]?"ddd"+(5===n[1].length?", ":" "):"",o="D MMM "+(10<n[2].length?"YYYY ":"YY "),r="HH:mm"+(n[4]?":ss":""),n[1]){var c=["Sun","Mon","Tue","Wed","Thu","Fri","Sat"][new Date(n[2]).getDay()];if(n[1].substr(0,3)!==c)return y(t).weekdayMismatch=!0,void(t._isValid=!1)}switch(n[5].length){case 2:s=0===a?" +0000":((a="YXWVUTSRQPONZABCDEFGHIKLM".indexOf(n[5][1].toUpperCase())-12)<0?" -":" +")+(""+a).replace(/^-?/,"0").match(/..$/)[0]+"00";break;case 4:s=l[n[5]];break;default:s=l[" GMT"]}n[5]=s,t._i=n.splice(1).join("")," ZZ",t._f=i+o+r+" ZZ",ke(t),y(t).rfc2822=!0}else t._isValid=!1}function we(t,e,n){return null!=t?t:null!=e?e:n}function xe(t){var e,n,i,o,r=[];if(!t._d){var s,a;for(s=t,a=new Date(h.now()),i=s._useUTC?[a.getUTCFullYear(),a.getUTCMonth(),a.getUTCDate()]:[a.getFullYear(),a.getMonth(),a.getDate()],t._w&&null==t._a[bt]&&null==t._a[vt]&&function(t){var e,n,i,o,r,s,a,l;if(null!=(e=t._w).GG||null!=e.W||null!=e.E)r=1,s=4,n=we(e.GG,t._a[yt],Rt(Te(),1,4).year),i=we(e.W,1),((o=we(e.E,1))<1||7<o)&&(l=!0);else{r=t._locale._week.dow,s=t._locale._week.doy;var c=Rt(Te(),r,s);n=we(e.gg,t._a[yt],c.year),i=we(e.w,c.week),null!=e.d?((o=e.d)<0||6<o)&&(l=!0):null!=e.e?(o=e.e+r,(e.e<0||6<e.e)&&(l=!0)):o=r}i<1||i>Wt(n,r,s)?y(t)._overflowWeeks=!0:null!=l?y(t)._overflowWeekday=!0:(a=qt(n,i,o,r,s),t._a[yt]=a.year,t._dayOfYear=a.dayOfYear)}(t),null!=t._dayOfYear&&(o=we(t._a[yt],i[yt]),(t._dayOfYear>Nt(o)||0===t._dayOfYear)&&(y(t)._overflowDayOfYear=!0),n=Ht(o,0,t._dayOfYear),t._a[vt]=n.getUTCMonth(),t._a[bt]=n.getUTCDate()),e=0;e<3&&null==t._a[e];++e)t._a[e]=r[e]=i[e];for(;e<7;e++)t._a[e]=r[e]=null==t._a[e]?2===e?1:0:t._a[e];24===t._a[wt]&&0===t._a[xt]&&0===t._a[kt]&&0===t._a[_t]&&(t._nextDay=!0,t._a[wt]=0),t._d=(t._useUTC?Ht:function(t,e,n,i,o,r,s){var a=new Date(t,e,n,i,o,r,s);return t<100&&0<=t&&isFinite(a.getFullYear())&&a.setFullYear(t),a}).apply(null,r),null!=t._tzm&&t._d.setUTCMinutes(t._d.getUTCMinutes()-t._tzm),t._nextDay&&(t._a[wt]=24)}}function ke(t){if(t._f!==h.ISO_8601)if(t._f!==h.RFC_2822){t._a=[],y(t).empty=!0;var e,n,i,o,r,s,a,l,c=""+t._i,u=c.length,d=0;for(i=z(t._f,t._locale).match(q)||[],e=0;e<i.length;e++)o=i[e],(n=(c.match(ht(o,t))||[])[0])&&(0<(r=c.substr(0,c.indexOf(n))).length&&y(t).unusedInput.push(r),c=c.slice(c.indexOf(n)+n.length),d+=n.length),B[o]?(n?y(t).empty=!1:y(t).unusedTokens.push(o),s=o,l=t,null!=(a=n)&&f(ft,s)&&ft[s](a,l._a,l,s)):t._strict&&!n&&y(t).unusedTokens.push(o);y(t).charsLeftOver=u-d,0<c.length&&y(t).unusedInput.push(c),t._a[wt]<=12&&!0===y(t).bigHour&&0<t._a[wt]&&(y(t).bigHour=void 0),y(t).parsedDateParts=t._a.slice(0),y(t).meridiem=t._meridiem,t._a[wt]=function(t,e,n){var i;if(null==n)return e;return null!=t.meridiemHour?t.meridiemHour(e,n):(null!=t.isPM&&((i=t.isPM(n))&&e<12&&(e+=12),i||12!==e||(e=0)),e)}(t._locale,t._a[wt],t._meridiem),xe(t),ue(t)}else be(t);else ye(t)}function _e(t){var e,n,i,o,r=t._i,s=t._f;return t._locale=t._locale||ce(t._l),null===r||void 0===s&&""===r?b({nullInput:!0}):("string"==typeof r&&(t._i=r=t._locale.preparse(r)),k(r)?new x(ue(r)):(d(r)?t._d=r:a(s)?function(t){var e,n,i,o,r;if(0===t._f.length)return y(t).invalidFormat=!0,t._d=new Date(NaN);for(o=0;o<t._f.length;o++)r=0,e=w({},t),null!=t._useUTC&&(e._useUTC=t._useUTC),e._f=t._f[o],ke(e),v(e)&&(r+=y(e).charsLeftOver,r+=10*y(e).unusedTokens.length,y(e).score=r,(null==i||r<i)&&(i=r,n=e));m(t,n||e)}(t):s?ke(t):c(n=(e=t)._i)?e._d=new Date(h.now()):d(n)?e._d=new Date(n.valueOf()):"string"==typeof n?(i=e,null===(o=ge.exec(i._i))?(ye(i),!1===i._isValid&&(delete i._isValid,be(i),!1===i._isValid&&(delete i._isValid,h.createFromInputFallback(i)))):i._d=new Date(+o[1])):a(n)?(e._a=p(n.slice(0),function(t){return parseInt(t,10)}),xe(e)):l(n)?function(t){if(!t._d){var e=j(t._i);t._a=p([e.year,e.month,e.day||e.date,e.hour,e.minute,e.second,e.millisecond],function(t){return t&&parseInt(t,10)}),xe(t)}}(e):u(n)?e._d=new Date(n):h.createFromInputFallback(e),v(t)||(t._d=null),t))}function Ce(t,e,n,i,o){var r,s={};return!0!==n&&!1!==n||(i=n,n=void 0),(l(t)&&function(t){var e;for(e in t)return!1;return!0}(t)||a(t)&&0===t.length)&&(t=void 0),s._isAMomentObject=!0,s._useUTC=s._isUTC=o,s._l=n,s._i=t,s._f=e,s._strict=i,(r=new x(ue(_e(s))))._nextDay&&(r.add(1,"d"),r._nextDay=void 0),r}function Te(t,e,n,i){return Ce(t,e,n,i,!1)}h.createFromInputFallback=n("value provided is not in a recognized RFC2822 or ISO format. moment construction falls back to js Date(), which is not reliable across all browsers and versions. Non RFC2822/ISO date formats are discouraged and will be removed in an upcoming major release. Please refer to http://momentjs.com/guides/#/warnings/js-date/ for more info.",function(t){t._d=new Date(t._i+(t._useUTC?" UTC":""))}),h.ISO_8601=function(){},h.RFC_2822=function(){};var Se=n("moment().min is deprecated, use moment.max instead. http://momentjs.com/guides/#/warnings/min-max/",function(){var t=Te.apply(null,arguments);return this.isValid()&&t.isValid()?t<this?this:t:b()}),De=n("moment().max is deprecated, use moment.min instead. http://momentjs.com/guides/#/warnings/min-max/",function(){var t=Te.apply(null,arguments);return this.isValid()&&t.isValid()?this<t?this:t:b()});function Ee(t,e){var n,i;if(1===e.length&&a(e[0])&&(e=e[0]),!e.length)return Te();for(n=e[0],i=1;i<e.length;++i)e[i].isValid()&&!e[i][t](n)||(n=e[i]);return n}var $e=["year","quarter","month","week","day","hour","minute","second","millisecond"];function Le(t){var e=j(t),n=e.year||0,i=e.quarter||0,o=e.month||0,r=e.week||0,s=e.day||0,a=e.hour||0,l=e.minute||0,c=e.second||0,u=e.millisecond||0;this._isValid=function(t){for(var e in t)if(-1===$e.indexOf(e)||null!=t[e]&&isNaN(t[e]))return!1;for(var n=!1,i=0;i<$e.length;++i)if(t[$e[i]]){if(n)return!1;parseFloat(t[$e[i]])!==C(t[$e[i]])&&(n=!0)}return!0}(e),this._milliseconds=+u+1e3*c+6e4*l+1e3*a*60*60,this._days=+s+7*r,this._months=+o+3*i+12*n,this._data={},this._locale=ce(),this._bubble()}function Me(t){return t instanceof Le}function Oe(t){return t<0?-1*Math.round(-1*t):Math.round(t)}function Ae(t,n){G(t,0,0,function(){var t=this.utcOffset(),e="+";return t<0&&(t=-t,e="-"),e+Y(~~(t/60),2)+n+Y(~~t%60,2)})}Ae("Z",":"),Ae("ZZ",""),dt("Z",lt),dt("ZZ",lt),mt(["Z","ZZ"],function(t,e,n){n._useUTC=!0,n._tzm=Fe(lt,t)});var je=/([\+\-]|\d\d)/gi;function Fe(t,e){var n=(e||"").match(t);if(null===n)return null;var i=((n[n.length-1]||[])+"").match(je)||["-",0,0],o=60*i[1]+C(i[2]);return 0===o?0:"+"===i[0]?o:-o}function Ne(t,e){var n,i;return e._isUTC?(n=e.clone(),i=(k(t)||d(t)?t.valueOf():Te(t).valueOf())-n.valueOf(),n._d.setTime(n._d.valueOf()+i),h.updateOffset(n,!1),n):Te(t).local()}function Pe(t){return 15*-Math.round(t._d.getTimezoneOffset()/15)}function Ie(){return!!this.isValid()&&(this._isUTC&&0===this._offset)}h.updateOffset=function(){};var He=/^(\-)?(?:(\d*)[. ])?(\d+)\:(\d+)(?:\:(\d+)(\.\d*)?)?$/,Ye=/^(-)?P(?:(-?[0-9,.]*)Y)?(?:(-?[0-9,.]*)M)?(?:(-?[0-9,.]*)W)?(?:(-?[0-9,.]*)D)?(?:T(?:(-?[0-9,.]*)H)?(?:(-?[0-9,.]*)M)?(?:(-?[0-9,.]*)S)?)?$/;function qe(t,e){var n,i,o,r=t,s=null;return Me(t)?r={ms:t._milliseconds,d:t._days,M:t._months}:u(t)?(r={},e?r[e]=t:r.milliseconds=t):(s=He.exec(t))?(n="-"===s[1]?-1:1,r={y:0,d:C(s[bt])*n,h:C(s[wt])*n,m:C(s[xt])*n,s:C(s[kt])*n,ms:C(Oe(1e3*s[_t]))*n}):(s=Ye.exec(t))?(n="-"===s[1]?-1:1,r={y:Re(s[2],n),M:Re(s[3],n),w:Re(s[4],n),d:Re(s[5],n),h:Re(s[6],n),m:Re(s[7],n),s:Re(s[8],n)}):null==r?r={}:"object"==typeof r&&("from"in r||"to"in r)&&(o=function(t,e){var n;if(!t.isValid()||!e.isValid())return{milliseconds:0,months:0};e=Ne(e,t),t.isBefore(e)?n=We(t,e):((n=We(e,t)).milliseconds=-n.milliseconds,n.months=-n.months);return n}(Te(r.from),Te(r.to)),(r={}).ms=o.milliseconds,r.M=o.months),i=new Le(r),Me(t)&&f(t,"_locale")&&(i._locale=t._locale),i}function Re(t,e){var n=t&&parseFloat(t.replace(",","."));return(isNaN(n)?0:n)*e}function We(t,e){var n={milliseconds:0,months:0};return n.months=e.month()-t.month()+12*(e.year()-t.year()),t.clone().add(n.months,"M").isAfter(e)&&--n.months,n.milliseconds=+e-+t.clone().add(n.months,"M"),n}function Be(i,o){return function(t,e){var n;return null===e||isNaN(+e)||(S(o,"moment()."+o+"(period, number) is deprecated. Please use moment()."+o+"(number, period). See http://momentjs.com/guides/#/warnings/add-inverted-param/ for more info."),n=t,t=e,e=n),Ge(this,qe(t="string"==typeof t?+t:t,e),i),this}}function Ge(t,e,n,i){var o=e._milliseconds,r=Oe(e._days),s=Oe(e._months);t.isValid()&&(i=null==i||i,o&&t._d.setTime(t._d.valueOf()+o*n),r&&H(t,"Date",I(t,"Date")+r*n),s&&Mt(t,I(t,"Month")+s*n),i&&h.updateOffset(t,r||s))}qe.fn=Le.prototype,qe.invalid=function(){return qe(NaN)};var Ue=Be(1,"add"),ze=Be(-1,"subtract");function Ve(t){var e;return void 0===t?this._locale._abbr:(null!=(e=ce(t))&&(this._locale=e),this)}h.defaultFormat="YYYY-MM-DDTHH:mm:ssZ",h.defaultFormatUtc="YYYY-MM-DDTHH:mm:ss[Z]";var Ze=n("moment().lang() is deprecated. Instead, use moment().localeData() to get the language configuration. Use moment().locale() to change languages.",function(t){return void 0===t?this.localeData():this.locale(t)});function Xe(){return this._locale}function Qe(t,e){G(0,[t,t.length],0,e)}function Je(t,e,n,i,o){var r;return null==t?Rt(this,i,o).year:((r=Wt(t,i,o))<e&&(e=r),function(t,e,n,i,o){var r=qt(t,e,n,i,o),s=Ht(r.year,0,r.dayOfYear);return this.year(s.getUTCFullYear()),this.month(s.getUTCMonth()),this.date(s.getUTCDate()),this}.call(this,t,e,n,i,o))}G(0,["gg",2],0,function(){return this.weekYear()%100}),G(0,["GG",2],0,function(){return this.isoWeekYear()%100}),Qe("gggg","weekYear"),Qe("ggggg","weekYear"),Qe("GGGG","isoWeekYear"),Qe("GGGGG","isoWeekYear"),O("weekYear","gg"),O("isoWeekYear","GG"),N("weekYear",1),N("isoWeekYear",1),dt("G",st),dt("g",st),dt("GG",K,Z),dt("gg",K,Z),dt("GGGG",it,Q),dt("gggg",it,Q),dt("GGGGG",ot,J),dt("ggggg",ot,J),gt(["gggg","ggggg","GGGG","GGGGG"],function(t,e,n,i){e[i.substr(0,2)]=C(t)}),gt(["gg","GG"],function(t,e,n,i){e[i]=h.parseTwoDigitYear(t)}),G("Q",0,"Qo","quarter"),O("quarter","Q"),N("quarter",7),dt("Q",V),mt("Q",function(t,e){e[vt]=3*(C(t)-1)}),G("D",["DD",2],"Do","date"),O("date","D"),N("date",9),dt("D",K),dt("DD",K,Z),dt("Do",function(t,e){return t?e._dayOfMonthOrdinalParse||e._ordinalParse:e._dayOfMonthOrdinalParseLenient}),mt(["D","DD"],bt),mt("Do",function(t,e){e[bt]=C(t.match(K)[0])});var Ke=P("Date",!0);G("DDD",["DDDD",3],"DDDo","dayOfYear"),O("dayOfYear","DDD"),N("dayOfYear",4),dt("DDD",nt),dt("DDDD",X),mt(["DDD","DDDD"],function(t,e,n){n._dayOfYear=C(t)}),G("m",["mm",2],0,"minute"),O("minute","m"),N("minute",14),dt("m",K),dt("mm",K,Z),mt(["m","mm"],xt);var tn=P("Minutes",!1);G("s",["ss",2],0,"second"),O("second","s"),N("second",15),dt("s",K),dt("ss",K,Z),mt(["s","ss"],kt);var en,nn=P("Seconds",!1);for(G("S",0,0,function(){return~~(this.millisecond()/100)}),G(0,["SS",2],0,function(){return~~(this.millisecond()/10)}),G(0,["SSS",3],0,"millisecond"),G(0,["SSSS",4],0,function(){return 10*this.millisecond()}),G(0,["SSSSS",5],0,function(){return 100*this.millisecond()}),G(0,["SSSSSS",6],0,function(){return 1e3*this.millisecond()}),G(0,["SSSSSSS",7],0,function(){return 1e4*this.millisecond()}),G(0,["SSSSSSSS",8],0,function(){return 1e5*this.millisecond()}),G(0,["SSSSSSSSS",9],0,function(){return 1e6*this.millisecond()}),O("millisecond","ms"),N("millisecond",16),dt("S",nt,V),dt("SS",nt,Z),dt("SSS",nt,X),en="SSSS";en.length<=9;en+="S")dt(en,rt);function on(t,e){e[_t]=C(1e3*("0."+t))}for(en="S";en.length<=9;en+="S")mt(en,on);var rn=P("Milliseconds",!1);G("z",0,0,"zoneAbbr"),G("zz",0,0,"zoneName");var sn=x.prototype;function an(t){return t}sn.add=Ue,sn.calendar=function(t,e){var n=t||Te(),i=Ne(n,this).startOf("day"),o=h.calendarFormat(this,i)||"sameElse",r=e&&(D(e[o])?e[o].call(this,n):e[o]);return this.format(r||this.localeData().calendar(o,this,Te(n)))},sn.clone=function(){return new x(this)},sn.diff=function(t,e,n){var i,o,r,s;return this.isValid()&&(i=Ne(t,this)).isValid()?(o=6e4*(i.utcOffset()-this.utcOffset()),"year"===(e=A(e))||"month"===e||"quarter"===e?(a=this,l=i,d=12*(l.year()-a.year())+(l.month()-a.month()),h=a.clone().add(d,"months"),u=l-h<0?(c=a.clone().add(d-1,"months"),(l-h)/(h-c)):(c=a.clone().add(d+1,"months"),(l-h)/(c-h)),s=-(d+u)||0,"quarter"===e?s/=3:"year"===e&&(s/=12)):(r=this-i,s="second"===e?r/1e3:"minute"===e?r/6e4:"hour"===e?r/36e5:"day"===e?(r-o)/864e5:"week"===e?(r-o)/6048e5:r),n?s:_(s)):NaN;var a,l,c,u,d,h},sn.endOf=function(t){return void 0===(t=A(t))||"millisecond"===t?this:("date"===t&&(t="day"),this.startOf(t).add(1,"isoWeek"===t?"week":t).subtract(1,"ms"))},sn.format=function(t){t||(t=this.isUtc()?h.defaultFormatUtc:h.defaultFormat);var e=U(this,t);return this.localeData().postformat(e)},sn.from=function(t,e){return this.isValid()&&(k(t)&&t.isValid()||Te(t).isValid())?qe({to:this,from:t}).locale(this.locale()).humanize(!e):this.localeData().invalidDate()},sn.fromNow=function(t){return this.from(Te(),t)},sn.to=function(t,e){return this.isValid()&&(k(t)&&t.isValid()||Te(t).isValid())?qe({from:this,to:t}).locale(this.locale()).humanize(!e):this.localeData().invalidDate()},sn.toNow=function(t){return this.to(Te(),t)},sn.get=function(t){return D(this[t=A(t)])?this[t]():this},sn.invalidAt=function(){return y(this).overflow},sn.isAfter=function(t,e){var n=k(t)?t:Te(t);return!(!this.isValid()||!n.isValid())&&("millisecond"===(e=A(c(e)?"millisecond":e))?this.valueOf()>n.valueOf():n.valueOf()<this.clone().startOf(e).valueOf())},sn.isBefore=function(t,e){var n=k(t)?t:Te(t);return!(!this.isValid()||!n.isValid())&&("millisecond"===(e=A(c(e)?"millisecond":e))?this.valueOf()<n.valueOf():this.clone().endOf(e).valueOf()<n.valueOf())},sn.isBetween=function(t,e,n,i){return("("===(i=i||"()")[0]?this.isAfter(t,n):!this.isBefore(t,n))&&(")"===i[1]?this.isBefore(e,n):!this.isAfter(e,n))},sn.isSame=function(t,e){var n,i=k(t)?t:Te(t);return!(!this.isValid()||!i.isValid())&&("millisecond"===(e=A(e||"millisecond"))?this.valueOf()===i.valueOf():(n=i.valueOf(),this.clone().startOf(e).valueOf()<=n&&n<=this.clone().endOf(e).valueOf()))},sn.isSameOrAfter=function(t,e){return this.isSame(t,e)||this.isAfter(t,e)},sn.isSameOrBefore=function(t,e){return this.isSame(t,e)||this.isBefore(t,e)},sn.isValid=function(){return v(this)},sn.lang=Ze,sn.locale=Ve,sn.localeData=Xe,sn.max=De,sn.min=Se,sn.parsingFlags=function(){return m({},y(this))},sn.set=function(t,e){if("object"==typeof t)for(var n=function(t){var e=[];for(var n in t)e.push({unit:n,priority:F[n]});return e.sort(function(t,e){return t.priority-e.priority}),e}(t=j(t)),i=0;i<n.length;i++)this[n[i].unit](t[n[i].unit]);else if(D(this[t=A(t)]))return this[t](e);return this},sn.startOf=function(t){switch(t=A(t)){case"year":this.month(0);case"quarter":case"month":this.date(1);case"week":case"isoWeek":case"day":case"date":this.hours(0);case"hour":this.minutes(0);case"minute":this.seconds(0);case"second":this.milliseconds(0)}return"week"===t&&this.weekday(0),"isoWeek"===t&&this.isoWeekday(1),"quarter"===t&&this.month(3*Math.floor(this.month()/3)),this},sn.subtract=ze,sn.toArray=function(){return[this.year(),this.month(),this.date(),this.hour(),this.minute(),this.second(),this.millisecond()]},sn.toObject=function(){return{years:this.year(),months:this.month(),date:this.date(),hours:this.hours(),minutes:this.minutes(),seconds:this.seconds(),milliseconds:this.milliseconds()}},sn.toDate=function(){return new Date(this.valueOf())},sn.toISOString=function(){if(!this.isValid())return null;var t=this.clone().utc();return t.year()<0||9999<t.year()?U(t,"YYYYYY-MM-DD[T]HH:mm:ss.SSS[Z]"):D(Date.prototype.toISOString)?this.toDate().toISOString():U(t,"YYYY-MM-DD[T]HH:mm:ss.SSS[Z]")},sn.inspect=function(){if(!this.isValid())return"moment.invalid(/* "+this._i+" */)";var t="moment",e="";this.isLocal()||(t=0===this.utcOffset()?"moment.utc":"moment.parseZone",e="Z");var n="["+t+'("]',i=0<=this.year()&&this.year()<=9999?"YYYY":"YYYYYY",o=e+'[")]';return this.format(n+i+"-MM-DD[T]HH:mm:ss.SSS"+o)},sn.toJSON=function(){return this.isValid()?this.toISOString():null},sn.toString=function(){return this.clone().locale("en").format("ddd MMM DD YYYY HH:mm:ss [GMT]ZZ")},sn.unix=function(){return Math.floor(this.valueOf()/1e3)},sn.valueOf=function(){return this._d.valueOf()-6e4*(this._offset||0)},sn.creationData=function(){return{input:this._i,format:this._f,locale:this._locale,isUTC:this._isUTC,strict:this._strict}},sn.year=It,sn.isLeapYear=function(){return Pt(this.year())},sn.weekYear=function(t){return Je.call(this,t,this.week(),this.weekday(),this.localeData()._week.dow,this.localeData()._week.doy)},sn.isoWeekYear=function(t){return Je.call(this,t,this.isoWeek(),this.isoWeekday(),1,4)},sn.quarter=sn.quarters=function(t){return null==t?Math.ceil((this.month()+1)/3):this.month(3*(t-1)+this.month()%3)},sn.month=Ot,sn.daysInMonth=function(){return Dt(this.year(),this.month())},sn.week=sn.weeks=function(t){var e=this.localeData().week(this);return null==t?e:this.add(7*(t-e),"d")},sn.isoWeek=sn.isoWeeks=function(t){var e=Rt(this,1,4).week;return null==t?e:this.add(7*(t-e),"d")},sn.weeksInYear=function(){var t=this.localeData()._week;return Wt(this.year(),t.dow,t.doy)},sn.isoWeeksInYear=function(){return Wt(this.year(),1,4)},sn.date=Ke,sn.day=sn.days=function(t){if(!this.isValid())return null!=t?this:NaN;var e,n,i=this._isUTC?this._d.getUTCDay():this._d.getDay();return null!=t?(e=t,n=this.localeData(),t="string"!=typeof e?e:isNaN(e)?"number"==typeof(e=n.weekdaysParse(e))?e:null:parseInt(e,10),this.add(t-i,"d")):i},sn.weekday=function(t){if(!this.isValid())return null!=t?this:NaN;var e=(this.day()+7-this.localeData()._week.dow)%7;return null==t?e:this.add(t-e,"d")},sn.isoWeekday=function(t){if(!this.isValid())return null!=t?this:NaN;if(null==t)return this.day()||7;var e,n,i=(e=t,n=this.localeData(),"string"==typeof e?n.weekdaysParse(e)%7||7:isNaN(e)?null:e);return this.day(this.day()%7?i:i-7)},sn.dayOfYear=function(t){var e=Math.round((this.clone().startOf("day")-this.clone().startOf("year"))/864e5)+1;return null==t?e:this.add(t-e,"d")},sn.hour=sn.hours=ee,sn.minute=sn.minutes=tn,sn.second=sn.seconds=nn,sn.millisecond=sn.milliseconds=rn,sn.utcOffset=function(t,e,n){var i,o=this._offset||0;if(!this.isValid())return null!=t?this:NaN;if(null==t)return this._isUTC?o:Pe(this);if("string"==typeof t){if(null===(t=Fe(lt,t)))return this}else Math.abs(t)<16&&!n&&(t*=60);return!this._isUTC&&e&&(i=Pe(this)),this._offset=t,this._isUTC=!0,null!=i&&this.add(i,"m"),o!==t&&(!e||this._changeInProgress?Ge(this,qe(t-o,"m"),1,!1):this._changeInProgress||(this._changeInProgress=!0,h.updateOffset(this,!0),this._changeInProgress=null)),this},sn.utc=function(t){return this.utcOffset(0,t)},sn.local=function(t){return this._isUTC&&(this.utcOffset(0,t),this._isUTC=!1,t&&this.subtract(Pe(this),"m")),this},sn.parseZone=function(){if(null!=this._tzm)this.utcOffset(this._tzm,!1,!0);else if("string"==typeof this._i){var t=Fe(at,this._i);null!=t?this.utcOffset(t):this.utcOffset(0,!0)}return this},sn.hasAlignedHourOffset=function(t){return!!this.isValid()&&(t=t?Te(t).utcOffset():0,(this.utcOffset()-t)%60==0)},sn.isDST=function(){return this.utcOffset()>this.clone().month(0).utcOffset()||this.utcOffset()>this.clone().month(5).utcOffset()},sn.isLocal=function(){return!!this.isValid()&&!this._isUTC},sn.isUtcOffset=function(){return!!this.isValid()&&this._isUTC},sn.isUtc=Ie,sn.isUTC=Ie,sn.zoneAbbr=function(){return this._isUTC?"UTC":""},sn.zoneName=function(){return this._isUTC?"Coordinated Universal Time":""},sn.dates=n("dates accessor is deprecated. Use date instead.",Ke),sn.months=n("months accessor is deprecated. Use month instead",Ot),sn.years=n("years accessor is deprecated. Use year instead",It),sn.zone=n("moment().zone is deprecated, use moment().utcOffset instead. http://momentjs.com/guides/#/warnings/zone/",function(t,e){return null!=t?("string"!=typeof t&&(t=-t),this.utcOffset(t,e),this):-this.utcOffset()}),sn.isDSTShifted=n("isDSTShifted is deprecated. See http://momentjs.com/guides/#/warnings/dst-shifted/ for more information",function(){if(!c(this._isDSTShifted))return this._isDSTShifted;var t={};if(w(t,this),(t=_e(t))._a){var e=t._isUTC?g(t._a):Te(t._a);this._isDSTShifted=this.isValid()&&0<s(t._a,e.toArray())}else this._isDSTShifted=!1;return this._isDSTShifted});var ln=$.prototype;function cn(t,e,n,i){var o=ce(),r=g().set(i,e);return o[n](r,t)}function un(t,e,n){if(u(t)&&(e=t,t=void 0),t=t||"",null!=e)return cn(t,e,n,"month");var i,o=[];for(i=0;i<12;i++)o[i]=cn(t,i,n,"month");return o}function dn(t,e,n,i){e=("boolean"==typeof t?u(e)&&(n=e,e=void 0):(e=t,t=!1,u(n=e)&&(n=e,e=void 0)),e||"");var o,r=ce(),s=t?r._week.dow:0;if(null!=n)return cn(e,(n+s)%7,i,"day");var a=[];for(o=0;o<7;o++)a[o]=cn(e,(o+s)%7,i,"day");return a}ln.calendar=function(t,e,n){var i=this._calendar[t]||this._calendar.sameElse;return D(i)?i.call(e,n):i},ln.longDateFormat=function(t){var e=this._longDateFormat[t],n=this._longDateFormat[t.toUpperCase()];return e||!n?e:(this._longDateFormat[t]=n.replace(/MMMM|MM|DD|dddd/g,function(t){return t.slice(1)}),this._longDateFormat[t])},ln.invalidDate=function(){return this._invalidDate},ln.ordinal=function(t){return this._ordinal.replace("%d",t)},ln.preparse=an,ln.postformat=an,ln.relativeTime=function(t,e,n,i){var o=this._relativeTime[n];return D(o)?o(t,e,n,i):o.replace(/%d/i,t)},ln.pastFuture=function(t,e){var n=this._relativeTime[0<t?"future":"past"];return D(n)?n(e):n.replace(/%s/i,e)},ln.set=function(t){var e,n;for(n in t)D(e=t[n])?this[n]=e:this["_"+n]=e;this._config=t,this._dayOfMonthOrdinalParseLenient=new RegExp((this._dayOfMonthOrdinalParse.source||this._ordinalParse.source)+"|"+/\d{1,2}/.source)},ln.months=function(t,e){return t?a(this._months)?this._months[t.month()]:this._months[(this._months.isFormat||Et).test(e)?"format":"standalone"][t.month()]:a(this._months)?this._months:this._months.standalone},ln.monthsShort=function(t,e){return t?a(this._monthsShort)?this._monthsShort[t.month()]:this._monthsShort[Et.test(e)?"format":"standalone"][t.month()]:a(this._monthsShort)?this._monthsShort:this._monthsShort.standalone},ln.monthsParse=function(t,e,n){var i,o,r;if(this._monthsParseExact)return function(t,e,n){var i,o,r,s=t.toLocaleLowerCase();if(!this._monthsParse)for(this._monthsParse=[],this._longMonthsParse=[],this._shortMonthsParse=[],i=0;i<12;++i)r=g([2e3,i]),this._shortMonthsParse[i]=this.monthsShort(r,"").toLocaleLowerCase(),this._longMonthsParse[i]=this.months(r,"").toLocaleLowerCase();return n?"MMM"===e?-1!==(o=St.call(this._shortMonthsParse,s))?o:null:-1!==(o=St.call(this._longMonthsParse,s))?o:null:"MMM"===e?-1!==(o=St.call(this._shortMonthsParse,s))?o:-1!==(o=St.call(this._longMonthsParse,s))?o:null:-1!==(o=St.call(this._longMonthsParse,s))?o:-1!==(o=St.call(this._shortMonthsParse,s))?o:null}.call(this,t,e,n);for(this._monthsParse||(this._monthsParse=[],this._longMonthsParse=[],this._shortMonthsParse=[]),i=0;i<12;i++){if(o=g([2e3,i]),n&&!this._longMonthsParse[i]&&(this._longMonthsParse[i]=new RegExp("^"+this.months(o,"").replace(".","")+"$","i"),this._shortMonthsParse[i]=new RegExp("^"+this.monthsShort(o,"").replace(".","")+"$","i")),n||this._monthsParse[i]||(r="^"+this.months(o,"")+"|^"+this.monthsShort(o,""),this._monthsParse[i]=new RegExp(r.replace(".",""),"i")),n&&"MMMM"===e&&this._longMonthsParse[i].test(t))return i;if(n&&"MMM"===e&&this._shortMonthsParse[i].test(t))return i;if(!n&&this._monthsParse[i].test(t))return i}},ln.monthsRegex=function(t){return this._monthsParseExact?(f(this,"_monthsRegex")||Ft.call(this),t?this._monthsStrictRegex:this._monthsRegex):(f(this,"_monthsRegex")||(this._monthsRegex=jt),this._monthsStrictRegex&&t?this._monthsStrictRegex:this._monthsRegex)},ln.monthsShortRegex=function(t){return this._monthsParseExact?(f(this,"_monthsRegex")||Ft.call(this),t?this._monthsShortStrictRegex:this._monthsShortRegex):(f(this,"_monthsShortRegex")||(this._monthsShortRegex=At),this._monthsShortStrictRegex&&t?this._monthsShortStrictRegex:this._monthsShortRegex)},ln.week=function(t){return Rt(t,this._week.dow,this._week.doy).week},ln.firstDayOfYear=function(){return this._week.doy},ln.firstDayOfWeek=function(){return this._week.dow},ln.weekdays=function(t,e){return t?a(this._weekdays)?this._weekdays[t.day()]:this._weekdays[this._weekdays.isFormat.test(e)?"format":"standalone"][t.day()]:a(this._weekdays)?this._weekdays:this._weekdays.standalone},ln.weekdaysMin=function(t){return t?this._weekdaysMin[t.day()]:this._weekdaysMin},ln.weekdaysShort=function(t){return t?this._weekdaysShort[t.day()]:this._weekdaysShort},ln.weekdaysParse=function(t,e,n){var i,o,r;if(this._weekdaysParseExact)return function(t,e,n){var i,o,r,s=t.toLocaleLowerCase();if(!this._weekdaysParse)for(this._weekdaysParse=[],this._shortWeekdaysParse=[],this._minWeekdaysParse=[],i=0;i<7;++i)r=g([2e3,1]).day(i),this._minWeekdaysParse[i]=this.weekdaysMin(r,"").toLocaleLowerCase(),this._shortWeekdaysParse[i]=this.weekdaysShort(r,"").toLocaleLowerCase(),this._weekdaysParse[i]=this.weekdays(r,"").toLocaleLowerCase();return n?"dddd"===e?-1!==(o=St.call(this._weekdaysParse,s))?o:null:"ddd"===e?-1!==(o=St.call(this._shortWeekdaysParse,s))?o:null:-1!==(o=St.call(this._minWeekdaysParse,s))?o:null:"dddd"===e?-1!==(o=St.call(this._weekdaysParse,s))?o:-1!==(o=St.call(this._shortWeekdaysParse,s))?o:-1!==(o=St.call(this._minWeekdaysParse,s))?o:null:"ddd"===e?-1!==(o=St.call(this._shortWeekdaysParse,s))?o:-1!==(o=St.call(this._weekdaysParse,s))?o:-1!==(o=St.call(this._minWeekdaysParse,s))?o:null:-1!==(o=St.call(this._minWeekdaysParse,s))?o:-1!==(o=St.call(this._weekdaysParse,s))?o:-1!==(o=St.call(this._shortWeekdaysParse,s))?o:null}.call(this,t,e,n);for(this._weekdaysParse||(this._weekdaysParse=[],this._minWeekdaysParse=[],this._shortWeekdaysParse=[],this._fullWeekdaysParse=[]),i=0;i<7;i++){if(o=g([2e3,1]).day(i),n&&!this._fullWeekdaysParse[i]&&(this._fullWeekdaysParse[i]=new RegExp("^"+this.weekdays(o,"").replace(".",".?")+"$","i"),this._shortWeekdaysParse[i]=new RegExp("^"+this.weekdaysShort(o,"").replace(".",".?")+"$","i"),this._minWeekdaysParse[i]=new RegExp("^"+this.weekdaysMin(o,"").replace(".",".?")+"$","i")),this._weekdaysParse[i]||(r="^"+this.weekdays(o,"")+"|^"+this.weekdaysShort(o,"")+"|^"+this.weekdaysMin(o,""),this._weekdaysParse[i]=new RegExp(r.replace(".",""),"i")),n&&"dddd"===e&&this._fullWeekdaysParse[i].test(t))return i;if(n&&"ddd"===e&&this._shortWeekdaysParse[i].test(t))return i;if(n&&"dd"===e&&this._minWeekdaysParse[i].test(t))return i;if(!n&&this._weekdaysParse[i].test(t))return i}},ln.weekdaysRegex=function(t){return this._weekdaysParseExact?(f(this,"_weekdaysRegex")||Xt.call(this),t?this._weekdaysStrictRegex:this._weekdaysRegex):(f(this,"_weekdaysRegex")||(this._weekdaysRegex=zt),this._weekdaysStrictRegex&&t?this._weekdaysStrictRegex:this._weekdaysRegex)},ln.weekdaysShortRegex=function(t){return this._weekdaysParseExact?(f(this,"_weekdaysRegex")||Xt.call(this),t?this._weekdaysShortStrictRegex:this._weekdaysShortRegex):(f(this,"_weekdaysShortRegex")||(this._weekdaysShortRegex=Vt),this._weekdaysShortStrictRegex&&t?this._weekdaysShortStrictRegex:this._weekdaysShortRegex)},ln.weekdaysMinRegex=function(t){return this._weekdaysParseExact?(f(this,"_weekdaysRegex")||Xt.call(this),t?this._weekdaysMinStrictRegex:this._weekdaysMinRegex):(f(this,"_weekdaysMinRegex")||(this._weekdaysMinRegex=Zt),this._weekdaysMinStrictRegex&&t?this._weekdaysMinStrictRegex:this._weekdaysMinRegex)},ln.isPM=function(t){return"p"===(t+"").toLowerCase().charAt(0)},ln.meridiem=function(t,e,n){return 11<t?n?"pm":"PM":n?"am":"AM"},ae("en",{dayOfMonthOrdinalParse:/\d{1,2}(th|st|nd|rd)/,ordinal:function(t){var e=t%10;return t+(1===C(t%100/10)?"th":1===e?"st":2===e?"nd":3===e?"rd":"th")}}),h.lang=n("moment.lang is deprecated. Use moment.locale instead.",ae),h.langData=n("moment.langData is deprecated. Use moment.localeData instead.",ce);var hn=Math.abs;function pn(t,e,n,i){var o=qe(e,n);return t._milliseconds+=i*o._milliseconds,t._days+=i*o._days,t._months+=i*o._months,t._bubble()}function fn(t){return t<0?Math.floor(t):Math.ceil(t)}function mn(t){return 4800*t/146097}function gn(t){return 146097*t/4800}function yn(t){return function(){return this.as(t)}}var vn=yn("ms"),bn=yn("s"),wn=yn("m"),xn=yn("h"),kn=yn("d"),_n=yn("w"),Cn=yn("M"),Tn=yn("y");function Sn(t){return function(){return this.isValid()?this._data[t]:NaN}}var Dn=Sn("milliseconds"),En=Sn("seconds"),$n=Sn("minutes"),Ln=Sn("hours"),Mn=Sn("days"),On=Sn("months"),An=Sn("years");var jn=Math.round,Fn={ss:44,s:45,m:45,h:22,d:26,M:11};var Nn=Math.abs;function Pn(){if(!this.isValid())return this.localeData().invalidDate();var t,e,n=Nn(this._milliseconds)/1e3,i=Nn(this._days),o=Nn(this._months);e=_((t=_(n/60))/60),n%=60,t%=60;var r=_(o/12),s=o%=12,a=i,l=e,c=t,u=n,d=this.asSeconds();return d?(d<0?"-":"")+"P"+(r?r+"Y":"")+(s?s+"M":"")+(a?a+"D":"")+(l||c||u?"T":"")+(l?l+"H":"")+(c?c+"M":"")+(u?u+"S":""):"P0D"}var In=Le.prototype;return In.isValid=function(){return this._isValid},In.abs=function(){var t=this._data;return this._milliseconds=hn(this._milliseconds),this._days=hn(this._days),this._months=hn(this._months),t.milliseconds=hn(t.milliseconds),t.seconds=hn(t.seconds),t.minutes=hn(t.minutes),t.hours=hn(t.hours),t.months=hn(t.months),t.years=hn(t.years),this},In.add=function(t,e){return pn(this,t,e,1)},In.subtract=function(t,e){return pn(this,t,e,-1)},In.as=function(t){if(!this.isValid())return NaN;var e,n,i=this._milliseconds;if("month"===(t=A(t))||"year"===t)return e=this._days+i/864e5,n=this._months+mn(e),"month"===t?n:n/12;switch(e=this._days+Math.round(gn(this._months)),t){case"week":return e/7+i/6048e5;case"day":return e+i/864e5;case"hour":return 24*e+i/36e5;case"minute":return 1440*e+i/6e4;case"second":return 86400*e+i/1e3;case"millisecond":return Math.floor(864e5*e)+i;default:throw new Error("Unknown unit "+t)}},In.asMilliseconds=vn,In.asSeconds=bn,In.asMinutes=wn,In.asHours=xn,In.asDays=kn,In.asWeeks=_n,In.asMonths=Cn,In.asYears=Tn,In.valueOf=function(){return this.isValid()?this._milliseconds+864e5*this._days+this._months%12*2592e6+31536e6*C(this._months/12):NaN},In._bubble=function(){var t,e,n,i,o,r=this._milliseconds,s=this._days,a=this._months,l=this._data;return 0<=r&&0<=s&&0<=a||r<=0&&s<=0&&a<=0||(r+=864e5*fn(gn(a)+s),a=s=0),l.milliseconds=r%1e3,t=_(r/1e3),l.seconds=t%60,e=_(t/60),l.minutes=e%60,n=_(e/60),l.hours=n%24,a+=o=_(mn(s+=_(n/24))),s-=fn(gn(o)),i=_(a/12),a%=12,l.days=s,l.months=a,l.years=i,this},In.get=function(t){return t=A(t),this.isValid()?this[t+"s"]():NaN},In.milliseconds=Dn,In.seconds=En,In.minutes=$n,In.hours=Ln,In.days=Mn,In.weeks=function(){return _(this.days()/7)},In.months=On,In.years=An,In.humanize=function(t){if(!this.isValid())return this.localeData().invalidDate();var e,n,i,o,r,s,a,l,c,u,d,h=this.localeData(),p=(n=!t,i=h,o=qe(e=this).abs(),r=jn(o.as("s")),s=jn(o.as("m")),a=jn(o.as("h")),l=jn(o.as("d")),c=jn(o.as("M")),u=jn(o.as("y")),(d=r<=Fn.ss&&["s",r]||r<Fn.s&&["ss",r]||s<=1&&["m"]||s<Fn.m&&["mm",s]||a<=1&&["h"]||a<Fn.h&&["hh",a]||l<=1&&["d"]||l<Fn.d&&["dd",l]||c<=1&&["M"]||c<Fn.M&&["MM",c]||u<=1&&["y"]||["yy",u])[2]=n,d[3]=0<+e,d[4]=i,function(t,e,n,i,o){return o.relativeTime(e||1,!!n,t,i)}.apply(null,d));return t&&(p=h.pastFuture(+this,p)),h.postformat(p)},In.toISOString=Pn,In.toString=Pn,In.toJSON=Pn,In.locale=Ve,In.localeData=Xe,In.toIsoString=n("toIsoString() is deprecated. Please use toISOString() instead (notice the capitals)",Pn),In.lang=Ze,G("X",0,0,"unix"),G("x",0,0,"valueOf"),dt("x",st),dt("X",/[+-]?\d+(\.\d{1,3})?/),mt("X",function(t,e,n){n._d=new Date(1e3*parseFloat(t,10))}),mt("x",function(t,e,n){n._d=new Date(C(t))}),h.version="2.18.1",t=Te,h.fn=sn,h.min=function(){return Ee("isBefore",[].slice.call(arguments,0))},h.max=function(){return Ee("isAfter",[].slice.call(arguments,0))},h.now=function(){return Date.now?Date.now():+new Date},h.utc=g,h.unix=function(t){return Te(1e3*t)},h.months=function(t,e){return un(t,e,"months")},h.isDate=d,h.locale=ae,h.invalid=b,h.duration=qe,h.isMoment=k,h.weekdays=function(t,e,n){return dn(t,e,n,"weekdays")},h.parseZone=function(){return Te.apply(null,arguments).parseZone()},h.localeData=ce,h.isDuration=Me,h.monthsShort=function(t,e){return un(t,e,"monthsShort")},h.weekdaysMin=function(t,e,n){return dn(t,e,n,"weekdaysMin")},h.defineLocale=le,h.updateLocale=function(t,e){if(null!=e){var n,i=ne;null!=ie[t]&&(i=ie[t]._config),(n=new $(e=E(i,e))).parentLocale=ie[t],ie[t]=n,ae(t)}else null!=ie[t]&&(null!=ie[t].parentLocale?ie[t]=ie[t].parentLocale:null!=ie[t]&&delete ie[t]);return ie[t]},h.locales=function(){return L(ie)},h.weekdaysShort=function(t,e,n){return dn(t,e,n,"weekdaysShort")},h.normalizeUnits=A,h.relativeTimeRounding=function(t){return void 0===t?jn:"function"==typeof t&&(jn=t,!0)},h.relativeTimeThreshold=function(t,e){return void 0!==Fn[t]&&(void 0===e?Fn[t]:(Fn[t]=e,"s"===t&&(Fn.ss=e-1),!0))},h.calendarFormat=function(t,e){var n=t.diff(e,"days",!0);return n<-6?"sameElse":n<-1?"lastWeek":n<0?"lastDay":n<1?"sameDay":n<2?"nextDay":n<7?"nextWeek":"sameElse"},h.prototype=sn,h}),function(t,e){"object"==typeof exports&&"undefined"!=typeof module&&"function"==typeof require?e(require("../moment")):"function"==typeof define&&define.amd?define(["../moment"],e):e(t.moment)}(this,function(t){"use strict";return t.defineLocale("pt-br",{months:"Janeiro_Fevereiro_MarÃ§o_Abril_Maio_Junho_Julho_Agosto_Setembro_Outubro_Novembro_Dezembro".split("_"),monthsShort:"Jan_Fev_Mar_Abr_Mai_Jun_Jul_Ago_Set_Out_Nov_Dez".split("_"),weekdays:"Domingo_Segunda-feira_TerÃ§a-feira_Quarta-feira_Quinta-feira_Sexta-feira_SÃ¡bado".split("_"),weekdaysShort:"Dom_Seg_Ter_Qua_Qui_Sex_SÃ¡b".split("_"),weekdaysMin:"Do_2Âª_3Âª_4Âª_5Âª_6Âª_SÃ¡".split("_"),weekdaysParseExact:!0,longDateFormat:{LT:"HH:mm",LTS:"HH:mm:ss",L:"DD/MM/YYYY",LL:"D [de] MMMM [de] YYYY",LLL:"D [de] MMMM [de] YYYY [Ã s] HH:mm",LLLL:"dddd, D [de] MMMM [de] YYYY [Ã s] HH:mm"},calendar:{sameDay:"[Hoje Ã s] LT",nextDay:"[AmanhÃ£ Ã s] LT",nextWeek:"dddd [Ã s] LT",lastDay:"[Ontem Ã s] LT",lastWeek:function(){return 0===this.day()||6===this.day()?"[Ãšltimo] dddd [Ã s] LT":"[Ãšltima] dddd [Ã s] LT"},sameElse:"L"},relativeTime:{future:"em %s",past:"%s atrÃ¡s",s:"poucos segundos",m:"um minuto",mm:"%d minutos",h:"uma hora",hh:"%d horas",d:"um dia",dd:"%d dias",M:"um mÃªs",MM:"%d meses",y:"um ano",yy:"%d anos"},dayOfMonthOrdinalParse:/\d{1,2}Âº/,ordinal:"%dÂº"})}),function(t,e){"object"==typeof exports&&"undefined"!=typeof module&&"function"==typeof require?e(require("../moment")):"function"==typeof define&&define.amd?define(["../moment"],e):e(t.moment)}(this,function(t){"use strict";var n="ene._feb._mar._abr._may._jun._jul._ago._sep._oct._nov._dic.".split("_"),i="ene_feb_mar_abr_may_jun_jul_ago_sep_oct_nov_dic".split("_");return t.defineLocale("es",{months:"enero_febrero_marzo_abril_mayo_junio_julio_agosto_septiembre_octubre_noviembre_diciembre".split("_"),monthsShort:function(t,e){return t?/-MMM-/.test(e)?i[t.month()]:n[t.month()]:n},monthsParseExact:!0,weekdays:"domingo_lunes_martes_miÃ©rcoles_jueves_viernes_sÃ¡bado".split("_"),weekdaysShort:"dom._lun._mar._miÃ©._jue._vie._sÃ¡b.".split("_"),weekdaysMin:"do_lu_ma_mi_ju_vi_sÃ¡".split("_"),weekdaysParseExact:!0,longDateFormat:{LT:"H:mm",LTS:"H:mm:ss",L:"DD/MM/YYYY",LL:"D [de] MMMM [de] YYYY",LLL:"D [de] MMMM [de] YYYY H:mm",LLLL:"dddd, D [de] MMMM [de] YYYY H:mm"},calendar:{sameDay:function(){return"[hoy a la"+(1!==this.hours()?"s":"")+"] LT"},nextDay:function(){return"[maÃ±ana a la"+(1!==this.hours()?"s":"")+"] LT"},nextWeek:function(){return"dddd [a la"+(1!==this.hours()?"s":"")+"] LT"},lastDay:function(){return"[ayer a la"+(1!==this.hours()?"s":"")+"] LT"},lastWeek:function(){return"[el] dddd [pasado a la"+(1!==this.hours()?"s":"")+"] LT"},sameElse:"L"},relativeTime:{future:"en %s",past:"hace %s",s:"unos segundos",m:"un minuto",mm:"%d minutos",h:"una hora",hh:"%d horas",d:"un dÃ­a",dd:"%d dÃ­as",M:"un mes",MM:"%d meses",y:"un aÃ±o",yy:"%d aÃ±os"},dayOfMonthOrdinalParse:/\d{1,2}Âº/,ordinal:"%dÂº",week:{dow:1,doy:4}})});var ModalForms={modal_id:null,form_id:null,url:"/",method:"POST",submit_btn_id:null,has_captcha:!1,captcha_key:null,captcha_theme:"light",captcha_id:null,email_confirm_modal_id:"#modal_confirm",success_message:null,error_message:null,rcaptcha:null,submit:function(){var e=this;$.ajax({type:e.method,url:e.url,data:$(e.form_id).serialize(),success:function(t){$.each(t.fields,function(t,e){$("#"+e).parent().removeClass("has-error"),$("#"+e+"_error").html("")}),!1===t.sent?(!0===e.has_captcha&&($(e.submit_btn_id).attr("disabled","disabled"),e.render_captcha()),$.each(t.message,function(t,e){$("#"+t).parent().addClass("has-error"),$("#"+t+"_error").html(e)})):($(e.modal_id).modal("toggle"),$(".midGlyph").addClass("success"),$(".midGlyph").html(e.success_message),$(e.email_confirm_modal_id).modal("show"))},error:function(t){$(e.modal_id).modal("toggle"),$(".midGlyph").removeClass("success").toggleClass("unsuccess"),$(".midGlyph").html(e.error_message),$(e.email_confirm_modal_id).modal("show")}})},recaptcha_callback:function(){$(this.submit_btn_id).removeAttr("disabled")},registry_recaptcha_modal:function(){var t=this;$(this.modal_id).on("show.bs.modal",function(){setTimeout(function(){t.render_captcha(t.captcha_id,t.captcha_key,t.captcha_theme)},100)})},render_captcha:function(t,e,n){this.render_captcha&&$(this.submit_btn_id).attr("disabled","disabled"),null===this.rcaptcha?this.rcaptcha=grecaptcha.render(t,{sitekey:e,theme:n,callback:this.recaptcha_callback.bind(this)}):grecaptcha.reset(this.rcaptcha)},init:function(t,e,n,i,o,r,s,a,l,c,u,d){this.modal_id=t,this.form_id=e,this.url=n,this.method=i,this.submit_btn_id=o,this.has_captcha=r,this.captcha_key=s,this.captcha_theme=l,this.captcha_id=a,this.email_confirm_modal_id=c,this.success_message=u,this.error_message=d,!(this.rcaptcha=null)===this.has_captcha&&this.registry_recaptcha_modal();var h=this;return $(this.form_id).submit(function(t){t.preventDefault(),h.submit()}),this}};
+//# sourceMappingURL=../maps/scielo-bundle-min.js.map
+
+
+var Article={TopBinder:[],Init:function(){Article.SetScreen();var e=$("#articleText"),t=e.offset(),i=$(".articleMenu").width();$(".articleSection",e);$(".ModalTables").on("shown.bs.modal",function(){var e=$(".modal-body",this),t=$("table",e),i=e.outerWidth(),o=t.outerWidth();e.is("cached")||(t.addClass("table"),i<o?t.addClass("autoWidth"):t.removeClass("autoWidth")),e.addClass("cached")});var o=function(e){var t=$(".xref",e),i=t.next("span:eq(0)"),o=e.position(),a=(t.outerHeight(),o.left),n=e.closest("li");0<n.length&&n.addClass("zindexFix"),i.removeClass("closed").addClass("opened").css({left:300<a?-a/3:0}).fadeIn("fast")},a=function(e){var t=$(".xref",e).next("span:eq(0)"),i=e.closest("li");0<i.length&&i.removeClass("zindexFix"),t.removeClass("opened").addClass("closed")};if(Article.IsTablet||Article.IsMobile){var n=!1,l=null;$("html").on("touchstart",function(e){$(".ref").each(function(){var e=$(this);a(e),n=!1})}),$(".ref").on("touchstart",function(e){e.stopPropagation();var t=$(this);null!==l&&t.get(0)===l.get(0)?n?n&&(a(t),n=!1):(o(l=t),n=!0):(null!==l&&a(l),o(l=t),n=!0)})}else $(".ref").on("mouseenter mouseleave",function(e){e.preventDefault();var t=$(this);"mouseenter"===e.type?o(t):a(t)});$(".thumb").on("mouseenter mouseleave",function(e){var t=$(this).parent().parent().find(".preview");"mouseenter"==e.type?t.fadeIn("fast"):"mouseleave"==e.type&&t.fadeOut("fast")}),$(".ModalTables").on("shown.bs.modal",function(){0==$("table td[colspan], table td[rowspan]",this).length&&$("table",this).addClass("table-hover")}),$(".collapseTitle").on("click",function(){var e=$(this).next(),t=$(this).find(".collapseIcon");e.is(":visible")?(e.slideUp("fast"),t.removeClass("opened")):(e.slideDown("fast"),t.addClass("opened"))}),$(".expandReduceText").on("click",function(e){e.preventDefault();var t=$("#articleText .ref"),i=$("#articleText .text"),o=$(this).data("expandreducetext");void 0===$(this).data("defaultwidth")&&$(this).data("defaultwidth",i.outerWidth()),1==o?(t.hide(),i.outerWidth("100%"),$(this).data("expandreducetext",!1)):(i.width(""),t.show(),$(this).data("expandreducetext",!0));var a=$(window).scrollTop();setTimeout(function(){Article.ArticleStructureBuilder(),Article.ArticleStructureSelect(a)},100)}),$(".articleTxt .xref:not(.big)").on("click",function(){var e=$(this).text();$(".ref-list");-1==e.indexOf(",")||(e=(e=e.split(","))[0]),parseInt(e),e--}),Article.ArticleStructureBuilder(),t.top=t.top-25;var r=e.outerHeight(),s=$(".articleMenu").height();if(window.setTimeout(function(){s=$(".articleMenu").height()},200),$(window).scroll(function(){var e=$(window).scrollTop();Article.isScrolledIntoView(".floatingMenuCtt")?($(".floatingMenuItem").css({position:"absolute"}),$(".floatingMenu").css({position:"absolute"})):($(".floatingMenuItem").css({position:"fixed"}),$(".floatingMenu").css({position:"fixed"})),e>t.top?($(".articleMenu").addClass("fixed").width(i),e>r+t.top-s-46?$(".articleMenu").addClass("fixedBottom"):$(".articleMenu").removeClass("fixedBottom")):$(".articleMenu").removeClass("fixed"),Article.ArticleStructureSelect(e),$(".alternativeHeader").stop(!1,!1)}),""!=window.location.hash){var c=window.location.hash,d=window.scrollY;$(c).modal("toggle").on("hidden.bs.modal",function(){window.location.hash="",$("body,html").scrollTop(d)})}$("[data-toggle='modal']").on("click",function(){var e=$(this).data("target"),t=window.scrollY;"undefined"==e&&""==e||(window.location.hash=e),$(e).on("hidden.bs.modal",function(){window.location.hash="",$("body,html").scrollTop(t)})});var u=$(".downloadOptions li.group"),p=100/u.length;u.css("width",p+"%"),Article.fechaAutores();var f=!1;$(".short-link").mouseenter(function(e){if(!f){if(-1!==(t=window.location.href).indexOf("localhost"))var t="http://www.scielo.br";$.ajax({type:"GET",async:!1,url:"http://ref.scielo.org/api/v1/shorten",data:"url="+encodeURI(t),dataType:"jsonp",success:function(e){result=e,f=!0}})}});var h=new Clipboard(".short-link",{text:function(e){return result}});h.on("success",function(e){var t=$(e.trigger);t.addClass("copyFeedback"),setTimeout(function(){t.removeClass("copyFeedback")},2e3)}),h.on("error",function(e){var t=$(e.trigger);t.addClass("copyFeedbackError"),setTimeout(function(){t.removeClass("copyFeedbackError")},2e3)}),$("ul.floatingMenuMobile").on("click",function(){$(this).find(".fm-button-child").each(function(){$(this).addClass("tooltip-mobile-on")})});var m=!0;$("ul.floatingMenuMobile").on("focusout click",function(e){if(m){if("focusout"===e.type)return;m=!1,$(this).find(".fm-list").children("li").removeAttr("style"),$(this).find(".fm-button-main").addClass("fm-button-main-mobile-open")}else m=!0,$(this).find(".fm-list").children("li").css({opacity:0}),$(this).find(".fm-button-main").removeClass("fm-button-main-mobile-open")})},isScrolledIntoView:function(e){var t=$(window).scrollTop(),i=t+$(window).height(),o=$(e).offset().top;return o+$(e).height()<=i&&t<=o},ArticleStructureBuilder:function(){var e=$(".articleMenu"),t=$("#articleText .articleSection"),a=0,n="";Article.TopBinder=[],t.each(function(){var e=$(this).data("anchor"),t=$(this).find(".articleSectionTitle"),i=$(this).offset();if(0==$(this).find("a[name='articleSection"+a+"']").length&&$(this).prepend("<a name='articleSection"+a+"'></a>"),0==a?Article.TopBinder.push(0):Article.TopBinder.push(i.top),void 0===e)return!0;if(n+="<li "+(0==a?'class="selected"':"")+">",n+='\t<a href="#articleSection'+a+'">'+e+"</a>",1<t.length){var o=0;n+="<ul>",t.each(function(){var e=$(this).offset();Article.TopBinder.push(e.top),0==$(this).prev("a[name='as"+a+"-heading"+o+"']").length&&$(this).before("<a name='as"+a+"-heading"+o+"'></a>"),n+="<li>",n+='\t<a href="#as'+a+"-heading"+o+'">'+$(this).text()+"</a>",n+="</li>",o++}),n+="</ul>"}n+="</li>",a++}),e.html(n),$("a",e).on("click",function(e){e.preventDefault();var t=$(this).attr("href");t=t.replace("#","");var i=$("a[name="+t+"]").offset();$("html,body").animate({scrollTop:i.top-60},500)})},ArticleStructureSelect:function(e){for(var t=$(".articleMenu"),i=0,o=Article.TopBinder.length;i<o;i++){if(i==o-1&&e>=Article.TopBinder[i]-100){t.find("li").removeClass("selected"),t.find("li:eq("+i+")").addClass("selected");break}if(e<=Article.TopBinder[i]-100){t.find("li").removeClass("selected"),t.find("li:eq("+(i-1)+")").addClass("selected");break}}},Bindings:function(e){void 0===e&&(e=".article")},fechaAutores:function(){var t=$(".contribGroup"),i=$(".contribGroup .dropdown"),o=i.length;if(10<=o){var a=null,n=$(".outlineFadeLink"),e=i[0],l=i[o-1],r=$('<a data-toggle="tooltip" data-placement="top" title="+'+(o-2)+'"></a>');r.text("[...]"),r.css({padding:"10px",cursor:"pointer"});var s=$("<div></div>"),c=$("<a></a>");c.addClass("btn-fechar");var d=$("<span></span>");d.addClass("sci-ico-floatingMenuClose"),c.append(d),s.append(c);var u=$("<div></div>");u.append(e),u.append(r),u.append(l),u.append(n),t.text(""),t.append(u),r.on("click",function(){a.tooltip("disable"),t.textContent="";for(var e=0;e<o;e++)t.append(i[e]);t.append(n),t.append(s)}),c.on("click",function(){a.tooltip("enable"),Article.fechaAutores()}),a=$('[data-toggle="tooltip"]').tooltip()}t.css("opacity","1")},IsMobile:!1,IsTablet:!1,IsTabletPortrait:!1,IsDesktop:!1,IsHD:!1,isOldIE:!1,DetectMobile:function(e){var t={detectMobileBrowsers:{fullPattern:/(android|bb\d+|meego).+mobile|avantgo|bada\/|blackberry|blazer|compal|elaine|fennec|hiptop|iemobile|ip(hone|od)|iris|kindle|lge |maemo|midp|mmp|mobile.+firefox|netfront|opera m(ob|in)i|palm( os)?|phone|p(ixi|re)\/|plucker|pocket|psp|series(4|6)0|symbian|treo|up\.(browser|link)|vodafone|wap|windows ce|xda|xiino/i,shortPattern:/1207|6310|6590|3gso|4thp|50[1-6]i|770s|802s|a wa|abac|ac(er|oo|s\-)|ai(ko|rn)|al(av|ca|co)|amoi|an(ex|ny|yw)|aptu|ar(ch|go)|as(te|us)|attw|au(di|\-m|r |s )|avan|be(ck|ll|nq)|bi(lb|rd)|bl(ac|az)|br(e|v)w|bumb|bw\-(n|u)|c55\/|capi|ccwa|cdm\-|cell|chtm|cldc|cmd\-|co(mp|nd)|craw|da(it|ll|ng)|dbte|dc\-s|devi|dica|dmob|do(c|p)o|ds(12|\-d)|el(49|ai)|em(l2|ul)|er(ic|k0)|esl8|ez([4-7]0|os|wa|ze)|fetc|fly(\-|_)|g1 u|g560|gene|gf\-5|g\-mo|go(\.w|od)|gr(ad|un)|haie|hcit|hd\-(m|p|t)|hei\-|hi(pt|ta)|hp( i|ip)|hs\-c|ht(c(\-| |_|a|g|p|s|t)|tp)|hu(aw|tc)|i\-(20|go|ma)|i230|iac( |\-|\/)|ibro|idea|ig01|ikom|im1k|inno|ipaq|iris|ja(t|v)a|jbro|jemu|jigs|kddi|keji|kgt( |\/)|klon|kpt |kwc\-|kyo(c|k)|le(no|xi)|lg( g|\/(k|l|u)|50|54|\-[a-w])|libw|lynx|m1\-w|m3ga|m50\/|ma(te|ui|xo)|mc(01|21|ca)|m\-cr|me(rc|ri)|mi(o8|oa|ts)|mmef|mo(01|02|bi|de|do|t(\-| |o|v)|zz)|mt(50|p1|v )|mwbp|mywa|n10[0-2]|n20[2-3]|n30(0|2)|n50(0|2|5)|n7(0(0|1)|10)|ne((c|m)\-|on|tf|wf|wg|wt)|nok(6|i)|nzph|o2im|op(ti|wv)|oran|owg1|p800|pan(a|d|t)|pdxg|pg(13|\-([1-8]|c))|phil|pire|pl(ay|uc)|pn\-2|po(ck|rt|se)|prox|psio|pt\-g|qa\-a|qc(07|12|21|32|60|\-[2-7]|i\-)|qtek|r380|r600|raks|rim9|ro(ve|zo)|s55\/|sa(ge|ma|mm|ms|ny|va)|sc(01|h\-|oo|p\-)|sdk\/|se(c(\-|0|1)|47|mc|nd|ri)|sgh\-|shar|sie(\-|m)|sk\-0|sl(45|id)|sm(al|ar|b3|it|t5)|so(ft|ny)|sp(01|h\-|v\-|v )|sy(01|mb)|t2(18|50)|t6(00|10|18)|ta(gt|lk)|tcl\-|tdg\-|tel(i|m)|tim\-|t\-mo|to(pl|sh)|ts(70|m\-|m3|m5)|tx\-9|up(\.b|g1|si)|utst|v400|v750|veri|vi(rg|te)|vk(40|5[0-3]|\-v)|vm40|voda|vulc|vx(52|53|60|61|70|80|81|83|85|98)|w3c(\-| )|webc|whit|wi(g |nc|nw)|wmlb|wonu|x700|yas\-|your|zeto|zte\-/i}};return t.detectMobileBrowsers.fullPattern.test(e)||t.detectMobileBrowsers.shortPattern.test(e.substr(0,4))},DetectTablet:function(e){var t={detectMobileBrowsers:{tabletPattern:/android|ipad|playbook|silk/i}};return t.detectMobileBrowsers.tabletPattern.test(e)},SetScreen:function(){var e=$(window).innerWidth(),t=window.matchMedia("(orientation: portrait)").matches;990<e&&(Article.IsDesktop=!0),1206<e&&(Article.IsHD=!0),Article.DetectMobile(navigator.userAgent)&&(Article.IsMobile=!0),Article.DetectTablet(navigator.userAgent)&&(Article.IsTablet=!0,Article.IsTabletPortrait=!!t,window.addEventListener("orientationchange",function(){0==screen.orientation.angle?Article.IsTabletPortrait=!0:Article.IsTabletPortrait=!1})),-1<navigator.appVersion.indexOf("MSIE 8")&&(Article.IsMobile=!1,Article.IsTablet=!1,Article.IsDesktop=!0,Article.IsOldIE=!0,Article.IsHD=!1)}};$(function(){$("body.article").length&&Article.Init()});
+//# sourceMappingURL=../maps/scielo-article-min.js.map
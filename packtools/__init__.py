@@ -1,13 +1,13 @@
 """Packtools is a Python library and set of command line utilities which can be
 used to handle SciELO Publishing Schema packages and XML files.
 """
-import os
 import sys
 import logging
 import platform
 
 from lxml import etree
 
+from . import catalogs
 from .domain import XMLValidator, HTMLGenerator
 from .utils import XML, SPPackage, XMLWebOptimiser
 from .version import __version__
@@ -65,7 +65,8 @@ def get_debug_info():
         'libxslt_compiled_version': LIBXSLT_COMPILED_VERSION,
         'libxslt_version': LIBXSLT_VERSION,
         'lxml_version': LXML_VERSION,
-        'xml_catalog_files': os.environ.get('XML_CATALOG_FILES', ''),
+        # the catalog used by packtools.utils.XMLCatalogResolver
+        'xml_catalog_files': catalogs.XML_CATALOG,
         'system_path': sys.path,
         'packtools_version': __version__,
         'python_version': platform.python_version(),
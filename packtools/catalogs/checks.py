@@ -3,6 +3,7 @@ from __future__ import unicode_literals
 import logging
 import itertools
 import json
+import functools
 
 import plumber
 
@@ -11,10 +12,17 @@ from packtools.style_errors import StyleError
 LOGGER = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _read_codes(path):
+    with open(path) as f:
+        return frozenset(json.load(f))
+
+
 def ISO3166_CODES_SET():
+    """ISO 3166 alpha-2 codes. The file is read only once per process.
+    """
     from . import ISO3166_CODES
-    with open(ISO3166_CODES) as f:
-        return set(json.load(f))
+    return _read_codes(ISO3166_CODES)
 
 
 # --------------------------------
@@ -148,10 +156,11 @@ def country_code(message):
     """
     et, err_list = message
 
+    country_codes = ISO3166_CODES_SET()
     elements = et.findall('//*[@country]')
     for elem in elements:
         value = elem.attrib['country']
-        if value not in ISO3166_CODES_SET():
+        if value not in country_codes:
             err = StyleError()
             err.line = elem.sourceline
             err.message = "Element '%s', attribute country: Invalid country code \"%s\"." % (elem.tag, value)
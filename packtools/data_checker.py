@@ -4,12 +4,19 @@ import sys
 import argparse
 import json
 import logging
+import multiprocessing
 from datetime import date, datetime
 
 from importlib.resources import files
 from packtools.sps.pid_provider.xml_sps_lib import XMLWithPre
+from packtools.sps.validation.profiling import DocumentProfile, ValidationProfile
 from packtools.sps.validation.xml_validator import get_validation_results
-from packtools.sps.validation.xml_validator_rules import read_json
+from packtools.sps.validation.xml_validator_rules import get_ruleset, read_json
+from packtools.utils import set_parse_timings
+
+
+# regras de validacao de cada processo do pool (ver _init_worker)
+_worker_params = None
 
 
 class Report:
@@ -67,6 +74,9 @@ class XMLFile:
         self.xml_csv_path = xml_csv_path
         self.exceptions = None
         self.results = None
+        self.error = None
+        # DocumentProfile, preenchido durante a validação, se informado
+        self.profile = None
 
     def validate(self, params):
         self.exceptions = []
@@ -77,7 +87,9 @@ class XMLFile:
             logging.error(f"Unable to read {self.xml_file_path}")
             return
 
-        for item in get_validation_results(xmltree, params):
+        for item in get_validation_results(
+            xmltree, params, report="failures", profile=self.profile
+        ):
             if item["response"] == "exception":
                 self.exceptions.append(item)
             else:
@@ -87,6 +99,18 @@ class XMLFile:
                     self.results.append(item)
 
     def get_xml_tree(self):
+        if self.profile is None:
+            return self._get_xml_tree()
+
+        timings = []
+        set_parse_timings(timings)
+        try:
+            return self._get_xml_tree()
+        finally:
+            set_parse_timings(None)
+            self.profile.add("(parse)", sum(timings), len(timings))
+
+    def _get_xml_tree(self):
         for xml_with_pre in XMLWithPre.create(path=self.xml_file_path):
             return xml_with_pre.xmltree
 
@@ -174,24 +198,85 @@ class XMLDataChecker:
                     # Constrói e adiciona o caminho completo do arquivo
                     yield os.path.join(root, file)
 
-    def get_xml_files(self):
+    def get_xml_files(self, profile=False, trace_memory=False):
         for file_path in self.xmls:
             f = os.path.basename(file_path)
             try:
-                yield XMLFile(
+                xml_file = XMLFile(
                     file_path,
                     os.path.join(self.xml_csv_path, f + ".csv"),
                 )
+                if profile:
+                    xml_file.profile = DocumentProfile(trace_memory)
+                yield xml_file
             except Exception as e:
                 print(f"Unable to read {file_path} {e}")
 
-    def validate(self, params, csv_per_xml):
+    def get_validated_xml_files(
+        self, params, workers=None, ordered=False, chunksize=4, profile=False,
+        trace_memory=False,
+    ):
+        """
+        Valida os XML e os retorna à medida que ficam prontos
+
+        Args:
+            params (dict | RuleSet): regras de validação
+            workers (int): quantidade de processos; None ou 1 valida no
+                próprio processo
+            ordered (bool): retorna os XML na ordem de entrada, em vez da
+                ordem de conclusão
+            chunksize (int): quantidade de XML enviada a cada processo por vez
+            profile (bool): mede o tempo de cada grupo de validações e de
+                cada validação (check) dos grupos
+                (ver XMLFile.profile)
+            trace_memory (bool): mede também o pico de memória, com
+                tracemalloc, o que torna a validação mais lenta
+
+        Returns:
+            generator de XMLFile validados
+        """
+        xml_files = (
+            xml_file
+            for xml_file in self.get_xml_files(profile, trace_memory)
+            if xml_file
+        )
+        if not workers or workers <= 1:
+            for xml_file in xml_files:
+                yield _validate_xml_file(xml_file, params)
+            return
+
+        pool = multiprocessing.Pool(
+            workers, initializer=_init_worker, initargs=(params,)
+        )
+        try:
+            imap = pool.imap if ordered else pool.imap_unordered
+            yield from imap(_validate_xml_file, xml_files, chunksize)
+        finally:
+            # o generator pode ser abandonado antes do fim
+            pool.terminate()
+            pool.join()
+
+    def validate(
+        self, params, csv_per_xml, workers=None, ordered=False, profile=None,
+        trace_memory=False,
+    ):
+        """
+        profile (ValidationProfile): reúne as medidas de tempo de cada XML
+        """
+        # regras lidas uma unica vez e compartilhadas por todos os XML
+        params = get_ruleset(params)
         report = Report(self.csv_file_path, self.exception_json_file_path)
-        for xml_file in self.get_xml_files():
-            if not xml_file:
+        # somente este processo escreve os relatórios
+        for xml_file in self.get_validated_xml_files(
+            params, workers, ordered, profile=profile is not None,
+            trace_memory=trace_memory,
+        ):
+            if profile is not None and xml_file.profile:
+                profile.add(xml_file.profile)
+            if xml_file.error:
+                print(f"Unable to process {xml_file.xml_file_path} {xml_file.error}")
                 continue
             try:
-                xml_file.validate(params)
                 if csv_per_xml:
                     report.create_xml_report(xml_file.xml_csv_path, xml_file.cols, xml_file.results)
                 else:
@@ -205,11 +290,28 @@ class XMLDataChecker:
             print(f"Created {self.csv_file_path}")
 
 
+def _init_worker(params):
+    global _worker_params
+    _worker_params = get_ruleset(params)
+
+
+def _validate_xml_file(xml_file, params=None):
+    try:
+        xml_file.validate(params or _worker_params)
+    except Exception as e:
+        xml_file.error = e
+    return xml_file
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="XML data checker")
     parser.add_argument("xml_path", type=str, help="XML folder or file path")
     parser.add_argument("output_path", type=str, help="Ouput folder path")
     parser.add_argument("--csv_per_xml", dest='csv_per_xml', action='store_true', help="Create one csv per xml", default=False)
+    parser.add_argument("--workers", dest='workers', type=int, help="Number of processes which validate the XML files", default=1)
+    parser.add_argument("--ordered", dest='ordered', action='store_true', help="Write the results in the same order of the XML files", default=False)
+    parser.add_argument("--profile", dest='profile', action='store_true', help="Report the time spent by each validation group and check (p50/p95 across the XML files)", default=False)
+    parser.add_argument("--profile-memory", dest='profile_memory', action='store_true', help="With --profile, also report the memory peak of each group (slower)", default=False)
 
     args = parser.parse_args()
 
@@ -220,10 +322,23 @@ if __name__ == "__main__":
     prefix = datetime.now().isoformat().replace(" ", "").replace(":", "").replace(".", "")
     csv_file_path = os.path.join(args.output_path, f"{prefix}-errors.csv")
     exception_json_file_path = os.path.join(args.output_path, f"{prefix}-exceptions.jsonl")
+    profile_json_file_path = os.path.join(args.output_path, f"{prefix}-profile.json")
     xml_path = args.xml_path
+    profile = ValidationProfile() if args.profile or args.profile_memory else None
     try:
         validator = XMLDataChecker(csv_file_path, exception_json_file_path, xml_path)
-        validator.validate({}, csv_per_xml)
+        validator.validate(
+            {}, csv_per_xml, workers=args.workers, ordered=args.ordered,
+            profile=profile, trace_memory=args.profile_memory,
+        )
 
     except FileNotFoundError as e:
         sys.exit(e)
+
+    if profile is not None:
+        print(profile.format_table())
+        print()
+        print(profile.format_table(by_check=True))
+        with open(profile_json_file_path, "w") as fp:
+            fp.write(profile.to_json())
+        print(f"Created {profile_json_file_path}")
@@ -9,6 +9,7 @@ validation behaviour and packaging functionality, respectively.
 """
 from __future__ import unicode_literals
 import logging
+import hashlib
 from copy import deepcopy
 try:
     import reprlib
@@ -61,7 +62,9 @@ def StdSchematron(schema_name):
     """Returns an instance of `isoschematron.Schematron`.
 
     A standard schematron is one bundled with packtools.
-    The returned instance is cached due to performance reasons.
+    The returned instance is cached due to performance reasons, and its
+    validation XSLT is stored on disk to be reused by other processes (see
+    :func:`packtools.utils.get_schematron_from_cache`).
 
     :param schema_name: The logical name of schematron file in the package `catalog`.
     """
@@ -75,29 +78,62 @@ def StdSchematron(schema_name):
         except KeyError:
             raise ValueError('unrecognized schema: "%s"' % schema_name)
 
-        schematron = utils.get_schematron_from_filepath(schema_path)
+        schematron = utils.get_schematron_from_cache(schema_path)
         cache[schema_name] = schematron
         return schematron
 
 
+def StdDTD(public_id):
+    """Returns an instance of `etree.DTD`.
+
+    A standard DTD is one bundled with packtools, and is identified by the
+    PUBLIC ID in the XML catalog :data:`packtools.catalogs.XML_CATALOG`.
+    The returned instance is cached due to performance reasons, since the
+    JATS DTDs are comprised of many modules.
+
+    :param public_id: The PUBLIC ID of the DOCTYPE declaration.
+    """
+    cache = utils.setdefault(StdDTD, 'cache', lambda: {})
+    key = (public_id, catalogs.XML_CATALOG)
+
+    if key in cache:
+        return cache[key]
+    else:
+        dtd_path = utils.resolve_dtd_filepath(public_id, catalogs.XML_CATALOG)
+        dtd = etree.DTD(dtd_path)
+        cache[key] = dtd
+        return dtd
+
+
 def XSLT(xslt_name):
     """Returns an instance of `etree.XSLT`.
 
     The returned instance is cached due to performance reasons.
     """
+    return _get_xslt(xslt_name)[0]
+
+
+def _get_xslt(xslt_name):
+    """Returns the pair (`etree.XSLT`, hash of the XSLTs it was compiled from).
+
+    The hash (see :func:`packtools.utils.get_htmlgenerator_xslt_hash`) is
+    computed once, when the XSLT is compiled, so it always describes the XSLT
+    kept in the cache.
+    """
     cache = utils.setdefault(XSLT, 'cache', lambda: {})
 
     if xslt_name in cache:
         return cache[xslt_name]
     else:
         try:
-            xslt_doc = etree.parse(catalogs.HTML_GEN_XSLTS[xslt_name])
+            xslt_path = catalogs.HTML_GEN_XSLTS[xslt_name]
         except KeyError:
             raise ValueError('unrecognized xslt: "%s"' % xslt_name)
 
-        xslt = etree.XSLT(xslt_doc)
-        cache[xslt_name] = xslt
-        return xslt
+        xslt_digest = utils.get_htmlgenerator_xslt_hash()
+        xslt = etree.XSLT(etree.parse(xslt_path))
+        cache[xslt_name] = (xslt, xslt_digest)
+        return cache[xslt_name]
 
 
 #----------------------------------
@@ -130,6 +166,23 @@ class DTDValidator(object):
         self.dtd = dtd
         self.label = label
 
+    @classmethod
+    def from_catalog(cls, public_id):
+        """Get the shared instance for a DTD bundled with packtools.
+
+        The instances are cached, so the DTD is parsed once per process and
+        shared by all :class:`packtools.domain.XMLValidator` objects.
+
+        :param public_id: The PUBLIC ID of the DTD in
+                          :data:`packtools.catalogs.XML_CATALOG`.
+        """
+        cache = utils.setdefault(cls, 'cache', lambda: {})
+        key = (public_id, catalogs.XML_CATALOG)
+
+        if key not in cache:
+            cache[key] = cls(StdDTD(public_id))
+        return cache[key]
+
     def validate(self, xmlfile):
         """Validate xmlfile against the given DTD.
 
@@ -203,7 +256,9 @@ class XMLValidator(object):
 
     :param file: etree._ElementTree instance.
     :param sps_version: the version of the SPS that will be the basis for validation.
-    :param dtd: (optional) etree.DTD instance. If not provided, we try the external DTD.
+    :param dtd: (optional) etree.DTD instance. If not provided, we try the DTD
+                bundled with packtools for the PUBLIC ID (see
+                :meth:`DTDValidator.from_catalog`) and then the external DTD.
     :param style_validators: (optional) list of
                              :class:`packtools.domain.SchematronValidator`
                              objects.
@@ -214,11 +269,21 @@ class XMLValidator(object):
         self.lxml = file
         self.doctype = self.lxml.docinfo.doctype
 
-        self.dtd = dtd or self.lxml.docinfo.externalDTD
         self.source_url = self.lxml.docinfo.URL
         self.public_id = self.lxml.docinfo.public_id
         self.encoding = self.lxml.docinfo.encoding
 
+        self._std_dtd_validator = None
+        if dtd is None and self.public_id:
+            try:
+                self._std_dtd_validator = DTDValidator.from_catalog(
+                        self.public_id)
+            except ValueError:
+                LOGGER.info('no bundled DTD for "%s"', self.public_id)
+            else:
+                dtd = self._std_dtd_validator.dtd
+        self.dtd = dtd or self.lxml.docinfo.externalDTD
+
         if style_validators:
             self.style_validators = list(style_validators)
         else:
@@ -226,7 +291,8 @@ class XMLValidator(object):
 
     @classmethod
     def parse(cls, file, no_doctype=False, sps_version=None,
-            supported_sps_versions=None, extra_sch_schemas=None, **kwargs):
+            supported_sps_versions=None, extra_sch_schemas=None,
+            load_dtd=True, **kwargs):
         """Factory of XMLValidator instances.
 
         If `file` is not an etree instance, it will be parsed using
@@ -248,9 +314,12 @@ class XMLValidator(object):
         :param supported_sps_versions: (optional) list of supported versions. the
                only way to bypass this restriction is by using the arg `sps_version`.
         :param extra_sch_schemas: (optional) list of extra Schematron schemas.
+        :param load_dtd: (optional) load the DTD while parsing `file`. The DTD
+               is not needed for validation if it is bundled with packtools,
+               only to expand the entities it declares.
         """
         try:
-            et = utils.XML(file)
+            et = utils.XML(file, load_dtd=load_dtd)
         except TypeError:
             # We hope it is an instance of etree.ElementTree. If it is not,
             # it will fail in the next lines.
@@ -300,10 +369,13 @@ class XMLValidator(object):
 
     @property
     def dtd_validator(self):
-        if self.dtd:
-            return DTDValidator(self.dtd)
-        else:
+        if not self.dtd:
             return None
+        elif (self._std_dtd_validator is not None and
+                self._std_dtd_validator.dtd is self.dtd):
+            return self._std_dtd_validator
+        else:
+            return DTDValidator(self.dtd)
 
     @utils.cachedmethod
     def validate(self):
@@ -366,18 +438,40 @@ class XMLValidator(object):
 
         :param element: etree instance to be annotated.
         :param error: string of the error.
+        :returns: the comment added.
         """
-        notice_element = etree.Element('SPS-ERROR')
-        notice_element.text = error
-        element.addprevious(
-            etree.Comment(
+        notice = etree.Comment(
                 ' SPS-ERROR: %s ' % error.replace("--", "- -"))
-        )
+        element.addprevious(notice)
+        return notice
+
+    def _get_error_elements(self, errors, doc):
+        """Pairs of the apparent element of each error at `doc` and its message.
+        """
+        err_pairs = []
+        # DTD errors are located by their line, which is indexed only once
+        elements_by_line = None
+        for error in errors:
+            try:
+                if isinstance(error, style_errors.SchemaStyleError):
+                    if elements_by_line is None:
+                        elements_by_line = style_errors.get_elements_by_line(doc)
+                    err_element = error.get_apparent_element(
+                            doc, elements_by_line)
+                else:
+                    err_element = error.get_apparent_element(doc)
+            except ValueError:
+                err_element = doc.getroot()
+
+            err_pairs.append((err_element, error.message))
+        return err_pairs
 
     def annotate_errors(self, fail_fast=False):
         """Add notes on all elements that have errors.
 
         The errors list is generated as the result of calling :meth:`validate_all`.
+        The notes are added to a copy of the XML, which is returned. To write
+        the annotated XML without copying it, see :meth:`write_annotated_errors`.
         """
         status, errors = self.validate_all(fail_fast=fail_fast)
         mutating_xml = deepcopy(self.lxml)
@@ -385,20 +479,63 @@ class XMLValidator(object):
         if status is True:
             return mutating_xml
 
-        err_pairs = []
-        for error in errors:
-            try:
-                err_element = error.get_apparent_element(mutating_xml)
-            except ValueError:
-                err_element = mutating_xml.getroot()
-
-            err_pairs.append((err_element, error.message))
-
-        for el, em in err_pairs:
+        for el, em in self._get_error_elements(errors, mutating_xml):
             self._annotate_error(el, em)
 
         return mutating_xml
 
+    def write_annotated_errors(self, file, fail_fast=False, encoding='utf-8',
+            pretty_print=True, xml_declaration=True):
+        """Write the XML to `file` with notes on all elements that have errors.
+
+        For XMLs parsed with their DTD (the default of :meth:`parse`), the
+        XML is written as :func:`lxml.etree.tostring` writes the copy
+        returned by :meth:`annotate_errors` once validated, i.e., without the
+        DOCTYPE. But the XML is not copied: the notes are added to the XML
+        only while it is written to `file`, and the results of
+        :meth:`validate_all` are reused. Therefore, the XML must not be
+        accessed by other threads meanwhile.
+
+        :param file: filename or file-like object opened in binary mode.
+        """
+        status, errors = self.validate_all(fail_fast=fail_fast)
+
+        notices = []
+        try:
+            if status is not True:
+                for el, em in self._get_error_elements(errors, self.lxml):
+                    notices.append(self._annotate_error(el, em))
+
+            if isinstance(file, str):
+                with open(file, 'wb') as fp:
+                    self._write_xml(fp, encoding, pretty_print, xml_declaration)
+            else:
+                self._write_xml(file, encoding, pretty_print, xml_declaration)
+        finally:
+            # moving the notes to another element removes them from the XML
+            # without changing the surrounding text
+            removed = etree.Element('SPS-ERRORS')
+            for notice in notices:
+                removed.append(notice)
+
+    def _write_xml(self, file, encoding, pretty_print, xml_declaration):
+        """Write the XML to `file` as :func:`lxml.etree.tostring` writes a
+        copy of it, i.e., the DOCTYPE is not written and the XML declaration
+        keeps `encoding` as given.
+        """
+        if xml_declaration:
+            file.write(("<?xml version='1.0' encoding='%s'?>\n" % encoding
+                    ).encode(encoding))
+
+        root = self.lxml.getroot()
+        nodes = list(root.itersiblings(preceding=True))[::-1]
+        nodes.append(root)
+        nodes.extend(root.itersiblings())
+        for node in nodes:
+            file.write(etree.tostring(node, encoding=encoding,
+                    pretty_print=pretty_print, xml_declaration=False,
+                    with_tail=False))
+
     def __repr__(self):
         arg_names = [u'lxml', u'sps_version', u'dtd']
         arg_values = [reprlib.repr(getattr(self, arg)) for arg in arg_names]
@@ -468,6 +605,9 @@ class HTMLGenerator(object):
     :param file: etree._ElementTree instance.
     :param xslt: (optional) etree.XSLT instance. If not provided, the default XSLT is used.
     :param css: (optional) URI for a CSS file.
+    :param render_cache: (optional) cache of the HTMLs serialized by :meth:`render`,
+        such as :class:`packtools.utils.HTMLRenderCache` or
+        :class:`packtools.utils.MemoryHTMLRenderCache`.
     """
     def __init__(self, file, xslt=None, css=None, print_css=None, js=None,
                  math_elem_preference=None, math_js=None,
@@ -476,13 +616,12 @@ class HTMLGenerator(object):
                  bootstrap_css=None, article_css=None,
                  design_system_static_img_path=None,
                  crossmark_policy_page=None,
+                 render_cache=None,
                  ):
         assert isinstance(file, etree._ElementTree)
         self.lxml = file
-        self.xslt = (
-            xslt and XSLT(f'root-html-{xslt}.xslt') or
-            XSLT('root-html-2.0.xslt')
-        )
+        self.xslt_name = xslt and f'root-html-{xslt}.xslt' or 'root-html-2.0.xslt'
+        self.xslt, self.xslt_digest = _get_xslt(self.xslt_name)
         self.css = css
         self.print_css = print_css
         self.js = js
@@ -500,6 +639,7 @@ class HTMLGenerator(object):
         self.design_system_static_img_path = design_system_static_img_path
 
         self.crossmark_policy_page = crossmark_policy_page
+        self.render_cache = render_cache
 
     @classmethod
     def parse(cls, file, valid_only=True, **kwargs):
@@ -584,52 +724,101 @@ class HTMLGenerator(object):
 
         return ' '.join([part for part in parts if part])
 
+    @property
+    def output_languages(self):
+        """The languages in which the HTML is generated: the abstract
+        languages if ``gs_abstract``, otherwise the document languages.
+        """
+        if self.gs_abstract:
+            return self.abstract_languages
+        return self.languages
+
     def __iter__(self):
         """Iterates thru all languages and generates the HTML for each one.
         """
-        if self.gs_abstract:
-            languages = self.abstract_languages
-        else:
-            languages = self.languages
-        for lang in languages:
+        for lang in self.output_languages:
             res_html = self.generate(lang)
             yield lang, res_html
 
-    def generate(self, lang):
-        """Generates the HTML in the language ``lang``.
-
-        :param lang: 2-digit ISO 639-1 text string.
+    def _get_params(self, lang):
+        """Returns the XSLT parameters to generate the HTML in ``lang``.
         """
         main_language = self.language
         if main_language is None:
             raise exceptions.HTMLGenerationError('main document language is '
                                                  'undefined.')
 
-        expected_langs = self.languages
-        if self.gs_abstract:
-            expected_langs = self.abstract_languages
+        expected_langs = self.output_languages
         if lang not in expected_langs:
             raise ValueError('unrecognized language: "%s"' % lang)
 
         is_translation = lang != main_language
+        return {
+            'article_lang': lang,
+            'is_translation': str(is_translation),
+            'bibliographic_legend': self._get_bibliographic_legend(),
+            'issue_label': self._get_issue_label(),
+            'styles_css_path': self.css or '',
+            'print_styles_css_path': self.print_css or '',
+            'article_css_path': self.article_css or '',
+            'bootstrap_css_path': self.bootstrap_css or '',
+            'js_path': self.js or '',
+            'permlink': self.permlink or '',
+            'url_article_page': self.url_article_page or '',
+            'url_download_ris': self.url_download_ris or '',
+            'gs_abstract_lang': self.gs_abstract and lang or '',
+            'output_style': self.output_style or '',
+            'math_elem_preference': self.math_elem_preference or '',
+            'math_js': self.math_js or '',
+            'design_system_static_img_path': self.design_system_static_img_path or '',
+            'crossmark_policy_page': self.crossmark_policy_page or '',
+        }
+
+    def generate(self, lang):
+        """Generates the HTML in the language ``lang``.
+
+        :param lang: 2-digit ISO 639-1 text string.
+        """
+        return self._transform(self._get_params(lang))
+
+    def _transform(self, params):
         return self.xslt(
-                self.lxml,
-                article_lang=etree.XSLT.strparam(lang),
-                is_translation=etree.XSLT.strparam(str(is_translation)),
-                bibliographic_legend=etree.XSLT.strparam(self._get_bibliographic_legend()),
-                issue_label=etree.XSLT.strparam(self._get_issue_label()),
-                styles_css_path=etree.XSLT.strparam(self.css or ''),
-                print_styles_css_path=etree.XSLT.strparam(self.print_css or ''),
-                article_css_path=etree.XSLT.strparam(self.article_css or ''),
-                bootstrap_css_path=etree.XSLT.strparam(self.bootstrap_css or ''),
-                js_path=etree.XSLT.strparam(self.js or ''),
-                permlink=etree.XSLT.strparam(self.permlink or ''),
-                url_article_page=etree.XSLT.strparam(self.url_article_page or ''),
-                url_download_ris=etree.XSLT.strparam(self.url_download_ris or ''),
-                gs_abstract_lang=etree.XSLT.strparam(self.gs_abstract and lang or ''),
-                output_style=etree.XSLT.strparam(self.output_style or ''),
-                math_elem_preference=etree.XSLT.strparam(self.math_elem_preference or ''),
-                math_js=etree.XSLT.strparam(self.math_js or ''),
-                design_system_static_img_path=etree.XSLT.strparam(self.design_system_static_img_path or ''),
-                crossmark_policy_page=etree.XSLT.strparam(self.crossmark_policy_page or ''),
+            self.lxml,
+            **{name: etree.XSLT.strparam(value) for name, value in params.items()}
         )
+
+    @utils.cachedmethod
+    def _get_xml_digest(self):
+        return hashlib.sha256(etree.tostring(self.lxml, encoding='utf-8')).hexdigest()
+
+    def render(self, lang, doctype=u"<!DOCTYPE html>"):
+        """Generates the HTML in the language ``lang`` serialized as bytes.
+
+        If ``render_cache`` was given, an HTML previously rendered for the same
+        XML, XSLT, language and parameters is returned from it.
+
+        :param lang: 2-digit ISO 639-1 text string.
+        :param doctype: (optional) doctype written before the HTML; if ``None``,
+            the HTML is serialized as the XSLT declares (``xsl:output``), the
+            same as ``str()`` of the result of :meth:`generate`.
+        """
+        if self.render_cache is None:
+            return self._serialize(self.generate(lang), doctype)
+
+        params = self._get_params(lang)
+        key = self.render_cache.get_key(
+            self._get_xml_digest(), self.xslt_digest, lang,
+            [('xslt', self.xslt_name), ('doctype', doctype)] +
+            list(params.items()))
+        html = self.render_cache.get(key)
+        if html is None:
+            html = self._serialize(self._transform(params), doctype)
+            self.render_cache.set(key, html)
+        return html
+
+    @staticmethod
+    def _serialize(html, doctype):
+        if doctype is None:
+            return bytes(html)
+        return etree.tostring(html, pretty_print=True, encoding='utf-8',
+                              method='html', doctype=doctype)
@@ -4,6 +4,7 @@ import argparse
 import sys
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from lxml import etree
 
@@ -20,8 +21,33 @@ class XMLError(Exception):
     """
 
 
-def get_htmlgenerator(
-    xmlpath, no_network, no_checks, css, print_css, js,
+def parse_xml(xmlpath, no_network, no_checks):
+    """Parses ``xmlpath`` and, unless ``no_checks``, validates it against
+    SciELO PS.
+
+    The returned etree may be used to create as many HTMLGenerator instances
+    (see :func:`create_htmlgenerator`) as needed.
+    """
+    try:
+        parsed_xml = packtools.XML(xmlpath, no_network=no_network)
+    except IOError as e:
+        raise XMLError('Error reading %s. Make sure it is a valid file-path or URL.' % xmlpath)
+    except etree.XMLSyntaxError as e:
+        raise XMLError('Error reading %s. Syntax error: %s' % (xmlpath, e))
+
+    if not no_checks:
+        try:
+            is_valid, _ = packtools.XMLValidator.parse(parsed_xml).validate_all()
+        except ValueError as e:
+            raise XMLError('Error reading %s. %s.' % (xmlpath, e))
+        if not is_valid:
+            raise XMLError('Error reading %s. invalid XML.' % xmlpath)
+
+    return parsed_xml
+
+
+def create_htmlgenerator(
+    parsed_xml, css, print_css, js,
     math_elem_preference, math_js,
     permlink,
     url_article_page, url_download_ris,
@@ -31,8 +57,11 @@ def get_htmlgenerator(
     bootstrap_css,
     article_css,
     design_system_static_img_path,
+    render_cache=None,
 ):
-
+    """Creates the HTMLGenerator of ``parsed_xml`` (see :func:`parse_xml`)
+    for the XSLT version ``xslt``.
+    """
     if xslt == "3.0":
         if bootstrap_css and article_css and os.path.isfile(css):
             css = os.path.dirname(css)
@@ -45,16 +74,8 @@ def get_htmlgenerator(
             )
 
     try:
-        parsed_xml = packtools.XML(xmlpath, no_network=no_network)
-    except IOError as e:
-        raise XMLError('Error reading %s. Make sure it is a valid file-path or URL.' % xmlpath)
-    except etree.XMLSyntaxError as e:
-        raise XMLError('Error reading %s. Syntax error: %s' % (xmlpath, e))
-
-    try:
-        valid_only = not no_checks
         generator = packtools.HTMLGenerator.parse(
-            parsed_xml, valid_only=valid_only, css=css,
+            parsed_xml, valid_only=False, css=css,
             print_css=print_css, js=js,
             math_elem_preference=math_elem_preference, math_js=math_js,
             permlink=permlink,
@@ -66,14 +87,41 @@ def get_htmlgenerator(
             bootstrap_css=bootstrap_css,
             article_css=article_css,
             design_system_static_img_path=design_system_static_img_path,
+            render_cache=render_cache,
             )
     except ValueError as e:
-        raise XMLError('Error reading %s. %s.' % (xmlpath, e))
+        raise XMLError('Error reading %s. %s.' % (parsed_xml.docinfo.URL, e))
 
     return generator
 
 
-@packtools.utils.config_xml_catalog
+def get_htmlgenerator(
+    xmlpath, no_network, no_checks, css, print_css, js,
+    math_elem_preference, math_js,
+    permlink,
+    url_article_page, url_download_ris,
+    gs_abstract,
+    output_style,
+    xslt,
+    bootstrap_css,
+    article_css,
+    design_system_static_img_path,
+):
+    parsed_xml = parse_xml(xmlpath, no_network, no_checks)
+    return create_htmlgenerator(
+        parsed_xml, css, print_css, js,
+        math_elem_preference, math_js,
+        permlink,
+        url_article_page, url_download_ris,
+        gs_abstract,
+        output_style,
+        xslt,
+        bootstrap_css,
+        article_css,
+        design_system_static_img_path,
+    )
+
+
 def main():
 
     packtools_version = get_version('packtools')
@@ -118,6 +166,18 @@ def main():
                         help='URL to download RIS file (how to cite this article)')
     parser.add_argument('XML', nargs='+',
                         help='filesystem path or URL to the XML')
+    parser.add_argument('--jobs', default=1, type=int,
+                        help='number of threads used to render the HTMLs')
+    parser.add_argument('--cache', action='store_true',
+                        help='reuse the HTMLs rendered before for the same XML, '
+                             'XSLT and parameters')
+    parser.add_argument('--cachedir',
+                        help='directory of the HTMLs cache (implies --cache). '
+                             'defaults to the PACKTOOLS_CACHE_DIR environment '
+                             'variable or to the user cache directory.')
+    parser.add_argument('--cachesize', type=int,
+                        help='maximum size of the HTMLs cache in MiB. '
+                             'defaults to 1024')
     parser.add_argument('--version', action='version', version=packtools_version)
     parser.add_argument('--loglevel', default='WARNING')
     args = parser.parse_args()
@@ -130,59 +190,136 @@ def main():
         xslt_versions = [args.xslt]
     else:
         xslt_versions = ["2.0", "3.0"]
-    for xml in packtools.utils.flatten(args.XML):
-        LOGGER.info('starting generation of %s' % (xml,))
+    render_cache = None
+    if args.cache or args.cachedir:
+        render_cache = packtools.utils.HTMLRenderCache(
+            args.cachedir, args.cachesize and args.cachesize * 1024 * 1024)
 
-        for xslt_version in xslt_versions:
-            generate_html_files(args, xslt_version, xml)
+    executor = None
+    if args.jobs > 1:
+        executor = ThreadPoolExecutor(max_workers=args.jobs)
+    try:
+        for xml in packtools.utils.flatten(args.XML):
+            LOGGER.info('starting generation of %s' % (xml,))
 
-        LOGGER.info('finished generating %s' % (xml,))
+            render_html_files(args, xslt_versions, xml, executor, render_cache)
 
+            LOGGER.info('finished generating %s' % (xml,))
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-def generate_html_files(config, xslt_version, xml):
-    try:
-        html_generator = get_htmlgenerator(
-            xml, config.nonetwork, config.nochecks,
-            config.css, config.print_css, config.js,
-            config.math_elem_preference, config.math_js,
-            config.permlink, config.url_article_page, config.url_download_ris,
-            config.gs_abstract,
-            config.output_style,
+
+def get_htmlgenerators(config, xslt_versions, xml, render_cache=None):
+    """Returns the HTMLGenerator of ``xml`` for each one of ``xslt_versions``,
+    as ``(xslt_version, html_generator)`` pairs.
+
+    ``xml`` is parsed and validated only once.
+    """
+    parsed_xml = parse_xml(xml, config.nonetwork, config.nochecks)
+    return [
+        (
             xslt_version,
-            config.bootstrap_css,
-            config.article_css,
-            config.design_system_static_img_path,
+            create_htmlgenerator(
+                parsed_xml,
+                config.css, config.print_css, config.js,
+                config.math_elem_preference, config.math_js,
+                config.permlink, config.url_article_page, config.url_download_ris,
+                config.gs_abstract,
+                config.output_style,
+                xslt_version,
+                config.bootstrap_css,
+                config.article_css,
+                config.design_system_static_img_path,
+                render_cache,
+            ),
         )
-        LOGGER.debug('HTMLGenerator repr: %s' % repr(html_generator))
+        for xslt_version in xslt_versions
+    ]
+
+
+def get_html_file_path(xml, lang, xslt_version, gs_abstract):
+    abstract_suffix = gs_abstract and '.abstract' or ''
+    version = xslt_version.replace(".", "_")
+    # nome do arquivo a ser criado
+    fname, fext = xml.rsplit('.', 1)
+    if xslt_version == "2.0":
+        name_parts = [fname, lang + abstract_suffix, 'html']
+    else:
+        name_parts = [fname, lang + abstract_suffix, version, 'html']
+    return '.'.join(name_parts)
+
+
+def render_html(html_generator, lang):
+    """Returns the HTML of ``html_generator`` in the language ``lang``,
+    serialized.
+    """
+    return html_generator.render(lang)
+
+
+def render_html_files(config, xslt_versions, xml, executor=None,
+                      render_cache=None):
+    """Generates the HTML files of ``xml`` for each one of ``xslt_versions``
+    and each one of its languages.
+
+    ``xml`` is parsed and validated only once. If ``executor`` (a
+    ``concurrent.futures.ThreadPoolExecutor``) is given, the HTMLs are
+    rendered concurrently, as lxml releases the GIL while running XSLT. Each
+    file is written as soon as its HTML is rendered.
+
+    HTMLs found in ``render_cache`` (see
+    :class:`packtools.utils.HTMLRenderCache`) are not rendered again.
+    """
+    try:
+        html_generators = get_htmlgenerators(
+            config, xslt_versions, xml, render_cache)
     except XMLError as e:
         LOGGER.debug(e)
         LOGGER.warning('Error generating %s. Skipping. Run with DEBUG for more info.', xml)
         return
 
+    renderings = []
+    for xslt_version, html_generator in html_generators:
+        LOGGER.debug('HTMLGenerator repr: %s' % repr(html_generator))
+        for lang in html_generator.output_languages:
+            renderings.append((xslt_version, lang, html_generator))
+
+    futures = {}
+    if executor is None:
+        rendered_htmls = (
+            ((xslt_version, lang), render_html(html_generator, lang))
+            for xslt_version, lang, html_generator in renderings
+        )
+    else:
+        for xslt_version, lang, html_generator in renderings:
+            future = executor.submit(render_html, html_generator, lang)
+            futures[future] = (xslt_version, lang)
+        rendered_htmls = (
+            (futures[future], future.result())
+            for future in as_completed(futures)
+        )
+
     try:
-        abstract_suffix = config.gs_abstract and '.abstract' or ''
-        version = xslt_version.replace(".", "_")
-        for lang, trans_result in html_generator:
-            # nome do arquivo a ser criado
-            fname, fext = xml.rsplit('.', 1)
-            if xslt_version == "2.0":
-                name_parts = [fname, lang + abstract_suffix, 'html']
-            else:
-                name_parts = [fname, lang + abstract_suffix, version, 'html']
-            out_fname = '.'.join(name_parts)
+        for (xslt_version, lang), html in rendered_htmls:
+            out_fname = get_html_file_path(
+                xml, lang, xslt_version, config.gs_abstract)
 
             # criação do arquivo
             with open(out_fname, 'wb') as fp:
-                fp.write(etree.tostring(trans_result, pretty_print=True,
-                                        encoding='utf-8', method='html',
-                                        doctype=u"<!DOCTYPE html>"))
+                fp.write(html)
 
             print('Generated HTML file:', out_fname)
     except TypeError as e:
+        for future in futures:
+            future.cancel()
         LOGGER.debug(e)
         LOGGER.warning('Error generating %s. Skipping. Run with DEBUG for more info.', xml)
         return
 
 
+def generate_html_files(config, xslt_version, xml):
+    render_html_files(config, [xslt_version], xml)
+
+
 if __name__ == '__main__':
     main()
@@ -11,7 +11,6 @@ from packtools.pkg_resources_fixer import get_version
 LOGGER = logging.getLogger(__name__)
 
 
-@packtools.utils.config_xml_catalog
 def main():
 
     packtools_version = get_version("packtools")
@@ -31,6 +30,30 @@ def main():
         action='store_true',
         help='stop execution if an error occurs',
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='number of processes optimising images',
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='reuse the web images and thumbnails produced from the same images '
+             'in previous executions',
+    )
+    parser.add_argument(
+        '--cachedir',
+        default=None,
+        help='directory of the images cache (implies --cache). defaults to the '
+             'PACKTOOLS_CACHE_DIR environment variable or to the user cache directory.',
+    )
+    parser.add_argument(
+        '--cachesize',
+        type=int,
+        default=None,
+        help='maximum size of the images cache in MiB. defaults to 1024',
+    )
     parser.add_argument("--version", action="version", version=packtools_version)
     parser.add_argument("--loglevel", default="WARNING")
     args = parser.parse_args()
@@ -44,13 +67,22 @@ def main():
     else:
         new_package_file_path = os.path.splitext(args.SPPackage)[0] + "_optimised.zip"
 
+    image_cache = None
+    if args.cache or args.cachedir:
+        image_cache = packtools.utils.ImageDerivativeCache(
+            args.cachedir, args.cachesize and args.cachesize * 1024 * 1024
+        )
+
     package = packtools.SPPackage.from_file(
         args.SPPackage,
         os.path.splitext(args.SPPackage)[0],
         stop_if_error=args.stopiferror,
+        image_cache=image_cache,
     )
     package.optimise(
-        new_package_file_path=new_package_file_path, preserve_files=args.preservefiles
+        new_package_file_path=new_package_file_path,
+        preserve_files=args.preservefiles,
+        jobs=args.jobs,
     )
 
 
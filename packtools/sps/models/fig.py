@@ -170,7 +170,7 @@ class Fig:
 
 
 class Figs:
-    def __init__(self, node):
+    def __init__(self, node, index=None):
         """
         Initializes the Figs class with an XML node.
 
@@ -178,20 +178,28 @@ class Figs:
         node : lxml.etree._Element
             The XML node (element) that contains one or more <fig> elements.
             This can be the root of an `xml_tree` or a node representing a `sub-article`.
+        index : ArticleIndex, optional
+            Index of the document of node, used instead of XPath queries
         """
         self.node = node
+        self.index = index
         self.parent = self.node.tag
         self.parent_id = self.node.get("id")
         self.lang = self.node.get("{http://www.w3.org/XML/1998/namespace}lang")
         self.article_type = self.node.get("article-type")
 
-    def figs(self):
+    def _nodes(self):
+        fulltext = self.index and self.index.get_fulltext(self.node)
         if self.parent == "article":
-            path = "./front//fig | ./body//fig | ./back//fig"
-        else:
-            path = ".//fig"
+            if fulltext is not None:
+                return self.index.section_descendants("fig", fulltext)
+            return self.node.xpath("./front//fig | ./body//fig | ./back//fig")
+        if fulltext is not None:
+            return self.index.descendants("fig", fulltext)
+        return self.node.xpath(".//fig")
 
-        for fig in self.node.xpath(path):
+    def figs(self):
+        for fig in self._nodes():
             data = Fig(fig).data
             yield put_parent_context(data, self.lang, self.article_type, self.parent, self.parent_id)
 
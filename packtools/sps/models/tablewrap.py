@@ -181,7 +181,7 @@ class TableWrap:
 
 
 class TableWrappers:
-    def __init__(self, node):
+    def __init__(self, node, index=None):
         """
         Initializes the TableWrappers class with an XML node.
 
@@ -189,20 +189,28 @@ class TableWrappers:
         node : lxml.etree._Element
             The XML node (element) that contains one or more <table-wrap> elements.
             This can be the root of an `xml_tree` or a node representing a `sub-article`.
+        index : ArticleIndex, optional
+            Index of the document of node, used instead of XPath queries
         """
         self.node = node
+        self.index = index
         self.parent = self.node.tag
         self.parent_id = self.node.get("id")
         self.lang = self.node.get("{http://www.w3.org/XML/1998/namespace}lang")
         self.article_type = self.node.get("article-type")
 
-    def table_wrappers(self):
+    def _nodes(self):
+        fulltext = self.index and self.index.get_fulltext(self.node)
         if self.parent == "article":
-            path = "./front//table-wrap | ./body//table-wrap | ./back//table-wrap"
-        else:
-            path = ".//table-wrap"
+            if fulltext is not None:
+                return self.index.section_descendants("table-wrap", fulltext)
+            return self.node.xpath("./front//table-wrap | ./body//table-wrap | ./back//table-wrap")
+        if fulltext is not None:
+            return self.index.descendants("table-wrap", fulltext)
+        return self.node.xpath(".//table-wrap")
 
-        for table in self.node.xpath(path):
+    def table_wrappers(self):
+        for table in self._nodes():
             data = TableWrap(table).data
             yield put_parent_context(
                 data, self.lang, self.article_type, self.parent, self.parent_id
@@ -1,3 +1,7 @@
+import functools
+import re
+from html.entities import html5
+
 NAME_TO_NUMBER_ENTITIES = {
     "&rquo;": "'",
     "&lquo;": "'",
@@ -396,34 +400,87 @@ NAME_TO_NUMBER_ENTITIES = {
 }
 
 
-def fix_pre_loading(xml):
-    """Corrige entidades problemáticas no XML de entrada."""
-    if "&" not in xml:
-        return xml
+# entidades predefinidas do XML, que são mantidas
+XML_ENTITIES = ("amp", "lt", "gt", "quot", "apos")
 
-    entities = set(find_entities_to_fix(xml))
-    if not entities:
-        return xml
+# "&nome;", "&#123;", "&#x7B;" ou "&" que não inicia uma referência
+ENTITY_REFERENCE = re.compile(r"&(?:(?P<name>\w+);|(?P<number>#(?:\d+|[xX][0-9a-fA-F]+);))?")
 
-    for ent in entities:
-        xml = xml.replace(ent, NAME_TO_NUMBER_ENTITIES.get(ent) or f"&amp;{ent}")
+# seções CDATA e comentários, cujo conteúdo não é interpretado pelo parser
+UNPARSED_SECTION = re.compile(r"<!(?:\[CDATA\[.*?\]\]>|--.*?-->)", re.DOTALL)
 
-    return xml
 
+@functools.lru_cache(maxsize=None)
+def get_entities_table():
+    """
+    Retorna o nome das entidades e seus valores como referências numéricas.
+
+    Reúne as entidades do HTML5 e as de ``NAME_TO_NUMBER_ENTITIES``, que
+    prevalecem; as entidades predefinidas do XML são mantidas.
+    """
+    table = {}
+    for name, chars in html5.items():
+        if name.endswith(";"):
+            table[name[:-1]] = "".join(f"&#{ord(char)};" for char in chars)
+    for entity, value in NAME_TO_NUMBER_ENTITIES.items():
+        table[entity[1:-1]] = value
+    for name in XML_ENTITIES:
+        table[name] = f"&{name};"
+    return table
+
+
+def _fix_entity_reference(match):
+    name = match.group("name")
+    if name is None:
+        if match.group("number"):
+            return match.group()
+        return "&amp;"
+    return get_entities_table().get(name) or f"&amp;{name};"
 
-def find_entities_to_fix(bkp):
-    """Identifica entidades que precisam ser corrigidas na entrada."""
-    bkp = bkp.replace("&", "<ISOLAENTIDADEXML>&")
-    bkp = bkp.replace(";", ";<ISOLAENTIDADEXML>")
 
-    for item in bkp.split("<ISOLAENTIDADEXML>"):
-        if not item.strip():
-            continue
-        if item[0] == "&" and item[-1] == ";":
-            if item in ("&amp;", "&gt;", "&apos;", "&quot;", "&lt;"):
-                continue
-            if item[1:-1].isalpha():
-                yield item
+def _split_unparsed_sections(xml):
+    """
+    Retorna os trechos de xml, alternando texto e seções CDATA ou comentários,
+    estes nas posições ímpares.
+    """
+    if "<!" not in xml:
+        return [xml]
+    parts = []
+    start = 0
+    for match in UNPARSED_SECTION.finditer(xml):
+        parts.append(xml[start:match.start()])
+        parts.append(match.group())
+        start = match.end()
+    parts.append(xml[start:])
+    return parts
+
+
+def fix_pre_loading(xml):
+    """
+    Corrige entidades problemáticas no XML de entrada, percorrendo-o uma vez.
+
+    - entidades HTML (``&eacute;``) são convertidas em referências numéricas;
+    - as entidades predefinidas do XML e as referências numéricas são mantidas;
+    - entidades desconhecidas e ``&`` isolado têm o ``&`` escapado
+      (``&amp;desconhecida;``);
+    - o conteúdo de seções CDATA e de comentários não é alterado.
+    """
+    if "&" not in xml:
+        return xml
+    parts = _split_unparsed_sections(xml)
+    parts[::2] = [
+        ENTITY_REFERENCE.sub(_fix_entity_reference, text) for text in parts[::2]
+    ]
+    return "".join(parts)
+
+
+def find_entities_to_fix(xml):
+    """Identifica entidades que precisam ser corrigidas na entrada."""
+    for text in _split_unparsed_sections(xml)[::2]:
+        for match in ENTITY_REFERENCE.finditer(text):
+            name = match.group("name")
+            if name and name not in XML_ENTITIES:
+                yield match.group()
 
 
 # Exemplo de uso:
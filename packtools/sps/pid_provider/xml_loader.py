@@ -1,14 +1,14 @@
 import html
 import logging
 from lxml import etree
-from bs4 import BeautifulSoup
 from packtools.sps.pid_provider.amp_name2number import fix_pos_loading
 from packtools.sps.pid_provider.name2number import fix_pre_loading
 
 
 def load_xml(xml):
     """
-    Carrega e processa XML, corrigindo entidades na entrada.
+    Carrega e processa XML, corrigindo entidades na entrada (ver
+    ``name2number.fix_pre_loading``).
 
     Análise:
     - sucesso
@@ -183,6 +183,8 @@ def bs_ent2char_(xml):
        - Mantém entidades problemáticas como &amp;lquo; e &amp;rquo;
        - Mais compatível mas adiciona estrutura HTML5
     """
+    from bs4 import BeautifulSoup
+
     parsers = [
         ("xml", "Alias para lxml-xml"),
         ("lxml", "Parser HTML com lxml, rápido"),
@@ -231,6 +233,8 @@ def bs_ent2char(xml):
     - Entidades &lquo; e &rquo; não são reconhecidas e perdem o ;
     - Tag <break/> é convertida para <break></break>
     """
+    from bs4 import BeautifulSoup
+
     soup_xml = BeautifulSoup(xml, "lxml")
     return str(soup_xml)
 
@@ -1,3 +1,4 @@
+import codecs
 import hashlib
 import logging
 import os
@@ -12,7 +13,9 @@ from zlib import crc32
 
 from lxml import etree
 
+from packtools.lib.file_utils import DEFAULT_COMPRESSION_POLICY, copy_zip_member
 from packtools.sps.libs.requester import fetch_data
+from packtools.utils import parse_bytes
 from packtools.sps.pid_provider.name2number import fix_pre_loading
 # 4.7.1 packtools.sps.models.*
 from packtools.sps.pid_provider.models.article_assets import ArticleAssets
@@ -35,6 +38,12 @@ from packtools.sps.pid_provider.models.related_articles import RelatedItems
 LOGGER = logging.getLogger(__name__)
 LOGGER_FMT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 
+FINGER_PRINT_CHUNK_SIZE = 64 * 1024
+# comentário serializado e o texto que o segue (tail)
+SERIALIZED_COMMENT_AND_TAIL = re.compile(r"<!--.*?-->[^<]*", re.DOTALL)
+# elemento serializado sem conteúdo, como <tag></tag>
+SERIALIZED_EMPTY_ELEMENT = re.compile(r"<([^\s/>!?]+)([^<>]*)></\1>")
+
 
 class XMLWithPreMissingISSNError(Exception): ...
 
@@ -108,48 +117,115 @@ def get_xml_with_pre_from_xml_file(xml_sps_file_path):
         }
 
 
-def get_xml_with_pre_from_zip_file(xml_sps_file_path):
+def iter_xml_items(xml_sps_file_path):
+    """
+    Get XML items from XML file or Zip file, on demand
+
+    Same as get_xml_items, but each XML of a zip file is read and loaded
+    only when its item is consumed
+
+    Arguments
+    ---------
+        xml_sps_file_path: str
+
+    Return
+    ------
+    dict iterator which keys are filename and xml_with_pre
+
+    Raises
+    ------
+    GetXMLItemsError
+    """
+    name, ext = os.path.splitext(xml_sps_file_path)
+    if ext != ".zip":
+        yield from get_xml_items(xml_sps_file_path)
+        return
+    try:
+        yield from iter_xml_with_pre_from_zip_file(xml_sps_file_path)
+    except GetXMLWithPreFromZipFileError as e:
+        raise GetXMLItemsError(
+            _("Unable to get xml items from {}: {} {}").format(
+                xml_sps_file_path, type(e), e
+            )
+        )
+
+
+class XMLZipItem:
+    """
+    Referência a um XML de um arquivo zip
+
+    O conteúdo do XML é lido e carregado somente em `load`, de modo que
+    percorrer os itens de um pacote mantém em memória apenas o documento
+    em uso.
+    """
+
+    def __init__(self, zip_file_path, path, zip_namelist, zip_basenames, zf=None):
+        self.zip_file_path = zip_file_path
+        self.path = path
+        self.xml_name, ext = os.path.splitext(os.path.basename(path))
+        self.zip_namelist = zip_namelist
+        self.zip_basenames = zip_basenames
+        self._zf = zf
+
+    def read(self):
+        # usa o zip aberto durante a iteração; depois dela, reabre o arquivo
+        if self._zf is not None and self._zf.fp is not None:
+            return self._zf.read(self.path)
+        with ZipFile(self.zip_file_path) as zf:
+            return zf.read(self.path)
+
+    def load(self):
+        """
+        Retorna dict com xml_name e xml_with_pre ou, em caso de falha,
+        com xml_name e os dados do erro
+        """
+        try:
+            zf_read = self.read()
+            try:
+                content = zf_read.decode("utf-8")
+            except Exception as e:
+                content = zf_read.decode("iso-8859-1")
+            xml_with_pre = get_xml_with_pre(content)
+            xml_with_pre.add_xml_info(self.xml_name, self.path)
+            xml_with_pre.add_zip_info(
+                self.zip_file_path, self.zip_namelist, self.zip_basenames
+            )
+            return {"xml_name": self.xml_name, "xml_with_pre": xml_with_pre}
+        except Exception as e:
+            return {
+                "xml_name": self.xml_name,
+                "error_message": str(e),
+                "error_type": str(type(e)),
+                "traceback": traceback.format_exc(),
+            }
+
+
+def iter_xml_zip_items(xml_sps_file_path):
+    """
+    Indexa o zip uma única vez e retorna gerador de XMLZipItem, um para
+    cada XML do zip, sem ler o conteúdo dos XML
+
+    Raises
+    ------
+    GetXMLWithPreFromZipFileError
+    """
     try:
-        # Extração dos arquivos do ZIP
-        xml_with_pre_items = []
-        paths = []
-        basenames = []
-        items = {}
         with ZipFile(xml_sps_file_path) as zf:
+            xml_paths = []
+            paths = []
+            basenames = []
             for item in zf.namelist():
                 if item.startswith("."):
                     continue
                 basename = os.path.basename(item)
-                if not basename.endswith(".xml"):
+                if basename.endswith(".xml"):
+                    xml_paths.append(item)
+                else:
                     paths.append(item)
                     basenames.append(basename)
-                    continue
 
-                xml_name, ext = os.path.splitext(basename)
-                try:
-                    zf_read = zf.read(item)
-                    try:
-                        content = zf_read.decode("utf-8")
-                    except Exception as e:
-                        content = zf_read.decode("iso-8859-1")
-                    xml_with_pre = get_xml_with_pre(content)
-                    xml_with_pre.add_xml_info(xml_name, item)
-                    xml_with_pre_items.append(xml_with_pre)
-                except Exception as e:
-                    items[xml_name] = {
-                        "xml_name": xml_name,
-                        "error_message": str(e),
-                        "error_type": str(type(e)),
-                        "traceback": traceback.format_exc(),
-                    }
-        for xml_with_pre in xml_with_pre_items:
-            xml_name = xml_with_pre.xml_name
-            xml_with_pre.add_zip_info(xml_sps_file_path, paths, basenames)
-            items[xml_with_pre.xml_name] = {
-                "xml_name": xml_name,
-                "xml_with_pre": xml_with_pre,
-            }
-        return list(items.values())
+            for item in xml_paths:
+                yield XMLZipItem(xml_sps_file_path, item, paths, basenames, zf)
     except Exception as e:
         raise GetXMLWithPreFromZipFileError(
             _("Unable to get xml items from zip file {}: {} {}").format(
@@ -158,6 +234,30 @@ def get_xml_with_pre_from_zip_file(xml_sps_file_path):
         )
 
 
+def iter_xml_with_pre_from_zip_file(xml_sps_file_path):
+    """
+    Retorna gerador dos itens de get_xml_with_pre_from_zip_file, carregando
+    cada XML somente quando o item é consumido
+
+    Raises
+    ------
+    GetXMLWithPreFromZipFileError
+    """
+    for item in iter_xml_zip_items(xml_sps_file_path):
+        yield item.load()
+
+
+def get_xml_with_pre_from_zip_file(xml_sps_file_path):
+    items = {}
+    for item in iter_xml_with_pre_from_zip_file(xml_sps_file_path):
+        # em caso de nomes repetidos, prevalece o XML carregado com sucesso
+        if "xml_with_pre" in item or "xml_with_pre" not in items.get(
+            item["xml_name"], {}
+        ):
+            items[item["xml_name"]] = item
+    return list(items.values())
+
+
 def get_xml_items_from_zip_file(
     xml_sps_file_path,
     filenames=None,
@@ -195,7 +295,9 @@ def get_xml_with_pre_from_zip_file_component(xml_sps_file_path, xml_file):
             return get_xml_with_pre(zf_read.decode("iso-8859-1"))
 
 
-def update_zip_file_xml(xml_sps_file_path, xml_file_path, content):
+def update_zip_file_xml(
+    xml_sps_file_path, xml_file_path, content, compression_policy=None
+):
     """
     Save XML content in a Zip file.
     Return saved zip file path
@@ -204,6 +306,7 @@ def update_zip_file_xml(xml_sps_file_path, xml_file_path, content):
     ---------
         xml_sps_file_path: str
         content: bytes
+        compression_policy: packtools.lib.file_utils.CompressionPolicy
 
     Return
     ------
@@ -214,12 +317,14 @@ def update_zip_file_xml(xml_sps_file_path, xml_file_path, content):
             "Try to write xml %s %s %s"
             % (xml_sps_file_path, xml_file_path, content[:100])
         )
-        zf.writestr(xml_file_path, content)
+        (compression_policy or DEFAULT_COMPRESSION_POLICY).writestr(
+            zf, xml_file_path, content
+        )
 
     return os.path.isfile(xml_sps_file_path)
 
 
-def create_xml_zip_file(xml_sps_file_path, content):
+def create_xml_zip_file(xml_sps_file_path, content, compression_policy=None):
     """
     Save XML content in a Zip file.
     Return saved zip file path
@@ -228,6 +333,7 @@ def create_xml_zip_file(xml_sps_file_path, content):
     ---------
         xml_sps_file_path: str
         content: bytes
+        compression_policy: packtools.lib.file_utils.CompressionPolicy
 
     Return
     ------
@@ -245,7 +351,9 @@ def create_xml_zip_file(xml_sps_file_path, content):
     name, ext = os.path.splitext(basename)
 
     with ZipFile(xml_sps_file_path, "w", compression=ZIP_DEFLATED) as zf:
-        zf.writestr(name + ".xml", content)
+        (compression_policy or DEFAULT_COMPRESSION_POLICY).writestr(
+            zf, name + ".xml", content
+        )
     return os.path.isfile(xml_sps_file_path)
 
 
@@ -277,7 +385,8 @@ def get_zips(xml_sps_file_path):
                 zfile = os.path.join(tmpdirname, f"{key}.zip")
                 with ZipFile(zfile, "w", compression=ZIP_DEFLATED) as zfw:
                     for item in files:
-                        zfw.writestr(item, zf.read(item))
+                        # copia o conteúdo comprimido, sem descomprimir
+                        copy_zip_member(zf, zfw, item)
 
                 with open(zfile, "rb") as zfw:
                     yield {"zipfilename": key + ".zip", "content": zfw.read()}
@@ -300,9 +409,9 @@ def get_xml_with_pre(xml_content):
             xml_content
         )
         try:
-            return XMLWithPre(pref, etree.fromstring(xml))
+            return XMLWithPre(pref, parse_bytes(xml))
         except etree.XMLSyntaxError as e:
-            return XMLWithPre(pref, etree.fromstring(fix_pre_loading(xml)))
+            return XMLWithPre(pref, parse_bytes(fix_pre_loading(xml)))
     except Exception as e:
         if xml_content:
             raise GetXmlWithPreError(
@@ -489,7 +598,9 @@ class PackagingAndFilesMixin:
         with TemporaryDirectory() as tmpdirname:
             temp_zip_file_path = os.path.join(tmpdirname, f"{xml_filename}.zip")
             with ZipFile(temp_zip_file_path, "w", compression=ZIP_DEFLATED) as zf:
-                zf.writestr(xml_filename, self.tostring(pretty_print=pretty_print))
+                DEFAULT_COMPRESSION_POLICY.writestr(
+                    zf, xml_filename, self.tostring(pretty_print=pretty_print)
+                )
             with open(temp_zip_file_path, "rb") as fp:
                 zip_content = fp.read()
         return zip_content
@@ -1684,7 +1795,7 @@ class XMLWithPre(
         if path:
             errors = []
             xml_with_pre = None
-            for item in get_xml_items(path):
+            for item in iter_xml_items(path):
                 if not item:
                     continue
                 try:
@@ -1727,14 +1838,58 @@ class XMLWithPre(
 
     @property
     def finger_print(self):
-        if self.xmltree.xpath(".//comment()"):
-            for item in XMLWithPre.create(
-                xml_content=self.tostring(pretty_print=self.pretty_print)
-            ):
-                remove_comments(item.xmltree)
-                return generate_finger_print(item.tostring(pretty_print=True))
-        else:
-            return generate_finger_print(self.tostring(pretty_print=self.pretty_print))
+        """
+        sha256 do XML serializado, em maiúsculas, sem comentários.
+
+        O valor é o mesmo de ``generate_finger_print`` aplicado ao XML
+        serializado sem comentários, mas o XML não é carregado novamente e o
+        hash é calculado por partes (ver scripts/benchmark_finger_print.py).
+        """
+        digest = hashlib.sha256()
+        if next(self.xmltree.iter(etree.Comment), None) is None:
+            update_finger_print(digest, self.xmlpre)
+            update_finger_print(
+                digest,
+                etree.tostring(
+                    self.xmltree, encoding="utf-8", pretty_print=self.pretty_print
+                ),
+            )
+            return digest.hexdigest()
+
+        if not self.pretty_print:
+            return self._get_finger_print_by_reparsing()
+        if next(self.xmltree.iter(etree.PI), None) is not None:
+            # uma instrução de processamento pode conter "<!--" e "-->", que
+            # seriam removidos do texto como se fossem um comentário
+            return self._get_finger_print_by_reparsing()
+        changes_indentation, empties_elements = inspect_comments_removal(
+            self.xmltree
+        )
+        if changes_indentation:
+            return self._get_finger_print_by_reparsing()
+
+        # Um XML serializado com pretty_print não é reformatado ao ser
+        # serializado novamente após ser carregado, então remover do texto os
+        # comentários (e o texto que os segue, removido com eles por
+        # remove_comments) equivale a carregá-lo e remover os comentários.
+        # Os elementos que ficam vazios são serializados como <tag/>
+        xmlpre, xml = split_processing_instruction_doctype_declaration_and_xml(
+            self.tostring(pretty_print=True)
+        )
+        xml = SERIALIZED_COMMENT_AND_TAIL.sub("", xml)
+        if empties_elements:
+            xml = SERIALIZED_EMPTY_ELEMENT.sub(r"<\1\2/>", xml)
+        update_finger_print(digest, xmlpre)
+        update_finger_print(digest, xml)
+        update_finger_print(digest, "\n")
+        return digest.hexdigest()
+
+    def _get_finger_print_by_reparsing(self):
+        for item in XMLWithPre.create(
+            xml_content=self.tostring(pretty_print=self.pretty_print)
+        ):
+            remove_comments(item.xmltree)
+            return generate_finger_print(item.tostring(pretty_print=True))
 
     @property
     def data(self):
@@ -1786,6 +1941,63 @@ def generate_finger_print(content):
     return hashlib.sha256(content).hexdigest()
 
 
+def update_finger_print(digest, content):
+    """
+    Atualiza ``digest`` com ``content`` (str ou bytes utf-8) em maiúsculas e
+    codificado em utf-8, como ``generate_finger_print``, por partes.
+    """
+    if not content:
+        return
+    if isinstance(content, bytes):
+        if content.isascii():
+            for start in range(0, len(content), FINGER_PRINT_CHUNK_SIZE):
+                digest.update(content[start : start + FINGER_PRINT_CHUNK_SIZE].upper())
+            return
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        view = memoryview(content)
+        for start in range(0, len(view), FINGER_PRINT_CHUNK_SIZE):
+            text = decoder.decode(view[start : start + FINGER_PRINT_CHUNK_SIZE])
+            digest.update(text.upper().encode("utf-8"))
+        digest.update(decoder.decode(b"", final=True).upper().encode("utf-8"))
+        return
+    for start in range(0, len(content), FINGER_PRINT_CHUNK_SIZE):
+        text = content[start : start + FINGER_PRINT_CHUNK_SIZE]
+        digest.update(text.upper().encode("utf-8"))
+
+
+def inspect_comments_removal(xmltree):
+    """
+    Informa se, ao remover os comentários (e o texto que os segue):
+
+    - algum elemento com outros elementos perde todo o seu texto, o que
+      permite que ele seja indentado por ``pretty_print``;
+    - algum elemento fica vazio.
+    """
+    parents = {}
+    for comment in xmltree.iter(etree.Comment):
+        parent = comment.getparent()
+        if parent is not None:
+            parents[parent] = None
+
+    changes_indentation = False
+    empties_elements = False
+    for parent in parents:
+        had_text = parent.text is not None
+        has_text = had_text
+        has_children = False
+        for child in parent:
+            if child.tag is etree.Comment:
+                had_text = had_text or child.tail is not None
+                continue
+            has_children = True
+            has_text = has_text or child.tail is not None
+        if had_text and has_children and not has_text:
+            changes_indentation = True
+        if parent.text is None and not has_children:
+            empties_elements = True
+    return changes_indentation, empties_elements
+
+
 def remove_comments(xmltree):
     """
     Remove todos os nós de comentário de uma árvore XML.
@@ -11,7 +11,7 @@ def get_names_and_packages(path):
     return packages.explore_source(path)
 
 
-def make_package_from_paths(paths, zip_folder=None):
+def make_package_from_paths(paths, zip_folder=None, compression_policy=None, jobs=1):
     """
     Constrói pacote a partir de caminhos de arquivos
 
@@ -29,6 +29,13 @@ def make_package_from_paths(paths, zip_folder=None):
                 ...,
             ]
         }
+    zip_folder : str
+        Pasta onde o pacote é criado (padrão: uma pasta temporária)
+    compression_policy : packtools.lib.file_utils.CompressionPolicy
+        Compressão de cada arquivo do pacote
+    jobs : int
+        Número de threads que comprimem os arquivos grandes
+        (ver packtools.lib.file_utils.write_zip_members)
 
     Returns
     -------
@@ -67,12 +74,14 @@ def make_package_from_paths(paths, zip_folder=None):
     package_metadata['assets'] = paths['assets']
 
     zip_filename = _get_zip_filename(xml_sps)
-    package_metadata['zip'] = _zip_files_from_paths(zip_filename, xml_sps, paths, zip_folder)
+    package_metadata['zip'] = _zip_files_from_paths(
+        zip_filename, xml_sps, paths, zip_folder, compression_policy, jobs)
 
     return package_metadata
 
 
-def make_package_from_uris(xml_uri, renditions_uris_and_names=[], zip_folder=None):
+def make_package_from_uris(xml_uri, renditions_uris_and_names=[], zip_folder=None,
+                           compression_policy=None, jobs=1):
     package_metadata = {}
 
     try:
@@ -95,7 +104,8 @@ def make_package_from_uris(xml_uri, renditions_uris_and_names=[], zip_folder=Non
     zip_filename = _get_zip_filename(sps_package)
 
     # cria um arquivo ZIP temporário com os arquivos das uris baixados
-    package_metadata['zip'] = _zip_files_from_uris_and_names(zip_filename, uris_and_names, zip_folder)
+    package_metadata['zip'] = _zip_files_from_uris_and_names(
+        zip_filename, uris_and_names, zip_folder, compression_policy, jobs)
 
     return package_metadata
 
@@ -172,10 +182,12 @@ def _get_zip_filename(xml_sps, output_filename=None):
         return output_filename
 
 
-def _zip_files_from_uris_and_names(zip_name, uris_and_names, zip_folder=None):
+def _zip_files_from_uris_and_names(zip_name, uris_and_names, zip_folder=None,
+                                   compression_policy=None, jobs=1):
     uris_and_names = _remove_invalid_uris(uris_and_names)
     downloaded_files = async_download.download_files(uris_and_names)
-    return file_utils.create_zip_file(downloaded_files, zip_name, zip_folder)
+    return file_utils.create_zip_file(
+        downloaded_files, zip_name, zip_folder, compression_policy, jobs)
 
 
 def _remove_invalid_uris(uris_and_names):
@@ -200,9 +212,11 @@ def _remove_invalid_uris(uris_and_names):
     ]
 
 
-def _zip_files_from_paths(zip_name, xml_sps, paths, zip_folder=None):
+def _zip_files_from_paths(zip_name, xml_sps, paths, zip_folder=None,
+                          compression_policy=None, jobs=1):
     renamed_paths = _get_canonical_files_paths(xml_sps, paths)
-    return file_utils.create_zip_file(renamed_paths, zip_name, zip_folder)
+    return file_utils.create_zip_file(
+        renamed_paths, zip_name, zip_folder, compression_policy, jobs)
 
 
 def _check_keys_and_files(paths: dict):
@@ -1,13 +1,17 @@
 import logging
 import re
 
+from contextvars import ContextVar
 from copy import deepcopy
 from lxml import etree
 from packtools.sps import exceptions
 from packtools.lib import file_utils
+from packtools.utils import parse_bytes
 
 logger = logging.getLogger(__name__)
 
+_text_memo = ContextVar("packtools_sps_xml_utils_text_memo", default=None)
+
 
 def remove_namespaces(xml_string):
     namespaces_to_remove = [
@@ -66,6 +70,73 @@ def process_xref(node, footnote_markers=None):
     return node
 
 
+def _is_xref_to_remove(xref, footnote_markers):
+    # mesmo critério de process_xref
+    text = "".join(xref.itertext()).strip()
+    return bool(text) and (
+        xref.get("ref-type") == "fn"
+        or text in footnote_markers
+        or text.isdigit()
+    )
+
+
+def _iter_xref_processed_children(node, footnote_markers, in_xref):
+    """
+    Retorna os filhos de node, sem copiá-lo, como se process_xref tivesse
+    sido aplicado: para cada filho, gera (filho, tail) ou, se o filho é um
+    xref a remover, (None, tail), sendo o tail descartado quando o próximo
+    irmão também é xref.
+    """
+    for child in node:
+        if child.tag == "xref" and not in_xref:
+            if _is_xref_to_remove(child, footnote_markers):
+                _next = child.getnext()
+                if _next is None or _next.tag != "xref":
+                    yield None, child.tail
+                continue
+        yield child, child.tail
+
+
+def _iter_plain_text(node, footnote_markers, in_xref=False):
+    if node.text:
+        yield node.text
+    for child, tail in _iter_xref_processed_children(node, footnote_markers, in_xref):
+        if child is not None and isinstance(child.tag, str):
+            yield from _iter_plain_text(
+                child, footnote_markers, in_xref or child.tag == "xref"
+            )
+        if tail:
+            yield tail
+
+
+def _get_memoized(key, function, *args):
+    # memorização ativada por set_text_memo
+    memo = _text_memo.get()
+    if memo is None:
+        return function(*args)
+    try:
+        return memo[key]
+    except KeyError:
+        value = memo[key] = function(*args)
+        return value
+
+
+def set_text_memo(enabled=True):
+    """
+    Ativa, no contexto atual, a memorização, por elemento, dos textos obtidos
+    por node_plain_text, remove_subtags e process_subtags
+
+    Os textos memorizados não são atualizados se a árvore for modificada,
+    portanto, ativar somente enquanto o documento é apenas consultado, por
+    exemplo, durante a validação.
+    """
+    _text_memo.set({} if enabled else None)
+
+
+def _node_plain_text(node):
+    return " ".join("".join(_iter_plain_text(node, ("*",))).split())
+
+
 def node_plain_text(node):
     """
     Função que retorna texto de nó, sem subtags e com espaços padronizados.
@@ -78,16 +149,7 @@ def node_plain_text(node):
     """
     if node is None:
         return ""
-
-    node = process_xref(node)
-
-    # Extrai todo o texto dos nós, removendo subtags
-    text_content = "".join(node.xpath(".//text()"))
-
-    # Remove espaços extras
-    text_content = ' '.join(text_content.split())
-
-    return text_content
+    return _get_memoized(("node_plain_text", node), _node_plain_text, node)
 
 
 def node_text_without_fn_xref(node):
@@ -138,10 +200,9 @@ def _get_xml_content(xml):
 
 
 def get_xml_tree(content):
-    parser = etree.XMLParser(remove_blank_text=True, no_network=True)
     try:
         content = _get_xml_content(content)
-        xml_tree = etree.XML(content, parser)
+        xml_tree = parse_bytes(content, remove_blank_text=True)
     except etree.XMLSyntaxError as exc:
         raise exceptions.SPSLoadToXMLError(str(exc)) from None
     else:
@@ -366,6 +427,132 @@ def _generate_tag_list(tags_to_keep, tags_to_convert_to_html):
     )
 
 
+class _NormalizedText:
+    """
+    Acumula textos com os espaços padronizados, como
+    ``" ".join(text.split())``, sem reprocessar os textos já padronizados.
+    """
+
+    def __init__(self):
+        self.items = []
+        self.space = False
+
+    def add(self, text):
+        if not text:
+            return
+        words = text.split()
+        if not words:
+            self.space = True
+            return
+        if text[0].isspace():
+            self.space = True
+        self.add_normalized(" ".join(words))
+        self.space = text[-1].isspace()
+
+    def add_normalized(self, text):
+        if not text:
+            return
+        if self.space and self.items:
+            self.items.append(" ")
+        self.items.append(text)
+        self.space = False
+
+    @property
+    def value(self):
+        return "".join(self.items)
+
+
+def _tostring_without_tail(node, footnote_markers, in_xref, is_root):
+    if in_xref:
+        # xref dentro de xref: somente a tag é removida
+        node = deepcopy(node)
+        etree.strip_tags(node, "xref")
+    else:
+        processed = process_xref(node, footnote_markers)
+        if not is_root and len(processed.xpath(".//xref")) != len(
+            node.xpath(".//xref")
+        ):
+            # declara somente os namespaces usados após a remoção
+            etree.cleanup_namespaces(processed)
+        node = processed
+    node.tail = None
+    return tostring(node, xml_declaration=False)
+
+
+def _add_subtags_content(text, node, params, in_xref):
+    text.add(node.text)
+    for child, tail in _iter_xref_processed_children(
+        node, params["footnote_markers"], in_xref
+    ):
+        if child is not None and isinstance(child.tag, str):
+            if in_xref and child.tag == "xref":
+                # xref dentro de xref: somente a tag é removida
+                _add_subtags_content(text, child, params, in_xref)
+            else:
+                text.add_normalized(
+                    _remove_subtags(child, params, in_xref or child.tag == "xref")
+                )
+        text.add(tail)
+
+
+def _remove_subtags(node, params, in_xref=False, is_root=False):
+    tag = node.tag
+
+    # verifica se é o caso de manutenção da tag e seu conteúdo
+    if tag in params["tags_to_keep_with_content"]:
+        content = _tostring_without_tail(
+            node, params["footnote_markers"], in_xref, is_root
+        )
+        return content if is_root else " ".join(content.split())
+
+    # verifica se é o caso de remoção do conteúdo da tag
+    if tag in params["tags_to_remove_with_content"]:
+        return ""
+
+    text = _NormalizedText()
+    _add_subtags_content(text, node, params, in_xref)
+    text = text.value
+
+    if tag in params["all_tags_to_keep"]:
+        if attribs := " ".join(
+            f'{key}="{value}"' for key, value in node.attrib.items()
+        ):
+            if not is_root:
+                attribs = " ".join(attribs.split())
+            return f"<{tag} {attribs}>{text}</{tag}>"
+        return f"<{tag}>{text}</{tag}>"
+    return text
+
+
+def _get_subtags_params(
+    tags_to_keep,
+    tags_to_keep_with_content,
+    tags_to_remove_with_content,
+    tags_to_convert_to_html,
+    footnote_markers,
+):
+    return {
+        "all_tags_to_keep": frozenset(
+            _generate_tag_list(tags_to_keep, tags_to_convert_to_html)
+        ),
+        "tags_to_keep_with_content": frozenset(tags_to_keep_with_content or []),
+        "tags_to_remove_with_content": frozenset(tags_to_remove_with_content or []),
+        "footnote_markers": tuple(
+            ["*"] if footnote_markers is None else footnote_markers
+        ),
+    }
+
+
+def _get_subtags_key(function_name, node, *args):
+    # argumentos em forma imutável, para compor a chave da memorização
+    return (function_name, node) + tuple(
+        tuple(sorted(arg.items())) if isinstance(arg, dict)
+        else tuple(arg) if isinstance(arg, (list, tuple, set, frozenset))
+        else arg
+        for arg in args
+    )
+
+
 def remove_subtags(
         node,
         tags_to_keep=None,
@@ -382,49 +569,33 @@ def remove_subtags(
         Saída: <italic>São</italic> Paulo Paulo
 
     Outros exemplos nos testes.
-    """
-
-    if footnote_markers is None:
-        footnote_markers = ["*"]
-
-    # processa as subtags xref
-    node = process_xref(node, footnote_markers)
-
-    # obtem a tag e seu conteúdo
-    tag = node.tag
-    text = node.text if node.text is not None else ""
-
-    # verifica se é o caso de manutenção da tag e seu conteúdo
-    if tag in (tags_to_keep_with_content or []):
-        return tostring(node, xml_declaration=False)
 
-    # verifica se é o caso de remoção do conteúdo da tag
-    if tag in (tags_to_remove_with_content or []):
-        return ""
-
-    # processa as tags internas
-    for child in node:
-        text += remove_subtags(
-            child,
+    Percorre node uma única vez, sem copiá-lo; somente as tags mantidas com
+    conteúdo são copiadas, para serem serializadas.
+    """
+    params = _get_subtags_params(
+        tags_to_keep,
+        tags_to_keep_with_content,
+        tags_to_remove_with_content,
+        tags_to_convert_to_html,
+        footnote_markers,
+    )
+    return _get_memoized(
+        _get_subtags_key(
+            "remove_subtags",
+            node,
             tags_to_keep,
             tags_to_keep_with_content,
             tags_to_remove_with_content,
             tags_to_convert_to_html,
-        )
-        if child.tail is not None:
-            text += child.tail
-
-    # gera uma lista com as tags que serão mantidas
-    all_tags_to_keep = _generate_tag_list(tags_to_keep, tags_to_convert_to_html)
-
-    text = " ".join(text.split())
-    if tag in all_tags_to_keep:
-        if attribs := " ".join(
-            f'{key}="{value}"' for key, value in node.attrib.items()
-        ):
-            return f"<{tag} {attribs}>{text}</{tag}>"
-        return f"<{tag}>{text}</{tag}>"
-    return text
+            footnote_markers,
+        ),
+        _remove_subtags,
+        node,
+        params,
+        False,
+        True,
+    )
 
 
 def process_subtags(
@@ -439,11 +610,37 @@ def process_subtags(
     if node is None:
         return
 
+    return _get_memoized(
+        _get_subtags_key(
+            "process_subtags",
+            node,
+            tags_to_keep,
+            tags_to_keep_with_content,
+            tags_to_remove_with_content,
+            tags_to_convert_to_html,
+            footnote_markers,
+        ),
+        _process_subtags,
+        node,
+        tags_to_keep,
+        tags_to_keep_with_content,
+        tags_to_remove_with_content,
+        tags_to_convert_to_html,
+        footnote_markers,
+    )
+
+
+def _process_subtags(
+        node,
+        tags_to_keep,
+        tags_to_keep_with_content,
+        tags_to_remove_with_content,
+        tags_to_convert_to_html,
+        footnote_markers,
+    ):
     if footnote_markers is None:
         footnote_markers = ["*"]
 
-    node = deepcopy(node)
-
     std_to_keep = ["sup", "sub"]
     std_to_keep_with_content = [
         "mml:math",
@@ -469,19 +666,21 @@ def process_subtags(
     # verifica se é o caso de manutenção da tag e seu conteúdo
     tag = node.tag
     if tag in tags_to_keep_with_content:
+        node = deepcopy(node)
+        node.tail = None
         return tostring(node)
 
     # garante que as tags em std_to_convert serão convertidas em html
     std_to_convert.update(tags_to_convert_to_html or {})
 
-    text = remove_subtags(
-        node,
-        tags_to_keep=tags_to_keep,
-        tags_to_keep_with_content=tags_to_keep_with_content,
-        tags_to_remove_with_content=tags_to_remove_with_content,
-        tags_to_convert_to_html=std_to_convert,
-        footnote_markers=footnote_markers
+    params = _get_subtags_params(
+        tags_to_keep,
+        tags_to_keep_with_content,
+        tags_to_remove_with_content,
+        std_to_convert,
+        footnote_markers,
     )
+    text = _remove_subtags(node, params, is_root=True)
 
     for xml_tag, html_tag in std_to_convert.items():
         text = text.replace(f"<{xml_tag} ", f"<{html_tag} ")
@@ -1,8 +1,8 @@
-from copy import deepcopy
 from difflib import SequenceMatcher
 
 from packtools.sps import i18n
 from packtools.sps.models.v2.aff import FulltextAffiliations
+from packtools.sps.validation.code_lists import code_set
 from packtools.sps.validation.utils import build_response
 
 
@@ -21,8 +21,12 @@ class FulltextAffiliationsValidation:
         self.node = node
         self.params = self.get_default_params()
         self.params.update(params or {})
+        if "country_codes_set" not in self.params:
+            self.params["country_codes_set"] = code_set(
+                self.params.get("country_codes_list")
+            )
         self.fulltext_affs = FulltextAffiliations(node)
-        self.translation_params = deepcopy(self.params)
+        self.translation_params = dict(self.params)
         self.translation_params.update(
             params.get("translation_aff_rules") or {}
         )
@@ -157,6 +161,7 @@ class AffiliationValidation:
         params: dict
             Dictionary containing validation parameters including:
             - country_codes_list: List of valid country codes
+            - country_codes_set: country_codes_list as a frozenset (optional)
             - error_levels: Dict with error levels for each validation type
         """
         self.params = self.get_default_params()
@@ -166,6 +171,10 @@ class AffiliationValidation:
             raise ValueError(
                 "AffiliationValidation requires list of country codes"
             )
+        if "country_codes_set" not in self.params:
+            self.params["country_codes_set"] = code_set(
+                self.params["country_codes_list"]
+            )
 
         self.affiliation = affiliation
         self.original = self.affiliation.get("original")
@@ -406,12 +415,16 @@ class AffiliationValidation:
         error_level = self.params["country_code_error_level"]
         country_codes_list = self.params["country_codes_list"]
 
-        is_valid = country_code in country_codes_list
+        is_valid = country_code in self.params["country_codes_set"]
 
-        # Format country codes list for display (max 5 examples)
-        codes_display = ", ".join(country_codes_list[:5])
-        if len(country_codes_list) > 5:
-            codes_display += ", ... ({} codes total)".format(len(country_codes_list))
+        advice = None
+        codes_display = None
+        if not is_valid:
+            advice = 'Complete <country country=""> in <aff> with a valid value: {} for {}'.format(country_codes_list, self.original)
+            # Format country codes list for display (max 5 examples)
+            codes_display = ", ".join(country_codes_list[:5])
+            if len(country_codes_list) > 5:
+                codes_display += ", ... ({} codes total)".format(len(country_codes_list))
 
         yield build_response(
             title="country code",
@@ -424,7 +437,7 @@ class AffiliationValidation:
                 country_code if is_valid else "one of {}".format(country_codes_list)
             ),
             obtained=country_code,
-            advice='Complete <country country=""> in <aff> with a valid value: {} for {}'.format(country_codes_list, self.original),
+            advice=advice,
             data=self.affiliation,
             error_level=error_level,
             advice_text=i18n._('Complete <country country=""> in <aff> with a valid value from the ISO 3166 list: {codes} for {original}'),
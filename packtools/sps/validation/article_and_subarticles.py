@@ -6,6 +6,7 @@ from packtools.sps.validation.exceptions import (
     ValidationArticleAndSubArticlesArticleTypeException,
     ValidationArticleAndSubArticlesSubjectsException,
 )
+from packtools.sps.validation.code_lists import code_set
 from packtools.sps.validation.similarity_utils import most_similar, similarity
 from packtools.sps.validation.utils import build_response
 from packtools.sps import i18n
@@ -17,6 +18,10 @@ class ArticleLangValidation:
         self.articles = ArticleAndSubArticles(self.xmltree)
         self.params = self._get_default_params()
         self.params.update(params or {})
+        if "language_codes_set" not in self.params:
+            self.params["language_codes_set"] = code_set(
+                self.params.get("language_codes_list")
+            )
 
     def _get_default_params(self):
         return {
@@ -76,6 +81,7 @@ class ArticleLangValidation:
         """
         try:
             language_codes_list = self.params["language_codes_list"] or []
+            language_codes_set = self.params["language_codes_set"]
         except KeyError:
             raise ValidationArticleAndSubArticlesLanguageCodeException(
                 "Function requires list of language codes"
@@ -87,16 +93,19 @@ class ArticleLangValidation:
             article_id = article.get("article_id")
             parent = article.get("parent_name")
 
-            valid = article_lang in language_codes_list
+            valid = article_lang in language_codes_set
 
             name = article_id or parent
             parent_id = f' id="{article_id}"' if article_id else ''
-            if article_lang:
+            advice = None
+            advice_text = None
+            advice_params = None
+            if not valid and article_lang:
                 xml = f'<{parent}{parent_id} xml:lang="{article_lang}">'
                 advice = f'Replace {article_lang} in {xml} with one of {language_codes_list}'
                 advice_text = i18n._('Replace {lang} in {xml} with one of {lang_list}')
                 advice_params = {"lang": article_lang, "xml": xml, "lang_list": str(language_codes_list)}
-            else:
+            elif not valid:
                 xml = f'<{parent}{parent_id}>'
                 xml2 = f'<{parent}{parent_id} xml:lang="VALUE">'
 
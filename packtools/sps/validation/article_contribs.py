@@ -1,6 +1,7 @@
 import re
 
 from packtools.sps.models.article_contribs import TextContribs, XMLContribs
+from packtools.sps.validation.code_lists import credit_taxonomy
 from packtools.sps.validation.utils import build_response
 from packtools.sps import i18n
 
@@ -515,6 +516,14 @@ class XMLContribsValidation:
         self.xml_contribs = XMLContribs(self.xmltree)
         self.params = self._get_default_params()
         self.params.update(params or {})
+        # indexed once and reused by each ContribRoleValidation
+        if (
+            "credit_taxonomy" not in self.params
+            and "credit_taxonomy_terms_and_urls" in self.params
+        ):
+            self.params["credit_taxonomy"] = credit_taxonomy(
+                self.params["credit_taxonomy_terms_and_urls"]
+            )
 
     def _get_default_params(self):
         # Include all params from ContribValidation plus its own
@@ -1077,16 +1086,12 @@ class ContribRoleValidation:
         self.index_credit_taxonomy()
 
     def index_credit_taxonomy(self):
-        credit_taxonomy_by_uri = {}
-        credit_taxonomy_by_term = {}
-        credit_taxonomy_by_terms = []
-        for item in self.params["credit_taxonomy_terms_and_urls"] or []:
-            credit_taxonomy_by_terms.append(item["term"])
-            credit_taxonomy_by_uri[item["uri"]] = item["term"]
-            credit_taxonomy_by_term[item["term"].upper()] = item["uri"]
-        self.params["credit_taxonomy_by_uri"] = credit_taxonomy_by_uri
-        self.params["credit_taxonomy_by_term"] = credit_taxonomy_by_term
-        self.params["credit_taxonomy_by_terms"] = credit_taxonomy_by_terms
+        taxonomy = self.params.get("credit_taxonomy") or credit_taxonomy(
+            self.params["credit_taxonomy_terms_and_urls"]
+        )
+        self.params["credit_taxonomy_by_uri"] = taxonomy.by_uri
+        self.params["credit_taxonomy_by_term"] = taxonomy.by_term
+        self.params["credit_taxonomy_by_terms"] = list(taxonomy.terms)
 
     @property
     def info(self):
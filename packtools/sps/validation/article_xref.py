@@ -27,16 +27,20 @@ REF_TYPES = [
 class ArticleXrefValidation:
     def __init__(self, xml_tree, params=None):
         self.xml_tree = xml_tree
-        self.xml_cross_refs = XMLCrossReference(xml_tree)
 
         # Get default parameters and update with provided params if any
         self.params = self.get_default_params()
         if params:
             self.params.update(params)
 
+        # article_index: ArticleIndex shared by the validators of the document
+        self.xml_cross_refs = XMLCrossReference(
+            xml_tree, self.params.get("article_index")
+        )
+
         self.xrefs_by_rid = self.xml_cross_refs.xrefs_by_rid()
 
-        ids = {elem_id for elem_id in self.xml_cross_refs.elems_by_id("*").keys() if elem_id}
+        ids = self.xml_cross_refs.all_ids()
         rids = {rid for rid in self.xrefs_by_rid.keys() if rid}
 
         self.missing_xrefs = list(ids - rids)
@@ -325,7 +329,9 @@ class ArticleXrefValidation:
         dict
             A dictionary containing validation results with standard keys.
         """
-        elements_by_id = self.xml_cross_refs.elems_by_id("*")
+        elements_by_id = self.xml_cross_refs.elems_by_id(
+            "*", ids=set(self.xrefs_by_rid)
+        )
         for rid, xrefs in self.xrefs_by_rid.items():
             if not rid:
                 continue
@@ -303,17 +303,22 @@ class FulltextDatesValidation:
         }
 
     def _add_required_events(self):
-        self.params.setdefault("required_events", [])
+        events = []
         key = self.fulltext.attribs_parent_prefixed["original_article_type"]
         if event := self.params["required_history_events_for_article_type"].get(key):
-            self.params["required_events"].append(event)
+            events.append(event)
 
         for item in self.fulltext.related_articles:
             key = item["related-article-type"]
             if event := self.params[
                 "required_history_events_for_related_article_type"
             ].get(key):
-                self.params["required_events"].append(event)
+                events.append(event)
+
+        self.params["required_events"] = [
+            *(self.params.get("required_events") or []),
+            *events,
+        ]
 
     def validate(self):
         """Perform all date validations.
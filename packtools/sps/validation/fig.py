@@ -10,7 +10,9 @@ class ArticleFigValidation:
         self.article_types_requires = rules.get("article_types_requires", [])
         self.article_type = xml_tree.find(".").get("article-type")
         self.required = self.article_type in self.article_types_requires
-        self.elements = list(ArticleFigs(xml_tree).get_all_figs)
+        self.elements = list(
+            ArticleFigs(xml_tree, rules.get("article_index")).get_all_figs
+        )
 
     def validate(self):
         if self.elements:
@@ -80,7 +80,7 @@ class XMLFnGroupValidation:
         self.rules = rules
         self.dtd_version = xml_tree
 
-        self.xml_article = XMLFns(xml_tree)
+        self.xml_article = XMLFns(xml_tree, rules.get("article_index"))
 
         self.article_fn_groups = list(self.xml_article.article_fn_groups_notes())
         self.sub_article_fn_groups = list(self.xml_article.sub_article_fn_groups_notes())
@@ -3,7 +3,7 @@ import logging
 from packtools.sps import i18n
 from packtools.sps.validation.models.formula import ArticleFormulas
 from packtools.sps.validation.utils import build_response
-from packtools.sps.validation.xml_validator_rules import get_group_rules
+from packtools.sps.validation.xml_validator_rules import get_group_ruleset
 
 
 class ArticleDispFormulaValidation:
@@ -491,8 +491,8 @@ class InlineFormulaValidation:
 
     def get_default_params(self):
         try:
-            data = get_group_rules("formula")
-            return data["inline_formula_rules"]
+            data = get_group_ruleset("formula")
+            return dict(data["inline_formula_rules"])
         except Exception as e:
             logging.exception(e)
             return {
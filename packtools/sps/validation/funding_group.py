@@ -1,4 +1,5 @@
 from packtools.sps.models.funding_group import FundingGroup
+from packtools.sps.validation.code_lists import code_set
 from packtools.sps.validation.utils import build_response
 from packtools.sps.validation.similarity_utils import most_similar, similarity
 from packtools.sps import i18n
@@ -17,7 +18,8 @@ class FundingGroupValidation:
         XML tree to validate
     params : dict
         Dictionary containing parameters for validation:
-        - special_chars_award_id: List of special characters allowed in award IDs
+        - special_chars_award_id: List (or frozenset) of special characters
+          allowed in award IDs
         - error_level: Error level for validation messages ("ERROR" or "WARNING")
     """
 
@@ -29,6 +31,9 @@ class FundingGroupValidation:
             "funding_statement_error_level": "CRITICAL"
         }
         self.params.update(params or {})
+        self.params["special_chars_award_id"] = code_set(
+            self.params["special_chars_award_id"]
+        )
         self.funding = FundingGroup(xml_tree, self.params)
 
     def validate_required_award_ids(self):
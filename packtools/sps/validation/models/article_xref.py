@@ -1,25 +1,25 @@
 from packtools.sps.models.v2.article_xref import Xref, Element
-from packtools.sps.models.article_and_subarticles import Fulltext
+from packtools.sps.models.article_index import ArticleIndex
 
 
 class XMLCrossReference:
-    def __init__(self, xml_tree):
+    def __init__(self, xml_tree, index=None):
         self.xml_tree = xml_tree
+        self.index = index or ArticleIndex(xml_tree)
 
-    def elems_by_id(self, element_name="*", attribs=None):
+    def elems_by_id(self, element_name="*", attribs=None, ids=None):
+        """
+        ids : restricts the result to the elements which @id is in ids
+        """
         elems = {}
-        xpaths = []
-        if attribs:
-            for attr in attribs or []:
-                name = attr["name"]
-                value = attr["value"]
-                xpaths.append(f'.//{element_name}[@{name}="{value}"]')
-        else:
-            xpaths.append(f'.//{element_name}')
-
-        for node in self.xml_tree.xpath(". | .//sub-article"):
-            fulltext = Fulltext(node)
-            for item in fulltext.node.xpath("|".join(xpaths)):
+        for fulltext in self.index.fulltexts:
+            for item in self.index.descendants(element_name, fulltext):
+                if ids is not None and item.get("id") not in ids:
+                    continue
+                if attribs and not any(
+                    item.get(attr["name"]) == attr["value"] for attr in attribs
+                ):
+                    continue
                 elem = Element(item)
                 data = fulltext.attribs_parent_prefixed
                 data.update(elem.data)
@@ -30,7 +30,7 @@ class XMLCrossReference:
 
     def xrefs_by_rid(self):
         response = {}
-        for xref_node in self.xml_tree.xpath(".//xref"):
+        for xref_node in self.index.descendants("xref"):
             xref_data = Xref(xref_node).data
             rid = xref_data.get("rid")
             response.setdefault(rid, [])
@@ -40,7 +40,7 @@ class XMLCrossReference:
     def all_xrefs(self):
         """Returns a list of data dicts for all <xref> elements in the document."""
         result = []
-        for xref_node in self.xml_tree.xpath(".//xref"):
+        for xref_node in self.index.descendants("xref"):
             xref = Xref(xref_node)
             data = xref.data
             data["xml"] = xref.xml
@@ -51,18 +51,14 @@ class XMLCrossReference:
 
     def all_ids(self):
         """Returns a set of all @id attribute values in the document."""
-        ids = set()
-        for node in self.xml_tree.xpath(".//*[@id]"):
-            id_val = node.get("id")
-            if id_val:
-                ids.add(id_val)
-        return ids
+        # includes the @id of the root element, as xml_tree.xpath(".//*[@id]")
+        return {id_val for id_val in self.index.elements_by_id if id_val}
 
     def transcript_sections(self):
         """Returns a list of @id values for <sec sec-type='transcript'> elements."""
         result = []
-        for node in self.xml_tree.xpath('.//sec[@sec-type="transcript"]'):
+        for node in self.index.descendants("sec"):
             sec_id = node.get("id")
-            if sec_id:
+            if sec_id and node.get("sec-type") == "transcript":
                 result.append(sec_id)
         return result
@@ -4,24 +4,44 @@ from packtools.sps.models.fn import FulltextFnGroups
 
 
 class XMLFns:
-    def __init__(self, xml_tree):
+    def __init__(self, xml_tree, index=None):
         self.xml_tree = xml_tree
+        # ArticleIndex shared by the validators of the document
+        self.index = index
 
     def article_fn_groups_notes(self):
         yield from FulltextFnGroups(self.xml_tree.find(".")).items
 
     def sub_article_fn_groups_notes(self):
-        for sub_article in self.xml_tree.xpath(".//sub-article"):
+        if self.index is not None:
+            sub_articles = self.index.descendants("sub-article")
+        else:
+            sub_articles = self.xml_tree.xpath(".//sub-article")
+        for sub_article in sub_articles:
             yield from FulltextFnGroups(sub_article).items
 
+    def _edited_by_nodes(self):
+        if self.index is None:
+            for item in self.xml_tree.xpath(". | .//sub-article"):
+                fulltext = Fulltext(item)
+                for node in fulltext.node.xpath("*//fn[@fn-type='edited-by']"):
+                    yield fulltext, node
+            return
+        for fulltext in self.index.fulltexts:
+            # same as "*//fn": fn which are not children of fulltext.node
+            for node in self.index.descendants("fn", fulltext):
+                if (
+                    node.get("fn-type") == "edited-by"
+                    and node.getparent() is not fulltext.node
+                ):
+                    yield fulltext, node
+
     @property
     def fn_edited_by(self):
-        for item in self.xml_tree.xpath(". | .//sub-article"):
-            fulltext = Fulltext(item)
-            for node in fulltext.node.xpath("*//fn[@fn-type='edited-by']"):
-                data = fulltext.attribs_parent_prefixed
-                data.update(Fn(node).data)
-                yield data
+        for fulltext, node in self._edited_by_nodes():
+            data = fulltext.attribs_parent_prefixed
+            data.update(Fn(node).data)
+            yield data
 
 
 ArticleFns = XMLFns
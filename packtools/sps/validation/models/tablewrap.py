@@ -2,8 +2,17 @@ from packtools.sps.models.tablewrap import TableWrappers
 
 
 class ArticleTableWrappers:
-    def __init__(self, xml_tree):
+    def __init__(self, xml_tree, index=None):
         self.xml_tree = xml_tree
+        # ArticleIndex shared by the validators of the document
+        self.index = index
+
+    def _sub_articles(self, translation):
+        if self.index is not None:
+            return self.index.sub_articles(translation)
+        if translation:
+            return self.xml_tree.xpath(".//sub-article[@article-type='translation']")
+        return self.xml_tree.xpath(".//sub-article[@article-type!='translation']")
 
     @property
     def get_all_table_wrappers(self):
@@ -13,14 +22,14 @@ class ArticleTableWrappers:
 
     @property
     def get_article_table_wrappers(self):
-        yield from TableWrappers(self.xml_tree.find(".")).table_wrappers()
+        yield from TableWrappers(self.xml_tree.find("."), self.index).table_wrappers()
 
     @property
     def get_sub_article_translation_table_wrappers(self):
-        for node in self.xml_tree.xpath(".//sub-article[@article-type='translation']"):
-            yield from TableWrappers(node).table_wrappers()
+        for node in self._sub_articles(translation=True):
+            yield from TableWrappers(node, self.index).table_wrappers()
 
     @property
     def get_sub_article_non_translation_table_wrappers(self):
-        for node in self.xml_tree.xpath(".//sub-article[@article-type!='translation']"):
-            yield from TableWrappers(node).table_wrappers()
+        for node in self._sub_articles(translation=False):
+            yield from TableWrappers(node, self.index).table_wrappers()
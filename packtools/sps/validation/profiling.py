@@ -0,0 +1,259 @@
+"""
+Opt-in measures of the validation, per group and per check
+
+A group is a group of results of ``xml_validations`` (e.g. "contrib"), which
+may be produced by many validators. A check is a validator method called by
+``xml_validations`` (e.g. ``XMLContribsValidation.validate``) through
+``measure_check``; it is named "group/method". For each group, the profile
+records the wall time spent producing its results, the number of results and,
+if tracemalloc is tracing, the memory peak. For each check, it records the
+wall time and the number of results.
+
+Usage::
+
+    profile = ValidationProfile()
+    for xmltree in xmltrees:
+        document = DocumentProfile()
+        for item in get_validation_results(xmltree, params, profile=document):
+            ...
+        profile.add(document)
+    print(profile.format_table())
+    print(profile.format_table(by_check=True))
+"""
+import json
+import math
+import time
+import tracemalloc
+from contextvars import ContextVar
+
+
+# time spent by validate_xml_content itself, out of the groups
+SETUP_GROUP = "(setup)"
+
+_profile = ContextVar("packtools_validation_profile", default=None)
+
+
+def set_profile(profile):
+    """
+    Sets, in the current context, the DocumentProfile used by measure_check
+    """
+    _profile.set(profile)
+
+
+def measure_check(method, *args, **kwargs):
+    """
+    Returns the results of method(*args, **kwargs)
+
+    If a DocumentProfile is set in the current context, method is called
+    only when the results are consumed, and the time spent is recorded as a
+    check of the group being measured.
+    """
+    profile = _profile.get()
+    if profile is None:
+        return method(*args, **kwargs)
+    return profile.measure_check(method.__qualname__, method, *args, **kwargs)
+
+
+def _measure(items, add, trace_memory=False):
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    items = iter(items)
+    seconds = 0.0
+    results = 0
+    peak = None
+    try:
+        while True:
+            if trace_memory:
+                tracemalloc.reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            finally:
+                seconds += time.perf_counter() - start
+                if trace_memory:
+                    peak = max(
+                        peak or 0, tracemalloc.get_traced_memory()[1] - current
+                    )
+            results += 1
+            yield item
+    finally:
+        add(seconds, results, peak)
+
+
+def percentile(values, percent):
+    """
+    Returns the nearest-rank percentile of values, or None if it is empty
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+class DocumentProfile:
+    """
+    Measures of the validation of one document
+
+    measures: dict group -> {"seconds", "results", "peak"}; the peak, in
+    bytes, is None if trace_memory is False
+
+    checks: dict "group/check" -> {"seconds", "results", "peak"}; the peak
+    is always None, since the checks are measured within their group
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.measures = {}
+        self.checks = {}
+        # group whose results are being produced
+        self.group = None
+
+    @staticmethod
+    def _add(measures, name, seconds, results, peak):
+        measure = measures.setdefault(
+            name, {"seconds": 0.0, "results": 0, "peak": None}
+        )
+        measure["seconds"] += seconds
+        measure["results"] += results
+        if peak is not None:
+            measure["peak"] = max(measure["peak"] or 0, peak)
+
+    def add(self, group, seconds, results=0, peak=None):
+        self._add(self.measures, group, seconds, results, peak)
+
+    def add_check(self, group, check, seconds, results=0):
+        self._add(self.checks, f"{group}/{check}", seconds, results, None)
+
+    def measure(self, group, items):
+        """
+        Yields items, recording the time spent, and the memory peak, to
+        produce each of them
+
+        The time spent by the consumer of items is not recorded. The measure
+        is added even if items raises an exception or is not consumed to the
+        end.
+        """
+        def add(seconds, results, peak):
+            self.add(group, seconds, results, peak)
+
+        yield from _measure(self._in_group(group, items), add, self.trace_memory)
+
+    def _in_group(self, group, items):
+        items = iter(items)
+        while True:
+            previous, self.group = self.group, group
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            finally:
+                self.group = previous
+            yield item
+
+    def measure_check(self, check, method, *args, **kwargs):
+        """
+        Yields the results of method(*args, **kwargs), recording the time
+        spent to produce them as the check of the current group
+        """
+        group = self.group
+
+        def add(seconds, results, peak):
+            self.add_check(group, check, seconds, results)
+
+        def call():
+            yield from method(*args, **kwargs)
+
+        yield from _measure(call(), add)
+
+
+class ValidationProfile:
+    """
+    Aggregates the DocumentProfile of many documents
+    """
+
+    COLUMNS = (
+        "group",
+        "documents",
+        "total_seconds",
+        "p50_ms",
+        "p95_ms",
+        "max_ms",
+        "results",
+        "p95_peak_kib",
+    )
+
+    def __init__(self):
+        self.documents = []
+
+    def add(self, document_profile):
+        self.documents.append(document_profile)
+
+    def _summarize(self, name, measures):
+        milliseconds = [measure["seconds"] * 1000 for measure in measures]
+        peaks = [
+            measure["peak"] / 1024
+            for measure in measures
+            if measure["peak"] is not None
+        ]
+        return {
+            "group": name,
+            "documents": len(measures),
+            "total_seconds": sum(milliseconds) / 1000,
+            "p50_ms": percentile(milliseconds, 50),
+            "p95_ms": percentile(milliseconds, 95),
+            "max_ms": max(milliseconds),
+            "results": sum(measure["results"] for measure in measures),
+            "p95_peak_kib": percentile(peaks, 95),
+        }
+
+    def summary(self, by_check=False):
+        """
+        Returns one row per group (or per check), the slowest first
+
+        The percentiles are taken across documents.
+        """
+        measures = {}
+        for document in self.documents:
+            items = document.checks if by_check else document.measures
+            for group, measure in items.items():
+                measures.setdefault(group, []).append(measure)
+
+        rows = [self._summarize(group, items) for group, items in measures.items()]
+        return sorted(rows, key=lambda row: row["total_seconds"], reverse=True)
+
+    def to_json(self):
+        return json.dumps(
+            {
+                "documents": len(self.documents),
+                "groups": self.summary(),
+                "checks": self.summary(by_check=True),
+            },
+            indent=2,
+        )
+
+    def format_table(self, by_check=False):
+        rows = self.summary(by_check)
+        header = list(self.COLUMNS)
+        if by_check:
+            header[0] = "check"
+        lines = [header] + [
+            [
+                "-" if row[column] is None
+                else f"{row[column]:.3f}" if isinstance(row[column], float)
+                else str(row[column])
+                for column in self.COLUMNS
+            ]
+            for row in rows
+        ]
+        widths = [max(len(line[i]) for line in lines) for i in range(len(self.COLUMNS))]
+        return "\n".join(
+            "  ".join(
+                value.ljust(width) if i == 0 else value.rjust(width)
+                for i, (value, width) in enumerate(zip(line, widths))
+            )
+            for line in lines
+        )
@@ -18,7 +18,11 @@ class ArticleTableWrapValidation:
         if not isinstance(rules, dict):
             raise ValueError("rules must be a dictionary containing error levels.")
         try:
-            self.elements = list(ArticleTableWrappers(xml_tree).get_all_table_wrappers)
+            self.elements = list(
+                ArticleTableWrappers(
+                    xml_tree, rules.get("article_index")
+                ).get_all_table_wrappers
+            )
         except Exception as e:
             raise RuntimeError(f"Error processing table-wraps: {e}")
         self.xml_tree = xml_tree
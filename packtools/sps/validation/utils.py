@@ -1,5 +1,6 @@
 import urllib.parse
 import re
+from contextvars import ContextVar
 from datetime import date, timedelta
 
 from packtools.sps import i18n
@@ -7,6 +8,64 @@ from packtools.sps.libs.requester import fetch_data
 from packtools.sps.validation.similarity_utils import most_similar, similarity, how_similar
 
 
+REPORT_ALL = "all"
+REPORT_FAILURES = "failures"
+REPORTS = (REPORT_ALL, REPORT_FAILURES)
+
+_report = ContextVar("packtools_sps_validation_report", default=REPORT_ALL)
+
+
+def set_report(report=REPORT_ALL):
+    """
+    Sets which results are fully rendered by build_response/format_response
+
+    With REPORT_FAILURES, valid results are returned as compact records:
+    the message and advice are not formatted nor localized.
+    """
+    if report not in REPORTS:
+        raise ValueError(f"Invalid report: {report}. Expected one of {REPORTS}")
+    _report.set(report)
+
+
+def get_report():
+    return _report.get()
+
+
+def _compact_response(
+    title,
+    parent,
+    parent_id,
+    parent_article_type,
+    parent_lang,
+    item,
+    sub_item,
+    validation_type,
+    expected,
+    obtained,
+    data,
+):
+    return {
+        "title": title,
+        "parent": parent,
+        "parent_id": parent_id,
+        "parent_article_type": parent_article_type,
+        "parent_lang": parent_lang,
+        "item": item,
+        "sub_item": sub_item,
+        "validation_type": validation_type,
+        "response": "OK",
+        "expected_value": expected,
+        "got_value": obtained,
+        "message": None,
+        "msg_text": None,
+        "msg_params": None,
+        "advice": None,
+        "adv_text": None,
+        "adv_params": None,
+        "data": data,
+    }
+
+
 def _normalize_message_value(value):
     if isinstance(value, str):
         preserve_leading_space = value.startswith(" ")
@@ -65,6 +124,21 @@ def format_response(
     advice_text=None,
     advice_params=None,
 ):
+    if is_valid and _report.get() == REPORT_FAILURES:
+        return _compact_response(
+            title,
+            parent,
+            parent_id,
+            parent_article_type,
+            parent_lang,
+            item,
+            sub_item,
+            validation_type,
+            obtained,
+            obtained,
+            data,
+        )
+
     message_expected = (
         expected.removeprefix("one of ")
         if isinstance(expected, str)
@@ -163,6 +237,21 @@ def build_response(
     advice_text=None,
     advice_params=None,
 ):
+    if is_valid and _report.get() == REPORT_FAILURES:
+        return _compact_response(
+            title,
+            parent.get("parent"),
+            parent.get("parent_id"),
+            parent.get("parent_article_type"),
+            parent.get("parent_lang"),
+            item,
+            sub_item,
+            validation_type,
+            expected,
+            obtained,
+            data,
+        )
+
     message_expected = (
         expected.removeprefix("one of ")
         if isinstance(expected, str)
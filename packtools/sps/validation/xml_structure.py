@@ -1,19 +1,20 @@
 # coding=utf-8
-import os
-from tempfile import TemporaryDirectory
+from io import BytesIO
 
-from packtools import XMLValidator, etree, XML
+from packtools import XMLValidator
 from packtools.domain import SchematronValidator, PyValidator
 from packtools.sps import i18n
 
 
+# the DTDs bundled with packtools are resolved by the parser
+# (see ``packtools.utils.XMLCatalogResolver``), without the need of the
+# ``XML_CATALOG_FILES`` environment variable
 IS_PACKTOOLS_INSTALLED = False
 try:
     from packtools.catalogs import XML_CATALOG
-    os.environ['XML_CATALOG_FILES'] = XML_CATALOG
-    IS_PACKTOOLS_INSTALLED = True
+    IS_PACKTOOLS_INSTALLED = bool(XML_CATALOG)
 except Exception as e:
-    os.environ['XML_CATALOG_FILES'] = ''
+    pass
 
 
 DEFAULT_VERSIONS = {
@@ -69,14 +70,12 @@ class StructureValidator:
             # the python based validation pipeline
         ]
 
-        with TemporaryDirectory() as targetdir:
-            filename = "a.xml"
-            target = os.path.join(targetdir, filename)
-            with open(target, 'w') as fp:
-                fp.write(self.xml_with_pre.tostring())
-            # saved optimised
-            with open(target, "rb") as fp:
-                self.xml_validator = XMLValidator.parse(XML(fp))
+        # the DTD bundled with packtools is parsed once per PUBLIC ID and
+        # shared by all the XMLValidator instances. It is also loaded while
+        # parsing, since the XML is serialized by annotate_errors
+        self.xml_validator = XMLValidator.parse(
+            BytesIO(self.xml_with_pre.tostring().encode("utf-8")),
+        )
 
     def validate_doctype(self, VERSIONS=None):
         VERSIONS = VERSIONS or self.VERSIONS or DEFAULT_VERSIONS
@@ -163,12 +162,9 @@ class StructureValidator:
             }
 
     def annotate_errors(self):
-        return etree.tostring(
-            self.xml_validator.annotate_errors(),
-            pretty_print=True,
-            encoding='utf-8',
-            xml_declaration=True,
-        ).decode("utf-8")
+        annotated = BytesIO()
+        self.xml_validator.write_annotated_errors(annotated)
+        return annotated.getvalue().decode("utf-8")
 
     def validate_dtd(self):
         try:
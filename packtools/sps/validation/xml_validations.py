@@ -1,3 +1,5 @@
+import functools
+
 from packtools.sps.validation.aff import FulltextAffiliationsValidation
 from packtools.sps.validation.article_abstract import (
     XMLAbstractsValidation,
@@ -9,6 +11,11 @@ from packtools.sps.validation.article_and_subarticles import (
     JATSAndDTDVersionValidation,
 )
 from packtools.sps.validation.article_contribs import XMLContribsValidation
+from packtools.sps.validation.code_lists import (
+    get_code_set,
+    get_credit_taxonomy,
+    get_special_chars_award_id,
+)
 from packtools.sps.validation.article_data_availability import (
     DataAvailabilityValidation,
 )
@@ -53,32 +60,35 @@ from packtools.sps.validation.response import ResponseValidation
 from packtools.sps.validation.sec import XMLSecValidation
 from packtools.sps.validation.product import ArticleProductValidation
 from packtools.sps.validation.permissions import PermissionsValidation
+from packtools.sps.validation.profiling import measure_check
 
 
 def validate_affiliations(xmltree, params):
     aff_rules = {}
     aff_rules.update(params["aff_rules"])
     aff_rules["country_codes_list"] = params["country_codes_list"]
+    aff_rules["country_codes_set"] = get_code_set(params, "country_codes_list")
     validator = FulltextAffiliationsValidation(xmltree, aff_rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_abstracts(xmltree, params):
     validator = XMLAbstractsValidation(xmltree, params)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_article(xmltree, params):
     validator = JATSAndDTDVersionValidation(xmltree, params["article_rules"])
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_article_languages(xmltree, params):
     rules = {}
     rules.update(params["article_languages_rules"])
     rules["language_codes_list"] = params["language_codes_list"]
+    rules["language_codes_set"] = get_code_set(params, "language_codes_list")
     validator = ArticleLangValidation(xmltree, rules)
-    yield from validator.validate_language()
+    yield from measure_check(validator.validate_language)
 
 
 def validate_article_type(xmltree, params):
@@ -89,47 +99,52 @@ def validate_article_type(xmltree, params):
     rules["journal_data"] = params["journal_data"]
 
     validator = ArticleTypeValidation(xmltree, rules)
-    yield from validator.validate_article_type()
-    yield from validator.validate_article_type_vs_subject_similarity()
+    yield from measure_check(validator.validate_article_type)
+    yield from measure_check(validator.validate_article_type_vs_subject_similarity)
 
 
 def validate_article_ids(xmltree, params):
 
     validator = ArticleIdValidation(xmltree, params["article_ids_rules"])
-    yield from validator.validate_article_id_other()
+    yield from measure_check(validator.validate_article_id_other)
 
     article_doi_rules = params["article_doi_rules"]
     validator = ArticleDoiValidation(xmltree)
-    yield from validator.validate_doi_exists(
-        error_level=article_doi_rules["error_level"]
+    yield from measure_check(
+        validator.validate_doi_exists,
+        error_level=article_doi_rules["error_level"],
     )
 
-    yield from validator.validate_doi_registered(
+    yield from measure_check(
+        validator.validate_doi_registered,
         callable_get_data=params.get("doi_api_get"),
         error_level=article_doi_rules["registered_doi_error_level"],
     )
-    yield from validator.validate_all_dois_are_unique(
-        error_level=article_doi_rules["unique_error_level"]
+    yield from measure_check(
+        validator.validate_all_dois_are_unique,
+        error_level=article_doi_rules["unique_error_level"],
     )
-    yield from validator.validate_different_doi_in_translation(
-        error_level=article_doi_rules["translation_doi_error_level"]
+    yield from measure_check(
+        validator.validate_different_doi_in_translation,
+        error_level=article_doi_rules["translation_doi_error_level"],
     )
 
 
 def validate_references(xmltree, params):
-    references_rules = params["references_rules"]
+    references_rules = dict(params["references_rules"])
     validator = ReferencesValidation(xmltree, references_rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_article_contribs(xmltree, params):
     rules = {}
     rules.update(params["article_contribs_rules"])
+    rules["credit_taxonomy"] = get_credit_taxonomy(params)
 
     # callable (customized) which checks orcid is registered
     rules["is_orcid_registered"] = params.get("is_orcid_registered")
     validator = XMLContribsValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_open_science_actions(xmltree, params):
@@ -138,7 +153,8 @@ def validate_open_science_actions(xmltree, params):
 
     validator = ArticleLicenseValidation(xmltree)
     try:
-        yield from validator.validate_license_code(
+        yield from measure_check(
+            validator.validate_license_code,
             expected_code=params["journal_data"]["license_code"],
             error_level=license_rules["error_level"],
         )
@@ -146,10 +162,12 @@ def validate_open_science_actions(xmltree, params):
         pass
 
     validator = DataAvailabilityValidation(xmltree, data_availability_rules)
-    yield from validator.validate_data_availability()
+    yield from measure_check(validator.validate_data_availability)
 
-    validator = XMLFnGroupValidation(xmltree, params["fn_rules"])
-    yield from validator.validate_edited_by()
+    fn_rules = dict(params["fn_rules"])
+    fn_rules["article_index"] = params.get("article_index")
+    validator = XMLFnGroupValidation(xmltree, fn_rules)
+    yield from measure_check(validator.validate_edited_by)
 
 
 def validate_article_toc_sections(xmltree, params):
@@ -158,7 +176,7 @@ def validate_article_toc_sections(xmltree, params):
     rules.update(params["article_toc_section_rules"])
 
     validator = XMLTocSectionsValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_id_and_rid_match(xmltree, params):
@@ -167,51 +185,56 @@ def validate_id_and_rid_match(xmltree, params):
     merged_rules = {}
     merged_rules.update(id_and_rid_match_rules)
     merged_rules.update(xref_rules)
+    merged_rules["article_index"] = params.get("article_index")
     validator = ArticleXrefValidation(xmltree, merged_rules)
-    yield from validator.validate_rid_presence()
-    yield from validator.validate_ref_type_presence()
-    yield from validator.validate_ref_type_value()
-    yield from validator.validate_bibr_presence()
-    yield from validator.validate_rid_has_corresponding_id()
-    yield from validator.validate_transcript_xref()
-    yield from validator.validate_aff_self_closing()
-    yield from validator.validate_xref_rid_has_corresponding_element_id()
-    yield from validator.validate_element_id_has_corresponding_xref_rid()
-    yield from validator.validate_attrib_name_and_value_has_corresponding_xref()
+    yield from measure_check(validator.validate_rid_presence)
+    yield from measure_check(validator.validate_ref_type_presence)
+    yield from measure_check(validator.validate_ref_type_value)
+    yield from measure_check(validator.validate_bibr_presence)
+    yield from measure_check(validator.validate_rid_has_corresponding_id)
+    yield from measure_check(validator.validate_transcript_xref)
+    yield from measure_check(validator.validate_aff_self_closing)
+    yield from measure_check(validator.validate_xref_rid_has_corresponding_element_id)
+    yield from measure_check(validator.validate_element_id_has_corresponding_xref_rid)
+    yield from measure_check(
+        validator.validate_attrib_name_and_value_has_corresponding_xref,
+    )
 
 
 def validate_article_dates(xmltree, params):
     article_dates_rules = params["article_dates_rules"]
     validator = FulltextDatesValidation(xmltree, article_dates_rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_figs(xmltree, params):
-    rules = params["fig_rules"]
+    rules = dict(params["fig_rules"])
     rules.update(params["article_type_rules"])
+    rules["article_index"] = params.get("article_index")
     validator = ArticleFigValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_tablewraps(xmltree, params):
-    rules = params["table_wrap_rules"]
+    rules = dict(params["table_wrap_rules"])
     rules.update(params["article_type_rules"])
+    rules["article_index"] = params.get("article_index")
     validator = ArticleTableWrapValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_equations(xmltree, params):
-    rules = params["disp_formula_rules"]
+    rules = dict(params["disp_formula_rules"])
     rules.update(params["article_type_rules"])
     validator = ArticleDispFormulaValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_inline_equations(xmltree, params):
-    rules = params["inline_formula_rules"]
+    rules = dict(params["inline_formula_rules"])
     rules.update(params["article_type_rules"])
     validator = ArticleInlineFormulaValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_bibliographic_strip(xmltree, params):
@@ -219,38 +242,52 @@ def validate_bibliographic_strip(xmltree, params):
     rules.update(params)
 
     validator = IssueValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
     validator = PaginationValidation(xmltree, rules)
-    yield validator.validate()
+
+    @functools.wraps(validator.validate)
+    def validate_pagination():
+        # PaginationValidation.validate returns a single result
+        yield validator.validate()
+
+    yield from measure_check(validate_pagination)
 
 
 def validate_funding_data(xmltree, params):
     funding_data_rules = params["funding_data_rules"]
-    validator = FundingGroupValidation(xmltree, funding_data_rules)
+    rules = dict(funding_data_rules)
+    rules["special_chars_award_id"] = get_special_chars_award_id(params)
+    validator = FundingGroupValidation(xmltree, rules)
     
     # Existing validations
-    yield from validator.validate_required_award_ids()
-    yield from validator.validate_funding_statement()
+    yield from measure_check(validator.validate_required_award_ids)
+    yield from measure_check(validator.validate_funding_statement)
     
     # New SPS 1.10 validations
-    yield from validator.validate_funding_group_uniqueness(
-        error_level=funding_data_rules.get("funding_group_uniqueness_error_level", "ERROR")
+    yield from measure_check(
+        validator.validate_funding_group_uniqueness,
+        error_level=funding_data_rules.get("funding_group_uniqueness_error_level", "ERROR"),
     )
-    yield from validator.validate_funding_statement_presence(
-        error_level=funding_data_rules.get("funding_statement_error_level", "CRITICAL")
+    yield from measure_check(
+        validator.validate_funding_statement_presence,
+        error_level=funding_data_rules.get("funding_statement_error_level", "CRITICAL"),
     )
-    yield from validator.validate_funding_source_in_award_group(
-        error_level=funding_data_rules.get("funding_source_in_award_group_error_level", "CRITICAL")
+    yield from measure_check(
+        validator.validate_funding_source_in_award_group,
+        error_level=funding_data_rules.get("funding_source_in_award_group_error_level", "CRITICAL"),
     )
-    yield from validator.validate_label_absence(
-        error_level=funding_data_rules.get("label_absence_error_level", "ERROR")
+    yield from measure_check(
+        validator.validate_label_absence,
+        error_level=funding_data_rules.get("label_absence_error_level", "ERROR"),
     )
-    yield from validator.validate_title_absence(
-        error_level=funding_data_rules.get("title_absence_error_level", "ERROR")
+    yield from measure_check(
+        validator.validate_title_absence,
+        error_level=funding_data_rules.get("title_absence_error_level", "ERROR"),
     )
-    yield from validator.validate_award_id_funding_source_consistency(
-        error_level=funding_data_rules.get("award_id_consistency_error_level", "WARNING")
+    yield from measure_check(
+        validator.validate_award_id_funding_source_consistency,
+        error_level=funding_data_rules.get("award_id_consistency_error_level", "WARNING"),
     )
 
 
@@ -267,20 +304,23 @@ def validate_journal_meta(xmltree, params):
     journal_rules = params["journal_rules"]
     validator = TitleValidation(xmltree)
 
-    yield from validator.abbreviated_journal_title_validation(
+    yield from measure_check(
+        validator.abbreviated_journal_title_validation,
         expected_value=journal_data["abbrev_journal_title"],
         error_level=journal_rules["abbrev_journal_title_error_level"],
     )
 
     validator = PublisherNameValidation(xmltree)
-    yield from validator.validate_publisher_names(
+    yield from measure_check(
+        validator.validate_publisher_names,
         publisher_name_list=journal_data["publisher_name_list"],
         error_level=journal_rules["publisher_name_error_level"],
     )
 
     try:
         validator = JournalIdValidation(xmltree)
-        yield from validator.nlm_ta_id_validation(
+        yield from measure_check(
+            validator.nlm_ta_id_validation,
             expected_value=journal_data["nlm_journal_title"],
             error_level=journal_rules["nlm_journal_title_error_level"],
         )
@@ -290,22 +330,27 @@ def validate_journal_meta(xmltree, params):
 
 def validate_metadata_languages(xmltree, params):
     validator = MetadataLanguagesValidation(xmltree)
-    yield from validator.validate(params["metadata_languages_rules"]["error_level"])
+    yield from measure_check(
+        validator.validate,
+        params["metadata_languages_rules"]["error_level"],
+    )
 
 
 def validate_related_articles(xmltree, params):
-    validator = XMLRelatedArticlesValidation(xmltree, params["related_article_rules"])
-    yield from validator.validate()
+    validator = XMLRelatedArticlesValidation(xmltree, dict(params["related_article_rules"]))
+    yield from measure_check(validator.validate)
 
 
 def validate_fns(xmltree, params):
-    validator = XMLFnGroupValidation(xmltree, params["fn_rules"])
-    yield from validator.validate()
+    fn_rules = dict(params["fn_rules"])
+    fn_rules["article_index"] = params.get("article_index")
+    validator = XMLFnGroupValidation(xmltree, fn_rules)
+    yield from measure_check(validator.validate)
 
 
 def validate_author_notes(xmltree, params):
-    validator = XMLAuthorNotesValidation(xmltree, params["author_notes_rules"])
-    yield from validator.validate()
+    validator = XMLAuthorNotesValidation(xmltree, dict(params["author_notes_rules"]))
+    yield from measure_check(validator.validate)
 
 
 def validate_peer_reviews(xmltree, params):
@@ -314,36 +359,36 @@ def validate_peer_reviews(xmltree, params):
     rules.update(params["peer_review_rules"])
 
     validator = XMLPeerReviewValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_accessibility_data(xmltree, params):
     rules = {}
     rules.update(params["accessibility_data_rules"])
     validator = XMLAccessibilityDataValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_media(xmltree, params):
     rules = {}
     rules.update(params["visual_resource_base_rules"])
     validator = XMLMediaValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_app_group(xmltree, params):
     rules = {}
     rules.update(params["app_group_rules"])
     validator = AppValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_supplementary_materials(xmltree, params):
     rules = dict(params["supplementary_materials_rules"])
-    rules["media_rules"] = params["visual_resource_base_rules"]
-    rules["graphic_rules"] = params["graphic_rules"]
+    rules["media_rules"] = dict(params["visual_resource_base_rules"])
+    rules["graphic_rules"] = dict(params["graphic_rules"])
     validator = XmlSupplementaryMaterialValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_history(xmltree, params):
@@ -351,7 +396,7 @@ def validate_history(xmltree, params):
     rules = {}
     rules.update(params.get("history_dates_rules", {}))
     validator = HistoryValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 def validate_ext_links(xmltree, params):
     """
@@ -364,20 +409,20 @@ def validate_ext_links(xmltree, params):
     - Descriptive text (accessibility)
     - @xlink:title requirement for generic/URL text
     """
-    ext_link_rules = params["ext_link_rules"]
+    ext_link_rules = dict(params["ext_link_rules"])
     validator = ExtLinkValidation(xmltree, ext_link_rules)
-    yield from validator.validate_ext_link_type_presence()
-    yield from validator.validate_xlink_href_presence()
-    yield from validator.validate_xlink_href_format()
-    yield from validator.validate_ext_link_type_value()
-    yield from validator.validate_descriptive_text()
-    yield from validator.validate_xlink_title_when_generic()
+    yield from measure_check(validator.validate_ext_link_type_presence)
+    yield from measure_check(validator.validate_xlink_href_presence)
+    yield from measure_check(validator.validate_xlink_href_format)
+    yield from measure_check(validator.validate_ext_link_type_value)
+    yield from measure_check(validator.validate_descriptive_text)
+    yield from measure_check(validator.validate_xlink_title_when_generic)
 
 
 def validate_lists(xmltree, params):
-    rules = params["list_rules"]
+    rules = dict(params["list_rules"])
     validator = ArticleListValidation(xmltree, rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
     
 def validate_graphics(xmltree, params):
@@ -393,9 +438,9 @@ def validate_graphics(xmltree, params):
     Note: Accessibility validation (<alt-text>, <long-desc>) is handled separately
     by validate_accessibility_data() via XMLAccessibilityDataValidation.
     """
-    graphic_rules = params["graphic_rules"]
+    graphic_rules = dict(params["graphic_rules"])
     validator = XMLGraphicValidation(xmltree, graphic_rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
 
 def validate_response(xmltree, params):
@@ -409,9 +454,9 @@ def validate_response(xmltree, params):
     - <front-stub> presence
     - <body> presence
     """
-    response_rules = params.get("response_rules", {})
+    response_rules = dict(params.get("response_rules") or {})
     validator = ResponseValidation(xmltree, response_rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
     
 def validate_secs(xmltree, params):
@@ -427,9 +472,9 @@ def validate_secs(xmltree, params):
     - Non-combinable sec-types
     - Content presence
     """
-    sec_rules = params["sec_rules"]
+    sec_rules = dict(params["sec_rules"])
     validator = XMLSecValidation(xmltree, sec_rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
 
     
 def validate_products(xmltree, params):
@@ -442,9 +487,9 @@ def validate_products(xmltree, params):
     - Consistency with @article-type="book-review"
     - Recommended elements (author, publisher-name, year)
     """
-    product_rules = params["product_rules"]
+    product_rules = dict(params["product_rules"])
     validator = ArticleProductValidation(xmltree, product_rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
     
     
 def validate_permissions(xmltree, params):
@@ -460,6 +505,6 @@ def validate_permissions(xmltree, params):
     - <license-p> presence
     - Copyright structure when present
     """
-    permissions_rules = params.get("permissions_rules", {})
+    permissions_rules = dict(params.get("permissions_rules") or {})
     validator = PermissionsValidation(xmltree, permissions_rules)
-    yield from validator.validate()
+    yield from measure_check(validator.validate)
@@ -1,13 +1,58 @@
+from contextvars import copy_context
+
+from packtools.sps.models.article_index import ArticleIndex
+from packtools.sps.utils import xml_utils
 from packtools.sps.validation import xml_validations
-from packtools.sps.validation.xml_validator_rules import get_default_rules
+from packtools.sps.validation.profiling import SETUP_GROUP, set_profile
+from packtools.sps.validation.utils import REPORT_ALL, REPORT_FAILURES, set_report
+from packtools.sps.validation.xml_validator_rules import get_ruleset
+
+
+def get_validation_results(xmltree, params, report=REPORT_ALL, profile=None):
+    """
+    Validates xmltree and yields one flat result per validation item
+
+    params may be a ``RuleSet`` (see ``xml_validator_rules.get_ruleset``),
+    which is used as is and can be shared across documents, or a dict of
+    rules which overrides the default rules.
+
+    report="failures" yields only the results which are not OK (and the
+    exceptions); the OK results are built as compact records, without
+    formatting nor localizing their messages, and then discarded.
+
+    profile may be a ``profiling.DocumentProfile``, which records the time
+    spent by each group of the validation and by each validator method
+    (check) of the groups.
+    """
+    # the report mode only applies to the validators run by this generator
+    context = copy_context()
+    context.run(set_report, report)
+    # os validadores extraem, repetidamente, textos dos mesmos elementos
+    context.run(xml_utils.set_text_memo)
+    context.run(set_profile, profile)
+    results = _get_validation_results(xmltree, params, profile)
+    while True:
+        try:
+            data = context.run(next, results)
+        except StopIteration:
+            return
+        if report == REPORT_FAILURES and data.get("response") == "OK":
+            continue
+        yield data
 
 
-def get_validation_results(xmltree, params):
-    for result in validate_xml_content(xmltree, params):
+def _get_validation_results(xmltree, params, profile=None):
+    groups = validate_xml_content(xmltree, params)
+    if profile is not None:
+        groups = profile.measure(SETUP_GROUP, groups)
+    for result in groups:
         try:
             group = None
             group = result["group"]
-            for index, item in enumerate(result["items"]):
+            items = result["items"]
+            if profile is not None:
+                items = profile.measure(group, items)
+            for index, item in enumerate(items):
                 if not item:
                     continue
                 try:
@@ -34,8 +79,10 @@ def get_validation_results(xmltree, params):
 
 
 def validate_xml_content(xmltree, rules):
-    params = get_default_rules()
-    params.update(rules or {})
+    params = get_ruleset(rules)
+    if not params.get("article_index"):
+        # built in one tree pass and shared by the validators
+        params = params.override({"article_index": ArticleIndex(xmltree)})
     yield {
         "group": "journal-meta",
         "items": xml_validations.validate_journal_meta(xmltree, params),
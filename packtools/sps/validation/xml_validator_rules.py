@@ -1,6 +1,15 @@
+import copy
+import functools
 import os
 import json
+from collections.abc import Mapping
 from importlib.resources import files
+from types import MappingProxyType
+
+
+RULES_PACKAGE = "packtools.sps.validation_rules"
+# lookups kept by the rule sets derived from the same RuleSet
+LOOKUPS_MAXSIZE = 128
 
 
 def json_loads(content):
@@ -23,14 +32,172 @@ def fix_json(content):
     return temp.replace(", ]", "]").replace(", }", "}")
 
 
-def get_default_rules():
-    params_path = "packtools.sps.validation_rules"
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only")
+
+
+class FrozenList(list):
+    """
+    Read-only list of the rules
+
+    It is compared, concatenated, formatted and serialized as a list, so the
+    results of the validations, which often include rule values, do not
+    change. Copies (``copy``, ``deepcopy``, ``pickle``) are plain lists.
+    """
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict of the rules, the FrozenList counterpart for mappings
+    """
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+def _freeze_value(value):
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenDict(
+            (key, _freeze_value(item)) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return FrozenList(_freeze_value(item) for item in value)
+    return value
+
+
+def _freeze(value):
+    """
+    Returns a read-only copy of a rule group: the group becomes a
+    MappingProxyType and the mappings and lists it holds, at any depth,
+    FrozenDict and FrozenList
+    """
+    if isinstance(value, MappingProxyType):
+        # already frozen by RuleSet
+        return value
+    if isinstance(value, Mapping):
+        return MappingProxyType(
+            {key: _freeze_value(item) for key, item in value.items()}
+        )
+    return _freeze_value(value)
+
+
+def _thaw(value):
+    """
+    Returns a mutable deep copy of a frozen value (dicts and lists)
+    """
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_thaw(item) for item in value]
+    return copy.deepcopy(value)
+
+
+class RuleSet(Mapping):
+    """
+    Read-only set of validation rules, shared by every validated document.
+
+    Keys are the rule groups found in ``packtools.sps.validation_rules``
+    (``fig_rules``, ``aff_rules``, ...) plus runtime values such as
+    ``journal_data``. The rules are frozen at any depth: groups are exposed
+    as read-only mappings, and the mappings and lists they hold as
+    ``FrozenDict`` and ``FrozenList``. Callers which need to
+    complete a group (``setdefault``, ``update``) work on a shallow copy,
+    for instance ``dict(ruleset["fig_rules"])``; the values it holds are
+    immutable and can be shared.
+
+    Layers are applied with ``override`` (defaults -> collection -> journal
+    -> call). Each layer returns a new ``RuleSet``; a group given as a
+    mapping is merged into the existing group, any other value replaces it.
+
+    >>> ruleset = get_default_ruleset().override(collection_rules, journal_rules)
+    >>> for item in get_validation_results(xmltree, ruleset): ...
+    """
+
+    def __init__(self, rules=None, _lookups=None):
+        self._rules = MappingProxyType(
+            {name: _freeze(value) for name, value in (rules or {}).items()}
+        )
+        # (build, id(value)) -> (value, build(value)), shared by the rule
+        # sets obtained with override
+        self._lookups = {} if _lookups is None else _lookups
+
+    def __getitem__(self, name):
+        return self._rules[name]
+
+    def __iter__(self):
+        return iter(self._rules)
+
+    def __len__(self):
+        return len(self._rules)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({sorted(self._rules)})"
+
+    def __reduce__(self):
+        # MappingProxyType is not picklable
+        return (type(self), (self.to_dict(),))
+
+    def override(self, *layers):
+        layers = [layer for layer in layers if layer]
+        if not layers:
+            return self
+
+        rules = dict(self._rules)
+        for layer in layers:
+            for name, value in layer.items():
+                current = rules.get(name)
+                if isinstance(value, Mapping) and isinstance(current, Mapping):
+                    merged = dict(current)
+                    merged.update(value)
+                    value = merged
+                rules[name] = value
+        return type(self)(rules, self._lookups)
+
+    def get_lookup(self, name, build):
+        """
+        Returns ``build(self[name])``, for structures derived from the rules,
+        such as the ``frozenset`` of a code list (see ``code_lists``)
+
+        It is built once and reused by the rule sets obtained with
+        ``override`` which keep the same ``self[name]``.
+        """
+        value = self._rules[name]
+        key = (build, id(value))
+        cached = self._lookups.get(key)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        if len(self._lookups) >= LOOKUPS_MAXSIZE:
+            self._lookups.clear()
+        lookup = build(value)
+        # keeps value, so its id is not reused while the entry exists
+        self._lookups[key] = (value, lookup)
+        return lookup
+
+    def to_dict(self):
+        """
+        Returns a mutable deep copy of the rules
+        """
+        return {name: _thaw(value) for name, value in self._rules.items()}
+
+
+def _read_default_rules():
     rules = {}
-    for entry in files(params_path).iterdir():
+    for entry in files(RULES_PACKAGE).iterdir():
         filename = entry.name
         if filename.endswith(".json"):
             content = (
-                files(params_path)
+                files(RULES_PACKAGE)
                 .joinpath(filename)
                 .read_text()
             )
@@ -39,7 +206,45 @@ def get_default_rules():
     return rules
 
 
+@functools.lru_cache(maxsize=None)
+def get_default_ruleset():
+    """
+    Returns the default rules, read and parsed only once per process
+    """
+    return RuleSet(_read_default_rules())
+
+
+def get_ruleset(*layers):
+    """
+    Returns the default ``RuleSet`` overridden by ``layers``
+
+    A single ``RuleSet`` is returned as is, so a rule set built once can be
+    shared by thousands of documents.
+    """
+    if len(layers) == 1 and isinstance(layers[0], RuleSet):
+        return layers[0]
+    return get_default_ruleset().override(*layers)
+
+
+def get_default_rules():
+    return get_default_ruleset().to_dict()
+
+
+@functools.lru_cache(maxsize=None)
+def get_group_ruleset(group):
+    """
+    Returns the read-only rules of ``{group}_rules.json``, read and parsed
+    only once per process
+    """
+    content = files(RULES_PACKAGE).joinpath(f"{group}_rules.json").read_text()
+    return RuleSet(json_loads(content))
+
+
 def get_group_rules(group):
-    params_path = "packtools.sps.validation_rules"
-    content = files(params_path).joinpath(f"{group}_rules.json").read_text()
-    return json_loads(content)
+    """
+    Returns a mutable deep copy of the rules of ``{group}_rules.json``
+
+    The copy is made on every call; callers which only read the rules use
+    ``get_group_ruleset``.
+    """
+    return get_group_ruleset(group).to_dict()
@@ -55,6 +55,15 @@ def search_element(doc, xpath, line=None):
     raise ValueError('could not find element "%s"' % xpath)
 
 
+def get_elements_by_line(doc):
+    """Maps each line of `doc` to the first element found at it.
+    """
+    elements_by_line = {}
+    for elem in doc.iter():
+        elements_by_line.setdefault(elem.sourceline, elem)
+    return elements_by_line
+
+
 #--------------------------------
 # adapters for XML style errors
 #--------------------------------
@@ -101,10 +110,20 @@ class SchemaStyleError(StyleErrorBase):
         self.line = self._err.line
         self.label = label
 
-    def get_apparent_element(self, doc):
-        for elem in doc.iter():
-            if elem.sourceline == self.line:
-                return elem
+    def get_apparent_element(self, doc, elements_by_line=None):
+        """The apparent element presenting the error at doc.
+
+        :param elements_by_line: (optional) the result of
+                                 :func:`get_elements_by_line` for `doc`, to
+                                 locate the element without searching `doc`.
+        """
+        if elements_by_line is not None:
+            if self.line in elements_by_line:
+                return elements_by_line[self.line]
+        else:
+            for elem in doc.iter():
+                if elem.sourceline == self.line:
+                    return elem
 
         LOGGER.info("cannot find element at the line %s", self.line)
         raise ValueError("cannot find element at the line %s" % self.line)
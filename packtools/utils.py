@@ -10,9 +10,18 @@ import json
 import unicodedata
 import zipfile
 import io
+import hashlib
+import tempfile
+import multiprocessing
+import collections
+import threading
+import time
+import warnings
+from contextvars import ContextVar
 
 from lxml import etree, isoschematron
-from PIL import Image, ImageFile
+from PIL import Image
+from PIL import __version__ as PILLOW_VERSION
 try:
     import pygments     # NOQA
     from pygments.lexers import get_lexer_for_mimetype
@@ -21,6 +30,7 @@ except ImportError:
     pygments = False    # NOQA
 
 from packtools import catalogs, exceptions
+from packtools.lib.file_utils import DEFAULT_COMPRESSION_POLICY, copy_zip_member
 
 
 LOGGER = logging.getLogger(__name__)
@@ -84,6 +94,83 @@ def get_static_assets(xml_et):
     return [element.attrib['{http://www.w3.org/1999/xlink}href'] for element in elements]
 
 
+_xml_parsers = threading.local()
+_parse_timings = ContextVar('packtools_utils_parse_timings', default=None)
+
+
+def get_xml_parser(remove_blank_text=False, load_dtd=False, no_network=True,
+                   huge_tree=False, collect_ids=True):
+    """Returns the XML parser of the current thread for the given options.
+
+    The parsers are created once per thread and per combination of options,
+    since creating a parser for each XML costs as much as parsing a small
+    XML. Being kept per thread, a parser is never shared between threads.
+    The DTDs bundled with packtools are resolved by
+    :class:`XMLCatalogResolver`.
+
+    :param remove_blank_text: (optional) discard the blank text nodes.
+    :param load_dtd: (optional) load the external DTD.
+    :param no_network: (optional) prevent network access for external DTD.
+    :param huge_tree: (optional) disable the libxml2 limits to the size of
+                      text nodes and the depth of the tree, that may be
+                      exceeded by MathML-heavy articles.
+    :param collect_ids: (optional) collect the ids in a hash table.
+    """
+    key = (remove_blank_text, load_dtd, no_network, huge_tree, collect_ids)
+    parsers = setdefault(_xml_parsers, 'parsers', lambda: {})
+    try:
+        return parsers[key]
+    except KeyError:
+        parser = etree.XMLParser(remove_blank_text=remove_blank_text,
+                                 load_dtd=load_dtd,
+                                 no_network=no_network,
+                                 huge_tree=huge_tree,
+                                 collect_ids=collect_ids)
+        parser.resolvers.add(XMLCatalogResolver())
+        parsers[key] = parser
+        return parser
+
+
+def set_parse_timings(timings=None):
+    """Records, in the current context, the duration in seconds of each
+    parse made by :func:`parse_bytes` and :func:`parse_path`.
+
+    :param timings: (optional) list to which the durations are appended.
+                    If ``None``, the durations are not recorded.
+    """
+    _parse_timings.set(timings)
+
+
+def _parse(parse, source, parser):
+    timings = _parse_timings.get()
+    if timings is None:
+        return parse(source, parser)
+
+    start = time.perf_counter()
+    try:
+        return parse(source, parser)
+    finally:
+        timings.append(time.perf_counter() - start)
+
+
+def parse_bytes(content, **parser_options):
+    """Parses the XML ``content`` and returns its root element.
+
+    :param content: bytes, or str without encoding declaration.
+    :param parser_options: options of :func:`get_xml_parser`.
+    """
+    return _parse(etree.fromstring, content, get_xml_parser(**parser_options))
+
+
+def parse_path(file, **parser_options):
+    """Parses ``file`` and returns an etree instance.
+
+    :param file: Path to the XML file, URL or file-object.
+    :param parser_options: options of :func:`get_xml_parser`.
+    """
+    return _parse(etree.parse, file, get_xml_parser(**parser_options))
+
+
 def XML(file, no_network=True, load_dtd=True):
     """Parses `file` to produce an etree instance.
 
@@ -92,14 +179,14 @@ def XML(file, no_network=True, load_dtd=True):
 
     :param file: Path to the XML file, URL or file-object.
     :param no_network: (optional) prevent network access for external DTD.
-    :param load_dtd: (optional) load DTD during parse-time.
+    :param load_dtd: (optional) load DTD during parse-time. It is required to
+                     expand the entities declared in the DTD, but not to
+                     validate the XML against the DTDs bundled with packtools.
+                     The DTDs bundled with packtools are loaded from
+                     :data:`packtools.catalogs.XML_CATALOG`.
     """
-    parser = etree.XMLParser(remove_blank_text=True,
-                             load_dtd=load_dtd,
-                             no_network=no_network)
-    xml = etree.parse(file, parser)
-
-    return xml
+    return parse_path(file, remove_blank_text=True, load_dtd=load_dtd,
+                      no_network=no_network)
 
 
 def get_schematron_from_buffer(buff, parser=NOIDS_XMLPARSER):
@@ -117,10 +204,144 @@ def get_schematron_from_filepath(filepath):
         return get_schematron_from_buffer(buff)
 
 
+SCH_NAMESPACE = 'http://purl.oclc.org/dsdl/schematron'
+
+
+class CompiledSchematron(isoschematron.Schematron):
+    """An ``isoschematron.Schematron`` built from its validation XSLT.
+
+    The iso-schematron steps (include, expand and compile) are skipped, so
+    ``validator_xslt`` must be the output of a previous compilation, e.g.
+    ``isoschematron.Schematron(doc, store_xslt=True).validator_xslt``.
+
+    ``isoschematron.Schematron.__init__`` always compiles the schema, so it
+    is not called and the attributes it would set, which are not part of the
+    lxml API, are set here. The instance validates an empty document before
+    it is returned: if the lxml version in use does not work with them, the
+    ``AttributeError`` or ``TypeError`` is raised here and
+    :func:`get_schematron_from_cache` compiles the schema as usual.
+    """
+    def __init__(self, validator_xslt, store_report=False):
+        etree._Validator.__init__(self)
+        self._store_report = store_report
+        self._schematron = None
+        self._validator_xslt = validator_xslt
+        self._validation_report = None
+        self._validator = etree.XSLT(validator_xslt)
+
+        self.validate(etree.Element('article'))
+        self._validation_report = None
+        self._clear_error_log()
+
+
+def _get_cache_base_dir():
+    return os.environ.get('PACKTOOLS_CACHE_DIR') or os.path.join(
+        os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+        'packtools')
+
+
+def get_schematron_cache_dir():
+    """Returns the directory where compiled schematron schemas are stored.
+
+    The directory is versioned by lxml and libxslt versions, since the
+    compiled XSLT depends on the iso-schematron skeleton shipped with lxml.
+    ``PACKTOOLS_CACHE_DIR`` environment variable overrides the base
+    directory, which defaults to ``$XDG_CACHE_HOME/packtools``.
+    """
+    base_dir = _get_cache_base_dir()
+    version = 'lxml-%s-libxslt-%s' % (
+        '.'.join(str(digit) for digit in etree.LXML_VERSION),
+        '.'.join(str(digit) for digit in etree.LIBXSLT_VERSION))
+    return os.path.join(base_dir, 'schematron', version)
+
+
+def get_schematron_hash(filepath):
+    """Returns the sha256 of the schematron at ``filepath`` and of the
+    schemas it includes (``<include href="..."/>``).
+    """
+    digest = hashlib.sha256()
+    pending = [os.path.abspath(filepath)]
+    seen = set()
+    while pending:
+        path = pending.pop(0)
+        if path in seen:
+            continue
+        seen.add(path)
+
+        with open(path, mode='rb') as fp:
+            content = fp.read()
+        digest.update(content)
+
+        doc = etree.fromstring(content, NOIDS_XMLPARSER)
+        for include in doc.iter('{%s}include' % SCH_NAMESPACE):
+            href = include.get('href')
+            if href:
+                pending.append(
+                    os.path.join(os.path.dirname(path), href))
+    return digest.hexdigest()
+
+
+def get_schematron_from_cache(filepath, cache_dir=None):
+    """Returns an ``isoschematron.Schematron`` for ``filepath``, reusing the
+    validation XSLT compiled by a previous run.
+
+    The compiled XSLT is stored at ``cache_dir`` (defaults to
+    ``get_schematron_cache_dir()``), keyed by the hash of the schema
+    content. If the cache can't be read or written the schema is compiled
+    as usual.
+    """
+    cache_dir = cache_dir or get_schematron_cache_dir()
+    try:
+        cache_path = os.path.join(
+            cache_dir, get_schematron_hash(filepath) + '.xsl')
+    except (OSError, etree.XMLSyntaxError) as exc:
+        LOGGER.info('cannot compute the hash of "%s": %s', filepath, exc)
+        return get_schematron_from_filepath(filepath)
+
+    try:
+        validator_xslt = etree.parse(cache_path, NOIDS_XMLPARSER)
+    except (OSError, etree.XMLSyntaxError):
+        LOGGER.debug('compiled schematron not found at "%s"', cache_path)
+    else:
+        try:
+            return CompiledSchematron(validator_xslt)
+        except etree.XSLTParseError as exc:
+            LOGGER.info('ignoring invalid compiled schematron "%s": %s',
+                        cache_path, exc)
+        except (AttributeError, TypeError) as exc:
+            LOGGER.info('cannot load compiled schematrons with lxml %s: %s',
+                        etree.__version__, exc)
+            return get_schematron_from_filepath(filepath)
+
+    with open(filepath, mode='rb') as buff:
+        xmlschema_doc = etree.parse(buff, NOIDS_XMLPARSER)
+    schematron = isoschematron.Schematron(xmlschema_doc, store_xslt=True)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temporary file first, since other processes may be
+        # reading the same cache entry
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(etree.tostring(schematron.validator_xslt))
+            os.replace(tmp_path, cache_path)
+        finally:
+            # not moved to cache_path if the write or the rename failed
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    except OSError as exc:
+        LOGGER.info('cannot store the compiled schematron at "%s": %s',
+                    cache_path, exc)
+    return schematron
+
+
 def config_xml_catalog(wrapped):
-    """Decorator that wraps the execution of a function, setting-up and
-    tearing-down the ``XML_CATALOG_FILES`` environment variable for the current
-    process.
+    """Deprecated decorator kept for backwards compatibility. It used to set-up
+    and tear-down the ``XML_CATALOG_FILES`` environment variable for the
+    current process, what is not needed anymore since :func:`XML` resolves the
+    DTDs bundled with packtools by means of :class:`XMLCatalogResolver`.
+    It emits a ``DeprecationWarning`` and does nothing else.
 
     .. code-block:: python
 
@@ -129,16 +350,16 @@ def config_xml_catalog(wrapped):
            xml = XMLValidator(xml_filepath)
            # do some work here
     """
+    warnings.warn(
+        'config_xml_catalog is deprecated: the DTDs bundled with packtools '
+        'are resolved by XMLCatalogResolver, without XML_CATALOG_FILES.',
+        DeprecationWarning,
+        stacklevel=2,
+    )
+
     @functools.wraps(wrapped)
     def wrapper(*args, **kwargs):
-        try:
-            os.environ['XML_CATALOG_FILES'] = catalogs.XML_CATALOG
-            _return = wrapped(*args, **kwargs)
-
-        finally:
-            del(os.environ['XML_CATALOG_FILES'])
-
-        return _return
+        return wrapped(*args, **kwargs)
     return wrapper
 
 
@@ -241,6 +462,15 @@ class Xray(object):
                 in zip(self._zipfile.infolist(), self._zipfile.namelist())
                 if fileinfo.file_size]
 
+    @cachedmethod
+    def members_index(self):
+        """Returns the package members as a frozenset, for membership tests
+        in constant time.
+
+        The central directory of the zip file is read once.
+        """
+        return frozenset(self.show_members())
+
     def get_file(self, member, mode='r'):
         """Get file object for member.
 
@@ -286,6 +516,312 @@ def resolve_schematron_filepath(value):
         raise ValueError('could not locate file "%s" (I/O failure)' % value)
 
 
+XML_CATALOG_NAMESPACE = 'urn:oasis:names:tc:entity:xmlns:xml:catalog'
+
+
+@functools.lru_cache(maxsize=None)
+def _get_catalog_entries(catalog_path, entry, id_attribute):
+    # the DTD of the catalog is not needed
+    parser = etree.XMLParser(load_dtd=False, no_network=True)
+    catalog = etree.parse(catalog_path, parser)
+    base_dir = os.path.dirname(os.path.abspath(catalog_path))
+    return {
+        item.get(id_attribute): os.path.join(base_dir, item.get('uri'))
+        for item in catalog.iter('{%s}%s' % (XML_CATALOG_NAMESPACE, entry))
+    }
+
+
+def _get_public_ids_from_catalog(catalog_path):
+    return _get_catalog_entries(catalog_path, 'public', 'publicId')
+
+
+def _get_system_ids_from_catalog(catalog_path):
+    return _get_catalog_entries(catalog_path, 'system', 'systemId')
+
+
+class XMLCatalogResolver(etree.Resolver):
+    """Resolves the external DTDs to the files listed in the XML catalog at
+    ``catalog_path`` (defaults to :data:`packtools.catalogs.XML_CATALOG`).
+
+    The lookup is run against the ``public`` entries and then against the
+    ``system`` entries, as in ``prefer="public"``. Unknown DTDs are left to
+    the parser.
+
+    It replaces the ``XML_CATALOG_FILES`` environment variable: the resolver
+    is attached to the parser, so XML files can be parsed concurrently in
+    threads without changing the process environment.
+    """
+    def __init__(self, catalog_path=None):
+        super(XMLCatalogResolver, self).__init__()
+        self.catalog_path = catalog_path or catalogs.XML_CATALOG
+
+    def resolve(self, system_url, public_id, context):
+        filepath = (
+            _get_public_ids_from_catalog(self.catalog_path).get(public_id) or
+            _get_system_ids_from_catalog(self.catalog_path).get(system_url)
+        )
+        if filepath:
+            return self.resolve_filename(filepath, context)
+        return None
+
+
+def resolve_dtd_filepath(public_id, catalog_path=None):
+    """Determine the filepath of the DTD identified by ``public_id``.
+
+    The lookup is run against the ``public`` entries of the XML catalog at
+    ``catalog_path`` (defaults to :data:`packtools.catalogs.XML_CATALOG`).
+    """
+    catalog_path = catalog_path or catalogs.XML_CATALOG
+    try:
+        return _get_public_ids_from_catalog(catalog_path)[public_id]
+    except KeyError:
+        raise ValueError('cannot resolve DTD "%s"' % public_id)
+
+
+def get_image_cache_dir():
+    """Returns the directory where images derived by
+    :class:`WebImageGenerator` are stored. See :func:`get_schematron_cache_dir`.
+    """
+    return os.path.join(_get_cache_base_dir(), 'images')
+
+
+class DiskCache(object):
+    """On-disk cache of byte strings addressed by hex digest keys.
+
+    Entries are stored in ``cache_dir``, one file per key. When the cache
+    exceeds ``max_size`` bytes, the least recently used entries are removed.
+    Subclasses define ``get_key``.
+
+    :param cache_dir: (str) directory of the entries
+    :param max_size: (int) maximum size in bytes, defaults to ``DEFAULT_MAX_SIZE``
+    """
+    DEFAULT_MAX_SIZE = 1024 ** 3
+    ENTRY_NAME = 'entry'
+
+    def __init__(self, cache_dir, max_size=None):
+        self.cache_dir = cache_dir
+        self.max_size = max_size or self.DEFAULT_MAX_SIZE
+        self._size = None
+
+    def _get_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def get(self, key):
+        """Returns the bytes stored for ``key`` or ``None``.
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, 'rb') as fp:
+                data = fp.read()
+            # the modification time is the last use, see ``evict``
+            os.utime(path)
+        except OSError:
+            return None
+        LOGGER.debug('%s "%s" found in cache', self.ENTRY_NAME, key)
+        return data
+
+    def set(self, key, data):
+        """Stores ``data`` for ``key``. Errors are logged and ignored.
+        """
+        path = self._get_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            try:
+                with os.fdopen(fd, 'wb') as fp:
+                    fp.write(data)
+                os.replace(tmp_path, path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        except OSError as exc:
+            LOGGER.warning('cannot store %s in "%s": %s', self.ENTRY_NAME, path, exc)
+            return
+
+        if self._size is None:
+            self._size = self.get_size()
+        else:
+            self._size += len(data)
+        if self._size > self.max_size:
+            self.evict()
+
+    def _get_entries(self):
+        entries = []
+        for dirpath, __, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def get_size(self):
+        """Returns the size in bytes of the stored entries.
+        """
+        return sum(size for __, size, __ in self._get_entries())
+
+    def evict(self):
+        """Removes the least recently used entries until the cache size is
+        at most ``max_size``.
+        """
+        entries = sorted(self._get_entries())
+        size = sum(size for __, size, __ in entries)
+        for __, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
+
+
+class ImageDerivativeCache(DiskCache):
+    """On-disk cache of images derived from other images, such as web
+    versions and thumbnails, addressed by the content of the source image.
+
+    The key of a derived image is the sha256 of the source image bytes, the
+    operation, its parameters and the Pillow version, so the same image sent
+    in another package is not decoded again. When the cache exceeds
+    ``max_size`` bytes, the least recently used images are removed.
+
+    Basic usage:
+
+    .. code-block:: python
+
+        cache = ImageDerivativeCache()
+        key = cache.get_key(source_digest, "png", ("PNG",))
+        png_bytes = cache.get(key)
+        if png_bytes is None:
+            png_bytes = ...
+            cache.set(key, png_bytes)
+
+    Any object with ``get_key``, ``get`` and ``set`` can be used instead.
+
+    :param cache_dir: (str) defaults to :func:`get_image_cache_dir`
+    :param max_size: (int) maximum size in bytes, defaults to 1 GiB
+    """
+    ENTRY_NAME = 'derived image'
+
+    def __init__(self, cache_dir=None, max_size=None):
+        super(ImageDerivativeCache, self).__init__(
+            cache_dir or get_image_cache_dir(), max_size)
+
+    def get_key(self, source_digest, operation, params=()):
+        """Returns the key of the image derived by ``operation`` with ``params``
+        from an image whose sha256 hex digest is ``source_digest``.
+        """
+        key = "%s\0%s\0%r\0Pillow-%s" % (
+            source_digest, operation, tuple(params), PILLOW_VERSION)
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def get_html_cache_dir():
+    """Returns the directory where HTMLs rendered by
+    :class:`packtools.domain.HTMLGenerator` are stored. See
+    :func:`get_schematron_cache_dir`.
+    """
+    return os.path.join(_get_cache_base_dir(), 'html')
+
+
+def get_htmlgenerator_xslt_hash():
+    """Returns the sha256 of the XSLTs of the HTML generator
+    (``catalogs/htmlgenerator/*.xsl*``).
+
+    The XSLTs are hashed again only if any of them changes (name, size or
+    modification time).
+    """
+    xslt_dir = os.path.dirname(catalogs.HTML_GEN_XSLTS['root-html-2.0.xslt'])
+    paths = sorted(
+        glob.glob(os.path.join(xslt_dir, '*.xsl*')) +
+        glob.glob(os.path.join(xslt_dir, '*', '*.xsl*')))
+    signature = []
+    for path in paths:
+        stat = os.stat(path)
+        signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return _get_files_hash(tuple(signature))
+
+
+@functools.lru_cache(maxsize=4)
+def _get_files_hash(signature):
+    digest = hashlib.sha256()
+    for path, __, __ in signature:
+        digest.update(path.encode('utf-8'))
+        with open(path, mode='rb') as fp:
+            digest.update(fp.read())
+    return digest.hexdigest()
+
+
+class HTMLRenderCache(DiskCache):
+    """On-disk cache of the HTMLs rendered by
+    :class:`packtools.domain.HTMLGenerator`, serialized.
+
+    The key of an HTML is the sha256 of the XML, the hash of the XSLTs (see
+    :func:`get_htmlgenerator_xslt_hash`), the language and the XSLT
+    parameters, so the entries are not used after the XSLTs change.
+
+    :param cache_dir: (str) defaults to :func:`get_html_cache_dir`
+    :param max_size: (int) maximum size in bytes, defaults to 1 GiB
+    """
+    ENTRY_NAME = 'rendered HTML'
+
+    def __init__(self, cache_dir=None, max_size=None):
+        super(HTMLRenderCache, self).__init__(
+            cache_dir or get_html_cache_dir(), max_size)
+
+    def get_key(self, xml_digest, xslt_digest, lang, params=()):
+        """Returns the key of the HTML in ``lang`` of an XML whose sha256 hex
+        digest is ``xml_digest``, rendered by the XSLTs whose hash is
+        ``xslt_digest`` with ``params``.
+        """
+        key = "%s\0%s\0%s\0%r" % (
+            xml_digest, xslt_digest, lang, tuple(sorted(params)))
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+class MemoryHTMLRenderCache(HTMLRenderCache):
+    """In-memory version of :class:`HTMLRenderCache`, which keeps the
+    ``max_entries`` most recently used HTMLs.
+
+    It may be shared by threads.
+    """
+    DEFAULT_MAX_ENTRIES = 256
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or self.DEFAULT_MAX_ENTRIES
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return None
+            return self._entries[key]
+
+    def set(self, key, data):
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+        self.evict()
+
+    def get_size(self):
+        with self._lock:
+            return sum(len(data) for data in self._entries.values())
+
+    def evict(self):
+        """Removes the least recently used HTMLs until there are at most
+        ``max_entries``.
+        """
+        with self._lock:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
 class WebImageGenerator:
     """Generate WEB Images versions of a given Image.
 
@@ -302,24 +838,42 @@ class WebImageGenerator:
     :param file_bytes: image file bytes
     """
 
+    THUMBNAIL_SIZE = (267, 140)
+
     def __init__(self, image_filename, image_file_dir, file_bytes=None):
         self.filename = image_filename
-        self.thumbnail_size = (267, 140)
+        self.thumbnail_size = self.THUMBNAIL_SIZE
         self.image_file_path = os.path.join(image_file_dir, image_filename)
+        self._file_bytes = file_bytes
+        # whether ``self._image_object`` was decoded by ``_get_bytes``
+        self._decoded = False
         self._image_object = self._get_image_object(file_bytes)
 
     def _get_image_object(self, file_bytes):
+        """Opens the image in ``file_bytes``, which is decoded only when its
+        pixels are needed, so that ``Image.draft`` can still be applied."""
         if file_bytes is not None:
-            parser = ImageFile.Parser()
             try:
-                parser.feed(file_bytes)
-                image = parser.close()
-            except (Image.DecompressionBombError, IOError) as exc:
+                return Image.open(io.BytesIO(file_bytes))
+            except Image.UnidentifiedImageError:
+                raise exceptions.WebImageGeneratorError(
+                    'Error reading image "%s": cannot parse this image'
+                    % self.filename
+                )
+            except (Image.DecompressionBombError, ValueError, IOError) as exc:
                 raise exceptions.WebImageGeneratorError(
                     'Error reading image "%s": %s' % (self.filename, str(exc))
                 )
-            else:
-                return image
+
+    @classmethod
+    def get_derived_image_params(cls, operation):
+        """Parameters which produce the web version (``operation="png"``) or
+        the thumbnail (``operation="thumbnail"``) of an image, used to
+        address them in :class:`ImageDerivativeCache`.
+        """
+        if operation == "png":
+            return ("PNG",)
+        return ("JPEG", cls.THUMBNAIL_SIZE)
 
     @property
     def png_filename(self):
@@ -329,62 +883,100 @@ class WebImageGenerator:
     def thumbnail_filename(self):
         return os.path.splitext(self.filename)[0] + ".thumbnail.jpg"
 
+    def _open(self):
+        try:
+            return Image.open(self.image_file_path)
+        except (Image.DecompressionBombError, OSError, IOError, ValueError) as exc:
+            raise exceptions.WebImageGeneratorError(
+                'Error opening image file "%s": %s' % (self.image_file_path, str(exc))
+            )
+
+    def _get_new_file_path(self, new_filename, destination_path):
+        new_file_path = os.path.join(
+            os.path.dirname(self.image_file_path), os.path.basename(new_filename)
+        )
+        if destination_path is not None and len(destination_path) > 0:
+            new_file_path = os.path.join(
+                destination_path, os.path.basename(new_file_path)
+            )
+        return new_file_path
+
+    def _save(self, image, new_file_path, format):
+        try:
+            image.save(new_file_path, format, quality='web_high')
+            return new_file_path
+        except (ValueError, IOError) as exc:
+            raise exceptions.WebImageGeneratorError(
+                'Error saving image file "%s": %s' % (new_file_path, str(exc))
+            )
+
+    def _get_thumbnail(self, image):
+        """Returns the thumbnail of ``image``, which is changed.
+
+        If ``image`` is not loaded yet, JPEG images are decoded at reduced
+        scale (``Image.draft``). ``Image.thumbnail`` reduces the image by an
+        integer factor before resampling it.
+        """
+        image.draft("RGB", self.thumbnail_size)
+        image = self._normalize_mode(image)
+        image.thumbnail(self.thumbnail_size)
+        return image
+
     def convert2png(self, destination_path=None):
         """Generate a PNG file from image file with the same name, changing only the
         file extension. If ``destination_path`` is given, the new image is saved in it,
         otherwise it is saved in the same directory as original image.
         """
+        image_file = self._open()
         try:
-            tiff_file = Image.open(self.image_file_path)
-        except (Image.DecompressionBombError, OSError, IOError, ValueError) as exc:
-            raise exceptions.WebImageGeneratorError(
-                'Error opening image file "%s": %s' % (self.image_file_path, str(exc))
+            return self._save(
+                image_file,
+                self._get_new_file_path(self.png_filename, destination_path),
+                "PNG",
             )
-        else:
-            png_file = tiff_file.copy()
-            new_filename = os.path.splitext(self.image_file_path)[0] + ".png"
-            if destination_path is not None and len(destination_path) > 0:
-                new_filename = os.path.join(
-                    destination_path, os.path.basename(new_filename)
-                )
-            try:
-                png_file.save(new_filename, "PNG", quality='web_high')
-                return new_filename
-            except (ValueError, IOError) as exc:
-                raise exceptions.WebImageGeneratorError(
-                    'Error saving image file "%s": %s' % (new_filename, str(exc))
-                )
-            finally:
-                tiff_file.close()
+        finally:
+            image_file.close()
 
     def create_thumbnail(self, destination_path=None):
         """Generate a thumbnail file from image file with the same name, changing only
         the file name to ``*.thumbnail.jpg``. If ``destination_path`` is given, the new
         image is saved in it, otherwise it is saved in the same directory as original image.
+
+        The image is not decoded at full resolution if it is a JPEG.
         """
+        image_file = self._open()
         try:
-            image_file = Image.open(self.image_file_path)
-        except (Image.DecompressionBombError, OSError, IOError, ValueError) as exc:
-            raise exceptions.WebImageGeneratorError(
-                'Error opening image file "%s": %s' % (self.image_file_path, str(exc))
+            thumbnail_file = self._get_thumbnail(image_file)
+            return self._save(
+                thumbnail_file,
+                self._get_new_file_path(self.thumbnail_filename, destination_path),
+                "JPEG",
             )
-        else:
-            thumbnail_file = self._normalize_mode(image_file.copy())
-            new_filename = os.path.splitext(self.image_file_path)[0] + ".thumbnail.jpg"
-            if destination_path is not None and len(destination_path) > 0:
-                new_filename = os.path.join(
-                    destination_path, os.path.basename(new_filename)
-                )
-            thumbnail_file.thumbnail(self.thumbnail_size)
-            try:
-                thumbnail_file.save(new_filename, "JPEG", quality='web_high')
-                return new_filename
-            except (ValueError, IOError) as exc:
-                raise exceptions.WebImageGeneratorError(
-                    'Error saving image file "%s": %s' % (new_filename, str(exc))
-                )
-            finally:
-                image_file.close()
+        finally:
+            image_file.close()
+
+    def create_png_and_thumbnail(self, destination_path=None):
+        """Generate the PNG file (see :meth:`convert2png`) and the thumbnail file
+        (see :meth:`create_thumbnail`) decoding the image file only once.
+
+        Returns the paths of both files.
+        """
+        image_file = self._open()
+        try:
+            png_file_path = self._save(
+                image_file,
+                self._get_new_file_path(self.png_filename, destination_path),
+                "PNG",
+            )
+            thumbnail_file = self._get_thumbnail(image_file)
+            thumbnail_file_path = self._save(
+                thumbnail_file,
+                self._get_new_file_path(self.thumbnail_filename, destination_path),
+                "JPEG",
+            )
+            return png_file_path, thumbnail_file_path
+        finally:
+            image_file.close()
 
     @staticmethod
     def _normalize_mode(image):
@@ -412,10 +1004,15 @@ class WebImageGenerator:
             return image.convert("RGB")
         return image
 
-    def _get_bytes(self, format):
+    def _get_bytes(self, format, image=None):
         image_file = io.BytesIO()
+        if image is None:
+            image = self._image_object
+            self._decoded = True
         try:
-            self._image_object.convert("RGB").save(image_file, format)
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            image.save(image_file, format)
         except (ValueError, IOError) as exc:
             raise exceptions.WebImageGeneratorError(
                 'Error optimising image bytes from "%s": %s' % (self.filename, str(exc))
@@ -436,7 +1033,10 @@ class WebImageGenerator:
 
     def get_thumbnail_bytes(self):
         """Generate a thumbnail image byte-like object from image file set in
-        ``self._image_object``."""
+        ``self._image_object``, which is not changed.
+
+        If the image was not decoded yet (see :meth:`get_png_bytes`), JPEG
+        images are decoded at reduced scale."""
         if self._image_object is None:
             raise exceptions.WebImageGeneratorError(
                 'Error optimising image bytes from "%s": '
@@ -444,10 +1044,24 @@ class WebImageGenerator:
                 % self.filename
             )
 
-        self._image_object = self._normalize_mode(self._image_object)
+        try:
+            if self._file_bytes is not None and not self._decoded:
+                # ``draft`` would also reduce the image of ``get_png_bytes``
+                image = self._get_image_object(self._file_bytes)
+            else:
+                image = self._image_object.copy()
+            image = self._get_thumbnail(image)
+        except (ValueError, IOError) as exc:
+            raise exceptions.WebImageGeneratorError(
+                'Error optimising image bytes from "%s": %s' % (self.filename, str(exc))
+            )
+        return self._get_bytes("JPEG", image)
 
-        self._image_object.thumbnail(self.thumbnail_size)
-        return self._get_bytes("JPEG")
+    def get_png_and_thumbnail_bytes(self):
+        """Generate the PNG image and the thumbnail image byte-like objects from
+        the same decoded image, set in ``self._image_object``."""
+        png_bytes = self.get_png_bytes()
+        return png_bytes, self.get_thumbnail_bytes()
 
 
 class XMLWebOptimiser(object):
@@ -472,22 +1086,30 @@ class XMLWebOptimiser(object):
     :param work_dir: directory path to work with image optimization
     :param stop_if_error: (bool) if True, it raises exceptions.XMLWebOptimiserError for
         handled exceptions, otherwise it logs error message.
+    :param image_cache: cache of the web versions and thumbnails, consulted before
+        decoding the images, such as :class:`ImageDerivativeCache`
     """
 
     def __init__(
-        self, filename, image_filenames, read_file, work_dir, stop_if_error=False
+        self, filename, image_filenames, read_file, work_dir, stop_if_error=False,
+        image_cache=None,
     ):
         self.filename = filename
         self.work_dir = work_dir
         self.stop_if_error = stop_if_error
+        self.image_cache = image_cache
         self._optimised_assets = []
         self._assets_thumbnails = []
+        # (operation, image filename) -> bytes, None or exception, see
+        # ``set_optimised_images``
+        self._optimised_images = {}
         if read_file is None:
             raise exceptions.XMLWebOptimiserError(
                 "Error instantiating XMLWebOptimiser: read_file cannot be None"
             )
         self._read_file = read_file
-        self._xml_file = XML(io.BytesIO(self._read_file(filename)), load_dtd=False)
+        self._xml_file = parse_bytes(
+            self._read_file(filename), remove_blank_text=True).getroottree()
         self._xml_doctype = self._xml_file.docinfo.doctype
         self._image_filenames = self._get_all_graphic_images_from_xml(image_filenames)
 
@@ -563,53 +1185,105 @@ class XMLWebOptimiser(object):
                 )
                 yield image_filename, alternatives[0]
 
-    def _get_web_image_generator(self, image_filename):
+    def _get_derived_image(self, operation, image_filename):
+        """Returns the bytes of the web version (``operation="png"``) or of the
+        thumbnail (``operation="thumbnail"``) of ``image_filename``, or ``None``
+        if it cannot be produced."""
         try:
             image_file_bytes = self._read_file(image_filename)
         except exceptions.SPPackageError as exc:
             self._handle_image_exception(exc)
-        else:
-            try:
-                web_image_generator = WebImageGenerator(
-                    image_filename, self.work_dir, image_file_bytes
-                )
-            except exceptions.WebImageGeneratorError as exc:
-                self._handle_image_exception(exc)
+            return None
+
+        key = None
+        if self.image_cache is not None:
+            key = self.image_cache.get_key(
+                hashlib.sha256(image_file_bytes).hexdigest(),
+                operation,
+                WebImageGenerator.get_derived_image_params(operation),
+            )
+            image_bytes = self.image_cache.get(key)
+            if image_bytes is not None:
+                return image_bytes
+
+        try:
+            web_image_generator = WebImageGenerator(
+                image_filename, self.work_dir, image_file_bytes
+            )
+            if operation == "png":
+                image_bytes = web_image_generator.get_png_bytes()
             else:
-                return web_image_generator
+                image_bytes = web_image_generator.get_thumbnail_bytes()
+        except exceptions.WebImageGeneratorError as exc:
+            self._handle_image_exception(exc)
+            return None
+
+        if key is not None:
+            self.image_cache.set(key, image_bytes)
+        return image_bytes
+
+    def set_optimised_images(self, operation, optimised_images):
+        """Set the web versions (``operation="png"``) or thumbnails
+        (``operation="thumbnail"``) of images, produced elsewhere (see
+        :meth:`SPPackage.optimise`), so that they are not produced again.
+
+        :param optimised_images: dict which maps each image file name to the
+            bytes produced, ``None`` if the bytes were already written to the
+            package, or the ``exceptions.SPPackageError`` raised.
+        """
+        for image_filename, result in optimised_images.items():
+            self._optimised_images[(operation, image_filename)] = result
+
+    def _add_precomputed_image(self, operation, image_filename, new_filename,
+                               assets):
+        result = self._optimised_images[(operation, image_filename)]
+        if isinstance(result, exceptions.SPPackageError):
+            self._handle_image_exception(result)
+        else:
+            assets.append((new_filename, result))
+            return new_filename
 
     def _add_optimised_image(self, image_filename):
-        web_image_generator = self._get_web_image_generator(image_filename)
-        if web_image_generator is not None:
-            try:
-                png_bytes = web_image_generator.get_png_bytes()
-            except exceptions.WebImageGeneratorError as exc:
-                self._handle_image_exception(exc)
-            else:
-                self._optimised_assets.append(
-                    (web_image_generator.png_filename, png_bytes)
-                )
-                return web_image_generator.png_filename
+        if ("png", image_filename) in self._optimised_images:
+            return self._add_precomputed_image(
+                "png",
+                image_filename,
+                WebImageGenerator(image_filename, self.work_dir).png_filename,
+                self._optimised_assets,
+            )
+        png_bytes = self._get_derived_image("png", image_filename)
+        if png_bytes is not None:
+            png_filename = WebImageGenerator(image_filename, self.work_dir).png_filename
+            self._optimised_assets.append((png_filename, png_bytes))
+            return png_filename
 
     def _add_assets_thumbnails(self, image_filename):
-        web_image_generator = self._get_web_image_generator(image_filename)
-        if web_image_generator is not None:
-            try:
-                thumbnail_bytes = web_image_generator.get_thumbnail_bytes()
-            except exceptions.WebImageGeneratorError as exc:
-                self._handle_image_exception(exc)
-            else:
-                self._assets_thumbnails.append(
-                    (web_image_generator.thumbnail_filename, thumbnail_bytes)
-                )
-                return web_image_generator.thumbnail_filename
-
-    def _get_similar_filename(self, image_filename):
+        if ("thumbnail", image_filename) in self._optimised_images:
+            return self._add_precomputed_image(
+                "thumbnail",
+                image_filename,
+                WebImageGenerator(image_filename, self.work_dir).thumbnail_filename,
+                self._assets_thumbnails,
+            )
+        thumbnail_bytes = self._get_derived_image("thumbnail", image_filename)
+        if thumbnail_bytes is not None:
+            thumbnail_filename = WebImageGenerator(
+                image_filename, self.work_dir
+            ).thumbnail_filename
+            self._assets_thumbnails.append((thumbnail_filename, thumbnail_bytes))
+            return thumbnail_filename
+
+    def _find_similar_filename(self, image_filename):
         for filename in self._image_filenames:
             filename_root, filename_ext = os.path.splitext(filename)
             if filename_root == image_filename and ".tif" in filename_ext:
-                LOGGER.debug('Found similar file name: "%s"', image_filename)
-                return True, filename
+                return filename
+
+    def _get_similar_filename(self, image_filename):
+        filename = self._find_similar_filename(image_filename)
+        if filename is not None:
+            LOGGER.debug('Found similar file name: "%s"', image_filename)
+            return True, filename
         else:
             msg_error = 'No file named "%s" in package'
             if self.stop_if_error:
@@ -644,8 +1318,31 @@ class XMLWebOptimiser(object):
             alternative_node.append(new_alternative)
             image_parent.append(alternative_node)
 
-    def get_xml_file(self):
-        """Get a byte-like optimised XML, with WEB alternatives for images."""
+    def _get_images_filenames(self, images):
+        # same file names as ``_get_optimised_image_with_filename``
+        filenames = []
+        for image_filename, __ in images:
+            if image_filename not in self._image_filenames:
+                image_filename = self._find_similar_filename(image_filename)
+            if image_filename is not None and image_filename not in filenames:
+                filenames.append(image_filename)
+        return filenames
+
+    def get_images_to_optimise(self):
+        """Get the file names of the images which will have a web version
+        (PNG) produced by :meth:`add_optimised_images`."""
+        return self._get_images_filenames(self._get_all_images_to_optimise())
+
+    def get_images_to_thumbnail(self):
+        """Get the file names of the images which will have a thumbnail
+        produced by :meth:`add_assets_thumbnails`.
+
+        As the web versions change the XML, it must be called after
+        :meth:`add_optimised_images`."""
+        return self._get_images_filenames(self._get_all_images_to_thumbnail())
+
+    def add_optimised_images(self):
+        """Add the web versions (PNG) of images as alternatives in XML."""
         for image_filename, image_element in self._get_all_images_to_optimise():
             new_filename = self._get_optimised_image_with_filename(
                 image_filename, self._add_optimised_image
@@ -659,6 +1356,8 @@ class XMLWebOptimiser(object):
                     image_element, alternative_attr_values
                 )
 
+    def add_assets_thumbnails(self):
+        """Add the thumbnails of images as alternatives in XML."""
         for image_filename, image_element in self._get_all_images_to_thumbnail():
             new_filename = self._get_optimised_image_with_filename(
                 image_filename, self._add_assets_thumbnails
@@ -673,6 +1372,8 @@ class XMLWebOptimiser(object):
                     image_element, alternative_attr_values
                 )
 
+    def tostring(self):
+        """Get a byte-like XML, as it is."""
         return etree.tostring(
             self._xml_file,
             doctype=self._xml_doctype or None,
@@ -682,6 +1383,12 @@ class XMLWebOptimiser(object):
             pretty_print=True,
         )
 
+    def get_xml_file(self):
+        """Get a byte-like optimised XML, with WEB alternatives for images."""
+        self.add_optimised_images()
+        self.add_assets_thumbnails()
+        return self.tostring()
+
     def get_optimised_assets(self):
         """Generate tuples of PNG file name and bytes of each image produced by TIFF
         images referenced in XML content."""
@@ -707,15 +1414,24 @@ class SPPackage(object):
 
     :param package_file: SciELO Publishing Package, instance of ``zipfile.ZipFile``
     :param extracted_package: path to extract package files and optimise them
+    :param image_cache: cache of the web versions and thumbnails of images, such as
+        :class:`ImageDerivativeCache`
+    :param compression_policy: compression of the XML and images written in the new
+        package, instance of ``packtools.lib.file_utils.CompressionPolicy``. Images
+        are stored and XML files are deflated by default.
     """
 
-    def __init__(self, package_file, extracted_package, stop_if_error=False):
+    def __init__(self, package_file, extracted_package, stop_if_error=False,
+                 image_cache=None, compression_policy=None):
         self._package_file = package_file
         self._extracted_package = extracted_package
         self._stop_if_error = stop_if_error
+        self._image_cache = image_cache
+        self._compression_policy = compression_policy or DEFAULT_COMPRESSION_POLICY
 
     @classmethod
-    def from_file(cls, package_file_path, extracted_package=None, stop_if_error=False):
+    def from_file(cls, package_file_path, extracted_package=None, stop_if_error=False,
+                  image_cache=None, compression_policy=None):
         """Factory of SPPackage instances.
 
         :param package_file_path: Path to the SciELO Publishing Package file, instance
@@ -728,53 +1444,145 @@ class SPPackage(object):
         package2optimise = zipfile.ZipFile(package_file_path)
         if extracted_package is None:
             extracted_package = os.path.splitext(package_file_path)[0]
-        return cls(package2optimise, extracted_package, stop_if_error)
+        return cls(
+            package2optimise, extracted_package, stop_if_error, image_cache,
+            compression_policy,
+        )
 
-    def _optimise_to_zipfile(
-        self, new_package_file_path, xml_filename, zipped_filenames
-    ):
-        with zipfile.ZipFile(new_package_file_path, "a", compression=zipfile.ZIP_DEFLATED) as new_zip_file:
-            zipped_files = []
-            xml_web_optimiser = self._get_optimise_web_xml(
-                xml_filename, zipped_filenames
+    def _optimise_to_zipfile(self, new_zip_file, xml_filename, xml_web_optimiser):
+        zipped_files = []
+        # Write optimised XML to new Zipfile
+        optimised_xml = xml_web_optimiser.tostring()
+        LOGGER.debug('Writing XML file "%s" in package', xml_filename)
+        self._compression_policy.writestr(new_zip_file, xml_filename, optimised_xml)
+        zipped_files.append(xml_filename)
+        # Write optimised assets to new Zipfile
+        LOGGER.debug('Writing asset files in package')
+        for asset_filename, asset_bytes in xml_web_optimiser.get_optimised_assets():
+            if asset_bytes is not None:
+                LOGGER.debug('Writing file "%s"', asset_filename)
+                self._compression_policy.writestr(
+                    new_zip_file, asset_filename, asset_bytes
+                )
+                zipped_files.append(asset_filename)
+        LOGGER.debug('Writing asset thumbnail files in package')
+        for (
+            asset_filename,
+            asset_bytes,
+        ) in xml_web_optimiser.get_assets_thumbnails():
+            if asset_bytes is not None:
+                LOGGER.debug('Writing file "%s"', asset_filename)
+                self._compression_policy.writestr(
+                    new_zip_file, asset_filename, asset_bytes
+                )
+                zipped_files.append(asset_filename)
+        return zipped_files
+
+    def _write_files_left(self, new_zip_file, files_to_write):
+        # Copy files left to new Zipfile, as they are compressed
+        for file_to_write in files_to_write:
+            LOGGER.debug('Writing file "%s"', file_to_write)
+            copy_zip_member(self._package_file, new_zip_file, file_to_write)
+
+    def _get_digest(self, filename):
+        digest = hashlib.sha256()
+        try:
+            with self._package_file.open(filename) as fp:
+                for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        except KeyError:
+            return None
+        return digest.hexdigest()
+
+    def _optimise_images(self, new_zip_file, operation, filenames, pool,
+                         zipped_files, thumbnails, thumbnail_filenames=()):
+        """Produce the web versions (``operation="png"``) or thumbnails
+        (``operation="thumbnail"``) of the images ``filenames`` and write them
+        in ``new_zip_file``.
+
+        Images with identical bytes are decoded only once and images found in
+        ``self._image_cache`` are not decoded. The web versions of the images
+        in ``thumbnail_filenames`` are produced with their thumbnails, which
+        are kept in ``thumbnails``, by digest of the image, so the thumbnails
+        do not decode the images again. Returns a dict which maps each image
+        file name to ``None``, if the new image was written, or to the
+        exception raised.
+        """
+        def get_key(digest, operation):
+            return self._image_cache.get_key(
+                digest,
+                operation,
+                WebImageGenerator.get_derived_image_params(operation),
             )
-            # Write optimised XML to new Zipfile
-            optimised_xml = xml_web_optimiser.get_xml_file()
-            xml_zip_info = self._package_file.getinfo(xml_filename)
-            LOGGER.debug('Writing XML file "%s" in package', xml_filename)
-            new_zip_file.writestr(
-                xml_filename, optimised_xml, xml_zip_info.compress_type
+
+        groups = {}
+        for filename in filenames:
+            # missing files are reported by ``_optimise_image``
+            digest = self._get_digest(filename)
+            groups.setdefault(digest or filename, (digest, []))[1].append(filename)
+
+        optimised_images = {}
+
+        def write(same_filenames, result):
+            for filename in same_filenames:
+                if isinstance(result, exceptions.SPPackageError):
+                    optimised_images[filename] = result
+                    continue
+
+                generator = WebImageGenerator(filename, self._extracted_package)
+                if operation == "png":
+                    new_filename = generator.png_filename
+                else:
+                    new_filename = generator.thumbnail_filename
+                if new_filename not in zipped_files:
+                    LOGGER.debug('Writing file "%s"', new_filename)
+                    self._compression_policy.writestr(
+                        new_zip_file, new_filename, result
+                    )
+                    zipped_files.add(new_filename)
+                optimised_images[filename] = None
+
+        # one image of each group of identical images
+        tasks = []
+        for digest, same_filenames in groups.values():
+            if operation == "thumbnail" and digest in thumbnails:
+                write(same_filenames, thumbnails.pop(digest))
+                continue
+            if digest and self._image_cache is not None:
+                cached = self._image_cache.get(get_key(digest, operation))
+                if cached is not None:
+                    write(same_filenames, cached)
+                    continue
+            with_thumbnail = operation == "png" and any(
+                filename in thumbnail_filenames for filename in same_filenames
             )
-            zipped_files.append(xml_filename)
-            # Write optimised assets to new Zipfile
-            LOGGER.debug('Writing asset files in package')
-            for asset_filename, asset_bytes in xml_web_optimiser.get_optimised_assets():
-                if asset_bytes is not None:
-                    LOGGER.debug('Writing file "%s"', asset_filename)
-                    new_zip_file.writestr(asset_filename, asset_bytes)
-                    zipped_files.append(asset_filename)
-            LOGGER.debug('Writing asset thumbnail files in package')
-            for (
-                asset_filename,
-                asset_bytes,
-            ) in xml_web_optimiser.get_assets_thumbnails():
-                if asset_bytes is not None:
-                    LOGGER.debug('Writing file "%s"', asset_filename)
-                    new_zip_file.writestr(asset_filename, asset_bytes)
-                    zipped_files.append(asset_filename)
-            return zipped_files
-
-    def _write_files_left(self, new_package_file_path, files_to_write):
-        # Write files left to new Zipfile
-        with zipfile.ZipFile(new_package_file_path, "a", compression=zipfile.ZIP_DEFLATED) as new_zip_file:
-            for file_to_write in files_to_write:
-                zip_info = self._package_file.getinfo(file_to_write)
-                LOGGER.debug('Writing file "%s"', file_to_write)
-                new_zip_file.writestr(
-                    file_to_write,
-                    self._package_file.read(file_to_write),
-                    zip_info.compress_type,
-                )
+            tasks.append(
+                (digest, same_filenames, (operation, same_filenames[0], with_thumbnail))
+            )
+
+        if pool is None:
+            results = (
+                _optimise_image(self._read_file, *task) for __, __, task in tasks
+            )
+        else:
+            results = pool.imap(
+                _optimise_image_in_worker, [task for __, __, task in tasks]
+            )
+
+        for (digest, same_filenames, __), result in zip(tasks, results):
+            if isinstance(result, exceptions.SPPackageError):
+                write(same_filenames, result)
+                continue
+
+            if digest and self._image_cache is not None:
+                for derived_operation, image_bytes in result.items():
+                    self._image_cache.set(
+                        get_key(digest, derived_operation), image_bytes
+                    )
+            if operation == "png" and digest and "thumbnail" in result:
+                thumbnails[digest] = result["thumbnail"]
+            write(same_filenames, result[operation])
+        return optimised_images
 
     def _get_optimise_web_xml(self, xml_filename, xml_related_files):
         image_filenames = [
@@ -788,6 +1596,7 @@ class SPPackage(object):
             self._read_file,
             self._extracted_package,
             self._stop_if_error,
+            self._image_cache,
         )
 
     def _read_file(self, image_to_optimise):
@@ -800,7 +1609,7 @@ class SPPackage(object):
         else:
             return image_bytes
 
-    def optimise(self, new_package_file_path=None, preserve_files=True):
+    def optimise(self, new_package_file_path=None, preserve_files=True, jobs=1):
         """Optimise SciELO Publishing Package to have WEB images alternatives.
 
         For each XML file in package, optimise XML with WEB images alternatives.
@@ -808,11 +1617,17 @@ class SPPackage(object):
         with previous content and updates all optimised XMLs and the web images
         versions.
 
+        The images referenced by all the XMLs are optimised together: images
+        with identical bytes are decoded only once and, if ``jobs`` is greater
+        than 1, they are decoded and encoded in a pool of processes.
+
         :param new_package_file_path (default=None): Path to optimised SciELO Publishing
             Package file. If not given, it will be the same path and file name of the
             original package file ended with ``_optimised.zip``.
         :param preserve_files (default=True): preserve extracted and optimised files in
             aux directory. If False, it will delete files after written in new Package.
+        :param jobs (default=1): number of processes optimising images. It requires
+            the package to be a file in the filesystem.
         """
         if new_package_file_path is None:
             new_package_file_path = self._extracted_package + "_optimised.zip"
@@ -825,23 +1640,121 @@ class SPPackage(object):
             for xml_filename in zipped_filenames
             if os.path.splitext(xml_filename)[-1] == ".xml"
         ]
-        optimised_filenames = []
-        for i, xml_filename in enumerate(xmls_filenames):
-            LOGGER.info(
-                "Optimizing XML file %s [%s/%s]", xml_filename, i, len(xmls_filenames)
-            )
-            filename_root, __ = os.path.splitext(xml_filename)
-            optimised_filenames += self._optimise_to_zipfile(
-                new_package_file_path, xml_filename, zipped_filenames
+
+        pool = None
+        if jobs > 1 and isinstance(self._package_file.filename, str):
+            pool = multiprocessing.Pool(
+                jobs,
+                initializer=_init_optimiser_worker,
+                initargs=(self._package_file.filename, self._stop_if_error),
             )
 
-        LOGGER.info(
-            "Writing remained files from package in new SciELO Publishing Package"
-        )
-        self._write_files_left(
-            new_package_file_path, set(zipped_filenames) - set(optimised_filenames)
-        )
+        optimised_filenames = set()
+        thumbnails = {}
+        thumbnail_filenames = set()
+        try:
+            with zipfile.ZipFile(
+                new_package_file_path, "a", compression=zipfile.ZIP_DEFLATED
+            ) as new_zip_file:
+                xml_web_optimisers = [
+                    self._get_optimise_web_xml(xml_filename, zipped_filenames)
+                    for xml_filename in xmls_filenames
+                ]
+                # the images which will need thumbnails, produced with their web
+                # versions. The web versions change the XML, so this is an
+                # estimate: the thumbnails missing are produced afterwards.
+                for xml_web_optimiser in xml_web_optimisers:
+                    thumbnail_filenames.update(
+                        xml_web_optimiser.get_images_to_thumbnail()
+                    )
+
+                LOGGER.info("Optimizing images of %s XML files", len(xmls_filenames))
+                # the thumbnails depend on the XML changed by the web versions
+                for operation, get_filenames, add_images in (
+                    ("png", "get_images_to_optimise", "add_optimised_images"),
+                    ("thumbnail", "get_images_to_thumbnail", "add_assets_thumbnails"),
+                ):
+                    filenames = []
+                    for xml_web_optimiser in xml_web_optimisers:
+                        for filename in getattr(xml_web_optimiser, get_filenames)():
+                            if filename not in filenames:
+                                filenames.append(filename)
+                    optimised_images = self._optimise_images(
+                        new_zip_file, operation, filenames, pool, optimised_filenames,
+                        thumbnails, thumbnail_filenames,
+                    )
+                    for xml_web_optimiser in xml_web_optimisers:
+                        xml_web_optimiser.set_optimised_images(
+                            operation, optimised_images
+                        )
+                        getattr(xml_web_optimiser, add_images)()
+
+                for i, (xml_filename, xml_web_optimiser) in enumerate(
+                    zip(xmls_filenames, xml_web_optimisers)
+                ):
+                    LOGGER.info(
+                        "Optimizing XML file %s [%s/%s]",
+                        xml_filename, i, len(xmls_filenames)
+                    )
+                    optimised_filenames.update(
+                        self._optimise_to_zipfile(
+                            new_zip_file, xml_filename, xml_web_optimiser
+                        )
+                    )
+
+                LOGGER.info(
+                    "Writing remained files from package in new SciELO Publishing Package"
+                )
+                self._write_files_left(
+                    new_zip_file, set(zipped_filenames) - optimised_filenames
+                )
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
 
         if preserve_files:
             with zipfile.ZipFile(new_package_file_path) as new_zip_file:
                 new_zip_file.extractall(self._extracted_package)
+
+
+def _optimise_image(read_file, operation, image_filename, with_thumbnail=False):
+    """Returns a dict with the bytes of the web version (``operation="png"``) or
+    of the thumbnail (``operation="thumbnail"``) of ``image_filename``, or the
+    ``exceptions.SPPackageError`` raised, so that it can be handled by
+    :class:`XMLWebOptimiser`.
+
+    If ``with_thumbnail``, the thumbnail is also produced with the web version,
+    from the same decoded image, if it is possible.
+    """
+    try:
+        web_image_generator = WebImageGenerator(
+            image_filename, "", read_file(image_filename)
+        )
+        if operation == "thumbnail":
+            return {"thumbnail": web_image_generator.get_thumbnail_bytes()}
+        images = {"png": web_image_generator.get_png_bytes()}
+    except exceptions.SPPackageError as exc:
+        return exc
+    if not with_thumbnail:
+        return images
+    try:
+        images["thumbnail"] = web_image_generator.get_thumbnail_bytes()
+    except exceptions.SPPackageError:
+        # reported if the thumbnail is needed
+        pass
+    return images
+
+
+_worker_package = None
+
+
+def _init_optimiser_worker(package_file_path, stop_if_error):
+    global _worker_package
+    _worker_package = SPPackage.from_file(
+        package_file_path, stop_if_error=stop_if_error
+    )
+
+
+def _optimise_image_in_worker(task):
+    return _optimise_image(_worker_package._read_file, *task)
@@ -22,6 +22,9 @@ from .utils import analyze_xml
 
 main = Blueprint("main", __name__)
 
+# HTMLs of the previews, which are often requested again for the same XML
+PREVIEWS_CACHE = packtools.utils.MemoryHTMLRenderCache()
+
 
 @main.before_app_request
 def add_context_settings():
@@ -74,7 +77,7 @@ def packtools_preview_html():
         session["url_static_file"] = form.url_static_file.data
         previews = []
         try:
-            for lang, html_output in packtools.HTMLGenerator.parse(
+            html_generator = packtools.HTMLGenerator.parse(
                 form.file.data,
                 valid_only=False,
                 css=url_for("static", filename="css/htmlgenerator/scielo-article.css"),
@@ -82,7 +85,10 @@ def packtools_preview_html():
                     "static", filename="css/htmlgenerator/scielo-bundle-print.css"
                 ),
                 js=url_for("static", filename="js/htmlgenerator/scielo-article-min.js"),
-            ):
+                render_cache=PREVIEWS_CACHE,
+            )
+            for lang in html_generator.output_languages:
+                html_output = html_generator.render(lang, doctype=None).decode("utf-8")
                 previews.append({"lang": lang, "html": html_output})
         except Exception as e:
             # print(e.message)
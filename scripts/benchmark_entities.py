@@ -0,0 +1,110 @@
+"""
+Compares ``name2number.fix_pre_loading`` with its previous implementation,
+which marked and split the whole XML to find the entities and then replaced
+each distinct entity with ``str.replace``.
+
+Usage::
+
+    python scripts/benchmark_entities.py [XML ...] [--repeat 20]
+
+Each XML is converted to legacy HTML-derived XML first: its non-ASCII
+characters are replaced by HTML named entities (``&eacute;``, ``&ndash;``...).
+"""
+import argparse
+import glob
+import os
+import timeit
+from html.entities import codepoint2name
+
+from lxml import etree
+
+from packtools.sps.pid_provider import name2number
+
+
+def previous_find_entities_to_fix(bkp):
+    bkp = bkp.replace("&", "<ISOLAENTIDADEXML>&")
+    bkp = bkp.replace(";", ";<ISOLAENTIDADEXML>")
+
+    for item in bkp.split("<ISOLAENTIDADEXML>"):
+        if not item.strip():
+            continue
+        if item[0] == "&" and item[-1] == ";":
+            if item in ("&amp;", "&gt;", "&apos;", "&quot;", "&lt;"):
+                continue
+            if item[1:-1].isalpha():
+                yield item
+
+
+def previous_fix_pre_loading(xml):
+    if "&" not in xml:
+        return xml
+
+    entities = set(previous_find_entities_to_fix(xml))
+    if not entities:
+        return xml
+
+    for ent in entities:
+        xml = xml.replace(
+            ent, name2number.NAME_TO_NUMBER_ENTITIES.get(ent) or f"&amp;{ent}"
+        )
+
+    return xml
+
+
+def to_named_entities(xml):
+    return "".join(
+        f"&{codepoint2name[ord(char)]};" if ord(char) in codepoint2name and ord(char) > 127
+        else char
+        for char in xml
+    )
+
+
+def can_parse(xml):
+    try:
+        etree.fromstring(xml.encode("utf-8"))
+    except etree.XMLSyntaxError:
+        return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("xml", nargs="*")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = args.xml or sorted(
+        glob.glob(
+            os.path.join(os.path.dirname(__file__), "..", "tests", "samples", "*.xml")
+        )
+    )
+    print(
+        "%-45s %9s %12s %12s %9s %9s"
+        % ("xml", "entities", "previous ms", "current ms", "previous", "current")
+    )
+    for path in paths:
+        with open(path, encoding="utf-8") as fp:
+            content = fp.read()
+        # sem a declaração XML e o DOCTYPE, como em get_xml_with_pre
+        content = content[content.find("<article"):] if "<article" in content else content
+        xml = to_named_entities(content)
+        times = []
+        for function in (previous_fix_pre_loading, name2number.fix_pre_loading):
+            times.append(
+                min(timeit.repeat(lambda: function(xml), number=1, repeat=args.repeat))
+            )
+        print(
+            "%-45s %9d %12.2f %12.2f %9s %9s"
+            % (
+                os.path.basename(path)[:45],
+                len(list(name2number.find_entities_to_fix(xml))),
+                times[0] * 1000,
+                times[1] * 1000,
+                can_parse(previous_fix_pre_loading(xml)) and "parsed" or "failed",
+                can_parse(name2number.fix_pre_loading(xml)) and "parsed" or "failed",
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Compares ``XMLWithPre.finger_print`` with the previous implementation, which
+serialized the XML, loaded it again to remove the comments and hashed the
+whole text in upper case.
+
+Usage::
+
+    python scripts/benchmark_finger_print.py [XML ...] [--repeat 20]
+
+For each XML, it reports the time and the memory peak of both versions, for
+the XML as it is and with comments added between its elements.
+"""
+import argparse
+import glob
+import os
+import timeit
+import tracemalloc
+
+from lxml import etree
+
+from packtools.sps.pid_provider import xml_sps_lib
+
+
+def previous_finger_print(xml_with_pre):
+    if xml_with_pre.xmltree.xpath(".//comment()"):
+        for item in xml_sps_lib.XMLWithPre.create(
+            xml_content=xml_with_pre.tostring(pretty_print=xml_with_pre.pretty_print)
+        ):
+            xml_sps_lib.remove_comments(item.xmltree)
+            return xml_sps_lib.generate_finger_print(item.tostring(pretty_print=True))
+    return xml_sps_lib.generate_finger_print(
+        xml_with_pre.tostring(pretty_print=xml_with_pre.pretty_print)
+    )
+
+
+def current_finger_print(xml_with_pre):
+    return xml_with_pre.finger_print
+
+
+def add_comments(xml_with_pre):
+    for element in list(xml_with_pre.xmltree.iter("ref", "p", "sec")):
+        comment = etree.Comment(" revisado ")
+        comment.tail = element.tail
+        element.addprevious(comment)
+
+
+def measure(function, xml_with_pre, repeat):
+    seconds = min(timeit.repeat(lambda: function(xml_with_pre), number=1, repeat=repeat))
+    tracemalloc.start()
+    function(xml_with_pre)
+    __, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("xml", nargs="*")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = args.xml or sorted(
+        glob.glob(
+            os.path.join(os.path.dirname(__file__), "..", "tests", "samples", "*.xml")
+        )
+    )
+    print(
+        "%-45s %-9s %12s %12s %12s %12s"
+        % ("xml", "comments", "previous ms", "current ms", "previous KiB", "current KiB")
+    )
+    for path in paths:
+        with open(path, encoding="utf-8") as fp:
+            content = fp.read()
+        for with_comments in (False, True):
+            xml_with_pre = xml_sps_lib.get_xml_with_pre(content)
+            if with_comments:
+                add_comments(xml_with_pre)
+            assert previous_finger_print(xml_with_pre) == current_finger_print(
+                xml_with_pre
+            )
+            previous = measure(previous_finger_print, xml_with_pre, args.repeat)
+            current = measure(current_finger_print, xml_with_pre, args.repeat)
+            print(
+                "%-45s %-9s %12.2f %12.2f %12d %12d"
+                % (
+                    os.path.basename(path)[:45],
+                    with_comments,
+                    previous[0] * 1000,
+                    current[0] * 1000,
+                    previous[1] // 1024,
+                    current[1] // 1024,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -112,6 +112,7 @@ setup(
     extras_require=EXTRAS_REQUIRE,
     entry_points={
         "console_scripts":[
+            "packtools=packtools.__main__:main",
             "stylechecker=packtools.stylechecker:main",
             "htmlgenerator=packtools.htmlgenerator:main",
             "package_optimiser=packtools.package_optimiser:main",
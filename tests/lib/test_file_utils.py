@@ -0,0 +1,201 @@
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+from unittest import TestCase, mock
+
+from packtools.lib import file_utils
+from packtools.lib.file_utils import (
+    CompressionPolicy,
+    copy_zip_member,
+    create_zip_file,
+    write_zip_members,
+)
+
+
+class CopyZipMemberTest(TestCase):
+    def setUp(self):
+        self.source_bytes = io.BytesIO()
+        with zipfile.ZipFile(self.source_bytes, "w") as zf:
+            zf.writestr("a.xml", b"<article/>" * 1000, zipfile.ZIP_DEFLATED)
+            zf.writestr("a.pdf", os.urandom(3000), zipfile.ZIP_STORED)
+            zf.writestr("dir/a-v1.mp4", os.urandom(3000), zipfile.ZIP_BZIP2)
+        self.source = zipfile.ZipFile(self.source_bytes)
+
+    def tearDown(self):
+        self.source.close()
+
+    def _copy(self, names, mode="w", target_bytes=None):
+        target_bytes = target_bytes or io.BytesIO()
+        with zipfile.ZipFile(target_bytes, mode, zipfile.ZIP_DEFLATED) as target:
+            target.writestr("before.txt", b"before")
+            for name in names:
+                copy_zip_member(self.source, target, name)
+            target.writestr("after.txt", b"after")
+        return target_bytes
+
+    def test_copies_members_as_they_are(self):
+        target_bytes = self._copy(self.source.namelist())
+        with zipfile.ZipFile(target_bytes) as target:
+            self.assertIsNone(target.testzip())
+            self.assertEqual(
+                ["before.txt", "a.xml", "a.pdf", "dir/a-v1.mp4", "after.txt"],
+                target.namelist(),
+            )
+            for zinfo in self.source.infolist():
+                copied = target.getinfo(zinfo.filename)
+                self.assertEqual(zinfo.compress_type, copied.compress_type)
+                self.assertEqual(zinfo.compress_size, copied.compress_size)
+                self.assertEqual(zinfo.CRC, copied.CRC)
+                self.assertEqual(zinfo.date_time, copied.date_time)
+                self.assertEqual(
+                    self.source.read(zinfo), target.read(zinfo.filename)
+                )
+
+    def test_does_not_decompress(self):
+        with mock.patch.object(
+            zipfile, "_get_decompressor"
+        ) as mocked_get_decompressor:
+            self._copy(["a.xml", "a.pdf"])
+        mocked_get_decompressor.assert_not_called()
+
+    def test_appends_to_existing_zip(self):
+        target_bytes = self._copy(["a.xml"])
+        self._copy(["a.pdf"], mode="a", target_bytes=target_bytes)
+        with zipfile.ZipFile(target_bytes) as target:
+            self.assertIsNone(target.testzip())
+            self.assertEqual(self.source.read("a.pdf"), target.read("a.pdf"))
+            self.assertEqual(self.source.read("a.xml"), target.read("a.xml"))
+
+    def test_falls_back_to_read_and_write_without_zipfile_internals(self):
+        internals = file_utils._ZIPFILE_INTERNALS + ("_missing_internal",)
+        offsets = [zinfo.header_offset for zinfo in self.source.infolist()]
+        with mock.patch.object(file_utils, "_ZIPFILE_INTERNALS", internals):
+            target_bytes = self._copy(self.source.namelist())
+        # ZipFile.writestr changes the ZipInfo it is given, not the source one
+        self.assertEqual(
+            offsets, [zinfo.header_offset for zinfo in self.source.infolist()]
+        )
+        with zipfile.ZipFile(target_bytes) as target:
+            self.assertIsNone(target.testzip())
+            self.assertEqual(
+                ["before.txt", "a.xml", "a.pdf", "dir/a-v1.mp4", "after.txt"],
+                target.namelist(),
+            )
+            for zinfo in self.source.infolist():
+                copied = target.getinfo(zinfo.filename)
+                self.assertEqual(zinfo.compress_type, copied.compress_type)
+                self.assertEqual(zinfo.date_time, copied.date_time)
+                self.assertEqual(
+                    self.source.read(zinfo), target.read(zinfo.filename)
+                )
+
+
+class CompressionPolicyTest(TestCase):
+    def test_stores_compressed_media(self):
+        policy = CompressionPolicy()
+        for filename in ("a.png", "a.JPG", "a.pdf", "a-v1.mp4", "dir/a.zip"):
+            with self.subTest(filename=filename):
+                self.assertEqual(
+                    zipfile.ZIP_STORED, policy.get_compress_type(filename)
+                )
+
+    def test_deflates_text(self):
+        policy = CompressionPolicy()
+        for filename in ("a.xml", "a.html", "a.txt", "a.tif", "a"):
+            with self.subTest(filename=filename):
+                self.assertEqual(
+                    zipfile.ZIP_DEFLATED, policy.get_compress_type(filename)
+                )
+
+    def test_stored_extensions(self):
+        policy = CompressionPolicy(stored_extensions=[".XML"])
+        self.assertEqual(zipfile.ZIP_STORED, policy.get_compress_type("a.xml"))
+        self.assertEqual(zipfile.ZIP_DEFLATED, policy.get_compress_type("a.png"))
+
+    def test_writestr(self):
+        content = io.BytesIO()
+        with zipfile.ZipFile(content, "w", zipfile.ZIP_DEFLATED) as zf:
+            CompressionPolicy(compresslevel=9).writestr(zf, "a.png", b"png")
+            CompressionPolicy(compresslevel=9).writestr(zf, "a.xml", b"<a/>")
+        with zipfile.ZipFile(content) as zf:
+            self.assertEqual(zipfile.ZIP_STORED, zf.getinfo("a.png").compress_type)
+            self.assertEqual(zipfile.ZIP_DEFLATED, zf.getinfo("a.xml").compress_type)
+            self.assertEqual(b"<a/>", zf.read("a.xml"))
+
+
+class WriteZipMembersTest(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.members = [
+            ("a.xml", b"<article>" + b"text " * 100000 + b"</article>"),
+            ("a.pdf", os.urandom(2000)),
+            ("a-v1.txt", b"small"),
+            ("b.xml", b"<article>" + b"other " * 100000 + b"</article>"),
+        ]
+        self.paths = []
+        for name, content in self.members:
+            path = os.path.join(self.tmpdir, name)
+            with open(path, "wb") as fp:
+                fp.write(content)
+            self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, members, **kwargs):
+        content = io.BytesIO()
+        policy = CompressionPolicy(parallel_min_size=1000)
+        with zipfile.ZipFile(content, "w") as zf:
+            write_zip_members(zf, members, policy, **kwargs)
+        return zipfile.ZipFile(content)
+
+    def _members(self, zf):
+        return [
+            (zinfo.filename, zinfo.compress_type, zinfo.compress_size,
+             zinfo.CRC, zf.read(zinfo))
+            for zinfo in zf.infolist()
+        ]
+
+    def test_parallel_compression_gives_the_same_members(self):
+        expected = self._members(self._write(self.members))
+        self.assertEqual(expected, self._members(self._write(self.members, jobs=3)))
+        self.assertEqual(
+            [name for name, __ in self.members], [item[0] for item in expected]
+        )
+        self.assertEqual(
+            [zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED,
+             zipfile.ZIP_DEFLATED],
+            [item[1] for item in expected],
+        )
+
+    def test_parallel_compression_of_files(self):
+        members = [
+            (name, path) for (name, __), path in zip(self.members, self.paths)
+        ]
+        zf = self._write(members, jobs=2)
+        self.assertIsNone(zf.testzip())
+        self.assertEqual(
+            self._members(self._write(members)), self._members(zf)
+        )
+
+    def test_parallel_compression_without_zipfile_internals(self):
+        internals = file_utils._ZIPFILE_INTERNALS + ("_missing_internal",)
+        expected = self._members(self._write(self.members))
+        with mock.patch.object(file_utils, "_ZIPFILE_INTERNALS", internals), \
+                mock.patch.object(file_utils, "_deflate") as mocked_deflate:
+            zf = self._write(self.members, jobs=3)
+        mocked_deflate.assert_not_called()
+        self.assertEqual(expected, self._members(zf))
+
+    def test_create_zip_file(self):
+        zip_path = create_zip_file(self.paths, "package.zip", self.tmpdir, jobs=2)
+        with zipfile.ZipFile(zip_path) as zf:
+            self.assertIsNone(zf.testzip())
+            self.assertEqual(
+                [os.path.basename(path) for path in self.paths], zf.namelist()
+            )
+            self.assertEqual(
+                zipfile.ZIP_STORED, zf.getinfo("a.pdf").compress_type
+            )
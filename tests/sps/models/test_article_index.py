@@ -0,0 +1,117 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from packtools.sps.models.article_index import ArticleIndex
+from packtools.sps.utils.xml_utils import get_parents
+
+
+XML = """
+<article article-type="research-article" xml:lang="en" xmlns:xlink="http://www.w3.org/1999/xlink">
+    <front>
+        <article-meta>
+            <contrib-group>
+                <contrib><xref ref-type="aff" rid="aff1">1</xref></contrib>
+            </contrib-group>
+            <aff id="aff1"><!-- comment --><institution>Inst</institution></aff>
+        </article-meta>
+    </front>
+    <body>
+        <sec sec-type="transcript" id="s1"><p>See <xref ref-type="fig" rid="f1">Fig 1</xref></p></sec>
+        <fig id="f1"><label>Fig 1</label></fig>
+    </body>
+    <sub-article article-type="translation" xml:lang="pt" id="TRpt">
+        <front-stub><aff id="aff2"/></front-stub>
+        <body>
+            <p><xref ref-type="fig" rid="f2">Fig 1</xref></p>
+            <fig id="f2"><label>Fig 1</label></fig>
+            <sub-article article-type="reviewer-report" xml:lang="pt" id="R1">
+                <body><p><xref ref-type="fig" rid="f1"/></p></body>
+            </sub-article>
+        </body>
+    </sub-article>
+</article>
+"""
+
+
+class ArticleIndexTest(TestCase):
+    def setUp(self):
+        self.xmltree = etree.fromstring(XML)
+        self.index = ArticleIndex(self.xmltree)
+
+    def test_fulltexts(self):
+        self.assertEqual(
+            self.xmltree.xpath(". | .//sub-article"),
+            [fulltext.node for fulltext in self.index.fulltexts],
+        )
+
+    def test_descendants_of_xmltree(self):
+        for tag in ("*", "xref", "fig", "sub-article", "inexistent"):
+            with self.subTest(tag=tag):
+                self.assertEqual(
+                    self.xmltree.xpath(f".//{tag}"),
+                    self.index.descendants(tag),
+                )
+
+    def test_descendants_of_fulltexts(self):
+        for fulltext in self.index.fulltexts:
+            for tag in ("*", "xref", "fig", "aff"):
+                with self.subTest(fulltext=fulltext.id, tag=tag):
+                    self.assertEqual(
+                        fulltext.node.xpath(f".//{tag}"),
+                        self.index.descendants(tag, fulltext),
+                    )
+
+    def test_get_fulltext(self):
+        for fulltext in self.index.fulltexts:
+            with self.subTest(fulltext=fulltext.id):
+                self.assertIs(fulltext, self.index.get_fulltext(fulltext.node))
+        self.assertIsNone(self.index.get_fulltext(self.xmltree.find("body")))
+
+    def test_sub_articles(self):
+        self.assertEqual(
+            self.xmltree.xpath(".//sub-article[@article-type='translation']"),
+            self.index.sub_articles(translation=True),
+        )
+        self.assertEqual(
+            self.xmltree.xpath(".//sub-article[@article-type!='translation']"),
+            self.index.sub_articles(translation=False),
+        )
+
+    def test_section_descendants(self):
+        fulltext = self.index.fulltexts[0]
+        for tag in ("xref", "fig", "aff"):
+            with self.subTest(tag=tag):
+                self.assertEqual(
+                    self.xmltree.xpath(f"./front//{tag} | ./body//{tag} | ./back//{tag}"),
+                    self.index.section_descendants(tag, fulltext),
+                )
+
+    def test_elements_by_id(self):
+        self.assertEqual(
+            ["aff1", "s1", "f1", "TRpt", "aff2", "f2", "R1"],
+            list(self.index.elements_by_id),
+        )
+        self.assertEqual("fig", self.index.elements_by_id["f2"][0].tag)
+
+    def test_xrefs_by_rid(self):
+        self.assertEqual(
+            {"aff1": 1, "f1": 2, "f2": 1},
+            {rid: len(xrefs) for rid, xrefs in self.index.xrefs_by_rid.items()},
+        )
+
+    def test_fulltexts_by_lang(self):
+        self.assertEqual(
+            {"en": [None], "pt": ["TRpt", "R1"]},
+            {
+                lang: [fulltext.id for fulltext in fulltexts]
+                for lang, fulltexts in self.index.fulltexts_by_lang.items()
+            },
+        )
+
+    def test_parents(self):
+        self.assertEqual(list(get_parents(self.xmltree)), self.index.parents)
+
+    def test_accepts_element_tree(self):
+        index = ArticleIndex(etree.ElementTree(self.xmltree))
+        self.assertEqual(self.index.descendants(), index.descendants())
@@ -2,6 +2,7 @@ import unittest
 from lxml import etree
 
 from packtools.sps.models.fig import Fig, ArticleFigs
+from packtools.sps.models.article_index import ArticleIndex
 
 
 class FigTest(unittest.TestCase):
@@ -543,5 +544,28 @@ class ArticleFigsTest(unittest.TestCase):
                 self.assertDictEqual(item, obtained[i])
 
 
+    def test_article_index_gives_the_same_figs(self):
+        xml_tree = etree.fromstring(
+            '<article article-type="research-article" xml:lang="pt">'
+            '<fig id="x0"/>'
+            '<body><fig id="x1"/><sec><fig id="x2"/></sec></body>'
+            '<back><fig id="x3"/></back>'
+            '<sub-article article-type="translation" xml:lang="en" id="s1">'
+            '<body><fig id="x4"/></body>'
+            '<sub-article article-type="reviewer-report" xml:lang="en" id="s2">'
+            '<body><fig id="x5"/></body>'
+            '</sub-article>'
+            '</sub-article>'
+            '<sub-article xml:lang="en" id="s3"><body><fig id="x6"/></body></sub-article>'
+            '</article>'
+        )
+        expected = list(ArticleFigs(xml_tree).get_all_figs)
+        obtained = list(ArticleFigs(xml_tree, ArticleIndex(xml_tree)).get_all_figs)
+        self.assertEqual(
+            ["x1", "x2", "x3", "x4", "x5", "x5"], [item["id"] for item in expected]
+        )
+        self.assertEqual(expected, obtained)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ from unittest import TestCase, skip
 from packtools.sps.exceptions import SPSXMLFileError
 from packtools.sps.models import sps_package
 from packtools.sps import sps_maker
+from packtools.lib import file_utils
 
 import os
 import zipfile
@@ -254,6 +255,33 @@ class Test_make_package_from_paths(TestCase):
                 set(zf.namelist()),
             )
 
+    def test_make_package_from_paths_with_jobs_has_the_same_members(self):
+        paths = {
+            'xml': './tests/sps/fixtures/article_content/ca7d37e62e72840c1715ba83dda9893424ad31ec_kernel.xml',
+            'renditions': ['./tests/sps/fixtures/article_content/aed92928a9b5e04e17fa5777d83e8430b9f98f6d.pdf'],
+            'assets': [
+                './tests/sps/fixtures/article_content/0c10c88b56f3f9b4f4eccfe9ddbca3fd581aac1b.jpg',
+                './tests/sps/fixtures/article_content/fd89fb6a2a0f973016f2de7ee2b64b51ca573999.jpg',
+            ]
+        }
+        # os arquivos a comprimir são comprimidos em threads
+        policy = file_utils.CompressionPolicy(parallel_min_size=0)
+
+        expected = sps_maker.make_package_from_paths(paths)
+        result = sps_maker.make_package_from_paths(
+            paths, compression_policy=policy, jobs=2)
+
+        with zipfile.ZipFile(expected['zip']) as expected_zf, \
+                zipfile.ZipFile(result['zip']) as zf:
+            self.assertEqual(expected_zf.namelist(), zf.namelist())
+            for name in zf.namelist():
+                with self.subTest(name):
+                    self.assertEqual(
+                        expected_zf.getinfo(name).compress_type,
+                        zf.getinfo(name).compress_type,
+                    )
+                    self.assertEqual(expected_zf.read(name), zf.read(name))
+
 
 class Test_remove_invalid_uris(TestCase):
 
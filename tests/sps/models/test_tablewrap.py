@@ -2,6 +2,7 @@ import unittest
 from lxml import etree
 
 from packtools.sps.models.tablewrap import TableWrap, ArticleTableWrappers
+from packtools.sps.models.article_index import ArticleIndex
 
 
 class TableWrapTest(unittest.TestCase):
@@ -535,5 +536,28 @@ class ArticleTableWrappersTest(unittest.TestCase):
                 self.assertDictEqual(item, obtained[i])
 
 
+    def test_article_index_gives_the_same_table_wraps(self):
+        xml_tree = etree.fromstring(
+            '<article article-type="research-article" xml:lang="pt">'
+            '<table-wrap id="x0"/>'
+            '<body><table-wrap id="x1"/><sec><table-wrap id="x2"/></sec></body>'
+            '<back><table-wrap id="x3"/></back>'
+            '<sub-article article-type="translation" xml:lang="en" id="s1">'
+            '<body><table-wrap id="x4"/></body>'
+            '<sub-article article-type="reviewer-report" xml:lang="en" id="s2">'
+            '<body><table-wrap id="x5"/></body>'
+            '</sub-article>'
+            '</sub-article>'
+            '<sub-article xml:lang="en" id="s3"><body><table-wrap id="x6"/></body></sub-article>'
+            '</article>'
+        )
+        expected = list(ArticleTableWrappers(xml_tree).get_all_table_wrappers)
+        obtained = list(ArticleTableWrappers(xml_tree, ArticleIndex(xml_tree)).get_all_table_wrappers)
+        self.assertEqual(
+            ["x1", "x2", "x3", "x4", "x5", "x5"], [item["table_wrap_id"] for item in expected]
+        )
+        self.assertEqual(expected, obtained)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,6 @@
+from contextvars import copy_context
 from unittest import TestCase
+from unittest.mock import patch
 
 from lxml import etree
 
@@ -516,3 +518,71 @@ class XrefRefTypeFn(TestCase):
         self.assertEqual(expected, result)
 
 
+class TestTextExtraction(TestCase):
+
+    def test_process_subtags_does_not_copy_the_node(self):
+        xmltree = etree.fromstring(
+            "<p>a <bold>b <italic>c <sup>d</sup></italic></bold>"
+            '<xref ref-type="fn">1</xref> e</p>'
+        )
+        with patch("packtools.sps.utils.xml_utils.deepcopy") as mock_deepcopy:
+            result = xml_utils.process_subtags(xmltree)
+        mock_deepcopy.assert_not_called()
+        self.assertEqual("a b <i>c <sup>d</sup></i> e", result)
+
+    def test_remove_subtags_drops_comments(self):
+        xmltree = etree.fromstring("<p>a <!-- comentário --> b<bold>c</bold></p>")
+        self.assertEqual("a b<bold>c</bold>", xml_utils.remove_subtags(xmltree, ["bold"]))
+
+    def test_tag_kept_with_content_is_not_followed_by_its_tail_twice(self):
+        xmltree = etree.fromstring(
+            '<p xmlns:mml="http://www.w3.org/1998/Math/MathML">'
+            "Seja <mml:math><mml:mi>x</mml:mi></mml:math> positivo</p>"
+        )
+        self.assertEqual(
+            'Seja <mml:math xmlns:mml="http://www.w3.org/1998/Math/MathML">'
+            "<mml:mi>x</mml:mi></mml:math> positivo",
+            xml_utils.process_subtags(xmltree),
+        )
+
+    def test_footnote_markers_apply_to_all_levels(self):
+        xmltree = etree.fromstring(
+            '<p>a<xref ref-type="bibr">†</xref> <bold>b<xref ref-type="bibr">†</xref></bold></p>'
+        )
+        self.assertEqual(
+            "a <bold>b</bold>",
+            xml_utils.remove_subtags(xmltree, ["bold"], footnote_markers=["†"]),
+        )
+
+    def test_xref_tail_is_removed_between_removed_xrefs(self):
+        xmltree = etree.fromstring(
+            '<p>Texto<xref ref-type="bibr">1</xref>,<xref ref-type="bibr">2</xref> fim</p>'
+        )
+        self.assertEqual("Texto fim", xml_utils.node_plain_text(xmltree))
+        self.assertEqual("Texto fim", xml_utils.process_subtags(xmltree))
+
+    def test_xref_inside_kept_xref_keeps_its_content(self):
+        xmltree = etree.fromstring(
+            '<p>a <xref ref-type="bibr">Silva <xref ref-type="fn">1</xref></xref> b</p>'
+        )
+        self.assertEqual(
+            'a <xref ref-type="bibr">Silva 1</xref> b',
+            xml_utils.remove_subtags(xmltree, ["xref"]),
+        )
+        self.assertEqual("a Silva 1 b", xml_utils.node_plain_text(xmltree))
+
+    def test_text_memo(self):
+        xmltree = etree.fromstring("<p>a <bold>b</bold></p>")
+
+        def extract_twice():
+            xml_utils.set_text_memo()
+            first = (xml_utils.node_plain_text(xmltree), xml_utils.process_subtags(xmltree))
+            xmltree.find("bold").text = "c"
+            second = (xml_utils.node_plain_text(xmltree), xml_utils.process_subtags(xmltree))
+            return first, second
+
+        first, second = copy_context().run(extract_twice)
+        self.assertEqual(("a b", "a b"), first)
+        self.assertEqual(first, second)
+        # fora do contexto em que foi ativada, não há memorização
+        self.assertEqual("a c", xml_utils.node_plain_text(xmltree))
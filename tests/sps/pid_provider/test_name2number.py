@@ -0,0 +1,99 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from packtools.sps.pid_provider import name2number
+from packtools.sps.pid_provider.xml_loader import load_xml
+from packtools.sps.pid_provider.xml_sps_lib import get_xml_with_pre
+
+
+class FixPreLoadingTest(TestCase):
+    def test_html_entities_are_converted_to_numeric_references(self):
+        self.assertEqual(
+            "<p>S&#227;o Paulo &#8211; &#189;</p>",
+            name2number.fix_pre_loading("<p>S&atilde;o Paulo &ndash; &frac12;</p>"),
+        )
+
+    def test_xml_entities_and_numeric_references_are_kept(self):
+        xml = "<p>&amp; &lt; &gt; &quot; &apos; &#233; &#xE9; &#Xe9;</p>"
+        self.assertEqual(xml, name2number.fix_pre_loading(xml))
+
+    def test_legacy_table_has_precedence(self):
+        self.assertEqual(
+            "<p>'texto'</p>", name2number.fix_pre_loading("<p>&lquo;texto&rquo;</p>")
+        )
+
+    def test_unknown_entity_is_escaped(self):
+        self.assertEqual(
+            "<p>&amp;desconhecida;</p>",
+            name2number.fix_pre_loading("<p>&desconhecida;</p>"),
+        )
+
+    def test_bare_ampersand_is_escaped(self):
+        self.assertEqual(
+            "<p>AT&amp;T &amp; &amp;#; &amp;x</p>",
+            name2number.fix_pre_loading("<p>AT&T & &#; &x</p>"),
+        )
+
+    def test_cdata_is_kept(self):
+        xml = (
+            "<p>&eacute; <tex-math><![CDATA[a &= b & c &eacute; ]] &x]]>"
+            "</tex-math> & &eacute;</p>"
+        )
+        self.assertEqual(
+            "<p>&#233; <tex-math><![CDATA[a &= b & c &eacute; ]] &x]]>"
+            "</tex-math> &amp; &#233;</p>",
+            name2number.fix_pre_loading(xml),
+        )
+        self.assertEqual(
+            "a &= b & c &eacute; ]] &x",
+            etree.fromstring(name2number.fix_pre_loading(xml)).findtext("tex-math"),
+        )
+
+    def test_comments_are_kept(self):
+        xml = "<p>R&D <!-- R&D\n &eacute; --> &eacute;</p>"
+        self.assertEqual(
+            "<p>R&amp;D <!-- R&D\n &eacute; --> &#233;</p>",
+            name2number.fix_pre_loading(xml),
+        )
+
+    def test_xml_without_ampersand_is_returned_as_it_is(self):
+        xml = "<p>texto</p>"
+        self.assertIs(xml, name2number.fix_pre_loading(xml))
+
+    def test_fixed_xml_can_be_parsed(self):
+        xml = name2number.fix_pre_loading(
+            "<p>&eacute; &frac12; &rquo; &desconhecida; AT&T &amp;</p>"
+        )
+        self.assertEqual(
+            "é ½ ' &desconhecida; AT&T &", etree.fromstring(xml).text
+        )
+
+
+class FindEntitiesToFixTest(TestCase):
+    def test_find_entities_to_fix(self):
+        self.assertEqual(
+            ["&eacute;", "&frac12;", "&desconhecida;"],
+            list(
+                name2number.find_entities_to_fix(
+                    "<p>&eacute; &amp; &#233; &frac12; &desconhecida; &lt;"
+                    "<!-- &ndash; --><![CDATA[&ndash;]]></p>"
+                )
+            ),
+        )
+
+
+class LoadXMLWithEntitiesTest(TestCase):
+    def test_get_xml_with_pre(self):
+        xml_with_pre = get_xml_with_pre(
+            "<article><p>S&atilde;o Paulo &ndash; &frac12;</p></article>"
+        )
+        self.assertEqual(
+            "São Paulo – ½", xml_with_pre.xmltree.findtext(".//p")
+        )
+
+    def test_load_xml(self):
+        self.assertEqual(
+            "<article><p>São 'Paulo'</p></article>",
+            load_xml("<article><p>S&atilde;o &rquo;Paulo&rquo;</p></article>"),
+        )
@@ -1,5 +1,9 @@
+import gc
+import hashlib
 import os
+import weakref
 import unittest
+from io import BytesIO
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import MagicMock, mock_open, patch
@@ -7,11 +11,19 @@ from zipfile import ZIP_DEFLATED, ZipFile
 
 from lxml import etree
 
+from packtools.sps.pid_provider import xml_sps_lib
 from packtools.sps.pid_provider.xml_sps_lib import (
     GetXMLItemsError,
     XMLWithPre,
+    generate_finger_print,
     get_xml_items,
+    get_xml_with_pre,
+    get_zips,
     get_xml_with_pre_from_xml_file,
+    iter_xml_items,
+    iter_xml_with_pre_from_zip_file,
+    iter_xml_zip_items,
+    update_finger_print,
 )
 
 class TestGetXmlWithPreFromXmlFile(unittest.TestCase):
@@ -155,5 +167,178 @@ class TestGetXmlItems(TestCase):
             self.assertIn("xml_with_pre", items[0])
 
 
+class TestIterXMLWithPreFromZipFile(TestCase):
+    def _create_zip(self, tmpdir):
+        zip_path = os.path.join(tmpdir, "package.zip")
+        with ZipFile(zip_path, "w", compression=ZIP_DEFLATED) as zf:
+            zf.writestr("a.xml", "<article><p>a</p></article>")
+            zf.writestr("a.pdf", b"%PDF")
+            zf.writestr("b/b.xml", "<article><p>b</p></article>")
+            zf.writestr("c.xml", "<article>")
+        return zip_path
+
+    def test_items_are_loaded_when_consumed(self):
+        with TemporaryDirectory() as tmpdir:
+            zip_path = self._create_zip(tmpdir)
+            with patch(
+                "packtools.sps.pid_provider.xml_sps_lib.get_xml_with_pre",
+                wraps=get_xml_with_pre,
+            ) as mock_get_xml_with_pre:
+                items = iter_xml_with_pre_from_zip_file(zip_path)
+                first = next(items)
+                self.assertEqual(1, mock_get_xml_with_pre.call_count)
+                others = list(items)
+                self.assertEqual(3, mock_get_xml_with_pre.call_count)
+
+        self.assertEqual("a", first["xml_name"])
+        self.assertEqual("a", first["xml_with_pre"].xmltree.findtext("p"))
+        self.assertEqual(["a.pdf"], first["xml_with_pre"].zip_namelist)
+        self.assertEqual("b/b.xml", others[0]["xml_with_pre"].filename)
+        self.assertEqual("c", others[1]["xml_name"])
+        self.assertIn("error_message", others[1])
+
+    def test_handles_do_not_read_the_xml(self):
+        with TemporaryDirectory() as tmpdir:
+            zip_path = self._create_zip(tmpdir)
+            with patch.object(ZipFile, "read") as mock_read:
+                handles = list(iter_xml_zip_items(zip_path))
+                mock_read.assert_not_called()
+            self.assertEqual(
+                ["a.xml", "b/b.xml", "c.xml"], [item.path for item in handles]
+            )
+            # o zip, fechado ao fim da iteração, é reaberto
+            self.assertEqual(
+                "b", handles[1].load()["xml_with_pre"].xmltree.findtext("p")
+            )
+
+    def test_consumed_items_are_released(self):
+        with TemporaryDirectory() as tmpdir:
+            zip_path = self._create_zip(tmpdir)
+            items = XMLWithPre.create(path=zip_path)
+            first = weakref.ref(next(items))
+            next(items)
+            gc.collect()
+            self.assertIsNone(first())
+            with self.assertRaises(xml_sps_lib.GetXmlWithPreError):
+                list(items)
+
+    def test_invalid_zip_file(self):
+        with NamedTemporaryFile(suffix=".zip") as tmp:
+            with self.assertRaises(GetXMLItemsError):
+                list(iter_xml_items(tmp.name))
+
+
+class TestGetZips(TestCase):
+    def test_get_zips_copies_the_members_of_each_document(self):
+        with TemporaryDirectory() as tmpdir:
+            zip_path = os.path.join(tmpdir, "package.zip")
+            with ZipFile(zip_path, "w", compression=ZIP_DEFLATED) as zf:
+                zf.writestr("a.xml", "<article/>")
+                zf.writestr("a.pdf", b"%PDF a" * 100)
+                zf.writestr("a-gf01.jpg", b"jpg")
+                zf.writestr("b.xml", "<article/>")
+                zf.writestr("b-v1.mp4", b"video" * 100)
+
+            items = {
+                item["zipfilename"]: ZipFile(BytesIO(item["content"]))
+                for item in get_zips(zip_path)
+            }
+            with ZipFile(zip_path) as zf:
+                self.assertEqual(["a.zip", "b.zip"], sorted(items))
+                self.assertEqual(
+                    ["a-gf01.jpg", "a.pdf", "a.xml"], sorted(items["a.zip"].namelist())
+                )
+                self.assertEqual(
+                    ["b-v1.mp4", "b.xml"], sorted(items["b.zip"].namelist())
+                )
+                for item in items.values():
+                    self.assertIsNone(item.testzip())
+                    for zinfo in item.infolist():
+                        self.assertEqual(
+                            zf.getinfo(zinfo.filename).compress_size,
+                            zinfo.compress_size,
+                        )
+                        self.assertEqual(zf.read(zinfo.filename), item.read(zinfo))
+
+
 if __name__ == "__main__":
     unittest.main()
+
+
+FINGER_PRINT_XML = """<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE article PUBLIC "-//NLM//DTD JATS (Z39.96) Journal Publishing DTD v1.1 20151215//EN" "https://jats.nlm.nih.gov/publishing/1.1/JATS-journalpublishing1.dtd">
+<article article-type="research-article" xml:lang="pt">
+<front>
+<article-meta>
+<title-group><article-title>Educação e saúde: straße</article-title></title-group>
+{comment_in_element}
+<counts>{comment_only}</counts>
+</article-meta>
+</front>
+<body><p>Texto com <italic>itálico</italic>{comment_in_mixed_content}.</p></body>
+</article>"""
+
+
+class TestFingerPrint(TestCase):
+    def _get_xml_with_pre(self, **comments):
+        params = dict(
+            comment_in_element="", comment_only="", comment_in_mixed_content=""
+        )
+        params.update(comments)
+        return get_xml_with_pre(FINGER_PRINT_XML.format(**params))
+
+    def test_finger_print_without_comments(self):
+        xml_with_pre = self._get_xml_with_pre()
+        self.assertEqual(
+            generate_finger_print(xml_with_pre.tostring(pretty_print=True)),
+            xml_with_pre.finger_print,
+        )
+
+    def test_finger_print_with_comments_does_not_reparse_the_xml(self):
+        xml_with_pre = self._get_xml_with_pre(
+            comment_in_element="<!-- revisar -->",
+            comment_in_mixed_content="<!-- nota -->",
+        )
+        with patch.object(XMLWithPre, "create") as mock_create:
+            finger_print = xml_with_pre.finger_print
+        mock_create.assert_not_called()
+        self.assertEqual(
+            xml_with_pre._get_finger_print_by_reparsing(), finger_print
+        )
+
+    def test_finger_print_with_element_emptied_by_removing_comments(self):
+        xml_with_pre = self._get_xml_with_pre(comment_only="<!-- vazio -->")
+        self.assertEqual(
+            xml_with_pre._get_finger_print_by_reparsing(),
+            xml_with_pre.finger_print,
+        )
+
+    def test_finger_print_with_element_reindented_by_removing_comments(self):
+        xml_with_pre = get_xml_with_pre(
+            "<article><front><!-- nota --> texto <a/></front></article>"
+        )
+        self.assertEqual(
+            (True, False), xml_sps_lib.inspect_comments_removal(xml_with_pre.xmltree)
+        )
+        self.assertEqual(
+            xml_with_pre._get_finger_print_by_reparsing(),
+            xml_with_pre.finger_print,
+        )
+
+    def test_finger_print_with_comment_inside_processing_instruction(self):
+        xml_with_pre = get_xml_with_pre(
+            "<article><p><?pi <!-- x -->?></p><!--c--></article>"
+        )
+        self.assertEqual(
+            xml_with_pre._get_finger_print_by_reparsing(),
+            xml_with_pre.finger_print,
+        )
+
+    def test_update_finger_print_in_chunks(self):
+        content = "Educação ß straße " * 10
+        for data in (content, content.encode("utf-8"), b"ascii only " * 10):
+            with patch.object(xml_sps_lib, "FINGER_PRINT_CHUNK_SIZE", 7):
+                digest = hashlib.sha256()
+                update_finger_print(digest, data)
+            text = data if isinstance(data, str) else data.decode("utf-8")
+            self.assertEqual(generate_finger_print(text), digest.hexdigest())
@@ -1,7 +1,9 @@
 from unittest import TestCase
 
 from lxml import etree
+from packtools.sps.models.article_index import ArticleIndex
 from packtools.sps.validation.article_xref import ArticleXrefValidation
+from packtools.sps.validation.models.article_xref import XMLCrossReference
 
 
 def filter_results(results):
@@ -1024,3 +1026,40 @@ class TestResponseFormat(TestCase):
         self.assertIsNone(result["advice"])
         self.assertIsNone(result["adv_text"])
         self.assertIsNone(result["adv_params"])
+
+
+class TestSharedArticleIndex(TestCase):
+    """ArticleXrefValidation uses the ArticleIndex given in params."""
+
+    def test_results_with_shared_index_are_the_same(self):
+        xml_tree = etree.fromstring(
+            '<article article-type="research-article" xml:lang="pt">'
+            "<body>"
+            '<p><xref ref-type="fig" rid="f1">1</xref>'
+            '<xref ref-type="table" rid="t9">2</xref></p>'
+            '<fig id="f1"/><table-wrap id="t1"/>'
+            "</body>"
+            '<sub-article article-type="translation" xml:lang="en" id="s1">'
+            '<body><p><xref ref-type="fig" rid="f2">1</xref></p><fig id="f2"/></body>'
+            "</sub-article>"
+            "</article>"
+        )
+        index = ArticleIndex(xml_tree)
+        for method in (
+            "validate_rid_has_corresponding_id",
+            "validate_xref_rid_has_corresponding_element_id",
+            "validate_element_id_has_corresponding_xref_rid",
+        ):
+            with self.subTest(method=method):
+                expected = list(getattr(ArticleXrefValidation(xml_tree), method)())
+                validator = ArticleXrefValidation(xml_tree, {"article_index": index})
+                self.assertIs(index, validator.xml_cross_refs.index)
+                self.assertEqual(expected, list(getattr(validator, method)()))
+
+    def test_all_ids_include_the_root_id(self):
+        xml_tree = etree.fromstring(
+            '<article id="a1"><body><fig id="f1"/><p id=""/></body></article>'
+        )
+        self.assertEqual(
+            {"a1", "f1"}, XMLCrossReference(xml_tree, ArticleIndex(xml_tree)).all_ids()
+        )
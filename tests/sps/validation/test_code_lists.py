@@ -0,0 +1,108 @@
+import pickle
+from unittest import TestCase
+
+from packtools.catalogs.checks import ISO3166_CODES_SET
+from packtools.sps.validation import code_lists
+from packtools.sps.validation.aff import AffiliationValidation
+from packtools.sps.validation.xml_validator_rules import get_default_ruleset
+
+
+class CodeSetTest(TestCase):
+    def test_list(self):
+        self.assertEqual(frozenset(["BR", "PT"]), code_lists.code_set(["BR", "PT"]))
+
+    def test_sets_are_returned_as_they_are(self):
+        codes = {"BR", "PT"}
+        self.assertIs(codes, code_lists.code_set(codes))
+
+    def test_none(self):
+        self.assertEqual(frozenset(), code_lists.code_set(None))
+
+    def test_iso3166_codes_set_is_read_once(self):
+        self.assertIs(ISO3166_CODES_SET(), ISO3166_CODES_SET())
+
+
+class RuleSetCodeListsTest(TestCase):
+    def test_code_set_is_built_once_per_ruleset(self):
+        ruleset = get_default_ruleset()
+        codes = code_lists.get_code_set(ruleset, "country_codes_list")
+        self.assertIsInstance(codes, frozenset)
+        self.assertIn("BR", codes)
+        self.assertIs(codes, code_lists.get_code_set(ruleset, "country_codes_list"))
+        self.assertIn("pt", code_lists.get_code_set(ruleset, "language_codes_list"))
+
+    def test_code_set_of_an_overridden_ruleset(self):
+        default = get_default_ruleset()
+        codes = code_lists.get_code_set(default, "country_codes_list")
+        ruleset = default.override({"journal_data": {"x": 1}})
+        self.assertIs(codes, code_lists.get_code_set(ruleset, "country_codes_list"))
+
+        ruleset = ruleset.override({"country_codes_list": ["BR"]})
+        self.assertEqual(
+            frozenset(["BR"]), code_lists.get_code_set(ruleset, "country_codes_list")
+        )
+        self.assertIs(codes, code_lists.get_code_set(default, "country_codes_list"))
+
+    def test_code_set_of_a_dict(self):
+        self.assertEqual(
+            frozenset(["BR"]),
+            code_lists.get_code_set({"country_codes_list": ["BR"]}, "country_codes_list"),
+        )
+
+    def test_code_sets_are_not_pickled(self):
+        ruleset = get_default_ruleset()
+        code_lists.get_code_set(ruleset, "country_codes_list")
+        self.assertEqual({}, pickle.loads(pickle.dumps(ruleset))._lookups)
+
+    def test_credit_taxonomy(self):
+        ruleset = get_default_ruleset()
+        taxonomy = code_lists.get_credit_taxonomy(ruleset)
+        uri = "https://credit.niso.org/contributor-roles/conceptualization/"
+        self.assertEqual("Conceptualization", taxonomy.by_uri[uri])
+        self.assertEqual(uri, taxonomy.by_term["CONCEPTUALIZATION"])
+        self.assertEqual("Conceptualization", taxonomy.terms[0])
+        self.assertIs(taxonomy, code_lists.get_credit_taxonomy(ruleset))
+
+    def test_special_chars_award_id(self):
+        ruleset = get_default_ruleset()
+        special_chars = code_lists.get_special_chars_award_id(ruleset)
+        self.assertEqual(frozenset(["/", ".", "-"]), special_chars)
+        self.assertIs(special_chars, code_lists.get_special_chars_award_id(ruleset))
+
+
+class CountryCodeValidationTest(TestCase):
+    def _validate(self, country_code):
+        affiliation = {
+            "id": "aff1",
+            "original": "Universidade de São Paulo, Brasil",
+            "country_code": country_code,
+            "parent": "article",
+        }
+        params = {"country_codes_list": ["AR", "BR", "CL", "CO", "MX", "PE", "PT"]}
+        validator = AffiliationValidation(affiliation, params)
+        return list(validator.validate_country_code())[0]
+
+    def test_valid_code_has_no_codes_listing(self):
+        result = self._validate("BR")
+        self.assertEqual("OK", result["response"])
+        self.assertIsNone(result["advice"])
+        self.assertIsNone(result["adv_params"])
+
+    def test_invalid_code_lists_the_codes(self):
+        result = self._validate("XX")
+        self.assertEqual("CRITICAL", result["response"])
+        self.assertIn("['AR', 'BR', 'CL', 'CO', 'MX', 'PE', 'PT']", result["advice"])
+        self.assertEqual(
+            "AR, BR, CL, CO, MX, ... (7 codes total)",
+            result["adv_params"]["codes"],
+        )
+
+    def test_country_codes_set_is_used(self):
+        affiliation = {"id": "aff1", "country_code": "BR", "parent": "article"}
+        params = {
+            "country_codes_list": ["BR"],
+            "country_codes_set": frozenset(["PT"]),
+        }
+        validator = AffiliationValidation(affiliation, params)
+        result = list(validator.validate_country_code())[0]
+        self.assertEqual("CRITICAL", result["response"])
@@ -4,6 +4,7 @@ from unittest.mock import Mock
 from lxml import etree
 
 from packtools.sps.validation.basefn import BaseFnValidation
+from packtools.sps.models.article_index import ArticleIndex
 from packtools.sps.validation.fn import XMLFnGroupValidation, FnValidation
 
 
@@ -257,6 +258,28 @@ class TestFnValidation(unittest.TestCase):
         fn_type_presence = [item for item in results if "@fn-type attribute presence" in item["title"]]
         self.assertEqual(len(fn_type_presence), 0)
 
+    def test_edited_by_with_article_index(self):
+        xml_tree = etree.fromstring(
+            '<article article-type="research-article" xml:lang="pt">'
+            '<front><article-meta><author-notes>'
+            '<fn fn-type="edited-by" id="fn1"><p>Editor A</p></fn>'
+            '</author-notes></article-meta></front>'
+            '<fn fn-type="edited-by" id="fn0"><p>Not in a section</p></fn>'
+            '<sub-article article-type="translation" xml:lang="en" id="s1">'
+            '<front-stub><author-notes>'
+            '<fn fn-type="edited-by" id="fn2"><p>Editor A</p></fn>'
+            '</author-notes></front-stub>'
+            '</sub-article>'
+            '</article>'
+        )
+        rules = dict(self.rules, article_index=ArticleIndex(xml_tree))
+        expected = list(XMLFnGroupValidation(xml_tree, self.rules).validate_edited_by())
+        obtained = list(XMLFnGroupValidation(xml_tree, rules).validate_edited_by())
+        self.assertEqual(
+            ["fn1", "fn2", "fn2"], [item["fn_id"] for item in expected[0]["data"]]
+        )
+        self.assertEqual(expected, obtained)
+
 
 if __name__ == "__main__":
     unittest.main()
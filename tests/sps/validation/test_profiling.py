@@ -0,0 +1,200 @@
+import json
+import tracemalloc
+from contextvars import copy_context
+from unittest import TestCase
+
+from lxml import etree
+
+from packtools.sps.validation.profiling import (
+    SETUP_GROUP,
+    DocumentProfile,
+    ValidationProfile,
+    measure_check,
+    percentile,
+    set_profile,
+)
+from packtools.sps.validation.xml_validator import get_validation_results
+
+
+XML = """
+<article article-type="research-article" xml:lang="en" xmlns:xlink="http://www.w3.org/1999/xlink">
+    <front>
+        <article-meta>
+            <title-group><article-title>Title</article-title></title-group>
+        </article-meta>
+    </front>
+    <body>
+        <fig id="f1"><label>Figure 1</label><graphic xlink:href="f1.jpg"/></fig>
+        <fig><graphic/></fig>
+    </body>
+</article>
+"""
+
+
+def validate_items(count, error=None):
+    for index in range(count):
+        yield {"index": index}
+    if error:
+        raise error
+
+
+class PercentileTest(TestCase):
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(50, percentile(values, 50))
+        self.assertEqual(95, percentile(values, 95))
+        self.assertEqual(100, percentile(values, 100))
+        self.assertEqual(3, percentile([3], 95))
+
+    def test_empty(self):
+        self.assertIsNone(percentile([], 50))
+
+
+class DocumentProfileTest(TestCase):
+    def test_measure_yields_the_items(self):
+        profile = DocumentProfile()
+        items = list(profile.measure("fig", validate_items(3)))
+        self.assertEqual([{"index": 0}, {"index": 1}, {"index": 2}], items)
+        measure = profile.measures["fig"]
+        self.assertEqual(3, measure["results"])
+        self.assertGreaterEqual(measure["seconds"], 0)
+        self.assertIsNone(measure["peak"])
+
+    def test_measure_is_added_if_the_validation_fails(self):
+        profile = DocumentProfile()
+        items = profile.measure("fig", validate_items(2, ValueError("erro")))
+        with self.assertRaises(ValueError):
+            list(items)
+        self.assertEqual(2, profile.measures["fig"]["results"])
+
+    def test_measure_is_added_if_the_items_are_not_consumed(self):
+        profile = DocumentProfile()
+        items = profile.measure("fig", validate_items(3))
+        next(items)
+        items.close()
+        self.assertEqual(1, profile.measures["fig"]["results"])
+
+    def test_trace_memory(self):
+        if not tracemalloc.is_tracing():
+            self.addCleanup(tracemalloc.stop)
+        profile = DocumentProfile(trace_memory=True)
+        list(
+            profile.measure("fig", ([0] * 10000 for _ in range(2)))
+        )
+        self.assertGreater(profile.measures["fig"]["peak"], 0)
+
+    def test_add_sums_the_measures_of_the_group(self):
+        profile = DocumentProfile()
+        profile.add("article languages", 0.5, 2)
+        profile.add("article languages", 0.25, 1)
+        self.assertEqual(
+            {"article languages": {"seconds": 0.75, "results": 3, "peak": None}},
+            profile.measures,
+        )
+
+
+    def test_measure_check_of_the_current_group(self):
+        profile = DocumentProfile()
+
+        def validate_group():
+            yield from profile.measure_check("validate_items", validate_items, 2)
+            yield from profile.measure_check("validate_more", validate_items, 1)
+
+        items = list(profile.measure("fig", validate_group()))
+        self.assertEqual(3, len(items))
+        self.assertEqual(
+            ["fig/validate_items", "fig/validate_more"], sorted(profile.checks)
+        )
+        self.assertEqual(2, profile.checks["fig/validate_items"]["results"])
+        self.assertEqual(1, profile.checks["fig/validate_more"]["results"])
+        self.assertEqual(3, profile.measures["fig"]["results"])
+        self.assertIsNone(profile.group)
+
+
+class MeasureCheckTest(TestCase):
+    def test_without_profile_calls_the_method(self):
+        self.assertEqual(
+            [{"index": 0}], list(measure_check(validate_items, 1))
+        )
+
+    def test_with_profile_names_the_check_by_the_method(self):
+        profile = DocumentProfile()
+        context = copy_context()
+        context.run(set_profile, profile)
+        items = context.run(measure_check, validate_items, 2)
+        self.assertEqual(2, len(list(profile.measure("fig", items))))
+        self.assertEqual(2, profile.checks["fig/validate_items"]["results"])
+
+
+class GetValidationResultsProfileTest(TestCase):
+    def test_profile_does_not_change_the_results(self):
+        xmltree = etree.fromstring(XML)
+        profile = DocumentProfile()
+        expected = list(get_validation_results(xmltree, {}))
+        results = list(get_validation_results(xmltree, {}, profile=profile))
+        self.assertEqual(expected, results)
+
+        self.assertIn(SETUP_GROUP, profile.measures)
+        self.assertIn("fig", profile.measures)
+        self.assertEqual(
+            len([item for item in results if item["group"] == "fig"]),
+            profile.measures["fig"]["results"],
+        )
+        self.assertIn("fig/ArticleFigValidation.validate", profile.checks)
+        self.assertEqual(
+            1,
+            profile.checks["bibliographic strip/PaginationValidation.validate"][
+                "results"
+            ],
+        )
+        self.assertEqual(
+            profile.measures["fig"]["results"],
+            sum(
+                measure["results"]
+                for check, measure in profile.checks.items()
+                if check.startswith("fig/")
+            ),
+        )
+
+
+class ValidationProfileTest(TestCase):
+    def setUp(self):
+        self.profile = ValidationProfile()
+        for seconds in (0.001, 0.002, 0.003, 0.010):
+            document = DocumentProfile()
+            document.add("fig", seconds, 2)
+            document.add("reference", seconds * 10, 5)
+            document.add_check("fig", "ArticleFigValidation.validate", seconds, 2)
+            self.profile.add(document)
+
+    def test_summary(self):
+        rows = self.profile.summary()
+        self.assertEqual(["reference", "fig"], [row["group"] for row in rows])
+        fig = rows[1]
+        self.assertEqual(4, fig["documents"])
+        self.assertAlmostEqual(0.016, fig["total_seconds"])
+        self.assertAlmostEqual(2, fig["p50_ms"])
+        self.assertAlmostEqual(10, fig["p95_ms"])
+        self.assertEqual(8, fig["results"])
+        self.assertIsNone(fig["p95_peak_kib"])
+
+    def test_to_json(self):
+        data = json.loads(self.profile.to_json())
+        self.assertEqual(4, data["documents"])
+        self.assertEqual(["reference", "fig"], [row["group"] for row in data["groups"]])
+        self.assertEqual(
+            ["fig/ArticleFigValidation.validate"],
+            [row["group"] for row in data["checks"]],
+        )
+
+    def test_format_table(self):
+        lines = self.profile.format_table().splitlines()
+        self.assertEqual(3, len(lines))
+        self.assertTrue(lines[0].startswith("group"))
+        self.assertTrue(lines[1].startswith("reference"))
+
+    def test_format_table_by_check(self):
+        lines = self.profile.format_table(by_check=True).splitlines()
+        self.assertEqual(2, len(lines))
+        self.assertTrue(lines[0].startswith("check"))
+        self.assertTrue(lines[1].startswith("fig/ArticleFigValidation.validate"))
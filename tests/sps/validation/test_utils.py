@@ -1,11 +1,17 @@
 import unittest
+from contextvars import copy_context
 from unittest import skip
 from unittest.mock import patch
 
 from packtools.sps.validation.utils import (
+    REPORT_ALL,
+    REPORT_FAILURES,
+    build_response,
     get_doi_information,
+    get_report,
     handle_doi_response,
     is_valid_url_format,
+    set_report,
 )
 from packtools.sps.utils import xml_utils
 
@@ -118,3 +124,58 @@ class MyTestCase(unittest.TestCase):
 
 if __name__ == '__main__':
     unittest.main()
+
+
+class BuildResponseReportTest(unittest.TestCase):
+    def _build_response(self, is_valid):
+        return build_response(
+            title="title",
+            parent={"parent": "article", "parent_lang": "en"},
+            item="fig",
+            sub_item="@id",
+            validation_type="exist",
+            is_valid=is_valid,
+            expected="id",
+            obtained="f1" if is_valid else None,
+            advice="Add id",
+            data={"id": "f1"},
+            error_level="ERROR",
+        )
+
+    def _run_with_report(self, report, is_valid):
+        context = copy_context()
+        context.run(set_report, report)
+        return context.run(self._build_response, is_valid)
+
+    def test_report_all_renders_valid_response(self):
+        result = self._run_with_report(REPORT_ALL, True)
+        self.assertEqual("OK", result["response"])
+        self.assertEqual("Got f1, expected id", result["message"])
+        self.assertIsNotNone(result["msg_text"])
+
+    def test_report_failures_compacts_valid_response(self):
+        result = self._run_with_report(REPORT_FAILURES, True)
+        self.assertEqual("OK", result["response"])
+        self.assertEqual("article", result["parent"])
+        self.assertEqual("en", result["parent_lang"])
+        self.assertEqual("f1", result["got_value"])
+        self.assertIsNone(result["message"])
+        self.assertIsNone(result["msg_text"])
+        self.assertIsNone(result["msg_params"])
+        self.assertEqual(
+            set(self._build_response(True)), set(result)
+        )
+
+    def test_report_failures_renders_invalid_response(self):
+        self.assertEqual(
+            self._run_with_report(REPORT_ALL, False),
+            self._run_with_report(REPORT_FAILURES, False),
+        )
+
+    def test_report_failures_does_not_leak(self):
+        self._run_with_report(REPORT_FAILURES, True)
+        self.assertEqual(REPORT_ALL, get_report())
+
+    def test_set_report_rejects_unknown_report(self):
+        with self.assertRaises(ValueError):
+            copy_context().run(set_report, "errors")
@@ -0,0 +1,75 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from lxml import etree
+
+from packtools.domain import StdDTD
+from packtools.sps.pid_provider.xml_sps_lib import XMLWithPre
+from packtools.sps.validation.xml_structure import StructureValidator
+
+
+SAMPLE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "samples",
+    "artigo-com-traducao-e-pareceres-traduzidos.xml",
+)
+
+
+ANNOTATED_XML = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "fixtures",
+    "annotated",
+    "artigo-com-traducao-e-pareceres-traduzidos.structure.xml",
+)
+
+
+def get_xml_with_pre():
+    return next(XMLWithPre.create(path=SAMPLE))
+
+
+class StructureValidatorTest(TestCase):
+    def test_uses_std_dtd(self):
+        xml_with_pre = get_xml_with_pre()
+        validator = StructureValidator(xml_with_pre)
+        self.assertIs(StdDTD(xml_with_pre.public_id), validator.xml_validator.dtd)
+
+    def test_does_not_write_temporary_files(self):
+        with patch("tempfile.mkdtemp") as mkdtemp:
+            StructureValidator(get_xml_with_pre())
+        mkdtemp.assert_not_called()
+
+    def test_validate_dtd(self):
+        result = StructureValidator(get_xml_with_pre()).validate_dtd()
+        self.assertTrue(result["dtd_is_valid"])
+        self.assertEqual([], result["dtd_errors"])
+
+    def test_validate_dtd_reports_errors(self):
+        xml_with_pre = get_xml_with_pre()
+        xml_with_pre.xmltree.find(".//front").append(
+            xml_with_pre.xmltree.makeelement("invalid", {})
+        )
+        result = StructureValidator(xml_with_pre).validate_dtd()
+        self.assertFalse(result["dtd_is_valid"])
+        self.assertIn("invalid", result["dtd_errors"][0].message)
+
+    def test_annotate_errors_is_the_same_of_the_baseline(self):
+        # written before the DTD was shared, with the DTD loaded while parsing
+        with open(ANNOTATED_XML, encoding="utf-8") as fp:
+            expected = fp.read()
+        annotated = StructureValidator(get_xml_with_pre()).annotate_errors()
+        self.assertEqual(expected, annotated)
+
+    def test_annotate_errors_is_the_serialized_annotate_errors(self):
+        validator = StructureValidator(get_xml_with_pre())
+        expected = etree.tostring(
+            validator.xml_validator.annotate_errors(),
+            pretty_print=True,
+            encoding="utf-8",
+            xml_declaration=True,
+        ).decode("utf-8")
+        self.assertEqual(expected, validator.annotate_errors())
@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from packtools.sps.validation.utils import get_report
+from packtools.sps.validation.xml_validator import get_validation_results
+
+
+XML = """
+<article article-type="research-article" xml:lang="en" xmlns:xlink="http://www.w3.org/1999/xlink">
+    <front>
+        <article-meta>
+            <title-group><article-title>Title</article-title></title-group>
+        </article-meta>
+    </front>
+    <body>
+        <fig id="f1"><label>Figure 1</label><graphic xlink:href="f1.jpg"/></fig>
+        <fig><graphic/></fig>
+    </body>
+</article>
+"""
+
+
+class GetValidationResultsReportTest(TestCase):
+    def setUp(self):
+        self.xmltree = etree.fromstring(XML)
+
+    def test_report_failures_yields_only_failures(self):
+        results = list(get_validation_results(self.xmltree, {}))
+        failures = list(
+            get_validation_results(self.xmltree, {}, report="failures")
+        )
+        self.assertTrue(failures)
+        self.assertEqual(
+            [item for item in results if item["response"] != "OK"],
+            failures,
+        )
+
+    def test_report_failures_does_not_change_caller_report(self):
+        for item in get_validation_results(self.xmltree, {}, report="failures"):
+            self.assertEqual("all", get_report())
+
+    def test_invalid_report(self):
+        with self.assertRaises(ValueError):
+            list(get_validation_results(self.xmltree, {}, report="errors"))
@@ -0,0 +1,154 @@
+import copy
+import json
+import pickle
+from unittest import TestCase
+
+from lxml import etree
+
+from packtools.sps.validation.xml_validator import get_validation_results
+from packtools.sps.validation.xml_validator_rules import (
+    RuleSet,
+    get_default_rules,
+    get_default_ruleset,
+    get_group_rules,
+    get_group_ruleset,
+    get_ruleset,
+)
+
+
+XML = """
+<article article-type="research-article" xml:lang="en" xmlns:xlink="http://www.w3.org/1999/xlink">
+    <front>
+        <article-meta>
+            <title-group><article-title>Title</article-title></title-group>
+            <related-article related-article-type="correction-forward" ext-link-type="doi" xlink:href="10.1590/abc" id="ra1"/>
+        </article-meta>
+    </front>
+    <body>
+        <fig id="f1"><label>Figure 1</label><graphic xlink:href="f1.jpg"/></fig>
+        <table-wrap id="t1"><label>Table 1</label><table/></table-wrap>
+    </body>
+</article>
+"""
+
+
+class RuleSetTest(TestCase):
+    def test_default_ruleset_is_built_once(self):
+        self.assertIs(get_default_ruleset(), get_default_ruleset())
+
+    def test_get_ruleset_returns_given_ruleset(self):
+        ruleset = get_default_ruleset().override({"journal_data": {"a": 1}})
+        self.assertIs(get_ruleset(ruleset), ruleset)
+
+    def test_get_ruleset_without_layers_returns_default(self):
+        self.assertIs(get_ruleset(None), get_default_ruleset())
+        self.assertIs(get_ruleset({}), get_default_ruleset())
+
+    def test_ruleset_is_read_only(self):
+        ruleset = get_default_ruleset()
+        with self.assertRaises(TypeError):
+            ruleset["fig_rules"] = {}
+        with self.assertRaises(TypeError):
+            ruleset["fig_rules"]["absent_error_level"] = "INFO"
+        with self.assertRaises(AttributeError):
+            ruleset["fig_rules"].update({"absent_error_level": "INFO"})
+
+    def test_nested_values_are_read_only(self):
+        rules = get_default_ruleset()["article_dates_rules"]
+        with self.assertRaises(TypeError):
+            rules["required_events"].append("rev-recd")
+        with self.assertRaises(TypeError):
+            rules["required_events"] += ["rev-recd"]
+        with self.assertRaises(TypeError):
+            rules["required_history_events_for_article_type"]["x"] = "y"
+        with self.assertRaises(TypeError):
+            rules["required_history_events_for_article_type"].update({"x": "y"})
+
+    def test_nested_values_behave_as_lists_and_dicts(self):
+        rules = get_default_ruleset()["article_dates_rules"]
+        events = get_default_rules()["article_dates_rules"]["required_events"]
+        self.assertEqual(events, rules["required_events"])
+        self.assertEqual(str(events), str(rules["required_events"]))
+        self.assertEqual(events + ["x"], rules["required_events"] + ["x"])
+        self.assertEqual(
+            json.dumps(get_default_rules()["article_dates_rules"]),
+            json.dumps(dict(rules)),
+        )
+
+    def test_copies_of_nested_values_are_mutable(self):
+        events = get_default_ruleset()["article_dates_rules"]["required_events"]
+        for copied in (
+            copy.copy(events),
+            copy.deepcopy(events),
+            pickle.loads(pickle.dumps(events)),
+        ):
+            with self.subTest(copied=type(copied)):
+                self.assertIs(list, type(copied))
+                copied.append("x")
+        self.assertNotIn("x", events)
+
+    def test_ruleset_does_not_share_source_dict(self):
+        rules = {"fig_rules": {"absent_error_level": "ERROR"}}
+        ruleset = RuleSet(rules)
+        rules["fig_rules"]["absent_error_level"] = "INFO"
+        self.assertEqual("ERROR", ruleset["fig_rules"]["absent_error_level"])
+
+    def test_override_layers_are_merged_by_group(self):
+        default = get_default_ruleset()
+        collection = {"fig_rules": {"absent_error_level": "WARNING"}}
+        journal = {"fig_rules": {"id_error_level": "INFO"}, "journal_data": {"x": 1}}
+        call = {"fig_rules": {"absent_error_level": "ERROR"}}
+
+        ruleset = default.override(collection, journal, call)
+
+        self.assertEqual("ERROR", ruleset["fig_rules"]["absent_error_level"])
+        self.assertEqual("INFO", ruleset["fig_rules"]["id_error_level"])
+        self.assertEqual({"x": 1}, dict(ruleset["journal_data"]))
+        self.assertEqual(
+            set(default["fig_rules"]), set(ruleset["fig_rules"])
+        )
+        # default is untouched
+        self.assertEqual(
+            get_default_rules()["fig_rules"]["id_error_level"],
+            default["fig_rules"]["id_error_level"],
+        )
+
+    def test_to_dict_returns_mutable_copy(self):
+        rules = get_default_ruleset().to_dict()
+        rules["fig_rules"]["absent_error_level"] = "INFO"
+        rules["country_codes_list"].append("XX")
+        self.assertNotEqual(
+            "INFO", get_default_ruleset()["fig_rules"]["absent_error_level"]
+        )
+        self.assertNotIn("XX", get_default_ruleset()["country_codes_list"])
+
+    def test_get_default_rules_has_same_content(self):
+        self.assertEqual(get_default_rules(), get_default_ruleset().to_dict())
+
+    def test_group_ruleset_is_read_once(self):
+        self.assertIs(get_group_ruleset("formula"), get_group_ruleset("formula"))
+        self.assertEqual(
+            get_group_rules("formula"), get_group_ruleset("formula").to_dict()
+        )
+
+    def test_ruleset_is_picklable(self):
+        ruleset = get_default_ruleset().override({"journal_data": {"x": 1}})
+        loaded = pickle.loads(pickle.dumps(ruleset))
+        self.assertEqual(ruleset.to_dict(), loaded.to_dict())
+
+
+class GetValidationResultsWithRuleSetTest(TestCase):
+    def test_shared_ruleset_is_not_modified_by_validators(self):
+        ruleset = get_default_ruleset()
+        before = ruleset.to_dict()
+        xmltree = etree.fromstring(XML)
+        for i in range(2):
+            results = list(get_validation_results(xmltree, ruleset))
+            self.assertTrue(results)
+        self.assertEqual(before, ruleset.to_dict())
+
+    def test_ruleset_and_dict_params_give_same_results(self):
+        xmltree = etree.fromstring(XML)
+        from_dict = list(get_validation_results(xmltree, {}))
+        from_ruleset = list(get_validation_results(xmltree, get_default_ruleset()))
+        self.assertEqual(from_dict, from_ruleset)
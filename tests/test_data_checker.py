@@ -0,0 +1,88 @@
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+from packtools.data_checker import XMLDataChecker
+from packtools.sps.validation.profiling import ValidationProfile
+
+
+SAMPLES_PATH = os.path.join(os.path.dirname(__file__), "samples")
+SAMPLES = (
+    "article-abstract-and-trans-abstract.xml",
+    "example.xml",
+    "example2.xml",
+)
+
+
+def doi_api_get(doi_data):
+    return {"valid": True}
+
+
+class XMLDataCheckerValidateTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.xml_path = os.path.join(self.tmpdir, "xmls")
+        os.makedirs(self.xml_path)
+        for name in SAMPLES:
+            shutil.copy(os.path.join(SAMPLES_PATH, name), self.xml_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _validate(self, name, **kwargs):
+        csv_file_path = os.path.join(self.tmpdir, f"{name}-errors.csv")
+        exceptions_file_path = os.path.join(self.tmpdir, f"{name}-exceptions.jsonl")
+        checker = XMLDataChecker(csv_file_path, exceptions_file_path, self.xml_path)
+        checker.validate({"doi_api_get": doi_api_get}, False, **kwargs)
+        with open(csv_file_path, newline="") as fp:
+            return list(csv.DictReader(fp))
+
+    def test_validate_with_workers_writes_same_rows(self):
+        expected = self._validate("sequential")
+        result = self._validate("parallel", workers=2)
+        self.assertTrue(expected)
+        self.assertEqual(
+            sorted(tuple(row.items()) for row in expected),
+            sorted(tuple(row.items()) for row in result),
+        )
+
+    def test_validate_with_workers_ordered_keeps_input_order(self):
+        expected = self._validate("sequential")
+        result = self._validate("parallel", workers=3, ordered=True)
+        self.assertEqual(expected, result)
+
+    def test_validate_with_profile(self):
+        expected = self._validate("sequential")
+        profile = ValidationProfile()
+        result = self._validate("profile", workers=2, profile=profile)
+        self.assertEqual(
+            sorted(tuple(row.items()) for row in expected),
+            sorted(tuple(row.items()) for row in result),
+        )
+        self.assertEqual(len(SAMPLES), len(profile.documents))
+        groups = {row["group"]: row for row in profile.summary()}
+        self.assertEqual(len(SAMPLES), groups["(parse)"]["documents"])
+        self.assertEqual(len(SAMPLES), groups["reference"]["documents"])
+
+    def test_get_validated_xml_files_reports_unreadable_xml(self):
+        with open(os.path.join(self.xml_path, "broken.xml"), "w") as fp:
+            fp.write("<article>")
+        checker = XMLDataChecker(
+            os.path.join(self.tmpdir, "errors.csv"),
+            os.path.join(self.tmpdir, "exceptions.jsonl"),
+            self.xml_path,
+        )
+        xml_files = {
+            os.path.basename(xml_file.xml_file_path): xml_file
+            for xml_file in checker.get_validated_xml_files(
+                {"doi_api_get": doi_api_get}, workers=2
+            )
+        }
+        self.assertEqual(set(SAMPLES) | {"broken.xml"}, set(xml_files))
+        self.assertEqual([], xml_files["broken.xml"].results)
+
+
+if __name__ == "__main__":
+    unittest.main()
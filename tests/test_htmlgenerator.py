@@ -3,10 +3,15 @@ from __future__ import unicode_literals
 import unittest
 import io
 import os
+import shutil
+import tempfile
+from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
 from tempfile import NamedTemporaryFile
+from unittest import mock
 from lxml import etree
 
-from packtools import domain
+from packtools import catalogs, domain, htmlgenerator, utils
 
 
 NAMESPACES = {
@@ -2123,3 +2128,150 @@ class HTMLGeneratorModalWithFiguresAndTablesTests(unittest.TestCase):
         self.assertEqual(a.get("aria-controls"), "tables")
         self.assertEqual(a.get("data-toggle"), "tab")
 
+
+class RenderHTMLFilesTests(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.xml = os.path.join(
+            self.output_dir, "artigo-com-traducao-e-pareceres-traduzidos.xml")
+        shutil.copy(
+            os.path.join(
+                SAMPLES_PATH, "artigo-com-traducao-e-pareceres-traduzidos.xml"),
+            self.xml,
+        )
+        self.config = Namespace(
+            nonetwork=True, nochecks=True,
+            css=catalogs.HTML_GEN_DEFAULT_CSS_PATH,
+            print_css=catalogs.HTML_GEN_DEFAULT_PRINT_CSS_PATH,
+            js=catalogs.HTML_GEN_DEFAULT_JS_PATH,
+            math_elem_preference="mml:math", math_js="",
+            permlink="", url_article_page="", url_download_ris="",
+            gs_abstract=False, output_style="",
+            bootstrap_css=catalogs.HTML_GEN_BOOTSTRAP_CSS_PATH,
+            article_css=catalogs.HTML_GEN_ARTICLE_CSS_PATH,
+            design_system_static_img_path=None,
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def _read_html_files(self):
+        html_files = {}
+        for name in os.listdir(self.output_dir):
+            if name.endswith(".html"):
+                with open(os.path.join(self.output_dir, name), "rb") as fp:
+                    html_files[name] = fp.read()
+        return html_files
+
+    def test_parses_the_xml_once_for_all_xslt_versions(self):
+        with mock.patch.object(
+            htmlgenerator, "parse_xml", wraps=htmlgenerator.parse_xml
+        ) as mocked_parse_xml:
+            htmlgenerator.render_html_files(self.config, ["2.0", "3.0"], self.xml)
+        mocked_parse_xml.assert_called_once()
+        self.assertEqual(
+            [
+                "artigo-com-traducao-e-pareceres-traduzidos.en.3_0.html",
+                "artigo-com-traducao-e-pareceres-traduzidos.en.html",
+                "artigo-com-traducao-e-pareceres-traduzidos.pt.3_0.html",
+                "artigo-com-traducao-e-pareceres-traduzidos.pt.html",
+            ],
+            sorted(self._read_html_files()),
+        )
+
+    def test_renders_the_same_html_files_with_executor(self):
+        for xslt_version in ("2.0", "3.0"):
+            htmlgenerator.generate_html_files(self.config, xslt_version, self.xml)
+        expected = self._read_html_files()
+        for name in expected:
+            os.remove(os.path.join(self.output_dir, name))
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            htmlgenerator.render_html_files(
+                self.config, ["2.0", "3.0"], self.xml, executor)
+        self.assertEqual(expected, self._read_html_files())
+
+    def test_invalid_xml_is_skipped(self):
+        with open(self.xml, "w") as fp:
+            fp.write("<article>")
+        htmlgenerator.render_html_files(self.config, ["2.0", "3.0"], self.xml)
+        self.assertEqual({}, self._read_html_files())
+
+
+class HTMLGeneratorRenderTests(unittest.TestCase):
+    def setUp(self):
+        self.xml = get_xml_tree_from_file(
+            "artigo-com-traducao-e-pareceres-traduzidos.xml")
+
+    def test_render_serializes_the_generated_html(self):
+        generator = domain.HTMLGenerator(self.xml)
+        self.assertEqual(
+            etree.tostring(
+                generator.generate("pt"), pretty_print=True, encoding="utf-8",
+                method="html", doctype="<!DOCTYPE html>"),
+            generator.render("pt"),
+        )
+
+    def test_render_uses_render_cache(self):
+        cache = utils.MemoryHTMLRenderCache()
+        generator = domain.HTMLGenerator(self.xml, render_cache=cache)
+        html = generator.render("pt")
+
+        generator = domain.HTMLGenerator(self.xml, render_cache=cache)
+        with mock.patch.object(generator, "xslt") as mocked_xslt:
+            self.assertEqual(html, generator.render("pt"))
+        mocked_xslt.assert_not_called()
+
+    def test_render_cache_depends_on_params(self):
+        cache = utils.MemoryHTMLRenderCache()
+        domain.HTMLGenerator(self.xml, render_cache=cache).render("pt")
+
+        generator = domain.HTMLGenerator(
+            self.xml, css="other.css", render_cache=cache)
+        self.assertIn(b"other.css", generator.render("pt"))
+        self.assertEqual(2, len(cache._entries))
+
+    def test_render_without_doctype_is_the_str_of_the_generated_html(self):
+        for render_cache in (None, utils.MemoryHTMLRenderCache()):
+            with self.subTest(render_cache=render_cache):
+                generator = domain.HTMLGenerator(
+                    self.xml, render_cache=render_cache)
+                self.assertEqual(
+                    str(generator.generate("pt")),
+                    generator.render("pt", doctype=None).decode("utf-8"),
+                )
+
+    def test_render_cache_depends_on_doctype(self):
+        cache = utils.MemoryHTMLRenderCache()
+        generator = domain.HTMLGenerator(self.xml, render_cache=cache)
+        self.assertTrue(generator.render("pt").startswith(b"<!DOCTYPE html>"))
+        self.assertFalse(
+            generator.render("pt", doctype=None).startswith(b"<!DOCTYPE html>"))
+        self.assertEqual(2, len(cache._entries))
+
+    def test_render_does_not_hash_the_xslts(self):
+        generator = domain.HTMLGenerator(
+            self.xml, render_cache=utils.MemoryHTMLRenderCache())
+        with mock.patch.object(
+            utils, "get_htmlgenerator_xslt_hash"
+        ) as mocked_hash:
+            generator.render("pt")
+        mocked_hash.assert_not_called()
+
+    def test_render_cache_is_invalidated_when_xslts_change(self):
+        cache = utils.MemoryHTMLRenderCache()
+        domain.HTMLGenerator(self.xml, render_cache=cache).render("pt")
+
+        # the XSLT is compiled again, with the hash of the changed XSLTs
+        with mock.patch.dict(domain.XSLT.cache, clear=True), mock.patch.object(
+            utils, "get_htmlgenerator_xslt_hash", return_value="changed"
+        ):
+            generator = domain.HTMLGenerator(self.xml, render_cache=cache)
+            generator.render("pt")
+        self.assertEqual("changed", generator.xslt_digest)
+        self.assertEqual(2, len(cache._entries))
+
+    def test_render_unknown_language(self):
+        generator = domain.HTMLGenerator(
+            self.xml, render_cache=utils.MemoryHTMLRenderCache())
+        self.assertRaises(ValueError, lambda: generator.render("xx"))
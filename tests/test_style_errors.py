@@ -51,3 +51,25 @@ class SearchElementFunctionTests(unittest.TestCase):
         fp = etree.parse(io.BytesIO(b'<a>\n<b>bar</b>\n</a>'))
         self.assertRaises(ValueError, lambda: style_errors.search_element(fp, 'c', 2))
 
+
+class GetElementsByLineFunctionTests(unittest.TestCase):
+
+    def test_first_element_of_each_line(self):
+        fp = etree.parse(io.BytesIO(b'<a>\n<b>bar</b><c/>\n</a>'))
+        elements_by_line = style_errors.get_elements_by_line(fp)
+        self.assertEqual('a', elements_by_line[1].tag)
+        self.assertEqual('b', elements_by_line[2].tag)
+
+    def test_schema_style_error_uses_the_index(self):
+        fp = etree.parse(io.BytesIO(b'<a>\n<b>bar</b><c/>\n</a>'))
+        dtd = etree.XMLSchema(etree.parse(io.BytesIO(
+            b'<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            b'<xs:element name="a"><xs:complexType><xs:sequence>'
+            b'<xs:element name="b" type="xs:string"/>'
+            b'</xs:sequence></xs:complexType></xs:element></xs:schema>')))
+        dtd.validate(fp)
+        error = style_errors.SchemaStyleError(dtd.error_log[0])
+        elements_by_line = style_errors.get_elements_by_line(fp)
+        self.assertIs(error.get_apparent_element(fp),
+                error.get_apparent_element(fp, elements_by_line))
+        self.assertEqual('b', error.get_apparent_element(fp, elements_by_line).tag)
@@ -0,0 +1,153 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import zipfile
+
+from lxml import etree
+
+from packtools import stylechecker
+
+
+SAMPLES_PATH = os.path.join(os.path.dirname(__file__), "samples")
+ANNOTATED_XML = os.path.join(
+    os.path.dirname(__file__),
+    "fixtures",
+    "annotated",
+    "artigo-com-traducao-e-pareceres-traduzidos.stylechecker.xml",
+)
+
+
+def square(value):
+    return value * value
+
+
+class ImapBoundedTests(unittest.TestCase):
+    def test_keeps_input_order(self):
+        with multiprocessing.Pool(2) as pool:
+            result = list(stylechecker._imap_bounded(pool, square, range(10), 3))
+        self.assertEqual([value * value for value in range(10)], result)
+
+    def test_consumes_input_as_results_are_produced(self):
+        consumed = []
+
+        def items():
+            for value in range(10):
+                consumed.append(value)
+                yield value
+
+        with multiprocessing.Pool(2) as pool:
+            results = stylechecker._imap_bounded(pool, square, items(), 3)
+            self.assertEqual(0, next(results))
+            self.assertEqual([0, 1, 2], consumed)
+
+
+class ValidateFileTests(unittest.TestCase):
+    def test_summary(self):
+        xml = os.path.join(SAMPLES_PATH, "0034-7094-rba-69-03-0227.xml")
+        result = stylechecker.validate_file(xml)
+        self.assertIsNone(result["error"])
+        self.assertEqual(xml, result["summary"]["_xml"])
+        self.assertEqual(result["summary"]["is_valid"], result["is_valid"])
+
+    def test_annotated_is_the_same_of_the_baseline(self):
+        # written by stylechecker --annotated before the DTD was shared: the
+        # DTD loaded while parsing adds the namespaces it defaults to the
+        # root and keeps the whitespace of the mixed content
+        with open(ANNOTATED_XML, "rb") as fp:
+            expected = fp.read()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            xml = os.path.join(tmpdir, "artigo-com-traducao-e-pareceres-traduzidos.xml")
+            shutil.copy(
+                os.path.join(SAMPLES_PATH, "artigo-com-traducao-e-pareceres-traduzidos.xml"),
+                xml,
+            )
+            result = stylechecker.validate_file(xml, annotated=True)
+            with open(result["annotated"], "rb") as fp:
+                annotated = fp.read()
+        self.assertEqual(expected, annotated)
+
+    def test_annotated_is_the_serialized_annotate_errors(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            xml = os.path.join(tmpdir, "0034-7094-rba-69-03-0227.xml")
+            shutil.copy(os.path.join(SAMPLES_PATH, "0034-7094-rba-69-03-0227.xml"), xml)
+            validator = stylechecker.get_xmlvalidator(xml, False, ())
+            expected = etree.tostring(
+                validator.annotate_errors(),
+                pretty_print=True,
+                encoding=validator.encoding,
+                xml_declaration=True,
+            )
+            result = stylechecker.validate_file(xml, annotated=True)
+            with open(result["annotated"], "rb") as fp:
+                annotated = fp.read()
+        self.assertEqual(expected, annotated)
+
+    def test_error(self):
+        xml = os.path.join(SAMPLES_PATH, "example.xml")
+        result = stylechecker.validate_file(xml)
+        self.assertIsNone(result["summary"])
+        self.assertIn("cannot get the DOCTYPE declaration", result["error"])
+
+
+class ValidateZipPackageTests(unittest.TestCase):
+    def setUp(self):
+        with open(os.path.join(
+                SAMPLES_PATH,
+                "artigo-com-traducao-e-pareceres-traduzidos.xml")) as fp:
+            xml = fp.read()
+        graphics = "".join(
+            '<fig id="fz%s"><graphic xlink:href="%s"/></fig>' % (i, href)
+            for i, href in enumerate(("a1.tif", "img/a2.tif", "a3.tif"))
+        )
+        xml = xml.replace("</body>", graphics + "</body>", 1)
+
+        self.package = tempfile.NamedTemporaryFile(suffix=".zip")
+        with zipfile.ZipFile(self.package, "w") as zip_file:
+            zip_file.writestr("pkg/a.xml", xml)
+            zip_file.writestr("pkg/a1.tif", b"tif")
+            zip_file.writestr("pkg/img/a2.tif", b"tif")
+            zip_file.writestr("a3.tif", b"tif")
+            zip_file.writestr("pkg/sub/b.xml", "<article/>")
+        self.package.flush()
+
+    def tearDown(self):
+        self.package.close()
+
+    def _validate(self, **kwargs):
+        return list(
+            stylechecker.validate_zip_package(self.package.name, **kwargs))
+
+    def test_assets_are_looked_up_relative_to_xml(self):
+        xml, summary, exc_type, exc_value = self._validate()[0]
+        self.assertEqual("pkg/a.xml", xml)
+        self.assertIsNone(exc_type)
+        self.assertEqual(
+            [("a1.tif", True), ("img/a2.tif", True), ("a3.tif", False)],
+            summary["assets"])
+
+    def test_invalid_xml(self):
+        xml, summary, exc_type, exc_value = self._validate()[1]
+        self.assertEqual("pkg/sub/b.xml", xml)
+        self.assertIsNone(summary)
+        self.assertEqual("XMLSPSVersionError", exc_type)
+
+    def test_jobs_give_same_reports(self):
+        self.assertEqual(self._validate(), self._validate(jobs=2))
+
+    def test_pool_is_joined_if_the_reports_are_not_consumed(self):
+        with mock.patch.object(stylechecker.multiprocessing, "Pool") as Pool:
+            Pool.return_value.apply_async.return_value.get.return_value = (
+                "pkg/a.xml", None, None, None)
+            reports = stylechecker.validate_zip_package(
+                self.package.name, jobs=2)
+            next(reports)
+            reports.close()
+        Pool.return_value.terminate.assert_called_once_with()
+        Pool.return_value.join.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
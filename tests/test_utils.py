@@ -13,9 +13,9 @@ except:
     import mock
 
 from PIL import Image, ImageFile
-from lxml import etree
+from lxml import etree, isoschematron
 
-from packtools import utils, exceptions
+from packtools import catalogs, utils, exceptions
 
 
 BASE_XML = """<?xml version="1.0" encoding="UTF-8"?>
@@ -152,6 +152,16 @@ class XrayTests(unittest.TestCase):
             self.assertEqual(xray.show_sorted_members(),
                     {'xml': ['bar.xml', 'jar.xml']})
 
+    def test_members_index(self):
+        arch = self._make_test_archive(
+            [('bar.xml', u'<root><name>bar</name></root>'),
+             ('img/jar.tif', u'tif')])
+
+        with utils.Xray.fromfile(arch.name) as xray:
+            self.assertEqual(xray.members_index(),
+                    frozenset(['bar.xml', 'img/jar.tif']))
+            self.assertIs(xray.members_index(), xray.members_index())
+
     def test_show_sorted_members_is_caseinsensitive(self):
         arch = self._make_test_archive(
             [('bar.xml', u'<root><name>bar</name></root>'),
@@ -189,6 +199,326 @@ class ResolveSchematronFilepathTests(unittest.TestCase):
                 lambda: utils.resolve_schematron_filepath(path))
 
 
+class ResolveDTDFilepathTests(unittest.TestCase):
+    def test_builtin_lookup(self):
+        path = utils.resolve_dtd_filepath(
+            '-//NLM//DTD JATS (Z39.96) Journal Publishing DTD v1.1 20151215//EN')
+        self.assertTrue(
+            path.endswith('jats-publishing-dtd-1.1/JATS-journalpublishing1.dtd'))
+        self.assertTrue(os.path.exists(path))
+
+    def test_unknown_public_id(self):
+        self.assertRaises(ValueError,
+                lambda: utils.resolve_dtd_filepath('-//UNKNOWN//EN'))
+
+
+DOCTYPE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE article PUBLIC "{}" "{}">
+<article><p>Ciência &mdash; Saúde</p></article>"""
+
+
+class XMLCatalogResolverTests(unittest.TestCase):
+    def _parse(self, public_id, system_id):
+        xml = DOCTYPE_XML.format(public_id, system_id).encode('utf-8')
+        return utils.XML(io.BytesIO(xml))
+
+    def test_public_id_is_resolved_to_the_bundled_dtd(self):
+        et = self._parse(
+            '-//NLM//DTD JATS (Z39.96) Journal Publishing DTD v1.1 20151215//EN',
+            'http://example.org/JATS-journalpublishing1.dtd')
+        self.assertEqual('Ciência — Saúde', et.findtext('p'))
+
+    def test_system_id_is_resolved_to_the_bundled_dtd(self):
+        et = self._parse(
+            '-//UNKNOWN//EN',
+            'http://jats.nlm.nih.gov/publishing/1.1/JATS-journalpublishing1.dtd')
+        self.assertEqual('Ciência — Saúde', et.findtext('p'))
+
+    def test_unknown_dtd_is_not_resolved(self):
+        self.assertRaises(etree.XMLSyntaxError,
+                lambda: self._parse('-//UNKNOWN//EN',
+                                    'http://example.org/unknown.dtd'))
+
+    def test_environment_is_not_changed(self):
+        with mock.patch.dict(os.environ, clear=True):
+            self._parse(
+                '-//NLM//DTD JATS (Z39.96) Journal Publishing DTD v1.1 20151215//EN',
+                'JATS-journalpublishing1.dtd')
+            self.assertNotIn('XML_CATALOG_FILES', os.environ)
+
+    def test_config_xml_catalog_is_deprecated(self):
+        with self.assertWarns(DeprecationWarning):
+            wrapped = utils.config_xml_catalog(lambda: 'ok')
+        self.assertEqual('ok', wrapped())
+
+    def test_debug_info_reports_the_resolved_catalog(self):
+        import packtools
+        with mock.patch.dict(os.environ, clear=True):
+            info = packtools.get_debug_info()
+        self.assertEqual(catalogs.XML_CATALOG, info['xml_catalog_files'])
+
+    def test_parsing_in_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        public_ids = [
+            '-//NLM//DTD JATS (Z39.96) Journal Publishing DTD v1.0 20120330//EN',
+            '-//NLM//DTD JATS (Z39.96) Journal Publishing DTD v1.1 20151215//EN',
+            '-//NLM//DTD JATS (Z39.96) Journal Publishing DTD v1.3 20210610//EN',
+        ] * 4
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            texts = list(executor.map(
+                lambda public_id: self._parse(
+                    public_id, 'JATS-journalpublishing1.dtd').findtext('p'),
+                public_ids))
+        self.assertEqual(['Ciência — Saúde'] * len(public_ids), texts)
+
+
+class XMLParserTests(unittest.TestCase):
+    def test_parser_is_reused_for_the_same_options(self):
+        parser = utils.get_xml_parser(remove_blank_text=True)
+        self.assertIs(parser, utils.get_xml_parser(remove_blank_text=True))
+        self.assertIsNot(parser, utils.get_xml_parser())
+        self.assertIsNot(parser, utils.get_xml_parser(remove_blank_text=True,
+                                                      huge_tree=True))
+
+    def test_parsers_are_not_shared_between_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        parser = utils.get_xml_parser()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(utils.get_xml_parser).result()
+        self.assertIsNot(parser, other)
+
+    def test_parse_bytes(self):
+        root = utils.parse_bytes(b'<article>\n  <p>texto</p>\n</article>',
+                                 remove_blank_text=True)
+        self.assertEqual(b'<article><p>texto</p></article>',
+                         etree.tostring(root))
+
+    def test_parse_path(self):
+        et = utils.parse_path(io.BytesIO(b'<article>\n  <p>texto</p>\n</article>'))
+        self.assertEqual(b'<article>\n  <p>texto</p>\n</article>',
+                         etree.tostring(et))
+
+    def test_parse_error_does_not_affect_the_next_parse(self):
+        self.assertRaises(etree.XMLSyntaxError,
+                lambda: utils.parse_bytes(b'<article><p></article>'))
+        self.assertEqual('article', utils.parse_bytes(b'<article/>').tag)
+
+    def test_huge_tree(self):
+        depth = 300
+        content = b'<mml:mrow xmlns:mml="http://www.w3.org/1998/Math/MathML">' * depth
+        content += b'</mml:mrow>' * depth
+        self.assertRaises(etree.XMLSyntaxError,
+                lambda: utils.parse_bytes(content))
+        self.assertEqual(depth,
+                len(list(utils.parse_bytes(content, huge_tree=True).iter())))
+
+    def test_parse_timings(self):
+        timings = []
+        utils.set_parse_timings(timings)
+        try:
+            utils.parse_bytes(b'<article/>')
+            utils.XML(io.BytesIO(b'<article/>'))
+        finally:
+            utils.set_parse_timings(None)
+        utils.parse_bytes(b'<article/>')
+
+        self.assertEqual(2, len(timings))
+        self.assertTrue(all(seconds >= 0 for seconds in timings))
+
+
+class SchematronCacheTests(unittest.TestCase):
+    def setUp(self):
+        from packtools.catalogs import catalog
+        self.sch_path = catalog.SCH_SCHEMAS['sps-1.10']
+        self.cache_dir = tempfile.mkdtemp()
+        self.xml = etree.parse(
+            os.path.join(os.path.dirname(__file__), 'samples', 'example.xml'))
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def _errors(self, schematron):
+        is_valid = schematron.validate(self.xml)
+        return is_valid, [err.message for err in schematron.error_log]
+
+    def test_stores_compiled_schematron(self):
+        schematron = utils.get_schematron_from_cache(
+                self.sch_path, cache_dir=self.cache_dir)
+        self.assertNotIsInstance(schematron, utils.CompiledSchematron)
+        self.assertEqual(
+            [utils.get_schematron_hash(self.sch_path) + '.xsl'],
+            os.listdir(self.cache_dir))
+
+    def test_loads_compiled_schematron(self):
+        utils.get_schematron_from_cache(self.sch_path, cache_dir=self.cache_dir)
+        schematron = utils.get_schematron_from_cache(
+                self.sch_path, cache_dir=self.cache_dir)
+        self.assertIsInstance(schematron, utils.CompiledSchematron)
+        self.assertEqual(
+            self._errors(utils.get_schematron_from_filepath(self.sch_path)),
+            self._errors(schematron))
+
+    def test_cache_round_trip_gives_the_same_report(self):
+        utils.get_schematron_from_cache(self.sch_path, cache_dir=self.cache_dir)
+        cache_path = os.path.join(
+            self.cache_dir, utils.get_schematron_hash(self.sch_path) + '.xsl')
+        fresh = isoschematron.Schematron(
+            etree.parse(self.sch_path), store_report=True)
+        compiled = utils.CompiledSchematron(
+            etree.parse(cache_path), store_report=True)
+        self.assertIsNone(compiled.validation_report)
+        self.assertEqual([], list(compiled.error_log))
+
+        self.assertEqual(self._errors(fresh), self._errors(compiled))
+        self.assertEqual(
+            etree.tostring(fresh.validation_report),
+            etree.tostring(compiled.validation_report))
+
+    def test_falls_back_if_compiled_schematron_cannot_be_loaded(self):
+        utils.get_schematron_from_cache(self.sch_path, cache_dir=self.cache_dir)
+        for error in (AttributeError, TypeError):
+            with self.subTest(error=error):
+                with mock.patch.object(
+                        utils.CompiledSchematron, '__init__',
+                        side_effect=error('_validator')):
+                    schematron = utils.get_schematron_from_cache(
+                        self.sch_path, cache_dir=self.cache_dir)
+                self.assertIsInstance(schematron, isoschematron.Schematron)
+                self.assertNotIsInstance(schematron, utils.CompiledSchematron)
+                self.assertEqual(
+                    self._errors(utils.get_schematron_from_filepath(self.sch_path)),
+                    self._errors(schematron))
+
+    def test_temporary_file_is_removed_if_cache_write_fails(self):
+        with mock.patch.object(utils.os, 'replace', side_effect=OSError('full')):
+            schematron = utils.get_schematron_from_cache(
+                self.sch_path, cache_dir=self.cache_dir)
+        self.assertIsInstance(schematron, isoschematron.Schematron)
+        self.assertEqual([], os.listdir(self.cache_dir))
+
+    def test_invalid_cache_entry_is_replaced(self):
+        cache_path = os.path.join(
+            self.cache_dir, utils.get_schematron_hash(self.sch_path) + '.xsl')
+        with open(cache_path, 'w') as fp:
+            fp.write('<invalid')
+        schematron = utils.get_schematron_from_cache(
+                self.sch_path, cache_dir=self.cache_dir)
+        self.assertNotIsInstance(schematron, utils.CompiledSchematron)
+        self.assertIsInstance(
+            utils.get_schematron_from_cache(
+                self.sch_path, cache_dir=self.cache_dir),
+            utils.CompiledSchematron)
+
+    def test_hash_covers_included_schemas(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        shutil.copy(self.sch_path, tmpdir)
+        common_path = os.path.join(os.path.dirname(self.sch_path), 'common.sch')
+        shutil.copy(common_path, tmpdir)
+        sch_path = os.path.join(tmpdir, os.path.basename(self.sch_path))
+        expected = utils.get_schematron_hash(sch_path)
+        with open(os.path.join(tmpdir, 'common.sch'), 'a') as fp:
+            fp.write('<!-- changed -->')
+        self.assertNotEqual(expected, utils.get_schematron_hash(sch_path))
+
+    def test_cache_dir_is_versioned(self):
+        self.assertEqual(
+            'lxml-%s-libxslt-%s' % (
+                '.'.join(str(digit) for digit in etree.LXML_VERSION),
+                '.'.join(str(digit) for digit in etree.LIBXSLT_VERSION)),
+            os.path.basename(utils.get_schematron_cache_dir()))
+
+
+class ImageDerivativeCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = utils.ImageDerivativeCache(self.cache_dir, max_size=12)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_get_missing_key(self):
+        self.assertIsNone(self.cache.get(self.cache.get_key("abc", "png")))
+
+    def test_set_and_get(self):
+        key = self.cache.get_key("abc", "png", ("PNG",))
+        self.cache.set(key, b"12345")
+        self.assertEqual(b"12345", self.cache.get(key))
+        self.assertEqual(5, self.cache.get_size())
+
+    def test_key_depends_on_source_operation_and_params(self):
+        key = self.cache.get_key("abc", "thumbnail", ("JPEG", (267, 140)))
+        self.assertEqual(
+            key, self.cache.get_key("abc", "thumbnail", ("JPEG", (267, 140))))
+        self.assertNotEqual(
+            key, self.cache.get_key("abd", "thumbnail", ("JPEG", (267, 140))))
+        self.assertNotEqual(
+            key, self.cache.get_key("abc", "png", ("JPEG", (267, 140))))
+        self.assertNotEqual(
+            key, self.cache.get_key("abc", "thumbnail", ("JPEG", (100, 100))))
+
+    def test_evicts_least_recently_used(self):
+        keys = [self.cache.get_key(str(i), "png") for i in range(3)]
+        for i, key in enumerate(keys):
+            self.cache.set(key, b"1234")
+            path = self.cache._get_path(key)
+            os.utime(path, (i, i))
+        # keys[0] is used again, keys[1] is the least recently used
+        os.utime(self.cache._get_path(keys[0]), (10, 10))
+        self.cache.set(self.cache.get_key("3", "png"), b"1234")
+
+        self.assertEqual(12, self.cache.get_size())
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertEqual(b"1234", self.cache.get(keys[0]))
+        self.assertEqual(b"1234", self.cache.get(keys[2]))
+
+
+class HTMLRenderCacheTests(unittest.TestCase):
+    def test_key_depends_on_xml_xslt_lang_and_params(self):
+        cache = utils.HTMLRenderCache(tempfile.gettempdir())
+        key = cache.get_key("xml", "xslt", "pt", [("css", "a.css")])
+        self.assertEqual(key, cache.get_key("xml", "xslt", "pt", [("css", "a.css")]))
+        self.assertNotEqual(key, cache.get_key("xml2", "xslt", "pt", [("css", "a.css")]))
+        self.assertNotEqual(key, cache.get_key("xml", "xslt2", "pt", [("css", "a.css")]))
+        self.assertNotEqual(key, cache.get_key("xml", "xslt", "en", [("css", "a.css")]))
+        self.assertNotEqual(key, cache.get_key("xml", "xslt", "pt", [("css", "b.css")]))
+
+    def test_memory_cache_keeps_the_most_recently_used(self):
+        cache = utils.MemoryHTMLRenderCache(max_entries=2)
+        cache.set("a", b"<html>a</html>")
+        cache.set("b", b"<html>b</html>")
+        cache.get("a")
+        cache.set("c", b"<html>c</html>")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(b"<html>a</html>", cache.get("a"))
+        self.assertEqual(b"<html>c</html>", cache.get("c"))
+        self.assertEqual(28, cache.get_size())
+
+    def test_xslt_hash_changes_when_an_xslt_changes(self):
+        xslt_dir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(xslt_dir, "v2.0"))
+        root_xslt = os.path.join(xslt_dir, "root-html-2.0.xslt")
+        included_xsl = os.path.join(xslt_dir, "v2.0", "article.xsl")
+        for path in (root_xslt, included_xsl):
+            with open(path, "w") as fp:
+                fp.write("<xsl:stylesheet/>")
+        try:
+            with mock.patch.dict(
+                catalogs.HTML_GEN_XSLTS, {"root-html-2.0.xslt": root_xslt}
+            ):
+                digest = utils.get_htmlgenerator_xslt_hash()
+                self.assertEqual(digest, utils.get_htmlgenerator_xslt_hash())
+
+                with open(included_xsl, "w") as fp:
+                    fp.write("<xsl:stylesheet version='1.0'/>")
+                self.assertNotEqual(digest, utils.get_htmlgenerator_xslt_hash())
+        finally:
+            shutil.rmtree(xslt_dir)
+
+
 class TestWebImageGenerator(unittest.TestCase):
     def setUp(self):
         self.extracted_package = tempfile.mkdtemp(".")
@@ -245,11 +575,11 @@ class TestWebImageGenerator(unittest.TestCase):
             web_image_generator._image_object.tobytes(), mocked_image.tobytes()
         )
 
-    @mock.patch.object(ImageFile.Parser, "feed")
+    @mock.patch.object(Image, "open")
     def test__get_image_object_large_image_file_security_error(
-        self, mk_img_parser_feed
+        self, mk_img_open
     ):
-        mk_img_parser_feed.side_effect = Image.DecompressionBombError("ERROR!")
+        mk_img_open.side_effect = Image.DecompressionBombError("ERROR!")
         mocked_image_io = io.BytesIO()
         mocked_image = Image.new("RGB", (10, 10))
         mocked_image.save(mocked_image_io, "TIFF")
@@ -402,6 +732,51 @@ class TestWebImageGenerator(unittest.TestCase):
         shutil.rmtree(destination_path)
         self.assertTrue(is_thumbnail_ok)
 
+    def test_create_png_and_thumbnail(self):
+        web_image_generator = utils.WebImageGenerator(
+            "image_tiff_2.tif", self.extracted_package
+        )
+        with mock.patch.object(
+            Image, "open", wraps=Image.open
+        ) as mocked_open:
+            png_file_path, thumbnail_file_path = (
+                web_image_generator.create_png_and_thumbnail()
+            )
+        self.assertEqual(1, mocked_open.call_count)
+        self.assertEqual(
+            os.path.join(self.extracted_package, "image_tiff_2.png"), png_file_path
+        )
+        self.assertEqual(
+            os.path.join(self.extracted_package, "image_tiff_2.thumbnail.jpg"),
+            thumbnail_file_path,
+        )
+        with Image.open(png_file_path) as png_file:
+            self.assertEqual((50, 50), png_file.size)
+        with Image.open(thumbnail_file_path) as thumbnail_file:
+            self.assertEqual("JPEG", thumbnail_file.format)
+
+    def test_create_thumbnail_decodes_jpeg_at_reduced_scale(self):
+        filename = os.path.join(self.extracted_package, "large_image.jpg")
+        Image.new("RGB", (2000, 2000)).save(filename, "JPEG")
+        web_image_generator = utils.WebImageGenerator(
+            "large_image.jpg", self.extracted_package
+        )
+        decoded_sizes = []
+
+        def normalize_mode(image):
+            decoded_sizes.append(image.size)
+            return image
+
+        with mock.patch.object(
+            utils.WebImageGenerator, "_normalize_mode", side_effect=normalize_mode
+        ):
+            thumbnail_file_path = web_image_generator.create_thumbnail()
+        # the image is decoded at 1/4 scale, the smallest one not smaller than
+        # the thumbnail size (267, 140)
+        self.assertEqual([(500, 500)], decoded_sizes)
+        with Image.open(thumbnail_file_path) as thumbnail_file:
+            self.assertEqual((140, 140), thumbnail_file.size)
+
     def test_get_png_bytes_no_image_object(self):
         web_image_generator = utils.WebImageGenerator(
             "image_tiff_1.tiff", self.extracted_package
@@ -463,6 +838,59 @@ class TestWebImageGenerator(unittest.TestCase):
         image_copy.save(image_expected, "JPEG")
         self.assertEqual(result, image_expected.getvalue())
 
+    def _get_jpeg_bytes(self, size):
+        image_io = io.BytesIO()
+        Image.new("RGB", size, (200, 100, 50)).save(image_io, "JPEG")
+        return image_io.getvalue()
+
+    def test_get_thumbnail_bytes_decodes_jpeg_at_reduced_scale(self):
+        web_image_generator = utils.WebImageGenerator(
+            "image.jpg", self.extracted_package, self._get_jpeg_bytes((2000, 2000))
+        )
+        sizes = []
+        with mock.patch.object(
+            utils.WebImageGenerator,
+            "_normalize_mode",
+            side_effect=lambda image: sizes.append(image.size) or image,
+        ):
+            result = web_image_generator.get_thumbnail_bytes()
+        self.assertEqual([(500, 500)], sizes)
+        self.assertEqual((140, 140), Image.open(io.BytesIO(result)).size)
+
+    def test_get_png_bytes_after_get_thumbnail_bytes(self):
+        web_image_generator = utils.WebImageGenerator(
+            "image.jpg", self.extracted_package, self._get_jpeg_bytes((500, 400))
+        )
+        thumbnail = web_image_generator.get_thumbnail_bytes()
+        png = web_image_generator.get_png_bytes()
+        self.assertEqual((175, 140), Image.open(io.BytesIO(thumbnail)).size)
+        self.assertEqual((500, 400), Image.open(io.BytesIO(png)).size)
+
+    def test_get_png_and_thumbnail_bytes(self):
+        web_image_generator = utils.WebImageGenerator(
+            "image.jpg", self.extracted_package, self._get_jpeg_bytes((500, 400))
+        )
+        png, thumbnail = web_image_generator.get_png_and_thumbnail_bytes()
+        self.assertEqual((500, 400), Image.open(io.BytesIO(png)).size)
+        self.assertEqual((175, 140), Image.open(io.BytesIO(thumbnail)).size)
+        self.assertEqual(
+            (500, 400), Image.open(io.BytesIO(web_image_generator.get_png_bytes())).size
+        )
+
+    def test_get_png_bytes_truncated_image(self):
+        image_io = io.BytesIO()
+        Image.frombytes("RGB", (500, 400), os.urandom(500 * 400 * 3)).save(
+            image_io, "JPEG"
+        )
+        truncated = image_io.getvalue()[: len(image_io.getvalue()) // 2]
+        web_image_generator = utils.WebImageGenerator(
+            "image.jpg", self.extracted_package, truncated
+        )
+        with self.assertRaises(exceptions.WebImageGeneratorError):
+            web_image_generator.get_png_bytes()
+        with self.assertRaises(exceptions.WebImageGeneratorError):
+            web_image_generator.get_thumbnail_bytes()
+
     def test_get_thumbnail_bytes_with_palette_mode(self):
         mocked_image = Image.new("P", (300, 300))
         web_image_generator = utils.WebImageGenerator(
@@ -730,6 +1158,35 @@ class TestXMLWebOptimiser(unittest.TestCase):
         self.assertEqual(image_filename, "1234-5678-rctb-45-05-0110-e01.thumbnail.jpg")
         self.assertIsNotNone(image_bytes)
 
+    def test_get_xml_file_uses_image_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        image_cache = utils.ImageDerivativeCache(cache_dir)
+        xml_web_optimiser = utils.XMLWebOptimiser(
+            self.xml_filename,
+            self.image_filenames,
+            self.mocked_read_file,
+            self.work_dir,
+            image_cache=image_cache,
+        )
+        expected = xml_web_optimiser.get_xml_file()
+        expected_assets = list(xml_web_optimiser.get_optimised_assets())
+        self.assertTrue(image_cache.get_size() > 0)
+
+        xml_web_optimiser = utils.XMLWebOptimiser(
+            self.xml_filename,
+            self.image_filenames,
+            self.mocked_read_file,
+            self.work_dir,
+            image_cache=image_cache,
+        )
+        with mock.patch.object(ImageFile.Parser, "feed") as mocked_feed:
+            self.assertEqual(expected, xml_web_optimiser.get_xml_file())
+        mocked_feed.assert_not_called()
+        self.assertEqual(
+            expected_assets, list(xml_web_optimiser.get_optimised_assets())
+        )
+
 
 class TestXMLWebOptimiserGraphicsWithNoFileExtention(unittest.TestCase):
     def setUp(self):
@@ -1144,3 +1601,167 @@ class TestSPPackage(unittest.TestCase):
                     image_element.attrib["{http://www.w3.org/1999/xlink}href"],
                     expected_href,
                 )
+
+    def test_optimise_with_jobs_creates_the_same_zip(self):
+        self.sp_package.optimise()
+        with zipfile.ZipFile(self.optimised_package) as zf:
+            expected_namelist = sorted(zf.namelist())
+            expected_xml = zf.read(self.xml_filename)
+        os.remove(self.optimised_package)
+
+        self.sp_package.optimise(jobs=2)
+        with zipfile.ZipFile(self.optimised_package) as zf:
+            self.assertEqual(expected_namelist, sorted(zf.namelist()))
+            self.assertEqual(expected_xml, zf.read(self.xml_filename))
+
+    def test_optimise_decodes_identical_images_once(self):
+        self.archive.close()
+        with zipfile.ZipFile(self.tmp_package, "a") as archive:
+            # another XML referencing an image identical to "e01.tif"
+            archive.writestr(
+                "otherdocument.xml",
+                BASE_XML.format(
+                    '<graphic xlink:href="1234-5678-rctb-45-05-0110-e01.tif"/>',
+                    '<graphic xlink:href="1234-5678-rctb-45-05-0110-e05.tif"/>',
+                ),
+            )
+            archive.writestr(
+                "1234-5678-rctb-45-05-0110-e05.tif",
+                archive.read("1234-5678-rctb-45-05-0110-e01.tif"),
+            )
+        self.archive = zipfile.ZipFile(self.tmp_package)
+        self.sp_package = utils.SPPackage(self.archive, self.extracted_package)
+
+        with mock.patch.object(
+            utils, "_optimise_image", wraps=utils._optimise_image
+        ) as mocked_optimise_image:
+            self.sp_package.optimise()
+        png_calls = [
+            call[0][2]
+            for call in mocked_optimise_image.call_args_list
+            if call[0][1] == "png"
+        ]
+        self.assertEqual(
+            1,
+            len(
+                [
+                    filename
+                    for filename in png_calls
+                    if filename in (
+                        "1234-5678-rctb-45-05-0110-e01.tif",
+                        "1234-5678-rctb-45-05-0110-e05.tif",
+                    )
+                ]
+            ),
+        )
+        with zipfile.ZipFile(self.optimised_package) as zf:
+            namelist = zf.namelist()
+            self.assertEqual(len(namelist), len(set(namelist)))
+            self.assertIn("1234-5678-rctb-45-05-0110-e01.png", namelist)
+            self.assertIn("1234-5678-rctb-45-05-0110-e05.png", namelist)
+            self.assertEqual(
+                zf.read("1234-5678-rctb-45-05-0110-e01.png"),
+                zf.read("1234-5678-rctb-45-05-0110-e05.png"),
+            )
+
+    def test_optimise_creates_png_and_thumbnail_from_the_same_image(self):
+        with mock.patch.object(
+            utils, "_optimise_image", wraps=utils._optimise_image
+        ) as mocked_optimise_image:
+            self.sp_package.optimise()
+        thumbnail_calls = [
+            call[0][2]
+            for call in mocked_optimise_image.call_args_list
+            if call[0][1] == "thumbnail"
+        ]
+        self.assertNotIn("1234-5678-rctb-45-05-0110-e01.tif", thumbnail_calls)
+        with zipfile.ZipFile(self.optimised_package) as zf:
+            self.assertIn(
+                "1234-5678-rctb-45-05-0110-e01.thumbnail.jpg", zf.namelist()
+            )
+
+    def test_optimise_creates_thumbnails_only_for_the_images_which_need_them(self):
+        self.archive.close()
+        with zipfile.ZipFile(self.tmp_package, "a") as archive:
+            # inline images have no thumbnails
+            archive.writestr(
+                "otherdocument.xml",
+                BASE_XML.format(
+                    '<inline-graphic xlink:href="1234-5678-rctb-45-05-0110-e06.tif"/>',
+                    "",
+                ),
+            )
+            image_io = io.BytesIO()
+            Image.new("RGB", (50, 50), (10, 20, 30)).save(image_io, "TIFF")
+            archive.writestr("1234-5678-rctb-45-05-0110-e06.tif", image_io.getvalue())
+        self.archive = zipfile.ZipFile(self.tmp_package)
+        self.sp_package = utils.SPPackage(self.archive, self.extracted_package)
+
+        with mock.patch.object(
+            utils, "_optimise_image", wraps=utils._optimise_image
+        ) as mocked_optimise_image:
+            self.sp_package.optimise()
+        png_calls = {
+            call[0][2]: call[0][3]
+            for call in mocked_optimise_image.call_args_list
+            if call[0][1] == "png"
+        }
+        self.assertEqual(
+            {
+                "1234-5678-rctb-45-05-0110-e01.tif": True,
+                "1234-5678-rctb-45-05-0110-e06.tif": False,
+            },
+            png_calls,
+        )
+        with zipfile.ZipFile(self.optimised_package) as zf:
+            self.assertIn("1234-5678-rctb-45-05-0110-e06.png", zf.namelist())
+            self.assertNotIn(
+                "1234-5678-rctb-45-05-0110-e06.thumbnail.jpg", zf.namelist()
+            )
+
+    def test_optimise_uses_image_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        image_cache = utils.ImageDerivativeCache(cache_dir)
+        sp_package = utils.SPPackage(
+            self.archive, self.extracted_package, image_cache=image_cache
+        )
+        sp_package.optimise()
+        with zipfile.ZipFile(self.optimised_package) as zf:
+            expected = {name: zf.read(name) for name in zf.namelist()}
+        os.remove(self.optimised_package)
+
+        with mock.patch.object(
+            utils, "_optimise_image", wraps=utils._optimise_image
+        ) as mocked_optimise_image:
+            sp_package.optimise()
+        mocked_optimise_image.assert_not_called()
+        with zipfile.ZipFile(self.optimised_package) as zf:
+            self.assertEqual(
+                expected, {name: zf.read(name) for name in zf.namelist()}
+            )
+
+    def test_optimise_copies_files_left_as_they_are(self):
+        self.sp_package.optimise()
+        with zipfile.ZipFile(self.optimised_package) as zf:
+            for filename in ("1234-5678-rctb-45-05-0110.pdf", "1234-5678-rctb-45-05-0110-e04.tif"):
+                original = self.archive.getinfo(filename)
+                copied = zf.getinfo(filename)
+                self.assertEqual(original.compress_type, copied.compress_type)
+                self.assertEqual(original.CRC, copied.CRC)
+                self.assertEqual(original.date_time, copied.date_time)
+                self.assertEqual(self.archive.read(filename), zf.read(filename))
+
+    def test_optimise_stores_images_and_deflates_xml(self):
+        self.sp_package.optimise()
+        with zipfile.ZipFile(self.optimised_package) as zf:
+            self.assertEqual(
+                zipfile.ZIP_DEFLATED, zf.getinfo(self.xml_filename).compress_type
+            )
+            for filename in (
+                "1234-5678-rctb-45-05-0110-e01.png",
+                "1234-5678-rctb-45-05-0110-e01.thumbnail.jpg",
+            ):
+                self.assertEqual(
+                    zipfile.ZIP_STORED, zf.getinfo(filename).compress_type
+                )
@@ -1,6 +1,7 @@
 #coding: utf-8
 from __future__ import unicode_literals
 import unittest
+from unittest import mock
 import io
 from tempfile import NamedTemporaryFile
 
@@ -161,6 +162,51 @@ class XMLValidatorTests(unittest.TestCase):
 
         self.assertIn(u"<!-- SPS-ERROR: Element 'Total': Sum is not 100%. -->", xml_text.decode())
 
+    def test_write_annotated_errors(self):
+        fp = etree.parse(io.BytesIO(b'<a>\n<c>bar</c>\n<c>baz</c>\n</a>'))
+        dtd = etree.XMLSchema(etree.parse(sample_xsd))
+        xml = domain.XMLValidator.parse(fp, no_doctype=True,
+                sps_version='sps-1.1', dtd=dtd)
+        expected = etree.tostring(xml.annotate_errors(), pretty_print=True,
+                encoding='utf-8', xml_declaration=True)
+
+        output = io.BytesIO()
+        with mock.patch('packtools.domain.deepcopy') as mock_deepcopy:
+            xml.write_annotated_errors(output)
+        mock_deepcopy.assert_not_called()
+
+        self.assertIn(b"<!-- SPS-ERROR: Element 'c': This element is not expected. Expected is ( b ). -->",
+                output.getvalue())
+        self.assertEqual(expected, output.getvalue())
+        # the notes are removed from the XML after being written
+        self.assertEqual(b'<a>\n<c>bar</c>\n<c>baz</c>\n</a>', etree.tostring(fp))
+
+    def test_write_annotated_errors_without_doctype(self):
+        xml = domain.XMLValidator.parse(
+                'tests/samples/0034-7094-rba-69-03-0227.xml')
+        expected = etree.tostring(xml.annotate_errors(), pretty_print=True,
+                encoding='utf-8', xml_declaration=True)
+
+        output = io.BytesIO()
+        xml.write_annotated_errors(output)
+
+        self.assertTrue(output.getvalue().startswith(
+                b"<?xml version='1.0' encoding='utf-8'?>\n<article "))
+        self.assertEqual(expected, output.getvalue())
+
+    def test_write_annotated_errors_at_root(self):
+        fp = etree.parse(io.BytesIO(b'<Total><Percent>60</Percent><Percent>30</Percent></Total>'))
+        schema = domain.SchematronValidator(
+                isoschematron.Schematron(etree.parse(sample_sch)))
+        xml = domain.XMLValidator(fp, style_validators=[schema])
+
+        output = io.BytesIO()
+        xml.write_annotated_errors(output, xml_declaration=False)
+
+        self.assertTrue(output.getvalue().startswith(
+                b"<!-- SPS-ERROR: Element 'Total': Sum is not 100%. -->\n<Total>"))
+        self.assertIsNone(fp.getroot().getprevious())
+
     def test_fails_without_doctype_declaration(self):
         fp = io.BytesIO(b'<a><b>bar</b></a>')
         et = etree.parse(fp)
@@ -240,6 +286,40 @@ class XMLValidatorTests(unittest.TestCase):
         self.assertEqual(xml_validator.assets, [])
 
 
+class XMLValidatorStdDTDTests(unittest.TestCase):
+    xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE article PUBLIC "-//NLM//DTD JATS (Z39.96) Journal Publishing DTD v1.0 20120330//EN" "JATS-journalpublishing1.dtd">
+<article xmlns:xlink="http://www.w3.org/1999/xlink"
+         dtd-version="1.0"
+         article-type="research-article"
+         specific-use="sps-1.1"
+         xml:lang="en">
+  <front><article-meta><title/></article-meta></front>
+</article>"""
+
+    def _parse(self, **kwargs):
+        return domain.XMLValidator.parse(io.BytesIO(self.xml),
+                sps_version='sps-1.1', **kwargs)
+
+    def test_dtd_validator_is_shared(self):
+        first = self._parse()
+        second = self._parse(load_dtd=False)
+        self.assertIs(first.dtd_validator, second.dtd_validator)
+        self.assertIs(domain.StdDTD(first.public_id), first.dtd)
+
+    def test_validates_without_loading_dtd(self):
+        is_valid, errors = self._parse(load_dtd=False).validate()
+        self.assertFalse(is_valid)
+        self.assertEqual(
+            [err.message for err in self._parse().validate()[1]],
+            [err.message for err in errors])
+
+    def test_given_dtd_is_used(self):
+        dtd = etree.DTD(io.StringIO('<!ELEMENT article ANY>'))
+        xml = self._parse(dtd=dtd)
+        self.assertIs(dtd, xml.dtd_validator.dtd)
+
+
 class XMLValidatorExtraSchematronTests(unittest.TestCase):
 
     def test_extra_schematron_thru_parse(self):